@@ -3,17 +3,22 @@ This module is the public face of BombSquad.
 For most modding purposes, the functionality exposed here is all you should need.
 """
 
+# profile module loads through the rest of boot
+import bsImport as _bsImport
+_bsImport._startImportProfiling()
+
 # pull in our 'public' stuff
 from bsInternal import *
 from bsUtils import getLanguage, writeConfig, openURL, WeakCall, Call, animate, animateArray,\
     Lstr, uni, utf8, playMusic, PopupText, getConfig, getNormalizedColor, isPointInBox, getTimeString,\
-    printError, printErrorOnce, printException, getSharedObject, isBrowserLikelyAvailable, OnScreenTimer, OnScreenCountdown
+    printError, printErrorOnce, printException, getSharedObject, isBrowserLikelyAvailable, OnScreenTimer, OnScreenCountdown, applySettings
 from bsGame import Team, OutOfBoundsMessage, DieMessage, StandMessage, PickUpMessage, DropMessage, PickedUpMessage,\
     DroppedMessage, ShouldShatterMessage, ImpactDamageMessage, FreezeMessage, ThawMessage, HealMessage,  HitMessage,\
     Actor, NodeActor, Session, Activity, GameActivity
 from bsCoopGame import CoopSession, CoopGameActivity, Level
 from bsTeamGame import TeamBaseSession, FreeForAllSession, TeamsSession, TeamGameActivity, TeamGameResults
-from bsBomb import Bomb, TNTSpawner, BombFactory, Blast
+from bsBomb import Bomb, TNTSpawner, BombFactory, Blast, BlastProfile, registerBlastProfile, getBlastProfile,\
+    BombType, registerBombType, getBombType, getBombTypeNames, BlastGroup, getBlastMergeStats
 from bsPowerup import Powerup, PowerupMessage, PowerupAcceptMessage, PowerupFactory
 from bsMap import Map, getMapsSupportingPlayType
 from bsFlag import FlagFactory, Flag, FlagPickedUpMessage, FlagDeathMessage, FlagDroppedMessage
@@ -25,6 +30,7 @@ from bsSpaz import SpazFactory, RespawnIcon, Spaz, PlayerSpaz, PlayerSpazHurtMes
                    ChickBotProShielded, MelBot, MelDuperBot, MelBotStatic, PirateBot, PirateBotNoTimeLimit, PirateBotShielded, FrostyBot, FrostyBotStatic,\
                    FrostyBotShielded, AgentBot, AgentBotShielded, CyborgBot, SpyBot, LooieBot, LooieBotShielded
 from bsVector import Vector
+from bsParticles import emitBGDynamics, getParticleStats
 
 # change everything's listed module to ours
 import bs
@@ -1,6 +1,7 @@
 import bs
 import bsUtils
 import bsInternal
+import bsTransactions
 
 gAchievements = []
 gAchievementsToDisplay = []
@@ -61,7 +62,7 @@ def _awardLocalAchievement(ach):
             # report new achievements to the game-service..
             bsInternal._reportAchievement(ach)
             # and to our account..
-            bsInternal._addTransaction({'type':'ACHIEVEMENT','name':ach})
+            bsTransactions.addTransaction({'type':'ACHIEVEMENT','name':ach})
             # now attempt to show a banner
             _displayBanner(ach)
 
@@ -94,8 +95,27 @@ def setCompletedAchievements(achs):
     # write config in one fell swoop..
     bs.writeConfig()
 
+# name and level indexes into gAchievements; rebuilt whenever achievements get appended
+_gIndexedCount = None
+_gAchievementsByName = {}
+_gAchievementsByLevel = {}
+_gAchievementOrder = {}
+
+def _getIndex():
+    global _gIndexedCount
+    if _gIndexedCount != len(gAchievements):
+        _gIndexedCount = len(gAchievements)
+        _gAchievementsByName.clear()
+        _gAchievementsByLevel.clear()
+        _gAchievementOrder.clear()
+        for i,a in enumerate(gAchievements):
+            _gAchievementsByName[a._name] = a
+            _gAchievementsByLevel.setdefault(a._level,[]).append(a)
+            _gAchievementOrder[a._name] = i
+    return _gAchievementsByName,_gAchievementsByLevel
+
 def getAchievement(name):
-    try: return [a for a in gAchievements if a._name == name][0]
+    try: return _getIndex()[0][name]
     except Exception: raise Exception("Invalid achievement name: '"+name+"'")
 
 # return the mult for achievement pts (just for display; changing this here won't affect what you get :-P)
@@ -107,7 +127,41 @@ def _getAchMult(includeProBonus=False):
 def getAchievementsForCoopLevel(level):
     # for the Easy campaign we return achievements for the Default campaign too..
     # (want the user to see what achieements are part of the level even if they can't unlock them all on easy mode)
-    return [a for a in gAchievements if a._level in (level,level.replace('Easy','Default'))]
+    byLevel = _getIndex()[1]
+    achievements = list(byLevel.get(level,[]))
+    defaultLevel = level.replace('Easy','Default')
+    if defaultLevel != level and defaultLevel in byLevel:
+        achievements += byLevel[defaultLevel]
+        achievements.sort(key=lambda a:_gAchievementOrder[a._name])
+    return achievements
+
+# achievement name -> list of AchievementTriggers
+_gAchievementTriggers = {}
+
+def registerAchievementTrigger(name,eventType,threshold=None,match=None,count=1,delay=0,sound=True):
+    """
+    Has an achievement awarded when a co-op game reports matching events through
+    bs.CoopGameActivity._achievementEvent(). Events are only evaluated for
+    incomplete achievements belonging to the level being played.
+
+    'eventType' is a string such as 'score', 'wave', 'kill' or 'punch'. An event
+    matches if its value is at least 'threshold' and/or equal to 'match' (whichever
+    are given); the achievement is awarded once 'count' events have matched in the
+    same game, 'delay' milliseconds later.
+    """
+    getAchievement(name) # make sure it exists
+    trigger = AchievementTrigger(name,eventType,threshold,match,count,delay,sound)
+    _gAchievementTriggers.setdefault(name,[]).append(trigger)
+    return trigger
+
+def _getTriggersForCoopLevel(level):
+    """ returns a dict of eventType -> list of triggers for a level's incomplete achievements """
+    triggers = {}
+    for a in getAchievementsForCoopLevel(level):
+        if a.isComplete(): continue
+        for t in _gAchievementTriggers.get(a._name,()):
+            triggers.setdefault(t.eventType,[]).append(t)
+    return triggers
 
 def _displayNextAchievement():
     global gAchievementDisplayTimer
@@ -125,6 +179,22 @@ def _displayNextAchievement():
     else:
         gAchievementDisplayTimer = None
 
+class AchievementTrigger(object):
+    """ An event condition that awards an achievement; see registerAchievementTrigger() """
+    def __init__(self,name,eventType,threshold,match,count,delay,sound):
+        self.name = name
+        self.eventType = eventType
+        self.threshold = threshold
+        self.match = match
+        self.count = count
+        self.delay = delay
+        self.sound = sound
+
+    def matches(self,value):
+        if self.threshold is not None and (value is None or value < self.threshold): return False
+        if self.match is not None and value != self.match: return False
+        return True
+
 class Achievement(object):
     def __init__(self,name,iconName,iconColor,level,award,hardModeOnly=False):
         self._name = name
@@ -823,6 +893,25 @@ gAchievements.append(Achievement('Half-Marathon','achievementMarathonHalf',(0.8,
 # Complete half of the Marathon mode, 30 points of reward
 gAchievements.append(Achievement('The Full Run','achievementMarathonFull',(0.8,0.8,0.8),'Challenges:Marathon',30))
 
+# event-driven awards for co-op games (see registerAchievementTrigger())
+registerAchievementTrigger('Off You Go Then','kill',match=('pickedUp','default'),count=3)
+registerAchievementTrigger('Mine Games','kill',match=('explosion','landMine'),count=3)
+registerAchievementTrigger('Boom Goes the Dynamite','kill',match=('explosion','tnt'),count=3,delay=500)
+registerAchievementTrigger('Gold Miner','kill',match=('explosion','landMine'),count=6)
+registerAchievementTrigger('TNT Terror','kill',match=('explosion','tnt'),count=6,delay=500)
+registerAchievementTrigger('Super Punch','punch',threshold=500)
+registerAchievementTrigger('Super Mega Punch','punch',threshold=1000)
+registerAchievementTrigger('Onslaught Master','score',threshold=500)
+registerAchievementTrigger('Onslaught Wizard','score',threshold=1000)
+registerAchievementTrigger('Onslaught God','score',threshold=5000)
+registerAchievementTrigger('Runaround Master','score',threshold=500)
+registerAchievementTrigger('Runaround Wizard','score',threshold=1000)
+registerAchievementTrigger('Runaround God','score',threshold=2000)
+registerAchievementTrigger('Last Stand Master','score',threshold=250)
+registerAchievementTrigger('Last Stand Wizard','score',threshold=500)
+registerAchievementTrigger('Last Stand God','score',threshold=1000)
+registerAchievementTrigger('Half-Marathon','wave',threshold=16)
+
 # just a test...
 def _test():
     
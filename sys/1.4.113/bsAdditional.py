@@ -1181,7 +1181,7 @@ class MarathonGame(bs.CoopGameActivity):
 
             self._canEndWave = False
 
-            if self._wave == 16: self._awardAchievement('Half-Marathon',sound=True)
+            self._achievementEvent('wave',self._wave)
             won = (self._wave == len(self._waves))
 
             if won:
@@ -3,6 +3,8 @@ import bsUtils
 from bsVector import Vector
 import random
 import weakref
+import collections
+import time
 
 
 class BombFactory(object):
@@ -111,6 +113,16 @@ class BombFactory(object):
           bs.Sound for a rolling bomb.
     """
 
+    def getBombTypeAttrs(self,bombType):
+        """
+        Returns the node attrs (media, materials, etc) for a bs.BombType,
+        resolving them the first time they're asked for in this activity.
+        """
+        try: return self._bombTypeAttrs[bombType.name]
+        except KeyError:
+            attrs = self._bombTypeAttrs[bombType.name] = bombType._resolveMedia(self)
+            return attrs
+
     def getRandomExplodeSound(self):
         'Return a random explosion bs.Sound from the factory.'
         return self.explodeSounds[random.randrange(len(self.explodeSounds))]
@@ -129,6 +141,8 @@ class BombFactory(object):
         You shouldn't need to do this; call bs.Bomb.getFactory() to get a shared instance.
         """
 
+        self._bombTypeAttrs = {}
+
         self.bombModel = bs.getModel('bomb')
         self.stickyBombModel = bs.getModel('bombSticky')
         # jasonhu5
@@ -345,6 +359,362 @@ class ExplodeHitMessage(object):
     def __init__(self):
         pass
 
+class BlastProfile(object):
+    """
+    category: Game Flow Classes
+
+    Describes how a given type of bs.Blast looks and sounds.
+    Profiles are registered by blastType with bs.registerBlastProfile();
+    types without one of their own use the 'normal' profile.
+
+    Attributes:
+
+       emits
+          A list of emission recipes: dicts of bs.emitBGDynamics() keywords plus
+          'count' (an int or a (base,random) pair), 'delay' (ms after the blast;
+          defaults to 50 since it looks better that way) and 'chance' (0-1).
+          Recipes without a count (distortion, etc) are treated as optional.
+          Counts are scaled down by level-of-detail when lots of blasts go off at once.
+
+       explosion, explosionColor, big
+          Whether to show an explosion node, its color (None for default), and
+          whether the explosion and scorch are the big variety.
+
+       lightColor, lightVolumeIntensity, lightRadiusScale, lightTimeScale
+          The flash of light (no light if lightColor is None).
+
+       scorch, scorchColor, scorchRadiusScale, scorchFade
+          The scorch mark left behind; scorchFade is a 'presence' keyframe dict.
+
+       sounds
+          A list of (delay, BombFactory attribute name, volume); the attribute
+          can be a bs.Sound or a method returning one.
+
+       shakeIntensity
+          Camera shake amount (None for no shake).
+
+       hitMagnitude
+          Magnitude of the bs.HitMessage sent to things caught in the blast.
+    """
+    def __init__(self,emits=(),explosion=True,explosionColor=None,big=False,
+                 lightColor=(1,0.3,0.1),lightVolumeIntensity=10.0,lightRadiusScale=1.0,lightTimeScale=1.0,
+                 scorch=True,scorchColor=None,scorchRadiusScale=1.0,scorchFade={3000:1,13000:0},
+                 sounds=(),shakeIntensity=1.0,hitMagnitude=2000.0):
+        self.emits = list(emits)
+        self.explosion = explosion
+        self.explosionColor = explosionColor
+        self.big = big
+        self.lightColor = lightColor
+        self.lightVolumeIntensity = lightVolumeIntensity
+        self.lightRadiusScale = lightRadiusScale
+        self.lightTimeScale = lightTimeScale
+        self.scorch = scorch
+        self.scorchColor = scorchColor
+        self.scorchRadiusScale = scorchRadiusScale
+        self.scorchFade = scorchFade
+        self.sounds = list(sounds)
+        self.shakeIntensity = shakeIntensity
+        self.hitMagnitude = hitMagnitude
+        self._compile()
+
+    def copy(self,**keywds):
+        """ Returns a new profile the same as this one apart from the values given """
+        attrs = dict((k,v) for k,v in self.__dict__.items() if not k.startswith('_'))
+        attrs.update(keywds)
+        return BlastProfile(**attrs)
+
+    def _compile(self):
+        # precompute emission recipes into per-delay groups so blasts don't have to
+        groups = {}
+        for e in self.emits:
+            keywds = dict(e)
+            delay = keywds.pop('delay',50)
+            chance = keywds.pop('chance',1.0)
+            count = keywds.pop('count',None)
+            if isinstance(count,(int,float)): count = (count,0)
+            groups.setdefault(delay,[]).append((chance,count,keywds))
+        self._emitGroups = sorted(groups.items())
+        self._sounds = sorted(self.sounds)
+
+
+_gBlastProfiles = {}
+
+# once more than this many blasts go off within a second, emission counts
+# start scaling down proportionally (but never below _gBlastLODMinScale)
+_gBlastLODThreshold = 12
+_gBlastLODMinScale = 0.15
+# below this scale optional emits (distortion, etc) and delayed sounds are skipped
+_gBlastLODOptionalCutoff = 0.5
+
+def registerBlastProfile(blastType,profile):
+    """
+    category: Game Flow Functions
+
+    Registers a bs.BlastProfile to be used for bs.Blasts of the given type.
+    """
+    _gBlastProfiles[blastType] = profile
+
+def getBlastProfile(blastType):
+    """
+    category: Game Flow Functions
+
+    Returns the bs.BlastProfile used for the given blast type.
+    """
+    profile = _gBlastProfiles.get(blastType)
+    return profile if profile is not None else _gBlastProfiles['normal']
+
+def _getBlastLOD():
+    """ registers a blast with the current activity and returns the emission scale to use for it """
+    activity = bs.getActivity()
+    if activity is None: return 1.0
+    now = bs.getGameTime()
+    try: times = activity._blastLODTimes
+    except Exception: times = activity._blastLODTimes = collections.deque()
+    times.append(now)
+    while times[0] <= now-1000: times.popleft()
+    if len(times) <= _gBlastLODThreshold: return 1.0
+    return max(_gBlastLODMinScale,float(_gBlastLODThreshold)/len(times))
+
+def _emitBlastRecipes(position,velocity,recipes,lod):
+    for chance,count,keywds in recipes:
+        if chance < 1.0 and random.random() >= chance: continue
+        if count is None:
+            if lod >= _gBlastLODOptionalCutoff: bs.emitBGDynamics(position=position,**keywds)
+        else:
+            n = int((count[0]+random.random()*count[1])*lod)
+            if n > 0: bs.emitBGDynamics(position=position,velocity=velocity,count=n,**keywds)
+
+def _playBlastSound(factory,name,volume,position):
+    sound = getattr(factory,name)
+    if callable(sound): sound = sound()
+    bs.playSound(sound,volume=volume,position=position)
+
+class BlastGroup(object):
+    """
+    category: Game Flow Classes
+
+    A set of bs.Blasts of the same type that went off close together in the
+    same tick. They share a single explosion, light, scorch, shrapnel and sound,
+    sized to cover all of them. Each blast still does its own damage (so credit
+    goes to the right players); a bs.Blast's group is its 'blastGroup' attr.
+
+    Attributes:
+
+       blastType
+          The type of the blasts in this group.
+
+       count
+          How many blasts have been merged into this group.
+
+       position, radius
+          The combined centre and radius of the group.
+    """
+    def __init__(self,blastType,position,velocity,radius):
+        self.blastType = blastType
+        self.count = 1
+        self.position = tuple(position)
+        self.velocity = tuple(velocity)
+        self.radius = radius
+        self._members = [(self.position,radius)]
+
+    def _getDistance(self,position):
+        return sum((self.position[i]-position[i])**2 for i in range(3))**0.5
+
+    def _add(self,position,velocity,radius):
+        self._members.append((tuple(position),radius))
+        self.count += 1
+        n = float(self.count)
+        self.position = tuple(sum(p[i] for p,r in self._members)/n for i in range(3))
+        self.velocity = tuple((self.velocity[i]*(n-1.0)+velocity[i])/n for i in range(3))
+        self.radius = max(self._getDistance(p)+r for p,r in self._members)
+
+    def _spawn(self):
+        factory = Bomb.getFactory()
+        profile = getBlastProfile(self.blastType)
+        position = self.position
+        velocity = self.velocity
+        radius = self.radius
+        lod = _getBlastLOD()
+
+        # throw in an explosion and flash
+        if profile.explosion:
+            explosion = bs.newNode("explosion",
+                                   attrs={'position':position,
+                                          'velocity':(velocity[0],max(-1.0,velocity[1]),velocity[2]),
+                                          'radius':radius,
+                                          'big':profile.big})
+            if profile.explosionColor is not None: explosion.color = profile.explosionColor
+
+        # and emit some shrapnel..
+        for delay,recipes in profile._emitGroups:
+            bs.gameTimer(delay,bs.Call(_emitBlastRecipes,position,velocity,recipes,lod))
+
+        scorchRadius = radius*profile.scorchRadiusScale
+        if profile.lightColor is not None:
+            light = bs.newNode('light',
+                               attrs={'position':position,
+                                      'color':profile.lightColor,
+                                      'volumeIntensityScale':profile.lightVolumeIntensity})
+            lightRadius = radius*profile.lightRadiusScale
+            s = random.uniform(0.6,0.9)*profile.lightTimeScale
+            iScale = 1.6
+            bsUtils.animate(light,"intensity",{0:2.0*iScale, int(s*20):0.1*iScale, int(s*25):0.2*iScale, int(s*50):17.0*iScale, int(s*60):5.0*iScale, int(s*80):4.0*iScale, int(s*200):0.6*iScale, int(s*2000):0.00*iScale, int(s*3000):0.0})
+            bsUtils.animate(light,"radius",{0:lightRadius*0.2, int(s*50):lightRadius*0.55, int(s*100):lightRadius*0.3, int(s*300):lightRadius*0.15, int(s*1000):lightRadius*0.05})
+            bs.gameTimer(int(s*3000),light.delete)
+
+        # make a scorch that fades over time
+        if profile.scorch:
+            scorch = bs.newNode('scorch',
+                                attrs={'position':position,'size':scorchRadius*0.5,'big':profile.big})
+            if profile.scorchColor is not None: scorch.color = profile.scorchColor
+            bsUtils.animate(scorch,"presence",profile.scorchFade)
+            bs.gameTimer(max(profile.scorchFade.keys()),scorch.delete)
+
+        for delay,name,volume in profile._sounds:
+            if delay == 0: _playBlastSound(factory,name,volume,position)
+            elif lod >= _gBlastLODOptionalCutoff: bs.gameTimer(delay,bs.Call(_playBlastSound,factory,name,volume,position))
+
+        if profile.shakeIntensity is not None:
+            if isinstance(bs.getSession(),bs.CoopSession) or bsUtils.getConfigSnapshot().cameraShake:
+                bs.shakeCamera(intensity=profile.shakeIntensity)
+
+
+class _BlastAggregator(object):
+    """ groups up each tick's blasts for an activity; see bs.BlastGroup """
+    def __init__(self):
+        self._tick = None
+        self._groups = []
+        self._stats = {'blasts':0,'groups':0,'merged':0}
+
+    def add(self,blast,position,velocity):
+        now = bs.getGameTime()
+        if now != self._tick:
+            self._tick = now
+            self._groups = []
+        self._stats['blasts'] += 1
+        mergeRadius = bsUtils.getConfigSnapshot().blastMergeRadius
+        if mergeRadius > 0:
+            for group in self._groups:
+                if group.blastType == blast.blastType and group._getDistance(position) <= mergeRadius:
+                    group._add(position,velocity,blast.radius)
+                    self._stats['merged'] += 1
+                    return group
+        group = BlastGroup(blast.blastType,position,velocity,blast.radius)
+        self._groups.append(group)
+        self._stats['groups'] += 1
+        # visuals go in at the end of the tick once everything that's merging has arrived
+        bs.gameTimer(1,group._spawn)
+        return group
+
+def _getBlastAggregator():
+    activity = bs.getActivity()
+    try: return activity._sharedBlastAggregator
+    except Exception:
+        a = activity._sharedBlastAggregator = _BlastAggregator()
+        return a
+
+def getBlastMergeStats():
+    """
+    category: Game Flow Functions
+
+    Returns a dict with how many 'blasts' have gone off in the current activity,
+    how many 'groups' they were shown as, and how many were 'merged' into another
+    blast's group (see the 'Blast Merge Radius' config value; 0 disables merging).
+    """
+    return dict(_getBlastAggregator()._stats)
+
+_gNormalBlastEmits = [
+    {'count':(4,8),'chunkType':'rock'},
+    {'count':(4,8),'scale':0.5,'chunkType':'rock'},
+    {'count':30,'scale':0.7,'chunkType':'spark','emitType':'stickers'},
+    {'count':(18,20),'scale':0.8,'spread':1.5,'chunkType':'spark'},
+    # every now and then do a sparky one
+    {'delay':70,'chance':0.1,'count':(10,35),'scale':2.5,'spread':0.5,'chunkType':'spark'}]
+
+_gNormalBlastProfile = BlastProfile(emits=_gNormalBlastEmits)
+registerBlastProfile('normal',_gNormalBlastProfile)
+registerBlastProfile('landMine',_gNormalBlastProfile.copy(hitMagnitude=5000.0))
+registerBlastProfile('fire',_gNormalBlastProfile.copy(explosionColor=(1.25,0.8,0.8),
+                                                      scorchColor=(1.25,0.95,0.95),
+                                                      scorchFade={3000:2,5000:1.5,5150:0.5,8000:0},
+                                                      shakeIntensity=0.25,hitMagnitude=300.0))
+registerBlastProfile('curse',_gNormalBlastProfile.copy(explosionColor=(0.8,0.36,0.4),
+                                                       lightColor=(0.8,0.36,0.4),lightVolumeIntensity=50.0,
+                                                       sounds=[(0,'overdriveExplosionSound',1.0)],
+                                                       shakeIntensity=3.5,hitMagnitude=2400.0))
+registerBlastProfile('tnt',BlastProfile(emits=[{'count':30,'scale':1.0,'chunkType':'spark','emitType':'stickers'},
+                                               {'count':(18,20),'scale':1.0,'spread':1.5,'chunkType':'spark'},
+                                               # tnt throws metal chunks
+                                               {'delay':60,'count':(35,50),'scale':1.5,'spread':1,'chunkType':'metal'},
+                                               {'delay':70,'count':(10,35),'scale':2.5,'spread':0.5,'chunkType':'spark'}],
+                                        explosionColor=(0,1,0),big=True,
+                                        lightColor=(0.4,0.7,0.4),lightRadiusScale=1.4,lightTimeScale=3.0,
+                                        scorchColor=(0.4,0.7,0.4),scorchRadiusScale=1.15,
+                                        # tnt is more epic..
+                                        sounds=[(0,'getRandomTNTExplodeSound',1.0),
+                                                (250,'getRandomExplodeSound',1.0),
+                                                (400,'debrisFallSound',1.0),
+                                                (400,'woodDebrisFallSound',1.0),
+                                                (500,'getRandomTNTExplodeSound',1.0)],
+                                        shakeIntensity=5.0,hitMagnitude=4000.0))
+registerBlastProfile('miniDynamite',BlastProfile(emits=_gNormalBlastEmits[-1:],
+                                                 lightRadiusScale=0.15,shakeIntensity=None,hitMagnitude=1600.0))
+registerBlastProfile('ice',BlastProfile(emits=[{'count':30,'spread':2.0,'scale':0.4,'chunkType':'ice','emitType':'stickers'}],
+                                        explosionColor=(0,0.05,0.4),lightColor=(0.6,0.6,1.0),scorchColor=(1,1,1.5),
+                                        sounds=[(0,'hissSound',1.0)],hitMagnitude=1000.0))
+registerBlastProfile('sticky',BlastProfile(explosion=False,lightColor=None,scorch=False,hitMagnitude=1.0))
+registerBlastProfile('overPowerBomb',BlastProfile(emits=[{'count':(4,8),'spread':0.7,'chunkType':'slime'},
+                                                         {'count':(4,8),'scale':0.5,'spread':0.7,'chunkType':'slime'},
+                                                         {'count':15,'scale':0.6,'chunkType':'slime','emitType':'stickers'},
+                                                         {'count':20,'scale':0.7,'chunkType':'spark','emitType':'stickers'},
+                                                         {'count':(6,12),'scale':0.8,'spread':1.5,'chunkType':'spark'}]))
+registerBlastProfile('dynamite',BlastProfile(emits=[{'count':(4,8),'chunkType':'rock'},
+                                                    {'count':(4,8),'scale':0.8,'chunkType':'rock'},
+                                                    {'count':(8,20),'scale':0.7,'spread':1.5,'chunkType':'spark'},
+                                                    {'count':60,'scale':1.0,'spread':3.0,'chunkType':'spark','emitType':'stickers'}],
+                                             hitMagnitude=1300.0))
+registerBlastProfile('impact',BlastProfile(emits=[{'count':(4,8),'scale':0.8,'chunkType':'metal'},
+                                                  {'count':(4,8),'scale':0.4,'chunkType':'metal'},
+                                                  {'count':20,'scale':0.7,'chunkType':'spark','emitType':'stickers'},
+                                                  {'count':(8,15),'scale':0.8,'spread':1.5,'chunkType':'spark'}]))
+registerBlastProfile('combat',BlastProfile(emits=[{'count':(4,15),'scale':0.9,'chunkType':'metal'},
+                                                  {'count':(4,15),'scale':0.5,'chunkType':'metal'},
+                                                  {'count':30,'scale':0.7,'chunkType':'spark','emitType':'stickers'},
+                                                  {'count':(8,20),'scale':0.7,'spread':1.5,'chunkType':'spark'},
+                                                  {'emitType':'distortion','spread':1.0}],
+                                           explosionColor=(0,0,1),
+                                           lightColor=(0.2,0.69,0.9),lightVolumeIntensity=50.0,lightRadiusScale=0.5,lightTimeScale=2.0,
+                                           sounds=[(0,'combatExplosionSound',1.0)],shakeIntensity=0.5,hitMagnitude=3700.0))
+registerBlastProfile('knocker',BlastProfile(emits=[{'count':(4,30),'scale':0.5,'chunkType':'ice'},
+                                                   {'count':15,'scale':0.3,'chunkType':'spark','emitType':'stickers'},
+                                                   {'count':(4,8),'emitType':'tendrils','tendrilType':'ice'},
+                                                   {'emitType':'distortion','spread':0.3}],
+                                            explosionColor=(0.2,0.2,0.6),
+                                            lightColor=(0.0,0.0,1.0),lightVolumeIntensity=5.0,
+                                            sounds=[(0,'knockerExplosionSound',1.0)],shakeIntensity=0.75,hitMagnitude=3000.0))
+registerBlastProfile('hijump',BlastProfile(emits=[{'emitType':'distortion','spread':2.0},
+                                                  {'count':15,'scale':1.0,'chunkType':'spark','emitType':'stickers'},
+                                                  {'count':(8,20),'scale':0.3,'spread':3.0,'chunkType':'spark'}],
+                                           explosionColor=(1,0.01,0.95),
+                                           lightColor=(1,0.05,0.95),lightVolumeIntensity=5.0,scorchColor=(0.7,0.05,0.65),
+                                           sounds=[(0,'hijumpSound',2.0)],shakeIntensity=0.1))
+registerBlastProfile('healing',BlastProfile(emits=[{'count':(1,4),'emitType':'tendrils','tendrilType':'smoke'},
+                                                   {'emitType':'distortion','spread':1.0}],
+                                            explosionColor=(1,0,0.3),
+                                            lightColor=(1,0.73,1),scorchColor=(2,1.73,2),hitMagnitude=0.0))
+registerBlastProfile('ranger',BlastProfile(emits=[{'count':(4,20),'scale':1.5,'chunkType':'spark'},
+                                                  {'count':(4,20),'scale':1.2,'chunkType':'spark'},
+                                                  {'count':50,'scale':0.7,'chunkType':'spark','emitType':'stickers'},
+                                                  {'count':(8,45),'scale':1.0,'spread':3,'chunkType':'spark'}],
+                                           explosionColor=(1,1,0),big=True,
+                                           lightColor=(1,1,1),lightVolumeIntensity=100.0,lightRadiusScale=1.6,lightTimeScale=2.0,
+                                           scorchColor=(2,2,2),
+                                           sounds=[(0,'crystalExplosionSound',1.0)],shakeIntensity=2.0,hitMagnitude=2300.0))
+registerBlastProfile('grenade',BlastProfile(emits=[{'count':(6,15),'scale':0.8,'chunkType':'rock'},
+                                                   {'count':(6,30),'scale':0.5,'chunkType':'rock'}],
+                                            big=True,sounds=[(0,'getRandomGrenadeSound',1.0)],
+                                            shakeIntensity=1.5,hitMagnitude=2300.0))
+
 class Blast(bs.Actor):
     """
     category: Game Flow Classes
@@ -386,316 +756,11 @@ class Blast(bs.Actor):
 
         bs.gameTimer(50,self.node.delete)
 
-        # throw in an explosion and flash````
-        if not self.blastType == 'sticky':
-          explosion = bs.newNode("explosion",
-                                 attrs={'position':position,
-                                        'velocity':(velocity[0],max(-1.0,velocity[1]),velocity[2]),
-                                        'radius':self.radius,
-                                        'big':(self.blastType == 'tnt' or self.blastType == 'ranger' or self.blastType == 'grenade')})
-        if self.blastType == "ice":
-            explosion.color = (0,0.05,0.4)
-            
-        if self.blastType == "fire":
-            explosion.color = (1.25,0.8,0.8)   
-            
-        # jasonhu5
-        if self.blastType == "ranger":
-            explosion.color = (1,1,0)
-            
-        if self.blastType == "curse":
-            explosion.color = (0.8,0.36,0.4)
-            
-        if self.blastType == "combat":
-            explosion.color = (0,0,1)
-            
-        if self.blastType == "knocker":
-            explosion.color = (0.2,0.2,0.6)
-            
-        if self.blastType == "tnt":
-            explosion.color = (0,1,0)
-            
-        if self.blastType == "healing":
-            explosion.color = (1,0,0.3)
-            
-        if self.blastType == "hijump":
-            explosion.color = (1,0.01,0.95)
-
-        # if self.blastType != 'ice': bs.emitBGDynamics(position=position,velocity=velocity,count=int(1.0+random.random()*4),emitType='tendrils',tendrilType='thinSmoke')
-        # if self.blastType != 'combat' and self.blastType != 'knocker': bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*4),emitType='tendrils',tendrilType='ice' if self.blastType == 'ice' else 'smoke')
-        # bs.emitBGDynamics(position=position,emitType='distortion',spread=1.0 if self.blastType == 'tnt' else 2.0)
-
-        # and emit some shrapnel..
-        if self.blastType == 'ice':
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=30,spread=2.0,scale=0.4,chunkType='ice',emitType='stickers');
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-
-
-        elif self.blastType == 'sticky':
-            def _doEmit():
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),spread=0.7,chunkType='slime');
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.5, spread=0.7,chunkType='slime');
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=15,scale=0.6,chunkType='slime',emitType='stickers');
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=20,scale=0.7,chunkType='spark',emitType='stickers');
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=int(6.0+random.random()*12),scale=0.8,spread=1.5,chunkType='spark');
-                # jasonhu5
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=int(10.0+random.random()*4),emitType='tendrils',tendrilType='smoke')        
-                # bs.emitBGDynamics(position=position,emitType='distortion',spread=1.0)
-                pass
-            bs.gameTimer(5,_doEmit) # looks better if we delay a bit
-        # jasonhu5
-        elif self.blastType == 'overPowerBomb':
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),spread=0.7,chunkType='slime');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.5, spread=0.7,chunkType='slime');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=15,scale=0.6,chunkType='slime',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=20,scale=0.7,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(6.0+random.random()*12),scale=0.8,spread=1.5,chunkType='spark');
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-        # 
-            
-        elif self.blastType == 'dynamite':
-            def _doEmit():
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),chunkType='rock');
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.8,chunkType='rock');
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*20),scale=0.7,spread=1.5,chunkType='spark');
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=60,scale=1.0,spread=3.0,chunkType='spark',emitType='stickers');
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'impact': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.8,chunkType='metal');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.4,chunkType='metal');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=20,scale=0.7,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*15),scale=0.8,spread=1.5,chunkType='spark');
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'combat': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*15),scale=0.9,chunkType='metal');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*15),scale=0.5,chunkType='metal');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=30,scale=0.7,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*20),scale=0.7,spread=1.5,chunkType='spark');
-                bs.emitBGDynamics(position=position,emitType='distortion',spread=1.0);
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'knocker': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*30),scale=0.5,chunkType='ice');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=15,scale=0.3,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),emitType='tendrils',tendrilType='ice')
-                bs.emitBGDynamics(position=position,emitType='distortion',spread=0.3);
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'hijump': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,emitType='distortion',spread=2.0);
-                bs.emitBGDynamics(position=position,velocity=velocity,count=15,scale=1.0,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*20),scale=0.3,spread=3.0,chunkType='spark');
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'healing': # regular bomb shrapnel
-            def _doEmit():
-                # bs.emitBGDynamics(position=position,emitType='distortion',spread=1.5);
-                # bs.emitBGDynamics(position=position,emitType='distortion',spread=2.0);
-                # bs.emitBGDynamics(position=position,emitType='distortion',spread=1.0);
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=30,scale=1.0,chunkType='spark',emitType='stickers');
-                # bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*20),scale=0.7,spread=1.5,chunkType='spark');
-                # jasonhu5
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(1.0+random.random()*4),emitType='tendrils',tendrilType='smoke')        
-                bs.emitBGDynamics(position=position,emitType='distortion',spread=1.0)
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-            
-        elif self.blastType == 'ranger': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*20),scale=1.5,chunkType='spark');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*20),scale=1.2,chunkType='spark');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=50,scale=0.7,chunkType='spark',emitType='stickers');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(8.0+random.random()*45),scale=1.0,spread=3,chunkType='spark');
-            bs.gameTimer(50,_doEmit)
-            
-        elif self.blastType == 'grenade': # regular bomb shrapnel
-            def _doEmit():
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(6.0+random.random()*15),scale=0.8,chunkType='rock');
-                bs.emitBGDynamics(position=position,velocity=velocity,count=int(6.0+random.random()*30),scale=0.5,chunkType='rock');
-            bs.gameTimer(50,_doEmit)
-
-        else: # regular or land mine bomb shrapnel
-            def _doEmit():
-                if self.blastType != 'tnt' and self.blastType != 'miniDynamite':
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),chunkType='rock');
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(4.0+random.random()*8),scale=0.5,chunkType='rock');
-                if self.blastType != 'miniDynamite':
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=30,scale=1.0 if self.blastType=='tnt' else 0.7,chunkType='spark',emitType='stickers');
-                    bs.emitBGDynamics(position=position,velocity=velocity,count=int(18.0+random.random()*20),scale=1.0 if self.blastType == 'tnt' else 0.8,spread=1.5,chunkType='spark');
-
-                # tnt throws metal chunks
-                if self.blastType == 'tnt':
-                    def _emitSplinters():
-                        bs.emitBGDynamics(position=position,velocity=velocity,count=int(35.0+random.random()*50),scale=1.5,spread=1,chunkType='metal');
-                    bs.gameTimer(10,_emitSplinters)
-                
-                # every now and then do a sparky one
-                if self.blastType == 'tnt' or random.random() < 0.1:
-                    def _emitExtraSparks():
-                        bs.emitBGDynamics(position=position,velocity=velocity,count=int(10.0+random.random()*35),scale=2.5,spread=0.5,chunkType='spark');
-                    bs.gameTimer(20,_emitExtraSparks)
-                        
-            bs.gameTimer(50,_doEmit) # looks better if we delay a bit
-
-        if self.blastType == 'tnt':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (0.4,0.7,0.4),
-                                  'volumeIntensityScale': 10.0})
-        elif self.blastType == 'ranger':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (1,1,1),
-                                  'volumeIntensityScale': 100.0})
-        elif self.blastType == 'curse':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (0.8,0.36,0.4),
-                                  'volumeIntensityScale': 50.0})
-        elif self.blastType == 'combat':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (0.2,0.69,0.9),
-                                  'volumeIntensityScale': 50.0})
-        elif self.blastType == 'healing':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (1,0.73,1),                                  
-                                  'volumeIntensityScale': 10.0})                      
-        elif self.blastType == 'hijump':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (1,0.05,0.95),                                  
-                                  'volumeIntensityScale': 5.0})
-        elif self.blastType == 'knocker':
-            light = bs.newNode('light',
-                           attrs={'position':position,
-                                  'color': (0.0,0.0,1.0),
-                                  'volumeIntensityScale': 5.0})
-        else:
-            if not self.blastType == 'sticky':
-                light = bs.newNode('light',
-                               attrs={'position':position,
-                                      'color': (0.6,0.6,1.0) if self.blastType == 'ice' else (1,0.3,0.1),
-                                      'volumeIntensityScale': 10.0})
-        scorchRadius = lightRadius = self.radius
-        if not self.blastType == 'sticky':
-            s = random.uniform(0.6,0.9)
-            if self.blastType == 'tnt':
-                lightRadius *= 1.4
-                scorchRadius *= 1.15
-                s *= 3.0
-            elif self.blastType == 'ranger':
-                lightRadius *= 1.6
-                s *= 2.0
-            elif self.blastType == 'combat':
-                lightRadius *= 0.5
-                s *= 2.0
-            elif self.blastType == 'miniDynamite':
-                lightRadius *= 0.15
-                s *= 1.0
-            elif self.blastType == 'sticky':
-                lightRadius *= 0.05
-                scorchRadius = 0.0
-
-            iScale = 1.6
-            bsUtils.animate(light,"intensity",{0:2.0*iScale, int(s*20):0.1*iScale, int(s*25):0.2*iScale, int(s*50):17.0*iScale, int(s*60):5.0*iScale, int(s*80):4.0*iScale, int(s*200):0.6*iScale, int(s*2000):0.00*iScale, int(s*3000):0.0})
-            bsUtils.animate(light,"radius",{0:lightRadius*0.2, int(s*50):lightRadius*0.55, int(s*100):lightRadius*0.3, int(s*300):lightRadius*0.15, int(s*1000):lightRadius*0.05})
-            bs.gameTimer(int(s*3000),light.delete)
+        self.profile = getBlastProfile(self.blastType)
 
-        # make a scorch that fades over time
-        if not self.blastType == 'sticky':
-          scorch = bs.newNode('scorch',
-                          attrs={'position':position,'size':scorchRadius*0.5,'big':(self.blastType == 'tnt' or self.blastType == 'ranger' or self.blastType == 'grenade')})
-          if self.blastType == 'ice':
-              scorch.color = (1,1,1.5)
-              
-          if self.blastType == 'fire':
-              scorch.color = (1.25,0.95,0.95)
-              
-          if self.blastType == 'ranger':
-              scorch.color = (2,2,2)
-              
-          if self.blastType == 'hijump':
-              scorch.color = (0.7,0.05,0.65)
-             
-          if self.blastType == 'healing':
-              scorch.color = (2,1.73,2)
-              
-          if self.blastType == 'tnt':
-              scorch.color = (0.4,0.7,0.4)
-
-          if self.blastType == 'fire':
-              bsUtils.animate(scorch,"presence",{3000:2, 5000:1.5, 5150:0.5, 8000:0})
-              bs.gameTimer(8000,scorch.delete)
-          else:
-              if not self.blastType == 'sticky':
-                  bsUtils.animate(scorch,"presence",{3000:1, 13000:0})
-                  bs.gameTimer(13000,scorch.delete)
-
-        if self.blastType == 'ice':
-            bs.playSound(factory.hissSound,position=light.position)
-            
-        if self.blastType == 'ranger':
-            bs.playSound(factory.crystalExplosionSound,position=light.position)  
-          
-        if self.blastType == 'curse':
-            bs.playSound(factory.overdriveExplosionSound,position=light.position)            
-            
-        p = position
-        if self.blastType == 'combat':
-            bs.playSound(factory.combatExplosionSound,position=p)
-        elif self.blastType == 'knocker':
-            bs.playSound(factory.knockerExplosionSound,position=p)
-        elif self.blastType == 'grenade':
-            bs.playSound(factory.getRandomGrenadeSound(),volume=1.0,position=p)  
-        elif self.blastType == 'hijump':
-            bs.playSound(factory.hijumpSound,volume=2.0,position=p)  
-        else:
-            if self.blastType != 'miniDynamite':
-                # bs.playSound(factory.getRandomExplodeSound(),volume=1.0,position=p)
-                # bs.playSound(factory.debrisFallSound,position=p)
-                pass
-        
-        if isinstance(bs.getSession(),bs.CoopSession) or bs.getConfig().get('Camera Shake', True):
-            if self.blastType == 'ranger':
-                bs.shakeCamera(intensity=2.0)
-            elif self.blastType == 'curse':
-                bs.shakeCamera(intensity=3.5)
-            elif self.blastType == 'grenade':
-                bs.shakeCamera(intensity=1.5)
-            elif self.blastType == 'fire':
-                bs.shakeCamera(intensity=0.25)
-            elif self.blastType == 'hijump':
-                bs.shakeCamera(intensity=0.1)
-            elif self.blastType == 'combat':
-                bs.shakeCamera(intensity=0.5)
-            elif self.blastType == 'knocker':
-                bs.shakeCamera(intensity=0.75)
-            else:
-                if self.blastType != 'miniDynamite':
-                    bs.shakeCamera(intensity=5.0 if self.blastType == 'tnt' else 1.0)
-
-        # tnt is more epic..
-        if self.blastType == 'tnt':
-            bs.playSound(factory.getRandomTNTExplodeSound(),position=p)
-            def _extraBoom():
-                bs.playSound(factory.getRandomExplodeSound(),position=p)
-            bs.gameTimer(250,_extraBoom)
-            def _extraBoom2():
-                bs.playSound(factory.getRandomTNTExplodeSound(),position=p)
-            bs.gameTimer(500,_extraBoom2)
-            def _extraDebrisSound():
-                bs.playSound(factory.debrisFallSound,position=p)
-                bs.playSound(factory.woodDebrisFallSound,position=p)
-            bs.gameTimer(400,_extraDebrisSound)
+        # the explosion, light, shrapnel and sound are shared with any nearby blasts of
+        # our type this tick (our region above still does our own damage)
+        self.blastGroup = _getBlastAggregator().add(self,position,velocity)
 
     def handleMessage(self,m):
         self._handleMessageSanityCheck()
@@ -708,23 +773,7 @@ class Blast(bs.Actor):
             if node is not None:
                 t = self.node.position
 
-                # new
-                mag = 2000.0
-                if self.blastType == 'sticky': mag = 1.0
-                if self.blastType == 'ice': mag *= 0.5
-                elif self.blastType == 'impact': mag *= 1.0
-                elif self.blastType == 'fire': mag *= 0.15
-                elif self.blastType == 'landMine': mag *= 2.5
-                elif self.blastType == 'tnt': mag *= 2.0
-                elif self.blastType == 'knocker': mag *= 1.5
-                elif self.blastType == 'combat': mag *= 1.85
-                elif self.blastType == 'dynamite': mag *= 0.65
-                elif self.blastType == 'miniDynamite': mag *= 0.8
-                elif self.blastType == 'ranger': mag *= 1.15
-                elif self.blastType == 'grenade': mag *= 1.15
-                elif self.blastType == 'curse': mag *= 1.2
-                elif self.blastType == 'healing': mag *= 0.0
-                elif self.blastType == 'hijump': mag *= 1.0
+                mag = self.profile.hitMagnitude
 
                 node.handleMessage(bs.HitMessage(pos=t,
                                                     velocity=(0,0,0),
@@ -747,6 +796,176 @@ class Blast(bs.Actor):
         else:
             bs.Actor.handleMessage(self,m)
 
+class BombType(object):
+    """
+    category: Game Flow Classes
+
+    Describes a type of bs.Bomb: its node, media, fuse and blast.
+    Types are registered by name with bs.registerBombType(); bs.Bomb looks
+    them up from there, so new bomb types can be added without touching
+    bsBomb or bsSpaz.
+
+    Media and materials are given as bs.BombFactory attribute names
+    and get resolved once per activity.
+
+    Attributes:
+
+       name
+          The bombType string used to create bs.Bombs of this type.
+
+       nodeType
+          'bomb' for regular fused bombs or 'prop' for everything else.
+
+       model, lightModel, colorTexture, body, shadowSize, reflection,
+       reflectionScale, sticky, modelScale, bodyScale
+          Node attributes (None for the node's default).
+
+       footing
+          Whether the bomb can be stood on (like tnt).
+
+       extraMaterials
+          bs.BombFactory material names applied on top of the standard ones.
+
+       fuseTime
+          Milliseconds until the bomb goes off, or None if it only goes off when hit.
+
+       timers
+          A list of (milliseconds, message class) sent to the bomb after creation
+          (bsBomb.ArmMessage, bsBomb.DeployMessage, etc).
+
+       blastRadiusScale
+          Multiplier applied to the blastRadius the bomb was created with.
+
+       blastType
+          The bs.Blast type it explodes with (defaults to its name).
+
+       powerupTex
+          The bs.PowerupFactory texture name shown on a spaz carrying this type
+          (None if it isn't something a spaz can have).
+
+       pickUpOnDrop
+          Whether a spaz holds onto this bomb type when dropping it.
+    """
+    def __init__(self,name,nodeType='bomb',model='bombModel',lightModel=None,colorTexture='regularTex',
+                 body=None,shadowSize=0.3,reflection='sharper',reflectionScale=1.8,sticky=None,
+                 modelScale=None,bodyScale=None,footing=False,extraMaterials=('normalSoundMaterial',),
+                 fuseTime=3000,timers=(),blastRadiusScale=1.0,blastType=None,powerupTex=None,pickUpOnDrop=True):
+        self.name = name
+        self.nodeType = nodeType
+        self.model = model
+        self.lightModel = lightModel
+        self.colorTexture = colorTexture
+        self.body = body
+        self.shadowSize = shadowSize
+        self.reflection = reflection
+        self.reflectionScale = reflectionScale
+        self.sticky = sticky
+        self.modelScale = modelScale
+        self.bodyScale = bodyScale
+        self.footing = footing
+        self.extraMaterials = tuple(extraMaterials)
+        self.fuseTime = fuseTime
+        self.timers = list(timers)
+        self.blastRadiusScale = blastRadiusScale
+        self.blastType = blastType if blastType is not None else name
+        self.powerupTex = powerupTex
+        self.pickUpOnDrop = pickUpOnDrop
+
+    def _resolveMedia(self,factory):
+        """ returns the node attrs for this type with all media looked up (done once per activity by bs.BombFactory) """
+        attrs = {'shadowSize':self.shadowSize,
+                 'reflection':self.reflection,
+                 'reflectionScale':[self.reflectionScale]}
+        for attr in ('model','lightModel','colorTexture'):
+            name = getattr(self,attr)
+            if name is not None: attrs[attr] = getattr(factory,name)
+        for attr in ('body','sticky','modelScale','bodyScale'):
+            value = getattr(self,attr)
+            if value is not None: attrs[attr] = value
+        # adding footing-materials to things can screw up jumping and flying since players carrying those things
+        # and thus touching footing objects will think they're on solid ground..
+        materials = (factory.bombMaterial,)
+        if self.footing: materials += (bs.getSharedObject('footingMaterial'),)
+        materials += (bs.getSharedObject('objectMaterial'),)
+        materials += tuple(getattr(factory,m) for m in self.extraMaterials)
+        attrs['materials'] = materials
+        if self.nodeType == 'bomb': attrs.setdefault('sticky',False)
+        return attrs
+
+
+_gBombTypes = {}
+
+def registerBombType(bombType):
+    """
+    category: Game Flow Functions
+
+    Registers a bs.BombType so bs.Bombs can be created with its name.
+    """
+    _gBombTypes[bombType.name] = bombType
+
+def getBombType(name):
+    """
+    category: Game Flow Functions
+
+    Returns the bs.BombType registered under the given name.
+    """
+    try: return _gBombTypes[name]
+    except KeyError: raise Exception("invalid bomb type: " + name)
+
+def getBombTypeNames():
+    """
+    category: Game Flow Functions
+
+    Returns the names of all registered bomb types.
+    """
+    return _gBombTypes.keys()
+
+registerBombType(BombType('normal'))
+registerBombType(BombType('ice',colorTexture='iceTex',blastRadiusScale=1.1,powerupTex='texIceBombs'))
+registerBombType(BombType('fire',colorTexture='fireTex',blastRadiusScale=1.1,powerupTex='texFireBombs'))
+# curse bombs don't exist as such, but they're used for the explosion
+registerBombType(BombType('curse',blastRadiusScale=2.1))
+registerBombType(BombType('sticky',model='stickyBombModel',colorTexture='stickyTex',sticky=True,
+                          extraMaterials=(),fuseTime=1,powerupTex='texStickyBombs'))
+registerBombType(BombType('overPowerBomb',model='stickyBombModel',colorTexture='overPowerTex',
+                          extraMaterials=('impactBlastMaterial',),fuseTime=1,
+                          powerupTex='texStickyBombs',pickUpOnDrop=False))
+registerBombType(BombType('ranger',model='crystalModel',colorTexture='rangerTex',
+                          extraMaterials=('crystalSoundMaterial',),fuseTime=4000,timers=[(1,DeployMessage)],
+                          blastRadiusScale=1.8,powerupTex='texRangerBombs'))
+registerBombType(BombType('knocker',model='knockerBombModel',colorTexture='knockerTex',
+                          reflection='powerup',reflectionScale=0.35,blastRadiusScale=1.5,powerupTex='texKnockerBombs'))
+registerBombType(BombType('dynamite',model='dynamiteModel',colorTexture='dynamiteTex',reflectionScale=0.8,
+                          timers=[(1,DeployMessage)],blastRadiusScale=0.75,powerupTex='texDynamitePack'))
+registerBombType(BombType('landMine',nodeType='prop',model='landMineModel',lightModel='landMineModel',
+                          colorTexture='landMineTex',body='landMine',shadowSize=0.44,reflection='powerup',reflectionScale=1.0,
+                          extraMaterials=('landMineNoExplodeMaterial','normalSoundMaterial'),fuseTime=None,blastRadiusScale=0.7))
+registerBombType(BombType('tnt',nodeType='prop',model='tntModel',lightModel='tntModel',colorTexture='tntTex',
+                          body='crate',shadowSize=0.5,reflection='soft',reflectionScale=0.23,sticky=True,footing=True,
+                          fuseTime=None,blastRadiusScale=1.6))
+registerBombType(BombType('miniDynamite',nodeType='prop',model='miniDynamiteModel',lightModel='miniDynamiteModel',
+                          colorTexture='dynamiteTex',body='crate',shadowSize=0.1,reflection='soft',reflectionScale=0.1,
+                          modelScale=1,bodyScale=0.55,fuseTime=1,blastRadiusScale=0.65))
+registerBombType(BombType('impact',nodeType='prop',model='impactBombModel',colorTexture='impactTex',body='sphere',
+                          reflection='powerup',reflectionScale=1.5,extraMaterials=('impactBlastMaterial','normalSoundMaterial'),
+                          fuseTime=10000,timers=[(200,ArmMessage),(10000-1700,WarnMessage)],
+                          blastRadiusScale=0.7,powerupTex='texImpactBombs'))
+registerBombType(BombType('hijump',nodeType='prop',model='impactBombModel',colorTexture='impactTex',body='sphere',
+                          reflection='powerup',reflectionScale=1.5,fuseTime=1,blastRadiusScale=0.75,powerupTex='texHijump'))
+registerBombType(BombType('healing',nodeType='prop',model='healingBombModel',colorTexture='healingTex',body='sphere',
+                          reflection='powerup',extraMaterials=('impactBlastMaterial','normalSoundMaterial'),
+                          fuseTime=1,timers=[(1,DeployMessage)],blastRadiusScale=1.2,powerupTex='texHealBombs'))
+registerBombType(BombType('combat',nodeType='prop',model='combatBombModel',lightModel='combatBombModel',
+                          colorTexture='combatTex',body='sphere',shadowSize=0.5,reflection='powerup',reflectionScale=1.0,
+                          fuseTime=2000,timers=[(300,DeployMessage),(1200,DeployMessage),(2000-250,ReadyMessage)],
+                          blastRadiusScale=0.85,powerupTex='texCombatBombs'))
+registerBombType(BombType('basketball',nodeType='prop',model='basketballModel',lightModel='basketballModel',
+                          colorTexture='basketballTex',body='sphere',shadowSize=0.5,reflection='soft',reflectionScale=0.35,
+                          extraMaterials=('basketballSoundMaterial',),fuseTime=None))
+registerBombType(BombType('grenade',nodeType='prop',model='grenadeBombModel',lightModel='grenadeBombModel',
+                          colorTexture='grenade3Tex',body='sphere',shadowSize=0.1,reflection='soft',reflectionScale=0.5,
+                          timers=[(1,DeployMessage)],blastRadiusScale=1.45,pickUpOnDrop=False))
+
 class Bomb(bs.Actor):
     """
     category: Game Flow Classes
@@ -799,7 +1018,8 @@ class Bomb(bs.Actor):
         """
         Create a new Bomb.
         
-        bombType can be 'ice','impact','landMine','normal','sticky', 'ranger', or 'tnt'.
+        bombType can be 'ice','impact','landMine','normal','sticky', 'ranger', 'tnt',
+        or any other type registered with bs.registerBombType().
         Note that for impact or landMine bombs you have to call arm()
         before they will go off.
         """
@@ -819,30 +1039,13 @@ class Bomb(bs.Actor):
 
         factory = self.getFactory()
 
-        # jasonhu5, just added overPowerBomb
-        if not bombType in ('ice','impact','landMine','normal','sticky', 'overPowerBomb','ranger','tnt','combat','knocker','dynamite','miniDynamite','fire','healing','curse','grenade','hijump','basketball'): raise Exception("invalid bomb type: " + bombType)
-        # 
+        bombTypeInfo = self.bombTypeInfo = getBombType(bombType)
         self.bombType = bombType
 
         self._exploded = False
+        self._lastStickySoundTime = 0
 
-        if self.bombType == 'sticky': self._lastStickySoundTime = 0
-
-        self.blastRadius = blastRadius
-        if self.bombType == 'ice': self.blastRadius *= 1.1
-        elif self.bombType == 'fire': self.blastRadius *= 1.1
-        elif self.bombType == 'impact': self.blastRadius *= 0.7
-        elif self.bombType == 'combat': self.blastRadius *= 0.85
-        elif self.bombType == 'knocker': self.blastRadius *= 1.5
-        elif self.bombType == 'dynamite': self.blastRadius *= 0.75
-        elif self.bombType == 'miniDynamite': self.blastRadius *= 0.65
-        elif self.bombType == 'landMine': self.blastRadius *= 0.7
-        elif self.bombType == 'tnt': self.blastRadius *= 1.6
-        elif self.bombType == 'ranger': self.blastRadius *= 1.8
-        elif self.bombType == 'curse': self.blastRadius *= 2.1
-        elif self.bombType == 'healing': self.blastRadius *= 1.2
-        elif self.bombType == 'grenade': self.blastRadius *= 1.45
-        elif self.bombType == 'hijump': self.blastRadius *= 0.75
+        self.blastRadius = blastRadius*bombTypeInfo.blastRadiusScale
 
         self._explodeCallbacks = []
         
@@ -860,246 +1063,21 @@ class Bomb(bs.Actor):
         # the node this came from
         self.owner = owner
 
-        # adding footing-materials to things can screw up jumping and flying since players carrying those things
-        # and thus touching footing objects will think they're on solid ground..
-        # perhaps we don't wanna add this even in the tnt case?..
-        if self.bombType == 'tnt':
-            materials = (factory.bombMaterial, bs.getSharedObject('footingMaterial'), bs.getSharedObject('objectMaterial'))
-        else:
-            materials = (factory.bombMaterial, bs.getSharedObject('objectMaterial'))
-
-        # jasonhu5
-        if self.bombType == 'impact' or self.bombType == 'healing': materials = materials + (factory.impactBlastMaterial,)
-        elif self.bombType == 'landMine': materials = materials + (factory.landMineNoExplodeMaterial,)
-
-        # if self.bombType == 'sticky': materials = materials + (factory.impactBlastMaterial,)
-        if self.bombType == 'sticky': pass
-        # jasonhu5
-        elif self.bombType == 'overPowerBomb': materials = materials + (factory.impactBlastMaterial,)
-        # 
-        elif self.bombType == 'ranger': materials = materials + (factory.crystalSoundMaterial,)
-        elif self.bombType == 'basketball': materials = materials + (factory.basketballSoundMaterial,)
-        else: materials = materials + (factory.normalSoundMaterial,)
-
-        # if self.bombType == 'impact' or self.bombType == 'healing': materials = materials + (factory.impactBlastMaterial,)
-        # elif self.bombType == 'landMine': materials = materials + (factory.landMineNoExplodeMaterial,)
-
-        # if self.bombType == 'sticky': materials = materials + (factory.stickyMaterial,)
-        # elif self.bombType == 'ranger': materials = materials + (factory.crystalSoundMaterial,)
-        # elif self.bombType == 'basketball': materials = materials + (factory.basketballSoundMaterial,)
-        # else: materials = materials + (factory.normalSoundMaterial,)
-
-        if self.bombType == 'landMine':
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.landMineModel,
-                                          'lightModel':factory.landMineModel,
-                                          'body':'landMine',
-                                          'shadowSize':0.44,
-                                          'colorTexture':factory.landMineTex,
-                                          'reflection':'powerup',
-                                          'reflectionScale':[1.0],
-                                          'materials':materials})
-
-        elif self.bombType == 'tnt':
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.tntModel,
-                                          'lightModel':factory.tntModel,
-                                          'sticky':True,
-                                          'body':'crate',
-                                          'shadowSize':0.5,
-                                          'colorTexture':factory.tntTex,
-                                          'reflection':'soft',
-                                          'reflectionScale':[0.23],
-                                          'materials':materials})
-                                          
-        elif self.bombType == 'miniDynamite':
-            fuseTime = 1
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.miniDynamiteModel,
-                                          'lightModel':factory.miniDynamiteModel,
-                                          'body':'crate',
-                                          'shadowSize':0.1,
-                                          'modelScale':1,
-                                          'bodyScale':0.55,
-                                          'colorTexture':factory.dynamiteTex,
-                                          'reflection':'soft',
-                                          'reflectionScale':[0.1],
-                                          'materials':materials})
-                                          
-        elif self.bombType == 'impact':
-            fuseTime = 10000
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'body':'sphere',
-                                          'model':factory.impactBombModel,
-                                          'shadowSize':0.3,
-                                          'colorTexture':factory.impactTex,
-                                          'reflection':'powerup',
-                                          'reflectionScale':[1.5],
-                                          'materials':materials})
-            self.armTimer = bs.Timer(200,bs.WeakCall(self.handleMessage,ArmMessage()))
-            self.warnTimer = bs.Timer(fuseTime-1700,bs.WeakCall(self.handleMessage,WarnMessage()))
-        elif self.bombType == 'hijump':
-            fuseTime = 1
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'body':'sphere',
-                                          'model':factory.impactBombModel,
-                                          'shadowSize':0.3,
-                                          'colorTexture':factory.impactTex,
-                                          'reflection':'powerup',
-                                          'reflectionScale':[1.5],
-                                          'materials':materials})
-            
-        elif self.bombType == 'healing':
-            fuseTime = 1
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'body':'sphere',
-                                          'model':factory.healingBombModel,
-                                          'shadowSize':0.3,
-                                          'colorTexture':factory.healingTex,
-                                          'reflection':'powerup',
-                                          'reflectionScale':[1.8],
-                                          'materials':materials})
-            self.deployedTimer = bs.Timer(1,bs.WeakCall(self.handleMessage,DeployMessage()))    
-            
-        elif self.bombType == 'combat':
-            fuseTime = 2000
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.combatBombModel,
-                                          'lightModel':factory.combatBombModel,
-                                          'body':'sphere',
-                                          'shadowSize':0.5,
-                                          'colorTexture':factory.combatTex,
-                                          'reflection':'powerup',
-                                          'reflectionScale':[1.0],
-                                          'materials':materials})
-            self.deployedFirstTimer = bs.Timer(300,bs.WeakCall(self.handleMessage,DeployMessage()))
-            self.deployedTimer = bs.Timer(1200,bs.WeakCall(self.handleMessage,DeployMessage()))
-            self.readyTimer = bs.Timer(fuseTime-250,bs.WeakCall(self.handleMessage,ReadyMessage()))
-            
-        elif self.bombType == 'basketball':
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.basketballModel,
-                                          'lightModel':factory.basketballModel,
-                                          'body':'sphere',
-                                          'shadowSize':0.5,
-                                          'colorTexture':factory.basketballTex,
-                                          'reflection':'soft',
-                                          'reflectionScale':[0.35],
-                                          'materials':materials})
-            
-        elif self.bombType == 'grenade':
-            fuseTime = 3000
-            self.node = bs.newNode('prop',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':factory.grenadeBombModel,
-                                          'lightModel':factory.grenadeBombModel,
-                                          'body':'sphere',
-                                          'shadowSize':0.1,
-                                          'colorTexture':factory.grenade3Tex,
-                                          'reflection':'soft',
-                                          'reflectionScale':[0.5],
-                                          'materials':materials})
-            self.deployedTimer = bs.Timer(1,bs.WeakCall(self.handleMessage,DeployMessage()))
+        attrs = dict(factory.getBombTypeAttrs(bombTypeInfo))
+        attrs['position'] = position
+        attrs['velocity'] = velocity
+        if bombTypeInfo.nodeType == 'bomb': attrs['owner'] = owner
+        self.node = bs.newNode(bombTypeInfo.nodeType,delegate=self,attrs=attrs)
 
-        else:
-            fuseTime = 3000
-            if self.bombType == 'sticky':
-                # jasonhu5
-                fuseTime = 1
-                # 
-                sticky = True
-                model = factory.stickyBombModel
-                rType = 'sharper'
-                rScale = 1.8
-            # jasonhu5
-            elif self.bombType == 'overPowerBomb':
-                fuseTime = 1
-                sticky = False
-                model = factory.stickyBombModel
-                rType = 'sharper'
-                rScale = 1.8
-            # 
-            elif self.bombType == 'ranger':
-                fuseTime = 4000
-                sticky = False
-                model = factory.crystalModel
-                rType = 'sharper'
-                rScale = 1.8
-                self.deployedTimer = bs.Timer(1,bs.WeakCall(self.handleMessage,DeployMessage()))
-            elif self.bombType == 'knocker':
-                fuseTime = 3000
-                sticky = False
-                model = factory.knockerBombModel
-                rType = 'powerup'
-                rScale = 0.35
-            elif self.bombType == 'dynamite':
-                fuseTime = 3000
-                sticky = False
-                model = factory.dynamiteModel
-                rType = 'sharper'
-                rScale = 0.8
-                self.deployedTimer = bs.Timer(1,bs.WeakCall(self.handleMessage,DeployMessage()))
-            else:
-                sticky = False
-                model = factory.bombModel
-                rType = 'sharper'
-                rScale = 1.8
-            if self.bombType == 'ice': tex = factory.iceTex
-            elif self.bombType == 'sticky': tex = factory.stickyTex
-            # jasonhu5
-            elif self.bombType == 'overPowerBomb': tex = factory.overPowerTex
-            # 
-            elif self.bombType == 'dynamite': tex = factory.dynamiteTex
-            elif self.bombType == 'fire': tex = factory.fireTex
-            elif self.bombType == 'ranger': tex = factory.rangerTex
-            elif self.bombType == 'knocker': tex = factory.knockerTex
-            elif self.bombType == 'basketball': tex = factory.basketballTex
-            # Curse bomb doesn't exist, but it's only used for the explosion. I'm gonna add the texture anyway.
-            else: tex = factory.regularTex
-            self.node = bs.newNode('bomb',
-                                   delegate=self,
-                                   attrs={'position':position,
-                                          'velocity':velocity,
-                                          'model':model,
-                                          'shadowSize':0.3,
-                                          'colorTexture':tex,
-                                          'sticky':sticky,
-                                          'owner':owner,
-                                          'reflection':rType,
-                                          'reflectionScale':[rScale],
-                                          'materials':materials})
+        fuseTime = bombTypeInfo.fuseTime
+        self._typeTimers = [bs.Timer(t,bs.WeakCall(self.handleMessage,messageType())) for t,messageType in bombTypeInfo.timers]
+        if bombTypeInfo.nodeType == 'bomb':
             sound = bs.newNode('sound',owner=self.node,attrs={'sound':factory.fuseSound,'volume':0.25})
             self.node.connectAttr('position',sound,'position')
             bsUtils.animate(self.node,'fuseLength',{0:1,fuseTime:0})
 
         # light the fuse!!!
-        if self.bombType not in ('landMine','tnt','basketball'):
+        if fuseTime is not None:
             bs.gameTimer(fuseTime,bs.WeakCall(self.handleMessage,ExplodeMessage()))
 
         bsUtils.animate(self.node,"modelScale",{0:0, 200:1.3, 260:1})
@@ -1238,7 +1216,7 @@ class Bomb(bs.Actor):
                     for c in self._explodeCallbacks: c(self,blast)
                 else:
                     blast = Blast(position=self.node.position,velocity=self.node.velocity,
-                                blastRadius=self.blastRadius,blastType=self.bombType,sourcePlayer=self.sourcePlayer,hitType=self.hitType,hitSubType=self.hitSubType).autoRetain()
+                                blastRadius=self.blastRadius,blastType=self.bombTypeInfo.blastType,sourcePlayer=self.sourcePlayer,hitType=self.hitType,hitSubType=self.hitSubType).autoRetain()
                     for c in self._explodeCallbacks: c(self,blast)
             # we blew up so we need to go away
             bs.gameTimer(1,bs.WeakCall(self.handleMessage,bs.DieMessage()))
@@ -1496,3 +1474,29 @@ class TNTSpawner(object):
                 self._tnt = Bomb(position=self._position,bombType='tnt')
                 self._waitTime = 0
             else: self._waitTime += 1000
+
+
+def benchmarkBombSpawns(clusters=100,clusterSize=3,bombTypes=('normal',)):
+    """
+    Spawns bombs in meteor-shower style clusters in the current activity
+    and reports how long creating them took. The bombs are removed again
+    right away, so nothing goes off. Handy for checking the cost of mass bomb
+    spawns from the console; returns a dict of timings in milliseconds.
+    """
+    times = []
+    for i in range(clusters):
+        for j in range(clusterSize):
+            bombType = bombTypes[(i*clusterSize+j)%len(bombTypes)]
+            pos = (-7.3+15.3*random.random(),11,-5.5+2.1*random.random())
+            vel = ((-5.0+random.random()*30.0) * (-1.0 if pos[0] > 0 else 1.0), -4.0,0)
+            startTime = time.time()
+            bomb = Bomb(position=pos,velocity=vel,bombType=bombType)
+            times.append((time.time()-startTime)*1000.0)
+            bomb.handleMessage(bs.DieMessage())
+    results = {'count':len(times),
+               'totalMS':sum(times),
+               'avgMS':sum(times)/len(times),
+               'firstMS':times[0],
+               'maxMS':max(times)}
+    print 'bomb spawn benchmark ('+', '.join(bombTypes)+'):',', '.join(k+'='+str(round(v,3)) for k,v in sorted(results.items()))
+    return results
@@ -4,10 +4,14 @@ import random
 import weakref
 import copy
 import bsUI
+import bsImport
 import bsAchievement
 import bsGame
 import bsInternal
-import bsTutorial
+import bsTransactions
+
+# the tutorial isn't needed until it's shown (and never on servers)
+bsTutorial = bsImport.lazyImport('bsTutorial')
 
 # team info
 gTeamColors = ((0.2,0.4,1.6),)
@@ -955,11 +959,10 @@ class CoopScoreScreen(bs.Activity):
                     total = self._showInfo['results']['total']
                     rating = 10.0 if total == 1 else round(10.0 * (1.0 - (float(rank-1)/(total-1))),1)
 
-                    bsInternal._addTransaction({'type':'SET_LEVEL_RATING',
-                                                'campaign':self._campaign.getName(),
-                                                'level':self._level,
-                                                'rating':rating})
-                    bsInternal._runTransactions()
+                    bsTransactions.addTransaction({'type':'SET_LEVEL_RATING',
+                                                   'campaign':self._campaign.getName(),
+                                                   'level':self._level,
+                                                   'rating':rating})
                     
                     #self._campaign.submitLevelRating(self._level,rating)
 
@@ -1487,8 +1490,8 @@ class CoopGameActivity(bs.GameActivity):
             bsInternal._reportAchievement(achievement)
 
             # and to our account..
-            bsInternal._addTransaction({'type':'ACHIEVEMENT',
-                                        'name':achievement})
+            bsTransactions.addTransaction({'type':'ACHIEVEMENT',
+                                           'name':achievement})
             
             # now bring up a celebration banner
             a.announceCompletion(sound=sound)
@@ -1503,6 +1506,25 @@ class CoopGameActivity(bs.GameActivity):
             bs.gameTimer(4000,bs.Call(stuffUnlocked,self))
             #bsInternal._runTransactions()
 
+    def _achievementEvent(self,eventType,value=None):
+        """
+        Reports a game event ('score', 'wave', 'kill', etc) that achievements
+        may be triggered by; see bsAchievement.registerAchievementTrigger().
+        """
+        # only this level's incomplete achievements are listening, so most events find nothing to do
+        if not hasattr(self,'_achievementTriggers'):
+            self._achievementTriggers = bsAchievement._getTriggersForCoopLevel(self._getCoopLevelName())
+            self._achievementTriggerCounts = {}
+        triggers = self._achievementTriggers.get(eventType)
+        if not triggers: return
+        for t in list(triggers):
+            if not t.matches(value): continue
+            count = self._achievementTriggerCounts[t] = self._achievementTriggerCounts.get(t,0)+1
+            if count < t.count: continue
+            triggers.remove(t)
+            if t.delay > 0: bs.gameTimer(t.delay,bs.WeakCall(self._awardAchievement,t.name,t.sound))
+            else: self._awardAchievement(t.name,sound=t.sound)
+
     def fadeToRed(self):
         """
         Fades the screen to red; useful when the good guys have lost.
@@ -1892,7 +1914,7 @@ class CoopSession(bs.Session):
                                            'call':bs.WeakCall(self.restart)}]
 
         # if we were in a tutorial, just pop a transition to get to the actual round
-        elif isinstance(activity,bsTutorial.TutorialActivity):
+        elif bsImport.isLoaded(bsTutorial) and isinstance(activity,bsTutorial.TutorialActivity):
             self.setActivity(bs.newActivity(bsGame.TransitionActivity))
         else:
 
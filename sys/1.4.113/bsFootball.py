@@ -849,12 +849,7 @@ class FootballCoopGame(bs.CoopGameActivity):
             bs.gameTimer(3000,bs.Call(self._spawnBot,(type(m.badGuy))))
 
         elif isinstance(m,bs.SpazBotPunchedMessage):
-            if self._preset in ['rookie','rookieEasy']:
-                if m.damage >= 500:
-                    self._awardAchievement('Super Punch')
-            elif self._preset in ['pro','proEasy']:
-                if m.damage >= 1000:
-                    self._awardAchievement('Super Mega Punch')
+            self._achievementEvent('punch',m.damage)
 
         # respawn dead flags
         elif isinstance(m,bs.FlagDeathMessage):
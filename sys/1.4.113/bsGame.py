@@ -341,6 +341,8 @@ class Actor(object):
         # update; we now *always* add a weak-ref...
         activity._addActorWeakRef(self)
 
+        bsUtils._registerLiveObject(self,'Actor',activity)
+
     def __del__(self):
         try:
             # non-finalized actors send themselves a DieMessage when going down
@@ -496,6 +498,7 @@ class Session(object):
 
         # first thing, generate our link to our C layer equivalent..
         self._sessionData = bsInternal._registerSession(self)
+        bsUtils._registerLiveObject(self,'Session')
 
         # self._tempSessionSanityCheck()
         
@@ -1075,6 +1078,7 @@ class Activity(object):
         self._activityData = bsInternal._registerActivity(self)
         session = bs.getSession()
         self._session = weakref.ref(session)
+        bsUtils._registerLiveObject(self,'Activity')
 
         if session is None: raise Exception("No current session")
         if type(settings) is not dict: raise Exception("expected dict for settings")
@@ -1084,6 +1088,7 @@ class Activity(object):
 
         self._hasTransitionedIn = False
         self._hasBegun = False
+        self._beginMS = None
         self._hasEnded = False
         self._shouldEndImmediately = False
 
@@ -1516,6 +1521,7 @@ class Activity(object):
             bs.printError("_begin called twice; this shouldn't happen")
             return
             
+        beginStartTime = time.time()
         self.scoreSet = session.scoreSet
 
         # operate on the subset of session players who have passed team/char selection
@@ -1556,6 +1562,7 @@ class Activity(object):
             # and finally tell the game to start
             self._hasBegun = True
             self.onBegin()
+        self._beginMS = (time.time()-beginStartTime)*1000.0
         
         # make sure that bs.Activity.onTransitionIn() got called at some point
         if not hasattr(self,'_calledActivityOnTransitionIn'):
@@ -2167,6 +2174,13 @@ class GameActivity(Activity):
         # sort this by name so high score lists/etc will be consistent regardless of player join order..
         self.initialPlayerInfo.sort(key=lambda x:x['name'])
 
+        # note where scores stand so the stats store can record just this match
+        try:
+            import bsStats
+            bsStats._beginMatch(self)
+        except Exception:
+            bs.printException("error starting stats for match")
+
         # if this is a tournament, query info about it such as how much time is left
         try: tournamentID = self.getSession()._tournamentID
         except Exception: tournamentID = None
@@ -2175,6 +2189,15 @@ class GameActivity(Activity):
             bsInternal._tournamentQuery(args={'tournamentIDs':[tournamentID],'source':'in-game time remaining query'},
                                         callback=bs.WeakCall(self._onTournamentQueryResponse))
 
+    def end(self, results=None, delay=0, force=False):
+        Activity.end(self,results,delay,force)
+        # record this match's stats on the first end() call; the write itself happens off the game thread
+        try:
+            import bsStats
+            bsStats._endMatch(self,results)
+        except Exception:
+            bs.printException("error recording stats for match")
+
     def _onTournamentQueryResponse(self,data):
         import bsUI
         if data is not None:
@@ -2517,7 +2540,7 @@ class GameActivity(Activity):
         bs.gameTimer(1,bs.WeakCall(self._projectFlagStand,pos[:3]))
         
     def _projectFlagStand(self,pos):
-        bs.emitBGDynamics(position=pos,emitType='flagStand')
+        bs.emitBGDynamics(position=pos,emitType='flagStand',priority='critical')
 
 
     def setupStandardPowerupDrops(self,enableTNT=True):
@@ -2542,8 +2565,7 @@ class GameActivity(Activity):
         """
         Standard powerup drop.
         """
-        try: pd = bs.getConfig()['Powerup Distribution']
-        except Exception: pd = 'JRMP'
+        pd = bsUtils.getConfigSnapshot().powerupDistribution
         # drop one powerup per point
         pts = self.getMap().powerupSpawnPoints
         for i,pt in enumerate(pts):
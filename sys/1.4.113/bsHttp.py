@@ -0,0 +1,273 @@
+import bs
+import bsInternal
+import threading
+import weakref
+import Queue
+import httplib
+import urllib
+import urlparse
+import json
+import ast
+import time
+import socket
+import errno
+
+_gServerRequestExecutor = None
+
+def getServerRequestExecutor():
+    """
+    Returns the shared ServerRequestExecutor used by bsUtils.serverGet()/serverPut().
+    """
+    global _gServerRequestExecutor
+    if _gServerRequestExecutor is None: _gServerRequestExecutor = ServerRequestExecutor()
+    return _gServerRequestExecutor
+
+def _parseResponse(body):
+    # most responses are valid json, which is much quicker to parse;
+    # fall back to python literals for anything else
+    try: return json.loads(body)
+    except ValueError: return ast.literal_eval(body)
+
+def _toUTF8(data):
+    import bsUtils
+    return bsUtils.toUTF8(data)
+
+# errors that mean the server had already dropped a kept-alive connection on us
+_gStaleConnectionErrnos = (errno.ECONNRESET,errno.EPIPE,errno.ECONNABORTED)
+
+def _isStaleConnectionError(e):
+    # an empty status line means the server closed the socket without sending a byte
+    if isinstance(e,httplib.BadStatusLine): return True
+    return isinstance(e,socket.error) and e.errno in _gStaleConnectionErrnos
+
+
+class _ServerCallback(object):
+    """ wraps a callback along with the context (and activity) it was created in """
+    def __init__(self,callback):
+        self._callback = callback
+        self._context = bs.Context('current')
+        activity = bs.getActivity(exceptionOnNone=False)
+        self._activity = weakref.ref(activity) if activity is not None else None
+
+    def run(self,arg):
+        # if we were created in an activity context and that activity has since died, do nothing
+        if self._activity is not None and (self._activity() is None or self._activity().isFinalized()): return
+        # (technically we could do the same check for session contexts, but not gonna worry about it for now)
+        with self._context: self._callback(arg)
+
+
+class _ServerRequest(object):
+    def __init__(self,requestType,request,encodedData,timeout):
+        self.requestType = requestType
+        self.request = request
+        self.encodedData = encodedData
+        self.timeout = timeout
+        self.callbacks = []
+
+
+class ServerRequestExecutor(object):
+    """
+    Runs server requests on a small, bounded pool of worker threads.
+
+    Each worker keeps a persistent (keep-alive) connection per host; ones that
+    have sat idle longer than 'keepAliveTimeout' seconds are replaced rather than
+    reused, since the server has likely closed them. Identical GET requests that
+    are already in flight are coalesced; their callbacks all get the one result.
+    Failed GETs (including 5xx responses) are retried up to 'retries' times,
+    waiting 'backoff' seconds (doubling each time) in between. POSTs aren't
+    idempotent, so they are only retried if the failure happened before the
+    request went out (ie: while connecting), or if a reused connection turned
+    out to be dead before any response came back; that case gets one immediate
+    retry on a fresh connection for any request type. 'timeout' is the default
+    per-request timeout; get() and post() can pass their own. Callbacks run in
+    the game thread in the context they were issued from, and are skipped if
+    that context's activity has since died.
+    """
+    def __init__(self,maxThreads=4,timeout=10.0,retries=2,backoff=0.5,keepAliveTimeout=15.0,serverAddress=None):
+        self._maxThreads = maxThreads
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._keepAliveTimeout = keepAliveTimeout
+        self._serverAddress = serverAddress
+        self._queue = Queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._pending = 0
+        self._inFlightGets = {}
+        self._local = threading.local()
+        self.requestCount = 0
+        self.coalescedCount = 0
+        self.retryCount = 0
+        self.staleRetryCount = 0
+        self.connectionCount = 0
+
+    def get(self,request,data,callback=None,timeout=None):
+        self._submit('get',request,data,callback,timeout)
+
+    def post(self,request,data,callback=None,timeout=None):
+        self._submit('post',request,data,callback,timeout)
+
+    def _submit(self,requestType,request,data,callback,timeout):
+        # encoding here gives us a snapshot of the data, so there's no need to deep-copy it
+        encodedData = urllib.urlencode(_toUTF8({} if data is None else data))
+        cb = _ServerCallback(callback) if callback is not None else None
+        with self._lock:
+            self.requestCount += 1
+            if requestType == 'get':
+                key = (request,encodedData)
+                existing = self._inFlightGets.get(key)
+                if existing is not None:
+                    self.coalescedCount += 1
+                    if cb is not None: existing.callbacks.append(cb)
+                    return
+            r = _ServerRequest(requestType,request,encodedData,self._timeout if timeout is None else timeout)
+            if cb is not None: r.callbacks.append(cb)
+            if requestType == 'get': self._inFlightGets[(request,encodedData)] = r
+            # spin up another worker if everyone's busy and we're under our cap
+            self._pending += 1
+            if self._pending > len(self._threads) and len(self._threads) < self._maxThreads:
+                t = threading.Thread(target=self._run)
+                t.daemon = True
+                self._threads.append(t)
+                t.start()
+        self._queue.put(r)
+
+    def _run(self):
+        bsInternal._setThreadName("BS_ServerCallThread")
+        self._local.connections = {}
+        self._local.lastUsed = {}
+        while True:
+            r = self._queue.get()
+            try: result = self._perform(r)
+            except Exception: result = None
+            with self._lock:
+                if r.requestType == 'get': self._inFlightGets.pop((r.request,r.encodedData),None)
+                callbacks = list(r.callbacks)
+                self._pending -= 1
+            for cb in callbacks: bs.callInGameThread(bs.Call(cb.run,result))
+
+    def _getConnection(self,scheme,host,timeout):
+        connections = self._local.connections
+        conn = connections.get((scheme,host))
+        if conn is not None and time.time()-self._local.lastUsed.get((scheme,host),0) > self._keepAliveTimeout:
+            self._dropConnection(scheme,host)
+            conn = None
+        if conn is None:
+            connClass = httplib.HTTPSConnection if scheme == 'https' else httplib.HTTPConnection
+            conn = connections[(scheme,host)] = connClass(host,timeout=timeout)
+            with self._lock: self.connectionCount += 1
+        else:
+            # pooled connections take on each request's own timeout
+            conn.timeout = timeout
+            if conn.sock is not None: conn.sock.settimeout(timeout)
+        return conn
+
+    def _dropConnection(self,scheme,host):
+        conn = self._local.connections.pop((scheme,host),None)
+        self._local.lastUsed.pop((scheme,host),None)
+        if conn is not None:
+            try: conn.close()
+            except Exception: pass
+
+    def _perform(self,r):
+        address = self._serverAddress if self._serverAddress is not None else bsInternal._getServerAddress()
+        url = urlparse.urlparse(str(address+'/'+r.request)) # fails with unicode for some reason
+        headers = {'User-Agent':bs.getEnvironment()['userAgentString']}
+        if r.requestType == 'get':
+            path,body = url.path+'?'+r.encodedData,None
+        elif r.requestType == 'post':
+            path,body = url.path,r.encodedData
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        else: raise Exception("Invalid requestType: "+r.requestType)
+        attempt = 0
+        staleRetried = False
+        while True:
+            sent = False
+            reused = False
+            responded = False
+            try:
+                conn = self._getConnection(url.scheme,url.netloc,r.timeout)
+                if conn.sock is None: conn.connect()
+                else: reused = True
+                # from here on the server may have gotten the request
+                sent = True
+                conn.request('GET' if body is None else 'POST',path,body,headers)
+                response = conn.getresponse()
+                responded = True
+                # (always read the whole body so the connection can be reused)
+                data = response.read()
+                if response.getheader('connection','').lower() == 'close': self._dropConnection(url.scheme,url.netloc)
+                else: self._local.lastUsed[(url.scheme,url.netloc)] = time.time()
+                if response.status >= 500 and r.requestType == 'get': raise Exception('server error '+str(response.status))
+                if response.status != 200: return None
+                return _parseResponse(data)
+            except Exception,e:
+                self._dropConnection(url.scheme,url.netloc)
+                # a kept-alive socket the server had already closed fails before any
+                # response; the request never got handled, so it's safe to send again
+                if reused and not responded and not staleRetried and _isStaleConnectionError(e):
+                    staleRetried = True
+                    with self._lock: self.staleRetryCount += 1
+                    continue
+                # otherwise only retry what's safe to repeat: GETs, or anything that never made it out
+                if attempt >= self._retries or (sent and r.requestType != 'get'): raise
+                with self._lock: self.retryCount += 1
+                time.sleep(self._backoff*(2**attempt))
+                attempt += 1
+
+
+class StubServer(object):
+    """
+    A tiny local http server standing in for the master server, for exercising
+    ServerRequestExecutor. 'responses' maps request names (ie: 'bsAccessCheck')
+    to response bodies; unknown requests get a 404. Connections are kept alive,
+    and requestCount/connectionCount are tallied for checking pooling behavior.
+    Point an executor at it with serverAddress=stub.address.
+    """
+    def __init__(self,responses=None,delay=0.0,failCount=0):
+        import BaseHTTPServer
+        import SocketServer
+        stub = self
+        self.responses = dict(responses) if responses is not None else {}
+        self.requestCount = 0
+        self.connectionCount = 0
+        self._delay = delay
+        self._failsLeft = failCount
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            def setup(self):
+                BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+                stub.connectionCount += 1
+            def _respond(self):
+                stub.requestCount += 1
+                length = int(self.headers.get('content-length',0))
+                if length: self.rfile.read(length)
+                if stub._delay > 0: time.sleep(stub._delay)
+                name = urlparse.urlparse(self.path).path.lstrip('/')
+                if stub._failsLeft > 0:
+                    stub._failsLeft -= 1
+                    status,body = 500,'error'
+                elif name in stub.responses: status,body = 200,stub.responses[name]
+                else: status,body = 404,'not found'
+                self.send_response(status)
+                self.send_header('Content-Length',str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            do_GET = _respond
+            do_POST = _respond
+            def log_message(self,*args): pass
+
+        class Server(SocketServer.ThreadingMixIn,BaseHTTPServer.HTTPServer):
+            daemon_threads = True
+
+        self._server = Server(('127.0.0.1',0),Handler)
+        self.address = 'http://127.0.0.1:'+str(self._server.server_address[1])
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,166 @@
+import __builtin__
+import sys
+import os
+import time
+import types
+
+# import profiling state
+_gOriginalImport = None
+_gImportStack = []
+_gImportRecords = {} # moduleName -> _ImportRecord (in load order via 'index')
+_gProfileStartTime = None
+_gBootImportTime = None
+
+# if launch never completes (or never tells us), stop profiling after this many seconds anyway
+_gProfileTimeout = 60.0
+
+class _ImportRecord(object):
+    def __init__(self,name,parent,index):
+        self.name = name
+        self.parent = parent
+        self.index = index
+        self.totalTime = 0.0
+        self.childTime = 0.0
+
+    def getSelfTime(self):
+        return self.totalTime-self.childTime
+
+    def getChain(self):
+        chain = [self.name]
+        parent = self.parent
+        while parent is not None:
+            chain.insert(0,parent)
+            record = _gImportRecords.get(parent)
+            parent = record.parent if record is not None else None
+        return chain
+
+
+def _profiledImport(name,*args,**keywds):
+    if time.time()-_gProfileStartTime > _gProfileTimeout:
+        originalImport = _gOriginalImport
+        _finishImportProfiling()
+        return originalImport(name,*args,**keywds)
+    # only the first (actual) load of a module is interesting
+    if name in sys.modules or name in _gImportRecords:
+        return _gOriginalImport(name,*args,**keywds)
+    parent = _gImportStack[-1] if _gImportStack else None
+    record = _ImportRecord(name,parent,len(_gImportRecords))
+    _gImportRecords[name] = record
+    _gImportStack.append(name)
+    startTime = time.time()
+    try: return _gOriginalImport(name,*args,**keywds)
+    finally:
+        record.totalTime = time.time()-startTime
+        _gImportStack.pop()
+        if parent is not None and parent in _gImportRecords:
+            _gImportRecords[parent].childTime += record.totalTime
+        # names that turned out not to be modules (ie: failed implicit-relative lookups) aren't worth listing
+        if name not in sys.modules: del _gImportRecords[name]
+
+def _startImportProfiling():
+    """ starts recording module loads; should be called as early in boot as possible """
+    global _gOriginalImport
+    global _gProfileStartTime
+    if _gOriginalImport is not None: return
+    _gProfileStartTime = time.time()
+    _gOriginalImport = __builtin__.__import__
+    __builtin__.__import__ = _profiledImport
+
+def _finishImportProfiling():
+    """
+    Stops recording module loads (called by bsUtils._onLaunchComplete(), or
+    on the first import after _gProfileTimeout seconds) and writes a report if the BS_IMPORT_PROFILE environment variable is set (to the
+    path it names, or next to the config if it's just '1').
+    """
+    global _gOriginalImport
+    global _gBootImportTime
+    if _gOriginalImport is None: return
+    __builtin__.__import__ = _gOriginalImport
+    _gOriginalImport = None
+    _gBootImportTime = sum(r.totalTime for r in _gImportRecords.values() if r.parent is None)
+    reportPath = os.environ.get('BS_IMPORT_PROFILE')
+    if reportPath:
+        if reportPath == '1': reportPath = None
+        try: writeImportReport(reportPath)
+        except Exception as e: print 'error writing import report:',e
+
+def getImportProfile():
+    """
+    Returns a list of dicts describing each module loaded during boot,
+    in load order: 'name', 'selfTime' and 'totalTime' (in seconds; total includes
+    modules it pulled in), and 'chain' (the list of modules that led to it).
+    """
+    return [{'name':r.name,'selfTime':r.getSelfTime(),'totalTime':r.totalTime,'chain':r.getChain()}
+            for r in sorted(_gImportRecords.values(),key=lambda r:r.index)]
+
+def getBootImportTime():
+    """ Returns total seconds spent importing modules during boot (or None if boot is still underway) """
+    return _gBootImportTime
+
+def writeImportReport(path=None):
+    """
+    Writes a plain-text report of boot-time module loads, costliest first,
+    to the given path (defaults to 'importProfile.txt' next to the config).
+    Returns the path written.
+    """
+    if path is None:
+        import bs
+        path = os.path.join(os.path.dirname(bs.getEnvironment()['configFilePath']),'importProfile.txt')
+    profile = getImportProfile()
+    total = sum(p['totalTime'] for p in profile if len(p['chain']) == 1)
+    lines = ['import profile: '+str(len(profile))+' modules, '+str(int(total*1000.0))+' ms total',
+             '',
+             '%8s %8s  %s' % ('self ms','total ms','module (import chain)')]
+    for p in sorted(profile,key=lambda p:p['selfTime'],reverse=True):
+        lines.append('%8.1f %8.1f  %s' % (p['selfTime']*1000.0,p['totalTime']*1000.0,' > '.join(p['chain'])))
+    lazy = [m.__name__ for m in _gLazyModules.values() if not isLoaded(m)]
+    if lazy: lines += ['','deferred (never loaded): '+', '.join(sorted(lazy))]
+    with open(path,'w') as f: f.write('\n'.join(lines)+'\n')
+    return path
+
+
+_gLazyModules = {}
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that gets imported on first attribute access.
+    Use lazyImport() to get one.
+    """
+    def __init__(self,name):
+        types.ModuleType.__init__(self,name)
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            __import__(self.__name__)
+            module = self.__dict__['_module'] = sys.modules[self.__name__]
+        return module
+
+    def __getattr__(self,attr):
+        return getattr(self._load(),attr)
+
+    def __setattr__(self,attr,value):
+        setattr(self._load(),attr,value)
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return '<lazy module \''+self.__name__+'\' ('+state+')>'
+
+def lazyImport(name):
+    """
+    Returns the named module if it's already loaded; otherwise a LazyModule
+    which imports it the first time one of its attributes is used.
+    Handy for breaking heavy imports (UI, tutorial, etc) out of boot.
+    """
+    module = sys.modules.get(name)
+    if module is not None: return module
+    lazy = _gLazyModules.get(name)
+    if lazy is None: lazy = _gLazyModules[name] = LazyModule(name)
+    return lazy
+
+def isLoaded(module):
+    """ Returns whether a module (or LazyModule) has actually been imported """
+    if isinstance(module,LazyModule):
+        return module.__dict__['_module'] is not None or module.__name__ in sys.modules
+    return True
@@ -23,6 +23,23 @@ class ChangeMessage(object):
 
 gAccountProfileDeviceID = None
 
+def _prepProfiles(profiles,withEdit):
+    """
+    returns a (profiles,sortedNames) pair for choosers from a json-prepped profile dict:
+    unknown characters become Spaz and '_random' (plus '_edit' if asked) are added
+    """
+    prepped = {}
+    for name,profile in profiles.items():
+        if profile.get('character','') not in bsSpaz.appearances: profile = dict(profile,character='Spaz')
+        prepped[name] = profile
+    # add in a random one so we're ok even if there's no user-created profiles
+    prepped['_random'] = {}
+    # for local devices, add it an 'edit' option which will pop up the profile window
+    if withEdit: prepped['_edit'] = {}
+    names = prepped.keys()
+    names.sort(key=lambda x:x.lower())
+    return prepped,names
+
 class Chooser(object):
 
     def __del__(self):
@@ -200,37 +217,14 @@ class Chooser(object):
         else:
             self.characterNames = self.getLobby().characterNamesLocalUnlocked
         
-        # if we're a local player, pull our local profiles from the config..
+        # if we're a local player, use the lobby's shared local profiles..
         # otherwise ask the remote-input-device for its profile list
+        # (these are shared between choosers; don't modify them)
         if isRemote:
-            self.profiles = inputDevice._getPlayerProfiles()
+            self.profiles,self.profileNames = self.getLobby()._getRemoteProfiles(inputDevice)
         else:
-            try:
-                self.profiles = dict(bs.getConfig()['Player Profiles'])
-            except Exception as e:
-                print 'EXC pulling local profiles'
-                self.profiles = {}
-
-        # these may have come over the wire from an older (non-unicode/non-json) version..
-        # ..make sure they conform to our standards (unicode strings, no tuples, etc)
-        self.profiles = bsUtils.jsonPrep(self.profiles)
-
-        # filter out any characters we're unaware of
-        for p in self.profiles.items():
-            if p[1].get('character','') not in bsSpaz.appearances:
-                p[1]['character'] = 'Spaz'
-        
-        # add in a random one so we're ok even if there's no user-created profiles
-        self.profiles['_random'] = {}
+            self.profiles,self.profileNames = self.getLobby()._getLocalProfiles(withEdit=not isTestInput)
 
-        # for local devices, add it an 'edit' option which will pop up the profile window
-        if not isRemote and not isTestInput:
-            self.profiles['_edit'] = {}
-            
-        # build a sorted name list we can iterate through
-        self.profileNames = self.profiles.keys()
-        self.profileNames.sort(key=lambda x:x.lower())
-            
         try:
             self.profileIndex = self.profileNames.index(self.profileName)
         except Exception:
@@ -403,7 +397,7 @@ class Chooser(object):
                 # join the team with the most players
                 if not self.ready:
                     try:
-                        if bs.getConfig().get('Auto Balance Teams', False):
+                        if bsUtils.getConfigSnapshot().autoBalanceTeams:
                             lobby = self.getLobby()
                             if len(lobby._teams) > 1:
                                 session = bs.getSession()
@@ -508,16 +502,7 @@ class Chooser(object):
             self.icon.tintColor = (0,1,0)
             return
 
-        try:
-            texName = bsSpaz.appearances[self.characterNames[self.characterIndex]].iconTexture
-            tintTexName = bsSpaz.appearances[self.characterNames[self.characterIndex]].iconMaskTexture
-        except Exception:
-            bs.printException('Error updating char icon list')
-            texName = 'neoSpazIcon'
-            tintTexName = 'neoSpazIconColorMask'
-        
-        tex = bs.getTexture(texName)
-        tintTex = bs.getTexture(tintTexName)
+        texName,tintTexName,tex,tintTex = self.getLobby()._getIconTextures(self.characterNames[self.characterIndex])
 
         self.icon.color = (1,1,1)
         self.icon.texture = tex
@@ -566,6 +551,10 @@ class Lobby(object):
         vOffset = -150 if isinstance(session,bs.CoopSession) else -30
         
         self.choosers = []
+        self._profileVersion = None
+        self._localProfiles = {} # withEdit -> (profiles,names)
+        self._remoteProfiles = {} # (device id, unique id) -> (profiles,names)
+        self._iconTextures = {} # character -> (texName,tintTexName,tex,tintTex)
         self.baseVOffset = vOffset
         self.updatePositions()
         self.nextAddTeam = 0
@@ -634,6 +623,13 @@ class Lobby(object):
         # do any overall prep we need to such as creating account profile..
         bsUtils._ensureHaveAccountPlayerProfile()
 
+        # profiles are edited through transactions rather than bs.writeConfig(),
+        # so make sure our config snapshot is current before choosers pull from it
+        bsUtils._refreshConfigSnapshot(profilesChanged=True)
+
+        # remote devices may have sent new lists too
+        self._remoteProfiles = {}
+
         # grab available player profiles
         # try: self.profiles = dict(bs.getConfig()['Player Profiles'])
         # except Exception: self.profiles = {}
@@ -650,6 +646,48 @@ class Lobby(object):
             except Exception:
                 bs.printException('exception reloading profiles')
 
+    def _checkProfileVersion(self):
+        # our prepped profiles are stamped with the config snapshot version they came from
+        version = bsUtils.getConfigSnapshot().version
+        if version != self._profileVersion:
+            self._profileVersion = version
+            self._localProfiles = {}
+            self._remoteProfiles = {}
+
+    def _getLocalProfiles(self,withEdit=True):
+        """ returns the (profiles,sortedNames) pair shared by all local choosers """
+        self._checkProfileVersion()
+        try: return self._localProfiles[withEdit]
+        except KeyError:
+            # (the config snapshot has already been json-prepped)
+            profiles = self._localProfiles[withEdit] = _prepProfiles(bsUtils.getConfigSnapshot().playerProfiles,withEdit)
+            return profiles
+
+    def _getRemoteProfiles(self,inputDevice):
+        """ returns a (profiles,sortedNames) pair for a remote input device, memoized per device """
+        self._checkProfileVersion()
+        key = (inputDevice.getID(),inputDevice.getUniqueIdentifier())
+        try: return self._remoteProfiles[key]
+        except KeyError:
+            # these may have come over the wire from an older (non-unicode/non-json) version..
+            # ..make sure they conform to our standards (unicode strings, no tuples, etc)
+            profiles = self._remoteProfiles[key] = _prepProfiles(bsUtils.jsonPrep(inputDevice._getPlayerProfiles()),False)
+            return profiles
+
+    def _getIconTextures(self,character):
+        """ returns (texName,tintTexName,tex,tintTex) for a character's chooser icon """
+        try: return self._iconTextures[character]
+        except KeyError: pass
+        try:
+            texName = bsSpaz.appearances[character].iconTexture
+            tintTexName = bsSpaz.appearances[character].iconMaskTexture
+        except Exception:
+            bs.printException('Error updating char icon list')
+            texName = 'neoSpazIcon'
+            tintTexName = 'neoSpazIconColorMask'
+        textures = self._iconTextures[character] = (texName,tintTexName,bs.getTexture(texName),bs.getTexture(tintTexName))
+        return textures
+
     def updatePositions(self):
         self._vPos = -100+self.baseVOffset
         for chooser in self.choosers:
@@ -444,7 +444,7 @@ class MainMenuActivity(bs.Activity):
                 bsUI.uiGlobals['mainMenuWindow'] = bsUI.KioskWindow().getRootWidget()
             # ..or in normal cases go back to the main menu
             else:
-                if mainWindow == 'Gather': bsUI.uiGlobals['mainMenuWindow'] = bsUI.GatherWindow(transition=None).getRootWidget()
+                if mainWindow == 'Gather': bsUI.uiGlobals['mainMenuWindow'] = bsUI.getWindowClass('GatherWindow')(transition=None).getRootWidget()
                 elif mainWindow == 'Watch': bsUI.uiGlobals['mainMenuWindow'] = bsUI.WatchWindow(transition=None).getRootWidget()
                 elif mainWindow == 'Team Game Select': bsUI.uiGlobals['mainMenuWindow'] = bsUI.TeamsWindow(sessionType=bs.TeamsSession,transition=None).getRootWidget()
                 elif mainWindow == 'Free-for-All Game Select': bsUI.uiGlobals['mainMenuWindow'] = bsUI.TeamsWindow(sessionType=bs.FreeForAllSession,transition=None).getRootWidget()
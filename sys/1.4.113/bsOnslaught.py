@@ -871,11 +871,7 @@ class OnslaughtGame(bs.CoopGameActivity):
         
     def _updateScores(self):
 
-        if self._preset == 'endless':
-            if self._score >= 500: self._awardAchievement('Onslaught Master')
-            if self._score >= 1000: self._awardAchievement('Onslaught Wizard')
-            if self._score >= 5000: self._awardAchievement('Onslaught God')
-
+        self._achievementEvent('score',self._score)
         self._scoreBoard.setTeamValue(self.teams[0],self._score,maxScore=None)
 
         
@@ -909,44 +905,8 @@ class OnslaughtGame(bs.CoopGameActivity):
             pts,importance = m.badGuy.getDeathPoints(m.how)
             if m.killerPlayer is not None:
 
-                # toss-off-map achievement
-                if self._preset in ['training','trainingEasy']:
-                    if m.badGuy.lastAttackedType == ('pickedUp','default'):
-                        if not hasattr(self,'_throwOffKills'): self._throwOffKills = 0
-                        self._throwOffKills += 1
-                        if self._throwOffKills >= 3: 
-                            self._awardAchievement('Off You Go Then')
-
-                # land-mine achievement
-                elif self._preset in ['rookie','rookieEasy']:
-                    if m.badGuy.lastAttackedType == ('explosion','landMine'):
-                        if not hasattr(self,'_landMineKills'): self._landMineKills = 0
-                        self._landMineKills += 1
-                        if self._landMineKills >= 3: 
-                            self._awardAchievement('Mine Games')
-
-                # tnt achievement
-                elif self._preset in ['pro','proEasy']:
-                    if m.badGuy.lastAttackedType == ('explosion','tnt'):
-                        if not hasattr(self,'_tntKills'): self._tntKills = 0
-                        self._tntKills += 1
-                        if self._tntKills >= 3: 
-                            bs.gameTimer(500,bs.WeakCall(self._awardAchievement,'Boom Goes the Dynamite'))
-
-                elif self._preset in ['uber','uberEasy']:
-
-                    # uber mine achievement
-                    if m.badGuy.lastAttackedType == ('explosion','landMine'):
-                        if not hasattr(self,'_landMineKills'): self._landMineKills = 0
-                        self._landMineKills += 1
-                        if self._landMineKills >= 6: 
-                            self._awardAchievement('Gold Miner')
-                    # uber tnt achievement
-                    if m.badGuy.lastAttackedType == ('explosion','tnt'):
-                        if not hasattr(self,'_tntKills'): self._tntKills = 0
-                        self._tntKills += 1
-                        if self._tntKills >= 6: 
-                            bs.gameTimer(500,bs.WeakCall(self._awardAchievement,'TNT Terror'))
+                # (kill-type achievements such as 'Mine Games' listen for these)
+                self._achievementEvent('kill',m.badGuy.lastAttackedType)
 
                 try: target = m.badGuy.node.position
                 except Exception: target = None
@@ -0,0 +1,101 @@
+import bs
+import bsInternal
+import bsUtils
+
+# requests scaled down to less than this fraction of what they asked for get dropped instead
+_gMinScaleFraction = 0.25
+_gFrameMS = 16
+
+_gParticleBudget = None
+
+def getParticleBudget():
+    """
+    Returns the shared ParticleBudget, creating it if necessary.
+    """
+    global _gParticleBudget
+    if _gParticleBudget is None: _gParticleBudget = ParticleBudget()
+    return _gParticleBudget
+
+def emitBGDynamics(position,priority='cosmetic',**keywds):
+    """
+    category: Game Flow Functions
+
+    Emits background dynamics (sparks, chunks, tendrils, etc); takes the same
+    arguments as bsInternal.emitBGDynamics() plus a 'priority' of 'cosmetic'
+    (the default) or 'critical'.
+
+    Everything emitted counts against a global per-frame and per-second particle
+    budget (see the 'Particle Budget Per Frame' and 'Particle Budget Per Second'
+    config values; -1 for unlimited). Critical requests always go through;
+    cosmetic ones are scaled down or dropped when the budget is exhausted.
+    """
+    keywds['position'] = position
+    return getParticleBudget().emit(priority,keywds)
+
+def getParticleStats():
+    """
+    Returns a dict of particle budget stats. See ParticleBudget.getStats().
+    """
+    return getParticleBudget().getStats()
+
+
+class ParticleBudget(object):
+    """
+    Keeps script-side particle emission within the configured budget.
+    Use bs.emitBGDynamics() rather than talking to this directly.
+    """
+    def __init__(self):
+        self._frame = None
+        self._frameCount = 0
+        self._second = None
+        self._secondCount = 0
+        self._stats = {'requests':0,'emitted':0,'scaled':0,'dropped':0,'droppedParticles':0}
+
+    def _getRemaining(self,now):
+        frame = now//_gFrameMS
+        if frame != self._frame:
+            self._frame = frame
+            self._frameCount = 0
+        second = now//1000
+        if second != self._second:
+            self._second = second
+            self._secondCount = 0
+        config = bsUtils.getConfigSnapshot()
+        remaining = []
+        if config.particleBudgetPerFrame >= 0: remaining.append(config.particleBudgetPerFrame-self._frameCount)
+        if config.particleBudgetPerSecond >= 0: remaining.append(config.particleBudgetPerSecond-self._secondCount)
+        return min(remaining) if remaining else None
+
+    def emit(self,priority,keywds):
+        stats = self._stats
+        stats['requests'] += 1
+        # count-less emits (distortion, etc) are cheap one-offs; count them as a single particle
+        count = keywds.get('count',1)
+        remaining = self._getRemaining(bs.getRealTime())
+        if priority != 'critical' and remaining is not None and count > remaining:
+            if 'count' in keywds and remaining >= max(1,count*_gMinScaleFraction):
+                stats['scaled'] += 1
+                stats['droppedParticles'] += count-remaining
+                keywds['count'] = count = remaining
+            else:
+                stats['dropped'] += 1
+                stats['droppedParticles'] += count
+                return None
+        self._frameCount += count
+        self._secondCount += count
+        stats['emitted'] += count
+        return bsInternal.emitBGDynamics(**keywds)
+
+    def getStats(self):
+        """
+        Returns a dict with 'requests' (emit calls), 'emitted' (particles),
+        'scaled' and 'dropped' (requests trimmed or skipped for budget) and
+        'droppedParticles', plus the current 'frameCount' and 'secondCount'.
+        """
+        stats = dict(self._stats)
+        stats['frameCount'] = self._frameCount
+        stats['secondCount'] = self._secondCount
+        return stats
+
+    def resetStats(self):
+        for key in self._stats: self._stats[key] = 0
@@ -0,0 +1,227 @@
+import bs
+import bsInternal
+import socket
+import select
+import threading
+import time
+import errno
+import collections
+
+BS_PACKET_SIMPLE_PING = '\x0b' # 11
+BS_PACKET_SIMPLE_PONG = '\x0c' # 12
+
+_gPartyPinger = None
+
+def getPartyPinger():
+    """
+    Returns the shared PartyPinger, creating it if need be.
+    """
+    global _gPartyPinger
+    if _gPartyPinger is None: _gPartyPinger = PartyPinger()
+    return _gPartyPinger
+
+def _deliverPingResults(batch):
+    for call,results in batch:
+        try: call(results)
+        except Exception: bs.printException('error in ping result callback',call)
+
+
+class _PingRequest(object):
+    def __init__(self,address,port,call):
+        self.address = address
+        self.port = port
+        self.calls = [call]
+        self.family = None
+        self.sockAddr = None
+        self.attempt = 0
+        self.sendTime = 0.0
+        self.deadline = 0.0
+
+
+class PartyPinger(object):
+    """
+    Pings public parties from a single background thread.
+
+    Rather than one thread and socket per party, all pings go out over one
+    non-blocking UDP socket per address family and are multiplexed with select().
+    Pongs are matched to requests by source address. At most 'maxInFlight' parties
+    are pinged at once; the rest wait in a queue. Unanswered pings are resent up to
+    'attempts' times, with the wait growing by 'backoff' each time.
+
+    Results are handed to the game thread in batches: each callback passed to
+    ping() gets called with a list of (address,port,pingMS) tuples, where pingMS
+    is None for parties that never answered.
+    """
+    def __init__(self,maxInFlight=16,attempts=3,timeout=1.0,backoff=1.5,batchInterval=0.1):
+        self._maxInFlight = maxInFlight
+        self._attempts = attempts
+        self._timeout = timeout
+        self._backoff = backoff
+        self._batchInterval = batchInterval
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._thread = None
+
+        # everything below is only touched by our thread
+        self._inFlight = {} # (host,port) -> _PingRequest
+        self._sockets = {} # family -> socket
+        self._pendingResults = collections.OrderedDict() # id(call) -> (call,[(address,port,ping),...])
+        self._lastDeliverTime = 0.0
+        self._errorReported = False
+
+    def ping(self,address,port,call):
+        """
+        Queues a ping of the given party. 'call' gets run in the game thread
+        with a list of results (see PartyPinger). Results are batched per call
+        object, so pass the same one for all pings that should be handled together.
+        """
+        with self._cond:
+            # need utf8 here to avoid an error on our minimum bundled python
+            self._queue.append(_PingRequest(bs.utf8(address),port,call))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        bsInternal._setThreadName("BS_PartyPingerThread")
+        while True:
+            with self._cond:
+                while not self._queue and not self._inFlight and not self._pendingResults:
+                    self._cond.wait()
+                newRequests = []
+                while self._queue and len(self._inFlight)+len(newRequests) < self._maxInFlight:
+                    newRequests.append(self._queue.popleft())
+            try:
+                for request in newRequests: self._start(request)
+                self._poll()
+                self._expire()
+                self._deliver()
+            except Exception as e:
+                self._reportError(e)
+
+    def _reportError(self,e):
+        if not self._errorReported:
+            self._errorReported = True
+            print 'error in public party pinger:',e
+
+    def _getSocket(self,family):
+        s = self._sockets.get(family)
+        if s is None:
+            s = self._sockets[family] = socket.socket(family,socket.SOCK_DGRAM)
+            s.setblocking(0)
+        return s
+
+    def _start(self,request):
+        try:
+            family,sockType,proto,canonName,sockAddr = socket.getaddrinfo(request.address,request.port,0,socket.SOCK_DGRAM)[0]
+        except Exception as e:
+            self._reportError(e)
+            self._addResult(request,None)
+            return
+        key = sockAddr[:2]
+        existing = self._inFlight.get(key)
+        if existing is not None:
+            # already pinging this one; just tag along
+            existing.calls.extend(request.calls)
+            return
+        request.family = family
+        request.sockAddr = sockAddr
+        self._inFlight[key] = request
+        self._send(request)
+
+    def _send(self,request):
+        request.attempt += 1
+        request.sendTime = time.time()
+        request.deadline = request.sendTime+self._timeout*(self._backoff**(request.attempt-1))
+        try: self._getSocket(request.family).sendto(BS_PACKET_SIMPLE_PING,request.sockAddr)
+        except Exception as e:
+            self._reportError(e)
+            del self._inFlight[request.sockAddr[:2]]
+            self._addResult(request,None)
+
+    def _poll(self):
+        now = time.time()
+        if self._inFlight: wait = max(0.0,min(r.deadline for r in self._inFlight.values())-now)
+        else: wait = 0.0
+        # wake up regularly to pick up newly queued requests and flush results
+        wait = min(wait,self._batchInterval)
+        sockets = self._sockets.values()
+        if not sockets:
+            time.sleep(wait)
+            return
+        readable = select.select(sockets,[],[],wait)[0]
+        for s in readable:
+            while True:
+                try: data,fromAddr = s.recvfrom(10)
+                except socket.error as e:
+                    if e.args[0] in (errno.EAGAIN,errno.EWOULDBLOCK): break
+                    # (windows reports icmp port-unreachable this way; just move on)
+                    break
+                request = self._inFlight.get(fromAddr[:2])
+                if request is not None and data == BS_PACKET_SIMPLE_PONG:
+                    del self._inFlight[fromAddr[:2]]
+                    # note: with resends we can't tell which ping this pong answers,
+                    # so time from the latest send (never overestimates)
+                    self._addResult(request,int((time.time()-request.sendTime)*1000.0))
+
+    def _expire(self):
+        now = time.time()
+        for key,request in self._inFlight.items():
+            if request.deadline <= now:
+                if request.attempt < self._attempts: self._send(request)
+                else:
+                    del self._inFlight[key]
+                    self._addResult(request,None)
+
+    def _addResult(self,request,ping):
+        for call in request.calls:
+            self._pendingResults.setdefault(id(call),(call,[]))[1].append((request.address,request.port,ping))
+
+    def _deliver(self):
+        if not self._pendingResults: return
+        now = time.time()
+        if self._inFlight and now-self._lastDeliverTime < self._batchInterval: return
+        batch = self._pendingResults.values()
+        self._pendingResults = collections.OrderedDict()
+        self._lastDeliverTime = now
+        bs.callInGameThread(bs.Call(_deliverPingResults,batch))
+
+
+class LocalPongServer(object):
+    """
+    A stand-in for a game server's simple-ping responder, for exercising
+    PartyPinger without real servers. Answers pings on 127.0.0.1 (at self.port)
+    after 'delay' seconds, ignoring the first 'dropCount' pings it gets.
+    """
+    def __init__(self,delay=0.0,dropCount=0):
+        self._delay = delay
+        self._dropsLeft = dropCount
+        self._socket = socket.socket(socket.AF_INET,socket.SOCK_DGRAM)
+        self._socket.bind(('127.0.0.1',0))
+        self._socket.settimeout(0.2)
+        self.port = self._socket.getsockname()[1]
+        self.pingCount = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try: data,fromAddr = self._socket.recvfrom(10)
+            except socket.timeout: continue
+            except socket.error: break
+            if data != BS_PACKET_SIMPLE_PING: continue
+            self.pingCount += 1
+            if self._dropsLeft > 0:
+                self._dropsLeft -= 1
+                continue
+            if self._delay > 0: time.sleep(self._delay)
+            self._socket.sendto(BS_PACKET_SIMPLE_PONG,fromAddr)
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
@@ -188,6 +188,8 @@ class PowerupFactory(object):
         are useless, like a Healing Bomb, why the hell would you want to heal enemies?
         """
         import weakref
+        import bsUtils
+        easyMode = bsUtils.getConfigSnapshot().easyMode
         
         # Disable some powerups based on the gamemode
         self._gamemode = bs.getActivity().getName()
@@ -200,7 +202,7 @@ class PowerupFactory(object):
             hijumpDisable = ['hijump']
         else:
             hijumpDisable = []
-        if bs.getConfig().get('Easy Mode', True): # If Easy Mode is enabled, disable the most difficult powerups
+        if easyMode: # If Easy Mode is enabled, disable the most difficult powerups
             nonHardMode=['hijump','speed','combatBombs','knockerBombs']
         else:
             nonHardMode=[]
@@ -214,7 +216,7 @@ class PowerupFactory(object):
                 self.healthPowerups = ['health']
             else:
                 self.healthPowerups = ['health','healBombs']
-            if bs.getConfig().get('Easy Mode',True): self.shieldCounters = ['grenades', 'impactBombs']
+            if easyMode: self.shieldCounters = ['grenades', 'impactBombs']
             else: self.shieldCounters = ['grenades', 'impactBombs', 'combatBombs']
             if self._lastPowerupType == 'curse': t = random.choice(self.healthPowerups)
             elif self._lastPowerupType == 'shield': 
@@ -228,8 +230,8 @@ class PowerupFactory(object):
 
 
 def getDefaultPowerupDistribution():
-    try: pd = bs.getConfig()['Powerup Distribution']
-    except Exception: pd = 'JRMP'
+    import bsUtils
+    pd = bsUtils.getConfigSnapshot().powerupDistribution
     if not isinstance(bs.getSession(),bs.CoopSession):
         if (pd == 'JRMP'):
             return (('tripleBombs',0),
@@ -861,11 +861,7 @@ class RunaroundGame(bs.CoopGameActivity):
         
     def _updateScores(self):
 
-        if self._preset == 'endless':
-            if self._score >= 500: self._awardAchievement('Runaround Master')
-            if self._score >= 1000: self._awardAchievement('Runaround Wizard')
-            if self._score >= 2000: self._awardAchievement('Runaround God')
-
+        self._achievementEvent('score',self._score)
         self._scoreBoard.setTeamValue(self.teams[0],self._score,maxScore=None)
         
     def _updateBot(self,bot):
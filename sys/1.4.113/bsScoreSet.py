@@ -5,6 +5,8 @@ import weakref
 import math
 import random
 import bsInternal
+import heapq
+import collections
 
 class PlayerScoredMessage(object):
     """
@@ -21,25 +23,49 @@ class PlayerScoredMessage(object):
         'Instantiate with the given values'
         self.score = score
 
+# kills closer together than this (in ms) count towards a multi-kill
+_gMultiKillWindow = 1000
+
+# multi-kill count -> (points, text resource, color, scale, delay, sound attr); bigger counts use the last entry
+_gMultiKillAwards = {2:(20,'twoKillText',(0.1,1.0,0.0,1),1.0,0,'_orchestraHitSound'),
+                     3:(40,'threeKillText',(1.0,0.7,0.0,1),1.1,300,'_orchestraHitSound2'),
+                     4:(60,'fourKillText',(1.0,1.0,0.0,1),1.2,600,'_orchestraHitSound3'),
+                     5:(80,'fiveKillText',(1.0,0.5,0.0,1),1.3,900,'_orchestraHitSound4'),
+                     6:(100,'multiKillText',(1.0,0.5,0.0,1),1.3,1000,'_orchestraHitSound4')}
+
+# per-player counters, stored as flat per-ScoreSet lists (see ScoreSet.getCounterArrays())
+_gCounterNames = ('score','accumScore','killCount','accumKillCount','killedCount','accumKilledCount')
+
+def _counterProperty(name):
+    def _get(self): return self._counters[name][self._index]
+    def _set(self,value): self._counters[name][self._index] = value
+    return property(_get,_set)
+
 class ScoreSet(object):
     """ Manages individual score keeping for players; provides persistant scores and some other goodies.
-    Players are indexed here by name so that if a player leaves and comes back he'll keep the same score """
+    Players are indexed here by name so that if a player leaves and comes back he'll keep the same score
+    (and by player id so lookups for players we've seen don't need their name) """
 
     class _Player(object):
         def __init__(self, name, nameFull, player, scoreSet):
             self.name = name
             self.nameFull = nameFull
-            self.score = 0
-            self.accumScore = 0
-            self.killCount = 0
-            self.accumKillCount = 0
-            self.killedCount = 0
-            self.accumKilledCount = 0
-            self._multiKillTimer = None
+            self._counters = scoreSet._counters
+            self._index = len(scoreSet._names)
+            scoreSet._names.append(name)
+            for counter in self._counters.values(): counter.append(0)
+            self._lastKillTime = None
             self._multiKillCount = 0
             self._scoreSet = weakref.ref(scoreSet)
             self._associateWithPlayer(player)
 
+        score = _counterProperty('score')
+        accumScore = _counterProperty('accumScore')
+        killCount = _counterProperty('killCount')
+        accumKillCount = _counterProperty('accumKillCount')
+        killedCount = _counterProperty('killedCount')
+        accumKilledCount = _counterProperty('accumKilledCount')
+
         def getTeam(self):
             return self.team()
 
@@ -56,8 +82,9 @@ class ScoreSet(object):
             if self._spaz is None: return None
             return self._spaz()
 
-        def cancelMultiKillTimer(self):
-            self._multiKillTimer = None
+        def cancelMultiKill(self):
+            self._lastKillTime = None
+            self._multiKillCount = 0
 
         def getActivity(self):
             try: return self._scoreSet()._activity()
@@ -71,95 +98,69 @@ class ScoreSet(object):
             self._spaz = None
             self.streak = 0
             
-        def _endMultiKill(self):
-
-            self._multiKillTimer = None
-            self._multiKillCount = 0
-
         def submitKill(self,showPoints=True):
+            # no timers here; just see whether this kill landed within the window of the last one
+            now = bs.getGameTime()
+            if self._lastKillTime is None or now-self._lastKillTime > _gMultiKillWindow: self._multiKillCount = 0
+            self._lastKillTime = now
             self._multiKillCount += 1
-
-            if self._multiKillCount == 1:
-                score = 0
-                name = None
-            elif self._multiKillCount == 2:
-                score = 20
-                name = bs.Lstr(resource='twoKillText')
-                color=(0.1,1.0,0.0,1)
-                scale = 1.0
-                delay = 0
-                sound = self._scoreSet()._orchestraHitSound
-            elif self._multiKillCount == 3:
-                score = 40
-                name = bs.Lstr(resource='threeKillText')
-                color=(1.0,0.7,0.0,1)
-                scale = 1.1
-                delay = 300
-                sound = self._scoreSet()._orchestraHitSound2
-            elif self._multiKillCount == 4:
-                score = 60
-                name = bs.Lstr(resource='fourKillText')
-                color=(1.0,1.0,0.0,1)
-                scale = 1.2
-                delay = 600
-                sound = self._scoreSet()._orchestraHitSound3
-            elif self._multiKillCount == 5:
-                score = 80
-                name = bs.Lstr(resource='fiveKillText')
-                color=(1.0,0.5,0.0,1)
-                scale = 1.3
-                delay = 900
-                sound = self._scoreSet()._orchestraHitSound4
-            else:
-                score = 100
-                name = bs.Lstr(resource='multiKillText',subs=[('${COUNT}',str(self._multiKillCount))])
-                color=(1.0,0.5,0.0,1)
-                scale = 1.3
-                delay = 1000
-                sound = self._scoreSet()._orchestraHitSound4
-
-            def _apply(name,score,showPoints,color,scale,sound):
-
-                # only award this if they're still alive and we can get their pos
-                try: ourPos = self.getSpaz().node.position
-                except Exception: return
-
-                # jitter position a bit since these often come in clusters
-                ourPos = (ourPos[0]+(random.random()-0.5)*2.0,
-                          ourPos[1]+(random.random()-0.5)*2.0,
-                          ourPos[2]+(random.random()-0.5)*2.0)
-                activity = self.getActivity()
-                if activity is not None:
-                    bsUtils.PopupText(
-                        # (('+'+str(score)+' ') if showPoints else '')+name,
-                        bs.Lstr(value=(('+'+str(score)+' ') if showPoints else '')+'${N}',subs=[('${N}',name)]),
-                        color=color,
-                        scale=scale,
-                        position=ourPos).autoRetain()
-                bs.playSound(sound)
-
-                self.score += score
-                self.accumScore += score
-
-                # inform a running game of the score
-                if score != 0 and activity is not None:
-                    activity.handleMessage(PlayerScoredMessage(score=score))
-
-            if name is not None:
-                bs.gameTimer(300+delay,bs.Call(_apply,name,score,showPoints,color,scale,sound))
-
-            # keep the tally rollin'...
-            # set a timer for a bit in the future
-            self._multiKillTimer = bs.Timer(1000,self._endMultiKill)
+            if self._multiKillCount < 2: return
+            self._scoreSet()._schedule(300+_gMultiKillAwards[min(self._multiKillCount,6)][4],'multiKill',
+                                       (self,self._multiKillCount,showPoints))
+
+        def _applyMultiKill(self,count,showPoints):
+            scoreSet = self._scoreSet()
+            score,resource,color,scale,delay,soundAttr = _gMultiKillAwards[min(count,6)]
+
+            # only award this if they're still alive and we can get their pos
+            try: ourPos = self.getSpaz().node.position
+            except Exception: return
+
+            # jitter position a bit since these often come in clusters
+            ourPos = (ourPos[0]+(random.random()-0.5)*2.0,
+                      ourPos[1]+(random.random()-0.5)*2.0,
+                      ourPos[2]+(random.random()-0.5)*2.0)
+            activity = self.getActivity()
+            if activity is not None:
+                if count > 5: name = bs.Lstr(resource=resource,subs=[('${COUNT}',str(count))])
+                else: name = bs.Lstr(resource=resource)
+                bsUtils.PopupText(
+                    bs.Lstr(value=(('+'+str(score)+' ') if showPoints else '')+'${N}',subs=[('${N}',name)]),
+                    color=color,
+                    scale=scale,
+                    position=ourPos).autoRetain()
+            bs.playSound(getattr(scoreSet,soundAttr))
+
+            self.score += score
+            self.accumScore += score
+
+            # inform a running game of the score
+            if score != 0 and activity is not None:
+                activity.handleMessage(PlayerScoredMessage(score=score))
 
         
     def __init__(self):
         self._activity = None
-        self._players = {}
+        self._resetRecords()
+        self._pending = []
+        self._pendingCount = 0
+        self._pendingTimer = None
+        self._pendingTimerTime = None
+
+    def _resetRecords(self):
+        self._players = {} # our dict of players indexed by name
+        self._playersByID = {}
+        self._names = []
+        self._counters = dict((name,[]) for name in _gCounterNames)
 
     def setActivity(self,activity):
         self._activity = None if activity is None else weakref.ref(activity)
 
+        # anything still waiting to be shown belonged to the last activity
+        self._pending = []
+        self._pendingTimer = None
+        self._pendingTimerTime = None
+
         # load our media into this activity's context
         if activity is not None:
             if activity.isFinalized():
@@ -173,27 +174,51 @@ class ScoreSet(object):
         self._orchestraHitSound4 = bs.getSound('orchestraHit4')
         
     def reset(self):
-        # just to be safe, lets make sure no multi-kill timers are gonna go off
+        # just to be safe, lets make sure no multi-kills are gonna get awarded
         # for no-longer-on-the-list players
-        for p in self._players.values(): p.cancelMultiKillTimer()
-        self._players = {} # our dict of players indexed by name
+        self._pending = []
+        self._pendingTimer = None
+        self._pendingTimerTime = None
+        self._resetRecords()
 
     # for things like per-round sub-scores..
     def resetAccum(self):
+        self._pending = [e for e in self._pending if e[2] != 'multiKill']
+        # (filtering doesn't keep heap order)
+        heapq.heapify(self._pending)
         for p in self._players.values():
-            p.cancelMultiKillTimer()
-            p.accumScore = 0
-            p.accumKillCount = 0
-            p.accumKilledCount = 0
+            p.cancelMultiKill()
             p.streak = 0
+        for name in ('accumScore','accumKillCount','accumKilledCount'):
+            counter = self._counters[name]
+            counter[:] = [0]*len(counter)
+
+    def getCounterArrays(self):
+        """
+        Returns a dict of flat per-player lists for the scoreboard: 'names', plus one
+        list per counter ('score', 'accumScore', 'killCount', 'accumKillCount',
+        'killedCount' and 'accumKilledCount'), all indexed alike. These are the live
+        lists; treat them as read-only.
+        """
+        arrays = dict(self._counters)
+        arrays['names'] = self._names
+        return arrays
 
     def registerPlayer(self,player):
         name = player.getName()
         nameFull = player.getName(full=True)
         try:
             # if the player already exists, update his character and such as it may have changed
-            self._players[name]._associateWithPlayer(player)
+            p = self._players[name]
+            p._associateWithPlayer(player)
         except Exception: p = self._players[name] = self._Player(name,nameFull,player,self)
+        self._playersByID[player.getID()] = p
+
+    def _getPlayer(self,player):
+        try: return self._playersByID[player.getID()]
+        except KeyError:
+            p = self._playersByID[player.getID()] = self._players[player.getName()]
+            return p
 
     def getValidPlayers(self):
         validPlayers = {}
@@ -207,27 +232,77 @@ class ScoreSet(object):
         return validPlayers
 
     def _getSpaz(self,player):
-        p = self._players[player.getName()]
+        p = self._getPlayer(player)
         # this is a weak-ref
         if p._spaz is None: return None
         return p._spaz()
 
     def playerGotNewSpaz(self,player,spaz):
-        p = self._players[player.getName()]
+        p = self._getPlayer(player)
         if p.getSpaz() is not None: raise Exception("got 2 playerGotNewSpaz() messages in a row without a lost-spaz message")
         p._spaz = weakref.ref(spaz)
 
     def playerGotHit(self,player):
-        p = self._players[player.getName()]
+        p = self._getPlayer(player)
         p.streak = 0
 
+    def _schedule(self,delay,kind,data):
+        # popups, announcements and multi-kill awards all wait in one queue serviced by a single timer;
+        # everything due at once gets rendered together (and same-player score popups combined)
+        now = bs.getGameTime()
+        self._pendingCount += 1
+        heapq.heappush(self._pending,(now+delay,self._pendingCount,kind,data))
+        dueTime = self._pending[0][0]
+        if self._pendingTimerTime is None or dueTime < self._pendingTimerTime:
+            self._pendingTimerTime = dueTime
+            self._pendingTimer = bs.Timer(max(1,dueTime-now),bs.WeakCall(self._processPending))
+
+    def _processPending(self):
+        now = bs.getGameTime()
+        self._pendingTimer = None
+        self._pendingTimerTime = None
+        due = []
+        while self._pending and self._pending[0][0] <= now: due.append(heapq.heappop(self._pending))
+        popups = collections.OrderedDict()
+        announced = set()
+        for t,count,kind,data in due:
+            try:
+                if kind == 'multiKill':
+                    p,killCount,showPoints = data
+                    p._applyMultiKill(killCount,showPoints)
+                elif kind == 'popup':
+                    p,points,title,color,scale,position = data
+                    # untitled pops for the same player this frame get rolled into one
+                    key = (p._index,color,scale) if title is None else count
+                    if key in popups: popups[key][1] += points
+                    else: popups[key] = [p,points,title,color,scale,position]
+                elif kind == 'announce':
+                    player,name = data
+                    if name in announced or not player.exists(): continue
+                    announced.add(name)
+                    bs.screenMessage(bs.Lstr(resource='nameScoresText',subs=[('${NAME}',name)]),
+                                     top=True,color=player.color,
+                                     image=player.getIcon())
+            except Exception: bs.printException('error processing score display',kind)
+        for p,points,title,color,scale,position in popups.values():
+            if title is not None:
+                s = bs.Lstr(value='+${A} ${B}',subs=[('${A}',str(points)),('${B}',title)])
+            else:
+                s = bs.Lstr(value='+${A}',subs=[('${A}',str(points))])
+            bsUtils.PopupText(s,
+                              color=color,
+                              scale=scale,
+                              position=position).autoRetain()
+        if self._pending:
+            dueTime = self._pending[0][0]
+            self._pendingTimerTime = dueTime
+            self._pendingTimer = bs.Timer(max(1,dueTime-now),bs.WeakCall(self._processPending))
+
     def playerScored(self,player,basePoints=1,target=None, kill=False, victimPlayer=None,scale=1.0,color=None,title=None,screenMessage=True,display=True,importance=1,showPoints=True,bigMessage=False):
         """ register a score for the player; return value is actual score with multipliers and such factored in """
 
-        name = player.getName()
-        p = self._players[name]
-
-        # if title is None: title = ''
+        p = self._getPlayer(player)
+        name = p.name
 
         if kill: p.submitKill(showPoints=showPoints)
 
@@ -237,7 +312,6 @@ class ScoreSet(object):
         elif importance != 1:
             displayColor = (1.0,1.0,0.4,1)
         points = basePoints
-        exc = ''
 
         # if they want a big announcement, throw a zoom-text up there
         if display and bigMessage:
@@ -259,21 +333,8 @@ class ScoreSet(object):
                 # if display-pos is *way* lower than us, raise it up
                 # (so we can still see scores from dudes that fell off cliffs)
                 displayPos = (target[0], max(target[1], ourPos[1]-2.0), min(target[2], ourPos[2]+2.0))
-
-                    # bs.printError('ignoring title arg in playerScored:',title)
-                # if type(title) != str or title != '': title = ' '+title
-                    
-                activity = self._activity()
-                if activity is not None:
-                    if title is not None:
-                        s = bs.Lstr(value='+${A} ${B}',subs=[('${A}',str(points)),('${B}',title)])
-                    else:
-                        s = bs.Lstr(value='+${A}',subs=[('${A}',str(points))])
-                    # bsUtils.PopupText('+'+str(points)+title,
-                    bsUtils.PopupText(s,
-                                      color=displayColor,
-                                      scale=1.2*scale,
-                                      position=displayPos).autoRetain()
+                if self._activity is not None and self._activity() is not None:
+                    self._schedule(0,'popup',(p,points,title,displayColor,1.2*scale,displayPos))
                     
         # tally kills
         if kill:
@@ -281,12 +342,7 @@ class ScoreSet(object):
             p.killCount += 1
 
         # report non-kill scorings
-        try:
-            if screenMessage and not kill:
-                bs.screenMessage(bs.Lstr(resource='nameScoresText',subs=[('${NAME}',name)]),
-                                 top=True,color=player.color,
-                                 image=player.getIcon())
-        except Exception,e: print 'Error announcing score:',e
+        if screenMessage and not kill: self._schedule(0,'announce',(player,name))
             
         p.score += points
         p.accumScore += points
@@ -301,7 +357,7 @@ class ScoreSet(object):
         
     def playerLostSpaz(self, player, killed=False, killer=None):
         name = player.getName()
-        p = self._players[name]
+        p = self._getPlayer(player)
         p._spaz = None
         p.streak = 0
 
@@ -1,5 +1,6 @@
 import bs
 import bsUtils
+import bsStatusEffect
 import random
 import weakref
 
@@ -579,7 +580,7 @@ class Spaz(bs.Actor):
             def _safeSetAttr(node,attr,val):
                 if node.exists(): setattr(node,attr,val)
             # bs.gameTimer(15000000,bs.Call(_safeSetAttr,self.node,'invincible',False))
-            bs.gameTimer(1500,bs.Call(_safeSetAttr,self.node,'invincible',False))
+            bsStatusEffect.addEffect(self,'invincible',1500,stack='max',onExpire=bs.Call(_safeSetAttr,self.node,'invincible',False))
 
         self.hitPoints = 1000
         self.hitPointsMax = 1000
@@ -1191,7 +1192,7 @@ class Spaz(bs.Actor):
             else:
                 factory = self.getFactory()
                 self._cursed = True
-                if bs.getConfig().get('Offensive Curse Sound', True):
+                if bsUtils.getConfigSnapshot().offensiveCurseSound:
                     self.sound = bs.newNode('sound',owner=self.node,attrs={'sound':factory.curseOffensiveSound,'volume':1.0})
                 else:
                     self.sound = bs.newNode('sound',owner=self.node,attrs={'sound':factory.curseSound,'volume':1.0})
@@ -1206,11 +1207,11 @@ class Spaz(bs.Actor):
                     self.node.curseDeathTime = -1
                 else:
                     self.node.curseDeathTime = bs.getGameTime()+self.curseTime
-                    self.curseExplodeTimer = bs.Timer(self.curseTime,bs.WeakCall(self.curseExplode))
+                    bsStatusEffect.addEffect(self,'curse',self.curseTime,onExpire=bs.WeakCall(self.curseExplode))
         else:
             if not self.curseTime == -1:
                 self.node.curseDeathTime = bs.getGameTime()+self.curseTime
-                self.curseExplodeTimer = bs.Timer(self.curseTime,bs.WeakCall(self.curseExplode))
+                bsStatusEffect.addEffect(self,'curse',self.curseTime,onExpire=bs.WeakCall(self.curseExplode))
             
     def equipBoxingGloves(self):
         """
@@ -1297,7 +1298,7 @@ class Spaz(bs.Actor):
             self.shield.hurt = 0
             bs.playSound(factory.shieldUpSound,1.0,position=self.node.position)
             if not isinstance(bs.getSession(),bs.CoopSession):
-                self.shieldDecayTimer = bs.Timer(20000,bs.WeakCall(self.shieldDecay)) # Only decay shields outside of Coop sessions
+                bsStatusEffect.addEffect(self,'shieldDecay',20000,onExpire=bs.WeakCall(self.shieldDecay)) # Only decay shields outside of Coop sessions
         else: # If the player is not given
             if self.shield is None: 
                 self.shield = bs.newNode('shield',owner=self.node,
@@ -1321,7 +1322,7 @@ class Spaz(bs.Actor):
             self.shield.hurt = 0
             bs.playSound(factory.shieldUpSound,1.0,position=self.node.position)
             if not isinstance(bs.getSession(),bs.CoopSession):
-                self.shieldDecayTimer = bs.Timer(20000,bs.WeakCall(self.shieldDecay)) # Only decay shields outside of Coop sessions
+                bsStatusEffect.addEffect(self,'shieldDecay',20000,onExpire=bs.WeakCall(self.shieldDecay)) # Only decay shields outside of Coop sessions
         
     def shieldDecay(self):
         factory = self.getFactory()
@@ -1372,7 +1373,7 @@ class Spaz(bs.Actor):
                 self._flashBillboard(tex)
                 self.setBombCount(3)
                 self.blastRadius = self.defaultBlastRadius
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='tripleBombs')),
                                             color=(1,1,0),
                                             scale=self.scale,
@@ -1382,14 +1383,13 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard1StartTime = t
                     self.node.miniBillboard1EndTime = t+gPowerupWearOffTime
-                    self._multiBombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._multiBombWearOffFlash))
-                    self._multiBombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._multiBombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombCount',gPowerupWearOffTime,self._multiBombWearOffFlash,self._multiBombWearOff)
             elif (m.powerupType == 'blastBuff'):
                 tex = bs.Powerup.getFactory().texBlast
                 self._flashBillboard(tex)
                 self.setBombCount(self.defaultBombCount)
                 self.blastRadius = 2.2
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='blastBuff')),
                                             color=(1,1,0),
                                             scale=self.scale,
@@ -1399,14 +1399,13 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard1StartTime = t
                     self.node.miniBillboard1EndTime = t+gPowerupWearOffTime
-                    self._multiBombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._blastBuffWearOffFlash))
-                    self._multiBombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._blastBuffWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombCount',gPowerupWearOffTime,self._blastBuffWearOffFlash,self._blastBuffWearOff)
             elif m.powerupType == 'landMines':
                 self.setGrenadeCount(min(0,4))
                 self.setHealBombCount(min(0,2))
                 self.setHijumpCount(min(0,6))
                 self.setLandMineCount(min(self.landMineCount+3,3))
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='landMine')),
                                             color=(0.1,0.7,0),
                                             scale=self.scale,
@@ -1416,7 +1415,7 @@ class Spaz(bs.Actor):
                 self.setLandMineCount(min(0,3))
                 self.setHijumpCount(min(0,6))
                 self.setGrenadeCount(min(self.grenadeCount+2,4))
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='grenade')),
                                             color=(0.57,0.82,0.6),
                                             scale=self.scale,
@@ -1426,7 +1425,7 @@ class Spaz(bs.Actor):
                 self.setLandMineCount(min(0,3))
                 self.setGrenadeCount(min(0,4))
                 self.setHijumpCount(min(self.hijumpCount+3,6))
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='hijump')),
                                             color=(1,0.01,0.95),
                                             scale=self.scale,
@@ -1436,7 +1435,7 @@ class Spaz(bs.Actor):
                 self.setLandMineCount(min(0,3))
                 self.setHijumpCount(min(0,6))
                 self.setHealBombCount(min(self.healBombCount+1,2))
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='healBomb')),
                                             color=(1,0.4,0.7),
                                             scale=self.scale,
@@ -1445,7 +1444,7 @@ class Spaz(bs.Actor):
                 self.bombType = 'impact'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='impactBomb')),
                                             color=(0.6,0.6,0.6),
                                             scale=self.scale,
@@ -1455,13 +1454,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif m.powerupType == 'knockerBombs':
                 self.bombType = 'knocker'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='knockerBomb')),
                                             color=(0.0,0.0,1.0),
                                             scale=self.scale,
@@ -1471,13 +1469,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif m.powerupType == 'stickyBombs':
                 self.bombType = 'sticky'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='stickyBomb')),
                                             color=(0,1,0),
                                             scale=self.scale,
@@ -1487,14 +1484,13 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             # jasonhu5
             elif m.powerupType == 'overPower':
                 self.bombType = 'overPowerBomb'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='stickyBomb')),
                                             color=(0,1,0),
                                             scale=self.scale,
@@ -1504,14 +1500,13 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             # 
             elif m.powerupType == 'rangerBombs':
                 self.bombType = 'ranger'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='rangerBomb')),
                                             color=(1,1,0.5),
                                             scale=self.scale,
@@ -1521,13 +1516,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif m.powerupType == 'combatBombs':
                 self.bombType = 'combat'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='combatBomb')),
                                             color=(0,1,1),
                                             scale=self.scale,
@@ -1537,13 +1531,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif m.powerupType == 'dynamitePack':
                 self.bombType = 'dynamite'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='dynamitePack')),
                                             color=(1,0,0),
                                             scale=self.scale,
@@ -1553,14 +1546,13 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif m.powerupType == 'punch':
                 self._hasBoxingGloves = True
                 tex = bs.Powerup.getFactory().texPunch
                 self._flashBillboard(tex)
                 self.equipBoxingGloves()
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='punch')),
                                             color=(1,0.3,0.3),
                                             scale=self.scale,
@@ -1571,13 +1563,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard3StartTime = t
                     self.node.miniBillboard3EndTime = t+gPowerupWearOffTime
-                    self._boxingGlovesWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._glovesWearOffFlash))
-                    self._boxingGlovesWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._glovesWearOff))
+                    self._addPowerupEffect(m.powerupType,'gloves',gPowerupWearOffTime,self._glovesWearOffFlash,self._glovesWearOff)
             elif m.powerupType == 'speed':
                 tex = bs.Powerup.getFactory().texSpeed
                 self._flashBillboard(tex)
                 self.equipSpeed()
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='speed')),
                                             color=(0.75,1,0.1),
                                             scale=self.scale,
@@ -1587,20 +1578,19 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard3StartTime = t
                     self.node.miniBillboard3EndTime = t+gPowerfulPowerupWearOffTime
-                    self._boxingGlovesWearOffFlashTimer = bs.Timer(gPowerfulPowerupWearOffTime-2000,bs.WeakCall(self._speedWearOffFlash))
-                    self._boxingGlovesWearOffTimer = bs.Timer(gPowerfulPowerupWearOffTime,bs.WeakCall(self._speedWearOff))
+                    self._addPowerupEffect(m.powerupType,'speed',gPowerfulPowerupWearOffTime,self._speedWearOffFlash,self._speedWearOff)
                     
             elif m.powerupType == 'shield':
                 player = bs.PlayerSpaz.getPlayer(self)
                 self.equipShields(player)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='shield')),
                                             color=(0.7,0.5,1),
                                             scale=self.scale,
                                             position=self.node.position).autoRetain()
             elif m.powerupType == 'curse':
                 self.curse()
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='curse')),
                                             color=(0.3,0,0.45),
                                             scale=self.scale,
@@ -1609,7 +1599,7 @@ class Spaz(bs.Actor):
                 self.bombType = 'ice'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='iceBomb')),
                                             color=(0,0.45,1.0),
                                             scale=1.0,
@@ -1619,13 +1609,12 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif (m.powerupType == 'fireBombs'):
                 self.bombType = 'fire'
                 tex = self._getBombTypeTex()
                 self._flashBillboard(tex)
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='fireBomb')),
                                             color=(1,0.5,1),
                                             scale=self.scale,
@@ -1635,8 +1624,7 @@ class Spaz(bs.Actor):
                     t = bs.getGameTime()
                     self.node.miniBillboard2StartTime = t
                     self.node.miniBillboard2EndTime = t+gPowerupWearOffTime
-                    self._bombWearOffFlashTimer = bs.Timer(gPowerupWearOffTime-2000,bs.WeakCall(self._bombWearOffFlash))
-                    self._bombWearOffTimer = bs.Timer(gPowerupWearOffTime,bs.WeakCall(self._bombWearOff))
+                    self._addPowerupEffect(m.powerupType,'bombType',gPowerupWearOffTime,self._bombWearOffFlash,self._bombWearOff)
             elif (m.powerupType == 'health'):
                 if self._cursed:
                     self._cursed = False
@@ -1648,6 +1636,7 @@ class Spaz(bs.Actor):
                         if factory.curseMaterial in materials:
                             setattr(self.node,attr,tuple(m for m in materials if m != factory.curseMaterial))
                     self.node.curseDeathTime = 0
+                    self.unarmCurse()
                 if (self.hitPoints > self.hitPointsOverdriveTooMuch):
                     self.hitPoints = self.hitPointsOverdriveTooMuch
                 elif (self.hitPoints < self.hitPointsMax):
@@ -1658,7 +1647,7 @@ class Spaz(bs.Actor):
                 self.node.hurt = 0
                 self._lastHitTime = None
                 self._numTimesHit = 0
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='health')),
                                             color=(1,0.9,0.9),
                                             scale=self.scale,
@@ -1667,7 +1656,8 @@ class Spaz(bs.Actor):
                 def _safeSetAttr(node,attr,val):
                     if node.exists(): setattr(node,attr,val)
                 bs.gameTimer(1,bs.Call(_safeSetAttr,self.node,'invincible',True))
-                bs.gameTimer(3000,bs.Call(_safeSetAttr,self.node,'invincible',False))
+                # (stack with any spawn invincibility rather than cutting it short)
+                bsStatusEffect.addEffect(self,'invincible',3000,stack='max',onExpire=bs.Call(_safeSetAttr,self.node,'invincible',False))
                 if self._cursed:
                     self.curseExplode()
                 if (self.hitPoints >= self.hitPointsOverdriveTooMuch):
@@ -1678,7 +1668,7 @@ class Spaz(bs.Actor):
                 self.node.hurt = 0
                 self._lastHitTime = None
                 self._numTimesHit = 0
-                if bs.getConfig().get('Powerup Popups', True):
+                if bsUtils.getConfigSnapshot().powerupPopups:
                     bsUtils.PopupText((bs.Lstr(resource='overdrive')),
                                             color=(0.5,0,1),
                                             scale=self.scale,
@@ -1722,6 +1712,7 @@ class Spaz(bs.Actor):
                     if factory.curseMaterial in materials:
                         setattr(self.node,attr,tuple(m for m in materials if m != factory.curseMaterial))
                 self.node.curseDeathTime = 0
+                self.unarmCurse()
             if (self.hitPoints <= self.hitPointsMax):
                 self.hitPoints = self.hitPointsMax
                 bs.playSound(factory.healthPowerupSound,3,position=self.node.position)
@@ -1785,7 +1776,8 @@ class Spaz(bs.Actor):
                     t = self.node.position
                     bs.emitBGDynamics(position=(t[0],t[1]+0.9,t[2]),
                                       velocity=self.node.velocity,
-                                      count=random.randrange(20,30),scale=0.6,spread=0.6,chunkType='spark')
+                                      count=random.randrange(20,30),scale=0.6,spread=0.6,chunkType='spark',
+                                      priority='critical') # (players need to see their shield is gone)
 
                 else:
                     bs.playSound(self.getFactory().shieldHitSound,0.5,position=self.node.position)
@@ -1852,6 +1844,7 @@ class Spaz(bs.Actor):
                                             m.forceDirection[1]*1.3+5.0,
                                             m.forceDirection[2]*1.3),
                                   count=60,
+                                  priority='critical',
                                   scale=4.0,
                                   spread=0.6);
                     self.sparks = bs.emitBGDynamics(position=m.pos,
@@ -1860,6 +1853,7 @@ class Spaz(bs.Actor):
                                             m.forceDirection[1]*1.3+5.0,
                                             m.forceDirection[2]*1.3),
                                   count=45,
+                                  priority='critical',
                                   scale=1.0,
                                   spread=1.0);
                     sounds = self.getFactory().powerPunchSounds
@@ -2246,8 +2240,7 @@ class Spaz(bs.Actor):
         #                    sourcePlayer=self.sourcePlayer,
         #                    owner=self.node).autoRetain()
 
-        # jasonhu5
-        if not bombType == 'overPowerBomb' and not bombType == 'grenade':
+        if bs.getBombType(bombType).pickUpOnDrop:
             if droppingBomb:
                 self.bombCount -= 1
                 bomb.node.addDeathAction(bs.WeakCall(self.handleMessage,_BombDiedMessage()))
@@ -2330,7 +2323,7 @@ class Spaz(bs.Actor):
                        owner=self.node).autoRetain()
 
     def unarmCurse(self):
-        self.curseExplodeTimer = None
+        bsStatusEffect.removeEffect(self,'curse')
 
     def curseExplode(self,sourcePlayer=None):
         """
@@ -2436,22 +2429,9 @@ class Spaz(bs.Actor):
         bs.playSound(s,position=pos,volume=4)
         
     def _getBombTypeTex(self):
-        bombFactory = bs.Powerup.getFactory()
-        if self.bombType == 'sticky': return bombFactory.texStickyBombs
-        # jasonhu5
-        elif self.bombType == 'overPowerBomb': return bombFactory.texStickyBombs
-        # 
-        elif self.bombType == 'ice': return bombFactory.texIceBombs
-        elif self.bombType == 'fire': return bombFactory.texFireBombs
-        elif self.bombType == 'ranger': return bombFactory.texRangerBombs
-        elif self.bombType == 'combat': return bombFactory.texCombatBombs
-        elif self.bombType == 'knocker': return bombFactory.texKnockerBombs
-        elif self.bombType == 'dynamite': return bombFactory.texDynamitePack
-        elif self.bombType == 'impact': return bombFactory.texImpactBombs
-        elif self.bombType == 'healing': return bombFactory.texHealBombs
-        elif self.bombType == 'hijump': return bombFactory.texHijump
-        elif self.bombType == 'speed': return bombFactory.texSpeed
-        else: raise Exception()
+        texName = bs.getBombType(self.bombType).powerupTex
+        if texName is None: raise Exception('no powerup texture for bomb type '+self.bombType)
+        return getattr(bs.Powerup.getFactory(),texName)
         
     def _flashBillboard(self,tex):
         self.node.billboardTexture = tex
@@ -2465,6 +2445,20 @@ class Spaz(bs.Actor):
         self._maxBombCount += diff
         self.bombCount += diff
         
+    def _addPowerupEffect(self,effectType,slot,duration,flashCall,wearOffCall):
+        # powerups in the same slot replace each other; different slots run independently
+        bsStatusEffect.addEffect(self,effectType,duration,slot=slot,flashLead=2000,
+                                 onFlash=bs.WeakCall(flashCall),onExpire=bs.WeakCall(wearOffCall))
+
+    def getActiveEffects(self):
+        """
+        Returns a list of the bsStatusEffect.StatusEffects (powerups, curse, etc)
+        currently on this spaz.
+        """
+        activity = self.getActivity()
+        if activity is None: return []
+        return bsStatusEffect.getStatusEffectManager(activity).getEffects(self)
+
     def _speedWearOffFlash(self):
         if self.node.exists():
             self.node.billboardTexture = bs.Powerup.getFactory().texSpeed
@@ -2788,92 +2782,172 @@ class RespawnIcon(object):
         """
         Instantiate with a given bs.Player and respawnTime (in milliseconds)
         """
-        activity = bs.getActivity()
-        onRight = False
         self._visible = True
+        self._slot = None
+        self._manager = weakref.ref(RespawnIconManager.get())
+        self._slot = self._manager()._acquire(self,player,respawnTime)
+
+    def __del__(self):
+        self._clear()
+
+    def _clear(self):
+        self._visible = False
+        manager = self._manager()
+        if manager is not None and self._slot is not None: manager._release(self._slot)
+        self._slot = None
+
+
+class _RespawnIconSlot(object):
+    """ one on-screen respawn icon position and its (reused) nodes """
+    def __init__(self,onRight,offs,maskTex):
+        hOffs = -10
+        self.icon = None
+        self.respawnTime = None
+        self.shown = None
+        self.image = bs.NodeActor(bs.newNode('image',
+                                             attrs={'maskTexture':maskTex,
+                                                    'position':(-40-hOffs if onRight else 40+hOffs,-180+offs),
+                                                    'scale':(32,32),
+                                                    'opacity':0.0,
+                                                    'absoluteScale':True,
+                                                    'attach':'topRight' if onRight else 'topLeft'}))
+        self.name = bs.NodeActor(bs.newNode('text',
+                                            attrs={'vAttach':'top',
+                                                   'hAttach':'right' if onRight else 'left',
+                                                   'text':'',
+                                                   'maxWidth':100,
+                                                   'hAlign':'center',
+                                                   'vAlign':'center',
+                                                   'shadow':1.0,
+                                                   'flatness':1.0,
+                                                   'scale':0.0,
+                                                   'position':(-40-hOffs if onRight else 40+hOffs,-205+49+offs)}))
+        self.text = bs.NodeActor(bs.newNode('text',
+                                            attrs={'position':(-60-hOffs if onRight else 60+hOffs,-192+offs),
+                                                   'hAttach':'right' if onRight else 'left',
+                                                   'hAlign':'right' if onRight else 'left',
+                                                   'scale':0.0,
+                                                   'shadow':0.5,
+                                                   'flatness':0.5,
+                                                   'vAttach':'top',
+                                                   'text':''}))
+
+    def show(self,icon,player,respawnTime):
+        self.icon = weakref.ref(icon)
+        self.respawnTime = bs.getGameTime()+respawnTime
+        self.shown = None
+        playerIcon = player.getIcon()
+        color = bs.getSafeColor(playerIcon['tintColor'])
+        image = self.image.node
+        image.texture = playerIcon['texture']
+        image.tintTexture = playerIcon['tintTexture']
+        image.tintColor = playerIcon['tintColor']
+        image.tint2Color = playerIcon['tint2Color']
+        bs.animate(image,'opacity',{0:0,200:0.7})
+        self.name.node.text = player.getName()
+        self.name.node.color = color
+        bs.animate(self.name.node,'scale',{0:0,100:0.5})
+        self.text.node.text = ''
+        self.text.node.color = color
+        bs.animate(self.text.node,'scale',{0:0,100:0.9})
+
+    def hide(self):
+        self.icon = None
+        # (animate rather than set so we override any fade-in still running)
+        if self.image.node.exists(): bs.animate(self.image.node,'opacity',{0:0})
+        for actor in (self.name,self.text):
+            if actor.node.exists():
+                bs.animate(actor.node,'scale',{0:0})
+                actor.node.text = ''
+
+
+class RespawnIconManager(object):
+    """
+    Drives all of an activity's bs.RespawnIcons.
+
+    Icon positions ('slots') and their nodes are created on first use and then
+    reused by later deaths. A single timer, set for whenever the next displayed
+    countdown second changes, updates every visible icon, and a countdown's text
+    is only rewritten when its displayed second actually changes.
+    """
+    def __init__(self):
+        self._activity = weakref.ref(bs.getActivity())
+        self._maskTex = bs.getTexture('characterIconMask')
+        self._slots = {} # group key -> list of _RespawnIconSlots
+        self._active = []
+        self._timer = None
+        self._timerTime = None
+
+    @classmethod
+    def get(cls):
+        """
+        Returns the current activity's shared RespawnIconManager, creating it if necessary.
+        """
+        activity = bs.getActivity()
+        if activity is None: raise Exception("no current activity")
+        try: return activity._sharedRespawnIconManager
+        except Exception:
+            m = activity._sharedRespawnIconManager = RespawnIconManager()
+            return m
+
+    def _acquire(self,icon,player,respawnTime):
+        # teams games stack icons per team on alternating sides; others share one column
         if isinstance(bs.getSession(),bs.TeamsSession):
-            onRight = player.getTeam().getID()%2==1
-            # store a list of icons in the team
-            try: respawnIcons = player.getTeam().gameData['_spazRespawnIconsRight']
-            except Exception: respawnIcons = player.getTeam().gameData['_spazRespawnIconsRight'] = {}
+            key = player.getTeam().getID()
+            onRight = key%2==1
             offsExtra = -20
         else:
+            key = None
             onRight = False
-            # store a list of icons in the activity
-            try: respawnIcons = activity._spazRespawnIconsRight
-            except Exception: respawnIcons = activity._spazRespawnIconsRight = {}
-            if isinstance(activity.getSession(),bs.FreeForAllSession): offsExtra = -150
-            else: offsExtra = -20
-
-        try: maskTex = player.getTeam().gameData['_spazRespawnIconsMaskTex']
-        except Exception: maskTex = player.getTeam().gameData['_spazRespawnIconsMaskTex'] = bs.getTexture('characterIconMask')
-
-        # now find the first unused slot and use that
-        index = 0
-        while index in respawnIcons and respawnIcons[index]() is not None and respawnIcons[index]()._visible: index += 1
-        respawnIcons[index] = weakref.ref(self)
-
-        offs = offsExtra + index*-53
-        icon = player.getIcon()
-        texture = icon['texture']
-        hOffs = -10
-        self._image = bs.NodeActor(bs.newNode('image',
-                                              attrs={'texture':texture,
-                                                     'tintTexture':icon['tintTexture'],
-                                                     'tintColor':icon['tintColor'],
-                                                     'tint2Color':icon['tint2Color'],
-                                                     'maskTexture':maskTex,
-                                                     'position':(-40-hOffs if onRight else 40+hOffs,-180+offs),
-                                                     'scale':(32,32),
-                                                     'opacity':1.0,
-                                                     'absoluteScale':True,
-                                                     'attach':'topRight' if onRight else 'topLeft'}))
-        
-        bs.animate(self._image.node,'opacity',{0:0,200:0.7})
-
-        self._name = bs.NodeActor(bs.newNode('text',
-                                             attrs={'vAttach':'top',
-                                                    'hAttach':'right' if onRight else 'left',
-                                                    'text':player.getName(),
-                                                    'maxWidth':100,
-                                                    'hAlign':'center',
-                                                    'vAlign':'center',
-                                                    'shadow':1.0,
-                                                    'flatness':1.0,
-                                                    'color':bs.getSafeColor(icon['tintColor']),
-                                                    'scale':0.5,
-                                                    'position':(-40-hOffs if onRight else 40+hOffs,-205+49+offs)}))
-        
-        bs.animate(self._name.node,'scale',{0:0,100:0.5})
-
-        self._text = bs.NodeActor(bs.newNode('text',
-                                             attrs={'position':(-60-hOffs if onRight else 60+hOffs,-192+offs),
-                                                    'hAttach':'right' if onRight else 'left',
-                                                    'hAlign':'right' if onRight else 'left',
-                                                    'scale':0.9,
-                                                    'shadow':0.5,
-                                                    'flatness':0.5,
-                                                    'vAttach':'top',
-                                                    'color':bs.getSafeColor(icon['tintColor']),
-                                                    'text':''}))
-        
-        bs.animate(self._text.node,'scale',{0:0,100:0.9})
+            offsExtra = -150 if isinstance(bs.getSession(),bs.FreeForAllSession) else -20
 
-        self._respawnTime = bs.getGameTime()+respawnTime
+        # use the first unused slot, adding one if they're all taken
+        slots = self._slots.setdefault(key,[])
+        for slot in slots:
+            if slot.icon is None: break
+        else:
+            slot = _RespawnIconSlot(onRight,offsExtra+len(slots)*-53,self._maskTex)
+            slots.append(slot)
+        slot.show(icon,player,respawnTime)
+        self._active.append(slot)
         self._update()
-        self._timer = bs.Timer(1000,bs.WeakCall(self._update),repeat=True)
+        return slot
+
+    def _release(self,slot):
+        if slot in self._active:
+            self._active.remove(slot)
+            # (icons can be released from anywhere, so make sure we're in our activity's context)
+            activity = self._activity()
+            if activity is not None and not activity.isFinalized():
+                with bs.Context(activity): slot.hide()
+            else: slot.icon = None
 
     def _update(self):
-        remaining = int(round(self._respawnTime-bs.getGameTime())/1000.0)
-        if remaining > 0:
-            if self._text.node.exists():
-                self._text.node.text = str(remaining)
-        else: self._clear()
-            
-    def _clear(self):
-        self._visible = False
-        self._image = self._text = self._timer = self._name = None
-        
+        now = bs.getGameTime()
+        nextTime = None
+        for slot in list(self._active):
+            remaining = int(round(slot.respawnTime-now)/1000.0)
+            if remaining > 0:
+                if remaining != slot.shown:
+                    slot.shown = remaining
+                    if slot.text.node.exists(): slot.text.node.text = str(remaining)
+                # (the displayed second drops once we're a millisecond past the boundary)
+                t = slot.respawnTime-remaining*1000+1
+                if nextTime is None or t < nextTime: nextTime = t
+            else:
+                icon = slot.icon() if slot.icon is not None else None
+                if icon is not None: icon._clear()
+                else: self._release(slot)
+        if nextTime is None:
+            self._timer = None
+            self._timerTime = None
+        elif nextTime != self._timerTime:
+            self._timerTime = nextTime
+            self._timer = bs.Timer(max(1,nextTime-now),bs.WeakCall(self._onTimer))
+
+    def _onTimer(self):
+        self._timerTime = None
+        self._update()
 
 
 class SpazBotPunchedMessage(object):
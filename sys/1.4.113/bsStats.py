@@ -0,0 +1,260 @@
+import bs
+import bsInternal
+import os
+import time
+import Queue
+import threading
+
+# counters we keep per player per match (column name -> bsScoreSet counter)
+_gPlayerStatColumns = (('score','score'),('kills','killCount'),('deaths','killedCount'))
+
+_gSchema = ("CREATE TABLE IF NOT EXISTS matches (id INTEGER PRIMARY KEY, time REAL, gameType TEXT, map TEXT,"
+            " session TEXT, duration INTEGER, playerCount INTEGER, winner TEXT)",
+            "CREATE TABLE IF NOT EXISTS playerStats (matchID INTEGER, time REAL, gameType TEXT, map TEXT,"
+            " name TEXT, score INTEGER, kills INTEGER, deaths INTEGER)",
+            "CREATE INDEX IF NOT EXISTS matchesTime ON matches (time)",
+            "CREATE INDEX IF NOT EXISTS playerStatsGameType ON playerStats (gameType, time)",
+            "CREATE INDEX IF NOT EXISTS playerStatsMap ON playerStats (map, time)",
+            "CREATE INDEX IF NOT EXISTS playerStatsName ON playerStats (name, time)")
+
+_gStatsStore = None
+_gStatsStoreChecked = False
+
+def getStatsStore():
+    """
+    Returns the shared StatsStore, or None if stats recording is disabled.
+    Recording is opt-in: set the 'Stats Database' config value to the path of
+    the database to enable it. Headless (server) builds default to 'stats.db'
+    next to the config; set it to '' there to disable.
+    """
+    global _gStatsStore
+    global _gStatsStoreChecked
+    if not _gStatsStoreChecked:
+        _gStatsStoreChecked = True
+        path = bs.getConfig().get('Stats Database',None)
+        if path is None:
+            env = bs.getEnvironment()
+            # regular clients don't need a database thread running unless they ask for it
+            if env['subplatform'] == 'headless': path = os.path.join(os.path.dirname(env['configFilePath']),'stats.db')
+        if path: _gStatsStore = StatsStore(path)
+    return _gStatsStore
+
+def queryTopPlayers(callback,stat='kills',count=10,since=None,gameType=None,mapName=None):
+    """
+    Looks up the top players in the stats database on a background thread.
+    See StatsStore.queryTopPlayers(). Returns False if stats are disabled.
+    """
+    store = getStatsStore()
+    if store is None: return False
+    store.queryTopPlayers(callback,stat=stat,count=count,since=since,gameType=gameType,mapName=mapName)
+    return True
+
+def _beginMatch(activity):
+    """ notes where an activity's scoreSet counters stand so _endMatch() can diff against them """
+    if getStatsStore() is None: return
+    counters = activity.scoreSet.getCounterArrays()
+    activity._statsMatch = {'startTime':bs.getGameTime(),
+                            'counters':dict((c,list(counters[c])) for col,c in _gPlayerStatColumns)}
+
+def _endMatch(activity,results=None):
+    """ records an activity's match and per-player rows and hands them off for writing """
+    match = getattr(activity,'_statsMatch',None)
+    if match is None: return
+    activity._statsMatch = None
+    store = getStatsStore()
+    counters = activity.scoreSet.getCounterArrays()
+    names = counters['names']
+    playing = set(p.getName() for p in activity.players if p.exists())
+    players = []
+    for i,name in enumerate(names):
+        row = {'name':name}
+        for col,c in _gPlayerStatColumns:
+            start = match['counters'][c]
+            row[col] = max(0,counters[c][i]-(start[i] if i < len(start) else 0))
+        if name in playing or any(row[col] for col,c in _gPlayerStatColumns): players.append(row)
+    winner = None
+    try:
+        if isinstance(results,bs.TeamGameResults):
+            team = results._getWinningTeam()
+            if team is not None: winner = team.name
+    except Exception: bs.printException('error getting winner for stats')
+    try: mapName = activity.getMap().getName()
+    except Exception: mapName = None
+    store.recordMatch({'time':time.time(),
+                       'gameType':activity.getName(),
+                       'map':mapName,
+                       'session':type(activity.getSession()).__name__,
+                       'duration':bs.getGameTime()-match['startTime'],
+                       'playerCount':len(playing),
+                       'winner':winner},players)
+    store.flush()
+
+def _shutdownStats():
+    if _gStatsStore is not None: _gStatsStore.close()
+
+
+def _toUnicode(value):
+    if isinstance(value,str): return value.decode('utf-8','replace')
+    return value
+
+
+class StatsStore(object):
+    """
+    Persistent per-player match stats in an SQLite database.
+
+    The database is only ever touched from a single background thread. Completed
+    matches are queued with recordMatch() and handed to that thread in one batch
+    by flush() (which happens automatically when a game ends); each batch is
+    written in a single transaction. Queries also run on that thread, and their
+    results come back to the game thread through a callback.
+    """
+    def __init__(self,path):
+        self._path = path
+        self._queue = Queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pending = []
+        self._disabled = False
+        self._matchesWritten = 0
+        self._batchesWritten = 0
+        self._queries = 0
+        self._errors = 0
+        self._lastLatency = 0.0
+        self._maxLatency = 0.0
+
+    def recordMatch(self,match,players):
+        """
+        Queues one match for writing: 'match' is a dict of matches-table values
+        ('time', 'gameType', 'map', 'session', 'duration', 'playerCount', 'winner')
+        and 'players' a list of dicts with 'name', 'score', 'kills' and 'deaths'.
+        Nothing is written until the next flush().
+        """
+        self._pending.append((match,players))
+
+    def flush(self):
+        """ hands everything queued by recordMatch() to the writer thread """
+        if not self._pending: return
+        batch = self._pending
+        self._pending = []
+        self._put(('write',batch,time.time()))
+
+    def queryTopPlayers(self,callback,stat='kills',count=10,since=None,gameType=None,mapName=None):
+        """
+        Looks up the 'count' players with the highest total 'stat' ('score',
+        'kills' or 'deaths') over matches since the given time.time() value,
+        optionally limited to one game type and/or map. 'callback' is called in
+        the game thread (in the current context) with a list of dicts with
+        'name', 'total' and 'games', or None if the query failed.
+        """
+        if stat not in [col for col,c in _gPlayerStatColumns]: raise Exception("invalid stat: "+str(stat))
+        import bsHttp
+        self._put(('query',(stat,count,since,gameType,mapName),bsHttp._ServerCallback(callback)))
+
+    def getStats(self):
+        """
+        Returns a dict with 'pending' (matches not yet handed off), 'queued'
+        (jobs waiting on the writer thread), 'matchesWritten', 'batchesWritten',
+        'queries', 'errors', and 'lastLatency'/'maxLatency': seconds between a batch
+        being flushed and it being committed.
+        """
+        with self._lock:
+            return {'pending':len(self._pending),
+                    'queued':self._queue.qsize(),
+                    'matchesWritten':self._matchesWritten,
+                    'batchesWritten':self._batchesWritten,
+                    'queries':self._queries,
+                    'errors':self._errors,
+                    'lastLatency':self._lastLatency,
+                    'maxLatency':self._maxLatency}
+
+    def close(self,timeout=2.0):
+        """ flushes and waits (up to 'timeout' seconds) for outstanding writes to finish """
+        self.flush()
+        if self._thread is None: return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _put(self,job):
+        if self._disabled:
+            if job[0] == 'query': bs.callInGameThread(bs.Call(job[2].run,None))
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        self._queue.put(job)
+
+    def _connect(self):
+        import sqlite3
+        db = sqlite3.connect(self._path)
+        db.execute("PRAGMA synchronous=NORMAL")
+        with db:
+            for statement in _gSchema: db.execute(statement)
+        return db
+
+    def _run(self):
+        bsInternal._setThreadName("BS_StatsThread")
+        try: db = self._connect()
+        except Exception,e:
+            print 'EXC opening stats database \''+str(self._path)+'\':',e
+            self._disabled = True
+            db = None
+        while True:
+            job = self._queue.get()
+            if job is None: break
+            if job[0] == 'write':
+                if db is not None: self._write(db,job[1],job[2])
+            elif job[0] == 'query':
+                result = self._query(db,*job[1]) if db is not None else None
+                bs.callInGameThread(bs.Call(job[2].run,result))
+        if db is not None: db.close()
+
+    def _write(self,db,batch,flushTime):
+        try:
+            with db:
+                for match,players in batch:
+                    cursor = db.execute("INSERT INTO matches (time, gameType, map, session, duration, playerCount, winner)"
+                                        " VALUES (?,?,?,?,?,?,?)",
+                                        (match['time'],_toUnicode(match['gameType']),_toUnicode(match['map']),
+                                         _toUnicode(match['session']),match['duration'],match['playerCount'],
+                                         _toUnicode(match['winner'])))
+                    matchID = cursor.lastrowid
+                    db.executemany("INSERT INTO playerStats (matchID, time, gameType, map, name, score, kills, deaths)"
+                                   " VALUES (?,?,?,?,?,?,?,?)",
+                                   [(matchID,match['time'],_toUnicode(match['gameType']),_toUnicode(match['map']),
+                                     _toUnicode(p['name']),p['score'],p['kills'],p['deaths']) for p in players])
+            latency = time.time()-flushTime
+            with self._lock:
+                self._matchesWritten += len(batch)
+                self._batchesWritten += 1
+                self._lastLatency = latency
+                self._maxLatency = max(self._maxLatency,latency)
+        except Exception,e:
+            print 'EXC writing stats:',e
+            with self._lock: self._errors += 1
+
+    def _query(self,db,stat,count,since,gameType,mapName):
+        where = []
+        args = []
+        if since is not None:
+            where.append("time >= ?")
+            args.append(since)
+        if gameType is not None:
+            where.append("gameType = ?")
+            args.append(_toUnicode(gameType))
+        if mapName is not None:
+            where.append("map = ?")
+            args.append(_toUnicode(mapName))
+        sql = "SELECT name, SUM("+stat+") AS total, COUNT(*) AS games FROM playerStats"
+        if where: sql += " WHERE "+" AND ".join(where)
+        sql += " GROUP BY name ORDER BY total DESC LIMIT ?"
+        args.append(count)
+        try:
+            rows = db.execute(sql,args).fetchall()
+            with self._lock: self._queries += 1
+            return [{'name':name,'total':total,'games':games} for name,total,games in rows]
+        except Exception,e:
+            print 'EXC querying stats:',e
+            with self._lock: self._errors += 1
+            return None
@@ -0,0 +1,206 @@
+import bs
+import heapq
+import weakref
+import itertools
+
+def getStatusEffectManager(activity=None):
+    """
+    Returns an activity's shared StatusEffectManager (the current activity's
+    if none is given), creating it if necessary.
+    """
+    if activity is None: activity = bs.getActivity()
+    if activity is None: raise Exception("no current activity")
+    try: return activity._sharedStatusEffectManager
+    except Exception:
+        m = activity._sharedStatusEffectManager = StatusEffectManager()
+        return m
+
+def addEffect(owner,effectType,duration,**keywds):
+    """
+    Adds a timed effect to 'owner' in the current activity.
+    See StatusEffectManager.addEffect().
+    """
+    return getStatusEffectManager().addEffect(owner,effectType,duration,**keywds)
+
+def removeEffect(owner,effectType,expire=False):
+    """
+    Removes an effect from 'owner' in the current activity.
+    See StatusEffectManager.removeEffect().
+    """
+    return getStatusEffectManager().removeEffect(owner,effectType,expire)
+
+def getEffects(owner):
+    """
+    Returns the active effects on 'owner' in the current activity.
+    """
+    return getStatusEffectManager().getEffects(owner)
+
+
+class StatusEffect(object):
+    """
+    A single timed effect (a powerup, curse, etc) on some owner.
+
+    Attributes:
+
+       effectType
+          A string naming the effect ('speed', 'curse', etc).
+
+       startTime, duration
+          Game time (ms) the effect (re)started at, and how long it lasts from then.
+
+       stack
+          How re-adding the same effectType behaves: 'refresh' restarts it with the
+          new duration, 'extend' adds the new duration onto what's left, 'max' keeps
+          whichever would end later, and 'independent' adds a separate instance.
+
+       slot
+          Effects sharing a slot are mutually exclusive; adding one silently
+          cancels any other type in the same slot. None for no slot.
+
+       flashLead
+          How long (ms) before expiring the onFlash call runs (0 for none).
+    """
+    def __init__(self,effectType,owner,startTime,duration,stack,slot,flashLead,onFlash,onExpire):
+        self.effectType = effectType
+        self._owner = weakref.ref(owner)
+        self.startTime = startTime
+        self.duration = duration
+        self.stack = stack
+        self.slot = slot
+        self.flashLead = flashLead
+        self.onFlash = onFlash
+        self.onExpire = onExpire
+        self.active = True
+        self._generation = 0
+
+    def getOwner(self):
+        return self._owner()
+
+    def getEndTime(self):
+        return self.startTime+self.duration
+
+    def getRemaining(self):
+        """ Returns ms remaining until this effect expires """
+        return max(0,self.getEndTime()-bs.getGameTime())
+
+    def __repr__(self):
+        return '<StatusEffect '+self.effectType+' ('+str(self.getRemaining())+'ms left)>'
+
+
+class StatusEffectManager(object):
+    """
+    Tracks timed effects for all owners in an activity.
+
+    Flash and expiry times for every effect live in one min-heap, driven by a
+    single game timer set for whatever is due next. Changing an effect just
+    pushes fresh entries; superseded ones are skipped when they come up.
+    Get the shared one with bsStatusEffect.getStatusEffectManager().
+    """
+    def __init__(self):
+        self._heap = []
+        self._effects = weakref.WeakKeyDictionary() # owner -> [StatusEffect,...]
+        self._counter = itertools.count()
+        self._timer = None
+        self._timerTime = None
+
+    def addEffect(self,owner,effectType,duration,stack='refresh',slot=None,flashLead=0,onFlash=None,onExpire=None):
+        """
+        Adds (or re-applies) an effect on 'owner' lasting 'duration' ms.
+        'onFlash' is called 'flashLead' ms before it ends and 'onExpire' when it ends.
+        Returns the StatusEffect.
+        """
+        now = bs.getGameTime()
+        effects = self._effects.setdefault(owner,[])
+        if slot is not None:
+            for e in [e for e in effects if e.slot == slot and e.effectType != effectType]:
+                self._deactivate(owner,e)
+        existing = None
+        if stack != 'independent':
+            for e in effects:
+                if e.effectType == effectType:
+                    existing = e
+                    break
+        if existing is None:
+            e = StatusEffect(effectType,owner,now,duration,stack,slot,flashLead,onFlash,onExpire)
+            effects.append(e)
+        else:
+            e = existing
+            if stack == 'extend':
+                e.duration = e.getEndTime()+duration-now
+                e.startTime = now
+            elif stack == 'max':
+                if now+duration > e.getEndTime():
+                    e.startTime = now
+                    e.duration = duration
+            else:
+                e.startTime = now
+                e.duration = duration
+            e.flashLead = flashLead
+            e.onFlash = onFlash
+            e.onExpire = onExpire
+        self._schedule(e,now)
+        return e
+
+    def removeEffect(self,owner,effectType,expire=False):
+        """
+        Removes all effects of the given type from 'owner'; if 'expire' is True
+        their onExpire calls are run as if they'd run out. Returns whether any were removed.
+        """
+        removed = [e for e in self._effects.get(owner,[]) if e.effectType == effectType]
+        for e in removed:
+            self._deactivate(owner,e)
+            if expire: self._run(e.onExpire,e)
+        return bool(removed)
+
+    def getEffects(self,owner):
+        """ Returns a list of the active StatusEffects on 'owner' """
+        return list(self._effects.get(owner,[]))
+
+    def hasEffect(self,owner,effectType):
+        return any(e.effectType == effectType for e in self._effects.get(owner,[]))
+
+    def _deactivate(self,owner,e):
+        e.active = False
+        effects = self._effects.get(owner)
+        if effects is not None:
+            if e in effects: effects.remove(e)
+            if not effects: del self._effects[owner]
+
+    def _schedule(self,e,now):
+        e._generation += 1
+        flashTime = e.getEndTime()-e.flashLead
+        if e.flashLead > 0 and e.onFlash is not None and flashTime > now:
+            heapq.heappush(self._heap,(flashTime,next(self._counter),e._generation,e,'flash'))
+        heapq.heappush(self._heap,(e.getEndTime(),next(self._counter),e._generation,e,'expire'))
+        self._updateTimer(now)
+
+    def _updateTimer(self,now):
+        # drop superseded entries off the top so we don't wake up for nothing
+        heap = self._heap
+        while heap and (not heap[0][3].active or heap[0][2] != heap[0][3]._generation): heapq.heappop(heap)
+        if not heap:
+            self._timer = None
+            self._timerTime = None
+        elif heap[0][0] != self._timerTime:
+            self._timerTime = heap[0][0]
+            self._timer = bs.Timer(max(1,self._timerTime-now),bs.WeakCall(self._process))
+
+    def _process(self):
+        now = bs.getGameTime()
+        self._timerTime = None
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            t,count,generation,e,phase = heapq.heappop(heap)
+            if not e.active or generation != e._generation: continue
+            if phase == 'flash': self._run(e.onFlash,e)
+            else:
+                owner = e.getOwner()
+                if owner is not None: self._deactivate(owner,e)
+                else: e.active = False
+                self._run(e.onExpire,e)
+        self._updateTimer(now)
+
+    def _run(self,call,e):
+        if call is None: return
+        try: call()
+        except Exception: bs.printException('error running status effect call for',e.effectType)
@@ -4,9 +4,13 @@ import bsUtils
 import random
 import weakref
 import copy
-import bsTutorial
+import time
+import bsImport
 import bsInternal
 
+# the tutorial isn't needed until it's shown (and never on servers)
+bsTutorial = bsImport.lazyImport('bsTutorial')
+
 # team info
 gTeamColors = ((0.1,0.25,1.0),
                (1.0,0.25,0.2))
@@ -123,40 +127,137 @@ class TeamGameResults(object):
         return [{'score':r[0],'teams':r[1]} for r in results]
 
 
-class ShuffleList(object):
-    """ shuffles a set of games with some smarts to avoid repeats in maps or game types """
-    def __init__(self,items,shuffle=True):
+class PlaylistScheduler(object):
+    """
+    Schedules games from a playlist, a whole shuffled cycle at a time.
+
+    Each cycle plays every entry once. When shuffling, cycles are arranged so the
+    same map is never repeated within 'mapGap' games and the same game type never
+    within 'typeGap' games (including across cycle boundaries), as far as the
+    playlist allows: gaps that can't possibly be satisfied by the entries present
+    are reduced to the largest that can. Cycles are built greedily and then repaired
+    by swapping entries around any remaining conflicts.
+
+    Passing a 'seed' makes the schedule reproducible; otherwise one is chosen at
+    random (see getSeed()) so a run can be replayed later.
+    """
+    def __init__(self,items,shuffle=True,seed=None,mapGap=1,typeGap=1):
         self.sourceList = items
         self.shuffle = shuffle
-        self.shuffleList = []
         self.lastGotten = None
+        self._seed = random.randrange(1<<30) if seed is None else seed
+        self._random = random.Random(self._seed)
+        self._upcoming = []
+        self._history = []
+        self._mapGap = self._getFeasibleGap(mapGap,self._getMap)
+        self._typeGap = self._getFeasibleGap(typeGap,self._getType)
+
+    @staticmethod
+    def _getMap(item):
+        return item['settings']['map']
+
+    @staticmethod
+    def _getType(item):
+        return item['type']
+
+    def _getFeasibleGap(self,gap,key):
+        counts = {}
+        for item in self.sourceList:
+            k = key(item)
+            counts[k] = counts.get(k,0)+1
+        n = len(self.sourceList)
+        maxCount = max(counts.values()) if counts else 0
+        if maxCount <= 1: return gap
+        # (maxCount-1) repeats each need 'gap' others between them
+        return max(0,min(gap,(n-maxCount)/(maxCount-1)))
+
+    def getSeed(self):
+        """ Returns the seed this schedule was built from """
+        return self._seed
 
     def pullNext(self):
-
-        # refill our list if its empty
-        if len(self.shuffleList) == 0:
-            self.shuffleList = list(self.sourceList)
-
-        # ok now find an index we should pull
-        index = 0
-
-        if self.shuffle:
-            for i in range(4):
-                index = random.randrange(0,len(self.shuffleList))
-                testObj = self.shuffleList[index]
-                # if the new one is the same map or game-type as the previous, lets try to keep looking..
-                if len(self.shuffleList) > 1 and self.lastGotten is not None:
-                    if testObj['settings']['map'] == self.lastGotten['settings']['map']:
-                        continue
-                    if testObj['type'] == self.lastGotten['type']:
-                        continue
-                # sufficiently different.. lets go with it
-                break
-
-        obj = self.shuffleList.pop(index)
+        """ Returns the next playlist entry, building a new cycle if need be """
+        if not self._upcoming: self._buildCycle()
+        obj = self._upcoming.pop(0)
+        self._history.append(obj)
+        del self._history[:-max(self._mapGap,self._typeGap,1)]
         self.lastGotten = obj
         return obj
 
+    def getUpcoming(self,count):
+        """ Returns (without consuming) the next 'count' entries that pullNext() will return """
+        while len(self._upcoming) < count and self.sourceList: self._buildCycle()
+        return list(self._upcoming[:count])
+
+    def _getConflicts(self,sequence,index):
+        """ returns how many constraints the entry at 'index' breaks against those before it """
+        item = sequence[index]
+        conflicts = 0
+        for key,gap in ((self._getMap,self._mapGap),(self._getType,self._typeGap)):
+            value = key(item)
+            for other in sequence[max(0,index-gap):index]:
+                if key(other) == value:
+                    conflicts += 1
+                    break
+        return conflicts
+
+    def _getTotalConflicts(self,sequence,start):
+        return sum(self._getConflicts(sequence,i) for i in range(start,len(sequence)))
+
+    def _getLocalConflicts(self,sequence,positions,start):
+        """ returns the conflicts of just the entries whose look-back window covers any of 'positions' """
+        reach = max(self._mapGap,self._typeGap)
+        affected = set()
+        for p in positions: affected.update(range(max(p,start),min(len(sequence),p+reach+1)))
+        return sum(self._getConflicts(sequence,k) for k in affected)
+
+    def _buildCycle(self):
+        items = list(self.sourceList)
+        if not self.shuffle:
+            self._upcoming += items
+            return
+        self._random.shuffle(items)
+
+        # whatever's already played or scheduled constrains the start of this cycle
+        prefix = (self._history+self._upcoming)[-max(self._mapGap,self._typeGap,1):]
+        start = len(prefix)
+        sequence = list(prefix)
+
+        # greedy: take the first remaining entry that fits, or failing that the one that fits best
+        while items:
+            best = bestConflicts = None
+            for i,item in enumerate(items):
+                sequence.append(item)
+                conflicts = self._getConflicts(sequence,len(sequence)-1)
+                sequence.pop()
+                if bestConflicts is None or conflicts < bestConflicts:
+                    best,bestConflicts = i,conflicts
+                    if conflicts == 0: break
+            sequence.append(items.pop(best))
+
+        # repair: swap conflicting entries with others wherever that lowers the total
+        # (a swap only changes conflicts within the gap window after either position)
+        total = self._getTotalConflicts(sequence,start)
+        for repairPass in range(3):
+            if total == 0: break
+            improved = False
+            for i in range(start,len(sequence)):
+                if self._getConflicts(sequence,i) == 0: continue
+                for j in range(start,len(sequence)):
+                    if i == j: continue
+                    before = self._getLocalConflicts(sequence,(i,j),start)
+                    sequence[i],sequence[j] = sequence[j],sequence[i]
+                    after = self._getLocalConflicts(sequence,(i,j),start)
+                    if after < before:
+                        total += after-before
+                        improved = True
+                        break
+                    sequence[i],sequence[j] = sequence[j],sequence[i]
+            if not improved: break
+        self._upcoming += sequence[start:]
+
+# old name, kept for mods that use it
+ShuffleList = PlaylistScheduler
 
 
 class TeamsScoreScreenActivity(bsGame.ScoreScreenActivity):
@@ -833,6 +934,14 @@ class TeamBaseSession(bs.Session):
     Free-for-all-mode is essentially just teams-mode with each bs.Player having
     their own bs.Team, so there is much overlap in functionality.
     """
+
+    # state for warming up the on-deck game during score screens
+    # (class-level defaults since some custom sessions skip our __init__)
+    _warmupTimer = None
+    _warmupStages = ()
+    _warmupRecord = None
+    _warmupHistory = None
+    _flipRecord = None
     
     def __init__(self):
 
@@ -876,6 +985,11 @@ class TeamBaseSession(bs.Session):
         except Exception: self._playlistName = '__default__'
         try: self._playlistRandomize = bs.getConfig()[self._playlistRandomizeVar]
         except Exception: self._playlistRandomize = False
+        # how many games must pass before a shuffled playlist repeats a map/game type
+        try: self._playlistMapGap = int(bs.getConfig()[self._playlistMapGapVar])
+        except Exception: self._playlistMapGap = 1
+        try: self._playlistTypeGap = int(bs.getConfig()[self._playlistTypeGapVar])
+        except Exception: self._playlistTypeGap = 1
 
         #self._roundEndSound = bs.getSound("boxingBell")
         #self._redWinsSound = bs.getSound('announceRedWins')
@@ -900,7 +1014,8 @@ class TeamBaseSession(bs.Session):
 
         if not playlistResolved: raise Exception("playlist contains no valid games")
         
-        self._playlist = ShuffleList(playlistResolved,shuffle=self._playlistRandomize)
+        self._playlist = PlaylistScheduler(playlistResolved,shuffle=self._playlistRandomize,
+                                           mapGap=self._playlistMapGap,typeGap=self._playlistTypeGap)
 
         # get a game on deck ready to go
         self._currentGameSpec = None
@@ -913,6 +1028,9 @@ class TeamBaseSession(bs.Session):
         # start in our custom join screen
         self.setActivity(bs.newActivity(TeamJoiningActivity))
 
+        # the first game warms up while folks are joining
+        self._startNextGameWarmup()
+
     def getNextGameDescription(self):
         'Returns a description of the next game on deck'
         # return self._nextGameSpec['resolvedType'].getConfigDescriptionLocalized(self._nextGameSpec)
@@ -938,7 +1056,71 @@ class TeamBaseSession(bs.Session):
             
 
     def _instantiateNextGame(self):
-        self._nextGameInstance = bs.newActivity(self._nextGameSpec['resolvedType'],self._nextGameSpec['settings'])
+        # playlist entries only import their game module once they're up next
+        gameType = bsUtils._prepareGameSpec(self._nextGameSpec,type(self))
+        self._nextGameInstance = bs.newActivity(gameType,self._nextGameSpec['settings'])
+
+    def _startNextGameWarmup(self):
+        """
+        Kicks off creation of the on-deck game's lazily-built state (factories,
+        player appearance media) in its own context, one stage per tick so the
+        score screen stays smooth. Whatever hasn't run by the time the game
+        starts simply gets created on demand as usual.
+        """
+        game = self._nextGameInstance
+        if game is None: return
+        self._warmupRecord = {'game':self._nextGameSpec['resolvedType'].getName(),'stages':{},'completed':False,
+                              'setActivityMS':None,'beginMS':None,'flipMS':None}
+        if self._warmupHistory is None: self._warmupHistory = []
+        self._warmupHistory.append(self._warmupRecord)
+        del self._warmupHistory[:-20]
+        self._warmupStages = [('bombFactory',bs.Bomb.getFactory),
+                              ('powerupFactory',bs.Powerup.getFactory),
+                              ('spazFactory',bs.Spaz.getFactory),
+                              ('appearances',self._warmPlayerAppearances)]
+        self._warmupTimer = bs.Timer(100,bs.WeakCall(self._runNextWarmupStage),repeat=True,timeType='real')
+
+    def _warmPlayerAppearances(self):
+        factory = bs.Spaz.getFactory()
+        for character in set(getattr(p,'character',None) for p in self.players):
+            if character is not None: factory._preload(character)
+
+    def _runNextWarmupStage(self):
+        if not self._warmupStages or self._nextGameInstance is None:
+            self._warmupTimer = None
+            return
+        name,call = self._warmupStages.pop(0)
+        startTime = time.time()
+        try:
+            with bs.Context(self._nextGameInstance): call()
+        except Exception: bs.printException('error warming up next game stage',name)
+        self._warmupRecord['stages'][name] = (time.time()-startTime)*1000.0
+        if not self._warmupStages:
+            self._warmupRecord['completed'] = True
+            self._warmupTimer = None
+
+    def _beginNextActivity(self):
+        bs.Session._beginNextActivity(self)
+        if self._flipRecord is None: return
+        gameRef,record = self._flipRecord
+        game = gameRef()
+        if game is None: self._flipRecord = None
+        elif game.hasBegun():
+            record['beginMS'] = game._beginMS
+            record['flipMS'] = record['setActivityMS']+game._beginMS
+            self._flipRecord = None
+
+    def getWarmupStats(self):
+        """
+        Returns a list of dicts describing recent on-deck game warm-ups, oldest first:
+        'game' (name), 'stages' (stage name -> milliseconds), 'completed' (whether
+        all stages ran before the game started), 'setActivityMS' (milliseconds spent
+        in setActivity() switching to the game), 'beginMS' (milliseconds spent adding
+        players and running its onBegin()) and 'flipMS' (the two combined: the
+        game-thread hitch the warm-up is meant to shrink). The latter two are None
+        until the game has begun.
+        """
+        return list(self._warmupHistory or [])
 
     def onPlayerRequest(self,player):
         return bs.Session.onPlayerRequest(self,player)
@@ -952,7 +1134,7 @@ class TeamBaseSession(bs.Session):
 
         # if we're leaving the tutorial activity, pop a transition activity to transition
         # us into a round gracefully (otherwise we'd snap from one terrain to another instantly)
-        elif isinstance(activity,bsTutorial.TutorialActivity):
+        elif bsImport.isLoaded(bsTutorial) and isinstance(activity,bsTutorial.TutorialActivity):
             self.setActivity(bs.newActivity(bsGame.TransitionActivity))
             
         # if we're in a between-round activity or a restart-activity, hop into a round
@@ -984,8 +1166,17 @@ class TeamBaseSession(bs.Session):
                     self.scoreSet.registerPlayer(p)
             self.scoreSet.setActivity(nextGame)
 
-            # now flip the current activity
+            # now flip the current activity (any warm-up left undone happens on demand from here)
+            self._warmupTimer = None
+            self._warmupStages = []
+            flipStartTime = time.time()
             self.setActivity(nextGame)
+            if self._warmupRecord is not None:
+                self._warmupRecord['setActivityMS'] = (time.time()-flipStartTime)*1000.0
+                # the rest of the work (players joining, onBegin()) happens once the
+                # old activity has transitioned out; _beginNextActivity() picks it up
+                self._flipRecord = (weakref.ref(nextGame),self._warmupRecord)
+                self._warmupRecord = None
 
         # if we're leaving a round, go to the score screen
         else:
@@ -1023,6 +1214,9 @@ class TeamBaseSession(bs.Session):
                     else:
                         self.setActivity(bs.newActivity(FreeForAllVictoryScoreScreenActivity,{'results':results}))
 
+            # use the score screen to get the next game warmed up
+            self._startNextGameWarmup()
+
     def announceGameResults(self,activity,results,delay,announceWinningTeam=True):
         """
         Show game results at the end of a game
@@ -1058,6 +1252,8 @@ class FreeForAllSession(TeamBaseSession):
     _useTeams = False
     _playlistSelectionVar = 'Free-for-All Playlist Selection'
     _playlistRandomizeVar = 'Free-for-All Playlist Randomize'
+    _playlistMapGapVar = 'Free-for-All Playlist Map Gap'
+    _playlistTypeGapVar = 'Free-for-All Playlist Game Type Gap'
     _playlistsVar = 'Free-for-All Playlists'
 
     def _getFFAPointAwards(self):
@@ -1087,6 +1283,8 @@ class TeamsSession(TeamBaseSession):
     _useTeams = True
     _playlistSelectionVar = 'Team Tournament Playlist Selection'
     _playlistRandomizeVar = 'Team Tournament Playlist Randomize'
+    _playlistMapGapVar = 'Team Tournament Playlist Map Gap'
+    _playlistTypeGapVar = 'Team Tournament Playlist Game Type Gap'
     _playlistsVar = 'Team Tournament Playlists'
 
     def __init__(self):
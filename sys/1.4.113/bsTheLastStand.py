@@ -161,11 +161,7 @@ class TheLastStandGame(bs.CoopGameActivity):
         
     def _updateScores(self):
 
-        # achievements in default only..
-        if self._preset == 'default':
-            if self._score >= 250: self._awardAchievement('Last Stand Master')
-            if self._score >= 500: self._awardAchievement('Last Stand Wizard')
-            if self._score >= 1000: self._awardAchievement('Last Stand God')
+        self._achievementEvent('score',self._score)
         self._scoreBoard.setTeamValue(self.teams[0],self._score,maxScore=None)
         
     def handleMessage(self,m):
@@ -0,0 +1,228 @@
+import bs
+import bsInternal
+import os
+import json
+import time
+import collections
+
+# transaction types that only ever need to reach the server once per run
+# (awarding the same achievement twice in a round, etc)
+_gOnceOnlyTypes = ('ACHIEVEMENT',)
+
+# transaction types that just fetch current info; only the latest
+# requester of one still waiting gets the result
+_gQueryTypes = ('PUBLIC_PARTY_QUERY',)
+
+_gTransactionQueue = None
+
+def getTransactionQueue():
+    """
+    Returns the shared TransactionQueue, creating it (and loading any
+    transactions persisted by a previous run) if need be.
+    """
+    global _gTransactionQueue
+    if _gTransactionQueue is None:
+        _gTransactionQueue = TransactionQueue()
+        _gTransactionQueue.load()
+    return _gTransactionQueue
+
+def addTransaction(transaction,callback=None):
+    """
+    Queues a transaction to be sent with the next batch.
+    See TransactionQueue.add().
+    """
+    getTransactionQueue().add(transaction,callback)
+
+def getTransactionQueueStats():
+    """
+    Returns a dict of transaction queue stats. See TransactionQueue.getStats().
+    """
+    return getTransactionQueue().getStats()
+
+def _persistTransactions():
+    if _gTransactionQueue is not None: _gTransactionQueue.persist()
+
+def _onAccountStateChanged():
+    # (signing in also picks up anything persisted by a previous run)
+    if _gTransactionQueue is not None or bsInternal._getAccountState() == 'SIGNED_IN':
+        getTransactionQueue().onAccountStateChanged()
+
+
+
+class _QueuedTransaction(object):
+    def __init__(self,transaction,key):
+        self.transaction = transaction
+        self.key = key
+        self.callbacks = []
+        self.queueTime = time.time()
+
+    def runCallbacks(self,result):
+        for call in self.callbacks:
+            try: call(result)
+            except Exception: bs.printException('error in transaction callback',call)
+
+
+class TransactionQueue(object):
+    """
+    Batches outgoing account transactions.
+
+    Transactions added here are held for up to 'flushInterval' milliseconds and
+    then handed to the account layer together, with a single run. Adding a
+    transaction identical to one still waiting is a no-op (aside from its callback
+    getting the shared result; for query types such as PUBLIC_PARTY_QUERY the new
+    callback replaces the old one), and once-only types such as achievements are
+    only ever sent once per run.
+
+    While we're not signed in, transactions simply wait (with no timer running);
+    they go out as soon as the account state changes to signed in. Anything
+    without a callback that is still waiting when the app is paused or shut down
+    is written to disk and re-queued the next time the game starts; that file is
+    only removed once its transactions have been sent.
+    """
+    def __init__(self,flushInterval=250,path=None):
+        self._flushInterval = flushInterval
+        self._path = path
+        self._pending = collections.OrderedDict() # key -> _QueuedTransaction
+        self._sentOnceKeys = set()
+        self._timer = None
+        self._dirty = False
+        self._onDisk = False
+        self._added = 0
+        self._deduped = 0
+        self._sent = 0
+        self._flushes = 0
+        self._maxDepth = 0
+        self._lastLatency = 0.0
+        self._totalLatency = 0.0
+        self._maxLatency = 0.0
+
+    def add(self,transaction,callback=None):
+        """
+        Queues a transaction dict (in the form accepted by bsInternal._addTransaction).
+        If a callback is given it is called with the transaction's result.
+        """
+        key = json.dumps(transaction,sort_keys=True)
+        self._added += 1
+        if key in self._sentOnceKeys:
+            self._deduped += 1
+            return
+        entry = self._pending.get(key)
+        if entry is not None: self._deduped += 1
+        else:
+            entry = self._pending[key] = _QueuedTransaction(transaction,key)
+            self._maxDepth = max(self._maxDepth,len(self._pending))
+            self._dirty = True
+        if callback is not None:
+            if transaction.get('type') in _gQueryTypes: entry.callbacks = [callback]
+            else: entry.callbacks.append(callback)
+        self._updateTimer()
+
+    def _updateTimer(self):
+        # we only need to tick while there's something to send and we're able to send it
+        if self._pending and bsInternal._getAccountState() == 'SIGNED_IN':
+            if self._timer is None:
+                # (ui context so the timer outlives whatever activity we were called from)
+                with bs.Context('UI'): self._timer = bs.Timer(self._flushInterval,bs.WeakCall(self._onTimer),repeat=True,timeType='real')
+        else: self._timer = None
+
+    def onAccountStateChanged(self):
+        """ sends anything that queued up while signed out; stops ticking when signed out """
+        self.flush()
+        self._updateTimer()
+
+    def getDepth(self):
+        return len(self._pending)
+
+    def getStats(self):
+        """
+        Returns a dict with 'depth' (transactions waiting), 'maxDepth', 'added',
+        'deduped', 'sent', 'flushes', and 'lastLatency'/'avgLatency'/'maxLatency':
+        seconds between a transaction being queued and it being sent.
+        """
+        return {'depth':len(self._pending),
+                'maxDepth':self._maxDepth,
+                'added':self._added,
+                'deduped':self._deduped,
+                'sent':self._sent,
+                'flushes':self._flushes,
+                'lastLatency':self._lastLatency,
+                'avgLatency':self._totalLatency/self._sent if self._sent > 0 else 0.0,
+                'maxLatency':self._maxLatency}
+
+    def _onTimer(self):
+        self.flush()
+        self._updateTimer()
+
+    def flush(self):
+        """ sends everything waiting (if we're signed in) """
+        if not self._pending or bsInternal._getAccountState() != 'SIGNED_IN': return
+        now = time.time()
+        entries = self._pending.values()
+        self._pending = collections.OrderedDict()
+        for entry in entries:
+            t = entry.transaction
+            if t.get('type') in _gOnceOnlyTypes: self._sentOnceKeys.add(entry.key)
+            if entry.callbacks: bsInternal._addTransaction(t,callback=bs.Call(entry.runCallbacks))
+            else: bsInternal._addTransaction(t)
+            latency = now-entry.queueTime
+            self._lastLatency = latency
+            self._totalLatency += latency
+            self._maxLatency = max(self._maxLatency,latency)
+        bsInternal._runTransactions()
+        self._sent += len(entries)
+        self._flushes += 1
+        self._dirty = True
+        # whatever was persisted has been handed off now; bring the file up to date
+        if self._onDisk: self.persist()
+
+    def _getPath(self):
+        if self._path is None:
+            self._path = os.path.join(os.path.dirname(bs.getEnvironment()['configFilePath']),'.bsTransactionQueue')
+        return self._path
+
+    def persist(self):
+        """
+        Writes waiting transactions to disk (those with callbacks are
+        skipped since there'd be nobody to call back next run).
+        """
+        if not self._dirty: return
+        path = self._getPath()
+        transactions = [e.transaction for e in self._pending.values() if not e.callbacks]
+        try:
+            if transactions:
+                tmpPath = path+'.tmp'
+                with open(tmpPath,'wb') as f: f.write(json.dumps(transactions))
+                if os.path.exists(path): os.remove(path)
+                os.rename(tmpPath,path)
+            elif os.path.exists(path): os.remove(path)
+            self._onDisk = bool(transactions)
+            self._dirty = False
+        except Exception,e:
+            print 'EXC persisting transaction queue \''+str(path)+'\':',e
+
+    def load(self):
+        """
+        Re-queues any transactions persisted by a previous run. The file stays
+        put until they've been sent (in case we go down again before then).
+        """
+        path = self._getPath()
+        if not os.path.exists(path): return
+        self._onDisk = True
+        try:
+            with open(path,'rb') as f: transactions = json.loads(f.read())
+        except Exception,e:
+            print 'EXC loading transaction queue \''+str(path)+'\':',e
+            # no use trying this one again
+            try: os.remove(path)
+            except Exception: pass
+            self._onDisk = False
+            return
+        now = time.time()
+        for t in transactions:
+            # don't bother with anything that's gone stale while we were away
+            if 'expireTime' in t and t['expireTime'] < now: continue
+            self.add(t)
+        # if it was all stale there's nothing to wait on
+        if not self._pending:
+            self._dirty = True
+            self.persist()
@@ -14,13 +14,13 @@ import weakref
 import bsServerData
 import threading
 import bsGame
+import bsPinger
+import bsTransactions
 
 uiGlobals = {'mainMenuWindow':None}
 
 gWindowStates = {}
 
-gPingErrorReported = False
-
 quitWindowID = None
 
 # we include this extra hash with shared input-mapping names
@@ -271,6 +271,108 @@ class Window(object):
     def getRootWidget(self):
         return self._rootWidget
 
+
+# windows living in their own modules; these get imported the first time they're opened.
+_gWindowRegistry = {} # name -> (moduleName,className)
+
+# windows players open most; prewarmWindows() loads these in the background after launch
+_gCommonWindows = ['StoreWindow','GatherWindow','PowerRankingWindow']
+
+class _LazyWindowClass(object):
+    """
+    Stands in (as bsUI.<name>) for a registered window class until its module
+    is loaded, so 'bsUI.StoreWindow(...)' and 'from bsUI import StoreWindow'
+    keep working. Calls and attribute lookups go to the real class, and
+    'class MyWindow(bsUI.StoreWindow)' loads it and subclasses that.
+    """
+    def __new__(cls,name,bases=None,dct=None):
+        if bases is None: return object.__new__(cls)
+        # python uses a base's type as the metaclass, so class statements deriving
+        # from a stand-in land here; build the class on the real bases instead
+        bases = tuple(getWindowClass(b._name) if isinstance(b,_LazyWindowClass) else b for b in bases)
+        return type(bases[0])(name,bases,dct)
+
+    def __init__(self,name):
+        self._name = name
+
+    def __repr__(self):
+        return '<lazy window class '+self._name+'>'
+
+    def __call__(self,*args,**keywds):
+        return getWindowClass(self._name)(*args,**keywds)
+
+    def __getattr__(self,attr):
+        if attr.startswith('__'): raise AttributeError(attr)
+        return getattr(getWindowClass(self._name),attr)
+
+    # nothing can be one of these until its module is loaded
+    def __instancecheck__(self,obj):
+        return isWindowLoaded(self._name) and isinstance(obj,getWindowClass(self._name))
+
+    def __subclasscheck__(self,cls):
+        return isWindowLoaded(self._name) and issubclass(cls,getWindowClass(self._name))
+
+def registerWindow(name,moduleName,className=None):
+    """
+    Registers a window class living in its own module, so it can be
+    fetched with getWindowClass() without importing the module up front.
+    Until then bsUI.<name> is a stand-in that loads it on use.
+    """
+    _gWindowRegistry[name] = (moduleName,name if className is None else className)
+    if name not in globals(): globals()[name] = _LazyWindowClass(name)
+
+def getWindowClass(name):
+    """
+    Returns a registered window class, importing its module if need be.
+    """
+    moduleName,className = _gWindowRegistry[name]
+    cls = getattr(__import__(moduleName),className)
+    # swap the real thing in for our stand-in
+    if isinstance(globals().get(name),_LazyWindowClass): globals()[name] = cls
+    return cls
+
+def isWindowLoaded(name):
+    """ Returns whether a registered window's module has been imported yet """
+    import sys
+    return _gWindowRegistry[name][0] in sys.modules
+
+def prewarmWindows(names=None):
+    """
+    Imports registered window modules (by default the commonly-opened ones)
+    on a background thread so the first open doesn't hitch.
+    """
+    pending = [n for n in (_gCommonWindows if names is None else names) if not isWindowLoaded(n)]
+    if not pending: return
+    def _warm():
+        bsInternal._setThreadName("BS_WindowPrewarmThread")
+        for name in pending:
+            try: getWindowClass(name)
+            except Exception,e: print 'EXC prewarming window',name+':',e
+    thread = threading.Thread(target=_warm)
+    thread.daemon = True
+    thread.start()
+
+registerWindow('StoreWindow','bsUIStore')
+registerWindow('GatherWindow','bsUIGather')
+registerWindow('PowerRankingWindow','bsUIPowerRanking')
+registerWindow('GamePadConfigWindow','bsUIGamePadConfig')
+registerWindow('ControllersWindow','bsUISettings')
+registerWindow('ConfigureWiiRemotesWindow','bsUISettings')
+registerWindow('ConfigGamePadWindow','bsUISettings')
+registerWindow('ConfigTouchscreenWindow','bsUISettings')
+registerWindow('ConfigKeyboardWindow','bsUISettings')
+registerWindow('ConfigAudioWindow','bsUISettings')
+registerWindow('GraphicsWindow','bsUISettings')
+registerWindow('AdvancedSettingsWindow','bsUISettings')
+registerWindow('DebugWindow','bsUISettings')
+registerWindow('SoundtracksWindow','bsUISoundtrack')
+registerWindow('EditSoundtrackWindow','bsUISoundtrack')
+registerWindow('GetSoundtrackEntryTypeWindow','bsUISoundtrack')
+registerWindow('FileSelectorWindow','bsUISoundtrack')
+registerWindow('HelpWindow','bsUIHelp')
+registerWindow('CreditsWindow','bsUIHelp')
+registerWindow('WatchWindow','bsUIWatch')
+
 class ContinueWindow(Window):
 
     # def __del__(self):
@@ -494,1010 +596,6 @@ class QuitWindow(Window):
         #bs.realTimer(300,bs.Call(bsInternal._fadeScreen,True))
 
         
-class DebugWindow(Window):
-
-    def __init__(self,transition='inRight'):
-        
-        self._width = width = 580
-        self._height = height = 350 if gSmallUI else 420 if gMedUI else 520
-
-        self._scrollWidth = self._width - 100
-        self._scrollHeight = self._height - 120
-
-        self._subWidth = self._scrollWidth*0.95;
-        self._subHeight = 520
-        
-        self._stressTestGameType = 'Random'
-        self._stressTestPlaylist = '__default__'
-        self._stressTestPlayerCount = 8
-        self._stressTestRoundDuration = 30
-
-        # bs.playSound(bs.getSound('gong'))
-
-        self._r = 'debugWindow'
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
-                                              scale=2.35 if gSmallUI else 1.55 if gMedUI else 1.0,
-                                              stackOffset=(0,-30) if gSmallUI else (0,0))
-        
-        self._doneButton = b = bs.buttonWidget(parent=self._rootWidget,position=(40,height-67),size=(120,60),scale=0.8,
-                                               autoSelect=True,label=bs.Lstr(resource='doneText'), onActivateCall=self._done)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-        t = bs.textWidget(parent=self._rootWidget,position=(0,height-60),size=(width,30),
-                          # text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          hAlign="center",color=gTitleColor,
-                          vAlign="center",maxWidth=260)
-
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,size=(self._scrollWidth,self._scrollHeight),
-                                             highlight=False, position=((self._width-self._scrollWidth)*0.5,50))
-        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True)
-        
-        self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),
-                                                background=False)
-        
-        v = self._subHeight - 70
-        buttonWidth = 300
-        # b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
-        #                     label=R.unlockCoopText,onActivateCall=self._unlockPressed)
-        # v -= 80
-        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
-                            autoSelect=True,
-                            # label=R.runCPUBenchmarkText,
-                            label=bs.Lstr(resource=self._r+'.runCPUBenchmarkText'),
-                            onActivateCall=self._runCPUBenchmarkPressed)
-        bs.widget(edit=b,upWidget=self._doneButton,leftWidget=self._doneButton)
-        v -= 60
-
-        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
-                            autoSelect=True,
-                            # label=R.runGPUBenchmarkText,
-                            label=bs.Lstr(resource=self._r+'.runGPUBenchmarkText'),
-                            onActivateCall=self._runGPUBenchmarkPressed)
-        v -= 60
-
-        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
-                            autoSelect=True,
-                            # label=R.runMediaReloadBenchmarkText,
-                            label=bs.Lstr(resource=self._r+'.runMediaReloadBenchmarkText'),
-                            onActivateCall=self._runMediaReloadBenchmarkPressed)
-        v -= 60
-        
-        t = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v+22),size=(0,0),
-                          # text=R.stressTestTitleText,
-                          text=bs.Lstr(resource=self._r+'.stressTestTitleText'),
-                          maxWidth=200,color=gHeadingColor,
-                          scale=0.85,hAlign="center",vAlign="center")
-        v -= 45
-
-        xOffs = 165
-        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v+22),size=(0,0),
-                          # text=R.stressTestPlaylistTypeText,
-                          text=bs.Lstr(resource=self._r+'.stressTestPlaylistTypeText'),
-                          maxWidth=130,color=gHeadingColor,
-                          scale=0.65,hAlign="right",vAlign="center")
-
-        PopupMenu(parent=self._subContainer,position=(xOffs,v),width=150,
-                  choices=['Random','Teams','Free-For-All'],
-                  choicesDisplay=[bs.Lstr(resource=a) for a in ['randomText','playModes.teamsText','playModes.freeForAllText']],
-                  currentChoice='Auto',onValueChangeCall=self._stressTestGameTypeSelected)
-        v -= 46
-        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v+22),size=(0,0),
-                          # text=R.stressTestPlaylistNameText,
-                          text=bs.Lstr(resource=self._r+'.stressTestPlaylistNameText'),
-                          maxWidth=130,color=gHeadingColor,
-                          scale=0.65,hAlign="right",vAlign="center")
-        self._stressTestPlaylistNameField = bs.textWidget(parent=self._subContainer,position=(xOffs+5,v-5),size=(250,46),
-                                                          text=self._stressTestPlaylist,hAlign="left",
-                                                          vAlign="center",
-                                                          autoSelect=True,
-                                                          color=(0.9,0.9,0.9,1.0),
-                                                          # description=R.stressTestPlaylistDescriptionText,
-                                                          description=bs.Lstr(resource=self._r+'.stressTestPlaylistDescriptionText'),
-                                                          editable=True,padding=4)
-        v -= 29
-        xSub = 60
-        
-        # player count
-        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v),size=(0,0),
-                          # text=R.stressTestPlayerCountText,
-                          text=bs.Lstr(resource=self._r+'.stressTestPlayerCountText'),
-                          color=(0.8,0.8,0.8,1.0),hAlign="right",vAlign="center",scale=0.65,
-                          maxWidth=130)
-        self._stressTestPlayerCountText = bs.textWidget(parent=self._subContainer,position=(246-xSub,v-14),
-                                                      size=(60,28),editable=False,
-                                                      color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
-                                                      text=str(self._stressTestPlayerCount),
-                          padding=2)
-        b = bs.buttonWidget(parent=self._subContainer,position=(330-xSub,v-11),size=(28,28),label="-",
-                            autoSelect=True,onActivateCall=bs.Call(self._stressTestPlayerCountDecrement),
-                            repeat=True,enableSound=True)
-        b = bs.buttonWidget(parent=self._subContainer,position=(380-xSub,v-11),size=(28,28),label="+",
-                            autoSelect=True,onActivateCall=bs.Call(self._stressTestPlayerCountIncrement),
-                            repeat=True,enableSound=True)
-
-
-        v -= 42
-
-        # round duration
-        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v),size=(0,0),
-                          # text=R.stressTestRoundDurationText,
-                          text=bs.Lstr(resource=self._r+'.stressTestRoundDurationText'),
-                          color=(0.8,0.8,0.8,1.0),hAlign="right",vAlign="center",scale=0.65,
-                          maxWidth=130)
-        self._stressTestRoundDurationText = bs.textWidget(parent=self._subContainer,position=(246-xSub,v-14),
-                                                      size=(60,28),editable=False,
-                                                          color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
-                                                          text=str(self._stressTestRoundDuration),
-                          padding=2)
-        b = bs.buttonWidget(parent=self._subContainer,position=(330-xSub,v-11),size=(28,28),label="-",
-                            autoSelect=True,onActivateCall=bs.Call(self._stressTestRoundDurationDecrement),
-                            repeat=True,enableSound=True)
-        b = bs.buttonWidget(parent=self._subContainer,position=(380-xSub,v-11),size=(28,28),label="+",
-                            autoSelect=True,onActivateCall=bs.Call(self._stressTestRoundDurationIncrement),
-                            repeat=True,enableSound=True)
-
-
-        v -= 82
-
-        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
-                            autoSelect=True,
-                            # label=R.runStressTestText,
-                            label=bs.Lstr(resource=self._r+'.runStressTestText'),
-                            onActivateCall=self._stressTestPressed)
-        bs.widget(b,showBufferBottom=50)
-
-    def _stressTestPlayerCountDecrement(self):
-        self._stressTestPlayerCount = max(1,self._stressTestPlayerCount - 1)
-        bs.textWidget(edit=self._stressTestPlayerCountText,text=str(self._stressTestPlayerCount))
-
-    def _stressTestPlayerCountIncrement(self):
-        self._stressTestPlayerCount = self._stressTestPlayerCount + 1
-        bs.textWidget(edit=self._stressTestPlayerCountText,text=str(self._stressTestPlayerCount))
-
-    def _stressTestRoundDurationDecrement(self):
-        self._stressTestRoundDuration = max(10,self._stressTestRoundDuration - 10)
-        bs.textWidget(edit=self._stressTestRoundDurationText,text=str(self._stressTestRoundDuration))
-
-    def _stressTestRoundDurationIncrement(self):
-        self._stressTestRoundDuration = self._stressTestRoundDuration + 10
-        bs.textWidget(edit=self._stressTestRoundDurationText,text=str(self._stressTestRoundDuration))
-
-
-    def _stressTestGameTypeSelected(self,gameType):
-        self._stressTestGameType = gameType
-
-    def _runCPUBenchmarkPressed(self):
-        bsUtils.runCPUBenchmark()
-
-    def _runGPUBenchmarkPressed(self):
-        bsUtils.runGPUBenchmark()
-
-    def _runMediaReloadBenchmarkPressed(self):
-        bsUtils.runMediaReloadBenchmark()
-        
-    # def _unlockPressed(self):
-    #     try:
-    #         import bsCoopGame
-    #         campaign = bsCoopGame.getCampaign('Default')
-    #         levels = campaign.getLevels()
-    #         for level in levels: campaign.completeLevel(level['name'])
-    #         bs.screenMessage("CO-OP LEVELS UNLOCKED!",color=(0,1,0))
-    #         bs.playSound(bs.getSound('gunCocking'))
-    #     except Exception:
-    #         bs.screenMessage("ERROR UNLOCKING CO-OP LEVELS",color=(1,0,0))
-
-    def _stressTestPressed(self):
-        bsUtils.runStressTest(playlistType=self._stressTestGameType,
-                              playlistName=bs.textWidget(query=self._stressTestPlaylistNameField),
-                              playerCount=self._stressTestPlayerCount,
-                              roundDuration=self._stressTestRoundDuration)
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-
-    def _done(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = AdvancedSettingsWindow(transition='inLeft').getRootWidget()
-
-
-class CreditsWindow(Window):
-    def __init__(self,originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Credits Window')
-        
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-            transition = 'inRight'
-        
-        width = 670
-        height = 398 if gSmallUI else 500
-
-        self._r = 'creditsWindow'
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=2.0 if gSmallUI else 1.3 if gMedUI else 1.0,
-                                              stackOffset=(0,-8) if gSmallUI else (0,0))
-
-        if gToolbars and gSmallUI:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
-        else:
-            b = bs.buttonWidget(parent=self._rootWidget,position=(40,height-(68 if gSmallUI else 62)),size=(140,60),scale=0.8,
-                                label=bs.Lstr(resource='backText'),buttonType='back', onActivateCall=self._back,autoSelect=True)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-            if gDoAndroidNav:
-                bs.buttonWidget(edit=b,buttonType='backSmall',position=(40,height-(68 if gSmallUI else 62)+5),size=(60,48),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(110,height-(59 if gSmallUI else 54)))
-
-            
-        t = bs.textWidget(parent=self._rootWidget,position=(0,height-(59 if gSmallUI else 54)),size=(width,30),
-                          text=bs.Lstr(resource=self._r+'.titleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
-                          hAlign="center",
-                          color=gTitleColor,
-                          maxWidth=330,vAlign="center")
-
-        
-        s = bs.scrollWidget(parent=self._rootWidget,position=(40,35),size=(width-80,height-100),captureArrows=True)
-
-        if gToolbars:
-            bs.widget(edit=s,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if gSmallUI:
-                bs.widget(edit=s,leftWidget=bsInternal._getSpecialWidget('backButton'))
-                
-            
-        def _formatNames(names,inset):
-            s = ''
-            spaceWidth = bsInternal._getStringWidth(' '*10,suppressWarning=True)/10.0 # measure a series since theres overlaps and stuff..
-            spacing = 330
-            c1 = inset
-            c2 = c1+spacing
-            c3 = c2+spacing
-            #c4 = c3+spacing
-            lineWidth = 0
-            line = ''
-            for name in names:
-                # move to the next column (or row) and print
-                if lineWidth > c3:
-                    s += line+'\n'
-                    line = ''
-                    lineWidth = 0
-
-                #if lineWidth > c3: target = c4
-                if lineWidth > c2: target = c3
-                elif lineWidth > c1: target = c2
-                else: target = c1
-                #print 'ADDING',(target-width)/spaceWidth,'TO GET TO',target
-                spacing = ' '*int((target-lineWidth)/spaceWidth)
-                line += spacing
-                line += name.decode('utf-8')
-                lineWidth = bsInternal._getStringWidth(line,suppressWarning=True)
-            if line != '': s += line+'\n'
-            return s
-
-        soundAndMusic = bs.Lstr(resource=self._r+'.songCreditText').evaluate()
-        soundAndMusic = soundAndMusic.replace('${TITLE}',"'William Tell (Trumpet Entry)'")
-        soundAndMusic = soundAndMusic.replace('${PERFORMER}','The Apollo Symphony Orchestra')
-        soundAndMusic = soundAndMusic.replace('${PERFORMER}','The Apollo Symphony Orchestra')
-        soundAndMusic = soundAndMusic.replace('${COMPOSER}','Gioacchino Rossini')
-        soundAndMusic = soundAndMusic.replace('${ARRANGER}','Chris Worth')
-        soundAndMusic = soundAndMusic.replace('${PUBLISHER}','BMI')
-        soundAndMusic = soundAndMusic.replace('${SOURCE}','www.AudioSparx.com')
-        spc = '     '
-        soundAndMusic = spc+soundAndMusic.replace('\n','\n'+spc)
-        # soundAndMusic = ("     'William Tell (Trumpet Entry)' Performed by The Apollo Symphony Orchestra\n"
-        #                  "     Composed by Gioacchino Rossini, Arranged by Chris Worth, Published by BMI,\n"
-        #                  "     courtesy of www.AudioSparx.com")
-        names = ['HubOfTheUniverseProd', 'Jovica', 'LG', 'Leady', 'Percy Duke', 'PhreaKsAccount',
-                                       'Pogotron', 'Rock Savage', 'anamorphosis', 'benboncan', 'cdrk', 'chipfork',
-                                       'guitarguy1985', 'jascha', 'joedeshon', 'loofa', 'm_O_m', 'mich3d', 'sandyrb',
-                                       'shakaharu', 'sirplus', 'stickman', 'thanvannispen', 'virotic', 'zimbot']
-        names.sort(key=lambda x:x.lower())
-
-        freesoundNames = _formatNames(names,90)
-
-        translationNames = _formatNames(bsServerData.translationContributors,60)
-        # eww - need to chop this up since we're passing our 65535 vertex limit for meshes..
-        # ..should add support for 32 bit indices i suppose...
-        creditsText1 = ('  '+bs.Lstr(resource=self._r+'.codingGraphicsAudioText').evaluate().replace('${NAME}','Eric Froemling')+'\n'
-                       '\n'
-                       '  '+bs.Lstr(resource=self._r+'.additionalAudioArtIdeasText').evaluate().replace('${NAME}','Raphael Suter')+'\n'
-                       '\n'
-                       '  '+bs.Lstr(resource=self._r+'.soundAndMusicText').evaluate()+'\n'
-                       '\n'
-                       +soundAndMusic+'\n'
-                       '\n'
-                       '     '+bs.Lstr(resource=self._r+'.publicDomainMusicViaText').evaluate().replace('${NAME}','Musopen.com')+'\n'
-                       '        '+bs.Lstr(resource=self._r+'.thanksEspeciallyToText').evaluate().replace('${NAME}','the US Army, Navy, and Marine Bands')+'\n'
-                       '\n'
-                       '     '+bs.Lstr(resource=self._r+'.additionalMusicFromText').evaluate().replace('${NAME}','The YouTube Audio Library')+'\n'
-                       '\n'
-                       '     '+bs.Lstr(resource=self._r+'.soundsText').evaluate().replace('${SOURCE}','Freesound.org')+'\n'
-                       '\n'
-                       +freesoundNames+'\n'
-                       '\n'
-                        '  '+bs.Lstr(resource=self._r+'.languageTranslationsText').evaluate()+'\n'
-                        '\n'
-                        +'\n'.join(translationNames.splitlines()[:40]))
-        
-        creditsText2 = ('\n'.join(translationNames.splitlines()[40:])+'\n'
-                        '\n'
-                       '  DISCLAIMER:\n\n'
-                        '     The Tournaments are disabled.\n'
-                        '     What did you expect?\n'
-                       '\n'
-                       '  Holiday theme vector art by designed by Freepik\n'
-                       '\n'
-                       '  '+bs.Lstr(resource=self._r+'.specialThanksText').evaluate()+'\n'
-                       '\n'
-                       '     Todd, Laura, and Robert Froemling\n'
-                       '     '+bs.Lstr(resource=self._r+'.allMyFamilyText').evaluate().replace('\n','\n     ')+'\n'
-                       '     '+bs.Lstr(resource=self._r+'.whoeverInventedCoffeeText').evaluate()+'\n'
-                       '\n'
-                       '  '+bs.Lstr(resource=self._r+'.legalText').evaluate()+'\n'
-                       '\n'
-                       '     '+bs.Lstr(resource=self._r+'.softwareBasedOnText').evaluate().replace('${NAME}','the Khronos Group')+'\n'
-                       '\n'
-                       '                                                             www.froemling.net\n')
-
-        # creditsText = (translationNames.split('ZpeedTube')[1]+'\n'
-        #                '\n'
-        # print 'CT IS',repr(creditsText)
-                       
-        # print 'PUT THIS BACK TOGETHER'
-
-
-        txt = creditsText1
-        txt2 = creditsText2
-        #txt = txt.replace("${SOUND_AND_MUSIC}",soundAndMusic)
-        #txt = txt.replace("${FREESOUND_NAMES}",freesoundNames)
-        #txt = txt.replace("${TRANSLATION_NAMES}",translationNames)
-        #txt = txt.replace("${LEGAL_STUFF}","     This software is based in part on the work of the Khronos Group.")
-
-        scale = 0.55
-        self._subWidth = width-80
-        self._subHeight = (bsInternal._getStringHeight(txt,suppressWarning=True)+bsInternal._getStringHeight(txt2,suppressWarning=True))*scale + 40
-        c = self._subContainer = bs.containerWidget(parent=s,size=(self._subWidth,self._subHeight),background=False,claimsLeftRight=False,claimsTab=False)
-
-        t = bs.textWidget(parent=c,
-                          padding=4,
-                          color=(0.7,0.9,0.7,1.0),
-                          scale=scale,
-                          flatness=1.0,
-                          size=(0,0),
-                          position=(0,self._subHeight-20),
-                          hAlign='left',
-                          vAlign='top',
-                          text=txt
-                          )
-        t = bs.textWidget(parent=c,
-                          padding=4,
-                          color=(0.7,0.9,0.7,1.0),
-                          scale=scale,
-                          flatness=1.0,
-                          size=(0,0),
-                          position=(0,self._subHeight-bsInternal._getStringHeight(txt,suppressWarning=True)*scale - 25),
-                          hAlign='left',
-                          vAlign='top',
-                          text=txt2
-                          )
-
-    def _back(self):
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
-
-
-class HelpWindow(Window):
-
-    def __init__(self,mainMenu=False,originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Help Window')
-        
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-            transition = 'inRight'
-
-        self._r = 'helpWindow'
-        
-        self._mainMenu = mainMenu
-        width = 750
-        height = 460 if gSmallUI else 530 if gMedUI else 600
-
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = False
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=1.77 if gSmallUI else 1.25 if gMedUI else 1.0,
-                                              stackOffset=(0,-30) if gSmallUI else (0,15) if gMedUI else (0,0))
-
-        t = bs.textWidget(parent=self._rootWidget,position=(0,height-(54 if gSmallUI else 45)),size=(width,25),
-                          text=bs.Lstr(resource=self._r+'.titleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),color=gTitleColor,
-                          hAlign="center",vAlign="top")
-
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(44,55 if gSmallUI else 55),simpleCullingV=100.0,
-                                             size=(width-88,height-120+(5 if gSmallUI else 0)),captureArrows=True)
-
-        if gToolbars:
-            bs.widget(edit=self._scrollWidget,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-        bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
-
-        # ugly: create this last so it gets first dibs at touch events (since we have it close to the scroll widget)
-        if gSmallUI and gToolbars:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._close)
-            bs.widget(edit=self._scrollWidget,leftWidget=bsInternal._getSpecialWidget('backButton'))
-        else:
-            b = bs.buttonWidget(parent=self._rootWidget,
-                                position=(40+0 if gSmallUI else 70,height-(59 if gSmallUI else 50)),size=(140,60),scale=0.7 if gSmallUI else 0.8,
-                                label=bs.Lstr(resource='backText') if self._mainMenu else "Close",buttonType='back' if self._mainMenu else None,
-                                extraTouchBorderScale=2.0,autoSelect=True,
-                                onActivateCall=self._close)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-            if self._mainMenu and gDoAndroidNav:
-                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,55),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(10+(90 if gSmallUI else 120),height - (52 if gSmallUI else 39)))
-
-        
-        interfaceType = bs.getEnvironment()['interfaceType']
-
-        self._subWidth = 660
-        #How To Play scroll size
-        self._subHeight = 2175 + bsUtils._getResource(self._r+'.someDaysExtraSpace') + bsUtils._getResource(self._r+'.orPunchingSomethingExtraSpace')
-        
-        c = self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),background=False,claimsLeftRight=False,claimsTab=False)
-
-        spacing = 1.0
-
-        h = self._subWidth*0.5
-        v = self._subHeight-55
-
-        logoTex = bs.getTexture('logo')
-        iconBuffer = 1.1
-
-        header = (0.7,1.0,0.7,1.0)
-        header2 = (0.8,0.8,1.0,1.0)
-        paragraph = (0.8,0.8,1.0,1.0)
-
-        txt = bs.Lstr(resource=self._r+'.welcomeText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
-        txtScale = 1.4
-        txtMaxWidth = 480
-        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,resScale=1.5,
-                          text=txt,hAlign="center",color=header,vAlign="center",maxWidth=txtMaxWidth)
-        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
-        
-        iconSize = 70
-        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
-
-        forceTest = False
-        # forceTest = True
-        # print 'FORCING TEST'
-        env = bs.getEnvironment()
-        if (env['platform'] == 'android' and env['subplatform'] == 'alibaba') or forceTest:
-            v -= 120.0
-            txt = ('\xe8\xbf\x99\xe6\x98\xaf\xe4\xb8\x80\xe4\xb8\xaa\xe5\x8f\xaf\xe4\xbb\xa5\xe5\x92\x8c\xe5\xae\xb6\xe4\xba\xba\xe6\x9c\x8b\xe5\x8f\x8b\xe4\xb8\x80\xe8\xb5\xb7\xe7\x8e\xa9\xe7\x9a\x84\xe6\xb8\xb8\xe6\x88\x8f,\xe5\x90\x8c\xe6\x97\xb6\xe6\x94\xaf\xe6\x8c\x81\xe8\x81\x94 \xe2\x80\xa8\xe7\xbd\x91\xe5\xaf\xb9\xe6\x88\x98\xe3\x80\x82\n'
-                   '\xe5\xa6\x82\xe6\xb2\xa1\xe6\x9c\x89\xe6\xb8\xb8\xe6\x88\x8f\xe6\x89\x8b\xe6\x9f\x84,\xe5\x8f\xaf\xe4\xbb\xa5\xe4\xbd\xbf\xe7\x94\xa8\xe7\xa7\xbb\xe5\x8a\xa8\xe8\xae\xbe\xe5\xa4\x87\xe6\x89\xab\xe7\xa0\x81\xe4\xb8\x8b\xe8\xbd\xbd\xe2\x80\x9c\xe9\x98\xbf\xe9\x87\x8c\xc2\xa0TV\xc2\xa0\xe5\x8a\xa9\xe6\x89\x8b\xe2\x80\x9d\xe7\x94\xa8 \xe6\x9d\xa5\xe4\xbb\xa3\xe6\x9b\xbf\xe5\xa4\x96\xe8\xae\xbe\xe3\x80\x82\n'
-                   '\xe6\x9c\x80\xe5\xa4\x9a\xe6\x94\xaf\xe6\x8c\x81\xe6\x8e\xa5\xe5\x85\xa5\xc2\xa08\xc2\xa0\xe4\xb8\xaa\xe5\xa4\x96\xe8\xae\xbe')
-            bs.textWidget(parent=c, size=(0,0), hAlign='center', vAlign='center', maxWidth = self._subWidth * 0.9,
-                          position=(self._subWidth*0.5, v-180), text=txt)
-            bs.imageWidget(parent=c, position=(self._subWidth - 320, v-120), size=(200, 200),
-                           texture=bs.getTexture('aliControllerQR'))
-            bs.imageWidget(parent=c, position=(90, v-130), size=(210, 210),
-                           texture=bs.getTexture('multiplayerExamples'))
-            v -= 120.0
-
-        else:
-            v -= spacing * 50.0
-            txtScale = 0.66
-            txt = bs.Lstr(resource=self._r+'.someDaysText').evaluate()
-            t = bs.textWidget(parent=c, position=(h,v), size=(0,0), scale=1.2, maxWidth=self._subWidth*0.9,
-                              text=txt, hAlign="center", color=paragraph, vAlign="center", flatness=1.0)
-            v -= (spacing * 25.0 + bsUtils._getResource(self._r+'.someDaysExtraSpace'))
-            txtScale = 0.66
-            txt = bs.Lstr(resource=self._r+'.orPunchingSomethingText').evaluate()
-            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
-                              text=txt,hAlign="center",color=paragraph,vAlign="center",flatness=1.0)
-            v -= (spacing * 27.0 + bsUtils._getResource(self._r+'.orPunchingSomethingExtraSpace'))
-            txtScale = 1.0
-            txt = bs.Lstr(resource=self._r+'.canHelpText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
-            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=1.0,
-                              text=txt,hAlign="center",color=paragraph,vAlign="center")
-
-            v -= spacing * 70.0
-            txtScale = 1.0
-            txt = bs.Lstr(resource=self._r+'.toGetTheMostText').evaluate()
-            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
-                              text=txt,hAlign="center",color=header,vAlign="center",flatness=1.0)
-
-            v -= spacing * 40.0
-            txtScale = 0.74
-            txt = bs.Lstr(resource=self._r+'.friendsText').evaluate()
-            h2 = h - 220
-            t = bs.textWidget(parent=c,position=(h2,v),size=(0,0),scale=txtScale,maxWidth=100,
-                              text=txt,hAlign="right",color=header,vAlign="center",flatness=1.0)
-
-            txt = bs.Lstr(resource=self._r+'.friendsGoodText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
-            txtScale = 0.7
-            t = bs.textWidget(parent=c,position=(h2+10,v+8),size=(0,0),scale=txtScale,maxWidth=500,
-                              text=txt,hAlign="left",color=paragraph,flatness=1.0)
-
-            env = bs.getEnvironment()
-
-            v -= spacing * 45.0
-            txt = bs.Lstr(resource=self._r+'.devicesText').evaluate() if (env['vrMode']) else bs.Lstr(resource=self._r+'.controllersText').evaluate()
-            txtScale = 0.74
-            h2 = h - 220
-            t = bs.textWidget(parent=c,position=(h2,v),size=(0,0),scale=txtScale,maxWidth=100,
-                              text=txt,hAlign="right",color=header,vAlign="center",flatness=1.0)
-
-            txtScale = 0.7
-            if not env['vrMode']: txt = bs.Lstr(resource=self._r+'.controllersInfoText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText')),('${REMOTE_APP_NAME}',bsUtils._getRemoteAppName())]).evaluate()
-            else: txt = bs.Lstr(resource=self._r+'.devicesInfoText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
-
-            t = bs.textWidget(parent=c,position=(h2+10,v+8),size=(0,0),scale=txtScale,
-                              maxWidth=500,maxHeight=105,
-                              text=txt,hAlign="left",color=paragraph,flatness=1.0)
-
-        v -= spacing * 150.0
-
-        txt = bs.Lstr(resource=self._r+'.controlsText').evaluate()
-        txtScale = 1.4
-        txtMaxWidth = 480
-        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,
-                          text=txt,hAlign="center",color=header,vAlign="center",resScale=1.5,
-                          maxWidth=txtMaxWidth)
-        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
-        iconSize = 70
-
-
-        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
-        v -= spacing * 45.0
-        txtScale = 0.7
-        txt = bs.Lstr(resource=self._r+'.controlsSubtitleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
-        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
-                          flatness=1.0,text=txt,hAlign="center",color=paragraph,vAlign="center")
-        v -= spacing * 160.0
-
-        sep = 70
-        iconSize = 100
-        iconSize2 = 30
-        icon2Offs = 55
-        icon2Offs2 = 40
-
-        # to determine whether to show ouya buttons here lets look for actual OUYA hardware
-        # (we could be an ouya build running on other hardware)
-        ouya = bsInternal._isRunningOnOuya();
-        
-        h2 = h - sep
-        v2 = v
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
-                           texture=bs.getTexture('buttonPunch'),color=(0.2,0.6,1) if ouya else (1,0.7,0.3))
-        txtScale = bsUtils._getResource(self._r+'.punchInfoTextScale')
-        txt = bs.Lstr(resource=self._r+'.punchInfoText').evaluate()
-        t = bs.textWidget(parent=c,position=(h-sep-185+70,v+120),size=(0,0),scale=txtScale,flatness=1.0,
-                          text=txt,hAlign="center",color=(0.3,0.65,1,1) if ouya else (1,0.7,0.3,1.0),vAlign="top")
-        if ouya:
-            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h-sep-185+70-66,v+107),
-                           texture=bs.getTexture('ouyaUButton'))
-        h2 = h + sep
-        v2 = v
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
-                           texture=bs.getTexture('buttonBomb'),color=(1,0.3,0.3))
-        txt = bs.Lstr(resource=self._r+'.bombInfoText').evaluate()
-        txtScale = bsUtils._getResource(self._r+'.bombInfoTextScale')
-        t = bs.textWidget(parent=c,position=(h+sep+50+60,v-35),size=(0,0),scale=txtScale,flatness=1.0,maxWidth=270,
-                          text=txt,hAlign="center",color=(1,0.3,0.3,1.0),vAlign="top")
-        if ouya:
-            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h+sep+50-5,v-48),
-                           texture=bs.getTexture('ouyaAButton'))
-        h2 = h
-        v2 = v + sep
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
-                           texture=bs.getTexture('buttonPickUp'),color=(1,0.8,0.3) if ouya else (0.5,0.5,1))
-        txt = bs.Lstr(resource=self._r+'.pickUpInfoText')
-        txtScale = bsUtils._getResource(self._r+'.pickUpInfoTextScale')
-        t = bs.textWidget(parent=c,position=(h+60+120,v+sep+50),size=(0,0),scale=txtScale,flatness=1.0,
-                          text=txt,hAlign="center",color=(1,0.8,0.3,1) if ouya else (0.5,0.5,1,1.0),vAlign="top")
-        if ouya:
-            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h+60+48,v+sep+38),
-                           texture=bs.getTexture('ouyaYButton'))
-        h2 = h
-        v2 = v - sep
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
-                           texture=bs.getTexture('buttonJump'),color=(0.4,1,0.4))
-        txt = bs.Lstr(resource=self._r+'.jumpInfoText').evaluate()
-        txtScale = bsUtils._getResource(self._r+'.jumpInfoTextScale')
-        t = bs.textWidget(parent=c,position=(h-250+75,v-sep-15+30),size=(0,0),scale=txtScale,flatness=1.0,
-                          text=txt,hAlign="center",color=(0.4,1,0.4,1.0),vAlign="top")
-        if ouya:
-            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h-250+13,v-sep+3),
-                           texture=bs.getTexture('ouyaOButton'))
-
-        txt = bs.Lstr(resource=self._r+'.runInfoText').evaluate()
-        txtScale = bsUtils._getResource(self._r+'.runInfoTextScale')
-        t = bs.textWidget(parent=c,position=(h,v-sep-100),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.93,
-                          flatness=1.0,text=txt,hAlign="center",color=(0.7,0.7,1.0,1.0),vAlign="center")
-
-        v -= spacing * 280.0
-
-
-        txt = bs.Lstr(resource=self._r+'.powerupsText').evaluate()
-        #txtScale = R.powerupsTextScale
-        txtScale = 1.4
-        txtMaxWidth = 480
-        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,
-                          text=txt,hAlign="center",color=header,vAlign="center",maxWidth=txtMaxWidth)
-        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
-        iconSize = 70
-        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
-        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
-
-        v -= spacing * 50.0
-        txtScale = bsUtils._getResource(self._r+'.powerupsSubtitleTextScale')
-        txt = bs.Lstr(resource=self._r+'.powerupsSubtitleText').evaluate()
-        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
-                          text=txt,hAlign="center",color=paragraph,vAlign="center",flatness=1.0)
-
-        v -= spacing * 1.0
-
-        m1 = -270
-        m2 = -215
-        m3 = 0
-        iconSize = 50
-        shadowSize = 80
-        shadowOffsX = 3
-        shadowOffsY = -4
-        tBig = 1.1
-        tSmall = 0.65
-
-        shadowTex = bs.getTexture('shadowSharp')
-
-        for tex in ['powerupPunch',
-                    'powerupShield',
-                    'powerupSpeed',
-                    'powerupHijump',
-                    'powerupBomb',
-                    'powerupBlast',
-                    'powerupHealth',
-                    'powerupOverdrive',
-                    'powerupIceBombs',
-                    'powerupImpactBombs',
-                    'powerupCombatBombs',
-                    'powerupStickyBombs',
-                    # jasonhu5
-                    'powerupOverPower',
-                    # 
-                    'powerupDynamitePack',
-                    'powerupRangerBombs',
-                    'powerupKnockerBombs',
-                    'powerupGrenade',
-                    'powerupHealBombs',
-                    'powerupLandMines',
-                    'powerupCurse']:
-            name = bs.Lstr(resource=self._r+'.'+tex+'NameText')
-            desc = bs.Lstr(resource=self._r+'.'+tex+'DescriptionText')
-            
-            v -= spacing * 60.0
-
-            i = bs.imageWidget(parent=c,size=(shadowSize,shadowSize),position=(h+m1+shadowOffsX-0.5*shadowSize,v+shadowOffsY-0.5*shadowSize),
-                               texture=shadowTex,color=(0,0,0),opacity=0.5)
-            i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h+m1-0.5*iconSize,v-0.5*iconSize),
-                               texture=bs.getTexture(tex))
-
-            txtScale = tBig
-            txt = name
-            t = bs.textWidget(parent=c,position=(h+m2,v+3),size=(0,0),scale=txtScale,maxWidth=200,flatness=1.0,
-                              text=txt,hAlign="left",color=header2,vAlign="center")
-            txtScale = tSmall
-            txt = desc
-            t = bs.textWidget(parent=c,position=(h+m3,v),size=(0,0),scale=txtScale,maxWidth=300,flatness=1.0,
-                              text=txt,hAlign="left",color=paragraph,vAlign="center",resScale=0.5)
-
-    def _close(self):
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        if self._mainMenu:
-            uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = True
-
-
-class ControllersWindow(Window):
-
-    def __init__(self,transition='inRight',originWidget=None):
-        
-        self._haveSelectedChild = False
-
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-
-        self._r = 'configControllersWindow'
-
-        env = bs.getEnvironment()
-        
-        ua = env['userAgentString']
-        interfaceType = env['interfaceType']
-        #isOuya = bsInternal._isOuyaBuild()
-        isOuya = bsInternal._isRunningOnOuya()
-        isFantasia = bsInternal._isRunningOnFireTV()
-
-        spacing = 50
-        buttonWidth = 350
-
-        width = 460
-        height = 135
-
-        spaceHeight = spacing*0.3
-
-        showGamepads = False
-        platform = env['platform']
-        subplatform = env['subplatform']
-        if platform == 'linux' or (platform == 'windows' and (subplatform != 'oculus' or env['vrMode'] == False)) or platform == 'android' or platform == 'mac':
-            showGamepads = True
-            height += spacing
-
-        showTouch = False
-        if bsInternal._haveTouchScreenInput():
-            showTouch = True
-            height += spacing
-
-        showSpace1 = False
-        if showGamepads or showTouch:
-            showSpace1 = True
-            height += spaceHeight
-
-        showKeyboards = False
-        if interfaceType == 'large':
-            showKeyboards = True
-            height += spacing*2
-
-        showSpace2 = False
-        if showKeyboards:
-            showSpace2 = True
-            height += spaceHeight
-
-        showRemote = False
-        if True:
-            showRemote = True
-            height += spacing
-
-        showPS3 = False
-        if 'Mac' in ua or isOuya:
-            showPS3 = True
-            height += spacing
-
-        show360 = False
-        if 'Mac' in ua or isOuya or isFantasia:
-            show360 = True
-            height += spacing
-
-        showMacWiimote = False
-        if 'Mac' in ua:
-            showMacWiimote = True
-            height += spacing
-
-        # show option to disable xinput on windows (aside from rift vr mode)
-        showXInputToggle = False
-        if platform == 'windows' and (subplatform != 'oculus' or env['vrMode'] == False):
-            showXInputToggle = True
-
-        if showXInputToggle:
-            height += spacing
-            
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,scaleOriginStackOffset=scaleOrigin,
-                                              scale=2.2 if gSmallUI else 1.5 if gMedUI else 1.0)
-        self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-60),size=(140,65),scale=0.8,textScale=1.2,autoSelect=True,
-                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-        # need these vars to exist even if the buttons dont
-        self._gamePadsButton = self._touchButton = self._keyboardButton = self._keyboard2Button = self._iDevicesButton = self._ps3Button = self._xbox360Button = self._wiimotesButton = -1
-
-        t = bs.textWidget(parent=self._rootWidget,position=(0,height-49),size=(width,25),
-                          # text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,
-                          hAlign="center",vAlign="top")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(100,height-48))
-        
-        v = height - 75
-        v -= spacing
-
-        
-        if showTouch:
-            self._touchButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2,v),size=(buttonWidth,43),autoSelect=True,
-                                                    # label=R.configureTouchText,
-                                                    label=bs.Lstr(resource=self._r+'.configureTouchText'),
-                                                    onActivateCall=self._doTouchscreen)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._touchButton)
-                bs.widget(edit=self._backButton,downWidget=self._touchButton)
-                self._haveSelectedChild = True
-            v -= spacing
-
-        if showGamepads:
-            self._gamePadsButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-7,v),size=(buttonWidth,43),autoSelect=True,
-                                                       # label=R.configureControllersText,
-                                                       label=bs.Lstr(resource=self._r+'.configureControllersText'),
-                                                       onActivateCall=self._doGamepads)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._gamePadsButton)
-                bs.widget(edit=self._backButton,downWidget=self._gamePadsButton)
-                self._haveSelectedChild = True
-            v -= spacing
-        else: self._gamePadsButton = None
-
-        if showSpace1: v -= spaceHeight
-
-        if showKeyboards:
-            self._keyboardButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
-                                                       # label=R.configureKeyboardText,
-                                                       label=bs.Lstr(resource=self._r+'.configureKeyboardText'),
-                                                       onActivateCall=self._configKeyboard)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._keyboardButton)
-                bs.widget(edit=self._backButton,downWidget=self._keyboardButton)
-                self._haveSelectedChild = True
-            v -= spacing
-            self._keyboard2Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-3,v),size=(buttonWidth,43),autoSelect=True,
-                                                        # label=R.configureKeyboard2Text,
-                                                        label=bs.Lstr(resource=self._r+'.configureKeyboard2Text'),
-                                                        onActivateCall=self._configKeyboard2)
-            v -= spacing
-        if showSpace2: v -= spaceHeight
-        if showRemote:
-            self._iDevicesButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-5,v),size=(buttonWidth,43),autoSelect=True,
-                                                       # label=R.configureMobileText,
-                                                       label=bs.Lstr(resource=self._r+'.configureMobileText'),
-                                                       onActivateCall=self._doMobileDevices)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._iDevicesButton)
-                bs.widget(edit=self._backButton,downWidget=self._iDevicesButton)
-                self._haveSelectedChild = True
-            v -= spacing
-        if showPS3:
-            self._ps3Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
-                                # label=R.ps3Text,
-                                label=bs.Lstr(resource=self._r+'.ps3Text'),
-                                onActivateCall=self._doPS3Controllers)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            v -= spacing
-        if show360:
-            self._xbox360Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-1,v),size=(buttonWidth,43),autoSelect=True,
-                                # label=R.xbox360Text,
-                                label=bs.Lstr(resource=self._r+'.xbox360Text'),
-                                onActivateCall=self._do360Controllers)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            v -= spacing
-        if showMacWiimote:
-            self._wiimotesButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
-                                # label=R.wiimotesText,
-                                label=bs.Lstr(resource=self._r+'.wiimotesText'),
-                                onActivateCall=self._doWiimotes)
-            if gToolbars:
-                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            v -= spacing
-
-        if showXInputToggle:
-            def doToggle(value):
-                bs.screenMessage(bs.Lstr(resource='settingsWindowAdvanced.mustRestartText'),color=(1,1,0))
-                bs.playSound(bs.getSound('gunCocking'))
-                bsInternal._setLowLevelConfigValue('enablexinput',not value)
-            bs.checkBoxWidget(parent=self._rootWidget, position=(100, v+3), size=(120, 30), value=not bsInternal._getLowLevelConfigValue('enablexinput',1),
-                              maxWidth=200, onValueChangeCall=doToggle,
-                              text=bs.Lstr(resource='disableXInputText'),
-                              autoSelect=True)
-            bs.textWidget(parent=self._rootWidget, position=(width*0.5,v-5), size=(0, 0), text=bs.Lstr(resource='disableXInputDescriptionText'),
-                          scale=0.5, hAlign='center',vAlign='center', color=gInfoTextColor, maxWidth=width*0.8)
-            v -= spacing
-            
-        self._restoreState()
-
-    def _configKeyboard(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConfigKeyboardWindow(bsInternal._getInputDevice('Keyboard','#1')).getRootWidget()
-
-    def _configKeyboard2(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConfigKeyboardWindow(bsInternal._getInputDevice('Keyboard','#2')).getRootWidget()
-
-    def _doMobileDevices(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConnectMobileDevicesWindow().getRootWidget()
-
-    def _doPS3Controllers(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConnectPS3ControllersWindow().getRootWidget()
-
-    def _do360Controllers(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = Connect360ControllersWindow().getRootWidget()
-
-    def _doWiimotes(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConfigureWiiRemotesWindow().getRootWidget()
-
-    def _doGamepads(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConfigGamePadWindow().getRootWidget()
-
-    def _doTouchscreen(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = ConfigTouchscreenWindow().getRootWidget()
-
-    def _saveState(self):
-        sel = self._rootWidget.getSelectedChild()
-        if sel == self._gamePadsButton: selName = 'GamePads'
-        elif sel == self._touchButton: selName = 'Touch'
-        elif sel == self._keyboardButton: selName = 'Keyboard'
-        elif sel == self._keyboard2Button: selName = 'Keyboard2'
-        elif sel == self._iDevicesButton: selName = 'iDevices'
-        elif sel == self._ps3Button: selName = 'PS3'
-        elif sel == self._xbox360Button: selName = 'xbox360'
-        elif sel == self._wiimotesButton: selName = 'Wiimotes'
-        else: selName = 'Back'
-        gWindowStates[self.__class__.__name__] = selName
-
-    def _restoreState(self):
-        try: selName = gWindowStates[self.__class__.__name__]
-        except Exception: selName = None
-        if selName == 'GamePads': sel = self._gamePadsButton
-        elif selName == 'Touch': sel = self._touchButton
-        elif selName == 'Keyboard': sel = self._keyboardButton
-        elif selName == 'Keyboard2': sel = self._keyboard2Button
-        elif selName == 'iDevices': sel = self._iDevicesButton
-        elif selName == 'PS3': sel = self._ps3Button
-        elif selName == 'xbox360': sel = self._xbox360Button
-        elif selName == 'Wiimotes': sel = self._wiimotesButton
-        elif selName == 'Back': sel = self._backButton
-        else: sel = self._gamePadsButton if self._gamePadsButton is not None else self._backButton
-        bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-
-
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow']=SettingsWindow(transition='inLeft').getRootWidget()
-
-
 class PopupWindow(Window):
 
     def __init__(self,position,size,scale=1.0,offset=(0,0),bgColor=(0.35,0.55,0.15),
@@ -2717,7 +1815,7 @@ class CharacterPicker(PopupWindow):
             showSignInPrompt()
             return
         self._transitionOut()
-        StoreWindow(modal=True,showTab='characters',originWidget=self._getMoreCharactersButton)
+        getWindowClass('StoreWindow')(modal=True,showTab='characters',originWidget=self._getMoreCharactersButton)
         
     def _selectCharacter(self,character):
         if self._delegate is not None: self._delegate.onCharacterPickerPick(character)
@@ -2823,7 +1921,7 @@ class IconPicker(PopupWindow):
             showSignInPrompt()
             return
         self._transitionOut()
-        StoreWindow(modal=True,showTab='icons',originWidget=self._getMoreIconsButton)
+        getWindowClass('StoreWindow')(modal=True,showTab='icons',originWidget=self._getMoreIconsButton)
         
     def _selectIcon(self,icon):
         if self._delegate is not None: self._delegate.onIconPickerPick(icon)
@@ -2945,6 +2043,7 @@ class UpgradeProfileWindow(Window):
             bsInternal._addTransaction({'type':'UPGRADE_PROFILE',
                                         'name':self._name})
             bsInternal._runTransactions()
+            bsUtils._markPlayerProfilesDirty()
             self._status = 'upgrading'
             self._upgradeStartTime = time.time()
         else:
@@ -3353,6 +2452,7 @@ class EditProfileWindow(Window):
                                                'global':self._global,
                                                'icon':self._icon,
                                                'highlight':self._highlight}})
+        bsUtils._markPlayerProfilesDirty()
 
         if transitionOut:
             bsInternal._runTransactions()
@@ -3522,6 +2622,7 @@ class PlayerProfilesWindow(Window):
         bsInternal._addTransaction({'type':'REMOVE_PLAYER_PROFILE',
                                     'name':self._selectedProfile})
         bsInternal._runTransactions()
+        bsUtils._markPlayerProfilesDirty()
         
         bs.playSound(bs.getSound('shieldDown'))
         self._refresh()
@@ -3629,78 +2730,13 @@ class PlayerProfilesWindow(Window):
             bs.printException('error restoring state for',self.__class__)
 
         
-class ConfigureWiiRemotesWindow(Window):
+class WiimoteListenWindow(Window):
 
     def __init__(self):
 
-        self._r = 'wiimoteSetupWindow'
-        width = 600
-        height = 480
-        spacing = 40
-
-        self._rootWidget = bs.containerWidget(size=(width,height),transition='inRight')
-
-        b = bs.buttonWidget(parent=self._rootWidget,position=(55,height-50),size=(120,60),scale=0.8,autoSelect=True,
-                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
-
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,height-28),size=(0,0),
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          maxWidth=270,
-                          color=gTitleColor,
-                          hAlign="center",vAlign="center")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(110,height-26))
-        
-        v = height - 60
-        v -= spacing
-        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v-80),size=(0,0),
-                          color=(0.7,0.9,0.7,1.0),
-                          scale=0.75,
-                          text=bs.Lstr(resource=self._r+'.macInstructionsText'),
-                          maxWidth=width*0.95,
-                          maxHeight=height*0.5,
-                          hAlign="center",vAlign="center")
-        v -= 230
-        buttonWidth = 200
-        v -= 30
-        b = bs.buttonWidget(parent=self._rootWidget,position=(width/2-buttonWidth/2,v+1),autoSelect=True,
-                            size=(buttonWidth,50),
-                            label=bs.Lstr(resource=self._r+'.listenText'),
-                            onActivateCall=WiimoteListenWindow)
-        bs.containerWidget(edit=self._rootWidget,startButton=b)
-        v -= spacing * 1.1
-        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v+10),size=(0,0),
-                          color=(0.7,0.9,0.7,1.0),
-                          scale=0.8,
-                          maxWidth=width*0.95,
-                          text=bs.Lstr(resource=self._r+'.thanksText'),
-                          hAlign="center",vAlign="center")
-        v -= 30
-        thisButtonWidth = 200
-        b = bs.buttonWidget(parent=self._rootWidget,position=(width/2-thisButtonWidth/2,v-14),
-                            color=(0.45,0.4,0.5),autoSelect=True,
-                            size=(thisButtonWidth,15),
-                            label=bs.Lstr(resource=self._r+'.copyrightText'),
-                            textColor=(0.55,0.5,0.6),
-                            textScale=0.6,
-                            onActivateCall=WiimoteLicenseWindow)
-
-    def _back(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-
-
-class WiimoteListenWindow(Window):
-
-    def __init__(self):
-
-        self._r = 'wiimoteListenWindow'
-        width = 650
-        height = 210
+        self._r = 'wiimoteListenWindow'
+        width = 650
+        height = 210
         self._rootWidget = bs.containerWidget(size=(width,height),transition='inRight')
 
         b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-60),size=(140,60),autoSelect=True,
@@ -4110,218 +3146,6 @@ class ConnectMobileDevicesWindow(Window):
         uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
 
 
-class ConfigGamePadWindow(Window):
-
-    def __init__(self):
-        width = 480
-        height = 170
-        spacing = 40
-        self._r = 'configGamepadSelectWindow'
-        self._rootWidget = bs.containerWidget(scale=2.3 if gSmallUI else 1.5 if gMedUI else 1.0,
-                                              size=(width,height),transition='inRight')
-        b = bs.buttonWidget(parent=self._rootWidget,position=(20,height-60),size=(130,60),
-                            label=bs.Lstr(resource='backText'),buttonType='back',scale=0.8,
-                            onActivateCall=self._back)
-        # lets not have anything selected by default; its misleading looking for the controller getting configured..
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b,selectedChild=0)
-        t = bs.textWidget(parent=self._rootWidget,position=(20,height-50),size=(width,25),
-                          #text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          maxWidth=250,color=gTitleColor,hAlign="center",vAlign="center")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(83,height-50))
-        
-        v = height - 60
-        v -= spacing
-        t = bs.textWidget(parent=self._rootWidget,position=(15,v),size=(width-30,30),
-                          scale=0.8,
-                          # text=R.pressAnyButtonText,
-                          text=bs.Lstr(resource=self._r+'.pressAnyButtonText'),
-                          maxWidth=width*0.95,color=gInfoTextColor,hAlign="center",vAlign="top")
-        v -= spacing * 1.24
-        ua = bs.getEnvironment()['userAgentString']
-        if 'android' in ua and not bsInternal._isOuyaBuild() and not bsInternal._isRunningOnFireTV():
-            t = bs.textWidget(parent=self._rootWidget,position=(15,v),size=(width-30,30),
-                              scale=0.46,
-                              # text=R.androidNoteText,
-                              text=bs.Lstr(resource=self._r+'.androidNoteText'),
-                              maxWidth=width*0.95,
-                              color=(0.7,0.9,0.7,0.5),
-                              hAlign="center",vAlign="top")
-
-        bsInternal._captureGamePadInput(gamePadConfigureCallback)
-
-    def _back(self):
-        bsInternal._releaseGamePadInput()
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-
-
-class ConfigTouchscreenWindow(Window):
-
-    def __del__(self):
-        # note - this happens in 'back' too just to get it going earlier..
-        # (but we do it here too in case somehow the window is closed by another means)
-        bsInternal._setTouchscreenEditing(False)
-
-    def __init__(self):
-
-        self._width = 650
-        self._height = 380
-        self._spacing = 40
-        self._r = 'configTouchscreenWindow'
-
-        bsInternal._setTouchscreenEditing(True)
-
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition='inRight',
-                                              scale=1.9 if gSmallUI else 1.55 if gMedUI else 1.2)
-
-        b = bs.buttonWidget(parent=self._rootWidget,position=(55,self._height-60),size=(120,60),
-                            label=bs.Lstr(resource='backText'),buttonType='back',scale=0.8,
-                            onActivateCall=self._back)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-        t = bs.textWidget(parent=self._rootWidget,position=(25,self._height-50),size=(self._width,25),
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,maxWidth=280,
-                          hAlign="center",vAlign="center")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(110,self._height-49))
-        
-
-        self._scrollWidth = self._width - 100
-        self._scrollHeight = self._height - 110
-        self._subWidth = self._scrollWidth-20
-        self._subHeight = 360
-
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
-                                             position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
-                                             size=(self._scrollWidth,self._scrollHeight))
-        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,
-                                                    size=(self._subWidth,self._subHeight),
-                                                    background=False)
-        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-        bs.containerWidget(edit=self._subContainer,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-
-        self._buildGui()
-
-    def _buildGui(self):
-
-        # clear anything already there
-        #children = bs.getWidgetChildren(self._rootWidget)
-        children = self._subContainer.getChildren()
-        for c in children: c.delete()
-        
-        h = 30
-        v = self._subHeight - 85
-
-        cl = (0.8,0.8,0.8,1.0)
-        cl2 = (0.8,0.8,0.8)
-
-        bs.textWidget(parent=self._subContainer,position=(-10,v+43),size=(self._subWidth,25),
-                      text=bs.Lstr(resource=self._r+'.swipeInfoText'),
-                      flatness=1.0,
-                      color=(0,0.9,0.1,0.7),maxWidth=self._subWidth*0.9,
-                      scale=0.55,hAlign="center",vAlign="center")
-
-        try: curVal = bs.getConfig()['Touch Movement Control Type']
-        except Exception: curVal = 'swipe'
-        bs.textWidget(parent=self._subContainer,position=(h,v-2),size=(0,30),
-                      text=bs.Lstr(resource=self._r+'.movementText'),
-                      maxWidth=190,color=cl,vAlign='center')
-        c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+220,v),size=(170,30),
-                               text=bs.Lstr(resource=self._r+'.joystickText'),
-                               maxWidth=100,textColor=cl2,scale=0.9)
-        c2 = bs.checkBoxWidget(parent=self._subContainer,position=(h+357,v),size=(170,30),
-                               text=bs.Lstr(resource=self._r+'.swipeText'),
-                               maxWidth=100,textColor=cl2,value=0,scale=0.9)
-        _makeRadioGroup((c1,c2),('joystick','swipe'),curVal,self._movementChanged)
-
-        v -= 50
-        configTextBox(parent=self._subContainer,position=(h,v),xOffset=65,name="Touch Controls Scale Movement",
-                      displayName=bs.Lstr(resource=self._r+'.movementControlScaleText'),
-                      type="float",changeSound=False,minVal=0.1,maxVal=4.0,increment=0.1)
-        
-        v -= 50
-
-        try: curVal = bs.getConfig()['Touch Action Control Type']
-        except Exception: curVal = 'buttons'
-        bs.textWidget(parent=self._subContainer,position=(h,v-2),size=(0,30),
-                      text=bs.Lstr(resource=self._r+'.actionsText'),
-                      maxWidth=190,color=cl,vAlign='center')
-        c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+220,v),size=(170,30),
-                               text=bs.Lstr(resource=self._r+'.buttonsText'),
-                               maxWidth=100,textColor=cl2,scale=0.9)
-        c2 = bs.checkBoxWidget(parent=self._subContainer,position=(h+357,v),size=(170,30),
-                               text=bs.Lstr(resource=self._r+'.swipeText'),
-                               maxWidth=100,textColor=cl2,scale=0.9)
-        _makeRadioGroup((c1,c2),('buttons','swipe'),curVal,self._actionsChanged)
-
-
-        v -= 50
-        configTextBox(parent=self._subContainer,position=(h,v),xOffset=65,name="Touch Controls Scale Actions",
-                      displayName=bs.Lstr(resource=self._r+'.actionControlScaleText'),
-                      type="float",changeSound=False,minVal=0.1,maxVal=4.0,increment=0.1)
-
-        v -= 50
-        configCheckBox(parent=self._subContainer,position=(h,v),
-                       size=(400,30),maxWidth=400,name="Touch Controls Swipe Hidden",
-                       displayName=bs.Lstr(resource=self._r+'.swipeControlsHiddenText'))
-        
-        v -= 65
-
-        b = bs.buttonWidget(parent=self._subContainer,position=(self._subWidth*0.5-70,v),size=(170,60),
-                            label=bs.Lstr(resource=self._r+'.resetText'),
-                            scale=0.75,onActivateCall=self._reset)
-
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,38),size=(0,0),hAlign='center',
-                          text=bs.Lstr(resource=self._r+'.dragControlsText'),
-                          maxWidth=self._width*0.8,
-                          scale=0.65,color=(1,1,1,0.4))
-        
-
-    def _actionsChanged(self,v):
-        bs.getConfig()['Touch Action Control Type'] = v
-        bs.writeConfig()
-        bs.applySettings()
-
-    def _movementChanged(self,v):
-        bs.getConfig()['Touch Movement Control Type'] = v
-        bs.writeConfig()
-        bs.applySettings()
-
-    def _reset(self):
-        bsConfig = bs.getConfig()
-        prefs = ['Touch Movement Control Type',
-                 'Touch Action Control Type',
-                 'Touch Controls Scale',
-                 'Touch Controls Scale Movement',
-                 'Touch Controls Scale Actions',
-                 'Touch Controls Swipe Hidden',
-                 'Touch DPad X',
-                 'Touch DPad Y',
-                 'Touch Buttons X',
-                 'Touch Buttons Y']
-        for p in prefs:
-            if p in bsConfig:
-                del(bsConfig[p])
-
-        bs.writeConfig()
-        bs.applySettings()
-
-        bs.realTimer(0,self._buildGui)
-
-
-    def _back(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-        bsInternal._setTouchscreenEditing(False)
-
-
 def gamePadConfigureCallback(event):
 
     # ignore all but button-presses
@@ -4335,7 +3159,7 @@ def gamePadConfigureCallback(event):
     bs.playSound(bs.getSound('activateBeep'))
     bs.playSound(bs.getSound('swish'))
     if event['inputDevice']._getAllowsConfiguring():
-        uiGlobals['mainMenuWindow'] = GamePadConfigWindow(event["inputDevice"]).getRootWidget()
+        uiGlobals['mainMenuWindow'] = getWindowClass('GamePadConfigWindow')(event["inputDevice"]).getRootWidget()
     else:
         width = 700
         height = 200
@@ -4720,805 +3544,6 @@ def getControllerValue(c,button,exceptionOnUnknown=False):
 
 
 
-class GamePadConfigWindow(Window):
-
-    def __init__(self,gamePad,isMainMenu=True,transition='inRight',transitionOut='outRight',settings=None):
-
-        self._input = gamePad
-
-        # if this fails, our input device went away or something.. just return an empty zombie then
-        try: self._name = self._input.getName()
-        except Exception: return
-
-        self._r = 'configGamepadWindow'
-
-        self._settings = settings
-        self._transitionOut = transitionOut
-
-        # we're a secondary gamepad if supplied with settings
-        self._isSecondary = (settings is not None)
-        self._ext = '_B' if self._isSecondary else ''
-        self._isMainMenu = isMainMenu
-        self._displayName = self._name
-        buttonWidth = 240
-        self._width = 700 if self._isSecondary else 730
-        self._height = 440 if self._isSecondary else 450
-        self._spacing = 40
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),
-                                              scale=1.63 if gSmallUI else 1.35 if gMedUI else 1.0,
-                                              stackOffset=(-20,-16) if gSmallUI else (0,0),
-                                              transition=transition)
-        # dont ask to config joysticks while we're in here..
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = False
-
-        self._rebuildUI()
-
-
-    def _rebuildUI(self):
-
-        # clear existing UI
-        #for w in bs.getWidgetChildren(self._rootWidget): w.delete()
-        for w in self._rootWidget.getChildren(): w.delete()
-
-        self._textWidgets = {}
-
-        # if we were supplied with settings, we're a secondary joystick and just operate on that.
-        # in the other (normal) case we make our own..
-        if not self._isSecondary:
-
-            # fill our temp config with present values (for our primary and secondary controls)
-            self._settings = {}
-            for s in ['buttonJump','buttonJump_B',
-                      'buttonPunch','buttonPunch_B',
-                      'buttonBomb','buttonBomb_B',
-                      'buttonPickUp','buttonPickUp_B',
-                      'buttonStart','buttonStart_B',
-                      'buttonStart2','buttonStart2_B',
-                      'buttonUp','buttonUp_B',
-                      'buttonDown','buttonDown_B',
-                      'buttonLeft','buttonLeft_B',
-                      'buttonRight','buttonRight_B',
-                      'buttonRun1','buttonRun1_B',
-                      'buttonRun2','buttonRun2_B',
-                      'triggerRun1','triggerRun1_B',
-                      'triggerRun2','triggerRun2_B',
-                      'buttonIgnored','buttonIgnored_B',
-                      'buttonIgnored2','buttonIgnored2_B',
-                      'buttonIgnored3','buttonIgnored3_B',
-                      'buttonIgnored4','buttonIgnored4_B',
-                      'buttonVRReorient','buttonVRReorient_B',
-                      'analogStickDeadZone','analogStickDeadZone_B',
-                      'dpad','dpad_B',
-                      'unassignedButtonsRun','unassignedButtonsRun_B',
-                      'startButtonActivatesDefaultWidget','startButtonActivatesDefaultWidget_B',
-                      'uiOnly','uiOnly_B',
-                      'ignoreCompletely','ignoreCompletely_B',
-                      'autoRecalibrateAnalogStick','autoRecalibrateAnalogStick_B',
-                      'analogStickLR','analogStickLR_B',
-                      'analogStickUD','analogStickUD_B',
-                      'enableSecondary',]:
-                val = getControllerValue(self._input,s)
-                if val != -1: self._settings[s] = val
-
-        #if not self._isSecondary:
-        if self._isSecondary:
-            backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-180,self._height-65),autoSelect=True,
-                                             size=(160,60),label=bs.Lstr(resource='doneText'),scale=0.9,
-                                             onActivateCall=self._save)
-            # backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-65),autoSelect=True,
-            #                                  size=(160,60),label=bs.Lstr(resource='backText'),scale=0.9,
-            #                                  buttonType='back',onActivateCall=self._save)
-            #bs.containerWidget(edit=self._rootWidget,cancelButton=backButton)
-            bs.containerWidget(edit=self._rootWidget,startButton=backButton,onCancelCall=backButton.activate)
-            cancelButton = None
-        else:
-            cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-65),autoSelect=True,
-                                               size=(160,60),label=bs.Lstr(resource='cancelText'),scale=0.9,
-                                               onActivateCall=self._cancel)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton)
-            backButton = None
-        #else: cancelButton = None
-
-        if not self._isSecondary:
-            saveButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-(165 if self._isSecondary else 195),self._height-65),
-                                             size=((160 if self._isSecondary else 180),60),autoSelect=True,
-                                             label=bs.Lstr(resource='doneText') if self._isSecondary else bs.Lstr(resource='makeItSoText'),
-                                             scale=0.9,
-                                             onActivateCall=self._save)
-            bs.containerWidget(edit=self._rootWidget,startButton=saveButton)
-        else: saveButton = None
-
-        if not self._isSecondary:
-
-            v = self._height - 59
-            t = bs.textWidget(parent=self._rootWidget,position=(0,v+5),size=(self._width,25),
-                              text=bs.Lstr(resource=self._r+'.titleText'),
-                              color=gTitleColor,maxWidth=310,
-                              hAlign="center",vAlign="center")
-            v -= 48
-
-            t = bs.textWidget(parent=self._rootWidget,position=(0,v+3),size=(self._width,25),text=self._name,
-                              color=gInfoTextColor,maxWidth=self._width*0.9,
-                              hAlign="center",vAlign="center")
-
-            v -= self._spacing * 1
-
-            bs.textWidget(parent=self._rootWidget,position=(50,v+10),size=(self._width-100,30),
-                          text=bs.Lstr(resource=self._r+'.appliesToAllText'),
-                          maxWidth=330,
-                          scale=0.65, color=(0.5,0.6,0.5,1.0),hAlign='center',vAlign='center')
-            v -= 70
-            self._enableCheckBox = None
-        else:
-            v = self._height - 49
-            t = bs.textWidget(parent=self._rootWidget,position=(0,v+5),size=(self._width,25),
-                              text=bs.Lstr(resource=self._r+'.secondaryText'),
-                              color=gTitleColor,maxWidth=300,hAlign="center",vAlign="center")
-            v -= self._spacing * 1
-
-            bs.textWidget(parent=self._rootWidget,position=(50,v+10),size=(self._width-100,30),
-                          text=bs.Lstr(resource=self._r+'.secondHalfText'),
-                          maxWidth=300,scale=0.65, color=(0.6,0.8,0.6,1.0),hAlign='center')
-            self._enableCheckBox = bs.checkBoxWidget(parent=self._rootWidget,position=(self._width*0.5-80,v-73),
-                                                     value=self._getEnableSecondaryValue(),
-                                                     autoSelect=True,
-                                                     onValueChangeCall=self._enableCheckBoxChanged,
-                                                     size=(200,30),
-                                                     text=bs.Lstr(resource=self._r+'.secondaryEnableText'),
-                                                     scale=1.2)
-            v = self._height - 205
-
-        hOffs = 160
-        dist = 70
-
-        dColor = (0.4,0.4,0.8)
-
-        sx = 1.2
-        sy = 0.98
-
-        dpm = bs.Lstr(resource=self._r+'.pressAnyButtonOrDpadText')
-        dpm2 = bs.Lstr(resource=self._r+'.ifNothingHappensTryAnalogText')
-        bLTop = self._captureButton(pos=(hOffs,v+sy*dist),color=dColor,button='buttonUp'+self._ext,texture=bs.getTexture('upButton'),scale=1.0,message=dpm,message2=dpm2)
-        bLLeft = self._captureButton(pos=(hOffs-sx*dist,v),color=dColor,button='buttonLeft'+self._ext,texture=bs.getTexture('leftButton'),scale=1.0,message=dpm,message2=dpm2)
-        bLRight = self._captureButton(pos=(hOffs+sx*dist,v),color=dColor,button='buttonRight'+self._ext,texture=bs.getTexture('rightButton'),scale=1.0,message=dpm,message2=dpm2)
-        bLBottom = self._captureButton(pos=(hOffs,v-sy*dist),color=dColor,button='buttonDown'+self._ext,texture=bs.getTexture('downButton'),scale=1.0,message=dpm,message2=dpm2)
-
-        dpm3 = bs.Lstr(resource=self._r+'.ifNothingHappensTryDpadText')
-        bAxes = self._captureButton(pos=(hOffs+130,v-125),color=(0.4,0.4,0.6),button='analogStickLR'+self._ext,maxWidth=140,
-                            texture=bs.getTexture('analogStick'),scale=1.2,message=bs.Lstr(resource=self._r+'.pressLeftRightText'),message2=dpm3)
-
-        bStart = self._captureButton(pos=(self._width*0.5,v),color=(0.4,0.4,0.6),button='buttonStart'+self._ext,texture=bs.getTexture('startButton'),scale=0.7)
-
-        hOffs = self._width-160
-
-        bRTop = self._captureButton(pos=(hOffs,v+sy*dist),color=(0.6,0.4,0.8),button='buttonPickUp'+self._ext,texture=bs.getTexture('buttonPickUp'),scale=1.0)
-        bRLeft = self._captureButton(pos=(hOffs-sx*dist,v),color=(0.7,0.5,0.1),button='buttonPunch'+self._ext,texture=bs.getTexture('buttonPunch'),scale=1.0)
-        bRRight = self._captureButton(pos=(hOffs+sx*dist,v),color=(0.5,0.2,0.1),button='buttonBomb'+self._ext,texture=bs.getTexture('buttonBomb'),scale=1.0)
-        bRBottom = self._captureButton(pos=(hOffs,v-sy*dist),color=(0.2,0.5,0.2),button='buttonJump'+self._ext,texture=bs.getTexture('buttonJump'),scale=1.0)
-
-        self._advancedButton = bAdvanced = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,label=bs.Lstr(resource=self._r+'.advancedText'),textScale=0.9,color=(0.45,0.4,0.5),
-                                                           textColor=(0.65,0.6,0.7),position=(self._width-300,30),size=(130,40),onActivateCall=self._doAdvanced)
-
-        try:
-            if cancelButton is not None and saveButton is not None:
-                bs.widget(edit=cancelButton,rightWidget=saveButton)
-                bs.widget(edit=saveButton,leftWidget=cancelButton)
-        except Exception:
-            bs.printException('error wiring gamepad config window')
-            
-    def _doAdvanced(self):
-
-        class _AdvancedWindow(Window):
-
-            def __init__(self,parentWindow,transition='inRight'):
-                self._parentWindow = parentWindow
-
-                env = bs.getEnvironment()
-
-                self._r = parentWindow._r
-                self._width = 700
-                self._height = 402 if gSmallUI else 512
-                self._textWidgets = {}
-                self._rootWidget = bs.containerWidget(transition='inScale',size=(self._width,self._height),
-                                                      scale=1.06*(1.85 if gSmallUI else 1.35 if gMedUI else 1.0),
-                                                      stackOffset=(0,-25) if gSmallUI else (0,0),
-                                                      scaleOriginStackOffset=(parentWindow._advancedButton.getScreenSpaceCenter()))
-
-                t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-(40 if gSmallUI else 34)),size=(0,0),
-                                  text=bs.Lstr(resource=self._r+'.advancedTitleText'),
-                                  maxWidth=320,color=gTitleColor,hAlign="center",vAlign="center")
-
-                backButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(self._width-176,self._height-(60 if gSmallUI else 55)),
-                                                 size=(120,48),textScale=0.8,
-                                                 label=bs.Lstr(resource='doneText'),onActivateCall=self._done)
-                bs.containerWidget(edit=self._rootWidget,startButton=b,onCancelCall=b.activate)
-
-
-                self._scrollWidth = self._width - 100
-                self._scrollHeight = self._height - 110
-                self._subWidth = self._scrollWidth-20
-                self._subHeight = 940 if self._parentWindow._isSecondary else 1040
-                if env['vrMode']: self._subHeight += 50
-                self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
-                                                     position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
-                                                     size=(self._scrollWidth,self._scrollHeight))
-                self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,
-                                                            size=(self._subWidth,self._subHeight),background=False)
-                bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-                bs.containerWidget(edit=self._subContainer,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
-                
-                h = 30
-                v = self._subHeight - 10
-
-                h2 = h + 12
-                
-                # dont allow secondary joysticks to handle unassigned buttons
-                if not self._parentWindow._isSecondary:
-                    v -= 40
-                    c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+70,v),size=(500,30),
-                                           text=bs.Lstr(resource=self._r+'.unassignedButtonsRunText'),textColor=(0.8,0.8,0.8),maxWidth=330,
-                                           scale=1.0,onValueChangeCall=self._parentWindow._setUnassignedButtonsRunValue,
-                                           autoSelect=True,
-                                           value=self._parentWindow._getUnassignedButtonsRunValue())
-                    bs.widget(edit=c1,upWidget=backButton)
-                v -= 60
-                cb = self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runButton1Text'),control='buttonRun1'+self._parentWindow._ext)
-                if self._parentWindow._isSecondary:
-                    for w in cb: bs.widget(edit=w,upWidget=backButton)
-                v -= 42
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runButton2Text'),control='buttonRun2'+self._parentWindow._ext)
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-24),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.runTriggerDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-
-                v -= 85
-                
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runTrigger1Text'),
-                                    control='triggerRun1'+self._parentWindow._ext,
-                                    message=bs.Lstr(resource=self._r+'.pressAnyAnalogTriggerText'))
-                v -= 42
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runTrigger2Text'),
-                                    control='triggerRun2'+self._parentWindow._ext,
-                                    message=bs.Lstr(resource=self._r+'.pressAnyAnalogTriggerText'))
-
-                # in vr mode, allow assigning a reset-view button
-                if env['vrMode']:
-                    v -= 50
-                    self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.vrReorientButtonText'),control='buttonVRReorient'+self._parentWindow._ext)
-                    
-                v -= 60
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.extraStartButtonText'),control='buttonStart2'+self._parentWindow._ext)
-                v -= 60
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton1Text'),control='buttonIgnored'+self._parentWindow._ext)
-                v -= 42
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton2Text'),control='buttonIgnored2'+self._parentWindow._ext)
-                v -= 42
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton3Text'),control='buttonIgnored3'+self._parentWindow._ext)
-                v -= 42
-                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton4Text'),control='buttonIgnored4'+self._parentWindow._ext)
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-14),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.ignoredButtonDescriptionText'),
-                              color=(0.7,1,0.7,0.6),
-                              scale=0.8,maxWidth=self._subWidth*0.8,
-                              hAlign='center',vAlign='center')
-
-                v -= 80
-                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
-                                       text=bs.Lstr(resource=self._r+'.startButtonActivatesDefaultText'),
-                                       textColor=(0.8,0.8,0.8),maxWidth=450,
-                                       scale=0.9,onValueChangeCall=self._parentWindow._setStartButtonActivatesDefaultWidgetValue,
-                                       value=self._parentWindow._getStartButtonActivatesDefaultWidgetValue())
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.startButtonActivatesDefaultDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-
-                v -= 80
-                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
-                                       text=bs.Lstr(resource=self._r+'.uiOnlyText'),
-                                       textColor=(0.8,0.8,0.8),maxWidth=450,
-                                       scale=0.9,onValueChangeCall=self._parentWindow._setUIOnlyValue,
-                                       value=self._parentWindow._getUIOnlyValue())
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.uiOnlyDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-
-                v -= 80
-                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
-                                       text=bs.Lstr(resource=self._r+'.ignoreCompletelyText'),
-                                       textColor=(0.8,0.8,0.8),maxWidth=450,
-                                       scale=0.9,onValueChangeCall=self._parentWindow._setIgnoreCompletelyValue,
-                                       value=self._parentWindow._getIgnoreCompletelyValue())
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.ignoreCompletelyDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-                
-                v -= 80
-
-                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
-                                       text=bs.Lstr(resource=self._r+'.autoRecalibrateText'),textColor=(0.8,0.8,0.8),maxWidth=450,
-                                       scale=0.9,onValueChangeCall=self._parentWindow._setAutoRecalibrateAnalogStickValue,
-                                       value=self._parentWindow._getAutoRecalibrateAnalogStickValue())
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.autoRecalibrateDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-                v -= 80
-
-                buttons = self._configValueEditor(bs.Lstr(resource=self._r+'.analogStickDeadZoneText'),control='analogStickDeadZone'+self._parentWindow._ext,
-                                                  position=(h+40,v),minVal=0,maxVal=10.0,increment=0.1,xOffset=100)
-                bs.widget(edit=buttons[0],leftWidget=c1,upWidget=c1)
-                bs.widget(edit=c1,rightWidget=buttons[0],downWidget=buttons[0])
-                
-                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.analogStickDeadZoneDescriptionText'),
-                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
-                              scale=0.7,hAlign='center',vAlign='center')
-                v -= 100
-                
-                # child joysticks cant have child joysticks.. that's just crazy talk
-                if not self._parentWindow._isSecondary:
-                    bs.buttonWidget(parent=self._subContainer,autoSelect=True,label=bs.Lstr(resource=self._r+'.twoInOneSetupText'),
-                                    position=(40,v),size=(self._subWidth-80,50),onActivateCall=self._parentWindow._showSecondaryEditor,upWidget=buttons[0])
-
-                # set a bigger bottom show-buffer for the widgets we just made so we can see the text below them when navigating
-                # with a gamepad
-                for w in self._subContainer.getChildren():
-                    bs.widget(edit=w,showBufferBottom=30,showBufferTop=30)
-
-            def _captureButton(self,pos,name,control,message=bs.Lstr(resource=self._r+'.pressAnyButtonText')):
-                b = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(pos[0],pos[1]),
-                                    label=name,size=(250,60),scale=0.7)
-                b2 = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(pos[0]+400,pos[1]+2),
-                                     leftWidget=b,
-                                     color=(0.45,0.4,0.5),textColor=(0.65,0.6,0.7),
-                                     label=bs.Lstr(resource=self._r+'.clearText'),size=(110,50),scale=0.7,
-                                     onActivateCall=bs.Call(self._clearControl,control))
-                bs.widget(edit=b,rightWidget=b2)
-                # make this in a timer so that it shows up on top of all other buttons
-                def foo():
-                    t = bs.textWidget(parent=self._subContainer,position=(pos[0]+285,pos[1]+20),
-                                      color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='center',scale=0.7,
-                                      text=self._parentWindow._getControlValueName(control),
-                                      maxWidth=200)
-                    self._textWidgets[control] = t
-                    bs.buttonWidget(edit=b,onActivateCall=bs.Call(AwaitGamePadInputWindow,self._parentWindow._input,control,self._gamePadEvent,message))
-                bs.realTimer(0,foo)
-                return [b,b2]
-
-
-            def _inc(self,control,minVal,maxVal,inc):
-                try: val = self._parentWindow._settings[control]
-                except Exception: val = 1.0
-                val = min(maxVal,max(minVal,val+inc))
-                if abs(1.0-val) < 0.001:
-                    if control in self._parentWindow._settings: del(self._parentWindow._settings[control])
-                else: self._parentWindow._settings[control] = round(val,1)
-                bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
-
-            def _configValueEditor(self,name,control,position,type='float',minVal=0,maxVal=100,increment=1.0,callback=None,changeSound=True,xOffset=0,displayName=None,textScale=1.0):
-
-                if displayName is None: displayName = name
-                t = bs.textWidget(parent=self._subContainer,position=position,size=(100,30),text=displayName,
-                                  color=(0.8,0.8,0.8,1.0),hAlign="left",vAlign="center",scale=1.0,maxWidth=280)
-                if type == 'string':
-                    raise Exception("fixme unimplemented");
-                else:
-                    self._textWidgets[control] = t = bs.textWidget(parent=self._subContainer,position=(246+xOffset,position[1]),
-                                                                   size=(60,28),editable=False,
-                                                                   color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
-                                                                   text=self._parentWindow._getControlValueName(control),padding=2)
-                    b = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(330+xOffset,position[1]+4),size=(28,28),label="-",
-                                        onActivateCall=bs.Call(self._inc,control,minVal,maxVal,-increment),
-                                        repeat=True,enableSound=(changeSound is True))
-                    b2 = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(380+xOffset,position[1]+4),size=(28,28),label="+",
-                                        onActivateCall=bs.Call(self._inc,control,minVal,maxVal,increment),
-                                        repeat=True,enableSound=(changeSound is True))
-                    return (b,b2)
-
-            def _clearControl(self,control):
-                e = self._parentWindow._ext
-                if control in self._parentWindow._settings: del(self._parentWindow._settings[control])
-                bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
-
-            def _gamePadEvent(self,control,event,dialog):
-                e = self._parentWindow._ext
-                if control in ['triggerRun1'+e,'triggerRun2'+e]:
-                    if event['type'] == 'AXISMOTION':
-                        # ignore small values or else we might get triggered by noise
-                        if abs(event['value']) > 0.5:
-                            self._parentWindow._settings[control] = event['axis']
-                            # update the button's text widget
-                            bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
-                            bs.playSound(bs.getSound('gunCocking'))
-                            dialog.die()
-                else:
-                    if event['type'] == 'BUTTONDOWN':
-                        value = event['button']
-                        self._parentWindow._settings[control] = value
-                        # update the button's text widget
-                        bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
-                        bs.playSound(bs.getSound('gunCocking'))
-                        dialog.die()
-
-            def _done(self):
-                bs.containerWidget(edit=self._rootWidget,transition='outScale')
-
-        w = _AdvancedWindow(self)
-
-    def _enableCheckBoxChanged(self,value):
-        if value: self._settings['enableSecondary'] = 1
-        else:
-            if 'enableSecondary' in self._settings: del self._settings['enableSecondary']
-
-    def _getUnassignedButtonsRunValue(self):
-        if 'unassignedButtonsRun' in self._settings: return self._settings['unassignedButtonsRun']
-        else: return True
-    def _setUnassignedButtonsRunValue(self,value):
-        if value:
-            if 'unassignedButtonsRun' in self._settings:
-                del(self._settings['unassignedButtonsRun']) # clear since this is default
-        else: self._settings['unassignedButtonsRun'] = False
-
-    def _getStartButtonActivatesDefaultWidgetValue(self):
-        if 'startButtonActivatesDefaultWidget' in self._settings:
-            return self._settings['startButtonActivatesDefaultWidget']
-        else:
-            return True
-
-    def _setStartButtonActivatesDefaultWidgetValue(self,value):
-        if value:
-            if 'startButtonActivatesDefaultWidget' in self._settings:
-                del(self._settings['startButtonActivatesDefaultWidget']) # clear since this is default
-        else: self._settings['startButtonActivatesDefaultWidget'] = False
-
-    def _getUIOnlyValue(self):
-        if 'uiOnly' in self._settings:
-            return self._settings['uiOnly']
-        else:
-            return False
-
-    def _setUIOnlyValue(self,value):
-        if not value:
-            if 'uiOnly' in self._settings:
-                del(self._settings['uiOnly']) # clear since this is default
-        else: self._settings['uiOnly'] = True
-
-    def _getIgnoreCompletelyValue(self):
-        if 'ignoreCompletely' in self._settings:
-            return self._settings['ignoreCompletely']
-        else:
-            return False
-
-    def _setIgnoreCompletelyValue(self,value):
-        if not value:
-            if 'ignoreCompletely' in self._settings:
-                del(self._settings['ignoreCompletely']) # clear since this is default
-        else: self._settings['ignoreCompletely'] = True
-        
-    def _getAutoRecalibrateAnalogStickValue(self):
-        if 'autoRecalibrateAnalogStick' in self._settings: return self._settings['autoRecalibrateAnalogStick']
-        else: return False
-
-    def _setAutoRecalibrateAnalogStickValue(self,value):
-        if not value:
-            if 'autoRecalibrateAnalogStick' in self._settings:
-                del(self._settings['autoRecalibrateAnalogStick']) # clear since this is default
-        else: self._settings['autoRecalibrateAnalogStick'] = True
-
-    def _getEnableSecondaryValue(self):
-        if not self._isSecondary: raise Exception("enable value only applies to secondary editor")
-        if 'enableSecondary' in self._settings: return self._settings['enableSecondary']
-        else: return False
-
-    def _showSecondaryEditor(self):
-        GamePadConfigWindow(self._input,isMainMenu=False,settings=self._settings,transition='inScale',transitionOut='outScale')
-
-    def _getControlValueName(self,control):
-
-        if control == 'analogStickLR'+self._ext:
-            # this actually shows both LR and UD
-            s1 = self._settings['analogStickLR'+self._ext] if 'analogStickLR'+self._ext in self._settings else 5 if self._isSecondary else 1
-            s2 = self._settings['analogStickUD'+self._ext] if 'analogStickUD'+self._ext in self._settings else 6 if self._isSecondary else 2
-            return self._input.getAxisName(s1)+' / '+self._input.getAxisName(s2)
-
-        # if they're looking for triggers
-        if control in ['triggerRun1'+self._ext,'triggerRun2'+self._ext]:
-            if control in self._settings: return self._input.getAxisName(self._settings[control])
-            else: return bs.Lstr(resource=self._r+'.unsetText')
-            
-        # dead-zone
-        if control == 'analogStickDeadZone'+self._ext:
-            if control in self._settings: return str(self._settings[control])
-            else: return str(1.0)
-
-        # for dpad buttons: show individual buttons if any are set..
-        # otherwise show whichever dpad is set (defaulting to 1)
-        dPadButtons = ['buttonLeft'+self._ext,'buttonRight'+self._ext,'buttonUp'+self._ext,'buttonDown'+self._ext]
-        if control in dPadButtons:
-            # if *any* dpad buttons are assigned, show only button assignments
-            if any(b in self._settings for b in dPadButtons):
-                if control in self._settings:
-                    return self._input.getButtonName(self._settings[control])
-                else: return bs.Lstr(resource=self._r+'.unsetText')
-            # no dpad buttons - show the dpad number for all 4
-            else:
-                return bs.Lstr(value='${A} ${B}',subs=[('${A}',bs.Lstr(resource=self._r+'.dpadText')),('${B}',str(self._settings['dpad'+self._ext] if 'dpad'+self._ext in self._settings else 2 if self._isSecondary else 1))])
-
-        # other buttons..
-        if control in self._settings:
-            return self._input.getButtonName(self._settings[control])
-        else:
-            return bs.Lstr(resource=self._r+'.unsetText')
-
-    def _gamePadEvent(self,control,event,dialog):
-        e = self._ext
-        # for our dpad-buttons we're looking for either a button-press or a hat-switch press
-        if control in ['buttonUp'+e, 'buttonLeft'+e, 'buttonDown'+e, 'buttonRight'+e]:
-            if event['type'] in ['BUTTONDOWN', 'HATMOTION']:
-                # if its a button-down..
-                if event['type'] == 'BUTTONDOWN':
-                    value = event['button']
-                    self._settings[control] = value
-                # if its a dpad
-                elif event['type'] == 'HATMOTION':
-                    # clear out any set dir-buttons
-                    for b in ['buttonUp'+e,'buttonLeft'+e,'buttonRight'+e,'buttonDown'+e]:
-                        if b in self._settings: del(self._settings[b])
-                    if event['hat'] == (2 if self._isSecondary else 1): # exclude value in default case
-                        if 'dpad'+e in self._settings: del(self._settings['dpad'+e])
-                    else: self._settings['dpad'+e] = event['hat']
-                # update the 4 dpad button txt widgets
-                bs.textWidget(edit=self._textWidgets['buttonUp'+e],text=self._getControlValueName('buttonUp'+e))
-                bs.textWidget(edit=self._textWidgets['buttonLeft'+e],text=self._getControlValueName('buttonLeft'+e))
-                bs.textWidget(edit=self._textWidgets['buttonRight'+e],text=self._getControlValueName('buttonRight'+e))
-                bs.textWidget(edit=self._textWidgets['buttonDown'+e],text=self._getControlValueName('buttonDown'+e))
-                bs.playSound(bs.getSound('gunCocking'))
-                dialog.die()
-
-        elif control == 'analogStickLR'+e:
-            if event['type'] == 'AXISMOTION':
-                # ignore small values or else we might get triggered by noise
-                if abs(event['value']) > 0.5:
-                    axis = event['axis']
-                    if axis == (5 if self._isSecondary else 1): # exclude value in default case
-                        if 'analogStickLR'+e in self._settings: del(self._settings['analogStickLR'+e])
-                    else: self._settings['analogStickLR'+e] = axis
-                    bs.textWidget(edit=self._textWidgets['analogStickLR'+e],text=self._getControlValueName('analogStickLR'+e))
-                    bs.playSound(bs.getSound('gunCocking'))
-                    dialog.die()
-                    # now launch the up/down waiter
-                    AwaitGamePadInputWindow(self._input,'analogStickUD'+e,self._gamePadEvent,bs.Lstr(resource=self._r+'.pressUpDownText'))
-
-        elif control == 'analogStickUD'+e:
-            if event['type'] == 'AXISMOTION':
-                # ignore small values or else we might get triggered by noise
-                if abs(event['value']) > 0.5:
-                    axis = event['axis']
-                    # ignore our LR axis
-                    if 'analogStickLR'+e in self._settings: lrAxis = self._settings['analogStickLR'+e]
-                    else: lrAxis = (5 if self._isSecondary else 1)
-                    if axis != lrAxis:
-                        if axis == (6 if self._isSecondary else 2): # exclude value in default case
-                            if 'analogStickUD'+e in self._settings: del(self._settings['analogStickUD'+e])
-                        else: self._settings['analogStickUD'+e] = axis
-                        bs.textWidget(edit=self._textWidgets['analogStickLR'+e],text=self._getControlValueName('analogStickLR'+e))
-                        #print 'WOULD CHANGE TXT'
-                        bs.playSound(bs.getSound('gunCocking'))
-                        dialog.die()
-        else:
-            # for other buttons we just want a button-press
-            if event['type'] == 'BUTTONDOWN':
-                value = event['button']
-                self._settings[control] = value
-                # update the button's text widget
-                bs.textWidget(edit=self._textWidgets[control],text=self._getControlValueName(control))
-                bs.playSound(bs.getSound('gunCocking'))
-                dialog.die()
-
-    def _captureButton(self,pos,color,texture,button,scale=1.0,message=None,message2=None,maxWidth=80):
-        if message is None: message = bs.Lstr(resource=self._r+'.pressAnyButtonText')
-
-        baseSize = 79
-        b = bs.buttonWidget(parent=self._rootWidget,position=(pos[0]-baseSize*0.5*scale,pos[1]-baseSize*0.5*scale),
-                            autoSelect=True,size=(baseSize*scale,baseSize*scale),
-                            texture=texture,label='',color=color)
-        # make this in a timer so that it shows up on top of all other buttons
-        def foo():
-            uiScale = 0.9*scale
-            t = bs.textWidget(parent=self._rootWidget,position=(pos[0]+0.0*scale,pos[1]-58.0*scale),
-                              color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='center',
-                              scale=uiScale, text=self._getControlValueName(button),maxWidth=maxWidth)
-            self._textWidgets[button] = t
-            bs.buttonWidget(edit=b,onActivateCall=bs.Call(AwaitGamePadInputWindow,self._input,button,self._gamePadEvent,message,message2))
-
-        bs.realTimer(0,foo)
-        return b
-    
-    def _cancel(self):
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        if self._isMainMenu:
-            uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = True
-
-    def _save(self):
-
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-
-        # if we're a secondary editor we just go away (we were editing our parent's settings dict)
-        if self._isSecondary: return
-
-        if self._input.exists():
-            dst = getConfigLocationForInputDevice(self._input,default=True)
-            dst = dst[0][dst[1]]
-            dst.clear()
-            # store any values that aren't -1
-            for key,val in self._settings.items():
-                if val != -1: dst[key] = val
-            # if we're allowed to phone home, send this config so we can generate more defaults in the future
-            if bsUtils._shouldSubmitDebugInfo():
-                bsUtils.serverPut('controllerConfig',{'ua':bs.getEnvironment()['userAgentString'],'name':self._name,'inputMapHash':getInputMapHash(self._input),'config':dst,'v':2})
-            bs.applySettings()
-            bs.writeConfig()
-            bs.playSound(bs.getSound('gunCocking'))
-        else:
-            bs.playSound(bs.getSound('error'))
-            
-        if self._isMainMenu:
-            uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = True
-
-
-class ConfigKeyboardWindow(Window):
-
-
-    def __init__(self,c,transition='inRight'):
-
-        self._r = 'configKeyboardWindow'
-        self._input = c
-        self._name = self._input.getName()
-        self._uniqueID = self._input.getUniqueIdentifier()
-        self._displayName = self._name
-        if self._uniqueID != '#1': self._displayName += ' '+self._uniqueID.replace('#','P')
-        self._displayName = bs.Lstr(translate=('inputDeviceNames',self._displayName))
-        buttonWidth = 240
-        self._width = 700
-        if self._uniqueID != "#1": self._height = 450
-        else: self._height = 345
-        self._spacing = 40
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),
-                                              scale=1.6 if gSmallUI else 1.3 if gMedUI else 1.0,
-                                              stackOffset=(0,-10) if gSmallUI else (0,0),
-                                              transition=transition)
-
-        # dont ask to config joysticks while we're in here..
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = False
-
-        self._rebuildUI()
-
-
-    def _rebuildUI(self):
-
-        for w in self._rootWidget.getChildren():
-            w.delete()
-
-        # fill our temp config with present values
-        self._settings = {}
-        for button in ['buttonJump','buttonPunch','buttonBomb','buttonPickUp',
-                       'buttonStart','buttonStart2','buttonUp','buttonDown','buttonLeft','buttonRight']:
-            self._settings[button] = getControllerValue(self._input,button)
-
-        cancelButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(38,self._height-65),size=(170,60),label=bs.Lstr(resource='cancelText'),scale=0.9,onActivateCall=self._cancel);
-        saveButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(self._width-190,self._height-65),size=(180,60),label=bs.Lstr(resource='makeItSoText'),scale=0.9,textScale=0.9,onActivateCall=self._save)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton,startButton=saveButton)
-
-        bs.widget(edit=cancelButton,rightWidget=saveButton)
-        bs.widget(edit=saveButton,leftWidget=cancelButton)
-        
-        v = self._height - 54
-        t = bs.textWidget(parent=self._rootWidget,
-                          position=(self._width*0.5,v+15),
-                          size=(0,0),
-                          text=bs.Lstr(resource=self._r+'.configuringText',subs=[('${DEVICE}',self._displayName)]),
-                          color=gTitleColor,
-                          hAlign='center',vAlign='center',maxWidth=270,
-                          scale=0.83)
-        # t = bs.textWidget(parent=self._rootWidget,position=(-10,v),size=(self._width,25),text="Configuring " + self._displayName,color=gTitleColor,
-        #                   scale=0.83,hAlign="center",vAlign="top")
-        v -= 20
-
-        if self._uniqueID != "#1":
-            v -= 20
-            v -= self._spacing
-            t = bs.textWidget(parent=self._rootWidget,position=(0,v+19),size=(self._width,50),
-                              text=bs.Lstr(resource=self._r+'.keyboard2NoteText'),
-                              scale=0.7,
-                              maxWidth=self._width*0.75,
-                              maxHeight=110,
-                              color=gInfoTextColor,
-                              hAlign="center",vAlign="top")
-            v -= 45
-        v -= 10
-        v -= self._spacing * 2.2
-
-        v += 25
-        v -= 42
-
-        hOffs = 160
-        dist = 70
-
-        dColor = (0.4,0.4,0.8)
-        self._captureButton(pos=(hOffs,v+0.95*dist),color=dColor,button='buttonUp',texture=bs.getTexture('upButton'),scale=1.0)
-        self._captureButton(pos=(hOffs-1.2*dist,v),color=dColor,button='buttonLeft',texture=bs.getTexture('leftButton'),scale=1.0)
-        self._captureButton(pos=(hOffs+1.2*dist,v),color=dColor,button='buttonRight',texture=bs.getTexture('rightButton'),scale=1.0)
-        self._captureButton(pos=(hOffs,v-0.95*dist),color=dColor,button='buttonDown',texture=bs.getTexture('downButton'),scale=1.0)
-
-        if self._uniqueID == "#2":
-            self._captureButton(pos=(self._width*0.5,v+0.1*dist),color=(0.4,0.4,0.6),button='buttonStart',texture=bs.getTexture('startButton'),scale=0.8)
-
-        hOffs = self._width-160
-
-        self._captureButton(pos=(hOffs,v+0.95*dist),color=(0.6,0.4,0.8),button='buttonPickUp',texture=bs.getTexture('buttonPickUp'),scale=1.0)
-        self._captureButton(pos=(hOffs-1.2*dist,v),color=(0.7,0.5,0.1),button='buttonPunch',texture=bs.getTexture('buttonPunch'),scale=1.0)
-        self._captureButton(pos=(hOffs+1.2*dist,v),color=(0.5,0.2,0.1),button='buttonBomb',texture=bs.getTexture('buttonBomb'),scale=1.0)
-        self._captureButton(pos=(hOffs,v-0.95*dist),color=(0.2,0.5,0.2),button='buttonJump',texture=bs.getTexture('buttonJump'),scale=1.0)
-
-        # bs.buttonWidget(parent=self._rootWidget,label='Reset',textScale=0.7,color=(0.45,0.4,0.5),
-        #                 textColor=(0.65,0.6,0.7),position=(self._width*0.5-40,20),size=(80,30),onActivateCall=self._reset)
-
-    # def _reset(self):
-    #     # simply clear our config dict and rebuild the UI
-    #     getConfigDictForInputDevice(self._input,default=False,clear=True)
-    #     bs.realTimer(0,self._rebuildUI)
-
-    def _captureButton(self,pos,color,texture,button,scale=1.0):
-        baseSize = 79
-        b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(pos[0]-baseSize*0.5*scale,pos[1]-baseSize*0.5*scale),
-                            size=(baseSize*scale,baseSize*scale),
-                            texture=texture,label='',color=color)
-        # make this in a timer so that it shows up on top of all other buttons
-        def foo():
-            uiScale = 0.66*scale*2.0
-            maxWidth = 76.0*scale
-            t = bs.textWidget(parent=self._rootWidget,position=(pos[0]+0.0*scale,pos[1]-(57.0-18.0)*scale),
-                              color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='top',
-                              scale=uiScale, maxWidth=maxWidth,text=self._input.getButtonName(self._settings[button]));
-            bs.buttonWidget(edit=b,autoSelect=True,onActivateCall=bs.Call(AwaitKeyboardInputWindow,button,t,self._settings))
-
-        bs.realTimer(0,foo)
-
-    def _cancel(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = True
-
-    def _save(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        bs.playSound(bs.getSound('gunCocking'))
-
-        dst = getConfigLocationForInputDevice(self._input,default=False)
-        dst = dst[0][dst[1]]
-        dst.clear()
-        # store any values that aren't -1
-        for key,val in self._settings.items():
-            if val != -1: dst[key] = val
-        # if we're allowed to phone home, send this config so we can generate more defaults in the future
-        if bsUtils._shouldSubmitDebugInfo(): bsUtils.serverPut('controllerConfig',{'ua':bs.getEnvironment()['userAgentString'],'name':self._name,'config':dst,'v':2})
-        bs.applySettings()
-        bs.writeConfig()
-
-        uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
-        global gCanAskToConfigGamePads
-        gCanAskToConfigGamePads = True
 
 
 def getConfigLocationForInputDevice(device,default):
@@ -5536,437 +3561,9 @@ def getConfigLocationForInputDevice(device,default):
         if not uniqueID in jsconfig[name]: jsconfig[name][uniqueID] = {}
         return jsconfig[name],uniqueID
 
-class EditSoundtrackWindow(Window):
-
-    def __init__(self,existingSoundtrack,transition='inRight'):
-
-        bsConfig = bs.getConfig()
+class GetMacITunesPlaylistWindow(Window):
 
-        self._r = 'editSoundtrackWindow'
-
-        self._folderTex = bs.getTexture('folder')
-        self._fileTex = bs.getTexture('file')
-
-        self._width = 648
-        self._height = 395 if gSmallUI else 450 if gMedUI else 560
-        spacing = 40
-        buttonWidth = 350
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
-                                              scale=2.08 if gSmallUI else 1.5 if gMedUI else 1.0,
-                                              stackOffset=(0,-48) if gSmallUI else (0,15) if gMedUI else (0,0))
-
-        cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(38,self._height-60),size=(160,60),
-                                           autoSelect=True,label=bs.Lstr(resource='cancelText'),scale=0.8)
-        saveButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-168,self._height-60),
-                                         autoSelect=True,size=(160,60),label=bs.Lstr(resource='saveText'),scale=0.8)
-        bs.widget(edit=saveButton,leftWidget=cancelButton)
-        bs.widget(edit=cancelButton,rightWidget=saveButton)
-        t = bs.textWidget(parent=self._rootWidget,position=(0,self._height-50),
-                          size=(self._width,25),
-                          text=bs.Lstr(resource=self._r+('.editSoundtrackText' if existingSoundtrack is not None else '.newSoundtrackText')),
-                          color=gTitleColor,
-                          hAlign="center",vAlign="center",maxWidth=280)
-        v = self._height - 110
-
-        # make sure config exists
-        try: bsConfig['Soundtracks']
-        except Exception: bsConfig['Soundtracks'] = {}
-
-        if existingSoundtrack is not None:
-            # if they passed just a name, pull info from that soundtrack
-            if type(existingSoundtrack) is unicode:
-                self._soundtrack = copy.deepcopy(bsConfig['Soundtracks'][existingSoundtrack])
-                self._soundtrackName = existingSoundtrack
-                self._existingSoundtrackName = existingSoundtrack
-                self._lastEditedSongType = None
-            elif type(existingSoundtrack) is str:
-                print 'ERROR; got str existingSoundtrack'
-            else:
-                # otherwise they can pass info on an in-progress edit
-                self._soundtrack = existingSoundtrack['soundtrack']
-                self._soundtrackName = existingSoundtrack['name']
-                self._existingSoundtrackName = existingSoundtrack['existingName']
-                self._lastEditedSongType = existingSoundtrack['lastEditedSongType']
-        else:
-            self._soundtrackName = None
-            self._existingSoundtrackName = None
-            self._soundtrack = {}
-            self._lastEditedSongType = None
-
-        bs.textWidget(parent=self._rootWidget,
-                      # text=R.nameText,
-                      text=bs.Lstr(resource=self._r+'.nameText'),
-                      maxWidth=80,scale=0.8,
-                      position=(105,v+19),color=(0.8,0.8,0.8,0.5),size=(0,0),hAlign='right',vAlign='center')
-
-        # if there's no initial value, find a good initial unused name
-        if existingSoundtrack is None:
-            i = 1
-            stNameText = bs.Lstr(resource=self._r+'.newSoundtrackNameText').evaluate()
-            if '${COUNT}' not in stNameText: stNameText = stNameText+' ${COUNT}' # make sure we insert number *somewhere*
-            while True:
-                self._soundtrackName = stNameText.replace('${COUNT}',str(i))
-                if self._soundtrackName not in bsConfig['Soundtracks']: break
-                i += 1
-
-        self._textField = bs.textWidget(parent=self._rootWidget,position=(120,v-5),size=(self._width - 160,43),
-                                        text=self._soundtrackName,hAlign="left",
-                                        vAlign="center",
-                                        maxChars=32,
-                                        autoSelect=True,
-                                        editable=True,padding=4,
-                                        onReturnPressCall=self._doItWithSound)
-        
-        scrollHeight = self._height - 180
-        self._scrollWidget = scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=(40,v-(scrollHeight+10)),size=(self._width-80,scrollHeight),simpleCullingV=10)
-        bs.widget(edit=self._textField,downWidget=self._scrollWidget)
-        self._col = bs.columnWidget(parent=scrollWidget)
-
-        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-        bs.containerWidget(edit=self._col,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-
-        self._songTypeButtons = {}
-        self._refresh()
-        bs.buttonWidget(edit=cancelButton,onActivateCall=self._cancel)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton)
-        bs.buttonWidget(edit=saveButton,onActivateCall=self._doIt)
-        bs.containerWidget(edit=self._rootWidget,startButton=saveButton)
-
-        bs.widget(edit=self._textField,upWidget=cancelButton)
-        bs.widget(edit=cancelButton,downWidget=self._textField)
-        
-    def _refresh(self):
-        for w in self._col.getChildren():
-            w.delete()
-            
-        types = ['Menu',
-                 'CharSelectCOOP',
-                 'CharSelectFFA',
-                 'CharSelectTEAMS',
-                 'Last Stand',
-                 'ToTheDeath',
-                 'Onslaught',
-                 'Keep Away',
-                 'Race',
-                 'Epic Race',
-                 'Nightmare',
-                 'Marathon',
-                 'ForwardMarch',
-                 'FlagCatcher',
-                 'FlagSlip',
-                 'FlagDropper',
-                 'FlagBomber',
-                 'FlagRunner',
-                 'Survival',
-                 'Epic',
-                 'Hockey',
-                 'Football',
-                 'Flying',
-                 'Scary',
-                 'Marching',
-                 'GrandRomp',
-                 'Where Eagles Dare',
-                 'Toilet',
-                 'Chosen One',
-                 'Scores',
-                 'Victory',
-                 ]
-        # FIXME - we should probably convert this to use translations...
-        typeNamesTranslated = bsUtils._getResource('soundtrackTypeNames')
-        prevTypeButton = None
-        prevTestButton = None
-
-        bColor = (0.6,0.53,0.63)
-        bTextColor = (0.75,0.7,0.8)
-        
-        for index,songType in enumerate(types):
-            r = bs.rowWidget(parent=self._col,size=(self._width-40,40))
-            bs.containerWidget(edit=r,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-            try: typeName = typeNamesTranslated[songType]
-            except Exception: typeName = songType
-            t = bs.textWidget(parent=r,size=(230,25),alwaysHighlight=True,
-                              text=typeName,scale=0.7,hAlign='left',vAlign='center',maxWidth=190)
-
-            if songType in self._soundtrack: entry = self._soundtrack[songType]
-            else: entry = None
-
-            if entry is not None: entry = copy.deepcopy(entry) # make sure they dont muck with this after it gets to us
-
-            iconType = self._getEntryButtonDisplayIconType(entry)
-            self._songTypeButtons[songType] = b = bs.buttonWidget(parent=r,size=(230,32),label=self._getEntryButtonDisplayName(entry),
-                                                                  textScale=0.6,onActivateCall=bs.Call(self._getEntry,songType,entry,typeName),
-                                                                  icon=self._fileTex if iconType == 'file' else self._folderTex if iconType == 'folder' else None,
-                                                                  #color=bColor,textColor=(1,1,1),
-                                                                  iconColor=(1.1,0.8,0.2) if iconType == 'folder' else (1,1,1),
-                                                                  leftWidget=self._textField,
-                                                                  iconScale=0.7,autoSelect=True,upWidget=prevTypeButton)
-                                                                  #iconScale=0.7,upWidget=prevTypeButton)
-            if index == 0: bs.widget(edit=b,upWidget=self._textField)
-            bs.widget(edit=b,downWidget=b)
-
-            if self._lastEditedSongType is not None and songType == self._lastEditedSongType:
-                bs.containerWidget(edit=r,selectedChild=b,visibleChild=b)
-                bs.containerWidget(edit=self._col,selectedChild=r,visibleChild=r)
-                bs.containerWidget(edit=self._scrollWidget,selectedChild=self._col,visibleChild=self._col)
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget,visibleChild=self._scrollWidget)
-                
-            if prevTypeButton is not None: bs.widget(edit=prevTypeButton,downWidget=b)
-            prevTypeButton = b
-            t = bs.textWidget(parent=r,size=(10,32),text='') # spacing..
-            b = bs.buttonWidget(parent=r,size=(50,32),
-                                label=bs.Lstr(resource=self._r+'.testText'),
-                                textScale=0.6,onActivateCall=bs.Call(self._test,songType),
-                                upWidget=prevTestButton if prevTestButton is not None else self._textField)
-            if prevTestButton is not None: bs.widget(edit=prevTestButton,downWidget=b)
-            bs.widget(edit=b,downWidget=b,rightWidget=b)
-            prevTestButton = b
-
-    @classmethod
-    def _restoreEditor(cls,state,musicType,entry):
-        #print 'GOT CB',state,musicType,entry
-        # apply the change and recreate the window
-        soundtrack = state['soundtrack']
-        existingEntry = None if musicType not in soundtrack else soundtrack[musicType]
-        if existingEntry != entry:
-            bs.playSound(bs.getSound('gunCocking'))
-
-        # make sure this doesn't get mucked with after we get it
-        if entry is not None: entry = copy.deepcopy(entry)
-
-        entryType = bsUtils._getSoundtrackEntryType(entry)
-        if entryType == 'default':
-            # for 'default' entries simply exclude them from the list
-            if musicType in soundtrack: del soundtrack[musicType]
-        else:
-            soundtrack[musicType] = entry
-
-        uiGlobals['mainMenuWindow'] = cls(state,transition='inLeft').getRootWidget()
-        
-    def _getEntry(self,songType,entry,selectionTargetName):
-        if selectionTargetName != '':
-            selectionTargetName = "'"+selectionTargetName+"'"
-        state = {'name':self._soundtrackName,'existingName':self._existingSoundtrackName,'soundtrack':self._soundtrack,'lastEditedSongType':songType}
-        #bsUtils.getMusicPlayer().selectEntry(bs.Call(self._completionCB,songType),name)
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = bsUtils.getMusicPlayer().selectEntry(bs.Call(self._restoreEditor,state,songType),entry,selectionTargetName).getRootWidget()
-
-    def _test(self,songType):
-        # warn if volume is zero
-        if bsInternal._getSetting("Music Volume") < 0.01:
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource=self._r+'.musicVolumeZeroWarning'),color=(1,0.5,0))
-        bsUtils.setMusicPlayMode('test')
-        bsUtils._playMusic(songType,mode='test',testSoundtrack=self._soundtrack)
-
-    def _getEntryButtonDisplayName(self,entry):
-        entryType = bsUtils._getSoundtrackEntryType(entry)
-        if entryType == 'default':
-            entryName = bs.Lstr(resource=self._r+'.defaultGameMusicText')
-        elif entryType in ('musicFile','musicFolder'):
-            entryName = os.path.basename(bsUtils._getSoundtrackEntryName(entry))
-        else:
-            entryName = bsUtils._getSoundtrackEntryName(entry)
-        return entryName
-
-    def _getEntryButtonDisplayIconType(self,entry):
-        entryType = bsUtils._getSoundtrackEntryType(entry)
-        if entryType == 'musicFile':
-            return 'file'
-        elif entryType == 'musicFolder':
-            return 'folder'
-        else: return None
-
-    # def _completionCB(self,musicType,entry):
-    #     existingEntry = None if musicType not in self._soundtrack else self._soundtrack[musicType]
-    #     if existingEntry != entry:
-    #         bs.playSound(bs.getSound('gunCocking'))
-
-    #     # make sure this doesn't get mucked with after we get it
-    #     if entry is not None: entry = copy.deepcopy(entry)
-
-    #     entryType = bsUtils._getSoundtrackEntryType(entry)
-    #     if entryType == 'default':
-    #         # for 'default' entries simply exclude them from the list
-    #         if musicType in self._soundtrack: del self._soundtrack[musicType]
-    #     else:
-    #         self._soundtrack[musicType] = entry
-
-    #     bs.buttonWidget(edit=self._songTypeButtons[musicType],label=self._getEntryButtonDisplayName(entry),
-    #                     onActivateCall=bs.Call(self._getEntry,musicType,entry))
-
-    def _cancel(self):
-        # resets music back to normal..
-        bsUtils.setMusicPlayMode('regular')
-
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = SoundtracksWindow(transition='inLeft').getRootWidget()
-        #self._completionCall(None)
-
-    def _doIt(self):
-
-        bsConfig = bs.getConfig()
-        newName = bs.uni(bs.textWidget(query=self._textField))
-        if newName != self._soundtrackName and newName in bsConfig['Soundtracks']:
-            bs.screenMessage(bs.Lstr(resource=self._r+'.cantSaveAlreadyExistsText'))
-            bs.playSound(bs.getSound('error'))
-            return
-        if len(newName) == 0:
-            bs.playSound(bs.getSound('error'))
-            return
-        if newName == bs.Lstr(resource=self._r+'.defaultSoundtrackNameText').evaluate():
-            bs.screenMessage(bs.Lstr(resource=self._r+'.cantOverwriteDefaultText'))
-            bs.playSound(bs.getSound('error'))
-            return
-
-        # make sure config exists
-        try: bsConfig['Soundtracks']
-        except Exception: bsConfig['Soundtracks'] = {}
-
-        # if we had an old one, delete it
-        if self._existingSoundtrackName is not None and self._existingSoundtrackName in bsConfig['Soundtracks']:
-            del bsConfig['Soundtracks'][self._existingSoundtrackName]
-        bsConfig['Soundtracks'][newName] = self._soundtrack
-        bsConfig['Soundtrack'] = newName
-        
-        bs.writeConfig()
-        bs.playSound(bs.getSound('gunCocking'))
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        
-        # resets music back to normal
-        bsUtils.setMusicPlayMode('regular',forceRestart=True)
-
-        uiGlobals['mainMenuWindow'] = SoundtracksWindow(transition='inLeft').getRootWidget()
-        #self._completionCall(newName)
-
-    def _doItWithSound(self):
-        bs.playSound(bs.getSound('swish'))
-        self._doIt()
-
-
-
-class GetSoundtrackEntryTypeWindow(Window):
-
-    def __init__(self,callback,currentEntry,selectionTargetName,transition='inRight'):
-
-        self._r = 'editSoundtrackWindow'
-
-        self._callback = callback
-        self._currentEntry = copy.deepcopy(currentEntry)
-
-        self._width = 580
-        self._height = 220
-        spacing = 80
-        
-        doDefault = True
-        doITunesPlaylist = bsUtils._isSoundtrackEntryTypeSupported('iTunesPlaylist')
-        doMusicFile = bsUtils._isSoundtrackEntryTypeSupported('musicFile')
-        doMusicFolder = bsUtils._isSoundtrackEntryTypeSupported('musicFolder')
-
-        if doITunesPlaylist: self._height += spacing
-        if doMusicFile: self._height += spacing
-        if doMusicFolder: self._height += spacing
-
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
-                                              scale=1.7 if gSmallUI else 1.4 if gMedUI else 1.0)
-        b = bs.buttonWidget(parent=self._rootWidget,position=(35,self._height-65),size=(160,60),scale=0.8,textScale=1.2,
-                            label=bs.Lstr(resource='cancelText'),onActivateCall=self._onCancelPress)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-32),size=(0,0),
-                          text=bs.Lstr(resource=self._r+'.selectASourceText'),
-                          color=gTitleColor,
-                          maxWidth=230,hAlign="center",vAlign="center")
-
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-56),size=(0,0),
-                          text=selectionTargetName,color=gInfoTextColor,
-                          scale=0.7,maxWidth=230,hAlign="center",vAlign="center")
-
-        v = self._height - 155
-
-        currentEntryType = bsUtils._getSoundtrackEntryType(currentEntry)
-
-        if doDefault:
-            b = defaultGameMusicButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
-                                                         label=bs.Lstr(resource=self._r+'.useDefaultGameMusicText'),
-                                                         onActivateCall=self._onDefaultPress)
-            if currentEntryType == 'default':
-                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
-            v -= spacing
-
-        if doITunesPlaylist:
-            b = iTunesPlaylistButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
-                                                       label=bs.Lstr(resource=self._r+'.useITunesPlaylistText'),
-                                                       onActivateCall=self._onITunesPlaylistPress,
-                                                       icon=None)
-            if currentEntryType == 'iTunesPlaylist':
-                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
-            v -= spacing
-
-        if doMusicFile:
-            b = musicFileButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
-                                                  label=bs.Lstr(resource=self._r+'.useMusicFileText'),
-                                                  onActivateCall=self._onMusicFilePress,
-                                                  icon=bs.getTexture('file'))
-            if currentEntryType == 'musicFile':
-                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
-            v -= spacing
-
-        if doMusicFolder:
-            b = musicFolderButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
-                                                    label=bs.Lstr(resource=self._r+'.useMusicFolderText'),
-                                                    onActivateCall=self._onMusicFolderPress,
-                                                    icon=bs.getTexture('folder'),iconColor=(1.1,0.8,0.2))
-            if currentEntryType == 'musicFolder':
-                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
-            v -= spacing
-
-    def _onITunesPlaylistPress(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-
-        if bsUtils._getSoundtrackEntryType(self._currentEntry) == 'iTunesPlaylist':
-            currentPlaylistEntry = bsUtils._getSoundtrackEntryName(self._currentEntry)
-        else:
-            currentPlaylistEntry = None
-        uiGlobals['mainMenuWindow'] = GetMacITunesPlaylistWindow(self._callback,currentPlaylistEntry,self._currentEntry).getRootWidget()
-
-    def _onMusicFilePress(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        basePath = bsInternal._androidGetExternalStoragePath()
-        uiGlobals['mainMenuWindow'] = FileSelectorWindow(basePath,callback=self._musicFileSelectorCB,
-                                                         showBasePath=False,
-                                                         validFileExtensions=bsUtils._getValidMusicFileExtensions(),
-                                                         allowFolders=False).getRootWidget()
-
-    def _onMusicFolderPress(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        basePath = bsInternal._androidGetExternalStoragePath()
-        uiGlobals['mainMenuWindow'] = FileSelectorWindow(basePath,callback=self._musicFolderSelectorCB,
-                                                         showBasePath=False,
-                                                         validFileExtensions=[],
-                                                         allowFolders=True).getRootWidget()
-
-    def _musicFileSelectorCB(self,result):
-        if result is None:
-            self._callback(self._currentEntry)
-        else:
-            self._callback({'type':'musicFile','name':bs.uni(result)})
-
-    def _musicFolderSelectorCB(self,result):
-        if result is None:
-            self._callback(self._currentEntry)
-        else:
-            self._callback({'type':'musicFolder','name':bs.uni(result)})
-
-    def _onDefaultPress(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        self._callback(None)
-        
-    def _onCancelPress(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        self._callback(self._currentEntry)
-
-class GetMacITunesPlaylistWindow(Window):
-
-    def __init__(self,callback,existingPlaylist,existingEntry):
+    def __init__(self,callback,existingPlaylist,existingEntry):
         self._r = 'editSoundtrackWindow'
         self._callback = callback
         self._existingPlaylist = existingPlaylist
@@ -6022,10 +3619,14 @@ class GetMacITunesPlaylistWindow(Window):
         self._callback(self._existingEntry)
 
 
-class SoundtracksWindow(Window):
+class AccountWindow(Window):
 
-    def __init__(self,transition='inRight',originWidget=None):
+    def __init__(self,transition='inRight',modal=False,originWidget=None,closeOnceSignedIn=False):
 
+        self._closeOnceSignedIn = closeOnceSignedIn
+            
+        bsInternal._setAnalyticsScreen('Account Window')
+        
         # if they provided an origin-widget, scale up from that
         if originWidget is not None:
             self._transitionOut = 'outScale'
@@ -6035,430 +3636,116 @@ class SoundtracksWindow(Window):
             self._transitionOut = 'outRight'
             scaleOrigin = None
 
-        self._r = 'editSoundtrackWindow'
-        self._width = 600
-        self._height = 340 if gSmallUI else 370 if gMedUI else 440
-        spacing = 40
-        v = self._height - 40
-        v -= spacing*1.0
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
+        self._r = 'accountSettingsWindow'
+        self._modal = modal
+        self._needsRefresh = False
+        self._signedIn = (bsInternal._getAccountState() == 'SIGNED_IN')
+        self._accountStateNum = bsInternal._getAccountStateNum()
+        self._showLinked = True if self._signedIn and bsInternal._getAccountMiscReadVal('allowAccountLinking2',False) else False
+        self._checkSignInTimer = bs.Timer(1000,bs.WeakCall(self._update),timeType='real',repeat=True)
+        
+        # currently we can only reset achievements on game-center..
+        if self._signedIn: accountType = bsInternal._getAccountType()
+        else: accountType = None
+        if accountType == 'Game Center': self._canResetAchievements = True
+        else: self._canResetAchievements = False
+        
+        env = bs.getEnvironment()
+        
+        self._width = 660
+        self._height = 390 if gSmallUI else 430 if gMedUI else 490
+
+        self._signInButton = None
+        self._signInText = None
+        
+        self._scrollWidth = self._width - 100
+        self._scrollHeight = self._height - 120
+        self._subWidth = self._scrollWidth-20
+
+        # determine which sign-in/sign-out buttons we should show..
+        self._showSignInButtons = []
+
+        #print 'PLATFORM',env['platform'],'SUB',env['subplatform']
+        
+        if env['platform'] == 'android' and env['subplatform'] == 'google':
+            self._showSignInButtons.append('Google Play')
+            
+        elif env['platform'] == 'android' and env['subplatform'] == 'amazon':
+            self._showSignInButtons.append('Game Circle')
+
+        # elif env['platform'] == 'android' and env['subplatform'] == 'alibaba':
+        #     self._showSignInButtons.append('Ali')
+
+        # Local accounts are generally always available with a few key exceptions
+        # if not (env['platform'] == 'android' and env['subplatform'] == 'alibaba'):
+        self._showSignInButtons.append('Local')
+        
+        # show old test-account option *only* if we've been installed since before build 14101
+        # (after then, people should just use device accounts for the same purpose)
+        if env['testBuild'] or (env['platform'] == 'android' and env['subplatform'] in ['oculus','cardboard']):
+            if bs.getConfig().get('lc14c',0) > 1:
+                self._showSignInButtons.append('Test')
+        
+        topExtra = 15 if gSmallUI else 0
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),transition=transition,
                                               toolbarVisibility='MENU_MINIMAL',
                                               scaleOriginStackOffset=scaleOrigin,
-                                              scale=2.3 if gSmallUI else 1.6 if gMedUI else 1.0,
-                                              stackOffset=(0,-18) if gSmallUI else (0,0))
+                                              scale=2.09 if gSmallUI else 1.4 if gMedUI else 1.0,
+                                              stackOffset=(0,-19) if gSmallUI else (0,0))
 
-        if gToolbars and gSmallUI:
+        if gSmallUI and gToolbars:
             self._backButton = None
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
         else:
-            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(45,self._height-60),size=(120,60),
-                                                                scale=0.8,label=bs.Lstr(resource='backText'),buttonType='back',autoSelect=True)
-            if gDoAndroidNav:
-                bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(116,self._height-38))
-                
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-35),size=(0,0),maxWidth=300,
+            self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-62),size=(120,60),scale=0.8,textScale=1.2,
+                                                   autoSelect=True,
+                                                   label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
+                                                   buttonType='regular' if self._modal else 'back',
+                                                   onActivateCall=self._back)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+            if not self._modal and gDoAndroidNav:
+                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,56),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(113,self._height-40))
+            
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-38),size=(0,0),
+                          # text=R.titleText,
                           text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,
+                          color=gTitleColor,maxWidth=self._width-340,
                           hAlign="center",vAlign="center")
 
-        
-        h = 43
-        v = self._height - 60
-        hspacing = 15
-        bColor = (0.6,0.53,0.63)
-        bTextColor = (0.75,0.7,0.8)
-
-        s = 1.0 if gSmallUI else 1.13 if gMedUI else 1.4
-        v -= 60.0*s
-        self._newButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
-                                              onActivateCall=self._newSoundtrack,
-                                              color=bColor,
-                                              buttonType='square',
-                                              autoSelect=True,
-                                              textColor=bTextColor,
-                                              textScale=0.7,
-                                              label=bs.Lstr(resource=self._r+'.newText'))
-        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
-        v -= 60.0*s
-
-
-        self._editButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
-                                               onActivateCall=self._editSoundtrack,
-                                               color=bColor,
-                                               buttonType='square',
-                                               autoSelect=True,
-                                               textColor=bTextColor,
-                                               textScale=0.7,
-                                               label=bs.Lstr(resource=self._r+'.editText'))
-        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
-        v -= 60.0*s
 
-        self._duplicateButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
-                                                    onActivateCall=self._duplicateSoundtrack,
-                                                    buttonType='square',
-                                                    autoSelect=True,
-                                                    color=bColor,
-                                                    textColor=bTextColor,
-                                                    textScale=0.7,
-                                                    label=bs.Lstr(resource=self._r+'.duplicateText'))
-        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
-        v -= 60.0*s
-
-        self._deleteButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
-                                                 onActivateCall=self._deleteSoundtrack,
-                                                 color=bColor,
-                                                 buttonType='square',
-                                                 autoSelect=True,
-                                                 textColor=bTextColor,
-                                                 textScale=0.7,
-                                                 label=bs.Lstr(resource=self._r+'.deleteText'))
-        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
+            
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
+                                             highlight=False,position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
+                                             size=(self._scrollWidth,self._scrollHeight))
+        self._subContainer = None
+        self._refresh()
+        self._restoreState()
 
-        v = self._height - 65
-        scrollHeight = self._height - 105
-        v -= scrollHeight
-        hspacing = 15
-        self._scrollWidget = scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(152,v),highlight=False,size=(self._width-205,scrollHeight))
-        bs.widget(edit=self._scrollWidget,leftWidget=self._newButton,rightWidget=bsInternal._getSpecialWidget('partyButton') if gToolbars else self._scrollWidget)
-        self._c = bs.columnWidget(parent=scrollWidget)
+    def _update(self):
 
+        # if they want us to close once we're signed in, do so.
+        if self._closeOnceSignedIn and self._signedIn:
+            self._back()
+            return
         
-        self._soundtracks = None
-        self._selectedSoundtrack = None
-        self._selectedSoundtrackIndex = None
-        self._soundtrackWidgets = []
-        self._allowChangingSoundtracks = False
-        self._refresh()
-        if self._backButton is not None:
-            bs.buttonWidget(edit=backButton,onActivateCall=self._back)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=backButton)
-        else:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
+        dirty = False
 
-        # try:
-        #     for b in [self._newButton,self._editButton,self._duplicateButton,self._deleteButton]:
-        #         bs.widget(edit=b,upWidget=scrollWidget)
-        #     self._restoreState()
-        # except Exception:
-        #     bs.printException('exception wiring up SoundtracksWindow')
+        # hmm should update this to use getAccountStateNum;
+        # theoretically if we switch from one signed-in account to another
+        # in the background this would break.
         
-    def _doDeleteSoundtrack(self):
-        try: del bs.getConfig()['Soundtracks'][self._selectedSoundtrack]
-        except Exception: pass
-        bs.writeConfig()
-        bs.playSound(bs.getSound('shieldDown'))
-        if self._selectedSoundtrackIndex >= len(self._soundtracks):
-            self._selectedSoundtrackIndex = len(self._soundtracks)
-        self._refresh()
+        accountStateNum = bsInternal._getAccountStateNum()
+        accountState = bsInternal._getAccountState()
 
-    def _deleteSoundtrack(self):
-        if self._selectedSoundtrack is None: return
-        if self._selectedSoundtrack == '__default__':
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource=self._r+'.cantDeleteDefaultText'))
-        else:
-            ConfirmWindow(bs.Lstr(resource=self._r+'.deleteConfirmText',subs=[("${NAME}",self._selectedSoundtrack)]),self._doDeleteSoundtrack,450,150)
+        showLinked = True if self._signedIn and bsInternal._getAccountMiscReadVal('allowAccountLinking2',False) else False
 
-    def _duplicateSoundtrack(self):
-        try: soundtracks = [bs.getConfig()['Soundtracks']]
-        except Exception: bs.getConfig()['Soundtracks'] = {}
-
-        if self._selectedSoundtrack is None: return
-        if self._selectedSoundtrack == '__default__':
-            pl = {}
-        else:
-            pl = bs.getConfig()['Soundtracks'][self._selectedSoundtrack]
-
-        # find a valid dup name that doesn't exist
-        testIndex = 1
-        copyText = bs.Lstr(resource='copyOfText').evaluate()
-        copyWord = copyText.replace('${NAME}','').strip() # get just 'Copy' or whatnot
-        baseName = self._getSoundtrackDisplayName(self._selectedSoundtrack).evaluate()
-        if type(baseName) is not unicode:
-            print 'expected uni baseName 3fj0'
-            baseName = baseName.decode('utf-8')
-        
-        # if it looks like a copy, strip digits and spaces off the end
-        if copyWord in baseName:
-            while baseName[-1].isdigit() or baseName[-1] == ' ': baseName = baseName[:-1]
-        while True:
-            if copyWord in baseName: testName = baseName
-            else: testName = copyText.replace('${NAME}',baseName)
-            if testIndex > 1: testName += ' '+str(testIndex)
-            if not testName in bs.getConfig()['Soundtracks']: break
-            testIndex += 1
-
-            # testName = baseName + (copyStr if testIndex < 2 else copyStr+' '+str(testIndex))
-            # if not testName in bs.getConfig()['Soundtracks']:
-            #     break
-            # testIndex += 1
-
-        bs.getConfig()['Soundtracks'][testName] = copy.deepcopy(pl)
-        bs.writeConfig()
-        #bs.playSound(bs.getSound('gunCocking'))
-        self._refresh(selectSoundtrack=testName)
-
-
-    def _select(self,name,index):
-        self._selectedSoundtrackIndex = index
-        self._selectedSoundtrack = name
-
-        try: currentSoundtrack = bs.getConfig()['Soundtrack']
-        except Exception: currentSoundtrack = '__default__'
-
-        # if it varies from current, write to prefs and apply
-        if currentSoundtrack != name and self._allowChangingSoundtracks:
-            bs.playSound(bs.getSound('gunCocking'))
-            bs.getConfig()['Soundtrack'] = self._selectedSoundtrack
-            bs.writeConfig()
-            # just play whats already playing.. this'll grab it from the new soundtrack
-            bsUtils._playMusic(bsUtils.gMusicTypes['regular'])
-
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = ConfigAudioWindow(transition='inLeft').getRootWidget()
-
-    def _editSoundtrackWithSound(self):
-        bs.playSound(bs.getSound('swish'))
-        self._editSoundtrack()
-
-    def _editSoundtrack(self):
-        if self._selectedSoundtrack is None: return
-        if self._selectedSoundtrack == u'__default__':
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource=self._r+'.cantEditDefaultText'))
-            return
-
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = EditSoundtrackWindow(existingSoundtrack=self._selectedSoundtrack).getRootWidget()
-
-    def _getSoundtrackDisplayName(self,soundtrack):
-        if soundtrack == '__default__':
-            return bs.Lstr(resource=self._r+'.defaultSoundtrackNameText')
-        else:
-            return bs.Lstr(value=soundtrack)
-        
-    def _refresh(self,selectSoundtrack=None):
-        self._allowChangingSoundtracks = False
-        oldSelection = self._selectedSoundtrack
-        # if there was no prev selection, look in prefs
-        if oldSelection is None:
-            try: oldSelection = bs.getConfig()['Soundtrack']
-            except Exception: pass
-        oldSelectionIndex = self._selectedSoundtrackIndex
-
-        # delete old
-        while len(self._soundtrackWidgets) > 0: self._soundtrackWidgets.pop().delete()
-        try: self._soundtracks = bs.getConfig()['Soundtracks']
-        except Exception: self._soundtracks = {}
-        items = self._soundtracks.items()
-        items.sort(key=lambda x:x[0].lower())
-        items = [['__default__',None]] + items # default is always first
-        index = 0
-        for pName,p in items:
-            w = bs.textWidget(parent=self._c,size=(self._width-40,24),
-                              text=self._getSoundtrackDisplayName(pName),hAlign='left',vAlign='center',
-                              maxWidth=self._width-110,
-                              alwaysHighlight=True,
-                              onSelectCall=bs.WeakCall(self._select,pName,index),
-                              onActivateCall=self._editSoundtrackWithSound,
-                              selectable=True)
-            if index == 0: bs.widget(edit=w,upWidget=self._backButton)
-            self._soundtrackWidgets.append(w)
-            # select this one if the user requested it
-            if selectSoundtrack is not None:
-                if pName == selectSoundtrack:
-                    bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
-            else:
-                # select this one if it was previously selected
-                if oldSelectionIndex is not None: # go by index if there's one
-                    if index == oldSelectionIndex:
-                        bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
-                else: # otherwise look by name
-                    if pName == oldSelection:
-                        bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
-            index += 1
-
-        # explicitly run select callback on current one and re-enable callbacks
-        
-        # eww need to run this in a timer so it happens after our select calbacks..
-        # with a small-enough time sometimes it happens before anyway.. ew.
-        # need a way to just schedule a callable i guess..
-        bs.realTimer(100,bs.WeakCall(self._setAllowChanging))
-
-    def _setAllowChanging(self):
-        self._allowChangingSoundtracks = True
-        self._select(self._selectedSoundtrack,self._selectedSoundtrackIndex)
-        
-    def _newSoundtrack(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        #EditSoundtrackWindow(existingSoundtrack=None,completionCall=self._createDone)
-        EditSoundtrackWindow(existingSoundtrack=None)
-
-    def _createDone(self,newSoundtrack):
-        if newSoundtrack is not None:
-            bs.playSound(bs.getSound('gunCocking'))
-            self._refresh(selectSoundtrack=newSoundtrack)
-
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._scrollWidget: selName = 'Scroll'
-            elif sel == self._newButton: selName = 'New'
-            elif sel == self._editButton: selName = 'Edit'
-            elif sel == self._duplicateButton: selName = 'Duplicate'
-            elif sel == self._deleteButton: selName = 'Delete'
-            elif sel == self._backButton: selName = 'Back'
-            else: raise Exception("unrecognized selection")
-            gWindowStates[self.__class__.__name__] = selName
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
-
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]
-            except Exception: selName = None
-            if selName == 'Scroll': sel = self._scrollWidget
-            elif selName == 'New': sel = self._newButton
-            elif selName == 'Edit': sel = self._editButton
-            elif selName == 'Duplicate': sel = self._duplicateButton
-            elif selName == 'Delete': sel = self._deleteButton
-            else: sel = self._scrollWidget
-            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-
-
-class AccountWindow(Window):
-
-    def __init__(self,transition='inRight',modal=False,originWidget=None,closeOnceSignedIn=False):
-
-        self._closeOnceSignedIn = closeOnceSignedIn
-            
-        bsInternal._setAnalyticsScreen('Account Window')
-        
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-
-        self._r = 'accountSettingsWindow'
-        self._modal = modal
-        self._needsRefresh = False
-        self._signedIn = (bsInternal._getAccountState() == 'SIGNED_IN')
-        self._accountStateNum = bsInternal._getAccountStateNum()
-        self._showLinked = True if self._signedIn and bsInternal._getAccountMiscReadVal('allowAccountLinking2',False) else False
-        self._checkSignInTimer = bs.Timer(1000,bs.WeakCall(self._update),timeType='real',repeat=True)
-        
-        # currently we can only reset achievements on game-center..
-        if self._signedIn: accountType = bsInternal._getAccountType()
-        else: accountType = None
-        if accountType == 'Game Center': self._canResetAchievements = True
-        else: self._canResetAchievements = False
-        
-        env = bs.getEnvironment()
-        
-        self._width = 660
-        self._height = 390 if gSmallUI else 430 if gMedUI else 490
-
-        self._signInButton = None
-        self._signInText = None
-        
-        self._scrollWidth = self._width - 100
-        self._scrollHeight = self._height - 120
-        self._subWidth = self._scrollWidth-20
-
-        # determine which sign-in/sign-out buttons we should show..
-        self._showSignInButtons = []
-
-        #print 'PLATFORM',env['platform'],'SUB',env['subplatform']
-        
-        if env['platform'] == 'android' and env['subplatform'] == 'google':
-            self._showSignInButtons.append('Google Play')
-            
-        elif env['platform'] == 'android' and env['subplatform'] == 'amazon':
-            self._showSignInButtons.append('Game Circle')
-
-        # elif env['platform'] == 'android' and env['subplatform'] == 'alibaba':
-        #     self._showSignInButtons.append('Ali')
-
-        # Local accounts are generally always available with a few key exceptions
-        # if not (env['platform'] == 'android' and env['subplatform'] == 'alibaba'):
-        self._showSignInButtons.append('Local')
-        
-        # show old test-account option *only* if we've been installed since before build 14101
-        # (after then, people should just use device accounts for the same purpose)
-        if env['testBuild'] or (env['platform'] == 'android' and env['subplatform'] in ['oculus','cardboard']):
-            if bs.getConfig().get('lc14c',0) > 1:
-                self._showSignInButtons.append('Test')
-        
-        topExtra = 15 if gSmallUI else 0
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=2.09 if gSmallUI else 1.4 if gMedUI else 1.0,
-                                              stackOffset=(0,-19) if gSmallUI else (0,0))
-
-        if gSmallUI and gToolbars:
-            self._backButton = None
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
-        else:
-            self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-62),size=(120,60),scale=0.8,textScale=1.2,
-                                                   autoSelect=True,
-                                                   label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
-                                                   buttonType='regular' if self._modal else 'back',
-                                                   onActivateCall=self._back)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-            if not self._modal and gDoAndroidNav:
-                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,56),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(113,self._height-40))
-            
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-38),size=(0,0),
-                          # text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,maxWidth=self._width-340,
-                          hAlign="center",vAlign="center")
-
-
-            
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
-                                             highlight=False,position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
-                                             size=(self._scrollWidth,self._scrollHeight))
-        self._subContainer = None
-        self._refresh()
-        self._restoreState()
-
-    def _update(self):
-
-        # if they want us to close once we're signed in, do so.
-        if self._closeOnceSignedIn and self._signedIn:
-            self._back()
-            return
-        
-        dirty = False
-
-        # hmm should update this to use getAccountStateNum;
-        # theoretically if we switch from one signed-in account to another
-        # in the background this would break.
-        
-        accountStateNum = bsInternal._getAccountStateNum()
-        accountState = bsInternal._getAccountState()
-
-        showLinked = True if self._signedIn and bsInternal._getAccountMiscReadVal('allowAccountLinking2',False) else False
-
-        if accountStateNum != self._accountStateNum or self._showLinked != showLinked or self._needsRefresh:
-            self._showLinked = showLinked
-            accountType = bsInternal._getAccountType() if accountState == 'SIGNED_IN' else 'unknown'
-            self._accountStateNum = accountStateNum
-            self._signedIn = (accountState == 'SIGNED_IN')
-            self._refresh()
+        if accountStateNum != self._accountStateNum or self._showLinked != showLinked or self._needsRefresh:
+            self._showLinked = showLinked
+            accountType = bsInternal._getAccountType() if accountState == 'SIGNED_IN' else 'unknown'
+            self._accountStateNum = accountStateNum
+            self._signedIn = (accountState == 'SIGNED_IN')
+            self._refresh()
 
 
         # go ahead and refresh some individual things that may change under us..
@@ -7044,528 +4331,42 @@ class AccountWindow(Window):
             bs.printException('error restoring state for',self.__class__)
 
 
-class ConfigAudioWindow(Window):
+class ResChangeConfirmWindow(object):
 
-    def __init__(self,transition='inRight',originWidget=None):
+    def __init__(self,configGraphicsWindow):
+        self._configGraphicsWindow = configGraphicsWindow
+        width = 550
+        height = 200
+        self._rootWidget = bs.containerWidget(size=(width,height),transition='inRight')
+        self._confirmCounter = 10
+        t = bs.textWidget(parent=self._rootWidget,position=(15,height-80),size=(width-30,30),
+                          text=bs.Lstr(resource='keepTheseSettingsText'),
+                          maxWidth=width*0.95,
+                          color=(0,1,0,1),
+                          scale=1.3,
+                          hAlign="center",vAlign="center")
+        self._timeText = bs.textWidget(parent=self._rootWidget,position=(15,40),size=(width-30,30),
+                                       text=("10"),
+                                       hAlign="center",vAlign="top")
+        self._revertButton = b = bs.buttonWidget(parent=self._rootWidget,position=(25,40),size=(160,50),label=bs.Lstr(resource='revertText'),onActivateCall=self._revert)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+        b = bs.buttonWidget(parent=self._rootWidget,position=(width-190,40),size=(160,50),label=bs.Lstr(resource='keepText'),onActivateCall=self._keep)
+        self._timer = bs.Timer(1000,bs.WeakCall(self._tick),repeat=True,timeType='real')
 
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
+    def _keep(self):
+        self._timer = None
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
 
-        self._r = 'audioSettingsWindow'
+    def _revert(self):
+        self._timer = None
+        self._configGraphicsWindow._setRes(self._configGraphicsWindow._oldRes,confirm=False,playSound=True)
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
 
-        spacing = 50
-        width = 460
-        height = 210
-
-        showVRHeadRelativeAudio = True if bs.getEnvironment()['vrMode'] else False
-
-        if showVRHeadRelativeAudio: height += 70
-        
-        showSoundtracks = False
-        if bsUtils.haveMusicPlayer():
-            showSoundtracks = True
-            height += spacing*2.0
-
-        baseScale=2.05 if gSmallUI else 1.6 if gMedUI else 1.0
-        popupMenuScale = baseScale*1.2
-
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,scale=baseScale,
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              stackOffset=(0,-20) if gSmallUI else (0,0))
-        self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-55),size=(120,60),scale=0.8,textScale=1.2,
-                                                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back,autoSelect=True)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-        v = height - 60
-        v -= spacing*1.0
-        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,height-32),size=(0,0),
-                          # text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,
-                          maxWidth=180,
-                          hAlign="center",vAlign="center")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(98,height-32))
-        
-
-        self._soundVolumeWidgets = sv = configTextBox(parent=self._rootWidget,position=(40,v),xOffset=10,name="Sound Volume",
-                                                      # displayName=R.soundVolumeText,
-                                                      displayName=bs.Lstr(resource=self._r+'.soundVolumeText'),
-                                                      type="float",minVal=0,maxVal=1.0,increment=0.1)
-        if gToolbars:
-            bs.widget(edit=sv['plusButton'],rightWidget=bsInternal._getSpecialWidget('partyButton'))
-        v -= spacing
-        self._musicVolumeWidgets = mv = configTextBox(parent=self._rootWidget,position=(40,v),xOffset=10,name="Music Volume",
-                                                      # displayName=R.musicVolumeText,
-                                                      displayName=bs.Lstr(resource=self._r+'.musicVolumeText'),
-                                                      type="float",minVal=0,maxVal=1.0,increment=0.1,callback=bsUtils._musicVolumeChanged,changeSound=None)
-
-        v -= 0.5*spacing
-        
-        if showVRHeadRelativeAudio:
-            v -= 40
-            t = bs.textWidget(parent=self._rootWidget,position=(40,v+24),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.headRelativeVRAudioText'),
-                              color=(0.8,0.8,0.8),maxWidth=230,
-                              hAlign="left",vAlign="center")
-            
-            p = PopupMenu(parent=self._rootWidget,position=(290,v),width=120,buttonSize=(135,50),scale=popupMenuScale,
-                          choices=['Auto','On','Off'],
-                          choicesDisplay=[bs.Lstr(resource='autoText'),
-                                          bs.Lstr(resource='onText'),
-                                          bs.Lstr(resource='offText')],
-                          currentChoice=bsInternal._getSetting('VR Head Relative Audio'),onValueChangeCall=self._setVRHeadRelativeAudio)
-            self._vrHeadRelativeAudioButton = p.getButtonWidget()
-            t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v-11),size=(0,0),
-                              text=bs.Lstr(resource=self._r+'.headRelativeVRAudioInfoText'),
-                              scale=0.5,
-                              color=(0.7,0.8,0.7),maxWidth=400,flatness=1.0,
-                              hAlign="center",vAlign="center")
-            v -= 30
-        else:
-            self._vrHeadRelativeAudioButton = None
-            
-
-        
-        if showSoundtracks:
-            v -= 1.2*spacing
-            self._soundtrackButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-310)/2,v),size=(310,50),autoSelect=True,
-                                                         # label=R.soundtrackButtonText,
-                                                         label=bs.Lstr(resource=self._r+'.soundtrackButtonText'),
-                                                         onActivateCall=self._doSoundtracks)
-            v -= spacing*0.5
-            bs.textWidget(parent=self._rootWidget,position=(0,v),size=(width,20),
-                          # text=R.soundtrackDescriptionText,
-                          text=bs.Lstr(resource=self._r+'.soundtrackDescriptionText'),
-                          flatness=1.0,hAlign='center',scale=0.5,color=(0.7,0.8,0.7,1.0),maxWidth=400)
-        else:
-            self._soundtrackButton = None
-
-        # tweak a few navigation bits
-        try:
-            bs.widget(edit=backButton,downWidget=sv['minusButton'])
-            # if self._soundtrackButton is not None:
-            #     bs.widget(edit=self._soundtrackButton,upWidget=mv['minusButton'])
-        except Exception:
-            bs.printException('error wiring ConfigAudioWindow')
-
-        self._restoreState()
-
-    def _setVRHeadRelativeAudio(self,val):
-        bs.getConfig()['VR Head Relative Audio'] = val
-        bs.applySettings()
-        bs.writeConfig()
-            
-    def _doSoundtracks(self):
-        # we require disk access for soundtracks;
-        # if we don't have it, request it..
-        if not bsInternal._havePermission("storage"):
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource='storagePermissionAccessText'),color=(1,0,0))
-            bsInternal._requestPermission("storage")
-            return
-        
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = SoundtracksWindow(originWidget=self._soundtrackButton).getRootWidget()
-
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = SettingsWindow(transition='inLeft').getRootWidget()
-
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._soundVolumeWidgets['minusButton']: selName = 'SoundMinus'
-            elif sel == self._soundVolumeWidgets['plusButton']: selName = 'SoundPlus'
-            elif sel == self._musicVolumeWidgets['minusButton']: selName = 'MusicMinus'
-            elif sel == self._musicVolumeWidgets['plusButton']: selName = 'MusicPlus'
-            elif sel == self._soundtrackButton: selName = 'Soundtrack'
-            elif sel == self._backButton: selName = 'Back'
-            elif sel == self._vrHeadRelativeAudioButton: selName = 'VRHeadRelative'
-            else: raise Exception("unrecognized selected widget")
-            gWindowStates[self.__class__.__name__] = selName
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
-
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]
-            except Exception: selName = None
-            if selName == 'SoundMinus': sel = self._soundVolumeWidgets['minusButton']
-            elif selName == 'SoundPlus': sel = self._soundVolumeWidgets['plusButton']
-            elif selName == 'MusicMinus': sel = self._musicVolumeWidgets['minusButton']
-            elif selName == 'MusicPlus': sel = self._musicVolumeWidgets['plusButton']
-            elif selName == 'VRHeadRelative': sel = self._vrHeadRelativeAudioButton
-            elif selName == 'Soundtrack': sel = self._soundtrackButton
-            elif selName == 'Back': sel = self._backButton
-            else: sel = self._backButton
-            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-
-
-class GraphicsWindow(Window):
-
-    def __init__(self,transition='inRight',originWidget=None):
-
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-
-        self._r = 'graphicsSettingsWindow'
-        env = bs.getEnvironment()
-        
-        spacing = 32
-        self._haveSelectedChild = False
-        ua = env['userAgentString']
-        interfaceType = env['interfaceType']
-        width = 450
-        height = 302
-
-        self._showFullscreen = False
-        fullscreenSpacingTop = spacing*0.2
-        fullscreenSpacing = spacing*1.2
-        if interfaceType == 'large':
-            self._showFullscreen = True
-            height += fullscreenSpacing+fullscreenSpacingTop
-
-        showGamma = False
-        gammaSpacing = spacing*1.3
-        #if interfaceType == 'large':
-        if bsInternal._hasGammaControl():
-            showGamma = True
-            height += gammaSpacing
-
-        showVSync = False
-        if 'Mac' in ua or 'macos' in ua:
-            showVSync = True
-
-        showResolution = True
-        if env['vrMode']: showResolution = False
-            
-        baseScale = 2.4 if gSmallUI else 1.5 if gMedUI else 1.0
-        popupMenuScale = baseScale*1.2
-        v = height - 50
-        v -= spacing*1.15
-        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=baseScale,
-                                              stackOffset=(0,-30) if gSmallUI else (0,0))
-
-        backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-50),size=(120,60),scale=0.8,textScale=1.2,autoSelect=True,
-                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
-
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-        t = bs.textWidget(parent=self._rootWidget,position=(0,height-44),size=(width,25),
-                          # text=R.titleText,
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          color=gTitleColor,
-                          hAlign="center",vAlign="top")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(100,height-37))
-        
-        if self._showFullscreen:
-            v -= fullscreenSpacingTop
-            self._fullscreenCheckBox = configCheckBox(parent=self._rootWidget,position=(100,v),maxWidth=200,
-                                                      size=(300,30),name="Fullscreen",
-                                                      displayName=bs.Lstr(resource=self._r+('.fullScreenCmdText' if 'Mac' in ua else '.fullScreenCtrlText')))
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._fullscreenCheckBox)
-                self._haveSelectedChild = True
-            v -= fullscreenSpacing
-        else:
-            self._fullscreenCheckBox = None
-
-        if showGamma:
-            self._gammaControls = tb = configTextBox(parent=self._rootWidget,position=(90,v),
-                                                     name="Screen Gamma",
-                                                     # displayName=R.gammaText,
-                                                     displayName=bs.Lstr(resource=self._r+'.gammaText'),
-                                                     type="float",minVal=0.1,maxVal=2.0,
-                                                     increment=0.1,xOffset=-70,textScale=0.85)
-            if gToolbars:
-                bs.widget(edit=tb['plusButton'],rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            
-            if not self._haveSelectedChild:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=tb['minusButton'])
-                self._haveSelectedChild = True
-            v -= gammaSpacing
-        else:
-            self._gammaControls = None
-
-        self._selectedColor=(0.5,1,0.5,1)
-        self._unselectedColor=(0.7,0.7,0.7,1)
-
-        # quality
-        hOffs = 15
-        t = bs.textWidget(parent=self._rootWidget,position=(60,v),size=(160,25),
-                          # text=R.visualsText,
-                          text=bs.Lstr(resource=self._r+'.visualsText'),
-                          color=gHeadingColor,scale=0.65,maxWidth=150,
-                          hAlign="center",vAlign="center")
-        visualsPopup = PopupMenu(parent=self._rootWidget,position=(60,v-50),width=150,scale=popupMenuScale,
-                                 choices=['Auto','Higher','High','Medium','Low'],
-                                 choicesDisabled=['Higher','High'] if bsInternal._getMaxGraphicsQuality() == 'Medium' else [],
-                                 choicesDisplay=[bs.Lstr(resource='autoText'),
-                                                 bs.Lstr(resource=self._r+'.higherText'),
-                                                 bs.Lstr(resource=self._r+'.highText'),
-                                                 bs.Lstr(resource=self._r+'.mediumText'),
-                                                 bs.Lstr(resource=self._r+'.lowText')],
-                                 currentChoice=bsInternal._getSetting('Graphics Quality'),onValueChangeCall=self._setQuality)
-
-        # texture controls
-        hOffs = 210
-        t = bs.textWidget(parent=self._rootWidget,position=(230,v),size=(160,25),
-                          # text=R.texturesText,
-                          text=bs.Lstr(resource=self._r+'.texturesText'),
-                          color=gHeadingColor,scale=0.65,maxWidth=150,
-                          hAlign="center",vAlign="center")
-        texturesPopup = PopupMenu(parent=self._rootWidget,position=(230,v-50),width=150,scale=popupMenuScale,
-                                  choices=['Auto','High','Medium','Low'],
-                                  choicesDisplay=[bs.Lstr(resource='autoText'),
-                                                  bs.Lstr(resource=self._r+'.highText'),
-                                                  bs.Lstr(resource=self._r+'.mediumText'),
-                                                  bs.Lstr(resource=self._r+'.lowText')],
-                                  currentChoice=bsInternal._getSetting('Texture Quality'),onValueChangeCall=self._setTextures)
-        if gToolbars:
-            bs.widget(edit=texturesPopup.getButtonWidget(),rightWidget=bsInternal._getSpecialWidget('partyButton'))
-        v -= 80
-
-        hOffs = 0
-
-        if showResolution:
-            # resolution
-            t = bs.textWidget(parent=self._rootWidget,position=(hOffs+60,v),size=(160,25),
-                              # text=R.resolutionText,
-                              text=bs.Lstr(resource=self._r+'.resolutionText'),
-                              color=gHeadingColor,scale=0.65,maxWidth=150,
-                              hAlign="center",vAlign="center")
-
-
-            # on android we have 'Auto', 'Native', and a few HD standards
-            if env['platform'] == 'android':
-                nativeRes = bsInternal._getDisplayResolution()
-                choices = ['Auto','Native']
-                choicesDisplay = [bs.Lstr(resource='autoText'),bs.Lstr(resource='nativeText')]
-                #choicesDisabled = []
-                for res in [1440,1080,960,720,480]:
-                    # nav bar is 72px so lets allow for that in what choices we show
-                    if nativeRes[1] >= res-72:
-                        resStr = str(res)+'p'
-                        choices.append(resStr)
-                        choicesDisplay.append(bs.Lstr(value=resStr))
-                currentRes = bsInternal._getSetting('Resolution (Android)')
-                resPopup = PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),width=120,scale=popupMenuScale,
-                                     choices=choices,choicesDisplay=choicesDisplay,
-                                     currentChoice=currentRes,onValueChangeCall=self._setAndroidRes)
-
-            else:
-
-                # if we're on a system that doesn't allow setting resolution, set pixel-scale instead
-                currentRes = bsInternal._getDisplayResolution()
-                if currentRes is None:
-                    currentRes = str(min(100,max(10,int(round(bsInternal._getSetting('Screen Pixel Scale')*100.0)))))+'%'
-                    resPopup = PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),width=120,scale=popupMenuScale,
-                                         choices=['100%','88%','75%','63%','50%'],
-                                         currentChoice=currentRes,onValueChangeCall=self._setPixelScale)
-                else:
-                    resolutions = bsInternal._getDisplayResolutions()
-                    resList = ['Desktop Res']+resolutions
-                    resListDisplay = [bs.Lstr(resource='desktopResText').evaluate()]+resolutions
-                    resPopup = PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),scale=popupMenuScale,
-                                         choices=resList,
-                                         choicesDisplay=resListDisplay,
-                                         currentChoice=currentRes,onValueChangeCall=self._setRes)
-                    self._resPopup = weakref.ref(resPopup)
-        hOffs = 210
-
-        # vsync
-        if showVSync:
-            t = bs.textWidget(parent=self._rootWidget,position=(230,v),
-                              size=(160,25),
-                              # text=R.verticalSyncText,
-                              text=bs.Lstr(resource=self._r+'.verticalSyncText'),
-                              color=gHeadingColor,scale=0.65,maxWidth=150,
-                              hAlign="center",vAlign="center")
-
-            vSyncPopup = PopupMenu(parent=self._rootWidget,position=(230,v-50),width=150,scale=popupMenuScale,
-                                   choices=['Auto','Always','Never'],
-                                   choicesDisplay=[bs.Lstr(resource='autoText'),
-                                                   bs.Lstr(resource=self._r+'.alwaysText'),
-                                                   bs.Lstr(resource=self._r+'.neverText')],
-                                   currentChoice=bsInternal._getSetting('Vertical Sync'),onValueChangeCall=self._setVSync)
-        else: vSyncPopup = None
-
-        v -= 90
-        fpsc = configCheckBox(parent=self._rootWidget,position=(69,v-6),
-                              size=(210,30),scale=0.86,name="Show FPS",
-                              # displayName=R.showFPSText,
-                              displayName=bs.Lstr(resource=self._r+'.showFPSText'),
-                              maxWidth=130)
-
-        # (tv mode doesnt apply to vr)
-        if not bs.getEnvironment()['vrMode']:
-            tvc = configCheckBox(parent=self._rootWidget,position=(240,v-6),
-                                  size=(210,30),scale=0.86,name="TV Border",
-                                 # displayName=R.tvBorderText,
-                                 displayName=bs.Lstr(resource=self._r+'.tvBorderText'),
-                                 maxWidth=130)
-            # grumble..
-            bs.widget(edit=fpsc,rightWidget=tvc)
-
-        try:
-            pass
-            # resB = resPopup.getButtonWidget()
-            # visB = visualsPopup.getButtonWidget()
-            # texB = texturesPopup.getButtonWidget()
-
-            # if self._gammaControls is not None:
-            #     if self._fullscreenCheckBox is not None:
-            #         bs.widget(edit=self._gammaControls['minusButton'],upWidget=self._fullscreenCheckBox)
-            #         bs.widget(edit=self._gammaControls['plusButton'],upWidget=self._fullscreenCheckBox)
-            #     else:
-            #         bs.widget(edit=self._gammaControls['minusButton'],upWidget=backButton)
-            #         bs.widget(edit=self._gammaControls['plusButton'],upWidget=backButton)
-            #     bs.widget(edit=self._gammaControls['minusButton'],downWidget=texB)
-            #     bs.widget(edit=self._gammaControls['plusButton'],downWidget=texB)
-            #     bs.widget(edit=texB,upWidget=self._gammaControls['plusButton'])
-            #     bs.widget(edit=visB,upWidget=self._gammaControls['minusButton'])
-
-            # # no gamma controls
-            # else:
-            #     if self._fullscreenCheckBox is not None:
-            #         bs.widget(edit=self._fullscreenCheckBox,rightWidget=texB)
-            #         bs.widget(edit=texB,upWidget=self._fullscreenCheckBox)
-            #         bs.widget(edit=visB,upWidget=self._fullscreenCheckBox)
-            #     else:
-            #         bs.widget(edit=texB,upWidget=backButton)
-
-            # bs.widget(edit=visB,downWidget=resB)
-            # bs.widget(edit=resB,upWidget=visB,downWidget=fpsc)
-            # bs.widget(edit=fpsc,upWidget=resB)
-            # if vSyncPopup is not None:
-            #     vsB = vSyncPopup.getButtonWidget()
-            #     bs.widget(edit=vsB,upWidget=texB,downWidget=tvc)
-            #     bs.widget(edit=texB,downWidget=vsB)
-            #     bs.widget(edit=tvc,upWidget=vsB)
-            # else:
-            #     bs.widget(edit=texB,downWidget=tvc)
-            #     bs.widget(edit=tvc,upWidget=texB)
-
-        except Exception:
-            bs.printException('Exception wiring up graphics settings UI:')
-
-        # fpsc = configCheckBox(parent=self._rootWidget,position=(150,v-7) if showVSync else (243,v+49),
-        #                       size=(210,30),scale=1.0 if showVSync else 0.85,name="Show FPS")
-        v -= spacing
-
-        # make a timer to update our controls in case the config changes under us
-        self._updateTimer = bs.Timer(250,bs.WeakCall(self._updateControls),repeat=True,timeType='real')
-
-    def _back(self):
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = SettingsWindow(transition='inLeft').getRootWidget()
-
-    def _setQuality(self,quality):
-        bs.getConfig()['Graphics Quality'] = quality
-        bs.applySettings()
-        bs.writeConfig()
-
-    def _setTextures(self,val):
-        bs.getConfig()['Texture Quality'] = val
-        bs.applySettings()
-        bs.writeConfig()
-
-    def _setAndroidRes(self,val):
-        #print 'PY SET RES',val
-        bs.getConfig()['Resolution (Android)'] = val
-        bs.writeConfig()
-        bs.applySettings()
-        
-    def _setPixelScale(self,res):
-        bs.getConfig()['Screen Pixel Scale'] = float(res[:-1])/100.0
-        bs.writeConfig()
-        bs.applySettings()
-        
-    def _setRes(self,res,confirm=True,playSound=False):
-        self._oldRes = bsInternal._getDisplayResolution()
-
-        if playSound: bs.playSound(bs.getSound('swish'))
-
-        bs.getConfig()['Screen Resolution'] = res
-
-        bs.writeConfig()
-        bs.applySettings()
-
-        rp = self._resPopup()
-        if rp is not None: rp.setChoice(res)
-
-        # if we're changing resolution in fullscreen mode, bring up a confirmation window to make sure the res is visible
-        if self._oldRes != res and confirm and bsInternal._('Fullscreen'):
-            ResChangeConfirmWindow(self)
-
-    def _setVSync(self,val):
-        bs.getConfig()['Vertical Sync'] = val
-        bs.applySettings()
-        bs.writeConfig()
-
-    def _updateControls(self):
-        if self._showFullscreen:
-            bs.checkBoxWidget(edit=self._fullscreenCheckBox,value=bsInternal._getSetting('Fullscreen'))
-
-class ResChangeConfirmWindow(object):
-
-    def __init__(self,configGraphicsWindow):
-        self._configGraphicsWindow = configGraphicsWindow
-        width = 550
-        height = 200
-        self._rootWidget = bs.containerWidget(size=(width,height),transition='inRight')
-        self._confirmCounter = 10
-        t = bs.textWidget(parent=self._rootWidget,position=(15,height-80),size=(width-30,30),
-                          text=bs.Lstr(resource='keepTheseSettingsText'),
-                          maxWidth=width*0.95,
-                          color=(0,1,0,1),
-                          scale=1.3,
-                          hAlign="center",vAlign="center")
-        self._timeText = bs.textWidget(parent=self._rootWidget,position=(15,40),size=(width-30,30),
-                                       text=("10"),
-                                       hAlign="center",vAlign="top")
-        self._revertButton = b = bs.buttonWidget(parent=self._rootWidget,position=(25,40),size=(160,50),label=bs.Lstr(resource='revertText'),onActivateCall=self._revert)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-        b = bs.buttonWidget(parent=self._rootWidget,position=(width-190,40),size=(160,50),label=bs.Lstr(resource='keepText'),onActivateCall=self._keep)
-        self._timer = bs.Timer(1000,bs.WeakCall(self._tick),repeat=True,timeType='real')
-
-    def _keep(self):
-        self._timer = None
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-
-    def _revert(self):
-        self._timer = None
-        self._configGraphicsWindow._setRes(self._configGraphicsWindow._oldRes,confirm=False,playSound=True)
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-
-    def _tick(self):
-        self._confirmCounter -= 1
-        bs.textWidget(edit=self._timeText,text=str(self._confirmCounter))
-        if self._confirmCounter == 0:
-            self._revertButton.activate()
+    def _tick(self):
+        self._confirmCounter -= 1
+        bs.textWidget(edit=self._timeText,text=str(self._confirmCounter))
+        if self._confirmCounter == 0:
+            self._revertButton.activate()
 
 def _promoCodeCallback(data):
     if data is None:
@@ -7831,11 +4632,44 @@ class NetTestingWindow(TestingWindow):
     # def _doBack(self):
     #     bs.containerWidget(edit=self._rootWidget,transition='outRight')    
         
-class AdvancedSettingsWindow(Window):
+def configCheckBox(parent,name,position,size,displayName=None,scale=None,maxWidth=None,autoSelect=True,valueChangeCall=None):
+    if displayName is None: displayName = name
 
-    # def __del__(self):
-    #     print '~AdvancedSettingsWindow()'
+    def _valueChanged(val):
+        bs.getConfig()[name] = val
+
+        if valueChangeCall is not None: valueChangeCall(val)
         
+        # special case: clicking kick-idle-players repeatedly unlocks co-op levels
+        if name == 'Kick Idle Players':
+            global gKickIdlePlayersKickCount
+            try: count = gKickIdlePlayersKickCount
+            except Exception: count = 1
+            count += 1
+            if count == 11:
+                try:
+                    import bsCoopGame
+                    #campaign = bsCoopGame.getCampaign('Default')
+                    levels = bsCoopGame.getCampaign('Default').getLevels() + bsCoopGame.getCampaign('Easy').getLevels()
+                    for level in levels: level.setComplete(True)
+                    bs.screenMessage("CO-OP LEVELS UNLOCKED! (temporarily)",color=(0,1,0))
+                    bs.playSound(bs.getSound('gunCocking'))
+                    bs.playSound(bs.getSound('gong'))
+                except Exception as e:
+                    print 'error during co-op unlock:',e
+                    bs.screenMessage("ERROR UNLOCKING CO-OP LEVELS",color=(1,0,0))
+                count = 1;
+            gKickIdlePlayersKickCount = count
+
+        bs.applySettings()
+        bs.writeConfig()
+
+    return bs.checkBoxWidget(parent=parent,autoSelect=autoSelect,position=position,size=size,text=displayName,textColor=(0.8,0.8,0.8),
+                             value=bsInternal._getSetting(name),onValueChangeCall=_valueChanged,scale=scale,maxWidth=maxWidth)
+                             
+                             
+class JRMPWindow(Window):
+
     def __init__(self,transition='inRight',originWidget=None):
 
         # if they provided an origin-widget, scale up from that
@@ -7846,523 +4680,12 @@ class AdvancedSettingsWindow(Window):
         else:
             self._transitionOut = 'outRight'
             scaleOrigin = None
-        
-        self._width = 670
-        self._height = 390 if gSmallUI else 450 if gMedUI else 520
-        self._spacing = 32
-        self._menuOpen = False
-        topExtra = 10 if gSmallUI else 0
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=2.06 if gSmallUI else 1.4 if gMedUI else 1.0,
-                                              stackOffset=(0,-25) if gSmallUI else (0,0))
-        self._prevLang = ""
-        self._prevLangList = []
-        self._completeLangsList = None
-        self._completeLangsError = False
-        self._languagePopup = None
 
-        # in vr-mode, the internal keyboard is currently the *only* option, so no need to show this..
-        self._showAlwaysUseInternalKeyboard = False if bs.getEnvironment()['vrMode'] else True
-        
-        self._scrollWidth = self._width - 100
-        self._scrollHeight = self._height - 115
-        self._subWidth = self._scrollWidth*0.95
-        self._subHeight = 732+50+60-60
-        
-        if self._showAlwaysUseInternalKeyboard: self._subHeight += 62
+        self._r = 'jrmpSettingsWindow'
 
-        self._doVRTestButton = True if bs.getEnvironment()['vrMode'] else False
-        
-        self._doNetTestButton = True
-
-        self._extraButtonSpacing = self._spacing * 2.5
-        
-        if self._doVRTestButton: self._subHeight += self._extraButtonSpacing
-        if self._doNetTestButton: self._subHeight += self._extraButtonSpacing
-
-        self._r = 'settingsWindowAdvanced'
-
-        if gToolbars:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._doBack)
-            self._backButton = None
-        else:
-            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(53,self._height-60),size=(140,60),scale=0.8,
-                                                                autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._doBack)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=self._backButton)
-
-        self._titleText = t = bs.textWidget(parent=self._rootWidget,position=(0,self._height-52),size=(self._width,25),
-                                            #text=R.titleText,
-                                            text=bs.Lstr(resource=self._r+'.titleText'),
-                                            color=gTitleColor,
-                                            hAlign="center",vAlign="top")
-
-        if gDoAndroidNav:
-            if self._backButton is not None:
-                bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(115,self._height-47))
-            
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(50,50),simpleCullingV=20.0,
-                                             highlight=False, size=(self._scrollWidth,self._scrollHeight))
-        bs.containerWidget(edit=self._scrollWidget,selectionLoopToParent=True)
-        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),
-                                                    background=False,selectionLoopToParent=True)
-
-        
-        self._rebuild()
-            
-        # rebuild periodically to pick up language changes/additions/etc
-        self._rebuildTimer = bs.Timer(1000,bs.WeakCall(self._rebuild),repeat=True,timeType='real')
-
-        # fetch the list of completed languages
-        bsUtils.serverGet('bsLangGetCompleted',{},callback=bs.WeakCall(self._completedLangsCB))
-    
-    def _updateLangStatus(self):
-        if self._completeLangsList is not None:
-            upToDate = (bs.getLanguage() in self._completeLangsList)
-            t = bs.textWidget(edit=self._langStatusText,text='' if bs.getLanguage() == 'Test' else bs.Lstr(resource=self._r+'.translationNoUpdateNeededText') if upToDate else bs.Lstr(resource=self._r+'.translationUpdateNeededText'),
-                              color=(0.2,1.0,0.2,0.8) if upToDate else (1.0,0.2,0.2,0.8))
-        else:
-            t = bs.textWidget(edit=self._langStatusText,
-                              text=bs.Lstr(resource=self._r+'.translationFetchErrorText') if self._completeLangsError else bs.Lstr(resource=self._r+'.translationFetchingStatusText'),
-                              color=(1.0,0.5,0.2) if self._completeLangsError else (0.7,0.7,0.7))
-            
-
-    def _rebuild(self):
-
-        # dont rebuild if the menu is open or if our language and language-list hasn't changed
-        # NOTE - although we now support widgets updating their own translations, we still change
-        # the label formatting on the language menu based on the language so still need this.
-        # ...however we could make this more limited to it only rebuilds that one menu instead of everything.
-        if self._menuOpen or (self._prevLang == bs.getLanguage(returnNoneForDefault=True) and self._prevLangList == bsUtils._getLanguages()): return
-        # if self._menuOpen or self._prevLangList == bsUtils._getLanguages(): return
-        self._prevLang = bs.getLanguage(returnNoneForDefault=True)
-        self._prevLangList = bsUtils._getLanguages()
-
-        # if our popup menu was selected we wanna restore that..
-        #langWasSelected = (self._languagePopup is not None and self._subContainer.getSelectedChild() == self._languagePopup.getButtonWidget())
-
-        # clear out our sub-container
-        children = self._subContainer.getChildren()
-        for c in children: c.delete()
-
-        
-        v = self._subHeight - 35
-
-        v -= self._spacing * 1.2
-
-        # update our existing back button and title
-        if self._backButton is not None:
-            bs.buttonWidget(edit=self._backButton,label=bs.Lstr(resource='backText'))
-            if gDoAndroidNav: bs.buttonWidget(edit=self._backButton,label=bs.getSpecialChar('back'))
-        
-        bs.textWidget(edit=self._titleText,
-                      text=bs.Lstr(resource=self._r+'.titleText'))
-        
-
-        thisButtonWidth = 410
-
-        self._promoCodeButton = bs.buttonWidget(parent=self._subContainer,
-                                                position=(self._subWidth/2-thisButtonWidth/2,v-14),
-                                                size=(thisButtonWidth,60),
-                                                autoSelect=True,
-                                                label=bs.Lstr(resource=self._r+'.enterPromoCodeText'),
-                                                textScale=1.0,
-                                                onActivateCall=self._onPromoCodePress)
-        if self._backButton is not None:
-            bs.widget(edit=self._promoCodeButton,upWidget=self._backButton,leftWidget=self._backButton)
-        v -= self._extraButtonSpacing * 0.8
-
-        t = bs.textWidget(parent=self._subContainer,position=(200,v+10),size=(0,0),
-                          text=bs.Lstr(resource=self._r+'.languageText'),
-                          maxWidth=150,
-                          scale=0.95,color=gTitleColor,hAlign='right',vAlign='center')
-
-        languages = bsUtils._getLanguages()
-        curLang = bs.getLanguage(returnNoneForDefault=True)
-        if curLang is None: curLang = 'Auto'
-
-        # we have a special dict of language names in that language
-        # so we dont have to import every language module here..
-        # (that causes hitches on slower systems)
-        langsTranslated = {}
-        for lang in languages:
-            langsTranslated[lang] = lang # default
-            if lang in bsServerData.languageNamesTranslated:
-                langsTranslated[lang] = bs.uni(bsServerData.languageNamesTranslated[lang])
-
-        langsFull = {}
-        for lang in languages:
-            lt = bs.Lstr(translate=('languages',lang)).evaluate()
-            if langsTranslated[lang] == lt:
-                langsFull[lang] = lt
-            else:
-                langsFull[lang] = langsTranslated[lang]+' ('+lt+')'
-
-        self._languagePopup = PopupMenu(parent=self._subContainer,position=(210,v-19),width=150,
-                                        openingCall=bs.WeakCall(self._onMenuOpen),closingCall=bs.WeakCall(self._onMenuClose),autoSelect=False,
-                                        onValueChangeCall=bs.WeakCall(self._onMenuChoice),
-                                        choices=['Auto']+languages,buttonSize=(250,60),
-                                        choicesDisplay=([bs.Lstr(value=(bs.Lstr(resource='autoText').evaluate()+' ('+bs.Lstr(translate=('languages',bsUtils._getDefaultLanguage())).evaluate()+')'))]
-                                                        +[bs.Lstr(value=langsFull[l]) for l in languages]),
-                                        currentChoice=curLang)
-
-        # bs.widget(edit=self._alwaysUseInternalKeyboardCheckBox if self._showAlwaysUseInternalKeyboard else self._kickIdlePlayersCheckBox,
-        #           downWidget=self._languagePopup.getButtonWidget())
-        # if langWasSelected:
-        #     bs.containerWidget(edit=self._subContainer,selectedChild=self._languagePopup.getButtonWidget())
-            
-        v -= self._spacing * 1.8
-
-        t = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v+10),size=(0,0),
-                          text=bs.Lstr(resource=self._r+'.helpTranslateText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
-                          maxWidth=self._subWidth*0.9,maxHeight=55,
-                          # flatness=1.0,scale=0.65*R.helpTranslateTextScale,color=(0.4,0.9,0.4,0.8),hAlign='center',vAlign='center')
-                          flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),hAlign='center',vAlign='center')
-        v -= self._spacing * 1.9
-        thisButtonWidth = 410
-        self._translationEditorButton = bs.buttonWidget(parent=self._subContainer,
-                                                        position=(self._subWidth/2-thisButtonWidth/2,v-24),
-                                                        size=(thisButtonWidth,60),
-                                                        label=bs.Lstr(resource=self._r+'.translationEditorButtonText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
-                                                        autoSelect=True,
-                                                        onActivateCall=bs.Call(bs.openURL,'http://bombsquadgame.com/translate'))
-
-        self._langStatusText = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-40),size=(0,0),
-                                             text='',flatness=1.0,
-                                             scale=0.63,
-                                             hAlign='center',vAlign='center',maxWidth=400.0)
-        self._updateLangStatus()
-        v -= self._spacing * 3.0
-
-        #v -= self._spacing * 1.0
-        self._kidFriendlyCheckBox = cb = configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Kid Friendly Mode",
-                                                        # displayName=R.kidFriendlyModeText,
-                                                        displayName=bs.Lstr(resource=self._r+'.kidFriendlyModeText'),
-                                                        scale=1.0,maxWidth=430)                                            
-                                                        
-        bs.widget(edit=self._translationEditorButton,downWidget=cb, upWidget=self._languagePopup.getButtonWidget())
-        # bs.widget(edit=cb,upWidget=self._backButton,leftWidget=self._backButton)
-
-        # if testButton is not None:
-        #     bs.widget(edit=backButton,rightWidget=testButton,downWidget=cb)
-        #     bs.widget(edit=testButton,leftWidget=backButton,downWidget=cb)
-        
-        v -= self._spacing * 1.2
-        self._kickIdlePlayersCheckBox = configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Kick Idle Players",autoSelect=True,
-                                                       # displayName=R.kickIdlePlayersText,
-                                                       displayName=bs.Lstr(resource=self._r+'.kickIdlePlayersText'),
-                                                       scale=1.0,maxWidth=430)
-
-        if self._showAlwaysUseInternalKeyboard:
-            v -= 42
-            self._alwaysUseInternalKeyboardCheckBox = configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Always Use Internal Keyboard",
-                                                                     autoSelect=True,
-                                                                     # displayName=R.alwaysUseInternalKeyboardText,
-                                                                     displayName=bs.Lstr(resource=self._r+'.alwaysUseInternalKeyboardText'),
-                                                                     scale=1.0,maxWidth=430)
-            t = bs.textWidget(parent=self._subContainer,position=(90,v-10),size=(0,0),
-                              # text=R.alwaysUseInternalKeyboardDescriptionText,
-                              text=bs.Lstr(resource=self._r+'.alwaysUseInternalKeyboardDescriptionText'),
-                              maxWidth=400,flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),
-                              hAlign='left',vAlign='center')
-            v -= 20
-        else: self._alwaysUseInternalKeyboardCheckBox = None
-
-        
-        v -= self._spacing * 2.1
-        
-
-        thisButtonWidth = 410
-        self._showUserModsButton = bs.buttonWidget(parent=self._subContainer,
-                                                   position=(self._subWidth/2-thisButtonWidth/2,v-10),
-                                                   size=(thisButtonWidth,60),
-                                                   autoSelect=True,
-                                                   # label=R.showUserModsText,
-                                                   label=bs.Lstr(resource=self._r+'.showUserModsText'),
-                                                   textScale=1.0,
-                                                   onActivateCall=bsUtils.showUserScripts)
-        if self._showAlwaysUseInternalKeyboard:
-            bs.widget(edit=self._alwaysUseInternalKeyboardCheckBox,downWidget=self._showUserModsButton)
-            bs.widget(edit=self._showUserModsButton,upWidget=self._alwaysUseInternalKeyboardCheckBox)
-        else:
-            bs.widget(edit=self._showUserModsButton,upWidget=self._kickIdlePlayersCheckBox)
-            bs.widget(edit=self._kickIdlePlayersCheckBox,downWidget=self._showUserModsButton)
-            
-            
-        v -= self._spacing * 2.0
-        
-        b = self._moddingGuideButton = bs.buttonWidget(parent=self._subContainer,
-                                                       position=(self._subWidth/2-thisButtonWidth/2,v-10),
-                                                       size=(thisButtonWidth,60),
-                                                       autoSelect=True,
-                                                       # label=R.moddingGuideText,
-                                                       label=bs.Lstr(resource=self._r+'.moddingGuideText'),
-                                                       textScale=1.0,
-                                                       onActivateCall=bs.Call(bs.openURL,'http://www.froemling.net/docs/bombsquad-modding-guide'))
-
-        v -= self._spacing * 1.8
-
-        def foo(val):
-            bs.screenMessage(bs.Lstr(resource=self._r+'.mustRestartText'),
-                             color=(1,1,0))
-            
-        cb = self._enablePackageModsCheckBox = configCheckBox(parent=self._subContainer,position=(80,v),size=(self._subWidth-100,30),
-                                                              name="Enable Package Mods",autoSelect=True,valueChangeCall=foo,
-                                                              # displayName=R.enablePackageModsText,
-                                                              displayName=bs.Lstr(resource=self._r+'.enablePackageModsText'),
-                                                              scale=1.0,maxWidth=400)
-        bs.widget(edit=b,downWidget=cb)
-        bs.widget(edit=cb,upWidget=b)
-        t = bs.textWidget(parent=self._subContainer,position=(90,v-10),size=(0,0),
-                          # text=R.enablePackageModsDescriptionText,
-                          text=bs.Lstr(resource=self._r+'.enablePackageModsDescriptionText'),
-                          maxWidth=400,flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),
-                          hAlign='left',vAlign='center')
-        
-        v -= self._spacing * 0.6
-
-        if self._doVRTestButton:
-            v -= self._extraButtonSpacing
-            self._vrTestButton = bs.buttonWidget(parent=self._subContainer,
-                                                 position=(self._subWidth/2-thisButtonWidth/2,v-14),
-                                                 size=(thisButtonWidth,60),
-                                                 autoSelect=True,
-                                                 #label=R.vrTestingText,
-                                                 label=bs.Lstr(resource=self._r+'.vrTestingText'),
-                                                 textScale=1.0,
-                                                 onActivateCall=self._onVRTestPress)
-        else:
-            self._vrTestButton = None
-            
-        if self._doNetTestButton:
-            v -= self._extraButtonSpacing
-            self._netTestButton = bs.buttonWidget(parent=self._subContainer,
-                                                  position=(self._subWidth/2-thisButtonWidth/2,v-14),
-                                                  size=(thisButtonWidth,60),
-                                                  autoSelect=True,
-                                                  # label=R.netTestingText,
-                                                  label=bs.Lstr(resource=self._r+'.netTestingText'),
-                                                  textScale=1.0,
-                                                  onActivateCall=self._onNetTestPress)
-        else: self._netTestButton = None
-
-        v -= 70
-        self._benchmarksButton = bs.buttonWidget(parent=self._subContainer,
-                                                 position=(self._subWidth/2-thisButtonWidth/2,v-14),
-                                                 size=(thisButtonWidth,60),
-                                                 autoSelect=True,
-                                                 # label=R.benchmarksText,
-                                                 label=bs.Lstr(resource=self._r+'.benchmarksText'),
-                                                 textScale=1.0,
-                                                 onActivateCall=self._onBenchmarkPress)
-
-        
-        bs.widget(edit=self._vrTestButton if self._vrTestButton is not None else self._netTestButton if self._netTestButton is not None else self._benchmarksButton,
-                  upWidget=cb)
-        
-        #bs.widget(edit=showUserModsButton,downWidget=promoCodeButton)
-        #bs.widget(edit=moddingGuideButton,upWidget=translationEditorButton)
-        # for b in [showUserModsButton,moddingGuideButton,promoCodeButton]:
-        #     bs.widget(edit=b,showBufferBottom=30)
-
-        for w in self._subContainer.getChildren():
-            bs.widget(edit=w,showBufferBottom=30,showBufferTop=20)
-            
-        self._modpackWebpageButton = bs.buttonWidget(parent=self._subContainer,
-                                                position=(self._subWidth/2-thisButtonWidth/2,v-86),
-                                                size=(thisButtonWidth,60),
-                                                autoSelect=True,
-                                                label=bs.Lstr(resource=self._r+'.modpackWebpageText'),
-                                                textScale=1.0,
-                                                onActivateCall=bs.Call(bs.openURL,'https://bombsquadjoyride.blogspot.com/'))
-
-        if gToolbars:
-            # print 'SETTING'
-            pb = bsInternal._getSpecialWidget('partyButton')
-            bs.widget(edit=self._scrollWidget,rightWidget=pb)
-            if self._backButton is None:
-                bs.widget(edit=self._scrollWidget,leftWidget=bsInternal._getSpecialWidget('backButton'))
-            # for w in self._subContainer.getChildren():
-            #     bs.widget(edit=w,rightWidget=pb)
-            
-        self._restoreState()
-        
-    def _onVRTestPress(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = VRTestingWindow(transition='inRight').getRootWidget()
-
-    def _onNetTestPress(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = NetTestingWindow(transition='inRight').getRootWidget()
-
-    def _onFriendPromoCodePress(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-            return
-        doAppInvitesPress()
-        
-    def _onPromoCodePress(self):
-
-        # we have to be logged in for promo-codes to work..
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-            return
-        
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = PromoCodeWindow(originWidget=self._promoCodeButton).getRootWidget()
-
-    def _onBenchmarkPress(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = DebugWindow(transition='inRight').getRootWidget()
-        
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._scrollWidget:
-                sel = self._subContainer.getSelectedChild()
-                if sel == self._vrTestButton: selName = 'VRTest'
-                elif sel == self._netTestButton: selName = 'NetTest'
-                elif sel == self._promoCodeButton: selName = 'PromoCode'
-                # elif sel == self._friendPromoCodeButton: selName = 'FriendPromoCode'
-                elif sel == self._benchmarksButton: selName = 'Benchmarks'
-                elif sel == self._kickIdlePlayersCheckBox: selName = 'KickIdlePlayers'
-                elif sel == self._alwaysUseInternalKeyboardCheckBox: selName = 'AlwaysUseInternalKeyboard'
-                elif sel == self._kidFriendlyCheckBox: selName = 'KidFriendly'
-                elif sel == self._languagePopup.getButtonWidget(): selName = 'Languages'
-                elif sel == self._translationEditorButton: selName = 'TranslationEditor'
-                elif sel == self._showUserModsButton: selName = 'ShowUserMods'
-                elif sel == self._moddingGuideButton: selName = 'ModdingGuide'
-                elif sel == self._enablePackageModsCheckBox: selName = 'PackageMods'
-                elif sel == self._modpackWebpageButton: selName = 'ModpackWebpage'
-                else: raise Exception("unrecognized selection")
-            elif sel == self._backButton: selName = 'Back'
-            else: raise Exception("unrecognized selection")
-            gWindowStates[self.__class__.__name__] = {'selName':selName}
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
-
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]['selName']
-            except Exception: selName = None
-            if selName == 'Back':
-                sel = self._backButton
-                subSel = None
-            else:
-                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
-                if selName == 'VRTest': sel = self._vrTestButton
-                elif selName == 'NetTest': sel = self._netTestButton
-                elif selName == 'PromoCode': sel = self._promoCodeButton
-                #elif selName == 'FriendPromoCode': sel = self._friendPromoCodeButton
-                elif selName == 'Benchmarks': sel = self._benchmarksButton
-                elif selName == 'KickIdlePlayers': sel = self._kickIdlePlayersCheckBox
-                elif selName == 'KidFriendly': sel = self._kidFriendlyCheckBox
-                elif selName == 'AlwaysUseInternalKeyboard': sel = self._alwaysUseInternalKeyboardCheckBox
-                elif selName == 'Languages': sel = self._languagePopup.getButtonWidget()
-                elif selName == 'TranslationEditor': sel = self._translationEditorButton
-                elif selName == 'ShowUserMods': sel = self._showUserModsButton
-                elif selName == 'ModdingGuide': sel = self._moddingGuideButton
-                elif selName == 'PackageMods': sel = self._enablePackageModsCheckBox
-                elif selName == 'ModpackWebpage': sel = self._modpackWebpageButton
-                else: sel = None
-                if sel != None: bs.containerWidget(edit=self._subContainer,selectedChild=sel,visibleChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-    
-    def _onMenuOpen(self):
-        self._menuOpen = True
-
-    def _onMenuClose(self):
-        self._menuOpen = False
-
-    def _onMenuChoice(self,choice):
-        if choice == 'Auto': bsUtils._setLanguage(None)
-        else:
-            try:
-                # attempt to reload the language module first.. (this makes iterating on a language easier)
-                langModule = __import__('bsLanguage'+choice)
-                reload(langModule)
-            except Exception:
-                bs.printException('error on language switch reload for lang \''+choice+'\':')
-            bsUtils._setLanguage(choice)
-        self._saveState()
-        bs.realTimer(100,bs.WeakCall(self._rebuild))
-
-    def _completedLangsCB(self,results):
-        if results is not None:
-            self._completeLangsList = results['langs']
-            self._completeLangsError = False
-        else:
-            self._completeLangsList = None
-            self._completeLangsError = True
-        bs.realTimer(1,bs.WeakCall(self._updateLangStatus))
-            
-
-    def _doBack(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = SettingsWindow(transition='inLeft').getRootWidget()
-        
-def configCheckBox(parent,name,position,size,displayName=None,scale=None,maxWidth=None,autoSelect=True,valueChangeCall=None):
-    if displayName is None: displayName = name
-
-    def _valueChanged(val):
-        bs.getConfig()[name] = val
-
-        if valueChangeCall is not None: valueChangeCall(val)
-        
-        # special case: clicking kick-idle-players repeatedly unlocks co-op levels
-        if name == 'Kick Idle Players':
-            global gKickIdlePlayersKickCount
-            try: count = gKickIdlePlayersKickCount
-            except Exception: count = 1
-            count += 1
-            if count == 11:
-                try:
-                    import bsCoopGame
-                    #campaign = bsCoopGame.getCampaign('Default')
-                    levels = bsCoopGame.getCampaign('Default').getLevels() + bsCoopGame.getCampaign('Easy').getLevels()
-                    for level in levels: level.setComplete(True)
-                    bs.screenMessage("CO-OP LEVELS UNLOCKED! (temporarily)",color=(0,1,0))
-                    bs.playSound(bs.getSound('gunCocking'))
-                    bs.playSound(bs.getSound('gong'))
-                except Exception as e:
-                    print 'error during co-op unlock:',e
-                    bs.screenMessage("ERROR UNLOCKING CO-OP LEVELS",color=(1,0,0))
-                count = 1;
-            gKickIdlePlayersKickCount = count
-
-        bs.applySettings()
-        bs.writeConfig()
-
-    return bs.checkBoxWidget(parent=parent,autoSelect=autoSelect,position=position,size=size,text=displayName,textColor=(0.8,0.8,0.8),
-                             value=bsInternal._getSetting(name),onValueChangeCall=_valueChanged,scale=scale,maxWidth=maxWidth)
-                             
-                             
-class JRMPWindow(Window):
-
-    def __init__(self,transition='inRight',originWidget=None):
-
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-
-        self._r = 'jrmpSettingsWindow'
-
-        spacing = 50
-        width = 650 if gSmallUI else 700
-        height = 265
+        spacing = 50
+        width = 650 if gSmallUI else 700
+        height = 265
 
         baseScale=2.0 if gSmallUI else 1.6 if gMedUI else 1.0
         popupMenuScale = baseScale*1.2
@@ -8940,7 +5263,7 @@ class SelectMapWindow(Window):
         if bsInternal._getAccountState() != 'SIGNED_IN':
             showSignInPrompt()
             return
-        StoreWindow(modal=True,showTab='maps',onCloseCall=self._onStoreClose,originWidget=self._getMoreMapsButton)
+        getWindowClass('StoreWindow')(modal=True,showTab='maps',onCloseCall=self._onStoreClose,originWidget=self._getMoreMapsButton)
 
     def _onStoreClose(self):
         self._refresh(selectGetMoreMapsButton=True)
@@ -9368,7 +5691,7 @@ class AddGameWindow(Window):
         if bsInternal._getAccountState() != 'SIGNED_IN':
             showSignInPrompt()
             return
-        StoreWindow(modal=True,showTab='minigames',onCloseCall=self._onStoreClose,originWidget=self._getMoreGamesButton)
+        getWindowClass('StoreWindow')(modal=True,showTab='minigames',onCloseCall=self._onStoreClose,originWidget=self._getMoreGamesButton)
 
     def _onStoreClose(self):
         self._refresh(selectGetMoreGamesButton=True)
@@ -11521,19 +7844,20 @@ class TrophiesWindow(PopupWindow):
         self._transitionOut()
 
         
-class PowerRankingWindow(Window):
-    
-    # def __del__(self):
-    #     print '~PowerRankingWindow()'
         
-    def __init__(self,transition='inRight',modal=False,originWidget=None):
-        #print 'PowerRankingWindow()'
+class CoopWindow(Window):
 
-        bsInternal._setAnalyticsScreen('League Window')
-        
-        self._powerRankingInfo = None
-        self._modal = modal
+    def _updateCornerButtonPositions(self):
+        offs = -55 if gSmallUI and bsInternal._isPartyIconVisible() else 0
+        if self._powerRankingButtonInstance is not None:
+            self._powerRankingButtonInstance.setPosition((self._width-282+offs,self._height-85-(4 if gSmallUI else 0)))
+        if self._storeButtonInstance is not None:
+            self._storeButtonInstance.setPosition((self._width-170+offs,self._height-85-(4 if gSmallUI else 0)))
 
+    def __init__(self,transition='inRight',originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Coop Window')
+        
         # if they provided an origin-widget, scale up from that
         if originWidget is not None:
             self._transitionOut = 'outScale'
@@ -11543,582 +7867,42 @@ class PowerRankingWindow(Window):
             self._transitionOut = 'outRight'
             scaleOrigin = None
         
+        # try to recreate the same number of buttons we had last time so our re-selection code works
+        self._tournamentButtonCount = 0
+
+        #self._enableChallenges = True
+        self._enableChallenges = False
+        
+        # same for challenges..
+        try: self._challengeButtonCount = bs.getConfig()['Challenge Button Count']
+        except Exception: self._challengeButtonCount = 0
+
         self._width = 1120
-        self._height = 657 if gSmallUI else 710 if gMedUI else 800
+        self._height = 657 if gSmallUI else 730 if gMedUI else 800
+        global gMainWindow
+        gMainWindow = "Coop Select"
         self._r = 'coopSelectWindow'
-        self._R = R = bsUtils._getResource(self._r)
         topExtra = 20 if gSmallUI else 0
 
-        self._leagueURLArg = ''
-
-        self._isCurrentSeason = False
-        self._canDoMoreButton = True
+        self._tourneyDataUpToDate = False
+        
+        self._campaignDifficulty = bsInternal._getAccountMiscVal('campaignDifficulty','easy')
         
+        bs.gCreateGameType = None
         self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),
-                                              stackOffset=(0,-15) if gSmallUI else (0,10) if gMedUI else (0,0),transition=transition,
+                                              toolbarVisibility='MENU_FULL',
                                               scaleOriginStackOffset=scaleOrigin,
-                                              scale = 1.2 if gSmallUI else 0.93 if gMedUI else 0.8)
-        
-        self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(75,self._height-87-(4 if gSmallUI else 0)),size=(120,60),scale=1.2,
-                                               autoSelect=True,
-                                               label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
-                                               buttonType=None if self._modal else 'back',
-                                               onActivateCall=self._back)
-
-        self._titleText = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height - 56),size=(0,0),
-                                         text=bs.Lstr(resource='league.leagueRankText',fallback='coopSelectWindow.powerRankingText'),
-                                         hAlign="center",color=gTitleColor,scale=1.4,maxWidth=600,
-                                         vAlign="center")
-
-        if gDoAndroidNav:
-            bs.buttonWidget(edit=b,buttonType='backSmall',position=(75,self._height-87-(2 if gSmallUI else 0)),size=(60,55),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=self._titleText,hAlign='left',position=(165,self._height - 56))
-        
-        self._scrollWidth = self._width-130
-        self._scrollHeight = self._height-160
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=(65,70),size=(self._scrollWidth,self._scrollHeight),centerSmallContent=True)
-        bs.widget(edit=self._scrollWidget,autoSelect=True)
-        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=self._backButton,selectedChild=self._backButton)
-
-        self._lastPowerRankingQueryTime = None
-        self._doingPowerRankingQuery = False
-        
-        self._subContainer = None
-        self._subContainerWidth = 800
-        self._subContainerHeight = 483
-        self._powerRankingScoreWidgets = []
-
-        self._seasonPopupMenu = None
-        self._requestedSeason = None
-        self._season = None
-        
-        # take note of our account state; we'll refresh later if this changes
-        self._accountState = bsInternal._getAccountState()
-
-        self._refresh()
-        self._restoreState()
-
-        # if we've got cached power-ranking data already, display it
-        info = _getCachedPowerRankingInfo()
-        if info is not None:
-            self._updateForPowerRankingInfo(info)
+                                              stackOffset=(0,-15) if gSmallUI else (0,0) if gMedUI else (0,0),transition=transition,
+                                              scale = 1.2 if gSmallUI else 0.8 if gMedUI else 0.75)
 
-        self._updateTimer = bs.Timer(1000,bs.WeakCall(self._update),timeType='real',repeat=True)
-        self._update(show = True if info is None else False)
-        
-    def _onAchievementsPress(self):
-        # only allow this for all-time or the current season
-        # (we currently don't keep specific achievement data for old seasons)
-        if self._season == 'a' or self._isCurrentSeason:
-            AchievementsWindow(position=self._powerRankingAchievementsButton.getScreenSpaceCenter())
+        if gToolbars and gSmallUI:
+            self._backButton = None
         else:
-            bs.screenMessage(bs.Lstr(resource='achievementsUnavailableForOldSeasonsText',fallback='unavailableText'),
-                             color=(1,0,0))
-            bs.playSound(bs.getSound('error'))
+            self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(75,self._height-87-(4 if gSmallUI else 0)),size=(120,60),scale=1.2,
+                                                   autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back')
 
 
-    def _onActivityMultPress(self):
-        t = bs.Lstr(resource='coopSelectWindow.activenessAllTimeInfoText' if self._season == 'a' else 'coopSelectWindow.activenessInfoText',
-                    subs=[('${MAX}',str(bsInternal._getAccountMiscReadVal('activenessMax',1.0)))])
-        ConfirmWindow(t,cancelButton=False,width=460,height=150,originWidget=self._activityMultButton)
-
-    def _onProMultPress(self):
-        t = bs.Lstr(resource='coopSelectWindow.proMultInfoText',
-                    subs=[('${PERCENT}',str(bsInternal._getAccountMiscReadVal('proPowerRankingBoost',10))),
-                          ('${PRO}',bs.Lstr(resource='store.bombSquadProNameText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]))])
-        ConfirmWindow(t,cancelButton=False,width=460,height=130,originWidget=self._proMultButton)
-        
-    def _onTrophiesPress(self):
-        #info = _getCachedPowerRankingInfo()
-        info = self._powerRankingInfo
-        if info is not None:
-            TrophiesWindow(position=self._powerRankingTrophiesButton.getScreenSpaceCenter(),data=info)
-        else:
-            bs.playSound(bs.getSound('error'))
-        
-    def _onPowerRankingQueryResponse(self,data):
-        self._doingPowerRankingQuery = False
-        # important: *only* cache this if we requested the current season..
-        if data is not None and data.get('s',None) is None:
-            _cachePowerRankingInfo(data)
-        # always store a copy locally though (even for other seasons)
-        self._powerRankingInfo = copy.deepcopy(data)
-        self._updateForPowerRankingInfo(data)
-            
-        
-    def _saveState(self):
-        pass
-    
-    def _restoreState(self):
-        pass
-    
-    def _update(self, show=False):
-
-        #print 'updating',bs.getRealTime()
-        curTime = bs.getRealTime()
-
-        # if our account state has changed, refresh our UI
-        accountState = bsInternal._getAccountState()
-        if accountState != self._accountState:
-            self._accountState = accountState
-            self._saveState()
-            self._refresh()
-            
-            # and power ranking too...
-            if not self._doingPowerRankingQuery: self._lastPowerRankingQueryTime = None
-
-        # send off a new power-ranking query if its been long enough or our requested season has changed or whatnot..
-        if not self._doingPowerRankingQuery and (self._lastPowerRankingQueryTime is None
-                                                 #or self._season != self._requestedSeason
-                                                 or curTime-self._lastPowerRankingQueryTime > 30000):
-            try:
-                if show:
-                    bs.textWidget(edit=self._leagueTitleText,text='')
-                    bs.textWidget(edit=self._leagueText,text='')
-                    bs.textWidget(edit=self._leagueNumberText,text='')
-                    bs.textWidget(edit=self._yourPowerRankingText,
-                                  text=bs.Lstr(value='${A}...',subs=[('${A}',bs.Lstr(resource='loadingText'))]))
-                    bs.textWidget(edit=self._toRankedText,text='')
-                    bs.textWidget(edit=self._powerRankingRankText,text='')
-                    bs.textWidget(edit=self._seasonEndsText,text='')
-                    bs.textWidget(edit=self._trophyCountsResetText,text='')
-            except Exception,e:
-                print 'EXC showing pr update msg',e
-                
-            self._lastPowerRankingQueryTime = curTime
-            self._doingPowerRankingQuery = True
-            bsInternal._powerRankingQuery(season=self._requestedSeason,callback=bs.WeakCall(self._onPowerRankingQueryResponse))
-            
-            
-    def _refresh(self):
-        
-        # (re)create the sub-container if need be..
-        if self._subContainer is not None: self._subContainer.delete()
-        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,size=(self._subContainerWidth,self._subContainerHeight),background=False)
-
-        wParent = self._subContainer
-        hBase = 6
-        hSpacing = 200
-        customButtons = []
-        h = 0
-        v = self._subContainerHeight - 20
-        v2 = -2
-
-        v -= 0
-
-        h2 = 80
-        v2 = v - 60
-        countColor = (0.5,1.0,0.5)
-        worthColor = (0.6,0.6,0.65)
-        tallyColor = (0.5,0.6,0.8)
-        spc = 43
-
-        hOffsCount = 50
-        hOffsPts = 140
-        hOffsTally = 150
-        ptsScale = 0.65
-        ptsMaxWidth = 60
-        tallyMaxWidth = 120
-        countMaxWidth = 40
-        hOffsIcons = -29
-        iconScale = 1.4
-        
-        numText = bs.Lstr(resource='numberText').evaluate()
-
-        
-        v2 -= 70
-
-        bs.textWidget(parent=wParent,position=(h2-60,v2+106),size=(0,0),flatness=1.0,shadow=0.0,
-                                               text=bs.Lstr(resource='coopSelectWindow.pointsText'),hAlign='left',vAlign='center',scale=0.8,color=(1,1,1,0.3),maxWidth=200)
-        
-        self._powerRankingAchievementsButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,80),icon=bs.getTexture('achievementsIcon'),
-                                                               autoSelect=True,
-                                                               onActivateCall=bs.WeakCall(self._onAchievementsPress),
-                                                               upWidget=self._backButton,leftWidget=self._backButton,
-                                                               color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
-                                                               label='')
-        
-        self._powerRankingAchievementTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+45),size=(0,0),flatness=1.0,shadow=0.0,
-                                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
-        
-        v2 -= 80
-
-        self._powerRankingTrophiesButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,80),icon=bs.getTexture('medalSilver'),
-                                                           autoSelect=True,
-                                                           onActivateCall=bs.WeakCall(self._onTrophiesPress),
-                                                           leftWidget=self._backButton,
-                                                           color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
-                                                           label='')
-        self._powerRankingTrophiesTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+45),size=(0,0),flatness=1.0,shadow=0.0,
-                                                            text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
-        
-        v2 -= 100
-
-        bs.textWidget(parent=wParent,position=(h2-60,v2+86),size=(0,0),flatness=1.0,shadow=0.0,
-                                               text=bs.Lstr(resource='coopSelectWindow.multipliersText'),hAlign='left',vAlign='center',scale=0.8,color=(1,1,1,0.3),maxWidth=200)
-        
-        self._activityMultButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,60),icon=bs.getTexture('heart'),iconColor=(0.5,0,0.5),
-                                                   label=bs.Lstr(resource='coopSelectWindow.activityText'),
-                                                   autoSelect=True,
-                                                   onActivateCall=bs.WeakCall(self._onActivityMultPress),
-                                                   leftWidget=self._backButton,
-                                                   color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8))
-        
-        self._activityMultText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+40),size=(0,0),flatness=1.0,shadow=0.0,
-                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
-        v2 -= 65
-
-        
-        self._proMultButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,60),icon=bs.getTexture('logo'),iconColor=(0.3,0,0.3),
-                                                   label=bs.Lstr(resource='store.bombSquadProNameText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
-                                                   autoSelect=True,
-                                                   onActivateCall=bs.WeakCall(self._onProMultPress),
-                                                   leftWidget=self._backButton,
-                                                   color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8))
-        
-        self._proMultText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+40),size=(0,0),flatness=1.0,shadow=0.0,
-                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
-        v2 -= 30
-        
-        v2 -= spc
-        bs.textWidget(parent=wParent,position=(h2+hOffsTally-10-40,v2+35),size=(0,0),flatness=1.0,shadow=0.0,
-                      text=bs.Lstr(resource='finalScoreText'),hAlign='right',vAlign='center',scale=0.9,color=worthColor,maxWidth=150)
-        self._powerRankingTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally-40,v2+35),size=(0,0),flatness=1.0,shadow=0.0,
-                                                    text='-',hAlign='left',vAlign='center',scale=0.9,color=tallyColor,maxWidth=tallyMaxWidth)
-
-        self._seasonShowText = bs.textWidget(parent=wParent,position=(390-15,v-20),size=(0,0),color=(0.6,0.6,0.7),maxWidth=200,
-                                              text=bs.Lstr(resource='showText'),hAlign='right',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
-        
-        self._leagueTitleText = bs.textWidget(parent=wParent,position=(470,v-97),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
-                                              text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
-
-        # self._leagueButton = bs.buttonWidget(parent=wParent,position=(474-135,v-190),size=(270,130),label='',buttonType='square',
-        #                                      autoSelect=True,color=(0.5,0.5,0.6))
-
-        self._leagueTextScale = 1.8
-        self._leagueTextMaxWidth = 210
-        self._leagueText = bs.textWidget(parent=wParent,position=(470,v-140),size=(0,0),color=(1,1,1),maxWidth=self._leagueTextMaxWidth,
-                                         text='-',hAlign='center',vAlign='center',scale=self._leagueTextScale,shadow=1.0,flatness=1.0)
-        self._leagueNumberBasePos = (470,v-140)
-        self._leagueNumberText = bs.textWidget(parent=wParent,position=(470,v-140),size=(0,0),color=(1,1,1),maxWidth=100,
-                                               text='',hAlign='left',vAlign='center',scale=0.8,shadow=1.0,flatness=1.0)
-        
-        self._yourPowerRankingText = bs.textWidget(parent=wParent,position=(470,v-142-70),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
-                                                   text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
-
-        self._toRankedText = bs.textWidget(parent=wParent,position=(470,v-250-70),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
-                                           text='',hAlign='center',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
-        
-        self._powerRankingRankText = bs.textWidget(parent=wParent,position=(473,v-210-70),size=(0,0),big=False,
-                                                   text='-',hAlign='center',vAlign='center',scale=1.0)
-
-        self._seasonEndsText = bs.textWidget(parent=wParent,position=(470,v-380),size=(0,0),color=(0.6,0.6,0.6),maxWidth=230,
-                                         text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
-        self._trophyCountsResetText = bs.textWidget(parent=wParent,position=(470,v-410),size=(0,0),color=(0.5,0.5,0.5),maxWidth=230,
-                                                    text=('Trophy counts will reset next season.'),hAlign='center',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
-        
-        # for w in self._powerRankingScoreWidgets: w.delete()
-        self._powerRankingScoreWidgets = []
-
-        self._powerRankingScoreV = v - 56
-        
-        h = 707
-        v -= 451
-
-        self._seeMoreButton = bs.buttonWidget(parent=wParent,label=self._R.seeMoreText,position=(h,v),
-                                              color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
-                                              size=(230,60),autoSelect=True,
-                                              onActivateCall=bs.WeakCall(self._onMorePress))
-        #bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._proMultButton)
-        
-        # bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._seasonPopupMenu.getButtonWidget())
-        # bs.widget(edit=self._seasonPopupMenu.getButtonWidget(),upWidget=self._backButton)
-        # bs.widget(edit=self._backButton,downWidget=self._powerRankingAchievementsButton,rightWidget=self._seasonPopupMenu.getButtonWidget())
-
-    def _onMorePress(self):
-        if not self._canDoMoreButton:
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource='unavailableText'),color=(1,0,0))
-            return
-        seasonStr = '' if self._season is None else '&season='+('all_time' if self._season == 'a' else self._season)
-        if self._leagueURLArg != '': leagueStr = '&league='+self._leagueURLArg
-        else: leagueStr = ''
-        bs.openURL(bsInternal._getServerAddress()+'/highscores?list=powerRankings&v=2'+leagueStr+seasonStr,aa='player')
-        
-    def _updateForPowerRankingInfo(self,data):
-
-        if not self._rootWidget.exists(): return
-        
-        inTop = True if (data is not None and data['rank'] is not None) else False
-        
-        eqText = self._R.powerRankingPointsEqualsText
-        ptsText = self._R.powerRankingPointsText
-        numText = bs.Lstr(resource='numberText').evaluate()
-
-        doPercent = False
-        finishedSeasonUnranked = False
-        self._canDoMoreButton = True
-        if bsInternal._getAccountState() != 'SIGNED_IN': statusText = '('+bs.Lstr(resource='notSignedInText').evaluate()+')'
-        elif inTop: statusText = numText.replace('${NUMBER}',str(data['rank']))
-        elif data is not None:
-            try:
-                # print 'hAVE',len(data['scores'])
-                # handle old seasons where we didn't wind up ranked at the end..
-                if len(data['scores']) == 0:
-                    statusText = self._R.powerRankingFinishedSeasonUnrankedText
-                    extraText = ''
-                    finishedSeasonUnranked = True
-                    self._canDoMoreButton = False
-                else:
-                    ourPoints = _getPowerRankingPoints(data)
-                    # progress = 0.0 if len(data['scores']) == 0 else float(ourPoints)/max(1,data['scores'][-1][1])
-                    progress = float(ourPoints)/max(1,data['scores'][-1][1])
-                    statusText = str(int(progress*100.0))+'%'
-                    extraText = '\n'+self._R.powerRankingPointsToRankedText.replace('${CURRENT}',str(ourPoints)).replace('${REMAINING}',str(data['scores'][-1][1]))
-                    doPercent = True
-            except Exception:
-                bs.printException('error updating power ranking')
-                statusText = self._R.powerRankingNotInTopText.replace('${NUMBER}',str(data['listSize']))
-                extraText = ''
-        else: statusText = '-'
-
-        #print 'UPDATING FOR SEASON',(data['s'] if data is not None else None)
-        self._season = data['s'] if data is not None else None
-        #print 'UPDATING FOR SEASON',self._season
-        
-        v = self._subContainerHeight - 20
-        popupWasSelected = False
-        if self._seasonPopupMenu is not None:
-            b = self._seasonPopupMenu.getButtonWidget()
-            if self._subContainer.getSelectedChild() == b: popupWasSelected = True
-            b.delete()
-        seasonChoices = []
-        seasonChoicesDisplay = []
-        # seasonText = bs.Lstr(resource='league.seasonText').evaluate()
-        didFirst = False
-        self._isCurrentSeason = False
-        if data is not None:
-            # build our list of seasons we have available
-            for s in data['sl']:
-                seasonChoices.append(s)
-                if s != 'a' and not didFirst:
-                    seasonChoicesDisplay.append(bs.Lstr(resource='league.currentSeasonText',subs=[('${NUMBER}',s)]))
-                    didFirst = True
-                    # if we either did not specify a season or specified the first, we're looking at the current..
-                    if self._season in[s,None]:
-                        self._isCurrentSeason = True
-                elif s == 'a':
-                    seasonChoicesDisplay.append(bs.Lstr(resource='league.allTimeText'))
-                else:
-                    seasonChoicesDisplay.append(bs.Lstr(resource='league.seasonText',subs=[('${NUMBER}',s)]))
-            self._seasonPopupMenu = PopupMenu(parent=self._subContainer,position=(390,v-45),width=150,buttonSize=(200,50),
-                                              choices=seasonChoices,
-                                              # choices=['Current Season (2)','Season 1',
-                                              #          'Season A','Season B','Season C','Season D','Season E','Season F','Season G','All Time'],
-                                              onValueChangeCall=bs.WeakCall(self._onSeasonChange),
-                                              choicesDisplay=seasonChoicesDisplay,
-                                              currentChoice=self._season)
-            if popupWasSelected: bs.containerWidget(edit=self._subContainer,selectedChild=self._seasonPopupMenu.getButtonWidget())
-            #bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._seasonPopupMenu.getButtonWidget())
-            bs.widget(edit=self._seeMoreButton,showBufferBottom=100)
-            bs.widget(edit=self._seasonPopupMenu.getButtonWidget(),upWidget=self._backButton)
-            bs.widget(edit=self._backButton,downWidget=self._powerRankingAchievementsButton,rightWidget=self._seasonPopupMenu.getButtonWidget())
-
-        #print 'IS CURRENT?',isCurrentSeason
-            
-        bs.textWidget(edit=self._leagueTitleText,text='' if self._season == 'a' else bs.Lstr(resource='league.leagueText'))
-        
-        if data is None:
-            lName = ''
-            lNum = ''
-            lColor = (1,1,1)
-            self._leagueURLArg = ''
-        elif self._season == 'a':
-            lName = bs.Lstr(resource='league.allTimeText')
-            lNum = ''
-            lColor = (1,1,1)
-            self._leagueURLArg = ''
-        else:
-            lNum = ('['+str(data['l']['i'])+']') if data['l']['i2'] else ''
-            lName = bs.Lstr(translate=('leagueNames',data['l']['n'])).evaluate()
-            lColor = data['l']['c']
-            self._leagueURLArg = (data['l']['n']+'_'+str(data['l']['i'])).lower()
-
-        if data is None or self._season == 'a' or data['se'] is None:
-            daysToEnd = 0
-            minutesToEnd = 0
-            toEndString = ''
-            showSeasonEnd = False
-        else:
-            showSeasonEnd = True
-            daysToEnd = data['se'][0]
-            minutesToEnd = data['se'][1]
-            if daysToEnd > 0: toEndString = bs.Lstr(resource='league.seasonEndsDaysText',subs=[('${NUMBER}',str(daysToEnd))])
-            elif daysToEnd == 0 and minutesToEnd >= 60: toEndString = bs.Lstr(resource='league.seasonEndsHoursText',subs=[('${NUMBER}',str(minutesToEnd/60))])
-            elif daysToEnd == 0 and minutesToEnd >= 0: toEndString = bs.Lstr(resource='league.seasonEndsMinutesText',subs=[('${NUMBER}',str(minutesToEnd))])
-            else: toEndString = bs.Lstr(resource='league.seasonEndedDaysAgoText',subs=[('${NUMBER}',str(-(daysToEnd+1)))])
-            
-        bs.textWidget(edit=self._seasonEndsText,text=toEndString)
-        bs.textWidget(edit=self._trophyCountsResetText,text=bs.Lstr(resource='league.trophyCountsResetText') if self._isCurrentSeason and showSeasonEnd else '')
-        
-        bs.textWidget(edit=self._leagueText,text=lName,color=lColor)
-        lTextWidth = min(self._leagueTextMaxWidth,bsInternal._getStringWidth(lName,suppressWarning=True)*self._leagueTextScale)
-        bs.textWidget(edit=self._leagueNumberText,text=lNum,color=lColor,
-                      position=(self._leagueNumberBasePos[0]+lTextWidth*0.5+8,self._leagueNumberBasePos[1]+10))
-        
-        bs.textWidget(edit=self._toRankedText,
-                      text=bs.Lstr(resource='coopSelectWindow.toRankedText').evaluate()+''+extraText if doPercent else '')
-
-        bs.textWidget(edit=self._yourPowerRankingText,
-                      text=bs.Lstr(resource='rankText',fallback='coopSelectWindow.yourPowerRankingText') if (not doPercent) else '')
-        
-        bs.textWidget(edit=self._powerRankingRankText,
-                      position=(473,v-70-(170 if doPercent else 220)),
-                      text=statusText,big=True if (inTop or doPercent) else False,
-                      scale=3.0 if (inTop or doPercent) else 0.7 if finishedSeasonUnranked else 1.0)
-
-        if data is None or data['act'] is None:
-            bs.buttonWidget(edit=self._activityMultButton,textColor=(0.7,0.7,0.8,0.5),iconColor=(0.5,0,0.5,0.3))
-            bs.textWidget(edit=self._activityMultText,text='     -')
-        else:
-            bs.buttonWidget(edit=self._activityMultButton,textColor=(0.7,0.7,0.8,1.0),iconColor=(0.5,0,0.5,1.0))
-            bs.textWidget(edit=self._activityMultText,text='x '+('%.2f' % data['act']))
-
-        #havePro = bsUtils._havePro()
-        havePro = False if data is None else data['p']
-        proMult = 1.0 + float(bsInternal._getAccountMiscReadVal('proPowerRankingBoost',0.0))*0.01
-        bs.textWidget(edit=self._proMultText,text='     -' if (data is None or not havePro) else 'x '+('%.2f' % proMult))
-        bs.buttonWidget(edit=self._proMultButton,
-                        textColor=(0.7,0.7,0.8,(1.0 if havePro else 0.5)),
-                        iconColor=(0.5, 0, 0.5) if havePro else (0.5, 0, 0.5, 0.2))
-        bs.buttonWidget(edit=self._powerRankingAchievementsButton,label=('' if data is None else (str(data['a'])+' '))+bs.Lstr(resource='achievementsText').evaluate())
-
-        # for the achievement value, use the number they gave us for non-current seasons; otherwise calc our own
-        totalAchValue = 0
-        for ach in bsAchievement.gAchievements:
-            if ach.isComplete(): totalAchValue += ach.getPowerRankingValue()
-        if self._season != 'a' and not self._isCurrentSeason:
-            if data is not None and 'at' in data: totalAchValue = data['at']
-            
-        bs.textWidget(edit=self._powerRankingAchievementTotalText,text='-' if data is None else ('+ '+ptsText.replace('${NUMBER}',str(totalAchValue))))
-
-        totalTrophiesCount = _getPowerRankingPoints(data,'trophyCount')
-        totalTrophiesValue = _getPowerRankingPoints(data,'trophies')
-        bs.buttonWidget(edit=self._powerRankingTrophiesButton,label=('' if data is None else (str(totalTrophiesCount)+' '))+bs.Lstr(resource='trophiesText').evaluate())
-        bs.textWidget(edit=self._powerRankingTrophiesTotalText,text='-' if data is None else ('+ '+ptsText.replace('${NUMBER}',str(totalTrophiesValue))))
-        
-        
-        bs.textWidget(edit=self._powerRankingTotalText,text='-' if data is None else eqText.replace('${NUMBER}',str(_getPowerRankingPoints(data))))
-        for w in self._powerRankingScoreWidgets: w.delete()
-        self._powerRankingScoreWidgets = []
-
-        scores = data['scores'] if data is not None else []
-
-        tallyColor = (0.5,0.6,0.8)
-        wParent = self._subContainer
-        v2 = self._powerRankingScoreV
-        
-        for s in scores:
-            h2 = 680
-            isUs = s[3]
-            self._powerRankingScoreWidgets.append(bs.textWidget(parent=wParent,position=(h2-20,v2),size=(0,0),
-                                                                color=(1,1,1) if isUs else (0.6,0.6,0.7),
-                                                                maxWidth=40,flatness=1.0,shadow=0.0,
-                                                                text=numText.replace('${NUMBER}',str(s[0])),hAlign='right',vAlign='center',scale=0.5))
-            self._powerRankingScoreWidgets.append(bs.textWidget(parent=wParent,position=(h2+20,v2),size=(0,0),
-                                                                color=(1,1,1) if isUs else tallyColor,
-                                                                maxWidth=60,text=str(s[1]),flatness=1.0,shadow=0.0,
-                                                                hAlign='center',vAlign='center',scale=0.7))
-            t = bs.textWidget(parent=wParent,position=(h2+60,v2-(28*0.5)/0.9),size=(210/0.9,28),
-                              color=(1,1,1) if isUs else (0.6,0.6,0.6),
-                              maxWidth=210,flatness=1.0,shadow=0.0,
-                              autoSelect=True,selectable=True,clickActivate=True,
-                              text=s[2],hAlign='left',vAlign='center',scale=0.9)
-            self._powerRankingScoreWidgets.append(t)
-            bs.textWidget(edit=t,onActivateCall=bs.Call(self._showAccountInfo,s[4],t))
-            bs.widget(edit=t,leftWidget=self._seasonPopupMenu.getButtonWidget())
-            v2 -= 28
-        
-    def _showAccountInfo(self,accountID,textWidget):
-        bs.playSound(bs.getSound('swish'))
-        AccountInfoWindow(accountID=accountID,
-                          position=textWidget.getScreenSpaceCenter())
-        
-        
-    def _onSeasonChange(self,value):
-        #print 'SEASON CHANGED TO',value
-        self._requestedSeason = value
-        self._lastPowerRankingQueryTime = None # make sure we update asap
-        self._update(show=True)
-        
-    def _saveState(self):
-        pass
-    
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        if not self._modal:
-            uiGlobals['mainMenuWindow'] = CoopWindow(transition='inLeft').getRootWidget()
-        
-class CoopWindow(Window):
-
-    def _updateCornerButtonPositions(self):
-        offs = -55 if gSmallUI and bsInternal._isPartyIconVisible() else 0
-        if self._powerRankingButtonInstance is not None:
-            self._powerRankingButtonInstance.setPosition((self._width-282+offs,self._height-85-(4 if gSmallUI else 0)))
-        if self._storeButtonInstance is not None:
-            self._storeButtonInstance.setPosition((self._width-170+offs,self._height-85-(4 if gSmallUI else 0)))
-
-    def __init__(self,transition='inRight',originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Coop Window')
-        
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-        
-        # try to recreate the same number of buttons we had last time so our re-selection code works
-        self._tournamentButtonCount = 0
-
-        #self._enableChallenges = True
-        self._enableChallenges = False
-        
-        # same for challenges..
-        try: self._challengeButtonCount = bs.getConfig()['Challenge Button Count']
-        except Exception: self._challengeButtonCount = 0
-
-        self._width = 1120
-        self._height = 657 if gSmallUI else 730 if gMedUI else 800
-        global gMainWindow
-        gMainWindow = "Coop Select"
-        self._r = 'coopSelectWindow'
-        topExtra = 20 if gSmallUI else 0
-
-        self._tourneyDataUpToDate = False
-        
-        self._campaignDifficulty = bsInternal._getAccountMiscVal('campaignDifficulty','easy')
-        
-        bs.gCreateGameType = None
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),
-                                              toolbarVisibility='MENU_FULL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              stackOffset=(0,-15) if gSmallUI else (0,0) if gMedUI else (0,0),transition=transition,
-                                              scale = 1.2 if gSmallUI else 0.8 if gMedUI else 0.75)
-
-        if gToolbars and gSmallUI:
-            self._backButton = None
-        else:
-            self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(75,self._height-87-(4 if gSmallUI else 0)),size=(120,60),scale=1.2,
-                                                   autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back')
-
-
-        if not gToolbars:
+        if not gToolbars:
 
             prb = self._powerRankingButtonInstance = PowerRankingButton(parent=self._rootWidget,position=(self._width-282,self._height-85-(4 if gSmallUI else 0)),size=(100,60),
                                                                         color=(0.4,0.4,0.9),
@@ -13367,7 +9151,7 @@ class CoopWindow(Window):
             return
         self._saveState()
         bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = PowerRankingWindow(originWidget=self._powerRankingButtonInstance.getButtonWidget()).getRootWidget()
+        uiGlobals['mainMenuWindow'] = getWindowClass('PowerRankingWindow')(originWidget=self._powerRankingButtonInstance.getButtonWidget()).getRootWidget()
     
     def _switchToStore(self,showTab='extras'):
         if bsInternal._getAccountState() != 'SIGNED_IN':
@@ -13375,7 +9159,7 @@ class CoopWindow(Window):
             return
         self._saveState()
         bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = StoreWindow(originWidget=self._storeButtonInstance.getButtonWidget(),showTab=showTab,backLocation='CoopWindow').getRootWidget()
+        uiGlobals['mainMenuWindow'] = getWindowClass('StoreWindow')(originWidget=self._storeButtonInstance.getButtonWidget(),showTab=showTab,backLocation='CoopWindow').getRootWidget()
         
 
     def _showLeader(self,tournamentButton):
@@ -14109,7 +9893,7 @@ class MainMenuWindow(Window):
             return
         self._saveState()
         bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = StoreWindow(originWidget=self._storeButton).getRootWidget()
+        uiGlobals['mainMenuWindow'] = getWindowClass('StoreWindow')(originWidget=self._storeButton).getRootWidget()
 
     def _confirmEndGame(self):
         # FIXME - currently we crash calling this on client-sessions
@@ -14239,7 +10023,7 @@ class MainMenuWindow(Window):
         
         self._saveState()
         bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        uiGlobals['mainMenuWindow'] = GatherWindow(originWidget=self._gatherButton).getRootWidget()
+        uiGlobals['mainMenuWindow'] = getWindowClass('GatherWindow')(originWidget=self._gatherButton).getRootWidget()
         
     def _watchPress(self):
         self._saveState()
@@ -14826,8 +10610,9 @@ def runPostLaunchStuff():
     # values with stale old values of ours and stuff..
     bs.realTimer(5000,bs.writeConfig)
 
-    # lets go ahead and scan our games to avoid hitches later
-    bsUtils.getGameTypes()
+    # lets go ahead and index our games to avoid hitches later
+    # (this only scans sources; game modules get imported as they're needed)
+    bsUtils._getScriptIndex()
 
     # migrate old setting to the new one..
     try:
@@ -14847,8 +10632,12 @@ def runPostLaunchStuff():
         elif bsConfig.get('Auto Account State') == 'Local':
             bsInternal._signIn('Local')
     bs.realTimer(1,doAutoSignIn)
-        
-    bsUtils._gRanPostLaunchStuff = True
+
+    # load the windows folks open most in the background (no need on servers)
+    if env['subplatform'] != 'headless':
+        bs.realTimer(5000,prewarmWindows)
+
+    bsUtils._onLaunchComplete()
 
     
 def checkGamePadConfigs():
@@ -14928,7 +10717,7 @@ def checkGamePadConfigs():
 
                     def doConfigure(gamepad):
                         bs.containerWidget(edit=d,transition='outLeft')
-                        GamePadConfigWindow(gamepad,isMainMenu=False)
+                        getWindowClass('GamePadConfigWindow')(gamepad,isMainMenu=False)
 
                     b = bs.buttonWidget(parent=d,position=(20,20),size=(200,60),
                                         label=bs.Lstr(resource='configureText'),
@@ -15712,7 +11501,7 @@ class GetTicketsWindow(Window):
         if self._transitioningOut: return
         bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
         if not self._modal:
-            window = StoreWindow(transition='inLeft',modal=self._fromModalStore,backLocation=self._storeBackLocation).getRootWidget()
+            window = getWindowClass('StoreWindow')(transition='inLeft',modal=self._fromModalStore,backLocation=self._storeBackLocation).getRootWidget()
             if not self._fromModalStore:
                 uiGlobals['mainMenuWindow'] = window
         self._transitioningOut = True
@@ -15774,1469 +11563,31 @@ class TestWindow(Window):
         scroll2 = bs.hScrollWidget(parent=sc,size=(430,200),position=(-5,550),highlight=False,borderOpacity=0.3)
         bs.widget(edit=scroll2,showBufferTop=40,showBufferBottom=40,autoSelect=True)
         bs.containerWidget(edit=scroll2,claimsLeftRight=True)
-        sc2 = bs.containerWidget(parent=scroll2,size=(1200,200),background=False)
-
-        b1 = bs.buttonWidget(parent=sc,position=(20,760),autoSelect=True)
-        b1 = bs.buttonWidget(parent=sc,position=(20,480),autoSelect=True)
-        b2 = bs.buttonWidget(parent=sc,position=(30,380),autoSelect=True)
-        b3 = bs.buttonWidget(parent=sc,position=(40,280),autoSelect=True)
-
-        x = 10
-        dx = 160
-        for i in range(6):
-            b = bs.buttonWidget(parent=sc2,position=(x,25),autoSelect=True,size=(150,150),
-                                buttonType='square',onActivateCall=bs.Call(bs.screenMessage,"CLICK!"))
-            bs.widget(edit=b,showBufferLeft=50,showBufferRight=50,downWidget=b1,upWidget=self._backButton)
-            x += dx
-        
-    def _back(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
-        
-        
-class WatchWindow(Window):
-
-    def __init__(self,transition='inRight',originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Watch Window')
-        
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-        
-        global gMainWindow
-        gMainWindow = "Watch"
-        
-        self._r = 'watchWindow'
-        
-        self._width = 1040
-        self._height = 578 if gSmallUI else 670 if gMedUI else 800
-        self._currentTab = None
-        extraTop = 20 if gSmallUI else 0
-
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=1.3 if gSmallUI else 0.97 if gMedUI else 0.8,
-                                              stackOffset=(0,-10) if gSmallUI else (0,15) if gMedUI else (0,0))
-
-        if gSmallUI and gToolbars:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
-            self._backButton = None
-        else:
-            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(70,self._height-74),
-                                                                size=(140,60),scale=1.1,label=bs.Lstr(resource='backText'),
-                                                                buttonType='back', onActivateCall=self._back)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-            if gDoAndroidNav:
-                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(155,self._height - 40))
-        
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-38),size=(0,0),
-                          color=gTitleColor,scale=1.5,hAlign="center",vAlign="center",
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          maxWidth=400)
-
-        
-        tabsDef = [['myReplays',bs.Lstr(resource=self._r+'.myReplaysText')]]
-
-        scrollBufferH = 130
-        tabBufferH = 750
-        
-        self._tabButtons = _createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
-                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab)
-
-        if gToolbars:
-            bs.widget(edit=self._tabButtons[tabsDef[-1][0]],rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if gSmallUI:
-                bb = bsInternal._getSpecialWidget('backButton')
-                bs.widget(edit=self._tabButtons[tabsDef[0][0]],upWidget=bb,leftWidget=bb)
-            
-        self._scrollWidth = self._width-scrollBufferH
-        self._scrollHeight = self._height-180
-
-        # not actually using a scroll widget anymore; just an image
-        scrollLeft = (self._width-self._scrollWidth)*0.5
-        scrollBottom = self._height-self._scrollHeight-79-48
-        bufferH = 10
-        bufferV = 4
-        bs.imageWidget(parent=self._rootWidget,position=(scrollLeft-bufferH,scrollBottom-bufferV),size=(self._scrollWidth+2*bufferH,self._scrollHeight+2*bufferV),
-                       texture=bs.getTexture('scrollWidget'),modelTransparent=bs.getModel('softEdgeOutside'))
-        self._tabContainer = None
-
-        self._restoreState()
-        
-    def _setTab(self,tab):
-
-        if self._currentTab == tab: return
-        self._currentTab = tab
-
-        # we wanna preserve our current tab between runs
-        bs.getConfig()['Watch Tab'] = tab
-        bs.writeConfig()
-        
-        # update tab colors based on which is selected
-        _updateTabButtonColors(self._tabButtons,tab)
-        
-        if self._tabContainer is not None and self._tabContainer.exists():
-            self._tabContainer.delete()
-        scrollLeft = (self._width-self._scrollWidth)*0.5
-        scrollBottom = self._height-self._scrollHeight-79-48
-
-        # a place where tabs can store data to get cleared when switching to a different tab
-        self._tabData = {}
-        
-        def _simpleMessage(message,stringHeight):
-            msgScale = 1.1
-            cWidth = self._scrollWidth
-            cHeight = min(self._scrollHeight,stringHeight*msgScale+100)
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectable=False)
-            bs.widget(edit=c,upWidget=self._tabButtons[tab])
-            
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,cHeight*0.5),color=(0.6,1.0,0.6),scale=msgScale,
-                              size=(0,0),maxWidth=cWidth*0.9,maxHeight=cHeight*0.9,
-                              hAlign='center',vAlign='center',
-                              text=message)
-        
-        if tab == 'myReplays':
-            cWidth = self._scrollWidth
-            cHeight = self._scrollHeight-20
-            subScrollHeight = cHeight - 63
-            self._myReplaysScrollWidth = subScrollWidth = (680 if gSmallUI else 640)
-
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-
-            v = cHeight - 30
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
-                              size=(0,0),
-                              maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource='replayRenameWarningText',subs=[('${REPLAY}',bs.Lstr(resource='replayNameDefaultText'))]))
-
-            bWidth = 140 if gSmallUI else 178
-            bHeight = 107 if gSmallUI else 142 if gMedUI else 190
-            bSpaceExtra = 0 if gSmallUI else -2 if gMedUI else -5
-            
-            bColor = (0.6,0.53,0.63)
-            bTextColor = (0.75,0.7,0.8)
-            bv = cHeight-(48 if gSmallUI else 45 if gMedUI else 40)-bHeight
-            bh = 40 if gSmallUI else 40
-            sh = 190 if gSmallUI else 225
-            ts = 1.0 if gSmallUI else 1.2
-            self._myReplaysWatchReplayButton = b1 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
-                                                                    buttonType='square',color=bColor,textColor=bTextColor,
-                                                                    onActivateCall=self._onMyReplayPlayPress,textScale=ts,
-                                                                    label=bs.Lstr(resource=self._r+'.watchReplayButtonText'),
-                                                                    autoSelect=True)
-            bs.widget(edit=b1,upWidget=self._tabButtons[tab])
-            if gSmallUI and gToolbars:
-                bs.widget(edit=b1,leftWidget=bsInternal._getSpecialWidget('backButton'))
-            bv -= bHeight+bSpaceExtra
-            b2 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
-                                 buttonType='square',color=bColor,textColor=bTextColor,
-                                 onActivateCall=self._onMyReplayRenamePress,textScale=ts,
-                                 label=bs.Lstr(resource=self._r+'.renameReplayButtonText'),
-                                 autoSelect=True)
-            bv -= bHeight+bSpaceExtra
-            b3 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
-                                 buttonType='square',color=bColor,textColor=bTextColor,
-                                 onActivateCall=self._onMyReplayDeletePress,textScale=ts,
-                                 label=bs.Lstr(resource=self._r+'.deleteReplayButtonText'),
-                                 autoSelect=True)
-            
-            v -= subScrollHeight+23
-            self._scrollWidget = sw = bs.scrollWidget(parent=c,position=(sh,v),size=(subScrollWidth,subScrollHeight))
-            bs.containerWidget(edit=c,selectedChild=sw)
-            self._columnWidget = bs.columnWidget(parent=sw,leftBorder=10)
-            
-            bs.widget(edit=sw,autoSelect=True,leftWidget=b1,upWidget=self._tabButtons[tab])
-            bs.widget(edit=self._tabButtons[tab],downWidget=sw)
-
-            self._myReplaySelected = None
-            self._refreshMyReplays()
-        elif tab == 'sharedReplays':
-            _simpleMessage(('(COMING SOON)\n'
-                            'This section will include replays that your friends\n'
-                            'have shared with you or possibly public replays\n'
-                            'from recent online tournaments, etc.'))
-        elif tab == 'bestMoments':
-            _simpleMessage(('(COMING SOON)\n'
-                            'This section will highlight short snippets of replays\n'
-                            'that people have shared, each only a few seconds long;\n'
-                            'awesome moves, random moments of hilarity, etc.'))
-
-    def _noReplaySelectedError(self):
-        bs.screenMessage(bs.Lstr(resource=self._r+'.noReplaySelectedErrorText'),color=(1,0,0))
-        bs.playSound(bs.getSound('error'))
-
-    def _onMyReplayPlayPress(self):
-        if self._myReplaySelected is None:
-            self._noReplaySelectedError()
-            return
-
-        bsInternal._incrementAnalyticsCount('Replay watch')
-        def doIt():
-            try:
-                bsInternal._fadeScreen(True)
-                bsInternal._newReplaySession(bsInternal._getReplaysDir()+'/'+self._myReplaySelected)
-            except Exception:
-                import bsMainMenu
-                bs.printException("exception running replay session")
-                # drop back into a fresh main menu session in case we half-launched or something..
-                bsInternal._newHostSession(bsMainMenu.MainMenuSession)
-        bsInternal._fadeScreen(False,time=250,endCall=bs.Call(bs.pushCall,doIt))
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-
-    def _onMyReplayRenamePress(self):
-        if self._myReplaySelected is None:
-            self._noReplaySelectedError()
-            return
-        cWidth = 600
-        cHeight = 250
-        self._myReplaysRenameWindow = c = bs.containerWidget(scale=1.8 if gSmallUI else 1.55 if gMedUI else 1.0,
-                                                             size=(cWidth,cHeight),transition='inScale')
-        dName = self._getReplayDisplayName(self._myReplaySelected)
-        bs.textWidget(parent=c,size=(0,0),hAlign='center',vAlign='center',
-                      text=bs.Lstr(resource=self._r+'.renameReplayText',subs=[('${REPLAY}',dName)]),
-                      maxWidth=cWidth*0.8,
-                      position=(cWidth*0.5,cHeight-60))
-        self._myReplayRenameText = t = bs.textWidget(parent=c,size=(cWidth*0.8,40),hAlign='left',vAlign='center',text=dName,
-                                                     editable=True,
-                                                     description=bs.Lstr(resource=self._r+'.replayNameText'),
-                                                     position=(cWidth*0.1,cHeight-140),autoSelect=True,maxWidth=cWidth*0.7,maxChars=200)
-        cb = bs.buttonWidget(parent=c,
-                             label=bs.Lstr(resource='cancelText'),
-                             onActivateCall=bs.Call(bs.containerWidget,edit=c,transition='outScale'),size=(180,60),position=(30,30),autoSelect=True)
-        okb = bs.buttonWidget(parent=c,
-                              label=bs.Lstr(resource=self._r+'.renameText'),
-                              size=(180,60),position=(cWidth-230,30),
-                              onActivateCall=bs.Call(self._renameMyReplay,self._myReplaySelected),autoSelect=True)
-        bs.widget(edit=cb,rightWidget=okb)
-        bs.widget(edit=okb,leftWidget=cb)
-        bs.textWidget(edit=t,onReturnPressCall=okb.activate)
-        bs.containerWidget(edit=c,cancelButton=cb,startButton=okb)
-
-    def _renameMyReplay(self,replay):
-        try:
-            if not self._myReplayRenameText.exists():
-                return
-            newNameRaw = bs.textWidget(query=self._myReplayRenameText)
-            newName = newNameRaw+'.brp'
-            # ignore attempts to change it to what it already is (or what it looks like to the user)
-            if replay != newName and self._getReplayDisplayName(replay) != newNameRaw:
-                oldNameFull = (bsInternal._getReplaysDir()+'/'+replay).encode('utf-8')
-                newNameFull = (bsInternal._getReplaysDir()+'/'+newName).encode('utf-8')
-                if os.path.exists(newNameFull):
-                    bs.playSound(bs.getSound('error'))
-                    bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorAlreadyExistsText'),color=(1,0,0))
-                elif any(char in newNameRaw for char in ['/','\\',':']):
-                    bs.playSound(bs.getSound('error'))
-                    bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorInvalidName'),color=(1,0,0))
-                else:
-                    bsInternal._incrementAnalyticsCount('Replay rename')
-                    os.rename(oldNameFull,newNameFull)
-                    self._refreshMyReplays()
-                    bs.playSound(bs.getSound('gunCocking'))
-        except Exception:
-            bs.printException("error renaming replay '"+replay+"' to '"+newName+"'")
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorText'),color=(1,0,0))
-            
-        bs.containerWidget(edit=self._myReplaysRenameWindow,transition='outScale')
-            
-        
-    def _onMyReplayDeletePress(self):
-        if self._myReplaySelected is None:
-            self._noReplaySelectedError()
-            return
-        ConfirmWindow(bs.Lstr(resource=self._r+'.deleteConfirmText',subs=[('${REPLAY}',self._getReplayDisplayName(self._myReplaySelected))]),
-                      bs.Call(self._deleteReplay,self._myReplaySelected),450,150)
-
-    def _getReplayDisplayName(self,replay):
-        if replay.endswith('.brp'):
-            replay = replay[:-4]
-        if replay == '__lastReplay': return bs.Lstr(resource='replayNameDefaultText').evaluate()
-        return replay
-    
-    def _deleteReplay(self,replay):
-        try:
-            bsInternal._incrementAnalyticsCount('Replay delete')
-            os.remove((bsInternal._getReplaysDir()+'/'+replay).encode('utf-8'))
-            self._refreshMyReplays()
-            bs.playSound(bs.getSound('shieldDown'))
-            if replay == self._myReplaySelected: self._myReplaySelected = None
-        except Exception:
-            bs.printException("exception deleting replay '"+replay+"'")
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource=self._r+'.replayDeleteErrorText'),color=(1,0,0))
-        
-    def _onMyReplaySelect(self,replay):
-        self._myReplaySelected = bs.uni(replay)
-
-    def _refreshMyReplays(self):
-        for c in self._columnWidget.getChildren(): c.delete()
-        tScale = 1.6
-        try:
-            names = os.listdir(bsInternal._getReplaysDir())
-            names = [bs.uni(n) for n in names if n.endswith('.brp')] # ignore random other files in there..
-            names.sort(key=lambda x:x.lower())
-        except Exception:
-            bs.printException("error listing replays dir")
-            names = []
-        
-        for i,name in enumerate(names):
-            t = bs.textWidget(parent=self._columnWidget,size=(self._myReplaysScrollWidth/tScale,30),selectable=True,
-                              color=(1.0,1,0.4) if name == '__lastReplay.brp' else (1,1,1),alwaysHighlight=True,
-                              onSelectCall=bs.Call(self._onMyReplaySelect,name),
-                              onActivateCall=self._myReplaysWatchReplayButton.activate,
-                              text=self._getReplayDisplayName(name),hAlign='left',vAlign='center',cornerScale=tScale,
-                              maxWidth=(self._myReplaysScrollWidth/tScale)*0.93)
-            if i == 0:
-                bs.widget(edit=t,upWidget=self._tabButtons['myReplays'])
-    
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._backButton: selName = 'Back'
-            elif sel in self._tabButtons.values():
-                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
-            elif sel == self._tabContainer: selName = 'TabContainer'
-            else: raise Exception("unrecognized selection")
-            gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab}
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
-
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]['selName']
-            except Exception: selName = None
-            try: currentTab = bs.getConfig()['Watch Tab']
-            except Exception: currentTab = None
-            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'myReplays'
-            self._setTab(currentTab)
-            if selName == 'Back': sel = self._backButton
-            elif selName == 'TabContainer': sel = self._tabContainer
-            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
-            else:
-                if self._tabContainer is not None: sel = self._tabContainer
-                else: sel = self._tabButtons[currentTab]
-            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-            
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
-
-gShowedNetPlayWarning = False
-
-
-class GatherWindow(Window):
-
-    def __del__(self):
-        bsInternal._setPartyIconAlwaysVisible(False)
-
-    def __init__(self,transition='inRight',originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Gather Window')
-        
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-        
-        global gMainWindow
-        gMainWindow = "Gather"
-        
-        bsInternal._setPartyIconAlwaysVisible(True)
-
-        self._publicParties = {}
-        
-        self._width = 1040
-        self._height = 582 if gSmallUI else 680 if gMedUI else 800
-        self._currentTab = None
-        extraTop = 20 if gSmallUI else 0
-
-        self._r = 'gatherWindow'
-
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
-                                              toolbarVisibility='MENU_MINIMAL',
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              scale=1.3 if gSmallUI else 0.97 if gMedUI else 0.8,
-                                              stackOffset=(0,-11) if gSmallUI else (0,0) if gMedUI else (0,0))
-
-        if gSmallUI and gToolbars:
-            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
-            self._backButton = None
-        else:
-            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(70,self._height-74),size=(140,60),scale=1.1,
-                                                                autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back', onActivateCall=self._back)
-            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-            if gDoAndroidNav:
-                bs.buttonWidget(edit=b,buttonType='backSmall',position=(70,self._height-78),size=(60,60),label=bs.getSpecialChar('back'))
-                # bs.textWidget(edit=t,hAlign='left',position=(155,self._height - 44))
-
-        
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-42),size=(0,0),
-                          color=gTitleColor,scale=1.5,hAlign="center",vAlign="center",
-                          text=bs.Lstr(resource=self._r+'.titleText'),
-                          maxWidth=550)
-
-        
-        platform = bs.getEnvironment()['platform']
-        subplatform = bs.getEnvironment()['subplatform']
-        
-        tabsDef = [['about',bs.Lstr(resource=self._r+'.aboutText')]]
-        if True and bsInternal._getAccountMiscReadVal('enablePublicParties',True):
-            tabsDef.append(['internet',bs.Lstr(resource=self._r+'.internetText')])
-        if platform == 'android' and subplatform == 'google':
-            tabsDef.append(['googlePlus',bs.Lstr(resource=self._r+'.googlePlayText')])
-        tabsDef.append(['localNetwork',bs.Lstr(resource=self._r+'.localNetworkText')])
-        
-        tabsDef.append(['manual',bs.Lstr(resource=self._r+'.manualText')])
-
-        scrollBufferH = 130
-        tabBufferH = 250
-        
-        self._tabButtons = _createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
-                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab)
-
-        if gToolbars:
-            bs.widget(edit=self._tabButtons[tabsDef[-1][0]],rightWidget=bsInternal._getSpecialWidget('partyButton'))
-            if gSmallUI:
-                bs.widget(edit=self._tabButtons[tabsDef[0][0]],leftWidget=bsInternal._getSpecialWidget('backButton'))
-            
-        self._scrollWidth = self._width-scrollBufferH
-        self._scrollHeight = self._height-180
-
-        # not actually using a scroll widget anymore; just an image
-        scrollLeft = (self._width-self._scrollWidth)*0.5
-        scrollBottom = self._height-self._scrollHeight-79-48
-        bufferH = 10
-        bufferV = 4
-        bs.imageWidget(parent=self._rootWidget,position=(scrollLeft-bufferH,scrollBottom-bufferV),size=(self._scrollWidth+2*bufferH,self._scrollHeight+2*bufferV),
-                       texture=bs.getTexture('scrollWidget'),modelTransparent=bs.getModel('softEdgeOutside'))
-        self._tabContainer = None
-        self._restoreState()
-
-    def _showWarning(self):
-        global gShowedNetPlayWarning
-        if not gShowedNetPlayWarning:
-            gShowedNetPlayWarning = True
-            env = bs.getEnvironment()
-            if not env['debugBuild']:
-                ConfirmWindow(bs.Lstr(resource=self._r+'.inDevelopmentWarningText'),
-                              color=(0.7,1.0,0.7),width=500,height=205,cancelButton=False)
-
-    def _onGooglePlayShowInvitesPress(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN'  or bsInternal._getAccountType() != 'Google Play':
-            showSignInPrompt('Google Play')
-        else:
-            bsInternal._showInvitesUI()
-    
-    def _onGooglePlayInvitePress(self):
-
-        if bsInternal._getAccountState() != 'SIGNED_IN' or bsInternal._getAccountType() != 'Google Play':
-            showSignInPrompt('Google Play')
-        else:
-            # if there's google play people connected to us, inform the user that they will get disconnected..
-            # otherwise just go ahead..
-            googlePlayerCount = bsInternal._getGooglePlayPartyClientCount()
-            if googlePlayerCount > 0:
-                ConfirmWindow(bs.Lstr(resource=self._r+'.googlePlayReInviteText',subs=[('${COUNT}',str(googlePlayerCount))]),
-                              bs.Call(bs.realTimer,200,bsInternal._invitePlayers),
-                              width=500,height=150,okText=bs.Lstr(resource=self._r+'.googlePlayInviteText'))
-            else:
-                bs.realTimer(100,bsInternal._invitePlayers)
-
-    def _inviteToTryPress(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-            return
-        doAppInvitesPress()
-        
-    def _setTab(self,tab):
-
-        if self._currentTab == tab: return
-        self._currentTab = tab
-
-        # we wanna preserve our current tab between runs
-        bs.getConfig()['Gather Tab'] = tab
-        bs.writeConfig()
-        
-        # update tab colors based on which is selected
-        _updateTabButtonColors(self._tabButtons,tab)
-
-        # (re)create scroll widget
-        if self._tabContainer is not None and self._tabContainer.exists():
-            self._tabContainer.delete()
-        scrollLeft = (self._width-self._scrollWidth)*0.5
-        scrollBottom = self._height-self._scrollHeight-79-48
-
-        # a place where tabs can store data to get cleared when switching to a different tab
-        self._tabData = {}
-        
-        # so we can still select root level widgets with direction buttons
-        def _simpleMessage(tab,message,stringHeight,includeInvite=False):
-            msgScale = 1.1
-            cWidth = self._scrollWidth
-            cHeight = min(self._scrollHeight,stringHeight*msgScale+100)
-            tryTickets = bsInternal._getAccountMiscReadVal('friendTryTickets',None)
-            if tryTickets is None: includeInvite = False
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectable=True if includeInvite else False)
-            bs.widget(edit=c,upWidget=self._tabButtons[tab])
-            
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,cHeight*(0.58 if includeInvite else 0.5)),
-                              color=(0.6,1.0,0.6),scale=msgScale,
-                              size=(0,0),maxWidth=cWidth*0.9,maxHeight=cHeight*(0.7 if includeInvite else 0.9),
-                              hAlign='center',vAlign='center',
-                              text=message)
-            if includeInvite:
-                t = bs.textWidget(parent=c,position=(cWidth*0.57,35),
-                                  color=(0,1,0),scale=0.6,
-                                  size=(0,0),maxWidth=cWidth*0.5,
-                                  hAlign='right',vAlign='center',
-                                  flatness=1.0,
-                                  text=bs.Lstr(resource=self._r+'.inviteAFriendText',subs=[('${COUNT}',str(tryTickets))])
-                )
-                bs.buttonWidget(parent=c,position=(cWidth*0.59,10),
-                                size=(230,50),
-                                color=(0.54,0.42,0.56),
-                                textColor=(0,1,0),
-                                label=bs.Lstr(resource='gatherWindow.inviteFriendsText',fallback='gatherWindow.getFriendInviteCodeText'),
-                                autoSelect=True,
-                                onActivateCall=bs.WeakCall(self._inviteToTryPress),
-                                upWidget=self._tabButtons[tab])
-
-
-        if tab == 'about':
-            msg = bs.Lstr(resource=self._r+'.aboutDescriptionText',subs=[('${PARTY}',bs.getSpecialChar('partyIcon')),('${BUTTON}',bs.getSpecialChar('topButton'))])
-
-            # let's not talk about sharing in vr-mode; its tricky to fit more than
-            # one head in a VR-headset ;-)
-            if not bs.getEnvironment()['vrMode']:
-                msg = bs.Lstr(value='${A}\n\n${B}',subs=[('${A}',msg),('${B}',bs.Lstr(resource=self._r+'.aboutDescriptionLocalMultiplayerExtraText'))])
-                
-            _simpleMessage(tab,msg,400,includeInvite=True)
-            
-        elif tab == 'googlePlus':
-            cWidth = self._scrollWidth
-            cHeight = 380
-            bWidth = 250
-            bWidth2 = 230
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            imgSize = 100
-            v = cHeight-30
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.googlePlayDescriptionText'))
-            v -= 35
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.worksWithGooglePlayDevicesText'))
-            v -= 125
-            b = bs.buttonWidget(parent=c,label='',position=(cWidth*0.5-bWidth*0.5,v-bWidth*0.5),size=(bWidth,bWidth*0.9),
-                                #buttonType='square',onActivateCall=bs.Call(bs.realTimer,100,bsInternal._invitePlayers),
-                                buttonType='square',onActivateCall=self._onGooglePlayInvitePress,
-                                autoSelect=True,upWidget=self._tabButtons[tab])
-            bs.imageWidget(parent=c,position=(cWidth*0.5-imgSize*0.5,v-35),size=(imgSize,imgSize),
-                           drawController=b,texture=bs.getTexture('googlePlayGamesIcon'),color=(0,1,0))
-            bs.textWidget(parent=c,text=bs.Lstr(resource=self._r+'.googlePlayInviteText'),maxWidth=bWidth*0.8,drawController=b,color=(0,1,0),flatness=1.0,
-                          position=(cWidth*0.5,v-60),scale=1.6,size=(0,0),hAlign='center',vAlign='center')
-            v -= 180
-            bs.buttonWidget(parent=c,label=bs.Lstr(resource=self._r+'.googlePlaySeeInvitesText'),
-                            color=(0.5,0.5,0.6),textColor=(0.75,0.7,0.8),
-                            autoSelect=True,
-                            position=(cWidth*0.5-bWidth2*0.5,v),
-                            size=(bWidth2,60),
-                            onActivateCall=bs.Call(bs.realTimer,100,self._onGooglePlayShowInvitesPress))
-
-        elif tab == 'internet':
-            cWidth = self._scrollWidth
-            cHeight = self._scrollHeight-20
-            subScrollHeight = cHeight - 85
-            subScrollWidth = 650
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            v = cHeight - 30
-            self._internetJoinText = t = bs.textWidget(parent=c,position=(cWidth*0.5-245,v-13),color=(0.6,1.0,0.6),scale=1.3,
-                                                       size=(200,30),maxWidth=250,
-                                                       hAlign='left',vAlign='center',
-                                                       clickActivate=True,
-                                                       selectable=True,autoSelect=True,
-                                                       onActivateCall=bs.Call(self._setInternetTab,'join',playSound=True),
-                                                       text=bs.Lstr(resource=self._r+'.joinPublicPartyDescriptionText')
-            )
-            bs.widget(edit=t,upWidget=self._tabButtons[tab])
-            self._internetHostText = t = bs.textWidget(parent=c,position=(cWidth*0.5+45,v-13),color=(0.6,1.0,0.6),scale=1.3,
-                                                       size=(200,30),maxWidth=250,
-                                                       hAlign='left',vAlign='center',
-                                                       clickActivate=True,
-                                                       selectable=True,autoSelect=True,
-                                                       onActivateCall=bs.Call(self._setInternetTab,'host',playSound=True),
-                                                       text=bs.Lstr(resource=self._r+'.hostPublicPartyDescriptionText')
-            )
-            bs.widget(edit=t,leftWidget=self._internetJoinText,upWidget=self._tabButtons[tab])
-            bs.widget(edit=self._internetJoinText,rightWidget=t)
-
-            # attempt to fetch our local address so we have it for error messages
-            self._internetLocalAddress = None
-            class AddrFetchThread(threading.Thread):
-                def __init__(self,call):
-                    threading.Thread.__init__(self)
-                    self._call = call
-                def run(self):
-                    try:
-                        # FIXME - update this to work with IPv6 at some point..
-                        import socket
-                        val = ([(s.connect(('8.8.8.8', 80)), s.getsockname()[0], s.close()) for s in [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)]][0][1])
-                        bs.callInGameThread(bs.Call(self._call,val))
-                    except Exception:
-                        pass
-
-            AddrFetchThread(bs.WeakCall(self._internetFetchLocalAddrCB)).start()
-            
-            self._setInternetTab(self._internetTab)
-            self._tabData = {}
-
-            self._tabData['updateTimer'] = bs.Timer(1000,bs.WeakCall(self._updateInternetTab),repeat=True,timeType='real')
-            
-            # bs.widget(edit=sw,autoSelect=True,upWidget=self._tabButtons[tab])
-            
-        elif tab == 'localNetwork':
-            cWidth = self._scrollWidth
-            cHeight = self._scrollHeight-20
-            subScrollHeight = cHeight - 85
-            subScrollWidth = 650
-
-            class NetScanner(object):
-                def __init__(self,scrollWidget,tabButton,width):
-                    self._scrollWidget = scrollWidget
-                    self._tabButton = tabButton
-                    self._columnWidget = bs.columnWidget(parent=self._scrollWidget,leftBorder=10)
-                    bs.widget(edit=self._columnWidget,upWidget=tabButton)
-                    self._width = width
-                    self._lastSelectedHost = None
-
-                    self._updateTimer = bs.Timer(1000,bs.WeakCall(self.update),timeType='real',repeat=True)
-                    # go ahead and run a few *almost* immediately so we dont have to wait a second
-                    self.update()
-                    bs.realTimer(250,bs.WeakCall(self.update))
-                    
-                def __del__(self):
-                    bsInternal._endHostScanning()
-
-                def _onSelect(self,host):
-                    self._lastSelectedHost = host
-
-                def _onActivate(self,host):
-                    bsInternal._connectToParty(host['address'])
-                    #bs.screenMessage("WOULD CONNECT TO '"+host['address']+"'")
-                        
-                def update(self):
-                    tScale = 1.6
-                    for c in self._columnWidget.getChildren(): c.delete()
-                    lastSelectedHost = self._lastSelectedHost # grab this now this since adding widgets will change it
-                    hosts = bsInternal._hostScanCycle()
-                    for i,host in enumerate(hosts):
-                        t = bs.textWidget(parent=self._columnWidget,size=(self._width/tScale,30),selectable=True,
-                                          #color=(0,1,0),
-                                          color=(1,1,1),
-                                          onSelectCall=bs.Call(self._onSelect,host),
-                                          onActivateCall=bs.Call(self._onActivate,host),clickActivate=True,
-                                          text=host['displayString'],hAlign='left',vAlign='center',cornerScale=tScale,maxWidth=(self._width/tScale)*0.93)
-                                          #text=host['name']+"_"+host['pubID'],hAlign='left',vAlign='center',cornerScale=tScale,maxWidth=(self._width/tScale)*0.93)
-                        if host == lastSelectedHost:
-                            bs.containerWidget(edit=self._columnWidget,selectedChild=t,visibleChild=t)
-                        if i == 0: bs.widget(edit=t,upWidget=self._tabButton)
-            
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            v = cHeight - 30
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v-3),color=(0.6,1.0,0.6),scale=1.3,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.localNetworkDescriptionText'))
-            v -= 15
-            v -= subScrollHeight+23
-            sw = bs.scrollWidget(parent=c,position=((self._scrollWidth-subScrollWidth)*0.5,v),size=(subScrollWidth,subScrollHeight))
-
-            self._tabData = NetScanner(sw,self._tabButtons[tab],width=subScrollWidth)
-            
-            
-            bs.widget(edit=sw,autoSelect=True,upWidget=self._tabButtons[tab])
-            # t = bs.textWidget(parent=c,position=(cWidth*0.5,v+subScrollHeight*0.5),color=(1,1,1),scale=0.9,
-            #                   size=(0,0),maxWidth=cWidth*0.9,
-            #                   hAlign='center',vAlign='center',
-            #                   text='(not wired up yet)')
-
-            # _simpleMessage(('TODO: add local network UI here'))
-
-        elif tab == 'bluetooth':
-            cWidth = self._scrollWidth
-            cHeight = 380
-            subScrollHeight = cHeight - 150
-            subScrollWidth = 650
-
-            bWidth = 250
-            bWidth2 = 230
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            imgSize = 100
-            v = cHeight-30
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.bluetoothDescriptionText'))
-            v -= 35
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.bluetoothAndroidSupportText'))
-
-            v -= 55
-            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-subScrollWidth*0.5+10,v-75),size=(300,70),autoSelect=True,
-                                onActivateCall=bsInternal._bluetoothAdvertise,
-                                label=bs.Lstr(resource=self._r+'.bluetoothHostText'))
-            bs.widget(edit=b,upWidget=self._tabButtons[tab])
-            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-subScrollWidth*0.5+330,v-75),size=(300,70),autoSelect=True,
-                                onActivateCall=bs.Call(bs.screenMessage,'FIXME: not wired up yet'),
-                                label=bs.Lstr(resource=self._r+'.bluetoothJoinText'))
-            bs.widget(edit=b,upWidget=self._tabButtons[tab])
-            bs.widget(edit=self._tabButtons[tab],downWidget=b)
-            
-        elif tab == 'wifiDirect':
-            cWidth = self._scrollWidth
-            cHeight = self._scrollHeight-20
-            subScrollHeight = cHeight - 100
-            subScrollWidth = 650
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            v = cHeight - 80
-
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.0,
-                              size=(0,0),maxWidth=cWidth*0.95,maxHeight=140,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.wifiDirectDescriptionTopText'))
-            v -= 140
-            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-175,v),size=(350,65),label=bs.Lstr(resource=self._r+'.wifiDirectOpenWiFiSettingsText'),
-                            autoSelect=True,onActivateCall=bsInternal._androidShowWifiSettings)
-            v -= 82
-            
-            bs.widget(edit=b,upWidget=self._tabButtons[tab])
-
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.9,
-                              size=(0,0),maxWidth=cWidth*0.95,maxHeight=150,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.wifiDirectDescriptionBottomText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]))
-            
-
-        elif tab == 'manual':
-            cWidth = self._scrollWidth
-            cHeight = 380
-
-            try: lastAddr = bs.getConfig()['Last Manual Party Connect Address']
-            except Exception: lastAddr = ''
-
-            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
-                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
-                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
-            v = cHeight-30
-            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
-                              size=(0,0),maxWidth=cWidth*0.9,
-                              hAlign='center',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.manualDescriptionText'))
-            v -= 30
-            v -= 70
-            t = bs.textWidget(parent=c,position=(cWidth*0.5-260-50,v),
-                              color=(0.6,1.0,0.6),scale=1.0,
-                              size=(0,0),maxWidth=130,
-                              hAlign='right',vAlign='center',
-                              text=bs.Lstr(resource=self._r+'.manualAddressText'))
-            t = bs.textWidget(parent=c,editable=True,
-                              description=bs.Lstr(resource=self._r+'.manualAddressText'),
-                              position=(cWidth*0.5-240-50,v-30),text=lastAddr,autoSelect=True,
-                              vAlign='center',scale=1.0, size=(420,60))
-            t2 = bs.textWidget(parent=c,position=(cWidth*0.5-260+490,v),
-                               color=(0.6,1.0,0.6),scale=1.0,
-                               size=(0,0),maxWidth=80,
-                               hAlign='right',vAlign='center',
-                               text=bs.Lstr(resource=self._r+'.portText')
-            )
-            t2 = bs.textWidget(parent=c,editable=True,
-                               description=bs.Lstr(resource=self._r+'.portText'),
-                               text='43210',autoSelect=True,maxChars=5,
-                               position=(cWidth*0.5-240+490,v-30),
-                               vAlign='center',scale=1.0, size=(170,60))
-
-            v -= 110
-            
-            def _connect(textWidget,portTextWidget):
-                addr = bs.textWidget(query=textWidget)
-                try:
-                    port = int(bs.textWidget(query=portTextWidget))
-                    if port > 65535 or port < 0: raise Exception()
-                except Exception:
-                    bs.screenMessage(bs.Lstr(resource='internal.invalidPortErrorText'),color=(1,0,0))
-                    return
-                
-                class HostAddrFetchThread(threading.Thread):
-                    def __init__(self,name,call):
-                        threading.Thread.__init__(self)
-                        self._name = name
-                        self._call = call
-                    def run(self):
-                        try:
-                            import socket
-                            addr = socket.gethostbyname(self._name)
-                            bs.callInGameThread(bs.Call(self._call,addr))
-                        except Exception:
-                            bs.callInGameThread(bs.Call(self._call,None))
-
-                def doIt(addr):
-                    if addr is None:
-                        bs.screenMessage(bs.Lstr(resource='internal.unableToResolveHostText'),color=(1,0,0))
-                    else:
-                        # print 'WOULD DO IT WITH',type(addr),addr
-                        bs.getConfig()['Last Manual Party Connect Address'] = addr # store for later
-                        bs.writeConfig()
-                        bsInternal._connectToParty(addr,port=port)
-                HostAddrFetchThread(addr,doIt).start()
-                
-            b = bs.buttonWidget(parent=c,size=(300,70),
-                                label=bs.Lstr(resource=self._r+'.manualConnectText'),
-                                position=(cWidth*0.5-150,v),autoSelect=True,
-                                onActivateCall=bs.Call(_connect,t,t2))
-            bs.widget(edit=t,upWidget=self._tabButtons[tab])
-            bs.textWidget(edit=t,onReturnPressCall=b.activate)
-            bs.textWidget(edit=t2,onReturnPressCall=b.activate)
-            v -= 45
-            
-            ts = 0.85
-            tspc = 25
-
-            #v -= 35
-            def _safeSetText(t,val,success=True):
-                if t.exists(): bs.textWidget(edit=t,text=val,color=(0,1,0) if success else (1,1,0))
-
-            # this currently doesn't work from china since we go through a reverse proxy there
-            # EDIT - it should work now; our proxy server forwards along original IPs
-            env = bs.getEnvironment()
-            # doInternetCheck = False if env['platform'] == 'android' and env['subplatform'] == 'alibaba' else True
-            doInternetCheck = True
-            
-            def doIt(v,c):
-                if not c.exists(): return
-
-                bs.playSound(bs.getSound('swish'))
-                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
-                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
-                                  hAlign='right',vAlign='center',
-                                  text=bs.Lstr(resource=self._r+'.manualYourLocalAddressText'))
-                t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
-                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
-                                  hAlign='left',vAlign='center',
-                                  text=bs.Lstr(resource=self._r+'.checkingText'))
-
-                class AddrFetchThread(threading.Thread):
-                    def __init__(self,window,textWidget):
-                        threading.Thread.__init__(self)
-                        self._window = window
-                        self._textWidget = textWidget
-                    def run(self):
-                        try:
-                            # FIXME - update this to work with IPv6 at some point..
-                            import socket
-                            val = ([(s.connect(('8.8.8.8', 80)), s.getsockname()[0], s.close()) for s in [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)]][0][1])
-                            bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,val))
-                        except Exception,e:
-                            errStr = str(e)
-                            if 'Network is unreachable' in errStr:
-                                bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,
-                                                            # self._window._R.noConnectionText,
-                                                            bs.Lstr(resource=self._window._r+'.noConnectionText'),
-                                                            False))
-                            else:
-                                bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,
-                                                            # self._window._R.addressFetchErrorText,
-                                                            bs.Lstr(resource=self._window._r+'.addressFetchErrorText'),
-                                                            False))
-                                bs.callInGameThread(bs.Call(bs.printError,'error in AddrFetchThread: '+str(e)))
-                AddrFetchThread(self,t).start()
-                
-                v -= tspc
-                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
-                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
-                                  hAlign='right',vAlign='center',
-                                  text=bs.Lstr(resource=self._r+'.manualYourAddressFromInternetText'))
-
-                tAddr = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
-                                  size=(0,0),maxWidth=cWidth*0.45,
-                                      hAlign='left',vAlign='center',flatness=1.0,
-                                      text=bs.Lstr(resource=self._r+'.checkingText'))
-                v -= tspc
-                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
-                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
-                                  hAlign='right',vAlign='center',
-                                  text=bs.Lstr(resource=self._r+'.manualJoinableFromInternetText'))
-
-                tAccessible = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
-                                            size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
-                                            hAlign='left',vAlign='center',
-                                            text=bs.Lstr(resource=self._r+'.checkingText'))
-                v -= 28
-                tAccessibleExtra = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(1,0.5,0.2),scale=0.7,
-                                                 size=(0,0),maxWidth=cWidth*0.9,flatness=1.0,
-                                                 hAlign='center',vAlign='center',
-                                                 text='')
-
-                self._doingAccessCheck = False
-                self._accessCheckCount = 0 # cap our refreshes eventually..
-                self._tabData['accessCheckTimer'] = bs.Timer(10000,bs.WeakCall(self._accessCheckUpdate,tAddr,tAccessible,tAccessibleExtra),
-                                                             repeat=True,timeType='real')
-                self._accessCheckUpdate(tAddr,tAccessible,tAccessibleExtra)  # kick initial off
-
-                if checkButton.exists():
-                    checkButton.delete()
-                
-            if doInternetCheck:
-                checkButton = b = bs.textWidget(parent=c, size=(250,60),
-                                                text=bs.Lstr(resource=self._r+'.showMyAddressText'),
-                                                vAlign='center',hAlign='center', clickActivate=True,
-                                                position=(cWidth*0.5 - 125,v-30), autoSelect=True,
-                                                color=(0.5,0.9,0.5),
-                                                scale=0.8,
-                                                selectable=True,
-                                                onActivateCall=bs.Call(doIt,v,c))
-
-    def _internetFetchLocalAddrCB(self, val):
-        self._internetLocalAddress = str(val)
-        
-    def _setInternetTab(self, value, playSound=False):
-        if playSound: bs.playSound(bs.getSound('click01'))
-
-        # if we're switching in from elsewhere, reset our selection
-        # (prevents selecting something way down the list if we switched away and came back)
-        if self._internetTab != value:
-            self._publicPartyListSelection = None
-        
-        self._internetTab = value
-        # activeColor = (0.4,1.0,0.4)
-        activeColor = (0.6,1.0,0.6)
-        inactiveColor = (0.5,0.4,0.5)
-        bs.textWidget(edit=self._internetJoinText,color=activeColor if value == 'join' else inactiveColor)
-        bs.textWidget(edit=self._internetHostText,color=activeColor if value == 'host' else inactiveColor)
-
-        # clear anything in existence..
-        for attr in ['_internetHostScrollWidget','_internetHostNameText','_internetHostToggleButton',
-                     '_internetHostNameLabelText','_internetHostStatusText','_internetJoinPartySizeLabel','_internetJoinNameLabel',
-                     '_internetJoinPartyNameLabel','_internetJoinPartyLanguageLabel',
-                     '_internetJoinPartyPingLabel','_internetHostMaxPartySizeLabel','_internetHostMaxPartySizeValue',
-                     '_internetHostMaxPartySizeMinusButton','_internetHostMaxPartySizePlusButton',
-                     '_internetJoinStatusText','_internetHostDedicatedServerInfoText']:
-            widget = getattr(self,attr,None)
-            if widget is not None:
-                widget.delete()
-                delattr(self,attr)
-
-        cWidth = self._scrollWidth
-        cHeight = self._scrollHeight-20
-        subScrollHeight = cHeight - 90
-        subScrollWidth = 830
-        v = cHeight - 35
-        v -= 25
-        isPublicEnabled = bsInternal._getPublicPartyEnabled()
-        if value == 'join':
-            self._internetJoinLastRefreshTime = -99999 # reset this so we do an immediate refresh query
-            # reset our list of public parties
-            self._publicParties = {}
-            self._internetJoinPartyNameLabel = bs.textWidget(text=bs.Lstr(resource='nameText'),
-                                                             parent=self._tabContainer,size=(0,0),position=(90,v-8),maxWidth=60,
-                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
-            self._internetJoinPartyLanguageLabel = bs.textWidget(text=bs.Lstr(resource='settingsWindowAdvanced.languageText'),
-                                                                 parent=self._tabContainer,size=(0,0),position=(662,v-8),maxWidth=100,
-                                                                 scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
-            self._internetJoinPartySizeLabel = bs.textWidget(text=bs.Lstr(resource=self._r+'.partySizeText'),
-                                                             parent=self._tabContainer,size=(0,0),position=(755,v-8),maxWidth=60,
-                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
-            self._internetJoinPartyPingLabel = bs.textWidget(text=bs.Lstr(resource=self._r+'.pingText'),
-                                                             parent=self._tabContainer,size=(0,0),position=(825,v-8),maxWidth=60,
-                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
-            v -= subScrollHeight+23
-            
-            self._internetHostScrollWidget = sw = bs.scrollWidget(parent=self._tabContainer,
-                                                                  position=((self._scrollWidth-subScrollWidth)*0.5,v),
-                                                                  size=(subScrollWidth,subScrollHeight))
-            bs.widget(edit=sw,autoSelect=True)
-            cw = self._internetHostColumnWidget = bs.columnWidget(parent=sw,leftBorder=10)
-            bs.widget(edit=cw,upWidget=self._internetJoinText)
-
-            self._internetJoinStatusText = bs.textWidget(parent=self._tabContainer,
-                                                         text=bs.Lstr(value='${A}...',subs=[('${A}',bs.Lstr(resource='store.loadingText'))]),
-                                                         size=(0,0), scale=0.9,
-                                                         flatness=1.0,shadow=0.0,hAlign='center',vAlign='top', maxWidth=cWidth,
-                                                         color=(0.6,0.6,0.6), position=(cWidth*0.5,cHeight*0.5))
-            
-            tScale = 1.6
-            
-        if value == 'host':
-            v -= 30
-            partyNameText = bs.Lstr(resource='gatherWindow.partyNameText',fallback='editGameListWindow.nameText')
-            self._internetHostNameLabelText = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='right',vAlign='center',
-                                                            maxWidth=200,scale=0.8,color=gInfoTextColor,position=(210,v-9),text=partyNameText)
-            self._internetHostNameText = bs.textWidget(parent=self._tabContainer,editable=True,size=(535,40),position=(230,v - 30),
-                                                       text=bs.getConfig().get('Public Party Name',''),maxWidth=494,shadow=0.3,flatness=1.0,
-                                                       description=partyNameText,autoSelect=True,vAlign='center',cornerScale=1.0)
-
-            v -= 60
-            self._internetHostMaxPartySizeLabel = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='right',vAlign='center',
-                                                                maxWidth=200,scale=0.8,color=gInfoTextColor,position=(210,v-9),
-                                                                text=bs.Lstr(resource='maxPartySizeText',fallback='maxConnectionsText')
-            )
-            self._internetHostMaxPartySizeValue = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='center',vAlign='center',
-                                                                scale=1.2,color=(1,1,1),position=(240,v-9),
-                                                                text=str(bsInternal._getPublicPartyMaxSize()))
-            b1 = self._internetHostMaxPartySizeMinusButton = bs.buttonWidget(parent=self._tabContainer,size=(40,40),
-                                                                            onActivateCall=bs.WeakCall(self._onMaxPublicPartySizeMinusPress),
-                                                                             position=(280,v-26),label='-',autoSelect=True)
-            b2 = self._internetHostMaxPartySizePlusButton = bs.buttonWidget(parent=self._tabContainer,size=(40,40),
-                                                                            onActivateCall=bs.WeakCall(self._onMaxPublicPartySizePlusPress),
-                                                                            position=(350,v-26),label='+',autoSelect=True)
-            v -= 50
-            v -= 70
-            if isPublicEnabled:
-                label = bs.Lstr(resource='gatherWindow.makePartyPrivateText',fallback='gatherWindow.stopAdvertisingText')
-            else: label = bs.Lstr(resource='gatherWindow.makePartyPublicText',fallback='gatherWindow.startAdvertisingText')
-            self._internetHostToggleButton = bs.buttonWidget(parent=self._tabContainer, label=label,size=(400,80),
-                                                             onActivateCall=self._onStopInternetAdvertisingPress if isPublicEnabled else self._onStartInternetAdvertisingPress,
-                                                             position=(cWidth*0.5-200,v),autoSelect=True,upWidget=b2)
-            bs.widget(edit=self._internetHostNameText,downWidget=b2)
-            bs.widget(edit=b2,upWidget=self._internetHostNameText)
-            bs.widget(edit=b1,upWidget=self._internetHostNameText)
-            bs.widget(edit=self._internetJoinText,downWidget=self._internetHostNameText)
-            v -= 10
-            self._internetHostStatusText = bs.textWidget(parent=self._tabContainer,
-                                                         text=bs.Lstr(resource=self._r+'.partyStatusNotPublicText'),
-                                                         size=(0,0), scale=0.7,
-                                                         flatness=1.0,shadow=0.0,hAlign='center',vAlign='top', maxWidth=cWidth,
-                                                         color=(0.6,0.6,0.6), position=(cWidth*0.5,v))
-            v -= 90
-            self._internetHostDedicatedServerInfoText = bs.textWidget(parent=self._tabContainer,
-                                                                      text=bs.Lstr(resource=self._r+'.dedicatedServerInfoText'),
-                                                                      size=(0,0), scale=0.7,
-                                                                      flatness=1.0,shadow=0.0,hAlign='center',vAlign='center', maxWidth=cWidth * 0.9,
-                                                                      color=gInfoTextColor, position=(cWidth*0.5,v))
-            
-            # if public sharing is already on, launch a status-check immediately
-            if bsInternal._getPublicPartyEnabled():
-                self._doInternetStatusCheck()
-
-        # now add a lock icon overlay for if we don't have pro
-        icon = getattr(self,'_internetLockIcon',None)
-        if icon is not None and icon.exists():
-            self._internetLockIcon.delete() # kill any existing
-        self._internetLockIcon = bs.imageWidget(parent=self._tabContainer,
-                                                position=(cWidth*0.5-60,cHeight*0.5-50),
-                                                size=(120,120),
-                                                opacity=0.0 if not self._isInternetLocked() else 0.5,
-                                                texture=bs.getTexture('lock'))
-        
-    def _isInternetLocked(self):
-        if bsInternal._getAccountMiscReadVal('ilck',False):
-            return False if bsUtils._havePro() else True
-        else:
-            return False
-
-
-    def _onMaxPublicPartySizeMinusPress(self):
-        val = bsInternal._getPublicPartyMaxSize()
-        val -= 1
-        if val < 1: val = 1
-        bsInternal._setPublicPartyMaxSize(val)
-        bs.textWidget(edit=self._internetHostMaxPartySizeValue,text=str(val))
-        
-    def _onMaxPublicPartySizePlusPress(self):
-        val = bsInternal._getPublicPartyMaxSize()
-        val += 1
-        bsInternal._setPublicPartyMaxSize(val)
-        bs.textWidget(edit=self._internetHostMaxPartySizeValue,text=str(val))
-    
-    def _onPublicPartyQueryResult(self, result):
-
-        with bs.Context('UI'):
-            
-            # any time we get any result at all, kill our loading status
-            statusText = getattr(self,'_internetJoinStatusText',None)
-            if statusText is not None and statusText.exists():
-                # dont show results if not signed in (probably didnt get any anyway)
-                if bsInternal._getAccountState() != 'SIGNED_IN':
-                    bs.textWidget(edit=statusText,text=bs.Lstr(resource='notSignedInText'))
-                else:
-                    if result is None: bs.textWidget(edit=statusText,text=bs.Lstr(resource='errorText'))
-                    else: bs.textWidget(edit=statusText,text='')
-
-            if result is not None: partiesIn = result['l']
-            else: partiesIn = []
-
-            for party in self._publicParties.values():
-                party['claimed'] = False
-
-            for partyIn in partiesIn:
-                # party is indexed by (ADDR)_(PORT)
-                partyKey = partyIn['a']+'_'+str(partyIn['p'])
-                party = self._publicParties.get(partyKey)
-                if party is None:
-                    # if this party is new to us, init it..
-                    index = getattr(self,'_nextPublicPartyEntryIndex',0)
-                    self._nextPublicPartyEntryIndex = index + 1
-                    party = self._publicParties[partyKey] = {
-                        'address':partyIn['a'],
-                        'nextPingTime':bs.getRealTime()+partyIn['pd'],
-                        'ping':None,
-                        'index':index,
-                    }
-                # now, new or not, update its values
-                party['port'] = partyIn['p']
-                party['name'] = partyIn['n']
-                party['size'] = partyIn['s']
-                party['language'] = partyIn['l']
-                party['sizeMax'] = partyIn['sm']
-                party['claimed'] = True
-                party['pingInterval'] = partyIn['pi']
-
-            # prune unclaimed party entries
-            self._publicParties = dict([entry for entry in self._publicParties.items() if entry[1]['claimed']])
-
-            self._rebuildPublicPartyList()
-
-    def _rebuildPublicPartyList(self):
-
-        # first off, check for the existence of our column widget; if we don't have this, we're done
-        columnWidget = getattr(self,'_internetHostColumnWidget',None)
-        if columnWidget is None or not columnWidget.exists(): return
-
-        ourLanguage = bs.getLanguage()
-        
-        with bs.Context('UI'):
-            
-            # now kill and recreate all widgets
-            for widget in columnWidget.getChildren():
-                widget.delete()
-            
-            # now build a list of parties, sort by index, and recreate their widgets
-            orderedParties = [(party['ping'] if party['ping'] is not None else 999999,
-                               party['index'],party) for party in self._publicParties.values()]
-            # orderedParties = [(0 if party['language'] == ourLanguage and party['ping'] is not None else 1,
-            #                    party['ping'] if party['ping'] is not None else 999999,
-            #                    party['index'],party) for party in self._publicParties.values()]
-            orderedParties.sort()
-            existingSelection = getattr(self,'_publicPartyListSelection',None)
-            first = True
-            for dummy2, index, party in orderedParties:
-                subScrollWidth = 830
-                party['rootWidget'] = c = bs.containerWidget(parent=columnWidget,
-                                                             size=(subScrollWidth * 0.9,40), rootSelectable=True,
-                                                             onSelectCall=bs.WeakCall(self._setPublicPartySelection,party['address']),
-                                                             onActivateCall=bs.WeakCall(self._onPublicPartyActivate,party['address'],party['port']),
-                                                             background=False, clickActivate=True)
-                if first:
-                    bs.widget(edit=c,upWidget=self._internetJoinText)
-                    first = False
-                if party['address'] == existingSelection:
-                    # reselect previous (if present) but don't scroll to it; that gives us too much unintentional jumping
-                    # if we're scrolling around looking at other stuff during a refresh
-                    bs.containerWidget(edit=columnWidget,selectedChild=c)
-                    #bs.containerWidget(edit=columnWidget,selectedChild=c,visibleChild=c)
-
-                party['nameWidget'] = bs.textWidget(text=party['name'],
-                                                    parent=c,drawController=c,size=(0,0),position=(14,20),maxWidth=subScrollWidth*0.63,
-                                                    scale=1.4,color=(1,1,1,0.3 if party['ping'] is None else 1.0),hAlign='left',vAlign='center')
-                party['languageWidget'] = bs.textWidget(text=bs.Lstr(translate=('languages',party['language'])),
-                                                        parent=c,drawController=c,size=(0,0),position=(subScrollWidth*0.73,20),maxWidth=subScrollWidth*0.13,
-                                                        scale=0.7,color=(0.8,0.8,0.8),hAlign='center',vAlign='center')
-                party['sizeWidget'] = bs.textWidget(text=str(party['size'])+'/'+str(party['sizeMax']),
-                                                    parent=c,drawController=c,size=(0,0),position=(subScrollWidth*0.86,20),
-                                                    scale=0.7,color=(0.8,0.8,0.8),hAlign='right',vAlign='center')
-                party['pingWidget'] = bs.textWidget(parent=c,drawController=c,size=(0,0),position=(subScrollWidth*0.94,20),
-                                                    scale=0.7,hAlign='right',vAlign='center')
-                if party['ping'] is None:
-                    bs.textWidget(edit=party['pingWidget'],text='-',color=(0.5,0.5,0.5))
-                else:
-                    pingGood = bsInternal._getAccountMiscReadVal('pingGood',100)
-                    pingMed = bsInternal._getAccountMiscReadVal('pingMed',500)
-                    bs.textWidget(edit=party['pingWidget'],text=str(party['ping']),color=(0,1,0) if party['ping'] <= pingGood else (1,1,0) if party['ping'] <= pingMed else (1,0,0))
-        
-    def _onPublicPartyActivate(self,address,port):
-        
-        if self._isInternetLocked():
-            if bsInternal._getAccountState() != 'SIGNED_IN': showSignInPrompt()
-            else: PurchaseWindow(items=['pro'])
-            return
-
-        # rate limit this a bit
-        now = time.time()
-        lastConnectTime = getattr(self,'_lastPublicPartyConnectAttemptTime',None)
-        if lastConnectTime is None or now - lastConnectTime > 2.0:
-            bsInternal._connectToParty(address,port=port)
-            self._lastPublicPartyConnectAttemptTime = now
-        
-    def _setPublicPartySelection(self,address):
-        self._publicPartyListSelection = address
-        
-    def _updateInternetTab(self):
-        # if we've got a party-name text widget, keep its value plugged into our public host name...
-        text = getattr(self, '_internetHostNameText', None)
-        if text is not None and text.exists():
-            name = bs.textWidget(query=self._internetHostNameText)
-            bsInternal._setPublicPartyName(name)
-
-        # show/hide the lock icon depending on if we've got pro
-        icon = getattr(self,'_internetLockIcon',None)
-        if icon is not None and icon.exists():
-            #if not bsUtils._havePro():
-            if self._isInternetLocked():
-                bs.imageWidget(edit=icon,opacity=0.5)
-            else:
-                bs.imageWidget(edit=icon,opacity=0.0)
-            
-        if self._internetTab == 'join':
-            now = bs.getRealTime()
-            if now - getattr(self,'_internetJoinLastRefreshTime',-99999) > bsInternal._getAccountMiscReadVal('pubPartyRefreshMS',10000):
-                self._internetJoinLastRefreshTime = now
-                env = bs.getEnvironment()
-                bsInternal._addTransaction({'type':'PUBLIC_PARTY_QUERY','proto':env['protocolVersion'],'lang':bs.getLanguage()},callback=bs.WeakCall(self._onPublicPartyQueryResult))
-
-            # go through our existing public party entries firing off pings for any
-            # that have timed out
-            for party in self._publicParties.values():
-                if party['nextPingTime'] <= now:
-                    party['nextPingTime'] += party['pingInterval']
-
-                    class PingThread(threading.Thread):
-                        def __init__(self,address,port,call):
-                            threading.Thread.__init__(self)
-                            # need utf8 here to avoid an error on our minimum bundled python
-                            self._address = bs.utf8(address)
-                            self._port = port
-                            self._call = call
-                        def run(self):
-                            try:
-                                import socket
-                                socketType = bsUtils._getIPAddressType(self._address)
-                                s = socket.socket(socketType, socket.SOCK_DGRAM)
-                                s.connect((self._address, self._port))
-
-                                accessible = False
-                                startTime = time.time() 
-                                # send a simple ping and wait for a response;
-                                # if we get it, they're accessible...
-
-                                # send a few pings and wait a second for a response
-                                s.settimeout(1)
-                                for i in range(3):
-                                    s.send('\x0b') # 11: BS_PACKET_SIMPLE_PING
-                                    try: result = s.recv(10)
-                                    except Exception: result = None
-                                    if result == '\x0c': # 12: BS_PACKET_SIMPLE_PONG
-                                        accessible = True
-                                        break
-                                    time.sleep(1)
-                                s.close()
-                                ping = int((time.time()-startTime)*1000.0)
-                                bs.callInGameThread(bs.Call(self._call, self._address, self._port, ping if accessible else None))
-                            except Exception as e:
-                                global gPingErrorReported
-                                if not gPingErrorReported:
-                                    gPingErrorReported = True
-                                    # print 'error on public party ping for "'+self._address+'":',e
-                                    
-                    PingThread(party['address'],party['port'],bs.WeakCall(self._pingCB)).start()
-
-    def _pingCB(self,address,port,result):
-        # look for a widget corresponding to this target; if we find one, update our list
-        party = self._publicParties.get(address+'_'+str(port))
-        if party is not None:
-            party['ping'] = result
-            if 'pingWidget' not in party:
-                pass # this can happen if we switch away and then back to the client tab while pings are in flight
-            elif party['pingWidget'].exists():
-                self._rebuildPublicPartyList()
-        
-    def _doInternetStatusCheck(self):
-        bs.textWidget(edit=self._internetHostStatusText,color=(1,1,0),
-                      text=bs.Lstr(resource=self._r+'.partyStatusCheckingText'))
-        bsUtils.serverGet('bsAccessCheck',{},callback=bs.WeakCall(self._onPublicPartyAccessibleResponse))
-
-        
-    def _onStartInternetAdvertisingPress(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-            return
-
-        # requires sign-in and pro
-        #if not bsUtils._havePro():
-        if self._isInternetLocked():
-            if bsInternal._getAccountState() != 'SIGNED_IN': showSignInPrompt()
-            else: PurchaseWindow(items=['pro'])
-            return
-        
-        name = bs.textWidget(query=self._internetHostNameText)
-        if name == '':
-            bs.screenMessage(bs.Lstr(resource='internal.invalidNameErrorText'),color=(1,0,0))
-            bs.playSound(bs.getSound('error'))
-            return
-        bsInternal._setPublicPartyName(name)
-        bs.getConfig()['Public Party Name'] = name
-        bs.writeConfig()
-        bs.playSound(bs.getSound('shieldUp'))
-        bsInternal._setPublicPartyEnabled(True);
-        self._doInternetStatusCheck()
-        bs.buttonWidget(edit=self._internetHostToggleButton,
-                        label=bs.Lstr(resource='gatherWindow.makePartyPrivateText',fallback='gatherWindow.stopAdvertisingText'),
-                        onActivateCall=self._onStopInternetAdvertisingPress)
-
-
-    def _onPublicPartyAccessibleResponse(self, data):
-        # if we've got status text widgets, update them..
-        text = getattr(self,'_internetHostStatusText',None)
-        if text is not None and text.exists():
-            if data is None:
-                bs.textWidget(edit=text,
-                              text=bs.Lstr(resource=self._r+'.partyStatusNoConnectionText'),
-                              color=(1,0,0))
-            else:
-                if not data.get('accessible',False):
-                    if self._internetLocalAddress is not None:
-                        exLine = bs.Lstr(value='\n${A} ${B}',
-                                         subs=[('${A}',bs.Lstr(resource=self._r+'.manualYourLocalAddressText')),
-                                               ('${B}',self._internetLocalAddress)])
-                    else:
-                        exLine = ''
-                    bs.textWidget(edit=text,
-                                  text=bs.Lstr(value='${A}\n${B}${C}',
-                                               subs=[('${A}',bs.Lstr(resource=self._r+'.partyStatusNotJoinableText')),
-                                                     ('${B}',bs.Lstr(resource=self._r+'.manualRouterForwardingText',
-                                                                     subs=[('${PORT}',str(bsInternal._getGamePort()))])),
-                                                     ('${C}',exLine)]),
-                                  color=(1,0,0))
-                else:
-                    bs.textWidget(edit=text,
-                                  text=bs.Lstr(resource=self._r+'.partyStatusJoinableText'),
-                                  color=(0,1,0))
-                
-        
-    def _onStopInternetAdvertisingPress(self):
-        bsInternal._setPublicPartyEnabled(False);
-        bs.playSound(bs.getSound('shieldDown'))
-        text = getattr(self,'_internetHostStatusText',None)
-        if text is not None and text.exists():
-            bs.textWidget(edit=text,
-                          text=bs.Lstr(resource=self._r+'.partyStatusNotPublicText'),
-                          color=(0.6,0.6,0.6))
-
-        bs.buttonWidget(edit=self._internetHostToggleButton,
-                        label=bs.Lstr(resource='gatherWindow.makePartyPublicText',fallback='gatherWindow.startAdvertisingText'),
-                        onActivateCall=self._onStartInternetAdvertisingPress)
-        
-    def _accessCheckUpdate(self,tAddr,tAccessible,tAccessibleExtra):
-        # if we don't have an outstanding query, start one..
-        if not self._doingAccessCheck and self._accessCheckCount < 100:
-            self._doingAccessCheck = True
-            self._accessCheckCount += 1
-            self._tAddr = tAddr
-            self._tAccessible = tAccessible
-            self._tAccessibleExtra = tAccessibleExtra
-            bsUtils.serverGet('bsAccessCheck',{},callback=bs.WeakCall(self._onAccessibleResponse))
-        
-    def _onAccessibleResponse(self,data):
-        tAddr = self._tAddr
-        tAccessible = self._tAccessible
-        tAccessibleExtra = self._tAccessibleExtra
-        self._doingAccessCheck = False
-        colorBad = (1,1,0)
-        colorGood = (0,1,0)
-        if data is None or 'address' not in data or 'accessible' not in data:
-            if tAddr.exists(): bs.textWidget(edit=tAddr,
-                                             text=bs.Lstr(resource=self._r+'.noConnectionText'),
-                                             color=colorBad)
-            if tAccessible.exists(): bs.textWidget(edit=tAccessible,
-                                                   text=bs.Lstr(resource=self._r+'.noConnectionText'),
-                                                   color=colorBad)
-            if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,text='',color=colorBad)
-            return
-        if tAddr.exists(): bs.textWidget(edit=tAddr,text=data['address'],color=colorGood)
-        if tAccessible.exists():
-            if data['accessible']:
-                bs.textWidget(edit=tAccessible,
-                              text=bs.Lstr(resource=self._r+'.manualJoinableYesText'),
-                              color=colorGood)
-                if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,text='',color=colorGood)
-            else:
-                bs.textWidget(edit=tAccessible,
-                              text=bs.Lstr(resource=self._r+'.manualJoinableNoWithAsteriskText'),
-                              color=colorBad)
-                if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,
-                                                            text=bs.Lstr(resource=self._r+'.manualRouterForwardingText',subs=[('${PORT}',str(bsInternal._getGamePort()))]),
-                                                            color=colorBad)
-        
-            
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._backButton: selName = 'Back'
-            elif sel in self._tabButtons.values():
-                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
-            elif sel == self._tabContainer: selName = 'TabContainer'
-            else: raise Exception("unrecognized selection: "+str(sel))
-            gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab,'internetTab':self._internetTab}
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
+        sc2 = bs.containerWidget(parent=scroll2,size=(1200,200),background=False)
 
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]['selName']
-            except Exception: selName = None
-            try: self._internetTab = gWindowStates[self.__class__.__name__]['internetTab']
-            except Exception: self._internetTab = 'join'
-            #try: currentTab = gWindowStates[self.__class__.__name__]['tab']
-            try: currentTab = bs.getConfig()['Gather Tab']
-            except Exception: currentTab = None
-            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'about'
-            self._setTab(currentTab)
-            if selName == 'Back': sel = self._backButton
-            elif selName == 'TabContainer': sel = self._tabContainer
-            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
-            else: sel = self._tabButtons[currentTab]
-            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-            
+        b1 = bs.buttonWidget(parent=sc,position=(20,760),autoSelect=True)
+        b1 = bs.buttonWidget(parent=sc,position=(20,480),autoSelect=True)
+        b2 = bs.buttonWidget(parent=sc,position=(30,380),autoSelect=True)
+        b3 = bs.buttonWidget(parent=sc,position=(40,280),autoSelect=True)
+
+        x = 10
+        dx = 160
+        for i in range(6):
+            b = bs.buttonWidget(parent=sc2,position=(x,25),autoSelect=True,size=(150,150),
+                                buttonType='square',onActivateCall=bs.Call(bs.screenMessage,"CLICK!"))
+            bs.widget(edit=b,showBufferLeft=50,showBufferRight=50,downWidget=b1,upWidget=self._backButton)
+            x += dx
+        
     def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
         uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
+        
+        
+gShowedNetPlayWarning = False
+
+
+
+
 
         
 class PartyWindow(Window):
@@ -17625,652 +11976,6 @@ class OnScreenKeyboardWindow(Window):
             bs.textWidget(edit=self._targetText,text=bs.textWidget(query=self._textField))
             
         
-class StoreWindow(Window):
-
-    def _updateGetTicketsButtonPos(self):
-        if self._getTicketsButton.exists():
-            p = (self._width-252-(47 if gSmallUI and bsInternal._isPartyIconVisible() else 0),self._height-70)
-            bs.buttonWidget(edit=self._getTicketsButton,position=p)
-        
-    def __init__(self,transition='inRight',modal=False,showTab=None,
-                 onCloseCall=None,backLocation=None,originWidget=None):
-
-        bsInternal._setAnalyticsScreen('Store Window')
-        
-        # if they provided an origin-widget, scale up from that
-        if originWidget is not None:
-            self._transitionOut = 'outScale'
-            scaleOrigin = originWidget.getScreenSpaceCenter()
-            transition = 'inScale'
-        else:
-            self._transitionOut = 'outRight'
-            scaleOrigin = None
-        
-        self._backLocation = backLocation
-        self._onCloseCall = onCloseCall
-        self._showTab = showTab
-        self._modal = modal
-        self._width = 1040
-        self._height = 578 if gSmallUI else 645 if gMedUI else 800
-        self._currentTab = None
-        extraTop = 30 if gSmallUI else 0
-        
-        self._request = None
-        self._r = 'store'
-        self._lastBuyTime = 0
-
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
-                                              toolbarVisibility='MENU_FULL',
-                                              scale=1.3 if gSmallUI else 0.9 if gMedUI else 0.8,
-                                              scaleOriginStackOffset=scaleOrigin,
-                                              stackOffset=(0,-5) if gSmallUI else (0,0) if gMedUI else (0,0))
-
-        self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(70,self._height-74),size=(140,60),scale=1.1,
-                                                            autoSelect=True,
-                                                            label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
-                                                            buttonType=None if self._modal else 'back',
-                                                            onActivateCall=self._back)
-        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
-
-        self._getTicketsButton = b = bs.buttonWidget(parent=self._rootWidget,
-                                                     size=(210,65),
-                                                     onActivateCall=self._onGetMoreTicketsPress,
-                                                     autoSelect=True,
-                                                     scale=0.9,
-                                                     textScale=1.4,
-                                                     leftWidget=self._backButton,
-                                                     color=(0.7,0.5,0.85),
-                                                     # textColor=(1,0.5,0),
-                                                     textColor=(0.2, 1.0, 0.2),
-                                                     label=bs.Lstr(resource='getTicketsWindow.titleText'))
-        
-        # move this dynamically to keep it out of the way of the party icon :-(
-        self._updateGetTicketsButtonPos()
-        self._getTicketPosUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateGetTicketsButtonPos),repeat=True,timeType='real')
-        bs.widget(edit=self._backButton,rightWidget=self._getTicketsButton)
-        self._ticketTextUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateTicketsText),timeType='real',repeat=True)
-        self._updateTicketsText()
-
-        env = bs.getEnvironment()
-        if env['platform'] in ['mac','ios'] and env['subplatform'] == 'appstore':
-            # b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-240,60),size=(230,60),scale=0.7,
-            b = bs.buttonWidget(parent=self._rootWidget,position=(self._width*0.5-70,16),size=(230,50),scale=0.65,
-                                onActivateCall=bs.WeakCall(self._restorePurchases),
-                                #color=(0.45,0.4,0.5),
-                                color=(0.35,0.3,0.4),
-                                selectable=False,
-                                textColor=(0.55,0.5,0.6),
-                                label=bs.Lstr(resource='getTicketsWindow.restorePurchasesText'))
-
-
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-44),size=(0,0),
-                          color=gTitleColor,scale=1.5,hAlign="center",vAlign="center",
-                          text=bs.Lstr(resource='storeText'),
-                          maxWidth=420)
-
-        if not self._modal and gDoAndroidNav:
-            bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
-            # bs.textWidget(edit=t,hAlign='left',position=(153,self._height-44))
-
-        scrollBufferH = 130
-        tabBufferH = 250
-        
-        tabsDef = [['extras',bs.Lstr(resource=self._r+'.extrasText')],
-                   ['maps',bs.Lstr(resource=self._r+'.mapsText')],
-                   ['minigames',bs.Lstr(resource=self._r+'.miniGamesText')],
-                   ['characters',bs.Lstr(resource=self._r+'.charactersText')],
-                   ['icons',bs.Lstr(resource=self._r+'.iconsText')]]
-
-        tabResults = _createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
-                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab,returnExtraInfo=True)
-
-        self._purchasableCountWidgets = {}
-        
-        # create our purchasable-items tags and have them update over time..
-        for i,tab in enumerate(tabsDef):
-            pos = tabResults['positions'][i]
-            size = tabResults['sizes'][i]
-            button = tabResults['buttonsIndexed'][i]
-            rad = 10
-            center = (pos[0]+0.1*size[0],pos[1]+0.9*size[1])
-            img = bs.imageWidget(parent=self._rootWidget,position=(center[0]-rad*1.04,center[1]-rad*1.15),size=(rad*2.2,rad*2.2),
-                           texture=bs.getTexture('circleShadow'),color=(1,0,0))
-            txt = bs.textWidget(parent=self._rootWidget,position=center,size=(0,0),hAlign='center',vAlign='center',
-                                maxWidth=1.4*rad,scale=0.6,shadow=1.0,flatness=1.0)
-            rad = 20
-            saleImg = bs.imageWidget(parent=self._rootWidget,position=(center[0]-rad,center[1]-rad),size=(rad*2,rad*2),
-                                     drawController=button,
-                                     texture=bs.getTexture('circleZigZag'),color=(0.5,0,1.0))
-            saleTitleText = bs.textWidget(parent=self._rootWidget,position=(center[0],center[1]+0.24*rad),size=(0,0),hAlign='center',vAlign='center',
-                                          drawController=button,
-                                          maxWidth=1.4*rad,scale=0.6,shadow=0.0,flatness=1.0,color=(0,1,0))
-            saleTimeText = bs.textWidget(parent=self._rootWidget,position=(center[0],center[1]-0.29*rad),size=(0,0),hAlign='center',vAlign='center',
-                                     drawController=button,
-                                     maxWidth=1.4*rad,scale=0.4,shadow=0.0,flatness=1.0,color=(0,1,0))
-            self._purchasableCountWidgets[tab[0]] = {'img':img,
-                                                     'text':txt,
-                                                     'saleImg':saleImg,
-                                                     'saleTitleText':saleTitleText,
-                                                     'saleTimeText':saleTimeText}
-        self._tabUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateTabs),timeType='real',repeat=True)
-        self._updateTabs()
-
-        self._tabButtons = tabResults['buttons']
-        
-        if self._getTicketsButton is not None:
-            lastTabButton = self._tabButtons[tabsDef[-1][0]]
-            bs.widget(edit=self._getTicketsButton,downWidget=lastTabButton)
-            bs.widget(edit=lastTabButton,upWidget=self._getTicketsButton,rightWidget=self._getTicketsButton)
-            
-        self._scrollWidth = self._width-scrollBufferH
-        self._scrollHeight = self._height-180
-
-        self._scrollWidget = None
-        self._statusTextWidget = None
-        self._restoreState()
-
-    def _restorePurchases(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-        else:
-            bsInternal._restorePurchases()
-        
-    def _updateTabs(self):
-        for tabName,tabData in self._purchasableCountWidgets.items():
-            saleTime = _getAvailableSaleTime(tabName)
-
-            if saleTime is not None:
-                bs.textWidget(edit=tabData['saleTitleText'],
-                              text=bs.Lstr(resource='store.saleText')
-                )
-                bs.textWidget(edit=tabData['saleTimeText'],text=bsUtils.getTimeString(saleTime,centi=False))
-                bs.imageWidget(edit=tabData['saleImg'],opacity=1.0)
-                count = 0
-            else:
-                bs.textWidget(edit=tabData['saleTitleText'],text='')
-                bs.textWidget(edit=tabData['saleTimeText'],text='')
-                bs.imageWidget(edit=tabData['saleImg'],opacity=0.0)
-                count = _getAvailablePurchaseCount(tabName)
-
-            if count > 0:
-                bs.textWidget(edit=tabData['text'],text=str(count))
-                bs.imageWidget(edit=tabData['img'],opacity=1.0)
-            else:
-                bs.textWidget(edit=tabData['text'],text='')
-                bs.imageWidget(edit=tabData['img'],opacity=0.0)
-        
-    def _updateTicketsText(self):
-        if bsInternal._getAccountState() == 'SIGNED_IN':
-            s = bs.getSpecialChar('ticket')+str(bsInternal._getAccountTicketCount())
-        else:
-            #s = bs.getSpecialChar('ticket')+'?'
-            s = bs.Lstr(resource='getTicketsWindow.titleText')
-        bs.buttonWidget(edit=self._getTicketsButton,label=s)
-        
-    def _setTab(self,tab):
-
-        if self._currentTab == tab: return
-        self._currentTab = tab
-
-        # we wanna preserve our current tab between runs
-        bs.getConfig()['Store Tab'] = tab
-        bs.writeConfig()
-        
-        # update tab colors based on which is selected
-        _updateTabButtonColors(self._tabButtons,tab)
-
-        # (re)create scroll widget
-        if self._scrollWidget is not None and self._scrollWidget.exists():
-            self._scrollWidget.delete()
-
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-79-48),size=(self._scrollWidth,self._scrollHeight))
-
-        # stop updating anything that was there
-        self._buttonInfos = {}
-        self._updateButtonsTimer = None
-
-        # so we can still select root level widgets with controllers
-        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-
-        # show status over top..
-        if self._statusTextWidget is not None and self._statusTextWidget.exists():
-            self._statusTextWidget.delete()
-        self._statusTextWidget = bs.textWidget(parent=self._rootWidget,
-                                               position=(self._width*0.5,self._height*0.5),
-                                               size=(0,0),
-                                               color=(1,0.7,1,0.5),hAlign="center",vAlign="center",
-                                               text=bs.Lstr(resource=self._r+'.loadingText'),
-                                               maxWidth=self._scrollWidth*0.9)
-        # self._statusTextWidgetUpdateTimer = bs.Timer(500,bs.WeakCall(self._updateStatusText),repeat=True,timeType='real')
-        # self._statusTextDots = 1
-
-
-        class _Request(object):
-            def __init__(self,window):
-                self._window = weakref.ref(window)
-                data = {'tab':tab}
-                bs.realTimer(100,bs.WeakCall(self._onResponse,data))
-            def _onResponse(self,data):
-                window = self._window()
-                if window is not None and (window._request is self):
-                    window._request = None
-                    window._onResponse(data)
-
-        # kick off a server request
-        self._request = _Request(self)
-        
-    # actually start the purchase locally..
-    def _purchaseCheckResult(self,item,isTicketPurchase,result):
-        if result is None:
-            bs.playSound(bs.getSound('error'))
-            bs.screenMessage(bs.Lstr(resource='internal.unavailableNoConnectionText'),
-                             color=(1,0,0))
-        else:
-            if isTicketPurchase:
-                price = bsInternal._getAccountMiscReadVal('price.'+item, None)
-                if price is None or type(price) not in (int,long) or price <= 0:
-                    print 'Error; got invalid local price of',price,'for item',item
-                    bs.playSound(bs.getSound('error'))
-                else:
-                    bs.playSound(bs.getSound('click01'))
-                    bsInternal._inGamePurchase(item, price)
-            # real in-app purchase
-            else:
-                if result['allow']:
-                    bsInternal._purchase(item)
-                else:
-                    if result['reason'] == 'versionTooOld':
-                        bs.playSound(bs.getSound('error'))
-                        bs.screenMessage(bs.Lstr(resource='getTicketsWindow.versionTooOldText'),
-                                         color=(1,0,0))
-                    else:
-                        bs.playSound(bs.getSound('error'))
-                        bs.screenMessage(bs.Lstr(resource='getTicketsWindow.unavailableText'),
-                                         color=(1,0,0))
-
-    def _doPurchaseCheck(self,item,isTicketPurchase=False):
-        # here we ping the server to ask if it's valid for us to purchase this..
-        # (better to fail now than after we've paid locally)
-        env = bs.getEnvironment()
-        bsUtils.serverGet('bsAccountPurchaseCheck',{'item':item,
-                                                    'platform':env['platform'],
-                                                    'subplatform':env['subplatform'],
-                                                    'version':env['version'],
-                                                    'buildNumber':env['buildNumber'],
-                                                    'purchaseType':'ticket' if isTicketPurchase else 'real'},
-                          callback=bs.WeakCall(self._purchaseCheckResult,item,isTicketPurchase))
-        
-    def _buy(self,item):
-        # prevent pressing buy within a few seconds of the last press
-        # (gives the buttons time to disable themselves and whatnot)
-        t = bs.getRealTime()
-        if t - self._lastBuyTime < 2000:
-            bs.playSound(bs.getSound('error'))
-        else:
-            if bsInternal._getAccountState() != 'SIGNED_IN':
-                showSignInPrompt()
-            else:
-                # pros is an actual IAP; the rest are ticket purchases.
-                if item == 'pro':
-                    bs.playSound(bs.getSound('click01'))
-                    self._lastBuyTime = t
-                    # purchase either pro or pro_sale depending on whether there is a sale going on..
-                    #bsInternal._purchase('pro' if _getAvailableSaleTime('extras') is None else 'pro_sale')
-                    self._doPurchaseCheck('pro' if _getAvailableSaleTime('extras') is None else 'pro_sale')
-                else:
-                    # def doIt():
-                    self._lastBuyTime = t
-                    price = bsInternal._getAccountMiscReadVal('price.'+item,None)
-                    ourTickets = bsInternal._getAccountTicketCount()
-                    if price is not None and ourTickets < price:
-                        bs.playSound(bs.getSound('error'))
-                        showGetTicketsPrompt()
-                    else:
-                        def doIt():
-                            self._doPurchaseCheck(item,isTicketPurchase=True)
-                        bs.playSound(bs.getSound('swish'))
-                        ConfirmWindow(bs.Lstr(resource='store.purchaseConfirmText',subs=[('${ITEM}',_getStoreItemNameTranslated(item))]),
-                                      width=400,height=120,
-                                      action=doIt,
-                                      okText=bs.Lstr(resource='store.purchaseText',fallback='okText'))
-
-    def _printAlreadyOwn(self,charName):
-        bs.screenMessage(bs.Lstr(resource=self._r+'.alreadyOwnText',subs=[('${NAME}',charName)]),color=(1,0,0))
-        bs.playSound(bs.getSound('error'))
-
-    def _updateButtons(self):
-        import datetime
-        salesRaw = bsInternal._getAccountMiscReadVal('sales',{})
-        sales = {}
-        try:
-            # look at the current set of sales; filter any with time remaining..
-            for saleItem, saleInfo in salesRaw.items():
-                toEnd = (datetime.datetime.utcfromtimestamp(saleInfo['e']) - datetime.datetime.utcnow()).total_seconds()
-                if toEnd > 0:
-                    sales[saleItem] = {'toEnd':toEnd,'originalPrice':saleInfo['op']}
-        except Exception:
-            bs.printException("Error parsing sales")
-        
-        for bType,bInfo in self._buttonInfos.items():
-
-            if bType in ['upgrades.pro','pro']: purchased = bsUtils._havePro()
-            else: purchased = bsInternal._getPurchased(bType)
-
-            saleOpacity = 0.0
-            saleTitleText = ''
-            saleTimeText = ''
-            
-            if purchased:
-                titleColor=(0.8,0.7,0.9,1.0)
-                color = (0.63,0.55,0.78)
-                extraImageOpacity = 0.5
-                call = bs.WeakCall(self._printAlreadyOwn,bInfo['name'])
-                priceText = ''
-                priceTextLeft = ''
-                priceTextRight = ''
-                showPurchaseCheck = True
-                descriptionColor = (0.4,1.0,0.4,0.4)
-                priceColor = (0.5,1,0.5,0.3)
-            else:
-                titleColor=(0.7,0.9,0.7,1.0)
-                color = (0.4,0.8,0.1)
-                extraImageOpacity = 1.0
-                call = bInfo['call'] if 'call' in bInfo else None
-                if bType in ['upgrades.pro','pro']:
-                    saleTime = _getAvailableSaleTime('extras')
-                    if saleTime is not None:
-                        price = bsInternal._getPrice('pro')
-                        priceTextLeft = price if price is not None else '?'
-                        price = bsInternal._getPrice('pro_sale')
-                        priceTextRight = price if price is not None else '?'
-                        saleOpacity = 1.0
-                        priceText = ''
-                        saleTitleText = bs.Lstr(resource='store.saleText')
-                        saleTimeText = bs.getTimeString(saleTime,centi=False)
-                    else:
-                        price = bsInternal._getPrice('pro')
-                        priceText = price if price is not None else '?'
-                        priceTextLeft = ''
-                        priceTextRight = ''
-                    # if price is None: priceText = '??'
-                    # else: priceText = price
-                else:
-                    price = bsInternal._getAccountMiscReadVal('price.'+bType,0)
-                    # color button differently if we cant afford this
-                    if bsInternal._getAccountState() == 'SIGNED_IN':
-                        if bsInternal._getAccountTicketCount() < price:
-                            color = (0.6, 0.61, 0.6)
-                    priceText = bs.getSpecialChar('ticket')+str(bsInternal._getAccountMiscReadVal('price.'+bType,'?'))
-                    priceTextLeft = ''
-                    priceTextRight = ''
-
-                    # TESTING:
-                    if bType in sales:
-                        saleOpacity = 1.0
-                        priceTextLeft = bs.getSpecialChar('ticket')+str(sales[bType]['originalPrice'])
-                        priceTextRight = priceText
-                        priceText = ''
-                        saleTitleText = bs.Lstr(resource='store.saleText')
-                        saleTimeText = bs.getTimeString(int(sales[bType]['toEnd']*1000),centi=False)
-                    
-                descriptionColor = (0.5,1,0.5)
-                # priceColor = (1,0.5,0.0,1.0)
-                priceColor = (0.2,1,0.2,1.0)
-                showPurchaseCheck = False
-
-            if 'titleText' in bInfo: bs.textWidget(edit=bInfo['titleText'], color=titleColor)
-            if 'purchaseCheck' in bInfo: bs.imageWidget(edit=bInfo['purchaseCheck'],opacity=1.0 if showPurchaseCheck else 0.0)
-            if 'priceWidget' in bInfo: bs.textWidget(edit=bInfo['priceWidget'],text=priceText,color=priceColor)
-            if 'priceWidgetLeft' in bInfo: bs.textWidget(edit=bInfo['priceWidgetLeft'],text=priceTextLeft)
-            if 'priceWidgetRight' in bInfo: bs.textWidget(edit=bInfo['priceWidgetRight'],text=priceTextRight)
-            if 'priceSlashWidget' in bInfo: bs.imageWidget(edit=bInfo['priceSlashWidget'],opacity=saleOpacity)
-            if 'saleBGWidget' in bInfo: bs.imageWidget(edit=bInfo['saleBGWidget'],opacity=saleOpacity)
-            if 'saleTitleWidget' in bInfo: bs.textWidget(edit=bInfo['saleTitleWidget'],text=saleTitleText)
-            if 'saleTimeWidget' in bInfo: bs.textWidget(edit=bInfo['saleTimeWidget'],text=saleTimeText)
-            if 'button' in bInfo: bs.buttonWidget(edit=bInfo['button'],color=color,onActivateCall=call)
-            if 'extraBackings' in bInfo:
-                for b in bInfo['extraBackings']:
-                    bs.imageWidget(edit=b,color=color,opacity=extraImageOpacity)
-            if 'extraImages' in bInfo:
-                for b in bInfo['extraImages']:
-                    bs.imageWidget(edit=b,opacity=extraImageOpacity)
-            if 'extraTexts' in bInfo:
-                for b in bInfo['extraTexts']:
-                    bs.textWidget(edit=b,color=descriptionColor)
-            if 'descriptionText' in bInfo: bs.textWidget(edit=bInfo['descriptionText'],color=descriptionColor)
-
-    def _onResponse(self,data):
-
-        # clear status text..
-        if self._statusTextWidget is not None and self._statusTextWidget.exists():
-            self._statusTextWidget.delete()
-            self._statusTextWidgetUpdateTimer = None
-        
-        if data is None:
-            self._statusTextWidget = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height*0.5),size=(0,0),
-                                                   scale=1.3,
-                                                   transitionDelay=100,
-                                                   color=(1,0.3,0.3,1.0),hAlign="center",vAlign="center",
-                                                   text=bs.Lstr(resource=self._r+'.loadErrorText'),
-                                                   maxWidth=self._scrollWidth*0.9)
-        else:
-            class _Store(object):
-
-                def __init__(self,storeWindow,data,width):
-
-                    self._storeWindow = storeWindow
-                    self._width = width
-                    self._rows = []
-                    storeData = _getStoreLayout()
-                    
-                    self._tab = data['tab']
-                    self._sections = copy.deepcopy(storeData[data['tab']])
-
-                    # pre-calc a few things and add them to store-data
-                    for section in self._sections:
-                        # if self._tab == 'characters': section['buttonSize'] = (340*0.6,430*0.6)
-                        # elif self._tab == 'extras': section['buttonSize'] = (650*0.75,500*0.75)
-                        # elif self._tab == 'maps': section['buttonSize'] = (510*0.6,450*0.6)
-                        # else: section['buttonSize'] = (450*0.6,450*0.6)
-                        if self._tab == 'characters': dummyName = 'characters.foo'
-                        elif self._tab == 'extras': dummyName = 'pro'
-                        elif self._tab == 'maps': dummyName = 'maps.foo'
-                        elif self._tab == 'icons': dummyName = 'icons.foo'
-                        else: dummyName = ''
-                        section['buttonSize'] = _getStoreItemDisplaySize(dummyName)
-                        section['vSpacing'] = -17 if self._tab == 'characters' else 0
-                        if 'title' not in section: section['title'] = ''
-                        #section['xOffs'] = 200 if self._tab == 'characters' else 170 if self._tab == 'extras' else 0
-                        # section['xOffs'] = 100 if (self._tab == 'characters' and not bsInternal._getAccountMiscReadVal('xmas',False)) else 130 if self._tab == 'extras' else 270 if self._tab == 'maps' else 0
-                        section['xOffs'] = 130 if self._tab == 'extras' else 270 if self._tab == 'maps' else 0
-                        section['yOffs'] = 55 if (self._tab == 'extras' and gSmallUI) else -20 if self._tab == 'icons' else 0
-                        
-                def instantiate(self,scrollWidget,tabButton):
-
-                    titleSpacing = 40
-                    buttonBorder = 20
-                    buttonSpacing = 4
-                    # buttonVSpacing = -10
-                    buttonOffsetH = 40
-                    
-                    self._height = 80
-
-                    # calc total height
-                    for i,section in enumerate(self._sections):
-                        if section['title'] != '': self._height += titleSpacing
-                        bWidth,bHeight = section['buttonSize']
-                        bColumnCount = int(math.floor((self._width-buttonOffsetH-20)/(bWidth+buttonSpacing)))
-                        bRowCount = int(math.ceil(float(len(section['items']))/bColumnCount))
-                        bHeightTotal = 2*buttonBorder+bRowCount*bHeight+(bRowCount-1)*section['vSpacing']
-                        self._height += bHeightTotal
-
-                    c = bs.containerWidget(parent=scrollWidget,scale=1.0,size=(self._width,self._height),background=False)
-                    bs.containerWidget(edit=c,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-                    v = self._height - 20
-
-                    if self._tab == 'characters':
-                        t = bs.Lstr(resource='store.howToSwitchCharactersText',
-                                    subs=[('${SETTINGS}',bs.Lstr(resource='accountSettingsWindow.titleText')),
-                                          ('${PLAYER_PROFILES}',bs.Lstr(resource='playerProfilesWindow.titleText'))])
-                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
-                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
-                                      maxWidth=700,transitionDelay=400)
-                    elif self._tab == 'icons':
-                        t = bs.Lstr(resource='store.howToUseIconsText',
-                                    subs=[('${SETTINGS}',bs.Lstr(resource='mainMenu.settingsText')),
-                                          ('${PLAYER_PROFILES}',bs.Lstr(resource='playerProfilesWindow.titleText'))])
-                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
-                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
-                                      maxWidth=700,transitionDelay=400)
-                    elif self._tab == 'maps':
-                        t = bs.Lstr(resource='store.howToUseMapsText')
-                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
-                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
-                                      maxWidth=700,transitionDelay=400)
-                        
-                    prevRowButtons = None
-                    thisRowButtons = []
-
-                    
-                    delay = 300
-                    for section in self._sections:
-                        if section['title'] != '':
-                            bs.textWidget(parent=c,position=(60,v-titleSpacing*0.8),size=(0,0),
-                                          scale=1.0,
-                                          transitionDelay=delay,
-                                          color=(0.7,0.9,0.7,1),hAlign="left",vAlign="center",
-                                          text=bs.Lstr(resource=section['title']),
-                                          maxWidth=self._width*0.7)
-                            v -= titleSpacing
-                        delay = max(100,delay-100)
-                        v -= buttonBorder
-                        bWidth,bHeight = section['buttonSize']
-                        bCount = len(section['items'])
-                        bColumnCount = int(math.floor((self._width-buttonOffsetH-20)/(bWidth+buttonSpacing)))
-                        col = 0
-                        for i,itemName in enumerate(section['items']):
-
-                            item = self._storeWindow._buttonInfos[itemName] = {}
-                            item['call'] = bs.WeakCall(self._storeWindow._buy,itemName)
-
-                            if 'xOffs' in section: bOffsH2 = section['xOffs']
-                            else: bOffsH2 = 0
-
-                            if 'yOffs' in section: bOffsV2 = section['yOffs']
-                            else: bOffsV2 = 0
-
-                            bPos = (buttonOffsetH+bOffsH2+(bWidth+buttonSpacing)*col,v-bHeight+bOffsV2)
-                            
-                            _instantiateStoreItemDisplay(itemName,item,
-                                                         parentWidget=c,
-                                                         bPos=bPos,
-                                                         buttonOffsetH=buttonOffsetH,
-                                                         bWidth=bWidth,bHeight=bHeight,
-                                                         bOffsH2=bOffsH2,bOffsV2=bOffsV2,
-                                                         delay=delay)
-                            b = item['button']
-                            
-                            delay = max(100,delay-100)
-                            thisRowButtons.append(b)
-
-                            # wire this button to the equivalent in the previous row
-                            if prevRowButtons is not None:
-                                if len(prevRowButtons) > col:
-                                    bs.widget(edit=b,upWidget=prevRowButtons[col])
-                                    bs.widget(edit=prevRowButtons[col],downWidget=b)
-                                    # if we're the last button in our row, wire any in the previous row past
-                                    # our position to go to us if down is pressed
-                                    if col+1 == bColumnCount or i == bCount-1:
-                                        for bPrev in prevRowButtons[col+1:]:
-                                            bs.widget(edit=bPrev,downWidget=b)
-                                else:
-                                    bs.widget(edit=b,upWidget=prevRowButtons[-1])
-                            else:
-                                bs.widget(edit=b,upWidget=tabButton)
-                                
-                            col += 1
-                            if col == bColumnCount or i == bCount-1:
-                                prevRowButtons = thisRowButtons
-                                thisRowButtons = []
-                                col = 0
-                                v -= bHeight
-                                if i < bCount-1: v -= section['vSpacing']
-
-                        v -= buttonBorder
-
-                    # set a timer to update these buttons periodically as long as we're alive
-                    # (so if we buy one it will grey out, etc)
-                    self._storeWindow._updateButtonsTimer = bs.Timer(500,bs.WeakCall(self._storeWindow._updateButtons),repeat=True,timeType='real')
-                    # also update them immediately
-                    self._storeWindow._updateButtons()
-                    
-            if self._currentTab in ('extras','minigames','characters','maps','icons'):
-                store = _Store(self,data,self._scrollWidth)
-                store.instantiate(scrollWidget=self._scrollWidget,tabButton=self._tabButtons[self._currentTab])
-            else:
-                c = bs.containerWidget(parent=self._scrollWidget,scale=1.0,size=(self._scrollWidth,self._scrollHeight*0.95),
-                                       background=False)
-                bs.containerWidget(edit=c,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
-                self._statusTextWidget = bs.textWidget(parent=c,position=(self._scrollWidth*0.5,self._scrollHeight*0.5),size=(0,0),
-                                                       scale=1.3,transitionDelay=100,
-                                                       color=(1,1,0.3,1.0),hAlign="center",vAlign="center",
-                                                       text=bs.Lstr(resource=self._r+'.comingSoonText'),
-                                                       maxWidth=self._scrollWidth*0.9)
-
-    def _saveState(self):
-        try:
-            sel = self._rootWidget.getSelectedChild()
-            if sel == self._getTicketsButton: selName = 'GetTickets'
-            elif sel == self._scrollWidget: selName = 'Scroll'
-            elif sel == self._backButton: selName = 'Back'
-            elif sel in self._tabButtons.values():
-                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
-            else: raise Exception("unrecognized selection")
-            gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab}
-        except Exception:
-            bs.printException('error saving state for',self.__class__)
-
-    def _restoreState(self):
-        try:
-            try: selName = gWindowStates[self.__class__.__name__]['selName']
-            except Exception: selName = None
-            try: currentTab = bs.getConfig()['Store Tab']
-            except Exception: currentTab = None
-            if self._showTab is not None: currentTab = self._showTab
-            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'characters'
-            if selName == 'GetTickets': sel = self._getTicketsButton
-            elif selName == 'Back': sel = self._backButton
-            elif selName == 'Scroll': sel = self._scrollWidget
-            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
-            else: sel = self._tabButtons[currentTab]
-            # if we were requested to show a tab, select it too..
-            if self._showTab is not None and self._showTab in self._tabButtons:
-                sel = self._tabButtons[self._showTab]
-            self._setTab(currentTab)
-            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
-        except Exception:
-            bs.printException('error restoring state for',self.__class__)
-
-                
-    def _onGetMoreTicketsPress(self):
-        if bsInternal._getAccountState() != 'SIGNED_IN':
-            showSignInPrompt()
-            return
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
-        window = GetTicketsWindow(fromModalStore=self._modal,storeBackLocation=self._backLocation).getRootWidget()
-        if not self._modal:
-            uiGlobals['mainMenuWindow'] = window
-
-    def _back(self):
-        self._saveState()
-        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
-        if not self._modal:
-            if self._backLocation == 'CoopWindow':
-                uiGlobals['mainMenuWindow'] = CoopWindow(transition='inLeft').getRootWidget()
-            else:
-                uiGlobals['mainMenuWindow'] = MainMenuWindow(transition='inLeft').getRootWidget()
-        if self._onCloseCall is not None: self._onCloseCall()
     
 def _handleLocalChatMessage(msg):
     global gPartyWindow
@@ -18322,253 +12027,6 @@ def _handlePartyInviteRevoke(inviteID):
         if w is not None and w._partyInviteID == inviteID:
             bs.containerWidget(edit=w.getRootWidget(),transition='outRight')
 
-class FileSelectorWindow(Window):
-
-    def __init__(self,path,callback=None,showBasePath=True,validFileExtensions=[],allowFolders=False):
-        self._width = 600
-        self._height = 365 if gSmallUI else 418
-        self._callback = callback
-        self._basePath = path
-        self._path = None
-        self._recentPaths = []
-        self._showBasePath = showBasePath
-        self._validFileExtensions = ['.'+ext for ext in validFileExtensions]
-        self._allowFolders = allowFolders
-        
-        self._scrollWidth = self._width-80
-        self._scrollHeight = self._height-170
-        self._r = 'fileSelectorWindow'
-        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition='inRight',
-                                              scale=2.23 if gSmallUI else 1.4 if gMedUI else 1.0,
-                                              stackOffset=(0,-35) if gSmallUI else (0,0))
-        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-42),size=(0,0),
-                          color=gTitleColor,hAlign="center",vAlign="center",
-                          text=bs.Lstr(resource=self._r+'.titleFolderText') if (allowFolders and not validFileExtensions) else bs.Lstr(resource=self._r+'.titleFileText') if not allowFolders else bs.Lstr(resource=self._r+'.titleFileFolderText'),
-                          maxWidth=210)
-
-        
-        self._buttonWidth = 146
-        self._cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,self._height-67),
-                                                 autoSelect=True,size=(self._buttonWidth,50),label=bs.Lstr(resource='cancelText'),onActivateCall=self._cancel)
-        bs.widget(edit=self._cancelButton,leftWidget=self._cancelButton)
-
-        bColor = (0.6,0.53,0.63)
-
-        self._backButton = bs.buttonWidget(parent=self._rootWidget,buttonType='square',position=(43,self._height-113),
-                                           color=bColor,textColor=(0.75,0.7,0.8),enableSound=False,
-                                           size=(55,35),label='Back' if False else bs.getSpecialChar('leftArrow'),onActivateCall=self._onBackPress)
-                                         #size=(55,35),label='Back' if False else bs.getSpecialChar('leftArrow')"\xee\x80\x81",call=self._onBackPress)
-                                         #size=(55,35),label='Up' if False else "\xc2\x81",call=self._onBackPress)
-
-        # self._upButton = bs.buttonWidget(parent=self._rootWidget,buttonType='square',position=(39,self._height-113),
-        #                                  color=bColor,textColor=(0.75,0.7,0.8),enableSound=False,
-        #                                  size=(65,35),label='Up' if False else "\xc2\x82",onActivateCall=self._onUpPress)
-
-
-        self._folderTex = bs.getTexture('folder')
-        self._folderColor = (1.1,0.8,0.2)
-        self._fileTex = bs.getTexture('file')
-        self._fileColor = (1,1,1)
-        self._useFolderButton = None
-
-        self._folderCenter = self._width*0.5+15
-
-        self._folderIcon = bs.imageWidget(parent=self._rootWidget,size=(40,40),position=(40,self._height-117),texture=self._folderTex,color=self._folderColor)
-        self._pathText = bs.textWidget(parent=self._rootWidget,position=(self._folderCenter,self._height-98),size=(0,0),
-                                       color=gTitleColor,hAlign="center",vAlign="center",text=self._path,maxWidth=self._width*0.9)
-
-        # self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-119),
-        #                                      size=(self._scrollWidth,self._scrollHeight))
-
-
-        self._scrollWidget = None
-
-        bs.containerWidget(edit=self._rootWidget,
-                   #selectedChild=self._scrollWidget,
-                   #startButton=self._selectButton,
-                   cancelButton=self._cancelButton)
-
-        self._setPath(path)
-
-    def _onUpPress(self):
-        self._onEntryActivated('..')
-
-    def _onBackPress(self):
-        if len(self._recentPaths) > 1:
-            bs.playSound(bs.getSound('swish'))
-            self._recentPaths.pop()
-            self._setPath(self._recentPaths.pop())
-        else:
-            pass
-            bs.playSound(bs.getSound('error'))
-            #bs.screenMessage('can\'t go back further',color=(1,0,0))
-
-    def _onFolderEntryActivated(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        if self._callback is not None:
-            self._callback(self._path)
-        
-    def _onEntryActivated(self,entry):
-        try:
-            newPath = None
-            if entry == '..':
-                chunks = self._path.split('/')
-                if len(chunks) > 1:
-                    newPath = '/'.join(chunks[:-1])
-                    if newPath == '': newPath = '/'
-                else:
-                    bs.playSound(bs.getSound('error'))
-            else:
-                if self._path == '/': testPath = self._path+entry
-                else: testPath = self._path+'/'+entry
-                if os.path.isdir(bs.utf8(testPath)):
-                    bs.playSound(bs.getSound('swish'))
-                    newPath = testPath
-                elif os.path.isfile(bs.utf8(testPath)):
-                    if self._isValidFilePath(testPath):
-                        bs.playSound(bs.getSound('swish'))
-                        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-                        if self._callback is not None:
-                            self._callback(testPath)
-                    else:
-                        bs.playSound(bs.getSound('error'))
-                else: print 'Error: FileSelectorWindow found non-file/dir:',testPath
-        except Exception:
-            bs.printException('error on FileSelectorWindow._onEntryActivated')
-
-        if newPath is not None:
-            self._setPath(newPath)
-
-    class _RefreshThread(threading.Thread):
-            
-        def __init__(self,path,callback):
-            threading.Thread.__init__(self)
-            self._callback = callback
-            self._path = path
-        def run(self):
-            try:
-                startTime = time.time()
-                files = [bs.uni(f) for f in os.listdir(bs.utf8(self._path))]
-                duration = time.time()-startTime
-                minTime = 0.1
-                # make sure this takes at least 1/10 second so the user has time to see the selection highlight
-                if duration < minTime: time.sleep(minTime-duration)
-                bs.callInGameThread(bs.Call(self._callback,fileNames=files))
-            except Exception,e:
-                bs.printException()
-                bs.callInGameThread(bs.Call(self._callback,error=str(e)))
-
-    def _setPath(self,path,addToRecent=True):
-        self._path = path
-        if addToRecent: self._recentPaths.append(path)
-        self._RefreshThread(path,self._refresh).start()
-        
-    def _refresh(self,fileNames=None,error=None):
-
-        scrollWidgetSelected = (self._scrollWidget is None or self._rootWidget.getSelectedChild() == self._scrollWidget)
-
-        inTopFolder = (self._path == self._basePath)
-        hideTopFolder = inTopFolder and self._showBasePath is False
-
-        if hideTopFolder: folderName = ''
-        elif self._path == '/': folderName = '/'
-        else: folderName = os.path.basename(self._path)
-
-        bColor = (0.6,0.53,0.63)
-        bColorDisabled = (0.65,0.65,0.65)
-
-        if len(self._recentPaths) < 2:
-            bs.buttonWidget(edit=self._backButton,color=bColorDisabled,textColor=(0.5,0.5,0.5))
-        else:
-            bs.buttonWidget(edit=self._backButton,color=bColor,textColor=(0.75,0.7,0.8))
-
-        maxStrWidth = 300
-        strWidth = min(maxStrWidth,bsInternal._getStringWidth(folderName,suppressWarning=True))
-        bs.textWidget(edit=self._pathText,text=folderName,maxWidth=maxStrWidth)
-        bs.imageWidget(edit=self._folderIcon,position=(self._folderCenter-strWidth*0.5-40,self._height-117),opacity=0.0 if hideTopFolder else 1.0)
-
-        if self._scrollWidget is not None:
-            self._scrollWidget.delete()
-
-        if self._useFolderButton is not None:
-            self._useFolderButton.delete()
-            bs.widget(edit=self._cancelButton,rightWidget=self._backButton)
-
-        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-119),
-                                             size=(self._scrollWidth,self._scrollHeight))
-
-        if scrollWidgetSelected:
-            bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
-
-        # show error case..
-        if error is not None:
-            self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._scrollWidth,self._scrollHeight),background=False)
-            bs.textWidget(parent=self._subContainer,color=(1,1,0,1),text=error,maxWidth=self._scrollWidth*0.9,
-                          position=(self._scrollWidth*0.48,self._scrollHeight*0.57),size=(0,0),
-                          hAlign='center',vAlign='center')
-
-        else:
-            fileNames = [f for f in fileNames if not f.startswith('.')]
-            fileNames.sort(key=lambda x:x[0].lower())
-
-            entries = fileNames
-            entryHeight = 35
-
-            folderEntryHeight = 100
-            showFolderEntry = False
-
-            showUseFolderButton = (self._allowFolders and not inTopFolder)
-
-            self._subContainerHeight = entryHeight*len(entries) + (folderEntryHeight if showFolderEntry else 0)
-            v = self._subContainerHeight - (folderEntryHeight if showFolderEntry else 0)
-
-            self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._scrollWidth,self._subContainerHeight),background=False)
-
-            bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=False,claimsTab=False)
-            bs.containerWidget(edit=self._subContainer,claimsLeftRight=False,claimsTab=False,
-                               selectionLoops=False,printListExitInstructions=False)
-            bs.widget(edit=self._subContainer,upWidget=self._backButton)
-
-            if showUseFolderButton:
-                self._useFolderButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width - self._buttonWidth-35,self._height-67),
-                                                            size=(self._buttonWidth,50),
-                                                            label=bs.Lstr(resource=self._r+'.useThisFolderButtonText'),
-                                                            onActivateCall=self._onFolderEntryActivated)
-                bs.widget(edit=b,leftWidget=self._cancelButton,downWidget=self._scrollWidget)
-                bs.widget(edit=self._cancelButton,rightWidget=b)
-                bs.containerWidget(edit=self._rootWidget,startButton=b)
-                
-
-            folderIconSize = 35
-            for num,entry in enumerate(entries):
-                c = bs.containerWidget(parent=self._subContainer,position=(0,v-entryHeight),
-                                       size=(self._scrollWidth,entryHeight),rootSelectable=True,
-                                       background=False,clickActivate=True,
-                                       onActivateCall=bs.Call(self._onEntryActivated,entry))
-                if num == 0:
-                    bs.widget(edit=c,upWidget=self._backButton)
-                isValidFilePath = self._isValidFilePath(entry)
-                isDir = os.path.isdir(bs.utf8(self._path+'/'+entry))
-                if isDir:
-                    i = bs.imageWidget(parent=c,size=(folderIconSize,folderIconSize),position=(10,0.5*entryHeight-folderIconSize*0.5),
-                                       drawController=c,texture=self._folderTex,color=self._folderColor)
-                else:
-                    i = bs.imageWidget(parent=c,size=(folderIconSize,folderIconSize),position=(10,0.5*entryHeight-folderIconSize*0.5),
-                                       opacity=1.0 if isValidFilePath else 0.5,
-                                       drawController=c,texture=self._fileTex,color=self._fileColor)
-                t = bs.textWidget(parent=c,drawController=c,text=entry,hAlign='left',vAlign='center',
-                                  position=(10+folderIconSize*1.05,entryHeight*0.5),
-                                  size=(0,0),maxWidth=self._scrollWidth*0.93-50,color=(1,1,1,1) if (isValidFilePath or isDir) else (0.5,0.5,0.5,1))
-                v -= entryHeight
-                
-    def _isValidFilePath(self,path):
-        return any(path.lower().endswith(ext) for ext in self._validFileExtensions)
-        
-    def _cancel(self):
-        bs.containerWidget(edit=self._rootWidget,transition='outRight')
-        if self._callback is not None:
-            self._callback(None)
-
 def _doLegacyProUpgradeMessage(tickets):
     with bs.Context('UI'):
         ConfirmWindow(bs.Lstr(resource='store.freeBombSquadProText',subs=[('${COUNT}',str(tickets))]),width=550,height=140,cancelButton=False)
@@ -18892,7 +12350,7 @@ class PowerRankingButton(object):
             bsInternal._powerRankingQuery(callback=bs.WeakCall(self._onPowerRankingQueryResponse))
         
     def _defaultOnActivateCall(self):
-        PowerRankingWindow(modal=True,originWidget=self._button)
+        getWindowClass('PowerRankingWindow')(modal=True,originWidget=self._button)
 
     def setPosition(self, position):
         self._position = position
@@ -19000,7 +12458,7 @@ class StoreButton(object):
         if bsInternal._getAccountState() != 'SIGNED_IN':
             showSignInPrompt()
             return
-        StoreWindow(modal=True,originWidget=self._button)
+        getWindowClass('StoreWindow')(modal=True,originWidget=self._button)
         
     def getButtonWidget(self):
         return self._button
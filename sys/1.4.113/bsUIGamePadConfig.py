@@ -0,0 +1,657 @@
+import bs
+import bsInternal
+import bsUtils
+import bsUI
+
+
+class GamePadConfigWindow(bsUI.Window):
+
+    def __init__(self,gamePad,isMainMenu=True,transition='inRight',transitionOut='outRight',settings=None):
+
+        self._input = gamePad
+
+        # if this fails, our input device went away or something.. just return an empty zombie then
+        try: self._name = self._input.getName()
+        except Exception: return
+
+        self._r = 'configGamepadWindow'
+
+        self._settings = settings
+        self._transitionOut = transitionOut
+
+        # we're a secondary gamepad if supplied with settings
+        self._isSecondary = (settings is not None)
+        self._ext = '_B' if self._isSecondary else ''
+        self._isMainMenu = isMainMenu
+        self._displayName = self._name
+        buttonWidth = 240
+        self._width = 700 if self._isSecondary else 730
+        self._height = 440 if self._isSecondary else 450
+        self._spacing = 40
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),
+                                              scale=1.63 if bsUI.gSmallUI else 1.35 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(-20,-16) if bsUI.gSmallUI else (0,0),
+                                              transition=transition)
+        # dont ask to config joysticks while we're in here..
+        bsUI.gCanAskToConfigGamePads = False
+
+        self._rebuildUI()
+
+
+    def _rebuildUI(self):
+
+        # clear existing UI
+        #for w in bs.getWidgetChildren(self._rootWidget): w.delete()
+        for w in self._rootWidget.getChildren(): w.delete()
+
+        self._textWidgets = {}
+
+        # if we were supplied with settings, we're a secondary joystick and just operate on that.
+        # in the other (normal) case we make our own..
+        if not self._isSecondary:
+
+            # fill our temp config with present values (for our primary and secondary controls)
+            self._settings = {}
+            for s in ['buttonJump','buttonJump_B',
+                      'buttonPunch','buttonPunch_B',
+                      'buttonBomb','buttonBomb_B',
+                      'buttonPickUp','buttonPickUp_B',
+                      'buttonStart','buttonStart_B',
+                      'buttonStart2','buttonStart2_B',
+                      'buttonUp','buttonUp_B',
+                      'buttonDown','buttonDown_B',
+                      'buttonLeft','buttonLeft_B',
+                      'buttonRight','buttonRight_B',
+                      'buttonRun1','buttonRun1_B',
+                      'buttonRun2','buttonRun2_B',
+                      'triggerRun1','triggerRun1_B',
+                      'triggerRun2','triggerRun2_B',
+                      'buttonIgnored','buttonIgnored_B',
+                      'buttonIgnored2','buttonIgnored2_B',
+                      'buttonIgnored3','buttonIgnored3_B',
+                      'buttonIgnored4','buttonIgnored4_B',
+                      'buttonVRReorient','buttonVRReorient_B',
+                      'analogStickDeadZone','analogStickDeadZone_B',
+                      'dpad','dpad_B',
+                      'unassignedButtonsRun','unassignedButtonsRun_B',
+                      'startButtonActivatesDefaultWidget','startButtonActivatesDefaultWidget_B',
+                      'uiOnly','uiOnly_B',
+                      'ignoreCompletely','ignoreCompletely_B',
+                      'autoRecalibrateAnalogStick','autoRecalibrateAnalogStick_B',
+                      'analogStickLR','analogStickLR_B',
+                      'analogStickUD','analogStickUD_B',
+                      'enableSecondary',]:
+                val = bsUI.getControllerValue(self._input,s)
+                if val != -1: self._settings[s] = val
+
+        #if not self._isSecondary:
+        if self._isSecondary:
+            backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-180,self._height-65),autoSelect=True,
+                                             size=(160,60),label=bs.Lstr(resource='doneText'),scale=0.9,
+                                             onActivateCall=self._save)
+            # backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-65),autoSelect=True,
+            #                                  size=(160,60),label=bs.Lstr(resource='backText'),scale=0.9,
+            #                                  buttonType='back',onActivateCall=self._save)
+            #bs.containerWidget(edit=self._rootWidget,cancelButton=backButton)
+            bs.containerWidget(edit=self._rootWidget,startButton=backButton,onCancelCall=backButton.activate)
+            cancelButton = None
+        else:
+            cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(51,self._height-65),autoSelect=True,
+                                               size=(160,60),label=bs.Lstr(resource='cancelText'),scale=0.9,
+                                               onActivateCall=self._cancel)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton)
+            backButton = None
+        #else: cancelButton = None
+
+        if not self._isSecondary:
+            saveButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-(165 if self._isSecondary else 195),self._height-65),
+                                             size=((160 if self._isSecondary else 180),60),autoSelect=True,
+                                             label=bs.Lstr(resource='doneText') if self._isSecondary else bs.Lstr(resource='makeItSoText'),
+                                             scale=0.9,
+                                             onActivateCall=self._save)
+            bs.containerWidget(edit=self._rootWidget,startButton=saveButton)
+        else: saveButton = None
+
+        if not self._isSecondary:
+
+            v = self._height - 59
+            t = bs.textWidget(parent=self._rootWidget,position=(0,v+5),size=(self._width,25),
+                              text=bs.Lstr(resource=self._r+'.titleText'),
+                              color=bsUI.gTitleColor,maxWidth=310,
+                              hAlign="center",vAlign="center")
+            v -= 48
+
+            t = bs.textWidget(parent=self._rootWidget,position=(0,v+3),size=(self._width,25),text=self._name,
+                              color=bsUI.gInfoTextColor,maxWidth=self._width*0.9,
+                              hAlign="center",vAlign="center")
+
+            v -= self._spacing * 1
+
+            bs.textWidget(parent=self._rootWidget,position=(50,v+10),size=(self._width-100,30),
+                          text=bs.Lstr(resource=self._r+'.appliesToAllText'),
+                          maxWidth=330,
+                          scale=0.65, color=(0.5,0.6,0.5,1.0),hAlign='center',vAlign='center')
+            v -= 70
+            self._enableCheckBox = None
+        else:
+            v = self._height - 49
+            t = bs.textWidget(parent=self._rootWidget,position=(0,v+5),size=(self._width,25),
+                              text=bs.Lstr(resource=self._r+'.secondaryText'),
+                              color=bsUI.gTitleColor,maxWidth=300,hAlign="center",vAlign="center")
+            v -= self._spacing * 1
+
+            bs.textWidget(parent=self._rootWidget,position=(50,v+10),size=(self._width-100,30),
+                          text=bs.Lstr(resource=self._r+'.secondHalfText'),
+                          maxWidth=300,scale=0.65, color=(0.6,0.8,0.6,1.0),hAlign='center')
+            self._enableCheckBox = bs.checkBoxWidget(parent=self._rootWidget,position=(self._width*0.5-80,v-73),
+                                                     value=self._getEnableSecondaryValue(),
+                                                     autoSelect=True,
+                                                     onValueChangeCall=self._enableCheckBoxChanged,
+                                                     size=(200,30),
+                                                     text=bs.Lstr(resource=self._r+'.secondaryEnableText'),
+                                                     scale=1.2)
+            v = self._height - 205
+
+        hOffs = 160
+        dist = 70
+
+        dColor = (0.4,0.4,0.8)
+
+        sx = 1.2
+        sy = 0.98
+
+        dpm = bs.Lstr(resource=self._r+'.pressAnyButtonOrDpadText')
+        dpm2 = bs.Lstr(resource=self._r+'.ifNothingHappensTryAnalogText')
+        bLTop = self._captureButton(pos=(hOffs,v+sy*dist),color=dColor,button='buttonUp'+self._ext,texture=bs.getTexture('upButton'),scale=1.0,message=dpm,message2=dpm2)
+        bLLeft = self._captureButton(pos=(hOffs-sx*dist,v),color=dColor,button='buttonLeft'+self._ext,texture=bs.getTexture('leftButton'),scale=1.0,message=dpm,message2=dpm2)
+        bLRight = self._captureButton(pos=(hOffs+sx*dist,v),color=dColor,button='buttonRight'+self._ext,texture=bs.getTexture('rightButton'),scale=1.0,message=dpm,message2=dpm2)
+        bLBottom = self._captureButton(pos=(hOffs,v-sy*dist),color=dColor,button='buttonDown'+self._ext,texture=bs.getTexture('downButton'),scale=1.0,message=dpm,message2=dpm2)
+
+        dpm3 = bs.Lstr(resource=self._r+'.ifNothingHappensTryDpadText')
+        bAxes = self._captureButton(pos=(hOffs+130,v-125),color=(0.4,0.4,0.6),button='analogStickLR'+self._ext,maxWidth=140,
+                            texture=bs.getTexture('analogStick'),scale=1.2,message=bs.Lstr(resource=self._r+'.pressLeftRightText'),message2=dpm3)
+
+        bStart = self._captureButton(pos=(self._width*0.5,v),color=(0.4,0.4,0.6),button='buttonStart'+self._ext,texture=bs.getTexture('startButton'),scale=0.7)
+
+        hOffs = self._width-160
+
+        bRTop = self._captureButton(pos=(hOffs,v+sy*dist),color=(0.6,0.4,0.8),button='buttonPickUp'+self._ext,texture=bs.getTexture('buttonPickUp'),scale=1.0)
+        bRLeft = self._captureButton(pos=(hOffs-sx*dist,v),color=(0.7,0.5,0.1),button='buttonPunch'+self._ext,texture=bs.getTexture('buttonPunch'),scale=1.0)
+        bRRight = self._captureButton(pos=(hOffs+sx*dist,v),color=(0.5,0.2,0.1),button='buttonBomb'+self._ext,texture=bs.getTexture('buttonBomb'),scale=1.0)
+        bRBottom = self._captureButton(pos=(hOffs,v-sy*dist),color=(0.2,0.5,0.2),button='buttonJump'+self._ext,texture=bs.getTexture('buttonJump'),scale=1.0)
+
+        self._advancedButton = bAdvanced = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,label=bs.Lstr(resource=self._r+'.advancedText'),textScale=0.9,color=(0.45,0.4,0.5),
+                                                           textColor=(0.65,0.6,0.7),position=(self._width-300,30),size=(130,40),onActivateCall=self._doAdvanced)
+
+        try:
+            if cancelButton is not None and saveButton is not None:
+                bs.widget(edit=cancelButton,rightWidget=saveButton)
+                bs.widget(edit=saveButton,leftWidget=cancelButton)
+        except Exception:
+            bs.printException('error wiring gamepad config window')
+            
+    def _doAdvanced(self):
+
+        class _AdvancedWindow(bsUI.Window):
+
+            def __init__(self,parentWindow,transition='inRight'):
+                self._parentWindow = parentWindow
+
+                env = bs.getEnvironment()
+
+                self._r = parentWindow._r
+                self._width = 700
+                self._height = 402 if bsUI.gSmallUI else 512
+                self._textWidgets = {}
+                self._rootWidget = bs.containerWidget(transition='inScale',size=(self._width,self._height),
+                                                      scale=1.06*(1.85 if bsUI.gSmallUI else 1.35 if bsUI.gMedUI else 1.0),
+                                                      stackOffset=(0,-25) if bsUI.gSmallUI else (0,0),
+                                                      scaleOriginStackOffset=(parentWindow._advancedButton.getScreenSpaceCenter()))
+
+                t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-(40 if bsUI.gSmallUI else 34)),size=(0,0),
+                                  text=bs.Lstr(resource=self._r+'.advancedTitleText'),
+                                  maxWidth=320,color=bsUI.gTitleColor,hAlign="center",vAlign="center")
+
+                backButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(self._width-176,self._height-(60 if bsUI.gSmallUI else 55)),
+                                                 size=(120,48),textScale=0.8,
+                                                 label=bs.Lstr(resource='doneText'),onActivateCall=self._done)
+                bs.containerWidget(edit=self._rootWidget,startButton=b,onCancelCall=b.activate)
+
+
+                self._scrollWidth = self._width - 100
+                self._scrollHeight = self._height - 110
+                self._subWidth = self._scrollWidth-20
+                self._subHeight = 940 if self._parentWindow._isSecondary else 1040
+                if env['vrMode']: self._subHeight += 50
+                self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
+                                                     position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
+                                                     size=(self._scrollWidth,self._scrollHeight))
+                self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,
+                                                            size=(self._subWidth,self._subHeight),background=False)
+                bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+                bs.containerWidget(edit=self._subContainer,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
+                
+                h = 30
+                v = self._subHeight - 10
+
+                h2 = h + 12
+                
+                # dont allow secondary joysticks to handle unassigned buttons
+                if not self._parentWindow._isSecondary:
+                    v -= 40
+                    c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+70,v),size=(500,30),
+                                           text=bs.Lstr(resource=self._r+'.unassignedButtonsRunText'),textColor=(0.8,0.8,0.8),maxWidth=330,
+                                           scale=1.0,onValueChangeCall=self._parentWindow._setUnassignedButtonsRunValue,
+                                           autoSelect=True,
+                                           value=self._parentWindow._getUnassignedButtonsRunValue())
+                    bs.widget(edit=c1,upWidget=backButton)
+                v -= 60
+                cb = self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runButton1Text'),control='buttonRun1'+self._parentWindow._ext)
+                if self._parentWindow._isSecondary:
+                    for w in cb: bs.widget(edit=w,upWidget=backButton)
+                v -= 42
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runButton2Text'),control='buttonRun2'+self._parentWindow._ext)
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-24),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.runTriggerDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+
+                v -= 85
+                
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runTrigger1Text'),
+                                    control='triggerRun1'+self._parentWindow._ext,
+                                    message=bs.Lstr(resource=self._r+'.pressAnyAnalogTriggerText'))
+                v -= 42
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.runTrigger2Text'),
+                                    control='triggerRun2'+self._parentWindow._ext,
+                                    message=bs.Lstr(resource=self._r+'.pressAnyAnalogTriggerText'))
+
+                # in vr mode, allow assigning a reset-view button
+                if env['vrMode']:
+                    v -= 50
+                    self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.vrReorientButtonText'),control='buttonVRReorient'+self._parentWindow._ext)
+                    
+                v -= 60
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.extraStartButtonText'),control='buttonStart2'+self._parentWindow._ext)
+                v -= 60
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton1Text'),control='buttonIgnored'+self._parentWindow._ext)
+                v -= 42
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton2Text'),control='buttonIgnored2'+self._parentWindow._ext)
+                v -= 42
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton3Text'),control='buttonIgnored3'+self._parentWindow._ext)
+                v -= 42
+                self._captureButton(pos=(h2,v),name=bs.Lstr(resource=self._r+'.ignoredButton4Text'),control='buttonIgnored4'+self._parentWindow._ext)
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-14),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.ignoredButtonDescriptionText'),
+                              color=(0.7,1,0.7,0.6),
+                              scale=0.8,maxWidth=self._subWidth*0.8,
+                              hAlign='center',vAlign='center')
+
+                v -= 80
+                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
+                                       text=bs.Lstr(resource=self._r+'.startButtonActivatesDefaultText'),
+                                       textColor=(0.8,0.8,0.8),maxWidth=450,
+                                       scale=0.9,onValueChangeCall=self._parentWindow._setStartButtonActivatesDefaultWidgetValue,
+                                       value=self._parentWindow._getStartButtonActivatesDefaultWidgetValue())
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.startButtonActivatesDefaultDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+
+                v -= 80
+                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
+                                       text=bs.Lstr(resource=self._r+'.uiOnlyText'),
+                                       textColor=(0.8,0.8,0.8),maxWidth=450,
+                                       scale=0.9,onValueChangeCall=self._parentWindow._setUIOnlyValue,
+                                       value=self._parentWindow._getUIOnlyValue())
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.uiOnlyDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+
+                v -= 80
+                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
+                                       text=bs.Lstr(resource=self._r+'.ignoreCompletelyText'),
+                                       textColor=(0.8,0.8,0.8),maxWidth=450,
+                                       scale=0.9,onValueChangeCall=self._parentWindow._setIgnoreCompletelyValue,
+                                       value=self._parentWindow._getIgnoreCompletelyValue())
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.ignoreCompletelyDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+                
+                v -= 80
+
+                c1 = bs.checkBoxWidget(parent=self._subContainer,autoSelect=True,position=(h+50,v),size=(400,30),
+                                       text=bs.Lstr(resource=self._r+'.autoRecalibrateText'),textColor=(0.8,0.8,0.8),maxWidth=450,
+                                       scale=0.9,onValueChangeCall=self._parentWindow._setAutoRecalibrateAnalogStickValue,
+                                       value=self._parentWindow._getAutoRecalibrateAnalogStickValue())
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.autoRecalibrateDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+                v -= 80
+
+                buttons = self._configValueEditor(bs.Lstr(resource=self._r+'.analogStickDeadZoneText'),control='analogStickDeadZone'+self._parentWindow._ext,
+                                                  position=(h+40,v),minVal=0,maxVal=10.0,increment=0.1,xOffset=100)
+                bs.widget(edit=buttons[0],leftWidget=c1,upWidget=c1)
+                bs.widget(edit=c1,rightWidget=buttons[0],downWidget=buttons[0])
+                
+                bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-12),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.analogStickDeadZoneDescriptionText'),
+                              color=(0.7,1,0.7,0.6),maxWidth=self._subWidth*0.8,
+                              scale=0.7,hAlign='center',vAlign='center')
+                v -= 100
+                
+                # child joysticks cant have child joysticks.. that's just crazy talk
+                if not self._parentWindow._isSecondary:
+                    bs.buttonWidget(parent=self._subContainer,autoSelect=True,label=bs.Lstr(resource=self._r+'.twoInOneSetupText'),
+                                    position=(40,v),size=(self._subWidth-80,50),onActivateCall=self._parentWindow._showSecondaryEditor,upWidget=buttons[0])
+
+                # set a bigger bottom show-buffer for the widgets we just made so we can see the text below them when navigating
+                # with a gamepad
+                for w in self._subContainer.getChildren():
+                    bs.widget(edit=w,showBufferBottom=30,showBufferTop=30)
+
+            def _captureButton(self,pos,name,control,message=bs.Lstr(resource=self._r+'.pressAnyButtonText')):
+                b = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(pos[0],pos[1]),
+                                    label=name,size=(250,60),scale=0.7)
+                b2 = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(pos[0]+400,pos[1]+2),
+                                     leftWidget=b,
+                                     color=(0.45,0.4,0.5),textColor=(0.65,0.6,0.7),
+                                     label=bs.Lstr(resource=self._r+'.clearText'),size=(110,50),scale=0.7,
+                                     onActivateCall=bs.Call(self._clearControl,control))
+                bs.widget(edit=b,rightWidget=b2)
+                # make this in a timer so that it shows up on top of all other buttons
+                def foo():
+                    t = bs.textWidget(parent=self._subContainer,position=(pos[0]+285,pos[1]+20),
+                                      color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='center',scale=0.7,
+                                      text=self._parentWindow._getControlValueName(control),
+                                      maxWidth=200)
+                    self._textWidgets[control] = t
+                    bs.buttonWidget(edit=b,onActivateCall=bs.Call(bsUI.AwaitGamePadInputWindow,self._parentWindow._input,control,self._gamePadEvent,message))
+                bs.realTimer(0,foo)
+                return [b,b2]
+
+
+            def _inc(self,control,minVal,maxVal,inc):
+                try: val = self._parentWindow._settings[control]
+                except Exception: val = 1.0
+                val = min(maxVal,max(minVal,val+inc))
+                if abs(1.0-val) < 0.001:
+                    if control in self._parentWindow._settings: del(self._parentWindow._settings[control])
+                else: self._parentWindow._settings[control] = round(val,1)
+                bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
+
+            def _configValueEditor(self,name,control,position,type='float',minVal=0,maxVal=100,increment=1.0,callback=None,changeSound=True,xOffset=0,displayName=None,textScale=1.0):
+
+                if displayName is None: displayName = name
+                t = bs.textWidget(parent=self._subContainer,position=position,size=(100,30),text=displayName,
+                                  color=(0.8,0.8,0.8,1.0),hAlign="left",vAlign="center",scale=1.0,maxWidth=280)
+                if type == 'string':
+                    raise Exception("fixme unimplemented");
+                else:
+                    self._textWidgets[control] = t = bs.textWidget(parent=self._subContainer,position=(246+xOffset,position[1]),
+                                                                   size=(60,28),editable=False,
+                                                                   color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
+                                                                   text=self._parentWindow._getControlValueName(control),padding=2)
+                    b = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(330+xOffset,position[1]+4),size=(28,28),label="-",
+                                        onActivateCall=bs.Call(self._inc,control,minVal,maxVal,-increment),
+                                        repeat=True,enableSound=(changeSound is True))
+                    b2 = bs.buttonWidget(parent=self._subContainer,autoSelect=True,position=(380+xOffset,position[1]+4),size=(28,28),label="+",
+                                        onActivateCall=bs.Call(self._inc,control,minVal,maxVal,increment),
+                                        repeat=True,enableSound=(changeSound is True))
+                    return (b,b2)
+
+            def _clearControl(self,control):
+                e = self._parentWindow._ext
+                if control in self._parentWindow._settings: del(self._parentWindow._settings[control])
+                bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
+
+            def _gamePadEvent(self,control,event,dialog):
+                e = self._parentWindow._ext
+                if control in ['triggerRun1'+e,'triggerRun2'+e]:
+                    if event['type'] == 'AXISMOTION':
+                        # ignore small values or else we might get triggered by noise
+                        if abs(event['value']) > 0.5:
+                            self._parentWindow._settings[control] = event['axis']
+                            # update the button's text widget
+                            bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
+                            bs.playSound(bs.getSound('gunCocking'))
+                            dialog.die()
+                else:
+                    if event['type'] == 'BUTTONDOWN':
+                        value = event['button']
+                        self._parentWindow._settings[control] = value
+                        # update the button's text widget
+                        bs.textWidget(edit=self._textWidgets[control],text=self._parentWindow._getControlValueName(control))
+                        bs.playSound(bs.getSound('gunCocking'))
+                        dialog.die()
+
+            def _done(self):
+                bs.containerWidget(edit=self._rootWidget,transition='outScale')
+
+        w = _AdvancedWindow(self)
+
+    def _enableCheckBoxChanged(self,value):
+        if value: self._settings['enableSecondary'] = 1
+        else:
+            if 'enableSecondary' in self._settings: del self._settings['enableSecondary']
+
+    def _getUnassignedButtonsRunValue(self):
+        if 'unassignedButtonsRun' in self._settings: return self._settings['unassignedButtonsRun']
+        else: return True
+    def _setUnassignedButtonsRunValue(self,value):
+        if value:
+            if 'unassignedButtonsRun' in self._settings:
+                del(self._settings['unassignedButtonsRun']) # clear since this is default
+        else: self._settings['unassignedButtonsRun'] = False
+
+    def _getStartButtonActivatesDefaultWidgetValue(self):
+        if 'startButtonActivatesDefaultWidget' in self._settings:
+            return self._settings['startButtonActivatesDefaultWidget']
+        else:
+            return True
+
+    def _setStartButtonActivatesDefaultWidgetValue(self,value):
+        if value:
+            if 'startButtonActivatesDefaultWidget' in self._settings:
+                del(self._settings['startButtonActivatesDefaultWidget']) # clear since this is default
+        else: self._settings['startButtonActivatesDefaultWidget'] = False
+
+    def _getUIOnlyValue(self):
+        if 'uiOnly' in self._settings:
+            return self._settings['uiOnly']
+        else:
+            return False
+
+    def _setUIOnlyValue(self,value):
+        if not value:
+            if 'uiOnly' in self._settings:
+                del(self._settings['uiOnly']) # clear since this is default
+        else: self._settings['uiOnly'] = True
+
+    def _getIgnoreCompletelyValue(self):
+        if 'ignoreCompletely' in self._settings:
+            return self._settings['ignoreCompletely']
+        else:
+            return False
+
+    def _setIgnoreCompletelyValue(self,value):
+        if not value:
+            if 'ignoreCompletely' in self._settings:
+                del(self._settings['ignoreCompletely']) # clear since this is default
+        else: self._settings['ignoreCompletely'] = True
+        
+    def _getAutoRecalibrateAnalogStickValue(self):
+        if 'autoRecalibrateAnalogStick' in self._settings: return self._settings['autoRecalibrateAnalogStick']
+        else: return False
+
+    def _setAutoRecalibrateAnalogStickValue(self,value):
+        if not value:
+            if 'autoRecalibrateAnalogStick' in self._settings:
+                del(self._settings['autoRecalibrateAnalogStick']) # clear since this is default
+        else: self._settings['autoRecalibrateAnalogStick'] = True
+
+    def _getEnableSecondaryValue(self):
+        if not self._isSecondary: raise Exception("enable value only applies to secondary editor")
+        if 'enableSecondary' in self._settings: return self._settings['enableSecondary']
+        else: return False
+
+    def _showSecondaryEditor(self):
+        GamePadConfigWindow(self._input,isMainMenu=False,settings=self._settings,transition='inScale',transitionOut='outScale')
+
+    def _getControlValueName(self,control):
+
+        if control == 'analogStickLR'+self._ext:
+            # this actually shows both LR and UD
+            s1 = self._settings['analogStickLR'+self._ext] if 'analogStickLR'+self._ext in self._settings else 5 if self._isSecondary else 1
+            s2 = self._settings['analogStickUD'+self._ext] if 'analogStickUD'+self._ext in self._settings else 6 if self._isSecondary else 2
+            return self._input.getAxisName(s1)+' / '+self._input.getAxisName(s2)
+
+        # if they're looking for triggers
+        if control in ['triggerRun1'+self._ext,'triggerRun2'+self._ext]:
+            if control in self._settings: return self._input.getAxisName(self._settings[control])
+            else: return bs.Lstr(resource=self._r+'.unsetText')
+            
+        # dead-zone
+        if control == 'analogStickDeadZone'+self._ext:
+            if control in self._settings: return str(self._settings[control])
+            else: return str(1.0)
+
+        # for dpad buttons: show individual buttons if any are set..
+        # otherwise show whichever dpad is set (defaulting to 1)
+        dPadButtons = ['buttonLeft'+self._ext,'buttonRight'+self._ext,'buttonUp'+self._ext,'buttonDown'+self._ext]
+        if control in dPadButtons:
+            # if *any* dpad buttons are assigned, show only button assignments
+            if any(b in self._settings for b in dPadButtons):
+                if control in self._settings:
+                    return self._input.getButtonName(self._settings[control])
+                else: return bs.Lstr(resource=self._r+'.unsetText')
+            # no dpad buttons - show the dpad number for all 4
+            else:
+                return bs.Lstr(value='${A} ${B}',subs=[('${A}',bs.Lstr(resource=self._r+'.dpadText')),('${B}',str(self._settings['dpad'+self._ext] if 'dpad'+self._ext in self._settings else 2 if self._isSecondary else 1))])
+
+        # other buttons..
+        if control in self._settings:
+            return self._input.getButtonName(self._settings[control])
+        else:
+            return bs.Lstr(resource=self._r+'.unsetText')
+
+    def _gamePadEvent(self,control,event,dialog):
+        e = self._ext
+        # for our dpad-buttons we're looking for either a button-press or a hat-switch press
+        if control in ['buttonUp'+e, 'buttonLeft'+e, 'buttonDown'+e, 'buttonRight'+e]:
+            if event['type'] in ['BUTTONDOWN', 'HATMOTION']:
+                # if its a button-down..
+                if event['type'] == 'BUTTONDOWN':
+                    value = event['button']
+                    self._settings[control] = value
+                # if its a dpad
+                elif event['type'] == 'HATMOTION':
+                    # clear out any set dir-buttons
+                    for b in ['buttonUp'+e,'buttonLeft'+e,'buttonRight'+e,'buttonDown'+e]:
+                        if b in self._settings: del(self._settings[b])
+                    if event['hat'] == (2 if self._isSecondary else 1): # exclude value in default case
+                        if 'dpad'+e in self._settings: del(self._settings['dpad'+e])
+                    else: self._settings['dpad'+e] = event['hat']
+                # update the 4 dpad button txt widgets
+                bs.textWidget(edit=self._textWidgets['buttonUp'+e],text=self._getControlValueName('buttonUp'+e))
+                bs.textWidget(edit=self._textWidgets['buttonLeft'+e],text=self._getControlValueName('buttonLeft'+e))
+                bs.textWidget(edit=self._textWidgets['buttonRight'+e],text=self._getControlValueName('buttonRight'+e))
+                bs.textWidget(edit=self._textWidgets['buttonDown'+e],text=self._getControlValueName('buttonDown'+e))
+                bs.playSound(bs.getSound('gunCocking'))
+                dialog.die()
+
+        elif control == 'analogStickLR'+e:
+            if event['type'] == 'AXISMOTION':
+                # ignore small values or else we might get triggered by noise
+                if abs(event['value']) > 0.5:
+                    axis = event['axis']
+                    if axis == (5 if self._isSecondary else 1): # exclude value in default case
+                        if 'analogStickLR'+e in self._settings: del(self._settings['analogStickLR'+e])
+                    else: self._settings['analogStickLR'+e] = axis
+                    bs.textWidget(edit=self._textWidgets['analogStickLR'+e],text=self._getControlValueName('analogStickLR'+e))
+                    bs.playSound(bs.getSound('gunCocking'))
+                    dialog.die()
+                    # now launch the up/down waiter
+                    bsUI.AwaitGamePadInputWindow(self._input,'analogStickUD'+e,self._gamePadEvent,bs.Lstr(resource=self._r+'.pressUpDownText'))
+
+        elif control == 'analogStickUD'+e:
+            if event['type'] == 'AXISMOTION':
+                # ignore small values or else we might get triggered by noise
+                if abs(event['value']) > 0.5:
+                    axis = event['axis']
+                    # ignore our LR axis
+                    if 'analogStickLR'+e in self._settings: lrAxis = self._settings['analogStickLR'+e]
+                    else: lrAxis = (5 if self._isSecondary else 1)
+                    if axis != lrAxis:
+                        if axis == (6 if self._isSecondary else 2): # exclude value in default case
+                            if 'analogStickUD'+e in self._settings: del(self._settings['analogStickUD'+e])
+                        else: self._settings['analogStickUD'+e] = axis
+                        bs.textWidget(edit=self._textWidgets['analogStickLR'+e],text=self._getControlValueName('analogStickLR'+e))
+                        #print 'WOULD CHANGE TXT'
+                        bs.playSound(bs.getSound('gunCocking'))
+                        dialog.die()
+        else:
+            # for other buttons we just want a button-press
+            if event['type'] == 'BUTTONDOWN':
+                value = event['button']
+                self._settings[control] = value
+                # update the button's text widget
+                bs.textWidget(edit=self._textWidgets[control],text=self._getControlValueName(control))
+                bs.playSound(bs.getSound('gunCocking'))
+                dialog.die()
+
+    def _captureButton(self,pos,color,texture,button,scale=1.0,message=None,message2=None,maxWidth=80):
+        if message is None: message = bs.Lstr(resource=self._r+'.pressAnyButtonText')
+
+        baseSize = 79
+        b = bs.buttonWidget(parent=self._rootWidget,position=(pos[0]-baseSize*0.5*scale,pos[1]-baseSize*0.5*scale),
+                            autoSelect=True,size=(baseSize*scale,baseSize*scale),
+                            texture=texture,label='',color=color)
+        # make this in a timer so that it shows up on top of all other buttons
+        def foo():
+            uiScale = 0.9*scale
+            t = bs.textWidget(parent=self._rootWidget,position=(pos[0]+0.0*scale,pos[1]-58.0*scale),
+                              color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='center',
+                              scale=uiScale, text=self._getControlValueName(button),maxWidth=maxWidth)
+            self._textWidgets[button] = t
+            bs.buttonWidget(edit=b,onActivateCall=bs.Call(bsUI.AwaitGamePadInputWindow,self._input,button,self._gamePadEvent,message,message2))
+
+        bs.realTimer(0,foo)
+        return b
+    
+    def _cancel(self):
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        if self._isMainMenu:
+            bsUI.uiGlobals['mainMenuWindow'] = bsUI.ControllersWindow(transition='inLeft').getRootWidget()
+        bsUI.gCanAskToConfigGamePads = True
+
+    def _save(self):
+
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+
+        # if we're a secondary editor we just go away (we were editing our parent's settings dict)
+        if self._isSecondary: return
+
+        if self._input.exists():
+            dst = bsUI.getConfigLocationForInputDevice(self._input,default=True)
+            dst = dst[0][dst[1]]
+            dst.clear()
+            # store any values that aren't -1
+            for key,val in self._settings.items():
+                if val != -1: dst[key] = val
+            # if we're allowed to phone home, send this config so we can generate more defaults in the future
+            if bsUtils._shouldSubmitDebugInfo():
+                bsUtils.serverPut('controllerConfig',{'ua':bs.getEnvironment()['userAgentString'],'name':self._name,'inputMapHash':bsUI.getInputMapHash(self._input),'config':dst,'v':2})
+            bs.applySettings()
+            bs.writeConfig()
+            bs.playSound(bs.getSound('gunCocking'))
+        else:
+            bs.playSound(bs.getSound('error'))
+            
+        if self._isMainMenu:
+            bsUI.uiGlobals['mainMenuWindow'] = bsUI.ControllersWindow(transition='inLeft').getRootWidget()
+        bsUI.gCanAskToConfigGamePads = True
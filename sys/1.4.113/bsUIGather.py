@@ -0,0 +1,1157 @@
+import bs
+import bsInternal
+import bsUtils
+import time
+import threading
+import bsPinger
+import bsTransactions
+import bsUI
+
+
+class PublicPartyList(object):
+    """
+    The scrolling list of public parties in the gather window's join tab.
+
+    Rows are keyed by party ('ADDR_PORT') and kept across updates; update() only
+    edits the cells whose values changed, and re-sorting just moves existing rows.
+    Only rows in or near the visible part of the scroll area get widgets at all,
+    so lists of hundreds of parties stay cheap to refresh and to scroll.
+    """
+    def __init__(self,scrollWidget,width,viewHeight,upWidget,onSelectCall,onActivateCall,rowHeight=40,margin=4):
+        self._scrollWidget = scrollWidget
+        self._width = width
+        self._viewHeight = viewHeight
+        self._upWidget = upWidget
+        self._onSelectCall = onSelectCall
+        self._onActivateCall = onActivateCall
+        self._rowHeight = rowHeight
+        self._margin = margin
+        self._height = rowHeight
+        self._container = bs.containerWidget(parent=scrollWidget,size=(width,self._height),background=False)
+        bs.widget(edit=self._container,upWidget=upWidget)
+        # an empty widget pinned to our top edge; comparing its screen position
+        # with ours and the scroll widget's tells us how far we're scrolled
+        self._anchor = bs.textWidget(parent=self._container,text='',size=(0,0),position=(0,self._height))
+        self._parties = {}
+        self._order = []
+        self._rows = {}
+        self._selection = None
+        self._updateTimer = bs.Timer(100,bs.WeakCall(self._updateVisibleRows),repeat=True,timeType='real')
+
+    def exists(self):
+        return self._container.exists()
+
+    def update(self,parties,selection=None):
+        """
+        Updates the list to reflect the current parties dict (as kept by GatherWindow)
+        """
+        if not self.exists(): return
+        self._parties = parties
+        self._selection = selection
+        order = [(party['ping'] if party['ping'] is not None else 999999,party['index'],key) for key,party in parties.items()]
+        order.sort()
+        self._order = [key for ping,index,key in order]
+
+        # resize if our row count changed
+        height = max(1,len(self._order))*self._rowHeight
+        if height != self._height:
+            self._height = height
+            bs.containerWidget(edit=self._container,size=(self._width,height))
+            bs.textWidget(edit=self._anchor,position=(0,height))
+
+        # kill rows for parties that are gone
+        for key in self._rows.keys():
+            if key not in parties: self._deleteRow(key)
+        self._updateVisibleRows()
+
+    def _getVisibleRange(self):
+        count = len(self._order)
+        try:
+            anchorY = self._anchor.getScreenSpaceCenter()[1]
+            scale = (anchorY-self._container.getScreenSpaceCenter()[1])/(self._height*0.5)
+            if scale <= 0.0: raise Exception('invalid list scale')
+            # distance (in our units) from our top edge to the top of the visible area
+            top = (anchorY-self._scrollWidget.getScreenSpaceCenter()[1])/scale-self._viewHeight*0.5
+        except Exception:
+            # if we can't tell where we are, just show everything
+            return 0,count
+        first = max(0,int(top/self._rowHeight)-self._margin)
+        last = min(count,int((top+self._viewHeight)/self._rowHeight)+1+self._margin)
+        return first,last
+
+    def _updateVisibleRows(self):
+        if not self.exists(): return
+        first,last = self._getVisibleRange()
+        visible = set(self._order[first:last])
+        for key in self._rows.keys():
+            if key not in visible: self._deleteRow(key)
+        for index in range(first,last):
+            key = self._order[index]
+            row = self._rows.get(key)
+            if row is None: row = self._createRow(key,index)
+            elif row['index'] != index or row['height'] != self._height:
+                bs.containerWidget(edit=row['widget'],position=(10,self._height-(index+1)*self._rowHeight))
+            row['index'] = index
+            row['height'] = self._height
+            self._updateCells(row,self._parties[key])
+
+    def _createRow(self,key,index):
+        party = self._parties[key]
+        w = self._width
+        c = bs.containerWidget(parent=self._container,position=(10,self._height-(index+1)*self._rowHeight),
+                               size=(w*0.9,self._rowHeight),rootSelectable=True,
+                               onSelectCall=bs.Call(self._onSelectCall,party['address']),
+                               onActivateCall=bs.Call(self._onActivateCall,party['address'],party['port']),
+                               background=False,clickActivate=True)
+        if index == 0: bs.widget(edit=c,upWidget=self._upWidget)
+        if party['address'] == self._selection:
+            # reselect previous (if present) but don't scroll to it; that gives us too much unintentional jumping
+            # if we're scrolling around looking at other stuff during a refresh
+            bs.containerWidget(edit=self._container,selectedChild=c)
+        row = self._rows[key] = {'widget':c,'index':index,'height':self._height,'cells':{}}
+        row['name'] = bs.textWidget(parent=c,drawController=c,size=(0,0),position=(14,20),maxWidth=w*0.63,
+                                    scale=1.4,hAlign='left',vAlign='center')
+        row['language'] = bs.textWidget(parent=c,drawController=c,size=(0,0),position=(w*0.73,20),maxWidth=w*0.13,
+                                        scale=0.7,color=(0.8,0.8,0.8),hAlign='center',vAlign='center')
+        row['size'] = bs.textWidget(parent=c,drawController=c,size=(0,0),position=(w*0.86,20),
+                                    scale=0.7,color=(0.8,0.8,0.8),hAlign='right',vAlign='center')
+        row['ping'] = bs.textWidget(parent=c,drawController=c,size=(0,0),position=(w*0.94,20),
+                                    scale=0.7,hAlign='right',vAlign='center')
+        return row
+
+    def _deleteRow(self,key):
+        row = self._rows.pop(key)
+        if row['widget'].exists(): row['widget'].delete()
+
+    def _updateCells(self,row,party):
+        ping = party['ping']
+        if ping is None: pingText,pingColor = '-',(0.5,0.5,0.5)
+        else:
+            pingGood = bsInternal._getAccountMiscReadVal('pingGood',100)
+            pingMed = bsInternal._getAccountMiscReadVal('pingMed',500)
+            pingText,pingColor = str(ping),(0,1,0) if ping <= pingGood else (1,1,0) if ping <= pingMed else (1,0,0)
+        cells = {'name':(party['name'],(1,1,1,0.3 if ping is None else 1.0)),
+                 'language':(party['language'],None),
+                 'size':(str(party['size'])+'/'+str(party['sizeMax']),None),
+                 'ping':(pingText,pingColor)}
+        shown = row['cells']
+        for cell,value in cells.items():
+            if shown.get(cell) == value: continue
+            shown[cell] = value
+            text,color = value
+            if cell == 'language': text = bs.Lstr(translate=('languages',text))
+            if color is None: bs.textWidget(edit=row[cell],text=text)
+            else: bs.textWidget(edit=row[cell],text=text,color=color)
+
+
+class GatherWindow(bsUI.Window):
+
+    def __del__(self):
+        bsInternal._setPartyIconAlwaysVisible(False)
+
+    def __init__(self,transition='inRight',originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Gather Window')
+        
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+        
+        bsUI.gMainWindow = "Gather"
+        
+        bsInternal._setPartyIconAlwaysVisible(True)
+
+        self._publicParties = {}
+        # one callback for all our pings so the pinger batches their results together
+        self._pingCall = bs.WeakCall(self._pingCB)
+        
+        self._width = 1040
+        self._height = 582 if bsUI.gSmallUI else 680 if bsUI.gMedUI else 800
+        self._currentTab = None
+        extraTop = 20 if bsUI.gSmallUI else 0
+
+        self._r = 'gatherWindow'
+
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=1.3 if bsUI.gSmallUI else 0.97 if bsUI.gMedUI else 0.8,
+                                              stackOffset=(0,-11) if bsUI.gSmallUI else (0,0) if bsUI.gMedUI else (0,0))
+
+        if bsUI.gSmallUI and bsUI.gToolbars:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
+            self._backButton = None
+        else:
+            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(70,self._height-74),size=(140,60),scale=1.1,
+                                                                autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back', onActivateCall=self._back)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+            if bsUI.gDoAndroidNav:
+                bs.buttonWidget(edit=b,buttonType='backSmall',position=(70,self._height-78),size=(60,60),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(155,self._height - 44))
+
+        
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-42),size=(0,0),
+                          color=bsUI.gTitleColor,scale=1.5,hAlign="center",vAlign="center",
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          maxWidth=550)
+
+        
+        platform = bs.getEnvironment()['platform']
+        subplatform = bs.getEnvironment()['subplatform']
+        
+        tabsDef = [['about',bs.Lstr(resource=self._r+'.aboutText')]]
+        if True and bsInternal._getAccountMiscReadVal('enablePublicParties',True):
+            tabsDef.append(['internet',bs.Lstr(resource=self._r+'.internetText')])
+        if platform == 'android' and subplatform == 'google':
+            tabsDef.append(['googlePlus',bs.Lstr(resource=self._r+'.googlePlayText')])
+        tabsDef.append(['localNetwork',bs.Lstr(resource=self._r+'.localNetworkText')])
+        
+        tabsDef.append(['manual',bs.Lstr(resource=self._r+'.manualText')])
+
+        scrollBufferH = 130
+        tabBufferH = 250
+        
+        self._tabButtons = bsUI._createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
+                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab)
+
+        if bsUI.gToolbars:
+            bs.widget(edit=self._tabButtons[tabsDef[-1][0]],rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if bsUI.gSmallUI:
+                bs.widget(edit=self._tabButtons[tabsDef[0][0]],leftWidget=bsInternal._getSpecialWidget('backButton'))
+            
+        self._scrollWidth = self._width-scrollBufferH
+        self._scrollHeight = self._height-180
+
+        # not actually using a scroll widget anymore; just an image
+        scrollLeft = (self._width-self._scrollWidth)*0.5
+        scrollBottom = self._height-self._scrollHeight-79-48
+        bufferH = 10
+        bufferV = 4
+        bs.imageWidget(parent=self._rootWidget,position=(scrollLeft-bufferH,scrollBottom-bufferV),size=(self._scrollWidth+2*bufferH,self._scrollHeight+2*bufferV),
+                       texture=bs.getTexture('scrollWidget'),modelTransparent=bs.getModel('softEdgeOutside'))
+        self._tabContainer = None
+        self._restoreState()
+
+    def _showWarning(self):
+        if not bsUI.gShowedNetPlayWarning:
+            bsUI.gShowedNetPlayWarning = True
+            env = bs.getEnvironment()
+            if not env['debugBuild']:
+                bsUI.ConfirmWindow(bs.Lstr(resource=self._r+'.inDevelopmentWarningText'),
+                              color=(0.7,1.0,0.7),width=500,height=205,cancelButton=False)
+
+    def _onGooglePlayShowInvitesPress(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN'  or bsInternal._getAccountType() != 'Google Play':
+            bsUI.showSignInPrompt('Google Play')
+        else:
+            bsInternal._showInvitesUI()
+    
+    def _onGooglePlayInvitePress(self):
+
+        if bsInternal._getAccountState() != 'SIGNED_IN' or bsInternal._getAccountType() != 'Google Play':
+            bsUI.showSignInPrompt('Google Play')
+        else:
+            # if there's google play people connected to us, inform the user that they will get disconnected..
+            # otherwise just go ahead..
+            googlePlayerCount = bsInternal._getGooglePlayPartyClientCount()
+            if googlePlayerCount > 0:
+                bsUI.ConfirmWindow(bs.Lstr(resource=self._r+'.googlePlayReInviteText',subs=[('${COUNT}',str(googlePlayerCount))]),
+                              bs.Call(bs.realTimer,200,bsInternal._invitePlayers),
+                              width=500,height=150,okText=bs.Lstr(resource=self._r+'.googlePlayInviteText'))
+            else:
+                bs.realTimer(100,bsInternal._invitePlayers)
+
+    def _inviteToTryPress(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+            return
+        bsUI.doAppInvitesPress()
+        
+    def _setTab(self,tab):
+
+        if self._currentTab == tab: return
+        self._currentTab = tab
+
+        # we wanna preserve our current tab between runs
+        bs.getConfig()['Gather Tab'] = tab
+        bs.writeConfig()
+        
+        # update tab colors based on which is selected
+        bsUI._updateTabButtonColors(self._tabButtons,tab)
+
+        # (re)create scroll widget
+        if self._tabContainer is not None and self._tabContainer.exists():
+            self._tabContainer.delete()
+        scrollLeft = (self._width-self._scrollWidth)*0.5
+        scrollBottom = self._height-self._scrollHeight-79-48
+
+        # a place where tabs can store data to get cleared when switching to a different tab
+        self._tabData = {}
+        
+        # so we can still select root level widgets with direction buttons
+        def _simpleMessage(tab,message,stringHeight,includeInvite=False):
+            msgScale = 1.1
+            cWidth = self._scrollWidth
+            cHeight = min(self._scrollHeight,stringHeight*msgScale+100)
+            tryTickets = bsInternal._getAccountMiscReadVal('friendTryTickets',None)
+            if tryTickets is None: includeInvite = False
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectable=True if includeInvite else False)
+            bs.widget(edit=c,upWidget=self._tabButtons[tab])
+            
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,cHeight*(0.58 if includeInvite else 0.5)),
+                              color=(0.6,1.0,0.6),scale=msgScale,
+                              size=(0,0),maxWidth=cWidth*0.9,maxHeight=cHeight*(0.7 if includeInvite else 0.9),
+                              hAlign='center',vAlign='center',
+                              text=message)
+            if includeInvite:
+                t = bs.textWidget(parent=c,position=(cWidth*0.57,35),
+                                  color=(0,1,0),scale=0.6,
+                                  size=(0,0),maxWidth=cWidth*0.5,
+                                  hAlign='right',vAlign='center',
+                                  flatness=1.0,
+                                  text=bs.Lstr(resource=self._r+'.inviteAFriendText',subs=[('${COUNT}',str(tryTickets))])
+                )
+                bs.buttonWidget(parent=c,position=(cWidth*0.59,10),
+                                size=(230,50),
+                                color=(0.54,0.42,0.56),
+                                textColor=(0,1,0),
+                                label=bs.Lstr(resource='gatherWindow.inviteFriendsText',fallback='gatherWindow.getFriendInviteCodeText'),
+                                autoSelect=True,
+                                onActivateCall=bs.WeakCall(self._inviteToTryPress),
+                                upWidget=self._tabButtons[tab])
+
+
+        if tab == 'about':
+            msg = bs.Lstr(resource=self._r+'.aboutDescriptionText',subs=[('${PARTY}',bs.getSpecialChar('partyIcon')),('${BUTTON}',bs.getSpecialChar('topButton'))])
+
+            # let's not talk about sharing in vr-mode; its tricky to fit more than
+            # one head in a VR-headset ;-)
+            if not bs.getEnvironment()['vrMode']:
+                msg = bs.Lstr(value='${A}\n\n${B}',subs=[('${A}',msg),('${B}',bs.Lstr(resource=self._r+'.aboutDescriptionLocalMultiplayerExtraText'))])
+                
+            _simpleMessage(tab,msg,400,includeInvite=True)
+            
+        elif tab == 'googlePlus':
+            cWidth = self._scrollWidth
+            cHeight = 380
+            bWidth = 250
+            bWidth2 = 230
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            imgSize = 100
+            v = cHeight-30
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.googlePlayDescriptionText'))
+            v -= 35
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.worksWithGooglePlayDevicesText'))
+            v -= 125
+            b = bs.buttonWidget(parent=c,label='',position=(cWidth*0.5-bWidth*0.5,v-bWidth*0.5),size=(bWidth,bWidth*0.9),
+                                #buttonType='square',onActivateCall=bs.Call(bs.realTimer,100,bsInternal._invitePlayers),
+                                buttonType='square',onActivateCall=self._onGooglePlayInvitePress,
+                                autoSelect=True,upWidget=self._tabButtons[tab])
+            bs.imageWidget(parent=c,position=(cWidth*0.5-imgSize*0.5,v-35),size=(imgSize,imgSize),
+                           drawController=b,texture=bs.getTexture('googlePlayGamesIcon'),color=(0,1,0))
+            bs.textWidget(parent=c,text=bs.Lstr(resource=self._r+'.googlePlayInviteText'),maxWidth=bWidth*0.8,drawController=b,color=(0,1,0),flatness=1.0,
+                          position=(cWidth*0.5,v-60),scale=1.6,size=(0,0),hAlign='center',vAlign='center')
+            v -= 180
+            bs.buttonWidget(parent=c,label=bs.Lstr(resource=self._r+'.googlePlaySeeInvitesText'),
+                            color=(0.5,0.5,0.6),textColor=(0.75,0.7,0.8),
+                            autoSelect=True,
+                            position=(cWidth*0.5-bWidth2*0.5,v),
+                            size=(bWidth2,60),
+                            onActivateCall=bs.Call(bs.realTimer,100,self._onGooglePlayShowInvitesPress))
+
+        elif tab == 'internet':
+            cWidth = self._scrollWidth
+            cHeight = self._scrollHeight-20
+            subScrollHeight = cHeight - 85
+            subScrollWidth = 650
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            v = cHeight - 30
+            self._internetJoinText = t = bs.textWidget(parent=c,position=(cWidth*0.5-245,v-13),color=(0.6,1.0,0.6),scale=1.3,
+                                                       size=(200,30),maxWidth=250,
+                                                       hAlign='left',vAlign='center',
+                                                       clickActivate=True,
+                                                       selectable=True,autoSelect=True,
+                                                       onActivateCall=bs.Call(self._setInternetTab,'join',playSound=True),
+                                                       text=bs.Lstr(resource=self._r+'.joinPublicPartyDescriptionText')
+            )
+            bs.widget(edit=t,upWidget=self._tabButtons[tab])
+            self._internetHostText = t = bs.textWidget(parent=c,position=(cWidth*0.5+45,v-13),color=(0.6,1.0,0.6),scale=1.3,
+                                                       size=(200,30),maxWidth=250,
+                                                       hAlign='left',vAlign='center',
+                                                       clickActivate=True,
+                                                       selectable=True,autoSelect=True,
+                                                       onActivateCall=bs.Call(self._setInternetTab,'host',playSound=True),
+                                                       text=bs.Lstr(resource=self._r+'.hostPublicPartyDescriptionText')
+            )
+            bs.widget(edit=t,leftWidget=self._internetJoinText,upWidget=self._tabButtons[tab])
+            bs.widget(edit=self._internetJoinText,rightWidget=t)
+
+            # attempt to fetch our local address so we have it for error messages
+            self._internetLocalAddress = None
+            class AddrFetchThread(threading.Thread):
+                def __init__(self,call):
+                    threading.Thread.__init__(self)
+                    self._call = call
+                def run(self):
+                    try:
+                        # FIXME - update this to work with IPv6 at some point..
+                        import socket
+                        val = ([(s.connect(('8.8.8.8', 80)), s.getsockname()[0], s.close()) for s in [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)]][0][1])
+                        bs.callInGameThread(bs.Call(self._call,val))
+                    except Exception:
+                        pass
+
+            AddrFetchThread(bs.WeakCall(self._internetFetchLocalAddrCB)).start()
+            
+            self._setInternetTab(self._internetTab)
+            self._tabData = {}
+
+            self._tabData['updateTimer'] = bs.Timer(1000,bs.WeakCall(self._updateInternetTab),repeat=True,timeType='real')
+            
+            # bs.widget(edit=sw,autoSelect=True,upWidget=self._tabButtons[tab])
+            
+        elif tab == 'localNetwork':
+            cWidth = self._scrollWidth
+            cHeight = self._scrollHeight-20
+            subScrollHeight = cHeight - 85
+            subScrollWidth = 650
+
+            class NetScanner(object):
+                def __init__(self,scrollWidget,tabButton,width):
+                    self._scrollWidget = scrollWidget
+                    self._tabButton = tabButton
+                    self._columnWidget = bs.columnWidget(parent=self._scrollWidget,leftBorder=10)
+                    bs.widget(edit=self._columnWidget,upWidget=tabButton)
+                    self._width = width
+                    self._lastSelectedHost = None
+
+                    self._updateTimer = bs.Timer(1000,bs.WeakCall(self.update),timeType='real',repeat=True)
+                    # go ahead and run a few *almost* immediately so we dont have to wait a second
+                    self.update()
+                    bs.realTimer(250,bs.WeakCall(self.update))
+                    
+                def __del__(self):
+                    bsInternal._endHostScanning()
+
+                def _onSelect(self,host):
+                    self._lastSelectedHost = host
+
+                def _onActivate(self,host):
+                    bsInternal._connectToParty(host['address'])
+                    #bs.screenMessage("WOULD CONNECT TO '"+host['address']+"'")
+                        
+                def update(self):
+                    tScale = 1.6
+                    for c in self._columnWidget.getChildren(): c.delete()
+                    lastSelectedHost = self._lastSelectedHost # grab this now this since adding widgets will change it
+                    hosts = bsInternal._hostScanCycle()
+                    for i,host in enumerate(hosts):
+                        t = bs.textWidget(parent=self._columnWidget,size=(self._width/tScale,30),selectable=True,
+                                          #color=(0,1,0),
+                                          color=(1,1,1),
+                                          onSelectCall=bs.Call(self._onSelect,host),
+                                          onActivateCall=bs.Call(self._onActivate,host),clickActivate=True,
+                                          text=host['displayString'],hAlign='left',vAlign='center',cornerScale=tScale,maxWidth=(self._width/tScale)*0.93)
+                                          #text=host['name']+"_"+host['pubID'],hAlign='left',vAlign='center',cornerScale=tScale,maxWidth=(self._width/tScale)*0.93)
+                        if host == lastSelectedHost:
+                            bs.containerWidget(edit=self._columnWidget,selectedChild=t,visibleChild=t)
+                        if i == 0: bs.widget(edit=t,upWidget=self._tabButton)
+            
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            v = cHeight - 30
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v-3),color=(0.6,1.0,0.6),scale=1.3,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.localNetworkDescriptionText'))
+            v -= 15
+            v -= subScrollHeight+23
+            sw = bs.scrollWidget(parent=c,position=((self._scrollWidth-subScrollWidth)*0.5,v),size=(subScrollWidth,subScrollHeight))
+
+            self._tabData = NetScanner(sw,self._tabButtons[tab],width=subScrollWidth)
+            
+            
+            bs.widget(edit=sw,autoSelect=True,upWidget=self._tabButtons[tab])
+            # t = bs.textWidget(parent=c,position=(cWidth*0.5,v+subScrollHeight*0.5),color=(1,1,1),scale=0.9,
+            #                   size=(0,0),maxWidth=cWidth*0.9,
+            #                   hAlign='center',vAlign='center',
+            #                   text='(not wired up yet)')
+
+            # _simpleMessage(('TODO: add local network UI here'))
+
+        elif tab == 'bluetooth':
+            cWidth = self._scrollWidth
+            cHeight = 380
+            subScrollHeight = cHeight - 150
+            subScrollWidth = 650
+
+            bWidth = 250
+            bWidth2 = 230
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            imgSize = 100
+            v = cHeight-30
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.bluetoothDescriptionText'))
+            v -= 35
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.bluetoothAndroidSupportText'))
+
+            v -= 55
+            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-subScrollWidth*0.5+10,v-75),size=(300,70),autoSelect=True,
+                                onActivateCall=bsInternal._bluetoothAdvertise,
+                                label=bs.Lstr(resource=self._r+'.bluetoothHostText'))
+            bs.widget(edit=b,upWidget=self._tabButtons[tab])
+            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-subScrollWidth*0.5+330,v-75),size=(300,70),autoSelect=True,
+                                onActivateCall=bs.Call(bs.screenMessage,'FIXME: not wired up yet'),
+                                label=bs.Lstr(resource=self._r+'.bluetoothJoinText'))
+            bs.widget(edit=b,upWidget=self._tabButtons[tab])
+            bs.widget(edit=self._tabButtons[tab],downWidget=b)
+            
+        elif tab == 'wifiDirect':
+            cWidth = self._scrollWidth
+            cHeight = self._scrollHeight-20
+            subScrollHeight = cHeight - 100
+            subScrollWidth = 650
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            v = cHeight - 80
+
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.0,
+                              size=(0,0),maxWidth=cWidth*0.95,maxHeight=140,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.wifiDirectDescriptionTopText'))
+            v -= 140
+            b = bs.buttonWidget(parent=c,position=(cWidth*0.5-175,v),size=(350,65),label=bs.Lstr(resource=self._r+'.wifiDirectOpenWiFiSettingsText'),
+                            autoSelect=True,onActivateCall=bsInternal._androidShowWifiSettings)
+            v -= 82
+            
+            bs.widget(edit=b,upWidget=self._tabButtons[tab])
+
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.9,
+                              size=(0,0),maxWidth=cWidth*0.95,maxHeight=150,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.wifiDirectDescriptionBottomText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]))
+            
+
+        elif tab == 'manual':
+            cWidth = self._scrollWidth
+            cHeight = 380
+
+            try: lastAddr = bs.getConfig()['Last Manual Party Connect Address']
+            except Exception: lastAddr = ''
+
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+            v = cHeight-30
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=1.3,
+                              size=(0,0),maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.manualDescriptionText'))
+            v -= 30
+            v -= 70
+            t = bs.textWidget(parent=c,position=(cWidth*0.5-260-50,v),
+                              color=(0.6,1.0,0.6),scale=1.0,
+                              size=(0,0),maxWidth=130,
+                              hAlign='right',vAlign='center',
+                              text=bs.Lstr(resource=self._r+'.manualAddressText'))
+            t = bs.textWidget(parent=c,editable=True,
+                              description=bs.Lstr(resource=self._r+'.manualAddressText'),
+                              position=(cWidth*0.5-240-50,v-30),text=lastAddr,autoSelect=True,
+                              vAlign='center',scale=1.0, size=(420,60))
+            t2 = bs.textWidget(parent=c,position=(cWidth*0.5-260+490,v),
+                               color=(0.6,1.0,0.6),scale=1.0,
+                               size=(0,0),maxWidth=80,
+                               hAlign='right',vAlign='center',
+                               text=bs.Lstr(resource=self._r+'.portText')
+            )
+            t2 = bs.textWidget(parent=c,editable=True,
+                               description=bs.Lstr(resource=self._r+'.portText'),
+                               text='43210',autoSelect=True,maxChars=5,
+                               position=(cWidth*0.5-240+490,v-30),
+                               vAlign='center',scale=1.0, size=(170,60))
+
+            v -= 110
+            
+            def _connect(textWidget,portTextWidget):
+                addr = bs.textWidget(query=textWidget)
+                try:
+                    port = int(bs.textWidget(query=portTextWidget))
+                    if port > 65535 or port < 0: raise Exception()
+                except Exception:
+                    bs.screenMessage(bs.Lstr(resource='internal.invalidPortErrorText'),color=(1,0,0))
+                    return
+                
+                class HostAddrFetchThread(threading.Thread):
+                    def __init__(self,name,call):
+                        threading.Thread.__init__(self)
+                        self._name = name
+                        self._call = call
+                    def run(self):
+                        try:
+                            import socket
+                            addr = socket.gethostbyname(self._name)
+                            bs.callInGameThread(bs.Call(self._call,addr))
+                        except Exception:
+                            bs.callInGameThread(bs.Call(self._call,None))
+
+                def doIt(addr):
+                    if addr is None:
+                        bs.screenMessage(bs.Lstr(resource='internal.unableToResolveHostText'),color=(1,0,0))
+                    else:
+                        # print 'WOULD DO IT WITH',type(addr),addr
+                        bs.getConfig()['Last Manual Party Connect Address'] = addr # store for later
+                        bs.writeConfig()
+                        bsInternal._connectToParty(addr,port=port)
+                HostAddrFetchThread(addr,doIt).start()
+                
+            b = bs.buttonWidget(parent=c,size=(300,70),
+                                label=bs.Lstr(resource=self._r+'.manualConnectText'),
+                                position=(cWidth*0.5-150,v),autoSelect=True,
+                                onActivateCall=bs.Call(_connect,t,t2))
+            bs.widget(edit=t,upWidget=self._tabButtons[tab])
+            bs.textWidget(edit=t,onReturnPressCall=b.activate)
+            bs.textWidget(edit=t2,onReturnPressCall=b.activate)
+            v -= 45
+            
+            ts = 0.85
+            tspc = 25
+
+            #v -= 35
+            def _safeSetText(t,val,success=True):
+                if t.exists(): bs.textWidget(edit=t,text=val,color=(0,1,0) if success else (1,1,0))
+
+            # this currently doesn't work from china since we go through a reverse proxy there
+            # EDIT - it should work now; our proxy server forwards along original IPs
+            env = bs.getEnvironment()
+            # doInternetCheck = False if env['platform'] == 'android' and env['subplatform'] == 'alibaba' else True
+            doInternetCheck = True
+            
+            def doIt(v,c):
+                if not c.exists(): return
+
+                bs.playSound(bs.getSound('swish'))
+                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
+                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
+                                  hAlign='right',vAlign='center',
+                                  text=bs.Lstr(resource=self._r+'.manualYourLocalAddressText'))
+                t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
+                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
+                                  hAlign='left',vAlign='center',
+                                  text=bs.Lstr(resource=self._r+'.checkingText'))
+
+                class AddrFetchThread(threading.Thread):
+                    def __init__(self,window,textWidget):
+                        threading.Thread.__init__(self)
+                        self._window = window
+                        self._textWidget = textWidget
+                    def run(self):
+                        try:
+                            # FIXME - update this to work with IPv6 at some point..
+                            import socket
+                            val = ([(s.connect(('8.8.8.8', 80)), s.getsockname()[0], s.close()) for s in [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)]][0][1])
+                            bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,val))
+                        except Exception,e:
+                            errStr = str(e)
+                            if 'Network is unreachable' in errStr:
+                                bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,
+                                                            # self._window._R.noConnectionText,
+                                                            bs.Lstr(resource=self._window._r+'.noConnectionText'),
+                                                            False))
+                            else:
+                                bs.callInGameThread(bs.Call(_safeSetText,self._textWidget,
+                                                            # self._window._R.addressFetchErrorText,
+                                                            bs.Lstr(resource=self._window._r+'.addressFetchErrorText'),
+                                                            False))
+                                bs.callInGameThread(bs.Call(bs.printError,'error in AddrFetchThread: '+str(e)))
+                AddrFetchThread(self,t).start()
+                
+                v -= tspc
+                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
+                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
+                                  hAlign='right',vAlign='center',
+                                  text=bs.Lstr(resource=self._r+'.manualYourAddressFromInternetText'))
+
+                tAddr = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
+                                  size=(0,0),maxWidth=cWidth*0.45,
+                                      hAlign='left',vAlign='center',flatness=1.0,
+                                      text=bs.Lstr(resource=self._r+'.checkingText'))
+                v -= tspc
+                t = bs.textWidget(parent=c,position=(cWidth*0.5-10,v),color=(0.6,1.0,0.6),scale=ts,
+                                  size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
+                                  hAlign='right',vAlign='center',
+                                  text=bs.Lstr(resource=self._r+'.manualJoinableFromInternetText'))
+
+                tAccessible = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.5,0.5,0.5),scale=ts,
+                                            size=(0,0),maxWidth=cWidth*0.45,flatness=1.0,
+                                            hAlign='left',vAlign='center',
+                                            text=bs.Lstr(resource=self._r+'.checkingText'))
+                v -= 28
+                tAccessibleExtra = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(1,0.5,0.2),scale=0.7,
+                                                 size=(0,0),maxWidth=cWidth*0.9,flatness=1.0,
+                                                 hAlign='center',vAlign='center',
+                                                 text='')
+
+                self._doingAccessCheck = False
+                self._accessCheckCount = 0 # cap our refreshes eventually..
+                self._tabData['accessCheckTimer'] = bs.Timer(10000,bs.WeakCall(self._accessCheckUpdate,tAddr,tAccessible,tAccessibleExtra),
+                                                             repeat=True,timeType='real')
+                self._accessCheckUpdate(tAddr,tAccessible,tAccessibleExtra)  # kick initial off
+
+                if checkButton.exists():
+                    checkButton.delete()
+                
+            if doInternetCheck:
+                checkButton = b = bs.textWidget(parent=c, size=(250,60),
+                                                text=bs.Lstr(resource=self._r+'.showMyAddressText'),
+                                                vAlign='center',hAlign='center', clickActivate=True,
+                                                position=(cWidth*0.5 - 125,v-30), autoSelect=True,
+                                                color=(0.5,0.9,0.5),
+                                                scale=0.8,
+                                                selectable=True,
+                                                onActivateCall=bs.Call(doIt,v,c))
+
+    def _internetFetchLocalAddrCB(self, val):
+        self._internetLocalAddress = str(val)
+        
+    def _setInternetTab(self, value, playSound=False):
+        if playSound: bs.playSound(bs.getSound('click01'))
+
+        # if we're switching in from elsewhere, reset our selection
+        # (prevents selecting something way down the list if we switched away and came back)
+        if self._internetTab != value:
+            self._publicPartyListSelection = None
+        
+        self._internetTab = value
+        # activeColor = (0.4,1.0,0.4)
+        activeColor = (0.6,1.0,0.6)
+        inactiveColor = (0.5,0.4,0.5)
+        bs.textWidget(edit=self._internetJoinText,color=activeColor if value == 'join' else inactiveColor)
+        bs.textWidget(edit=self._internetHostText,color=activeColor if value == 'host' else inactiveColor)
+
+        # clear anything in existence..
+        for attr in ['_internetHostScrollWidget','_internetHostNameText','_internetHostToggleButton',
+                     '_internetHostNameLabelText','_internetHostStatusText','_internetJoinPartySizeLabel','_internetJoinNameLabel',
+                     '_internetJoinPartyNameLabel','_internetJoinPartyLanguageLabel',
+                     '_internetJoinPartyPingLabel','_internetHostMaxPartySizeLabel','_internetHostMaxPartySizeValue',
+                     '_internetHostMaxPartySizeMinusButton','_internetHostMaxPartySizePlusButton',
+                     '_internetJoinStatusText','_internetHostDedicatedServerInfoText']:
+            widget = getattr(self,attr,None)
+            if widget is not None:
+                widget.delete()
+                delattr(self,attr)
+        self._publicPartyList = None
+
+        cWidth = self._scrollWidth
+        cHeight = self._scrollHeight-20
+        subScrollHeight = cHeight - 90
+        subScrollWidth = 830
+        v = cHeight - 35
+        v -= 25
+        isPublicEnabled = bsInternal._getPublicPartyEnabled()
+        if value == 'join':
+            self._internetJoinLastRefreshTime = -99999 # reset this so we do an immediate refresh query
+            # reset our list of public parties
+            self._publicParties = {}
+            self._internetJoinPartyNameLabel = bs.textWidget(text=bs.Lstr(resource='nameText'),
+                                                             parent=self._tabContainer,size=(0,0),position=(90,v-8),maxWidth=60,
+                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
+            self._internetJoinPartyLanguageLabel = bs.textWidget(text=bs.Lstr(resource='settingsWindowAdvanced.languageText'),
+                                                                 parent=self._tabContainer,size=(0,0),position=(662,v-8),maxWidth=100,
+                                                                 scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
+            self._internetJoinPartySizeLabel = bs.textWidget(text=bs.Lstr(resource=self._r+'.partySizeText'),
+                                                             parent=self._tabContainer,size=(0,0),position=(755,v-8),maxWidth=60,
+                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
+            self._internetJoinPartyPingLabel = bs.textWidget(text=bs.Lstr(resource=self._r+'.pingText'),
+                                                             parent=self._tabContainer,size=(0,0),position=(825,v-8),maxWidth=60,
+                                                             scale=0.6,color=(0.5,0.5,0.5),flatness=1.0,shadow=0.0,hAlign='center',vAlign='center')
+            v -= subScrollHeight+23
+            
+            self._internetHostScrollWidget = sw = bs.scrollWidget(parent=self._tabContainer,
+                                                                  position=((self._scrollWidth-subScrollWidth)*0.5,v),
+                                                                  size=(subScrollWidth,subScrollHeight))
+            bs.widget(edit=sw,autoSelect=True)
+            self._publicPartyList = PublicPartyList(sw,subScrollWidth,subScrollHeight,upWidget=self._internetJoinText,
+                                                    onSelectCall=bs.WeakCall(self._setPublicPartySelection),
+                                                    onActivateCall=bs.WeakCall(self._onPublicPartyActivate))
+
+            self._internetJoinStatusText = bs.textWidget(parent=self._tabContainer,
+                                                         text=bs.Lstr(value='${A}...',subs=[('${A}',bs.Lstr(resource='store.loadingText'))]),
+                                                         size=(0,0), scale=0.9,
+                                                         flatness=1.0,shadow=0.0,hAlign='center',vAlign='top', maxWidth=cWidth,
+                                                         color=(0.6,0.6,0.6), position=(cWidth*0.5,cHeight*0.5))
+            
+            tScale = 1.6
+            
+        if value == 'host':
+            v -= 30
+            partyNameText = bs.Lstr(resource='gatherWindow.partyNameText',fallback='editGameListWindow.nameText')
+            self._internetHostNameLabelText = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='right',vAlign='center',
+                                                            maxWidth=200,scale=0.8,color=bsUI.gInfoTextColor,position=(210,v-9),text=partyNameText)
+            self._internetHostNameText = bs.textWidget(parent=self._tabContainer,editable=True,size=(535,40),position=(230,v - 30),
+                                                       text=bs.getConfig().get('Public Party Name',''),maxWidth=494,shadow=0.3,flatness=1.0,
+                                                       description=partyNameText,autoSelect=True,vAlign='center',cornerScale=1.0)
+
+            v -= 60
+            self._internetHostMaxPartySizeLabel = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='right',vAlign='center',
+                                                                maxWidth=200,scale=0.8,color=bsUI.gInfoTextColor,position=(210,v-9),
+                                                                text=bs.Lstr(resource='maxPartySizeText',fallback='maxConnectionsText')
+            )
+            self._internetHostMaxPartySizeValue = bs.textWidget(parent=self._tabContainer,size=(0,0),hAlign='center',vAlign='center',
+                                                                scale=1.2,color=(1,1,1),position=(240,v-9),
+                                                                text=str(bsInternal._getPublicPartyMaxSize()))
+            b1 = self._internetHostMaxPartySizeMinusButton = bs.buttonWidget(parent=self._tabContainer,size=(40,40),
+                                                                            onActivateCall=bs.WeakCall(self._onMaxPublicPartySizeMinusPress),
+                                                                             position=(280,v-26),label='-',autoSelect=True)
+            b2 = self._internetHostMaxPartySizePlusButton = bs.buttonWidget(parent=self._tabContainer,size=(40,40),
+                                                                            onActivateCall=bs.WeakCall(self._onMaxPublicPartySizePlusPress),
+                                                                            position=(350,v-26),label='+',autoSelect=True)
+            v -= 50
+            v -= 70
+            if isPublicEnabled:
+                label = bs.Lstr(resource='gatherWindow.makePartyPrivateText',fallback='gatherWindow.stopAdvertisingText')
+            else: label = bs.Lstr(resource='gatherWindow.makePartyPublicText',fallback='gatherWindow.startAdvertisingText')
+            self._internetHostToggleButton = bs.buttonWidget(parent=self._tabContainer, label=label,size=(400,80),
+                                                             onActivateCall=self._onStopInternetAdvertisingPress if isPublicEnabled else self._onStartInternetAdvertisingPress,
+                                                             position=(cWidth*0.5-200,v),autoSelect=True,upWidget=b2)
+            bs.widget(edit=self._internetHostNameText,downWidget=b2)
+            bs.widget(edit=b2,upWidget=self._internetHostNameText)
+            bs.widget(edit=b1,upWidget=self._internetHostNameText)
+            bs.widget(edit=self._internetJoinText,downWidget=self._internetHostNameText)
+            v -= 10
+            self._internetHostStatusText = bs.textWidget(parent=self._tabContainer,
+                                                         text=bs.Lstr(resource=self._r+'.partyStatusNotPublicText'),
+                                                         size=(0,0), scale=0.7,
+                                                         flatness=1.0,shadow=0.0,hAlign='center',vAlign='top', maxWidth=cWidth,
+                                                         color=(0.6,0.6,0.6), position=(cWidth*0.5,v))
+            v -= 90
+            self._internetHostDedicatedServerInfoText = bs.textWidget(parent=self._tabContainer,
+                                                                      text=bs.Lstr(resource=self._r+'.dedicatedServerInfoText'),
+                                                                      size=(0,0), scale=0.7,
+                                                                      flatness=1.0,shadow=0.0,hAlign='center',vAlign='center', maxWidth=cWidth * 0.9,
+                                                                      color=bsUI.gInfoTextColor, position=(cWidth*0.5,v))
+            
+            # if public sharing is already on, launch a status-check immediately
+            if bsInternal._getPublicPartyEnabled():
+                self._doInternetStatusCheck()
+
+        # now add a lock icon overlay for if we don't have pro
+        icon = getattr(self,'_internetLockIcon',None)
+        if icon is not None and icon.exists():
+            self._internetLockIcon.delete() # kill any existing
+        self._internetLockIcon = bs.imageWidget(parent=self._tabContainer,
+                                                position=(cWidth*0.5-60,cHeight*0.5-50),
+                                                size=(120,120),
+                                                opacity=0.0 if not self._isInternetLocked() else 0.5,
+                                                texture=bs.getTexture('lock'))
+        
+    def _isInternetLocked(self):
+        if bsInternal._getAccountMiscReadVal('ilck',False):
+            return False if bsUtils._havePro() else True
+        else:
+            return False
+
+
+    def _onMaxPublicPartySizeMinusPress(self):
+        val = bsInternal._getPublicPartyMaxSize()
+        val -= 1
+        if val < 1: val = 1
+        bsInternal._setPublicPartyMaxSize(val)
+        bs.textWidget(edit=self._internetHostMaxPartySizeValue,text=str(val))
+        
+    def _onMaxPublicPartySizePlusPress(self):
+        val = bsInternal._getPublicPartyMaxSize()
+        val += 1
+        bsInternal._setPublicPartyMaxSize(val)
+        bs.textWidget(edit=self._internetHostMaxPartySizeValue,text=str(val))
+    
+    def _onPublicPartyQueryResult(self, result):
+
+        with bs.Context('UI'):
+            
+            # any time we get any result at all, kill our loading status
+            statusText = getattr(self,'_internetJoinStatusText',None)
+            if statusText is not None and statusText.exists():
+                # dont show results if not signed in (probably didnt get any anyway)
+                if bsInternal._getAccountState() != 'SIGNED_IN':
+                    bs.textWidget(edit=statusText,text=bs.Lstr(resource='notSignedInText'))
+                else:
+                    if result is None: bs.textWidget(edit=statusText,text=bs.Lstr(resource='errorText'))
+                    else: bs.textWidget(edit=statusText,text='')
+
+            if result is not None: partiesIn = result['l']
+            else: partiesIn = []
+
+            for party in self._publicParties.values():
+                party['claimed'] = False
+
+            for partyIn in partiesIn:
+                # party is indexed by (ADDR)_(PORT)
+                partyKey = partyIn['a']+'_'+str(partyIn['p'])
+                party = self._publicParties.get(partyKey)
+                if party is None:
+                    # if this party is new to us, init it..
+                    index = getattr(self,'_nextPublicPartyEntryIndex',0)
+                    self._nextPublicPartyEntryIndex = index + 1
+                    party = self._publicParties[partyKey] = {
+                        'address':partyIn['a'],
+                        'nextPingTime':bs.getRealTime()+partyIn['pd'],
+                        'ping':None,
+                        'index':index,
+                    }
+                # now, new or not, update its values
+                party['port'] = partyIn['p']
+                party['name'] = partyIn['n']
+                party['size'] = partyIn['s']
+                party['language'] = partyIn['l']
+                party['sizeMax'] = partyIn['sm']
+                party['claimed'] = True
+                party['pingInterval'] = partyIn['pi']
+
+            # prune unclaimed party entries
+            self._publicParties = dict([entry for entry in self._publicParties.items() if entry[1]['claimed']])
+
+            self._updatePublicPartyList()
+
+    def _updatePublicPartyList(self):
+        partyList = getattr(self,'_publicPartyList',None)
+        if partyList is None or not partyList.exists(): return
+        with bs.Context('UI'):
+            partyList.update(self._publicParties,selection=getattr(self,'_publicPartyListSelection',None))
+        
+    def _onPublicPartyActivate(self,address,port):
+        
+        if self._isInternetLocked():
+            if bsInternal._getAccountState() != 'SIGNED_IN': bsUI.showSignInPrompt()
+            else: bsUI.PurchaseWindow(items=['pro'])
+            return
+
+        # rate limit this a bit
+        now = time.time()
+        lastConnectTime = getattr(self,'_lastPublicPartyConnectAttemptTime',None)
+        if lastConnectTime is None or now - lastConnectTime > 2.0:
+            bsInternal._connectToParty(address,port=port)
+            self._lastPublicPartyConnectAttemptTime = now
+        
+    def _setPublicPartySelection(self,address):
+        self._publicPartyListSelection = address
+        
+    def _updateInternetTab(self):
+        # if we've got a party-name text widget, keep its value plugged into our public host name...
+        text = getattr(self, '_internetHostNameText', None)
+        if text is not None and text.exists():
+            name = bs.textWidget(query=self._internetHostNameText)
+            bsInternal._setPublicPartyName(name)
+
+        # show/hide the lock icon depending on if we've got pro
+        icon = getattr(self,'_internetLockIcon',None)
+        if icon is not None and icon.exists():
+            #if not bsUtils._havePro():
+            if self._isInternetLocked():
+                bs.imageWidget(edit=icon,opacity=0.5)
+            else:
+                bs.imageWidget(edit=icon,opacity=0.0)
+            
+        if self._internetTab == 'join':
+            now = bs.getRealTime()
+            if now - getattr(self,'_internetJoinLastRefreshTime',-99999) > bsInternal._getAccountMiscReadVal('pubPartyRefreshMS',10000):
+                self._internetJoinLastRefreshTime = now
+                env = bs.getEnvironment()
+                bsTransactions.addTransaction({'type':'PUBLIC_PARTY_QUERY','proto':env['protocolVersion'],'lang':bs.getLanguage()},callback=bs.WeakCall(self._onPublicPartyQueryResult))
+
+            # go through our existing public party entries firing off pings for any
+            # that have timed out
+            for party in self._publicParties.values():
+                if party['nextPingTime'] <= now:
+                    party['nextPingTime'] += party['pingInterval']
+
+                    bsPinger.getPartyPinger().ping(party['address'],party['port'],self._pingCall)
+
+    def _pingCB(self,results):
+        # results come in batches; update everything and then refresh our list once
+        changed = False
+        for address,port,result in results:
+            party = self._publicParties.get(address+'_'+str(port))
+            if party is not None:
+                party['ping'] = result
+                changed = True
+        # (our list may be gone if we switched away from the join tab while pings were in flight)
+        if changed: self._updatePublicPartyList()
+        
+    def _doInternetStatusCheck(self):
+        bs.textWidget(edit=self._internetHostStatusText,color=(1,1,0),
+                      text=bs.Lstr(resource=self._r+'.partyStatusCheckingText'))
+        bsUtils.serverGet('bsAccessCheck',{},callback=bs.WeakCall(self._onPublicPartyAccessibleResponse))
+
+        
+    def _onStartInternetAdvertisingPress(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+            return
+
+        # requires sign-in and pro
+        #if not bsUtils._havePro():
+        if self._isInternetLocked():
+            if bsInternal._getAccountState() != 'SIGNED_IN': bsUI.showSignInPrompt()
+            else: bsUI.PurchaseWindow(items=['pro'])
+            return
+        
+        name = bs.textWidget(query=self._internetHostNameText)
+        if name == '':
+            bs.screenMessage(bs.Lstr(resource='internal.invalidNameErrorText'),color=(1,0,0))
+            bs.playSound(bs.getSound('error'))
+            return
+        bsInternal._setPublicPartyName(name)
+        bs.getConfig()['Public Party Name'] = name
+        bs.writeConfig()
+        bs.playSound(bs.getSound('shieldUp'))
+        bsInternal._setPublicPartyEnabled(True);
+        self._doInternetStatusCheck()
+        bs.buttonWidget(edit=self._internetHostToggleButton,
+                        label=bs.Lstr(resource='gatherWindow.makePartyPrivateText',fallback='gatherWindow.stopAdvertisingText'),
+                        onActivateCall=self._onStopInternetAdvertisingPress)
+
+
+    def _onPublicPartyAccessibleResponse(self, data):
+        # if we've got status text widgets, update them..
+        text = getattr(self,'_internetHostStatusText',None)
+        if text is not None and text.exists():
+            if data is None:
+                bs.textWidget(edit=text,
+                              text=bs.Lstr(resource=self._r+'.partyStatusNoConnectionText'),
+                              color=(1,0,0))
+            else:
+                if not data.get('accessible',False):
+                    if self._internetLocalAddress is not None:
+                        exLine = bs.Lstr(value='\n${A} ${B}',
+                                         subs=[('${A}',bs.Lstr(resource=self._r+'.manualYourLocalAddressText')),
+                                               ('${B}',self._internetLocalAddress)])
+                    else:
+                        exLine = ''
+                    bs.textWidget(edit=text,
+                                  text=bs.Lstr(value='${A}\n${B}${C}',
+                                               subs=[('${A}',bs.Lstr(resource=self._r+'.partyStatusNotJoinableText')),
+                                                     ('${B}',bs.Lstr(resource=self._r+'.manualRouterForwardingText',
+                                                                     subs=[('${PORT}',str(bsInternal._getGamePort()))])),
+                                                     ('${C}',exLine)]),
+                                  color=(1,0,0))
+                else:
+                    bs.textWidget(edit=text,
+                                  text=bs.Lstr(resource=self._r+'.partyStatusJoinableText'),
+                                  color=(0,1,0))
+                
+        
+    def _onStopInternetAdvertisingPress(self):
+        bsInternal._setPublicPartyEnabled(False);
+        bs.playSound(bs.getSound('shieldDown'))
+        text = getattr(self,'_internetHostStatusText',None)
+        if text is not None and text.exists():
+            bs.textWidget(edit=text,
+                          text=bs.Lstr(resource=self._r+'.partyStatusNotPublicText'),
+                          color=(0.6,0.6,0.6))
+
+        bs.buttonWidget(edit=self._internetHostToggleButton,
+                        label=bs.Lstr(resource='gatherWindow.makePartyPublicText',fallback='gatherWindow.startAdvertisingText'),
+                        onActivateCall=self._onStartInternetAdvertisingPress)
+        
+    def _accessCheckUpdate(self,tAddr,tAccessible,tAccessibleExtra):
+        # if we don't have an outstanding query, start one..
+        if not self._doingAccessCheck and self._accessCheckCount < 100:
+            self._doingAccessCheck = True
+            self._accessCheckCount += 1
+            self._tAddr = tAddr
+            self._tAccessible = tAccessible
+            self._tAccessibleExtra = tAccessibleExtra
+            bsUtils.serverGet('bsAccessCheck',{},callback=bs.WeakCall(self._onAccessibleResponse))
+        
+    def _onAccessibleResponse(self,data):
+        tAddr = self._tAddr
+        tAccessible = self._tAccessible
+        tAccessibleExtra = self._tAccessibleExtra
+        self._doingAccessCheck = False
+        colorBad = (1,1,0)
+        colorGood = (0,1,0)
+        if data is None or 'address' not in data or 'accessible' not in data:
+            if tAddr.exists(): bs.textWidget(edit=tAddr,
+                                             text=bs.Lstr(resource=self._r+'.noConnectionText'),
+                                             color=colorBad)
+            if tAccessible.exists(): bs.textWidget(edit=tAccessible,
+                                                   text=bs.Lstr(resource=self._r+'.noConnectionText'),
+                                                   color=colorBad)
+            if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,text='',color=colorBad)
+            return
+        if tAddr.exists(): bs.textWidget(edit=tAddr,text=data['address'],color=colorGood)
+        if tAccessible.exists():
+            if data['accessible']:
+                bs.textWidget(edit=tAccessible,
+                              text=bs.Lstr(resource=self._r+'.manualJoinableYesText'),
+                              color=colorGood)
+                if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,text='',color=colorGood)
+            else:
+                bs.textWidget(edit=tAccessible,
+                              text=bs.Lstr(resource=self._r+'.manualJoinableNoWithAsteriskText'),
+                              color=colorBad)
+                if tAccessibleExtra.exists(): bs.textWidget(edit=tAccessibleExtra,
+                                                            text=bs.Lstr(resource=self._r+'.manualRouterForwardingText',subs=[('${PORT}',str(bsInternal._getGamePort()))]),
+                                                            color=colorBad)
+        
+            
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._backButton: selName = 'Back'
+            elif sel in self._tabButtons.values():
+                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
+            elif sel == self._tabContainer: selName = 'TabContainer'
+            else: raise Exception("unrecognized selection: "+str(sel))
+            bsUI.gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab,'internetTab':self._internetTab}
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]['selName']
+            except Exception: selName = None
+            try: self._internetTab = bsUI.gWindowStates[self.__class__.__name__]['internetTab']
+            except Exception: self._internetTab = 'join'
+            #try: currentTab = gWindowStates[self.__class__.__name__]['tab']
+            try: currentTab = bs.getConfig()['Gather Tab']
+            except Exception: currentTab = None
+            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'about'
+            self._setTab(currentTab)
+            if selName == 'Back': sel = self._backButton
+            elif selName == 'TabContainer': sel = self._tabContainer
+            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
+            else: sel = self._tabButtons[currentTab]
+            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+            
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.MainMenuWindow(transition='inLeft').getRootWidget()
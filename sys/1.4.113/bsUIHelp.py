@@ -0,0 +1,518 @@
+import bs
+import bsInternal
+import bsUtils
+import bsServerData
+import bsUI
+
+
+class HelpWindow(bsUI.Window):
+
+    def __init__(self,mainMenu=False,originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Help Window')
+        
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+            transition = 'inRight'
+
+        self._r = 'helpWindow'
+        
+        self._mainMenu = mainMenu
+        width = 750
+        height = 460 if bsUI.gSmallUI else 530 if bsUI.gMedUI else 600
+
+        bsUI.gCanAskToConfigGamePads = False
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=1.77 if bsUI.gSmallUI else 1.25 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-30) if bsUI.gSmallUI else (0,15) if bsUI.gMedUI else (0,0))
+
+        t = bs.textWidget(parent=self._rootWidget,position=(0,height-(54 if bsUI.gSmallUI else 45)),size=(width,25),
+                          text=bs.Lstr(resource=self._r+'.titleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="top")
+
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(44,55 if bsUI.gSmallUI else 55),simpleCullingV=100.0,
+                                             size=(width-88,height-120+(5 if bsUI.gSmallUI else 0)),captureArrows=True)
+
+        if bsUI.gToolbars:
+            bs.widget(edit=self._scrollWidget,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+        bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
+
+        # ugly: create this last so it gets first dibs at touch events (since we have it close to the scroll widget)
+        if bsUI.gSmallUI and bsUI.gToolbars:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._close)
+            bs.widget(edit=self._scrollWidget,leftWidget=bsInternal._getSpecialWidget('backButton'))
+        else:
+            b = bs.buttonWidget(parent=self._rootWidget,
+                                position=(40+0 if bsUI.gSmallUI else 70,height-(59 if bsUI.gSmallUI else 50)),size=(140,60),scale=0.7 if bsUI.gSmallUI else 0.8,
+                                label=bs.Lstr(resource='backText') if self._mainMenu else "Close",buttonType='back' if self._mainMenu else None,
+                                extraTouchBorderScale=2.0,autoSelect=True,
+                                onActivateCall=self._close)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+            if self._mainMenu and bsUI.gDoAndroidNav:
+                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,55),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(10+(90 if gSmallUI else 120),height - (52 if gSmallUI else 39)))
+
+        
+        interfaceType = bs.getEnvironment()['interfaceType']
+
+        self._subWidth = 660
+        #How To Play scroll size
+        self._subHeight = 2175 + bsUtils._getResource(self._r+'.someDaysExtraSpace') + bsUtils._getResource(self._r+'.orPunchingSomethingExtraSpace')
+        
+        c = self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),background=False,claimsLeftRight=False,claimsTab=False)
+
+        spacing = 1.0
+
+        h = self._subWidth*0.5
+        v = self._subHeight-55
+
+        logoTex = bs.getTexture('logo')
+        iconBuffer = 1.1
+
+        header = (0.7,1.0,0.7,1.0)
+        header2 = (0.8,0.8,1.0,1.0)
+        paragraph = (0.8,0.8,1.0,1.0)
+
+        txt = bs.Lstr(resource=self._r+'.welcomeText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
+        txtScale = 1.4
+        txtMaxWidth = 480
+        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,resScale=1.5,
+                          text=txt,hAlign="center",color=header,vAlign="center",maxWidth=txtMaxWidth)
+        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
+        
+        iconSize = 70
+        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
+
+        forceTest = False
+        # forceTest = True
+        # print 'FORCING TEST'
+        env = bs.getEnvironment()
+        if (env['platform'] == 'android' and env['subplatform'] == 'alibaba') or forceTest:
+            v -= 120.0
+            txt = ('\xe8\xbf\x99\xe6\x98\xaf\xe4\xb8\x80\xe4\xb8\xaa\xe5\x8f\xaf\xe4\xbb\xa5\xe5\x92\x8c\xe5\xae\xb6\xe4\xba\xba\xe6\x9c\x8b\xe5\x8f\x8b\xe4\xb8\x80\xe8\xb5\xb7\xe7\x8e\xa9\xe7\x9a\x84\xe6\xb8\xb8\xe6\x88\x8f,\xe5\x90\x8c\xe6\x97\xb6\xe6\x94\xaf\xe6\x8c\x81\xe8\x81\x94 \xe2\x80\xa8\xe7\xbd\x91\xe5\xaf\xb9\xe6\x88\x98\xe3\x80\x82\n'
+                   '\xe5\xa6\x82\xe6\xb2\xa1\xe6\x9c\x89\xe6\xb8\xb8\xe6\x88\x8f\xe6\x89\x8b\xe6\x9f\x84,\xe5\x8f\xaf\xe4\xbb\xa5\xe4\xbd\xbf\xe7\x94\xa8\xe7\xa7\xbb\xe5\x8a\xa8\xe8\xae\xbe\xe5\xa4\x87\xe6\x89\xab\xe7\xa0\x81\xe4\xb8\x8b\xe8\xbd\xbd\xe2\x80\x9c\xe9\x98\xbf\xe9\x87\x8c\xc2\xa0TV\xc2\xa0\xe5\x8a\xa9\xe6\x89\x8b\xe2\x80\x9d\xe7\x94\xa8 \xe6\x9d\xa5\xe4\xbb\xa3\xe6\x9b\xbf\xe5\xa4\x96\xe8\xae\xbe\xe3\x80\x82\n'
+                   '\xe6\x9c\x80\xe5\xa4\x9a\xe6\x94\xaf\xe6\x8c\x81\xe6\x8e\xa5\xe5\x85\xa5\xc2\xa08\xc2\xa0\xe4\xb8\xaa\xe5\xa4\x96\xe8\xae\xbe')
+            bs.textWidget(parent=c, size=(0,0), hAlign='center', vAlign='center', maxWidth = self._subWidth * 0.9,
+                          position=(self._subWidth*0.5, v-180), text=txt)
+            bs.imageWidget(parent=c, position=(self._subWidth - 320, v-120), size=(200, 200),
+                           texture=bs.getTexture('aliControllerQR'))
+            bs.imageWidget(parent=c, position=(90, v-130), size=(210, 210),
+                           texture=bs.getTexture('multiplayerExamples'))
+            v -= 120.0
+
+        else:
+            v -= spacing * 50.0
+            txtScale = 0.66
+            txt = bs.Lstr(resource=self._r+'.someDaysText').evaluate()
+            t = bs.textWidget(parent=c, position=(h,v), size=(0,0), scale=1.2, maxWidth=self._subWidth*0.9,
+                              text=txt, hAlign="center", color=paragraph, vAlign="center", flatness=1.0)
+            v -= (spacing * 25.0 + bsUtils._getResource(self._r+'.someDaysExtraSpace'))
+            txtScale = 0.66
+            txt = bs.Lstr(resource=self._r+'.orPunchingSomethingText').evaluate()
+            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
+                              text=txt,hAlign="center",color=paragraph,vAlign="center",flatness=1.0)
+            v -= (spacing * 27.0 + bsUtils._getResource(self._r+'.orPunchingSomethingExtraSpace'))
+            txtScale = 1.0
+            txt = bs.Lstr(resource=self._r+'.canHelpText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
+            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=1.0,
+                              text=txt,hAlign="center",color=paragraph,vAlign="center")
+
+            v -= spacing * 70.0
+            txtScale = 1.0
+            txt = bs.Lstr(resource=self._r+'.toGetTheMostText').evaluate()
+            t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
+                              text=txt,hAlign="center",color=header,vAlign="center",flatness=1.0)
+
+            v -= spacing * 40.0
+            txtScale = 0.74
+            txt = bs.Lstr(resource=self._r+'.friendsText').evaluate()
+            h2 = h - 220
+            t = bs.textWidget(parent=c,position=(h2,v),size=(0,0),scale=txtScale,maxWidth=100,
+                              text=txt,hAlign="right",color=header,vAlign="center",flatness=1.0)
+
+            txt = bs.Lstr(resource=self._r+'.friendsGoodText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
+            txtScale = 0.7
+            t = bs.textWidget(parent=c,position=(h2+10,v+8),size=(0,0),scale=txtScale,maxWidth=500,
+                              text=txt,hAlign="left",color=paragraph,flatness=1.0)
+
+            env = bs.getEnvironment()
+
+            v -= spacing * 45.0
+            txt = bs.Lstr(resource=self._r+'.devicesText').evaluate() if (env['vrMode']) else bs.Lstr(resource=self._r+'.controllersText').evaluate()
+            txtScale = 0.74
+            h2 = h - 220
+            t = bs.textWidget(parent=c,position=(h2,v),size=(0,0),scale=txtScale,maxWidth=100,
+                              text=txt,hAlign="right",color=header,vAlign="center",flatness=1.0)
+
+            txtScale = 0.7
+            if not env['vrMode']: txt = bs.Lstr(resource=self._r+'.controllersInfoText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText')),('${REMOTE_APP_NAME}',bsUtils._getRemoteAppName())]).evaluate()
+            else: txt = bs.Lstr(resource=self._r+'.devicesInfoText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
+
+            t = bs.textWidget(parent=c,position=(h2+10,v+8),size=(0,0),scale=txtScale,
+                              maxWidth=500,maxHeight=105,
+                              text=txt,hAlign="left",color=paragraph,flatness=1.0)
+
+        v -= spacing * 150.0
+
+        txt = bs.Lstr(resource=self._r+'.controlsText').evaluate()
+        txtScale = 1.4
+        txtMaxWidth = 480
+        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,
+                          text=txt,hAlign="center",color=header,vAlign="center",resScale=1.5,
+                          maxWidth=txtMaxWidth)
+        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
+        iconSize = 70
+
+
+        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
+        v -= spacing * 45.0
+        txtScale = 0.7
+        txt = bs.Lstr(resource=self._r+'.controlsSubtitleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]).evaluate()
+        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
+                          flatness=1.0,text=txt,hAlign="center",color=paragraph,vAlign="center")
+        v -= spacing * 160.0
+
+        sep = 70
+        iconSize = 100
+        iconSize2 = 30
+        icon2Offs = 55
+        icon2Offs2 = 40
+
+        # to determine whether to show ouya buttons here lets look for actual OUYA hardware
+        # (we could be an ouya build running on other hardware)
+        ouya = bsInternal._isRunningOnOuya();
+        
+        h2 = h - sep
+        v2 = v
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
+                           texture=bs.getTexture('buttonPunch'),color=(0.2,0.6,1) if ouya else (1,0.7,0.3))
+        txtScale = bsUtils._getResource(self._r+'.punchInfoTextScale')
+        txt = bs.Lstr(resource=self._r+'.punchInfoText').evaluate()
+        t = bs.textWidget(parent=c,position=(h-sep-185+70,v+120),size=(0,0),scale=txtScale,flatness=1.0,
+                          text=txt,hAlign="center",color=(0.3,0.65,1,1) if ouya else (1,0.7,0.3,1.0),vAlign="top")
+        if ouya:
+            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h-sep-185+70-66,v+107),
+                           texture=bs.getTexture('ouyaUButton'))
+        h2 = h + sep
+        v2 = v
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
+                           texture=bs.getTexture('buttonBomb'),color=(1,0.3,0.3))
+        txt = bs.Lstr(resource=self._r+'.bombInfoText').evaluate()
+        txtScale = bsUtils._getResource(self._r+'.bombInfoTextScale')
+        t = bs.textWidget(parent=c,position=(h+sep+50+60,v-35),size=(0,0),scale=txtScale,flatness=1.0,maxWidth=270,
+                          text=txt,hAlign="center",color=(1,0.3,0.3,1.0),vAlign="top")
+        if ouya:
+            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h+sep+50-5,v-48),
+                           texture=bs.getTexture('ouyaAButton'))
+        h2 = h
+        v2 = v + sep
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
+                           texture=bs.getTexture('buttonPickUp'),color=(1,0.8,0.3) if ouya else (0.5,0.5,1))
+        txt = bs.Lstr(resource=self._r+'.pickUpInfoText')
+        txtScale = bsUtils._getResource(self._r+'.pickUpInfoTextScale')
+        t = bs.textWidget(parent=c,position=(h+60+120,v+sep+50),size=(0,0),scale=txtScale,flatness=1.0,
+                          text=txt,hAlign="center",color=(1,0.8,0.3,1) if ouya else (0.5,0.5,1,1.0),vAlign="top")
+        if ouya:
+            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h+60+48,v+sep+38),
+                           texture=bs.getTexture('ouyaYButton'))
+        h2 = h
+        v2 = v - sep
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v2-0.5*iconSize),
+                           texture=bs.getTexture('buttonJump'),color=(0.4,1,0.4))
+        txt = bs.Lstr(resource=self._r+'.jumpInfoText').evaluate()
+        txtScale = bsUtils._getResource(self._r+'.jumpInfoTextScale')
+        t = bs.textWidget(parent=c,position=(h-250+75,v-sep-15+30),size=(0,0),scale=txtScale,flatness=1.0,
+                          text=txt,hAlign="center",color=(0.4,1,0.4,1.0),vAlign="top")
+        if ouya:
+            bs.imageWidget(parent=c,size=(iconSize2,iconSize2),position=(h-250+13,v-sep+3),
+                           texture=bs.getTexture('ouyaOButton'))
+
+        txt = bs.Lstr(resource=self._r+'.runInfoText').evaluate()
+        txtScale = bsUtils._getResource(self._r+'.runInfoTextScale')
+        t = bs.textWidget(parent=c,position=(h,v-sep-100),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.93,
+                          flatness=1.0,text=txt,hAlign="center",color=(0.7,0.7,1.0,1.0),vAlign="center")
+
+        v -= spacing * 280.0
+
+
+        txt = bs.Lstr(resource=self._r+'.powerupsText').evaluate()
+        #txtScale = R.powerupsTextScale
+        txtScale = 1.4
+        txtMaxWidth = 480
+        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,flatness=0.5,
+                          text=txt,hAlign="center",color=header,vAlign="center",maxWidth=txtMaxWidth)
+        txtWidth = min(txtMaxWidth,bsInternal._getStringWidth(txt,suppressWarning=True)*txtScale)
+        iconSize = 70
+        h2 = h - (txtWidth*0.5+iconSize*0.5*iconBuffer)
+        i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h2-0.5*iconSize,v-0.45*iconSize),texture=logoTex)
+
+        v -= spacing * 50.0
+        txtScale = bsUtils._getResource(self._r+'.powerupsSubtitleTextScale')
+        txt = bs.Lstr(resource=self._r+'.powerupsSubtitleText').evaluate()
+        t = bs.textWidget(parent=c,position=(h,v),size=(0,0),scale=txtScale,maxWidth=self._subWidth*0.9,
+                          text=txt,hAlign="center",color=paragraph,vAlign="center",flatness=1.0)
+
+        v -= spacing * 1.0
+
+        m1 = -270
+        m2 = -215
+        m3 = 0
+        iconSize = 50
+        shadowSize = 80
+        shadowOffsX = 3
+        shadowOffsY = -4
+        tBig = 1.1
+        tSmall = 0.65
+
+        shadowTex = bs.getTexture('shadowSharp')
+
+        for tex in ['powerupPunch',
+                    'powerupShield',
+                    'powerupSpeed',
+                    'powerupHijump',
+                    'powerupBomb',
+                    'powerupBlast',
+                    'powerupHealth',
+                    'powerupOverdrive',
+                    'powerupIceBombs',
+                    'powerupImpactBombs',
+                    'powerupCombatBombs',
+                    'powerupStickyBombs',
+                    # jasonhu5
+                    'powerupOverPower',
+                    # 
+                    'powerupDynamitePack',
+                    'powerupRangerBombs',
+                    'powerupKnockerBombs',
+                    'powerupGrenade',
+                    'powerupHealBombs',
+                    'powerupLandMines',
+                    'powerupCurse']:
+            name = bs.Lstr(resource=self._r+'.'+tex+'NameText')
+            desc = bs.Lstr(resource=self._r+'.'+tex+'DescriptionText')
+            
+            v -= spacing * 60.0
+
+            i = bs.imageWidget(parent=c,size=(shadowSize,shadowSize),position=(h+m1+shadowOffsX-0.5*shadowSize,v+shadowOffsY-0.5*shadowSize),
+                               texture=shadowTex,color=(0,0,0),opacity=0.5)
+            i = bs.imageWidget(parent=c,size=(iconSize,iconSize),position=(h+m1-0.5*iconSize,v-0.5*iconSize),
+                               texture=bs.getTexture(tex))
+
+            txtScale = tBig
+            txt = name
+            t = bs.textWidget(parent=c,position=(h+m2,v+3),size=(0,0),scale=txtScale,maxWidth=200,flatness=1.0,
+                              text=txt,hAlign="left",color=header2,vAlign="center")
+            txtScale = tSmall
+            txt = desc
+            t = bs.textWidget(parent=c,position=(h+m3,v),size=(0,0),scale=txtScale,maxWidth=300,flatness=1.0,
+                              text=txt,hAlign="left",color=paragraph,vAlign="center",resScale=0.5)
+
+    def _close(self):
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        if self._mainMenu:
+            bsUI.uiGlobals['mainMenuWindow'] = bsUI.MainMenuWindow(transition='inLeft').getRootWidget()
+        bsUI.gCanAskToConfigGamePads = True
+
+
+class CreditsWindow(bsUI.Window):
+    def __init__(self,originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Credits Window')
+        
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+            transition = 'inRight'
+        
+        width = 670
+        height = 398 if bsUI.gSmallUI else 500
+
+        self._r = 'creditsWindow'
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=2.0 if bsUI.gSmallUI else 1.3 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-8) if bsUI.gSmallUI else (0,0))
+
+        if bsUI.gToolbars and bsUI.gSmallUI:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
+        else:
+            b = bs.buttonWidget(parent=self._rootWidget,position=(40,height-(68 if bsUI.gSmallUI else 62)),size=(140,60),scale=0.8,
+                                label=bs.Lstr(resource='backText'),buttonType='back', onActivateCall=self._back,autoSelect=True)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+            if bsUI.gDoAndroidNav:
+                bs.buttonWidget(edit=b,buttonType='backSmall',position=(40,height-(68 if bsUI.gSmallUI else 62)+5),size=(60,48),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(110,height-(59 if gSmallUI else 54)))
+
+            
+        t = bs.textWidget(parent=self._rootWidget,position=(0,height-(59 if bsUI.gSmallUI else 54)),size=(width,30),
+                          text=bs.Lstr(resource=self._r+'.titleText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
+                          hAlign="center",
+                          color=bsUI.gTitleColor,
+                          maxWidth=330,vAlign="center")
+
+        
+        s = bs.scrollWidget(parent=self._rootWidget,position=(40,35),size=(width-80,height-100),captureArrows=True)
+
+        if bsUI.gToolbars:
+            bs.widget(edit=s,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if bsUI.gSmallUI:
+                bs.widget(edit=s,leftWidget=bsInternal._getSpecialWidget('backButton'))
+                
+            
+        def _formatNames(names,inset):
+            s = ''
+            spaceWidth = bsInternal._getStringWidth(' '*10,suppressWarning=True)/10.0 # measure a series since theres overlaps and stuff..
+            spacing = 330
+            c1 = inset
+            c2 = c1+spacing
+            c3 = c2+spacing
+            #c4 = c3+spacing
+            lineWidth = 0
+            line = ''
+            for name in names:
+                # move to the next column (or row) and print
+                if lineWidth > c3:
+                    s += line+'\n'
+                    line = ''
+                    lineWidth = 0
+
+                #if lineWidth > c3: target = c4
+                if lineWidth > c2: target = c3
+                elif lineWidth > c1: target = c2
+                else: target = c1
+                #print 'ADDING',(target-width)/spaceWidth,'TO GET TO',target
+                spacing = ' '*int((target-lineWidth)/spaceWidth)
+                line += spacing
+                line += name.decode('utf-8')
+                lineWidth = bsInternal._getStringWidth(line,suppressWarning=True)
+            if line != '': s += line+'\n'
+            return s
+
+        soundAndMusic = bs.Lstr(resource=self._r+'.songCreditText').evaluate()
+        soundAndMusic = soundAndMusic.replace('${TITLE}',"'William Tell (Trumpet Entry)'")
+        soundAndMusic = soundAndMusic.replace('${PERFORMER}','The Apollo Symphony Orchestra')
+        soundAndMusic = soundAndMusic.replace('${PERFORMER}','The Apollo Symphony Orchestra')
+        soundAndMusic = soundAndMusic.replace('${COMPOSER}','Gioacchino Rossini')
+        soundAndMusic = soundAndMusic.replace('${ARRANGER}','Chris Worth')
+        soundAndMusic = soundAndMusic.replace('${PUBLISHER}','BMI')
+        soundAndMusic = soundAndMusic.replace('${SOURCE}','www.AudioSparx.com')
+        spc = '     '
+        soundAndMusic = spc+soundAndMusic.replace('\n','\n'+spc)
+        # soundAndMusic = ("     'William Tell (Trumpet Entry)' Performed by The Apollo Symphony Orchestra\n"
+        #                  "     Composed by Gioacchino Rossini, Arranged by Chris Worth, Published by BMI,\n"
+        #                  "     courtesy of www.AudioSparx.com")
+        names = ['HubOfTheUniverseProd', 'Jovica', 'LG', 'Leady', 'Percy Duke', 'PhreaKsAccount',
+                                       'Pogotron', 'Rock Savage', 'anamorphosis', 'benboncan', 'cdrk', 'chipfork',
+                                       'guitarguy1985', 'jascha', 'joedeshon', 'loofa', 'm_O_m', 'mich3d', 'sandyrb',
+                                       'shakaharu', 'sirplus', 'stickman', 'thanvannispen', 'virotic', 'zimbot']
+        names.sort(key=lambda x:x.lower())
+
+        freesoundNames = _formatNames(names,90)
+
+        translationNames = _formatNames(bsServerData.translationContributors,60)
+        # eww - need to chop this up since we're passing our 65535 vertex limit for meshes..
+        # ..should add support for 32 bit indices i suppose...
+        creditsText1 = ('  '+bs.Lstr(resource=self._r+'.codingGraphicsAudioText').evaluate().replace('${NAME}','Eric Froemling')+'\n'
+                       '\n'
+                       '  '+bs.Lstr(resource=self._r+'.additionalAudioArtIdeasText').evaluate().replace('${NAME}','Raphael Suter')+'\n'
+                       '\n'
+                       '  '+bs.Lstr(resource=self._r+'.soundAndMusicText').evaluate()+'\n'
+                       '\n'
+                       +soundAndMusic+'\n'
+                       '\n'
+                       '     '+bs.Lstr(resource=self._r+'.publicDomainMusicViaText').evaluate().replace('${NAME}','Musopen.com')+'\n'
+                       '        '+bs.Lstr(resource=self._r+'.thanksEspeciallyToText').evaluate().replace('${NAME}','the US Army, Navy, and Marine Bands')+'\n'
+                       '\n'
+                       '     '+bs.Lstr(resource=self._r+'.additionalMusicFromText').evaluate().replace('${NAME}','The YouTube Audio Library')+'\n'
+                       '\n'
+                       '     '+bs.Lstr(resource=self._r+'.soundsText').evaluate().replace('${SOURCE}','Freesound.org')+'\n'
+                       '\n'
+                       +freesoundNames+'\n'
+                       '\n'
+                        '  '+bs.Lstr(resource=self._r+'.languageTranslationsText').evaluate()+'\n'
+                        '\n'
+                        +'\n'.join(translationNames.splitlines()[:40]))
+        
+        creditsText2 = ('\n'.join(translationNames.splitlines()[40:])+'\n'
+                        '\n'
+                       '  DISCLAIMER:\n\n'
+                        '     The Tournaments are disabled.\n'
+                        '     What did you expect?\n'
+                       '\n'
+                       '  Holiday theme vector art by designed by Freepik\n'
+                       '\n'
+                       '  '+bs.Lstr(resource=self._r+'.specialThanksText').evaluate()+'\n'
+                       '\n'
+                       '     Todd, Laura, and Robert Froemling\n'
+                       '     '+bs.Lstr(resource=self._r+'.allMyFamilyText').evaluate().replace('\n','\n     ')+'\n'
+                       '     '+bs.Lstr(resource=self._r+'.whoeverInventedCoffeeText').evaluate()+'\n'
+                       '\n'
+                       '  '+bs.Lstr(resource=self._r+'.legalText').evaluate()+'\n'
+                       '\n'
+                       '     '+bs.Lstr(resource=self._r+'.softwareBasedOnText').evaluate().replace('${NAME}','the Khronos Group')+'\n'
+                       '\n'
+                       '                                                             www.froemling.net\n')
+
+        # creditsText = (translationNames.split('ZpeedTube')[1]+'\n'
+        #                '\n'
+        # print 'CT IS',repr(creditsText)
+                       
+        # print 'PUT THIS BACK TOGETHER'
+
+
+        txt = creditsText1
+        txt2 = creditsText2
+        #txt = txt.replace("${SOUND_AND_MUSIC}",soundAndMusic)
+        #txt = txt.replace("${FREESOUND_NAMES}",freesoundNames)
+        #txt = txt.replace("${TRANSLATION_NAMES}",translationNames)
+        #txt = txt.replace("${LEGAL_STUFF}","     This software is based in part on the work of the Khronos Group.")
+
+        scale = 0.55
+        self._subWidth = width-80
+        self._subHeight = (bsInternal._getStringHeight(txt,suppressWarning=True)+bsInternal._getStringHeight(txt2,suppressWarning=True))*scale + 40
+        c = self._subContainer = bs.containerWidget(parent=s,size=(self._subWidth,self._subHeight),background=False,claimsLeftRight=False,claimsTab=False)
+
+        t = bs.textWidget(parent=c,
+                          padding=4,
+                          color=(0.7,0.9,0.7,1.0),
+                          scale=scale,
+                          flatness=1.0,
+                          size=(0,0),
+                          position=(0,self._subHeight-20),
+                          hAlign='left',
+                          vAlign='top',
+                          text=txt
+                          )
+        t = bs.textWidget(parent=c,
+                          padding=4,
+                          color=(0.7,0.9,0.7,1.0),
+                          scale=scale,
+                          flatness=1.0,
+                          size=(0,0),
+                          position=(0,self._subHeight-bsInternal._getStringHeight(txt,suppressWarning=True)*scale - 25),
+                          hAlign='left',
+                          vAlign='top',
+                          text=txt2
+                          )
+
+    def _back(self):
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.MainMenuWindow(transition='inLeft').getRootWidget()
@@ -0,0 +1,547 @@
+import bs
+import bsInternal
+import bsUtils
+import copy
+import bsAchievement
+import bsUI
+
+
+class PowerRankingWindow(bsUI.Window):
+    
+    # def __del__(self):
+    #     print '~PowerRankingWindow()'
+        
+    def __init__(self,transition='inRight',modal=False,originWidget=None):
+        #print 'PowerRankingWindow()'
+
+        bsInternal._setAnalyticsScreen('League Window')
+        
+        self._powerRankingInfo = None
+        self._modal = modal
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+        
+        self._width = 1120
+        self._height = 657 if bsUI.gSmallUI else 710 if bsUI.gMedUI else 800
+        self._r = 'coopSelectWindow'
+        self._R = R = bsUtils._getResource(self._r)
+        topExtra = 20 if bsUI.gSmallUI else 0
+
+        self._leagueURLArg = ''
+
+        self._isCurrentSeason = False
+        self._canDoMoreButton = True
+        
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),
+                                              stackOffset=(0,-15) if bsUI.gSmallUI else (0,10) if bsUI.gMedUI else (0,0),transition=transition,
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale = 1.2 if bsUI.gSmallUI else 0.93 if bsUI.gMedUI else 0.8)
+        
+        self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(75,self._height-87-(4 if bsUI.gSmallUI else 0)),size=(120,60),scale=1.2,
+                                               autoSelect=True,
+                                               label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
+                                               buttonType=None if self._modal else 'back',
+                                               onActivateCall=self._back)
+
+        self._titleText = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height - 56),size=(0,0),
+                                         text=bs.Lstr(resource='league.leagueRankText',fallback='coopSelectWindow.powerRankingText'),
+                                         hAlign="center",color=bsUI.gTitleColor,scale=1.4,maxWidth=600,
+                                         vAlign="center")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',position=(75,self._height-87-(2 if bsUI.gSmallUI else 0)),size=(60,55),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=self._titleText,hAlign='left',position=(165,self._height - 56))
+        
+        self._scrollWidth = self._width-130
+        self._scrollHeight = self._height-160
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=(65,70),size=(self._scrollWidth,self._scrollHeight),centerSmallContent=True)
+        bs.widget(edit=self._scrollWidget,autoSelect=True)
+        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=self._backButton,selectedChild=self._backButton)
+
+        self._lastPowerRankingQueryTime = None
+        self._doingPowerRankingQuery = False
+        
+        self._subContainer = None
+        self._subContainerWidth = 800
+        self._subContainerHeight = 483
+        self._powerRankingScoreWidgets = []
+
+        self._seasonPopupMenu = None
+        self._requestedSeason = None
+        self._season = None
+        
+        # take note of our account state; we'll refresh later if this changes
+        self._accountState = bsInternal._getAccountState()
+
+        self._refresh()
+        self._restoreState()
+
+        # if we've got cached power-ranking data already, display it
+        info = bsUI._getCachedPowerRankingInfo()
+        if info is not None:
+            self._updateForPowerRankingInfo(info)
+
+        self._updateTimer = bs.Timer(1000,bs.WeakCall(self._update),timeType='real',repeat=True)
+        self._update(show = True if info is None else False)
+        
+    def _onAchievementsPress(self):
+        # only allow this for all-time or the current season
+        # (we currently don't keep specific achievement data for old seasons)
+        if self._season == 'a' or self._isCurrentSeason:
+            bsUI.AchievementsWindow(position=self._powerRankingAchievementsButton.getScreenSpaceCenter())
+        else:
+            bs.screenMessage(bs.Lstr(resource='achievementsUnavailableForOldSeasonsText',fallback='unavailableText'),
+                             color=(1,0,0))
+            bs.playSound(bs.getSound('error'))
+
+
+    def _onActivityMultPress(self):
+        t = bs.Lstr(resource='coopSelectWindow.activenessAllTimeInfoText' if self._season == 'a' else 'coopSelectWindow.activenessInfoText',
+                    subs=[('${MAX}',str(bsInternal._getAccountMiscReadVal('activenessMax',1.0)))])
+        bsUI.ConfirmWindow(t,cancelButton=False,width=460,height=150,originWidget=self._activityMultButton)
+
+    def _onProMultPress(self):
+        t = bs.Lstr(resource='coopSelectWindow.proMultInfoText',
+                    subs=[('${PERCENT}',str(bsInternal._getAccountMiscReadVal('proPowerRankingBoost',10))),
+                          ('${PRO}',bs.Lstr(resource='store.bombSquadProNameText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]))])
+        bsUI.ConfirmWindow(t,cancelButton=False,width=460,height=130,originWidget=self._proMultButton)
+        
+    def _onTrophiesPress(self):
+        #info = _getCachedPowerRankingInfo()
+        info = self._powerRankingInfo
+        if info is not None:
+            bsUI.TrophiesWindow(position=self._powerRankingTrophiesButton.getScreenSpaceCenter(),data=info)
+        else:
+            bs.playSound(bs.getSound('error'))
+        
+    def _onPowerRankingQueryResponse(self,data):
+        self._doingPowerRankingQuery = False
+        # important: *only* cache this if we requested the current season..
+        if data is not None and data.get('s',None) is None:
+            bsUI._cachePowerRankingInfo(data)
+        # always store a copy locally though (even for other seasons)
+        self._powerRankingInfo = copy.deepcopy(data)
+        self._updateForPowerRankingInfo(data)
+            
+        
+    def _saveState(self):
+        pass
+    
+    def _restoreState(self):
+        pass
+    
+    def _update(self, show=False):
+
+        #print 'updating',bs.getRealTime()
+        curTime = bs.getRealTime()
+
+        # if our account state has changed, refresh our UI
+        accountState = bsInternal._getAccountState()
+        if accountState != self._accountState:
+            self._accountState = accountState
+            self._saveState()
+            self._refresh()
+            
+            # and power ranking too...
+            if not self._doingPowerRankingQuery: self._lastPowerRankingQueryTime = None
+
+        # send off a new power-ranking query if its been long enough or our requested season has changed or whatnot..
+        if not self._doingPowerRankingQuery and (self._lastPowerRankingQueryTime is None
+                                                 #or self._season != self._requestedSeason
+                                                 or curTime-self._lastPowerRankingQueryTime > 30000):
+            try:
+                if show:
+                    bs.textWidget(edit=self._leagueTitleText,text='')
+                    bs.textWidget(edit=self._leagueText,text='')
+                    bs.textWidget(edit=self._leagueNumberText,text='')
+                    bs.textWidget(edit=self._yourPowerRankingText,
+                                  text=bs.Lstr(value='${A}...',subs=[('${A}',bs.Lstr(resource='loadingText'))]))
+                    bs.textWidget(edit=self._toRankedText,text='')
+                    bs.textWidget(edit=self._powerRankingRankText,text='')
+                    bs.textWidget(edit=self._seasonEndsText,text='')
+                    bs.textWidget(edit=self._trophyCountsResetText,text='')
+            except Exception,e:
+                print 'EXC showing pr update msg',e
+                
+            self._lastPowerRankingQueryTime = curTime
+            self._doingPowerRankingQuery = True
+            bsInternal._powerRankingQuery(season=self._requestedSeason,callback=bs.WeakCall(self._onPowerRankingQueryResponse))
+            
+            
+    def _refresh(self):
+        
+        # (re)create the sub-container if need be..
+        if self._subContainer is not None: self._subContainer.delete()
+        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,size=(self._subContainerWidth,self._subContainerHeight),background=False)
+
+        wParent = self._subContainer
+        hBase = 6
+        hSpacing = 200
+        customButtons = []
+        h = 0
+        v = self._subContainerHeight - 20
+        v2 = -2
+
+        v -= 0
+
+        h2 = 80
+        v2 = v - 60
+        countColor = (0.5,1.0,0.5)
+        worthColor = (0.6,0.6,0.65)
+        tallyColor = (0.5,0.6,0.8)
+        spc = 43
+
+        hOffsCount = 50
+        hOffsPts = 140
+        hOffsTally = 150
+        ptsScale = 0.65
+        ptsMaxWidth = 60
+        tallyMaxWidth = 120
+        countMaxWidth = 40
+        hOffsIcons = -29
+        iconScale = 1.4
+        
+        numText = bs.Lstr(resource='numberText').evaluate()
+
+        
+        v2 -= 70
+
+        bs.textWidget(parent=wParent,position=(h2-60,v2+106),size=(0,0),flatness=1.0,shadow=0.0,
+                                               text=bs.Lstr(resource='coopSelectWindow.pointsText'),hAlign='left',vAlign='center',scale=0.8,color=(1,1,1,0.3),maxWidth=200)
+        
+        self._powerRankingAchievementsButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,80),icon=bs.getTexture('achievementsIcon'),
+                                                               autoSelect=True,
+                                                               onActivateCall=bs.WeakCall(self._onAchievementsPress),
+                                                               upWidget=self._backButton,leftWidget=self._backButton,
+                                                               color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
+                                                               label='')
+        
+        self._powerRankingAchievementTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+45),size=(0,0),flatness=1.0,shadow=0.0,
+                                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
+        
+        v2 -= 80
+
+        self._powerRankingTrophiesButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,80),icon=bs.getTexture('medalSilver'),
+                                                           autoSelect=True,
+                                                           onActivateCall=bs.WeakCall(self._onTrophiesPress),
+                                                           leftWidget=self._backButton,
+                                                           color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
+                                                           label='')
+        self._powerRankingTrophiesTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+45),size=(0,0),flatness=1.0,shadow=0.0,
+                                                            text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
+        
+        v2 -= 100
+
+        bs.textWidget(parent=wParent,position=(h2-60,v2+86),size=(0,0),flatness=1.0,shadow=0.0,
+                                               text=bs.Lstr(resource='coopSelectWindow.multipliersText'),hAlign='left',vAlign='center',scale=0.8,color=(1,1,1,0.3),maxWidth=200)
+        
+        self._activityMultButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,60),icon=bs.getTexture('heart'),iconColor=(0.5,0,0.5),
+                                                   label=bs.Lstr(resource='coopSelectWindow.activityText'),
+                                                   autoSelect=True,
+                                                   onActivateCall=bs.WeakCall(self._onActivityMultPress),
+                                                   leftWidget=self._backButton,
+                                                   color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8))
+        
+        self._activityMultText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+40),size=(0,0),flatness=1.0,shadow=0.0,
+                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
+        v2 -= 65
+
+        
+        self._proMultButton = bs.buttonWidget(parent=wParent,position=(h2-60,v2+10),size=(200,60),icon=bs.getTexture('logo'),iconColor=(0.3,0,0.3),
+                                                   label=bs.Lstr(resource='store.bombSquadProNameText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
+                                                   autoSelect=True,
+                                                   onActivateCall=bs.WeakCall(self._onProMultPress),
+                                                   leftWidget=self._backButton,
+                                                   color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8))
+        
+        self._proMultText = bs.textWidget(parent=wParent,position=(h2+hOffsTally,v2+40),size=(0,0),flatness=1.0,shadow=0.0,
+                                               text='-',hAlign='left',vAlign='center',scale=0.8,color=tallyColor,maxWidth=tallyMaxWidth)
+        v2 -= 30
+        
+        v2 -= spc
+        bs.textWidget(parent=wParent,position=(h2+hOffsTally-10-40,v2+35),size=(0,0),flatness=1.0,shadow=0.0,
+                      text=bs.Lstr(resource='finalScoreText'),hAlign='right',vAlign='center',scale=0.9,color=worthColor,maxWidth=150)
+        self._powerRankingTotalText = bs.textWidget(parent=wParent,position=(h2+hOffsTally-40,v2+35),size=(0,0),flatness=1.0,shadow=0.0,
+                                                    text='-',hAlign='left',vAlign='center',scale=0.9,color=tallyColor,maxWidth=tallyMaxWidth)
+
+        self._seasonShowText = bs.textWidget(parent=wParent,position=(390-15,v-20),size=(0,0),color=(0.6,0.6,0.7),maxWidth=200,
+                                              text=bs.Lstr(resource='showText'),hAlign='right',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
+        
+        self._leagueTitleText = bs.textWidget(parent=wParent,position=(470,v-97),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
+                                              text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
+
+        # self._leagueButton = bs.buttonWidget(parent=wParent,position=(474-135,v-190),size=(270,130),label='',buttonType='square',
+        #                                      autoSelect=True,color=(0.5,0.5,0.6))
+
+        self._leagueTextScale = 1.8
+        self._leagueTextMaxWidth = 210
+        self._leagueText = bs.textWidget(parent=wParent,position=(470,v-140),size=(0,0),color=(1,1,1),maxWidth=self._leagueTextMaxWidth,
+                                         text='-',hAlign='center',vAlign='center',scale=self._leagueTextScale,shadow=1.0,flatness=1.0)
+        self._leagueNumberBasePos = (470,v-140)
+        self._leagueNumberText = bs.textWidget(parent=wParent,position=(470,v-140),size=(0,0),color=(1,1,1),maxWidth=100,
+                                               text='',hAlign='left',vAlign='center',scale=0.8,shadow=1.0,flatness=1.0)
+        
+        self._yourPowerRankingText = bs.textWidget(parent=wParent,position=(470,v-142-70),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
+                                                   text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
+
+        self._toRankedText = bs.textWidget(parent=wParent,position=(470,v-250-70),size=(0,0),color=(0.6,0.6,0.7),maxWidth=230,
+                                           text='',hAlign='center',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
+        
+        self._powerRankingRankText = bs.textWidget(parent=wParent,position=(473,v-210-70),size=(0,0),big=False,
+                                                   text='-',hAlign='center',vAlign='center',scale=1.0)
+
+        self._seasonEndsText = bs.textWidget(parent=wParent,position=(470,v-380),size=(0,0),color=(0.6,0.6,0.6),maxWidth=230,
+                                         text='',hAlign='center',vAlign='center',scale=0.9,shadow=0,flatness=1.0)
+        self._trophyCountsResetText = bs.textWidget(parent=wParent,position=(470,v-410),size=(0,0),color=(0.5,0.5,0.5),maxWidth=230,
+                                                    text=('Trophy counts will reset next season.'),hAlign='center',vAlign='center',scale=0.8,shadow=0,flatness=1.0)
+        
+        # for w in self._powerRankingScoreWidgets: w.delete()
+        self._powerRankingScoreWidgets = []
+
+        self._powerRankingScoreV = v - 56
+        
+        h = 707
+        v -= 451
+
+        self._seeMoreButton = bs.buttonWidget(parent=wParent,label=self._R.seeMoreText,position=(h,v),
+                                              color=(0.5,0.5,0.6),textColor=(0.7,0.7,0.8),
+                                              size=(230,60),autoSelect=True,
+                                              onActivateCall=bs.WeakCall(self._onMorePress))
+        #bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._proMultButton)
+        
+        # bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._seasonPopupMenu.getButtonWidget())
+        # bs.widget(edit=self._seasonPopupMenu.getButtonWidget(),upWidget=self._backButton)
+        # bs.widget(edit=self._backButton,downWidget=self._powerRankingAchievementsButton,rightWidget=self._seasonPopupMenu.getButtonWidget())
+
+    def _onMorePress(self):
+        if not self._canDoMoreButton:
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource='unavailableText'),color=(1,0,0))
+            return
+        seasonStr = '' if self._season is None else '&season='+('all_time' if self._season == 'a' else self._season)
+        if self._leagueURLArg != '': leagueStr = '&league='+self._leagueURLArg
+        else: leagueStr = ''
+        bs.openURL(bsInternal._getServerAddress()+'/highscores?list=powerRankings&v=2'+leagueStr+seasonStr,aa='player')
+        
+    def _updateForPowerRankingInfo(self,data):
+
+        if not self._rootWidget.exists(): return
+        
+        inTop = True if (data is not None and data['rank'] is not None) else False
+        
+        eqText = self._R.powerRankingPointsEqualsText
+        ptsText = self._R.powerRankingPointsText
+        numText = bs.Lstr(resource='numberText').evaluate()
+
+        doPercent = False
+        finishedSeasonUnranked = False
+        self._canDoMoreButton = True
+        if bsInternal._getAccountState() != 'SIGNED_IN': statusText = '('+bs.Lstr(resource='notSignedInText').evaluate()+')'
+        elif inTop: statusText = numText.replace('${NUMBER}',str(data['rank']))
+        elif data is not None:
+            try:
+                # print 'hAVE',len(data['scores'])
+                # handle old seasons where we didn't wind up ranked at the end..
+                if len(data['scores']) == 0:
+                    statusText = self._R.powerRankingFinishedSeasonUnrankedText
+                    extraText = ''
+                    finishedSeasonUnranked = True
+                    self._canDoMoreButton = False
+                else:
+                    ourPoints = bsUI._getPowerRankingPoints(data)
+                    # progress = 0.0 if len(data['scores']) == 0 else float(ourPoints)/max(1,data['scores'][-1][1])
+                    progress = float(ourPoints)/max(1,data['scores'][-1][1])
+                    statusText = str(int(progress*100.0))+'%'
+                    extraText = '\n'+self._R.powerRankingPointsToRankedText.replace('${CURRENT}',str(ourPoints)).replace('${REMAINING}',str(data['scores'][-1][1]))
+                    doPercent = True
+            except Exception:
+                bs.printException('error updating power ranking')
+                statusText = self._R.powerRankingNotInTopText.replace('${NUMBER}',str(data['listSize']))
+                extraText = ''
+        else: statusText = '-'
+
+        #print 'UPDATING FOR SEASON',(data['s'] if data is not None else None)
+        self._season = data['s'] if data is not None else None
+        #print 'UPDATING FOR SEASON',self._season
+        
+        v = self._subContainerHeight - 20
+        popupWasSelected = False
+        if self._seasonPopupMenu is not None:
+            b = self._seasonPopupMenu.getButtonWidget()
+            if self._subContainer.getSelectedChild() == b: popupWasSelected = True
+            b.delete()
+        seasonChoices = []
+        seasonChoicesDisplay = []
+        # seasonText = bs.Lstr(resource='league.seasonText').evaluate()
+        didFirst = False
+        self._isCurrentSeason = False
+        if data is not None:
+            # build our list of seasons we have available
+            for s in data['sl']:
+                seasonChoices.append(s)
+                if s != 'a' and not didFirst:
+                    seasonChoicesDisplay.append(bs.Lstr(resource='league.currentSeasonText',subs=[('${NUMBER}',s)]))
+                    didFirst = True
+                    # if we either did not specify a season or specified the first, we're looking at the current..
+                    if self._season in[s,None]:
+                        self._isCurrentSeason = True
+                elif s == 'a':
+                    seasonChoicesDisplay.append(bs.Lstr(resource='league.allTimeText'))
+                else:
+                    seasonChoicesDisplay.append(bs.Lstr(resource='league.seasonText',subs=[('${NUMBER}',s)]))
+            self._seasonPopupMenu = bsUI.PopupMenu(parent=self._subContainer,position=(390,v-45),width=150,buttonSize=(200,50),
+                                              choices=seasonChoices,
+                                              # choices=['Current Season (2)','Season 1',
+                                              #          'Season A','Season B','Season C','Season D','Season E','Season F','Season G','All Time'],
+                                              onValueChangeCall=bs.WeakCall(self._onSeasonChange),
+                                              choicesDisplay=seasonChoicesDisplay,
+                                              currentChoice=self._season)
+            if popupWasSelected: bs.containerWidget(edit=self._subContainer,selectedChild=self._seasonPopupMenu.getButtonWidget())
+            #bs.widget(edit=self._seeMoreButton,showBufferBottom=100,upWidget=self._seasonPopupMenu.getButtonWidget())
+            bs.widget(edit=self._seeMoreButton,showBufferBottom=100)
+            bs.widget(edit=self._seasonPopupMenu.getButtonWidget(),upWidget=self._backButton)
+            bs.widget(edit=self._backButton,downWidget=self._powerRankingAchievementsButton,rightWidget=self._seasonPopupMenu.getButtonWidget())
+
+        #print 'IS CURRENT?',isCurrentSeason
+            
+        bs.textWidget(edit=self._leagueTitleText,text='' if self._season == 'a' else bs.Lstr(resource='league.leagueText'))
+        
+        if data is None:
+            lName = ''
+            lNum = ''
+            lColor = (1,1,1)
+            self._leagueURLArg = ''
+        elif self._season == 'a':
+            lName = bs.Lstr(resource='league.allTimeText')
+            lNum = ''
+            lColor = (1,1,1)
+            self._leagueURLArg = ''
+        else:
+            lNum = ('['+str(data['l']['i'])+']') if data['l']['i2'] else ''
+            lName = bs.Lstr(translate=('leagueNames',data['l']['n'])).evaluate()
+            lColor = data['l']['c']
+            self._leagueURLArg = (data['l']['n']+'_'+str(data['l']['i'])).lower()
+
+        if data is None or self._season == 'a' or data['se'] is None:
+            daysToEnd = 0
+            minutesToEnd = 0
+            toEndString = ''
+            showSeasonEnd = False
+        else:
+            showSeasonEnd = True
+            daysToEnd = data['se'][0]
+            minutesToEnd = data['se'][1]
+            if daysToEnd > 0: toEndString = bs.Lstr(resource='league.seasonEndsDaysText',subs=[('${NUMBER}',str(daysToEnd))])
+            elif daysToEnd == 0 and minutesToEnd >= 60: toEndString = bs.Lstr(resource='league.seasonEndsHoursText',subs=[('${NUMBER}',str(minutesToEnd/60))])
+            elif daysToEnd == 0 and minutesToEnd >= 0: toEndString = bs.Lstr(resource='league.seasonEndsMinutesText',subs=[('${NUMBER}',str(minutesToEnd))])
+            else: toEndString = bs.Lstr(resource='league.seasonEndedDaysAgoText',subs=[('${NUMBER}',str(-(daysToEnd+1)))])
+            
+        bs.textWidget(edit=self._seasonEndsText,text=toEndString)
+        bs.textWidget(edit=self._trophyCountsResetText,text=bs.Lstr(resource='league.trophyCountsResetText') if self._isCurrentSeason and showSeasonEnd else '')
+        
+        bs.textWidget(edit=self._leagueText,text=lName,color=lColor)
+        lTextWidth = min(self._leagueTextMaxWidth,bsInternal._getStringWidth(lName,suppressWarning=True)*self._leagueTextScale)
+        bs.textWidget(edit=self._leagueNumberText,text=lNum,color=lColor,
+                      position=(self._leagueNumberBasePos[0]+lTextWidth*0.5+8,self._leagueNumberBasePos[1]+10))
+        
+        bs.textWidget(edit=self._toRankedText,
+                      text=bs.Lstr(resource='coopSelectWindow.toRankedText').evaluate()+''+extraText if doPercent else '')
+
+        bs.textWidget(edit=self._yourPowerRankingText,
+                      text=bs.Lstr(resource='rankText',fallback='coopSelectWindow.yourPowerRankingText') if (not doPercent) else '')
+        
+        bs.textWidget(edit=self._powerRankingRankText,
+                      position=(473,v-70-(170 if doPercent else 220)),
+                      text=statusText,big=True if (inTop or doPercent) else False,
+                      scale=3.0 if (inTop or doPercent) else 0.7 if finishedSeasonUnranked else 1.0)
+
+        if data is None or data['act'] is None:
+            bs.buttonWidget(edit=self._activityMultButton,textColor=(0.7,0.7,0.8,0.5),iconColor=(0.5,0,0.5,0.3))
+            bs.textWidget(edit=self._activityMultText,text='     -')
+        else:
+            bs.buttonWidget(edit=self._activityMultButton,textColor=(0.7,0.7,0.8,1.0),iconColor=(0.5,0,0.5,1.0))
+            bs.textWidget(edit=self._activityMultText,text='x '+('%.2f' % data['act']))
+
+        #havePro = bsUtils._havePro()
+        havePro = False if data is None else data['p']
+        proMult = 1.0 + float(bsInternal._getAccountMiscReadVal('proPowerRankingBoost',0.0))*0.01
+        bs.textWidget(edit=self._proMultText,text='     -' if (data is None or not havePro) else 'x '+('%.2f' % proMult))
+        bs.buttonWidget(edit=self._proMultButton,
+                        textColor=(0.7,0.7,0.8,(1.0 if havePro else 0.5)),
+                        iconColor=(0.5, 0, 0.5) if havePro else (0.5, 0, 0.5, 0.2))
+        bs.buttonWidget(edit=self._powerRankingAchievementsButton,label=('' if data is None else (str(data['a'])+' '))+bs.Lstr(resource='achievementsText').evaluate())
+
+        # for the achievement value, use the number they gave us for non-current seasons; otherwise calc our own
+        totalAchValue = 0
+        for ach in bsAchievement.gAchievements:
+            if ach.isComplete(): totalAchValue += ach.getPowerRankingValue()
+        if self._season != 'a' and not self._isCurrentSeason:
+            if data is not None and 'at' in data: totalAchValue = data['at']
+            
+        bs.textWidget(edit=self._powerRankingAchievementTotalText,text='-' if data is None else ('+ '+ptsText.replace('${NUMBER}',str(totalAchValue))))
+
+        totalTrophiesCount = bsUI._getPowerRankingPoints(data,'trophyCount')
+        totalTrophiesValue = bsUI._getPowerRankingPoints(data,'trophies')
+        bs.buttonWidget(edit=self._powerRankingTrophiesButton,label=('' if data is None else (str(totalTrophiesCount)+' '))+bs.Lstr(resource='trophiesText').evaluate())
+        bs.textWidget(edit=self._powerRankingTrophiesTotalText,text='-' if data is None else ('+ '+ptsText.replace('${NUMBER}',str(totalTrophiesValue))))
+        
+        
+        bs.textWidget(edit=self._powerRankingTotalText,text='-' if data is None else eqText.replace('${NUMBER}',str(bsUI._getPowerRankingPoints(data))))
+        for w in self._powerRankingScoreWidgets: w.delete()
+        self._powerRankingScoreWidgets = []
+
+        scores = data['scores'] if data is not None else []
+
+        tallyColor = (0.5,0.6,0.8)
+        wParent = self._subContainer
+        v2 = self._powerRankingScoreV
+        
+        for s in scores:
+            h2 = 680
+            isUs = s[3]
+            self._powerRankingScoreWidgets.append(bs.textWidget(parent=wParent,position=(h2-20,v2),size=(0,0),
+                                                                color=(1,1,1) if isUs else (0.6,0.6,0.7),
+                                                                maxWidth=40,flatness=1.0,shadow=0.0,
+                                                                text=numText.replace('${NUMBER}',str(s[0])),hAlign='right',vAlign='center',scale=0.5))
+            self._powerRankingScoreWidgets.append(bs.textWidget(parent=wParent,position=(h2+20,v2),size=(0,0),
+                                                                color=(1,1,1) if isUs else tallyColor,
+                                                                maxWidth=60,text=str(s[1]),flatness=1.0,shadow=0.0,
+                                                                hAlign='center',vAlign='center',scale=0.7))
+            t = bs.textWidget(parent=wParent,position=(h2+60,v2-(28*0.5)/0.9),size=(210/0.9,28),
+                              color=(1,1,1) if isUs else (0.6,0.6,0.6),
+                              maxWidth=210,flatness=1.0,shadow=0.0,
+                              autoSelect=True,selectable=True,clickActivate=True,
+                              text=s[2],hAlign='left',vAlign='center',scale=0.9)
+            self._powerRankingScoreWidgets.append(t)
+            bs.textWidget(edit=t,onActivateCall=bs.Call(self._showAccountInfo,s[4],t))
+            bs.widget(edit=t,leftWidget=self._seasonPopupMenu.getButtonWidget())
+            v2 -= 28
+        
+    def _showAccountInfo(self,accountID,textWidget):
+        bs.playSound(bs.getSound('swish'))
+        bsUI.AccountInfoWindow(accountID=accountID,
+                          position=textWidget.getScreenSpaceCenter())
+        
+        
+    def _onSeasonChange(self,value):
+        #print 'SEASON CHANGED TO',value
+        self._requestedSeason = value
+        self._lastPowerRankingQueryTime = None # make sure we update asap
+        self._update(show=True)
+        
+    def _saveState(self):
+        pass
+    
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        if not self._modal:
+            bsUI.uiGlobals['mainMenuWindow'] = bsUI.CoopWindow(transition='inLeft').getRootWidget()
@@ -0,0 +1,1880 @@
+import bs
+import bsInternal
+import bsUtils
+import bsServerData
+import weakref
+import bsUI
+
+
+class ControllersWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight',originWidget=None):
+        
+        self._haveSelectedChild = False
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+
+        self._r = 'configControllersWindow'
+
+        env = bs.getEnvironment()
+        
+        ua = env['userAgentString']
+        interfaceType = env['interfaceType']
+        #isOuya = bsInternal._isOuyaBuild()
+        isOuya = bsInternal._isRunningOnOuya()
+        isFantasia = bsInternal._isRunningOnFireTV()
+
+        spacing = 50
+        buttonWidth = 350
+
+        width = 460
+        height = 135
+
+        spaceHeight = spacing*0.3
+
+        showGamepads = False
+        platform = env['platform']
+        subplatform = env['subplatform']
+        if platform == 'linux' or (platform == 'windows' and (subplatform != 'oculus' or env['vrMode'] == False)) or platform == 'android' or platform == 'mac':
+            showGamepads = True
+            height += spacing
+
+        showTouch = False
+        if bsInternal._haveTouchScreenInput():
+            showTouch = True
+            height += spacing
+
+        showSpace1 = False
+        if showGamepads or showTouch:
+            showSpace1 = True
+            height += spaceHeight
+
+        showKeyboards = False
+        if interfaceType == 'large':
+            showKeyboards = True
+            height += spacing*2
+
+        showSpace2 = False
+        if showKeyboards:
+            showSpace2 = True
+            height += spaceHeight
+
+        showRemote = False
+        if True:
+            showRemote = True
+            height += spacing
+
+        showPS3 = False
+        if 'Mac' in ua or isOuya:
+            showPS3 = True
+            height += spacing
+
+        show360 = False
+        if 'Mac' in ua or isOuya or isFantasia:
+            show360 = True
+            height += spacing
+
+        showMacWiimote = False
+        if 'Mac' in ua:
+            showMacWiimote = True
+            height += spacing
+
+        # show option to disable xinput on windows (aside from rift vr mode)
+        showXInputToggle = False
+        if platform == 'windows' and (subplatform != 'oculus' or env['vrMode'] == False):
+            showXInputToggle = True
+
+        if showXInputToggle:
+            height += spacing
+            
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,scaleOriginStackOffset=scaleOrigin,
+                                              scale=2.2 if bsUI.gSmallUI else 1.5 if bsUI.gMedUI else 1.0)
+        self._backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-60),size=(140,65),scale=0.8,textScale=1.2,autoSelect=True,
+                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+        # need these vars to exist even if the buttons dont
+        self._gamePadsButton = self._touchButton = self._keyboardButton = self._keyboard2Button = self._iDevicesButton = self._ps3Button = self._xbox360Button = self._wiimotesButton = -1
+
+        t = bs.textWidget(parent=self._rootWidget,position=(0,height-49),size=(width,25),
+                          # text=R.titleText,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="top")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(100,height-48))
+        
+        v = height - 75
+        v -= spacing
+
+        
+        if showTouch:
+            self._touchButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2,v),size=(buttonWidth,43),autoSelect=True,
+                                                    # label=R.configureTouchText,
+                                                    label=bs.Lstr(resource=self._r+'.configureTouchText'),
+                                                    onActivateCall=self._doTouchscreen)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._touchButton)
+                bs.widget(edit=self._backButton,downWidget=self._touchButton)
+                self._haveSelectedChild = True
+            v -= spacing
+
+        if showGamepads:
+            self._gamePadsButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-7,v),size=(buttonWidth,43),autoSelect=True,
+                                                       # label=R.configureControllersText,
+                                                       label=bs.Lstr(resource=self._r+'.configureControllersText'),
+                                                       onActivateCall=self._doGamepads)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._gamePadsButton)
+                bs.widget(edit=self._backButton,downWidget=self._gamePadsButton)
+                self._haveSelectedChild = True
+            v -= spacing
+        else: self._gamePadsButton = None
+
+        if showSpace1: v -= spaceHeight
+
+        if showKeyboards:
+            self._keyboardButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
+                                                       # label=R.configureKeyboardText,
+                                                       label=bs.Lstr(resource=self._r+'.configureKeyboardText'),
+                                                       onActivateCall=self._configKeyboard)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._keyboardButton)
+                bs.widget(edit=self._backButton,downWidget=self._keyboardButton)
+                self._haveSelectedChild = True
+            v -= spacing
+            self._keyboard2Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-3,v),size=(buttonWidth,43),autoSelect=True,
+                                                        # label=R.configureKeyboard2Text,
+                                                        label=bs.Lstr(resource=self._r+'.configureKeyboard2Text'),
+                                                        onActivateCall=self._configKeyboard2)
+            v -= spacing
+        if showSpace2: v -= spaceHeight
+        if showRemote:
+            self._iDevicesButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-5,v),size=(buttonWidth,43),autoSelect=True,
+                                                       # label=R.configureMobileText,
+                                                       label=bs.Lstr(resource=self._r+'.configureMobileText'),
+                                                       onActivateCall=self._doMobileDevices)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._iDevicesButton)
+                bs.widget(edit=self._backButton,downWidget=self._iDevicesButton)
+                self._haveSelectedChild = True
+            v -= spacing
+        if showPS3:
+            self._ps3Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
+                                # label=R.ps3Text,
+                                label=bs.Lstr(resource=self._r+'.ps3Text'),
+                                onActivateCall=self._doPS3Controllers)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            v -= spacing
+        if show360:
+            self._xbox360Button = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2-1,v),size=(buttonWidth,43),autoSelect=True,
+                                # label=R.xbox360Text,
+                                label=bs.Lstr(resource=self._r+'.xbox360Text'),
+                                onActivateCall=self._do360Controllers)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            v -= spacing
+        if showMacWiimote:
+            self._wiimotesButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-buttonWidth)/2+5,v),size=(buttonWidth,43),autoSelect=True,
+                                # label=R.wiimotesText,
+                                label=bs.Lstr(resource=self._r+'.wiimotesText'),
+                                onActivateCall=self._doWiimotes)
+            if bsUI.gToolbars:
+                bs.widget(edit=b,rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            v -= spacing
+
+        if showXInputToggle:
+            def doToggle(value):
+                bs.screenMessage(bs.Lstr(resource='settingsWindowAdvanced.mustRestartText'),color=(1,1,0))
+                bs.playSound(bs.getSound('gunCocking'))
+                bsInternal._setLowLevelConfigValue('enablexinput',not value)
+            bs.checkBoxWidget(parent=self._rootWidget, position=(100, v+3), size=(120, 30), value=not bsInternal._getLowLevelConfigValue('enablexinput',1),
+                              maxWidth=200, onValueChangeCall=doToggle,
+                              text=bs.Lstr(resource='disableXInputText'),
+                              autoSelect=True)
+            bs.textWidget(parent=self._rootWidget, position=(width*0.5,v-5), size=(0, 0), text=bs.Lstr(resource='disableXInputDescriptionText'),
+                          scale=0.5, hAlign='center',vAlign='center', color=bsUI.gInfoTextColor, maxWidth=width*0.8)
+            v -= spacing
+            
+        self._restoreState()
+
+    def _configKeyboard(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = ConfigKeyboardWindow(bsInternal._getInputDevice('Keyboard','#1')).getRootWidget()
+
+    def _configKeyboard2(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = ConfigKeyboardWindow(bsInternal._getInputDevice('Keyboard','#2')).getRootWidget()
+
+    def _doMobileDevices(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.ConnectMobileDevicesWindow().getRootWidget()
+
+    def _doPS3Controllers(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.ConnectPS3ControllersWindow().getRootWidget()
+
+    def _do360Controllers(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.Connect360ControllersWindow().getRootWidget()
+
+    def _doWiimotes(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = ConfigureWiiRemotesWindow().getRootWidget()
+
+    def _doGamepads(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = ConfigGamePadWindow().getRootWidget()
+
+    def _doTouchscreen(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = ConfigTouchscreenWindow().getRootWidget()
+
+    def _saveState(self):
+        sel = self._rootWidget.getSelectedChild()
+        if sel == self._gamePadsButton: selName = 'GamePads'
+        elif sel == self._touchButton: selName = 'Touch'
+        elif sel == self._keyboardButton: selName = 'Keyboard'
+        elif sel == self._keyboard2Button: selName = 'Keyboard2'
+        elif sel == self._iDevicesButton: selName = 'iDevices'
+        elif sel == self._ps3Button: selName = 'PS3'
+        elif sel == self._xbox360Button: selName = 'xbox360'
+        elif sel == self._wiimotesButton: selName = 'Wiimotes'
+        else: selName = 'Back'
+        bsUI.gWindowStates[self.__class__.__name__] = selName
+
+    def _restoreState(self):
+        try: selName = bsUI.gWindowStates[self.__class__.__name__]
+        except Exception: selName = None
+        if selName == 'GamePads': sel = self._gamePadsButton
+        elif selName == 'Touch': sel = self._touchButton
+        elif selName == 'Keyboard': sel = self._keyboardButton
+        elif selName == 'Keyboard2': sel = self._keyboard2Button
+        elif selName == 'iDevices': sel = self._iDevicesButton
+        elif selName == 'PS3': sel = self._ps3Button
+        elif selName == 'xbox360': sel = self._xbox360Button
+        elif selName == 'Wiimotes': sel = self._wiimotesButton
+        elif selName == 'Back': sel = self._backButton
+        else: sel = self._gamePadsButton if self._gamePadsButton is not None else self._backButton
+        bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+
+
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow']=bsUI.SettingsWindow(transition='inLeft').getRootWidget()
+
+
+class ConfigureWiiRemotesWindow(bsUI.Window):
+
+    def __init__(self):
+
+        self._r = 'wiimoteSetupWindow'
+        width = 600
+        height = 480
+        spacing = 40
+
+        self._rootWidget = bs.containerWidget(size=(width,height),transition='inRight')
+
+        b = bs.buttonWidget(parent=self._rootWidget,position=(55,height-50),size=(120,60),scale=0.8,autoSelect=True,
+                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
+
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,height-28),size=(0,0),
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          maxWidth=270,
+                          color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="center")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(110,height-26))
+        
+        v = height - 60
+        v -= spacing
+        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v-80),size=(0,0),
+                          color=(0.7,0.9,0.7,1.0),
+                          scale=0.75,
+                          text=bs.Lstr(resource=self._r+'.macInstructionsText'),
+                          maxWidth=width*0.95,
+                          maxHeight=height*0.5,
+                          hAlign="center",vAlign="center")
+        v -= 230
+        buttonWidth = 200
+        v -= 30
+        b = bs.buttonWidget(parent=self._rootWidget,position=(width/2-buttonWidth/2,v+1),autoSelect=True,
+                            size=(buttonWidth,50),
+                            label=bs.Lstr(resource=self._r+'.listenText'),
+                            onActivateCall=bsUI.WiimoteListenWindow)
+        bs.containerWidget(edit=self._rootWidget,startButton=b)
+        v -= spacing * 1.1
+        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v+10),size=(0,0),
+                          color=(0.7,0.9,0.7,1.0),
+                          scale=0.8,
+                          maxWidth=width*0.95,
+                          text=bs.Lstr(resource=self._r+'.thanksText'),
+                          hAlign="center",vAlign="center")
+        v -= 30
+        thisButtonWidth = 200
+        b = bs.buttonWidget(parent=self._rootWidget,position=(width/2-thisButtonWidth/2,v-14),
+                            color=(0.45,0.4,0.5),autoSelect=True,
+                            size=(thisButtonWidth,15),
+                            label=bs.Lstr(resource=self._r+'.copyrightText'),
+                            textColor=(0.55,0.5,0.6),
+                            textScale=0.6,
+                            onActivateCall=bsUI.WiimoteLicenseWindow)
+
+    def _back(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
+
+
+class ConfigGamePadWindow(bsUI.Window):
+
+    def __init__(self):
+        width = 480
+        height = 170
+        spacing = 40
+        self._r = 'configGamepadSelectWindow'
+        self._rootWidget = bs.containerWidget(scale=2.3 if bsUI.gSmallUI else 1.5 if bsUI.gMedUI else 1.0,
+                                              size=(width,height),transition='inRight')
+        b = bs.buttonWidget(parent=self._rootWidget,position=(20,height-60),size=(130,60),
+                            label=bs.Lstr(resource='backText'),buttonType='back',scale=0.8,
+                            onActivateCall=self._back)
+        # lets not have anything selected by default; its misleading looking for the controller getting configured..
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b,selectedChild=0)
+        t = bs.textWidget(parent=self._rootWidget,position=(20,height-50),size=(width,25),
+                          #text=R.titleText,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          maxWidth=250,color=bsUI.gTitleColor,hAlign="center",vAlign="center")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(83,height-50))
+        
+        v = height - 60
+        v -= spacing
+        t = bs.textWidget(parent=self._rootWidget,position=(15,v),size=(width-30,30),
+                          scale=0.8,
+                          # text=R.pressAnyButtonText,
+                          text=bs.Lstr(resource=self._r+'.pressAnyButtonText'),
+                          maxWidth=width*0.95,color=bsUI.gInfoTextColor,hAlign="center",vAlign="top")
+        v -= spacing * 1.24
+        ua = bs.getEnvironment()['userAgentString']
+        if 'android' in ua and not bsInternal._isOuyaBuild() and not bsInternal._isRunningOnFireTV():
+            t = bs.textWidget(parent=self._rootWidget,position=(15,v),size=(width-30,30),
+                              scale=0.46,
+                              # text=R.androidNoteText,
+                              text=bs.Lstr(resource=self._r+'.androidNoteText'),
+                              maxWidth=width*0.95,
+                              color=(0.7,0.9,0.7,0.5),
+                              hAlign="center",vAlign="top")
+
+        bsInternal._captureGamePadInput(bsUI.gamePadConfigureCallback)
+
+    def _back(self):
+        bsInternal._releaseGamePadInput()
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
+
+
+class ConfigTouchscreenWindow(bsUI.Window):
+
+    def __del__(self):
+        # note - this happens in 'back' too just to get it going earlier..
+        # (but we do it here too in case somehow the window is closed by another means)
+        bsInternal._setTouchscreenEditing(False)
+
+    def __init__(self):
+
+        self._width = 650
+        self._height = 380
+        self._spacing = 40
+        self._r = 'configTouchscreenWindow'
+
+        bsInternal._setTouchscreenEditing(True)
+
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition='inRight',
+                                              scale=1.9 if bsUI.gSmallUI else 1.55 if bsUI.gMedUI else 1.2)
+
+        b = bs.buttonWidget(parent=self._rootWidget,position=(55,self._height-60),size=(120,60),
+                            label=bs.Lstr(resource='backText'),buttonType='back',scale=0.8,
+                            onActivateCall=self._back)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+        t = bs.textWidget(parent=self._rootWidget,position=(25,self._height-50),size=(self._width,25),
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          color=bsUI.gTitleColor,maxWidth=280,
+                          hAlign="center",vAlign="center")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(110,self._height-49))
+        
+
+        self._scrollWidth = self._width - 100
+        self._scrollHeight = self._height - 110
+        self._subWidth = self._scrollWidth-20
+        self._subHeight = 360
+
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,
+                                             position=((self._width-self._scrollWidth)*0.5,self._height - 65-self._scrollHeight),
+                                             size=(self._scrollWidth,self._scrollHeight))
+        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,
+                                                    size=(self._subWidth,self._subHeight),
+                                                    background=False)
+        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+        bs.containerWidget(edit=self._subContainer,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+
+        self._buildGui()
+
+    def _buildGui(self):
+
+        # clear anything already there
+        #children = bs.getWidgetChildren(self._rootWidget)
+        children = self._subContainer.getChildren()
+        for c in children: c.delete()
+        
+        h = 30
+        v = self._subHeight - 85
+
+        cl = (0.8,0.8,0.8,1.0)
+        cl2 = (0.8,0.8,0.8)
+
+        bs.textWidget(parent=self._subContainer,position=(-10,v+43),size=(self._subWidth,25),
+                      text=bs.Lstr(resource=self._r+'.swipeInfoText'),
+                      flatness=1.0,
+                      color=(0,0.9,0.1,0.7),maxWidth=self._subWidth*0.9,
+                      scale=0.55,hAlign="center",vAlign="center")
+
+        try: curVal = bs.getConfig()['Touch Movement Control Type']
+        except Exception: curVal = 'swipe'
+        bs.textWidget(parent=self._subContainer,position=(h,v-2),size=(0,30),
+                      text=bs.Lstr(resource=self._r+'.movementText'),
+                      maxWidth=190,color=cl,vAlign='center')
+        c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+220,v),size=(170,30),
+                               text=bs.Lstr(resource=self._r+'.joystickText'),
+                               maxWidth=100,textColor=cl2,scale=0.9)
+        c2 = bs.checkBoxWidget(parent=self._subContainer,position=(h+357,v),size=(170,30),
+                               text=bs.Lstr(resource=self._r+'.swipeText'),
+                               maxWidth=100,textColor=cl2,value=0,scale=0.9)
+        bsUI._makeRadioGroup((c1,c2),('joystick','swipe'),curVal,self._movementChanged)
+
+        v -= 50
+        bsUI.configTextBox(parent=self._subContainer,position=(h,v),xOffset=65,name="Touch Controls Scale Movement",
+                      displayName=bs.Lstr(resource=self._r+'.movementControlScaleText'),
+                      type="float",changeSound=False,minVal=0.1,maxVal=4.0,increment=0.1)
+        
+        v -= 50
+
+        try: curVal = bs.getConfig()['Touch Action Control Type']
+        except Exception: curVal = 'buttons'
+        bs.textWidget(parent=self._subContainer,position=(h,v-2),size=(0,30),
+                      text=bs.Lstr(resource=self._r+'.actionsText'),
+                      maxWidth=190,color=cl,vAlign='center')
+        c1 = bs.checkBoxWidget(parent=self._subContainer,position=(h+220,v),size=(170,30),
+                               text=bs.Lstr(resource=self._r+'.buttonsText'),
+                               maxWidth=100,textColor=cl2,scale=0.9)
+        c2 = bs.checkBoxWidget(parent=self._subContainer,position=(h+357,v),size=(170,30),
+                               text=bs.Lstr(resource=self._r+'.swipeText'),
+                               maxWidth=100,textColor=cl2,scale=0.9)
+        bsUI._makeRadioGroup((c1,c2),('buttons','swipe'),curVal,self._actionsChanged)
+
+
+        v -= 50
+        bsUI.configTextBox(parent=self._subContainer,position=(h,v),xOffset=65,name="Touch Controls Scale Actions",
+                      displayName=bs.Lstr(resource=self._r+'.actionControlScaleText'),
+                      type="float",changeSound=False,minVal=0.1,maxVal=4.0,increment=0.1)
+
+        v -= 50
+        bsUI.configCheckBox(parent=self._subContainer,position=(h,v),
+                       size=(400,30),maxWidth=400,name="Touch Controls Swipe Hidden",
+                       displayName=bs.Lstr(resource=self._r+'.swipeControlsHiddenText'))
+        
+        v -= 65
+
+        b = bs.buttonWidget(parent=self._subContainer,position=(self._subWidth*0.5-70,v),size=(170,60),
+                            label=bs.Lstr(resource=self._r+'.resetText'),
+                            scale=0.75,onActivateCall=self._reset)
+
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,38),size=(0,0),hAlign='center',
+                          text=bs.Lstr(resource=self._r+'.dragControlsText'),
+                          maxWidth=self._width*0.8,
+                          scale=0.65,color=(1,1,1,0.4))
+        
+
+    def _actionsChanged(self,v):
+        bs.getConfig()['Touch Action Control Type'] = v
+        bs.writeConfig()
+        bs.applySettings()
+
+    def _movementChanged(self,v):
+        bs.getConfig()['Touch Movement Control Type'] = v
+        bs.writeConfig()
+        bs.applySettings()
+
+    def _reset(self):
+        bsConfig = bs.getConfig()
+        prefs = ['Touch Movement Control Type',
+                 'Touch Action Control Type',
+                 'Touch Controls Scale',
+                 'Touch Controls Scale Movement',
+                 'Touch Controls Scale Actions',
+                 'Touch Controls Swipe Hidden',
+                 'Touch DPad X',
+                 'Touch DPad Y',
+                 'Touch Buttons X',
+                 'Touch Buttons Y']
+        for p in prefs:
+            if p in bsConfig:
+                del(bsConfig[p])
+
+        bs.writeConfig()
+        bs.applySettings()
+
+        bs.realTimer(0,self._buildGui)
+
+
+    def _back(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
+        bsInternal._setTouchscreenEditing(False)
+
+
+class ConfigKeyboardWindow(bsUI.Window):
+
+
+    def __init__(self,c,transition='inRight'):
+
+        self._r = 'configKeyboardWindow'
+        self._input = c
+        self._name = self._input.getName()
+        self._uniqueID = self._input.getUniqueIdentifier()
+        self._displayName = self._name
+        if self._uniqueID != '#1': self._displayName += ' '+self._uniqueID.replace('#','P')
+        self._displayName = bs.Lstr(translate=('inputDeviceNames',self._displayName))
+        buttonWidth = 240
+        self._width = 700
+        if self._uniqueID != "#1": self._height = 450
+        else: self._height = 345
+        self._spacing = 40
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),
+                                              scale=1.6 if bsUI.gSmallUI else 1.3 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-10) if bsUI.gSmallUI else (0,0),
+                                              transition=transition)
+
+        # dont ask to config joysticks while we're in here..
+        bsUI.gCanAskToConfigGamePads = False
+
+        self._rebuildUI()
+
+
+    def _rebuildUI(self):
+
+        for w in self._rootWidget.getChildren():
+            w.delete()
+
+        # fill our temp config with present values
+        self._settings = {}
+        for button in ['buttonJump','buttonPunch','buttonBomb','buttonPickUp',
+                       'buttonStart','buttonStart2','buttonUp','buttonDown','buttonLeft','buttonRight']:
+            self._settings[button] = bsUI.getControllerValue(self._input,button)
+
+        cancelButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(38,self._height-65),size=(170,60),label=bs.Lstr(resource='cancelText'),scale=0.9,onActivateCall=self._cancel);
+        saveButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(self._width-190,self._height-65),size=(180,60),label=bs.Lstr(resource='makeItSoText'),scale=0.9,textScale=0.9,onActivateCall=self._save)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton,startButton=saveButton)
+
+        bs.widget(edit=cancelButton,rightWidget=saveButton)
+        bs.widget(edit=saveButton,leftWidget=cancelButton)
+        
+        v = self._height - 54
+        t = bs.textWidget(parent=self._rootWidget,
+                          position=(self._width*0.5,v+15),
+                          size=(0,0),
+                          text=bs.Lstr(resource=self._r+'.configuringText',subs=[('${DEVICE}',self._displayName)]),
+                          color=bsUI.gTitleColor,
+                          hAlign='center',vAlign='center',maxWidth=270,
+                          scale=0.83)
+        # t = bs.textWidget(parent=self._rootWidget,position=(-10,v),size=(self._width,25),text="Configuring " + self._displayName,color=gTitleColor,
+        #                   scale=0.83,hAlign="center",vAlign="top")
+        v -= 20
+
+        if self._uniqueID != "#1":
+            v -= 20
+            v -= self._spacing
+            t = bs.textWidget(parent=self._rootWidget,position=(0,v+19),size=(self._width,50),
+                              text=bs.Lstr(resource=self._r+'.keyboard2NoteText'),
+                              scale=0.7,
+                              maxWidth=self._width*0.75,
+                              maxHeight=110,
+                              color=bsUI.gInfoTextColor,
+                              hAlign="center",vAlign="top")
+            v -= 45
+        v -= 10
+        v -= self._spacing * 2.2
+
+        v += 25
+        v -= 42
+
+        hOffs = 160
+        dist = 70
+
+        dColor = (0.4,0.4,0.8)
+        self._captureButton(pos=(hOffs,v+0.95*dist),color=dColor,button='buttonUp',texture=bs.getTexture('upButton'),scale=1.0)
+        self._captureButton(pos=(hOffs-1.2*dist,v),color=dColor,button='buttonLeft',texture=bs.getTexture('leftButton'),scale=1.0)
+        self._captureButton(pos=(hOffs+1.2*dist,v),color=dColor,button='buttonRight',texture=bs.getTexture('rightButton'),scale=1.0)
+        self._captureButton(pos=(hOffs,v-0.95*dist),color=dColor,button='buttonDown',texture=bs.getTexture('downButton'),scale=1.0)
+
+        if self._uniqueID == "#2":
+            self._captureButton(pos=(self._width*0.5,v+0.1*dist),color=(0.4,0.4,0.6),button='buttonStart',texture=bs.getTexture('startButton'),scale=0.8)
+
+        hOffs = self._width-160
+
+        self._captureButton(pos=(hOffs,v+0.95*dist),color=(0.6,0.4,0.8),button='buttonPickUp',texture=bs.getTexture('buttonPickUp'),scale=1.0)
+        self._captureButton(pos=(hOffs-1.2*dist,v),color=(0.7,0.5,0.1),button='buttonPunch',texture=bs.getTexture('buttonPunch'),scale=1.0)
+        self._captureButton(pos=(hOffs+1.2*dist,v),color=(0.5,0.2,0.1),button='buttonBomb',texture=bs.getTexture('buttonBomb'),scale=1.0)
+        self._captureButton(pos=(hOffs,v-0.95*dist),color=(0.2,0.5,0.2),button='buttonJump',texture=bs.getTexture('buttonJump'),scale=1.0)
+
+        # bs.buttonWidget(parent=self._rootWidget,label='Reset',textScale=0.7,color=(0.45,0.4,0.5),
+        #                 textColor=(0.65,0.6,0.7),position=(self._width*0.5-40,20),size=(80,30),onActivateCall=self._reset)
+
+    # def _reset(self):
+    #     # simply clear our config dict and rebuild the UI
+    #     getConfigDictForInputDevice(self._input,default=False,clear=True)
+    #     bs.realTimer(0,self._rebuildUI)
+
+    def _captureButton(self,pos,color,texture,button,scale=1.0):
+        baseSize = 79
+        b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(pos[0]-baseSize*0.5*scale,pos[1]-baseSize*0.5*scale),
+                            size=(baseSize*scale,baseSize*scale),
+                            texture=texture,label='',color=color)
+        # make this in a timer so that it shows up on top of all other buttons
+        def foo():
+            uiScale = 0.66*scale*2.0
+            maxWidth = 76.0*scale
+            t = bs.textWidget(parent=self._rootWidget,position=(pos[0]+0.0*scale,pos[1]-(57.0-18.0)*scale),
+                              color=(1,1,1,0.3),size=(0,0),hAlign='center',vAlign='top',
+                              scale=uiScale, maxWidth=maxWidth,text=self._input.getButtonName(self._settings[button]));
+            bs.buttonWidget(edit=b,autoSelect=True,onActivateCall=bs.Call(bsUI.AwaitKeyboardInputWindow,button,t,self._settings))
+
+        bs.realTimer(0,foo)
+
+    def _cancel(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
+        bsUI.gCanAskToConfigGamePads = True
+
+    def _save(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bs.playSound(bs.getSound('gunCocking'))
+
+        dst = bsUI.getConfigLocationForInputDevice(self._input,default=False)
+        dst = dst[0][dst[1]]
+        dst.clear()
+        # store any values that aren't -1
+        for key,val in self._settings.items():
+            if val != -1: dst[key] = val
+        # if we're allowed to phone home, send this config so we can generate more defaults in the future
+        if bsUtils._shouldSubmitDebugInfo(): bsUtils.serverPut('controllerConfig',{'ua':bs.getEnvironment()['userAgentString'],'name':self._name,'config':dst,'v':2})
+        bs.applySettings()
+        bs.writeConfig()
+
+        bsUI.uiGlobals['mainMenuWindow'] = ControllersWindow(transition='inLeft').getRootWidget()
+        bsUI.gCanAskToConfigGamePads = True
+
+
+class ConfigAudioWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight',originWidget=None):
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+
+        self._r = 'audioSettingsWindow'
+
+        spacing = 50
+        width = 460
+        height = 210
+
+        showVRHeadRelativeAudio = True if bs.getEnvironment()['vrMode'] else False
+
+        if showVRHeadRelativeAudio: height += 70
+        
+        showSoundtracks = False
+        if bsUtils.haveMusicPlayer():
+            showSoundtracks = True
+            height += spacing*2.0
+
+        baseScale=2.05 if bsUI.gSmallUI else 1.6 if bsUI.gMedUI else 1.0
+        popupMenuScale = baseScale*1.2
+
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,scale=baseScale,
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              stackOffset=(0,-20) if bsUI.gSmallUI else (0,0))
+        self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-55),size=(120,60),scale=0.8,textScale=1.2,
+                                                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back,autoSelect=True)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+        v = height - 60
+        v -= spacing*1.0
+        t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,height-32),size=(0,0),
+                          # text=R.titleText,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          color=bsUI.gTitleColor,
+                          maxWidth=180,
+                          hAlign="center",vAlign="center")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(98,height-32))
+        
+
+        self._soundVolumeWidgets = sv = bsUI.configTextBox(parent=self._rootWidget,position=(40,v),xOffset=10,name="Sound Volume",
+                                                      # displayName=R.soundVolumeText,
+                                                      displayName=bs.Lstr(resource=self._r+'.soundVolumeText'),
+                                                      type="float",minVal=0,maxVal=1.0,increment=0.1)
+        if bsUI.gToolbars:
+            bs.widget(edit=sv['plusButton'],rightWidget=bsInternal._getSpecialWidget('partyButton'))
+        v -= spacing
+        self._musicVolumeWidgets = mv = bsUI.configTextBox(parent=self._rootWidget,position=(40,v),xOffset=10,name="Music Volume",
+                                                      # displayName=R.musicVolumeText,
+                                                      displayName=bs.Lstr(resource=self._r+'.musicVolumeText'),
+                                                      type="float",minVal=0,maxVal=1.0,increment=0.1,callback=bsUtils._musicVolumeChanged,changeSound=None)
+
+        v -= 0.5*spacing
+        
+        if showVRHeadRelativeAudio:
+            v -= 40
+            t = bs.textWidget(parent=self._rootWidget,position=(40,v+24),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.headRelativeVRAudioText'),
+                              color=(0.8,0.8,0.8),maxWidth=230,
+                              hAlign="left",vAlign="center")
+            
+            p = bsUI.PopupMenu(parent=self._rootWidget,position=(290,v),width=120,buttonSize=(135,50),scale=popupMenuScale,
+                          choices=['Auto','On','Off'],
+                          choicesDisplay=[bs.Lstr(resource='autoText'),
+                                          bs.Lstr(resource='onText'),
+                                          bs.Lstr(resource='offText')],
+                          currentChoice=bsInternal._getSetting('VR Head Relative Audio'),onValueChangeCall=self._setVRHeadRelativeAudio)
+            self._vrHeadRelativeAudioButton = p.getButtonWidget()
+            t = bs.textWidget(parent=self._rootWidget,position=(width*0.5,v-11),size=(0,0),
+                              text=bs.Lstr(resource=self._r+'.headRelativeVRAudioInfoText'),
+                              scale=0.5,
+                              color=(0.7,0.8,0.7),maxWidth=400,flatness=1.0,
+                              hAlign="center",vAlign="center")
+            v -= 30
+        else:
+            self._vrHeadRelativeAudioButton = None
+            
+
+        
+        if showSoundtracks:
+            v -= 1.2*spacing
+            self._soundtrackButton = b = bs.buttonWidget(parent=self._rootWidget,position=((width-310)/2,v),size=(310,50),autoSelect=True,
+                                                         # label=R.soundtrackButtonText,
+                                                         label=bs.Lstr(resource=self._r+'.soundtrackButtonText'),
+                                                         onActivateCall=self._doSoundtracks)
+            v -= spacing*0.5
+            bs.textWidget(parent=self._rootWidget,position=(0,v),size=(width,20),
+                          # text=R.soundtrackDescriptionText,
+                          text=bs.Lstr(resource=self._r+'.soundtrackDescriptionText'),
+                          flatness=1.0,hAlign='center',scale=0.5,color=(0.7,0.8,0.7,1.0),maxWidth=400)
+        else:
+            self._soundtrackButton = None
+
+        # tweak a few navigation bits
+        try:
+            bs.widget(edit=backButton,downWidget=sv['minusButton'])
+            # if self._soundtrackButton is not None:
+            #     bs.widget(edit=self._soundtrackButton,upWidget=mv['minusButton'])
+        except Exception:
+            bs.printException('error wiring ConfigAudioWindow')
+
+        self._restoreState()
+
+    def _setVRHeadRelativeAudio(self,val):
+        bs.getConfig()['VR Head Relative Audio'] = val
+        bs.applySettings()
+        bs.writeConfig()
+            
+    def _doSoundtracks(self):
+        # we require disk access for soundtracks;
+        # if we don't have it, request it..
+        if not bsInternal._havePermission("storage"):
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource='storagePermissionAccessText'),color=(1,0,0))
+            bsInternal._requestPermission("storage")
+            return
+        
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.SoundtracksWindow(originWidget=self._soundtrackButton).getRootWidget()
+
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.SettingsWindow(transition='inLeft').getRootWidget()
+
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._soundVolumeWidgets['minusButton']: selName = 'SoundMinus'
+            elif sel == self._soundVolumeWidgets['plusButton']: selName = 'SoundPlus'
+            elif sel == self._musicVolumeWidgets['minusButton']: selName = 'MusicMinus'
+            elif sel == self._musicVolumeWidgets['plusButton']: selName = 'MusicPlus'
+            elif sel == self._soundtrackButton: selName = 'Soundtrack'
+            elif sel == self._backButton: selName = 'Back'
+            elif sel == self._vrHeadRelativeAudioButton: selName = 'VRHeadRelative'
+            else: raise Exception("unrecognized selected widget")
+            bsUI.gWindowStates[self.__class__.__name__] = selName
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]
+            except Exception: selName = None
+            if selName == 'SoundMinus': sel = self._soundVolumeWidgets['minusButton']
+            elif selName == 'SoundPlus': sel = self._soundVolumeWidgets['plusButton']
+            elif selName == 'MusicMinus': sel = self._musicVolumeWidgets['minusButton']
+            elif selName == 'MusicPlus': sel = self._musicVolumeWidgets['plusButton']
+            elif selName == 'VRHeadRelative': sel = self._vrHeadRelativeAudioButton
+            elif selName == 'Soundtrack': sel = self._soundtrackButton
+            elif selName == 'Back': sel = self._backButton
+            else: sel = self._backButton
+            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+
+
+class GraphicsWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight',originWidget=None):
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+
+        self._r = 'graphicsSettingsWindow'
+        env = bs.getEnvironment()
+        
+        spacing = 32
+        self._haveSelectedChild = False
+        ua = env['userAgentString']
+        interfaceType = env['interfaceType']
+        width = 450
+        height = 302
+
+        self._showFullscreen = False
+        fullscreenSpacingTop = spacing*0.2
+        fullscreenSpacing = spacing*1.2
+        if interfaceType == 'large':
+            self._showFullscreen = True
+            height += fullscreenSpacing+fullscreenSpacingTop
+
+        showGamma = False
+        gammaSpacing = spacing*1.3
+        #if interfaceType == 'large':
+        if bsInternal._hasGammaControl():
+            showGamma = True
+            height += gammaSpacing
+
+        showVSync = False
+        if 'Mac' in ua or 'macos' in ua:
+            showVSync = True
+
+        showResolution = True
+        if env['vrMode']: showResolution = False
+            
+        baseScale = 2.4 if bsUI.gSmallUI else 1.5 if bsUI.gMedUI else 1.0
+        popupMenuScale = baseScale*1.2
+        v = height - 50
+        v -= spacing*1.15
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=baseScale,
+                                              stackOffset=(0,-30) if bsUI.gSmallUI else (0,0))
+
+        backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,height-50),size=(120,60),scale=0.8,textScale=1.2,autoSelect=True,
+                            label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._back)
+
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+        t = bs.textWidget(parent=self._rootWidget,position=(0,height-44),size=(width,25),
+                          # text=R.titleText,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="top")
+
+        if bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(100,height-37))
+        
+        if self._showFullscreen:
+            v -= fullscreenSpacingTop
+            self._fullscreenCheckBox = bsUI.configCheckBox(parent=self._rootWidget,position=(100,v),maxWidth=200,
+                                                      size=(300,30),name="Fullscreen",
+                                                      displayName=bs.Lstr(resource=self._r+('.fullScreenCmdText' if 'Mac' in ua else '.fullScreenCtrlText')))
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._fullscreenCheckBox)
+                self._haveSelectedChild = True
+            v -= fullscreenSpacing
+        else:
+            self._fullscreenCheckBox = None
+
+        if showGamma:
+            self._gammaControls = tb = bsUI.configTextBox(parent=self._rootWidget,position=(90,v),
+                                                     name="Screen Gamma",
+                                                     # displayName=R.gammaText,
+                                                     displayName=bs.Lstr(resource=self._r+'.gammaText'),
+                                                     type="float",minVal=0.1,maxVal=2.0,
+                                                     increment=0.1,xOffset=-70,textScale=0.85)
+            if bsUI.gToolbars:
+                bs.widget(edit=tb['plusButton'],rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            
+            if not self._haveSelectedChild:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=tb['minusButton'])
+                self._haveSelectedChild = True
+            v -= gammaSpacing
+        else:
+            self._gammaControls = None
+
+        self._selectedColor=(0.5,1,0.5,1)
+        self._unselectedColor=(0.7,0.7,0.7,1)
+
+        # quality
+        hOffs = 15
+        t = bs.textWidget(parent=self._rootWidget,position=(60,v),size=(160,25),
+                          # text=R.visualsText,
+                          text=bs.Lstr(resource=self._r+'.visualsText'),
+                          color=bsUI.gHeadingColor,scale=0.65,maxWidth=150,
+                          hAlign="center",vAlign="center")
+        visualsPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(60,v-50),width=150,scale=popupMenuScale,
+                                 choices=['Auto','Higher','High','Medium','Low'],
+                                 choicesDisabled=['Higher','High'] if bsInternal._getMaxGraphicsQuality() == 'Medium' else [],
+                                 choicesDisplay=[bs.Lstr(resource='autoText'),
+                                                 bs.Lstr(resource=self._r+'.higherText'),
+                                                 bs.Lstr(resource=self._r+'.highText'),
+                                                 bs.Lstr(resource=self._r+'.mediumText'),
+                                                 bs.Lstr(resource=self._r+'.lowText')],
+                                 currentChoice=bsInternal._getSetting('Graphics Quality'),onValueChangeCall=self._setQuality)
+
+        # texture controls
+        hOffs = 210
+        t = bs.textWidget(parent=self._rootWidget,position=(230,v),size=(160,25),
+                          # text=R.texturesText,
+                          text=bs.Lstr(resource=self._r+'.texturesText'),
+                          color=bsUI.gHeadingColor,scale=0.65,maxWidth=150,
+                          hAlign="center",vAlign="center")
+        texturesPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(230,v-50),width=150,scale=popupMenuScale,
+                                  choices=['Auto','High','Medium','Low'],
+                                  choicesDisplay=[bs.Lstr(resource='autoText'),
+                                                  bs.Lstr(resource=self._r+'.highText'),
+                                                  bs.Lstr(resource=self._r+'.mediumText'),
+                                                  bs.Lstr(resource=self._r+'.lowText')],
+                                  currentChoice=bsInternal._getSetting('Texture Quality'),onValueChangeCall=self._setTextures)
+        if bsUI.gToolbars:
+            bs.widget(edit=texturesPopup.getButtonWidget(),rightWidget=bsInternal._getSpecialWidget('partyButton'))
+        v -= 80
+
+        hOffs = 0
+
+        if showResolution:
+            # resolution
+            t = bs.textWidget(parent=self._rootWidget,position=(hOffs+60,v),size=(160,25),
+                              # text=R.resolutionText,
+                              text=bs.Lstr(resource=self._r+'.resolutionText'),
+                              color=bsUI.gHeadingColor,scale=0.65,maxWidth=150,
+                              hAlign="center",vAlign="center")
+
+
+            # on android we have 'Auto', 'Native', and a few HD standards
+            if env['platform'] == 'android':
+                nativeRes = bsInternal._getDisplayResolution()
+                choices = ['Auto','Native']
+                choicesDisplay = [bs.Lstr(resource='autoText'),bs.Lstr(resource='nativeText')]
+                #choicesDisabled = []
+                for res in [1440,1080,960,720,480]:
+                    # nav bar is 72px so lets allow for that in what choices we show
+                    if nativeRes[1] >= res-72:
+                        resStr = str(res)+'p'
+                        choices.append(resStr)
+                        choicesDisplay.append(bs.Lstr(value=resStr))
+                currentRes = bsInternal._getSetting('Resolution (Android)')
+                resPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),width=120,scale=popupMenuScale,
+                                     choices=choices,choicesDisplay=choicesDisplay,
+                                     currentChoice=currentRes,onValueChangeCall=self._setAndroidRes)
+
+            else:
+
+                # if we're on a system that doesn't allow setting resolution, set pixel-scale instead
+                currentRes = bsInternal._getDisplayResolution()
+                if currentRes is None:
+                    currentRes = str(min(100,max(10,int(round(bsInternal._getSetting('Screen Pixel Scale')*100.0)))))+'%'
+                    resPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),width=120,scale=popupMenuScale,
+                                         choices=['100%','88%','75%','63%','50%'],
+                                         currentChoice=currentRes,onValueChangeCall=self._setPixelScale)
+                else:
+                    resolutions = bsInternal._getDisplayResolutions()
+                    resList = ['Desktop Res']+resolutions
+                    resListDisplay = [bs.Lstr(resource='desktopResText').evaluate()]+resolutions
+                    resPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(hOffs+60,v-50),scale=popupMenuScale,
+                                         choices=resList,
+                                         choicesDisplay=resListDisplay,
+                                         currentChoice=currentRes,onValueChangeCall=self._setRes)
+                    self._resPopup = weakref.ref(resPopup)
+        hOffs = 210
+
+        # vsync
+        if showVSync:
+            t = bs.textWidget(parent=self._rootWidget,position=(230,v),
+                              size=(160,25),
+                              # text=R.verticalSyncText,
+                              text=bs.Lstr(resource=self._r+'.verticalSyncText'),
+                              color=bsUI.gHeadingColor,scale=0.65,maxWidth=150,
+                              hAlign="center",vAlign="center")
+
+            vSyncPopup = bsUI.PopupMenu(parent=self._rootWidget,position=(230,v-50),width=150,scale=popupMenuScale,
+                                   choices=['Auto','Always','Never'],
+                                   choicesDisplay=[bs.Lstr(resource='autoText'),
+                                                   bs.Lstr(resource=self._r+'.alwaysText'),
+                                                   bs.Lstr(resource=self._r+'.neverText')],
+                                   currentChoice=bsInternal._getSetting('Vertical Sync'),onValueChangeCall=self._setVSync)
+        else: vSyncPopup = None
+
+        v -= 90
+        fpsc = bsUI.configCheckBox(parent=self._rootWidget,position=(69,v-6),
+                              size=(210,30),scale=0.86,name="Show FPS",
+                              # displayName=R.showFPSText,
+                              displayName=bs.Lstr(resource=self._r+'.showFPSText'),
+                              maxWidth=130)
+
+        # (tv mode doesnt apply to vr)
+        if not bs.getEnvironment()['vrMode']:
+            tvc = bsUI.configCheckBox(parent=self._rootWidget,position=(240,v-6),
+                                  size=(210,30),scale=0.86,name="TV Border",
+                                 # displayName=R.tvBorderText,
+                                 displayName=bs.Lstr(resource=self._r+'.tvBorderText'),
+                                 maxWidth=130)
+            # grumble..
+            bs.widget(edit=fpsc,rightWidget=tvc)
+
+        try:
+            pass
+            # resB = resPopup.getButtonWidget()
+            # visB = visualsPopup.getButtonWidget()
+            # texB = texturesPopup.getButtonWidget()
+
+            # if self._gammaControls is not None:
+            #     if self._fullscreenCheckBox is not None:
+            #         bs.widget(edit=self._gammaControls['minusButton'],upWidget=self._fullscreenCheckBox)
+            #         bs.widget(edit=self._gammaControls['plusButton'],upWidget=self._fullscreenCheckBox)
+            #     else:
+            #         bs.widget(edit=self._gammaControls['minusButton'],upWidget=backButton)
+            #         bs.widget(edit=self._gammaControls['plusButton'],upWidget=backButton)
+            #     bs.widget(edit=self._gammaControls['minusButton'],downWidget=texB)
+            #     bs.widget(edit=self._gammaControls['plusButton'],downWidget=texB)
+            #     bs.widget(edit=texB,upWidget=self._gammaControls['plusButton'])
+            #     bs.widget(edit=visB,upWidget=self._gammaControls['minusButton'])
+
+            # # no gamma controls
+            # else:
+            #     if self._fullscreenCheckBox is not None:
+            #         bs.widget(edit=self._fullscreenCheckBox,rightWidget=texB)
+            #         bs.widget(edit=texB,upWidget=self._fullscreenCheckBox)
+            #         bs.widget(edit=visB,upWidget=self._fullscreenCheckBox)
+            #     else:
+            #         bs.widget(edit=texB,upWidget=backButton)
+
+            # bs.widget(edit=visB,downWidget=resB)
+            # bs.widget(edit=resB,upWidget=visB,downWidget=fpsc)
+            # bs.widget(edit=fpsc,upWidget=resB)
+            # if vSyncPopup is not None:
+            #     vsB = vSyncPopup.getButtonWidget()
+            #     bs.widget(edit=vsB,upWidget=texB,downWidget=tvc)
+            #     bs.widget(edit=texB,downWidget=vsB)
+            #     bs.widget(edit=tvc,upWidget=vsB)
+            # else:
+            #     bs.widget(edit=texB,downWidget=tvc)
+            #     bs.widget(edit=tvc,upWidget=texB)
+
+        except Exception:
+            bs.printException('Exception wiring up graphics settings UI:')
+
+        # fpsc = configCheckBox(parent=self._rootWidget,position=(150,v-7) if showVSync else (243,v+49),
+        #                       size=(210,30),scale=1.0 if showVSync else 0.85,name="Show FPS")
+        v -= spacing
+
+        # make a timer to update our controls in case the config changes under us
+        self._updateTimer = bs.Timer(250,bs.WeakCall(self._updateControls),repeat=True,timeType='real')
+
+    def _back(self):
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.SettingsWindow(transition='inLeft').getRootWidget()
+
+    def _setQuality(self,quality):
+        bs.getConfig()['Graphics Quality'] = quality
+        bs.applySettings()
+        bs.writeConfig()
+
+    def _setTextures(self,val):
+        bs.getConfig()['Texture Quality'] = val
+        bs.applySettings()
+        bs.writeConfig()
+
+    def _setAndroidRes(self,val):
+        #print 'PY SET RES',val
+        bs.getConfig()['Resolution (Android)'] = val
+        bs.writeConfig()
+        bs.applySettings()
+        
+    def _setPixelScale(self,res):
+        bs.getConfig()['Screen Pixel Scale'] = float(res[:-1])/100.0
+        bs.writeConfig()
+        bs.applySettings()
+        
+    def _setRes(self,res,confirm=True,playSound=False):
+        self._oldRes = bsInternal._getDisplayResolution()
+
+        if playSound: bs.playSound(bs.getSound('swish'))
+
+        bs.getConfig()['Screen Resolution'] = res
+
+        bs.writeConfig()
+        bs.applySettings()
+
+        rp = self._resPopup()
+        if rp is not None: rp.setChoice(res)
+
+        # if we're changing resolution in fullscreen mode, bring up a confirmation window to make sure the res is visible
+        if self._oldRes != res and confirm and bsInternal._('Fullscreen'):
+            bsUI.ResChangeConfirmWindow(self)
+
+    def _setVSync(self,val):
+        bs.getConfig()['Vertical Sync'] = val
+        bs.applySettings()
+        bs.writeConfig()
+
+    def _updateControls(self):
+        if self._showFullscreen:
+            bs.checkBoxWidget(edit=self._fullscreenCheckBox,value=bsInternal._getSetting('Fullscreen'))
+
+
+class AdvancedSettingsWindow(bsUI.Window):
+
+    # def __del__(self):
+    #     print '~AdvancedSettingsWindow()'
+        
+    def __init__(self,transition='inRight',originWidget=None):
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+        
+        self._width = 670
+        self._height = 390 if bsUI.gSmallUI else 450 if bsUI.gMedUI else 520
+        self._spacing = 32
+        self._menuOpen = False
+        topExtra = 10 if bsUI.gSmallUI else 0
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+topExtra),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=2.06 if bsUI.gSmallUI else 1.4 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-25) if bsUI.gSmallUI else (0,0))
+        self._prevLang = ""
+        self._prevLangList = []
+        self._completeLangsList = None
+        self._completeLangsError = False
+        self._languagePopup = None
+
+        # in vr-mode, the internal keyboard is currently the *only* option, so no need to show this..
+        self._showAlwaysUseInternalKeyboard = False if bs.getEnvironment()['vrMode'] else True
+        
+        self._scrollWidth = self._width - 100
+        self._scrollHeight = self._height - 115
+        self._subWidth = self._scrollWidth*0.95
+        self._subHeight = 732+50+60-60
+        
+        if self._showAlwaysUseInternalKeyboard: self._subHeight += 62
+
+        self._doVRTestButton = True if bs.getEnvironment()['vrMode'] else False
+        
+        self._doNetTestButton = True
+
+        self._extraButtonSpacing = self._spacing * 2.5
+        
+        if self._doVRTestButton: self._subHeight += self._extraButtonSpacing
+        if self._doNetTestButton: self._subHeight += self._extraButtonSpacing
+
+        self._r = 'settingsWindowAdvanced'
+
+        if bsUI.gToolbars:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._doBack)
+            self._backButton = None
+        else:
+            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(53,self._height-60),size=(140,60),scale=0.8,
+                                                                autoSelect=True,label=bs.Lstr(resource='backText'),buttonType='back',onActivateCall=self._doBack)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=self._backButton)
+
+        self._titleText = t = bs.textWidget(parent=self._rootWidget,position=(0,self._height-52),size=(self._width,25),
+                                            #text=R.titleText,
+                                            text=bs.Lstr(resource=self._r+'.titleText'),
+                                            color=bsUI.gTitleColor,
+                                            hAlign="center",vAlign="top")
+
+        if bsUI.gDoAndroidNav:
+            if self._backButton is not None:
+                bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(115,self._height-47))
+            
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(50,50),simpleCullingV=20.0,
+                                             highlight=False, size=(self._scrollWidth,self._scrollHeight))
+        bs.containerWidget(edit=self._scrollWidget,selectionLoopToParent=True)
+        self._subContainer = c = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),
+                                                    background=False,selectionLoopToParent=True)
+
+        
+        self._rebuild()
+            
+        # rebuild periodically to pick up language changes/additions/etc
+        self._rebuildTimer = bs.Timer(1000,bs.WeakCall(self._rebuild),repeat=True,timeType='real')
+
+        # fetch the list of completed languages
+        bsUtils.serverGet('bsLangGetCompleted',{},callback=bs.WeakCall(self._completedLangsCB))
+    
+    def _updateLangStatus(self):
+        if self._completeLangsList is not None:
+            upToDate = (bs.getLanguage() in self._completeLangsList)
+            t = bs.textWidget(edit=self._langStatusText,text='' if bs.getLanguage() == 'Test' else bs.Lstr(resource=self._r+'.translationNoUpdateNeededText') if upToDate else bs.Lstr(resource=self._r+'.translationUpdateNeededText'),
+                              color=(0.2,1.0,0.2,0.8) if upToDate else (1.0,0.2,0.2,0.8))
+        else:
+            t = bs.textWidget(edit=self._langStatusText,
+                              text=bs.Lstr(resource=self._r+'.translationFetchErrorText') if self._completeLangsError else bs.Lstr(resource=self._r+'.translationFetchingStatusText'),
+                              color=(1.0,0.5,0.2) if self._completeLangsError else (0.7,0.7,0.7))
+            
+
+    def _rebuild(self):
+
+        # dont rebuild if the menu is open or if our language and language-list hasn't changed
+        # NOTE - although we now support widgets updating their own translations, we still change
+        # the label formatting on the language menu based on the language so still need this.
+        # ...however we could make this more limited to it only rebuilds that one menu instead of everything.
+        if self._menuOpen or (self._prevLang == bs.getLanguage(returnNoneForDefault=True) and self._prevLangList == bsUtils._getLanguages()): return
+        # if self._menuOpen or self._prevLangList == bsUtils._getLanguages(): return
+        self._prevLang = bs.getLanguage(returnNoneForDefault=True)
+        self._prevLangList = bsUtils._getLanguages()
+
+        # if our popup menu was selected we wanna restore that..
+        #langWasSelected = (self._languagePopup is not None and self._subContainer.getSelectedChild() == self._languagePopup.getButtonWidget())
+
+        # clear out our sub-container
+        children = self._subContainer.getChildren()
+        for c in children: c.delete()
+
+        
+        v = self._subHeight - 35
+
+        v -= self._spacing * 1.2
+
+        # update our existing back button and title
+        if self._backButton is not None:
+            bs.buttonWidget(edit=self._backButton,label=bs.Lstr(resource='backText'))
+            if bsUI.gDoAndroidNav: bs.buttonWidget(edit=self._backButton,label=bs.getSpecialChar('back'))
+        
+        bs.textWidget(edit=self._titleText,
+                      text=bs.Lstr(resource=self._r+'.titleText'))
+        
+
+        thisButtonWidth = 410
+
+        self._promoCodeButton = bs.buttonWidget(parent=self._subContainer,
+                                                position=(self._subWidth/2-thisButtonWidth/2,v-14),
+                                                size=(thisButtonWidth,60),
+                                                autoSelect=True,
+                                                label=bs.Lstr(resource=self._r+'.enterPromoCodeText'),
+                                                textScale=1.0,
+                                                onActivateCall=self._onPromoCodePress)
+        if self._backButton is not None:
+            bs.widget(edit=self._promoCodeButton,upWidget=self._backButton,leftWidget=self._backButton)
+        v -= self._extraButtonSpacing * 0.8
+
+        t = bs.textWidget(parent=self._subContainer,position=(200,v+10),size=(0,0),
+                          text=bs.Lstr(resource=self._r+'.languageText'),
+                          maxWidth=150,
+                          scale=0.95,color=bsUI.gTitleColor,hAlign='right',vAlign='center')
+
+        languages = bsUtils._getLanguages()
+        curLang = bs.getLanguage(returnNoneForDefault=True)
+        if curLang is None: curLang = 'Auto'
+
+        # we have a special dict of language names in that language
+        # so we dont have to import every language module here..
+        # (that causes hitches on slower systems)
+        langsTranslated = {}
+        for lang in languages:
+            langsTranslated[lang] = lang # default
+            if lang in bsServerData.languageNamesTranslated:
+                langsTranslated[lang] = bs.uni(bsServerData.languageNamesTranslated[lang])
+
+        langsFull = {}
+        for lang in languages:
+            lt = bs.Lstr(translate=('languages',lang)).evaluate()
+            if langsTranslated[lang] == lt:
+                langsFull[lang] = lt
+            else:
+                langsFull[lang] = langsTranslated[lang]+' ('+lt+')'
+
+        self._languagePopup = bsUI.PopupMenu(parent=self._subContainer,position=(210,v-19),width=150,
+                                        openingCall=bs.WeakCall(self._onMenuOpen),closingCall=bs.WeakCall(self._onMenuClose),autoSelect=False,
+                                        onValueChangeCall=bs.WeakCall(self._onMenuChoice),
+                                        choices=['Auto']+languages,buttonSize=(250,60),
+                                        choicesDisplay=([bs.Lstr(value=(bs.Lstr(resource='autoText').evaluate()+' ('+bs.Lstr(translate=('languages',bsUtils._getDefaultLanguage())).evaluate()+')'))]
+                                                        +[bs.Lstr(value=langsFull[l]) for l in languages]),
+                                        currentChoice=curLang)
+
+        # bs.widget(edit=self._alwaysUseInternalKeyboardCheckBox if self._showAlwaysUseInternalKeyboard else self._kickIdlePlayersCheckBox,
+        #           downWidget=self._languagePopup.getButtonWidget())
+        # if langWasSelected:
+        #     bs.containerWidget(edit=self._subContainer,selectedChild=self._languagePopup.getButtonWidget())
+            
+        v -= self._spacing * 1.8
+
+        t = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v+10),size=(0,0),
+                          text=bs.Lstr(resource=self._r+'.helpTranslateText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
+                          maxWidth=self._subWidth*0.9,maxHeight=55,
+                          # flatness=1.0,scale=0.65*R.helpTranslateTextScale,color=(0.4,0.9,0.4,0.8),hAlign='center',vAlign='center')
+                          flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),hAlign='center',vAlign='center')
+        v -= self._spacing * 1.9
+        thisButtonWidth = 410
+        self._translationEditorButton = bs.buttonWidget(parent=self._subContainer,
+                                                        position=(self._subWidth/2-thisButtonWidth/2,v-24),
+                                                        size=(thisButtonWidth,60),
+                                                        label=bs.Lstr(resource=self._r+'.translationEditorButtonText',subs=[('${APP_NAME}',bs.Lstr(resource='titleText'))]),
+                                                        autoSelect=True,
+                                                        onActivateCall=bs.Call(bs.openURL,'http://bombsquadgame.com/translate'))
+
+        self._langStatusText = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v-40),size=(0,0),
+                                             text='',flatness=1.0,
+                                             scale=0.63,
+                                             hAlign='center',vAlign='center',maxWidth=400.0)
+        self._updateLangStatus()
+        v -= self._spacing * 3.0
+
+        #v -= self._spacing * 1.0
+        self._kidFriendlyCheckBox = cb = bsUI.configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Kid Friendly Mode",
+                                                        # displayName=R.kidFriendlyModeText,
+                                                        displayName=bs.Lstr(resource=self._r+'.kidFriendlyModeText'),
+                                                        scale=1.0,maxWidth=430)                                            
+                                                        
+        bs.widget(edit=self._translationEditorButton,downWidget=cb, upWidget=self._languagePopup.getButtonWidget())
+        # bs.widget(edit=cb,upWidget=self._backButton,leftWidget=self._backButton)
+
+        # if testButton is not None:
+        #     bs.widget(edit=backButton,rightWidget=testButton,downWidget=cb)
+        #     bs.widget(edit=testButton,leftWidget=backButton,downWidget=cb)
+        
+        v -= self._spacing * 1.2
+        self._kickIdlePlayersCheckBox = bsUI.configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Kick Idle Players",autoSelect=True,
+                                                       # displayName=R.kickIdlePlayersText,
+                                                       displayName=bs.Lstr(resource=self._r+'.kickIdlePlayersText'),
+                                                       scale=1.0,maxWidth=430)
+
+        if self._showAlwaysUseInternalKeyboard:
+            v -= 42
+            self._alwaysUseInternalKeyboardCheckBox = bsUI.configCheckBox(parent=self._subContainer,position=(50,v),size=(self._subWidth-100,30),name="Always Use Internal Keyboard",
+                                                                     autoSelect=True,
+                                                                     # displayName=R.alwaysUseInternalKeyboardText,
+                                                                     displayName=bs.Lstr(resource=self._r+'.alwaysUseInternalKeyboardText'),
+                                                                     scale=1.0,maxWidth=430)
+            t = bs.textWidget(parent=self._subContainer,position=(90,v-10),size=(0,0),
+                              # text=R.alwaysUseInternalKeyboardDescriptionText,
+                              text=bs.Lstr(resource=self._r+'.alwaysUseInternalKeyboardDescriptionText'),
+                              maxWidth=400,flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),
+                              hAlign='left',vAlign='center')
+            v -= 20
+        else: self._alwaysUseInternalKeyboardCheckBox = None
+
+        
+        v -= self._spacing * 2.1
+        
+
+        thisButtonWidth = 410
+        self._showUserModsButton = bs.buttonWidget(parent=self._subContainer,
+                                                   position=(self._subWidth/2-thisButtonWidth/2,v-10),
+                                                   size=(thisButtonWidth,60),
+                                                   autoSelect=True,
+                                                   # label=R.showUserModsText,
+                                                   label=bs.Lstr(resource=self._r+'.showUserModsText'),
+                                                   textScale=1.0,
+                                                   onActivateCall=bsUtils.showUserScripts)
+        if self._showAlwaysUseInternalKeyboard:
+            bs.widget(edit=self._alwaysUseInternalKeyboardCheckBox,downWidget=self._showUserModsButton)
+            bs.widget(edit=self._showUserModsButton,upWidget=self._alwaysUseInternalKeyboardCheckBox)
+        else:
+            bs.widget(edit=self._showUserModsButton,upWidget=self._kickIdlePlayersCheckBox)
+            bs.widget(edit=self._kickIdlePlayersCheckBox,downWidget=self._showUserModsButton)
+            
+            
+        v -= self._spacing * 2.0
+        
+        b = self._moddingGuideButton = bs.buttonWidget(parent=self._subContainer,
+                                                       position=(self._subWidth/2-thisButtonWidth/2,v-10),
+                                                       size=(thisButtonWidth,60),
+                                                       autoSelect=True,
+                                                       # label=R.moddingGuideText,
+                                                       label=bs.Lstr(resource=self._r+'.moddingGuideText'),
+                                                       textScale=1.0,
+                                                       onActivateCall=bs.Call(bs.openURL,'http://www.froemling.net/docs/bombsquad-modding-guide'))
+
+        v -= self._spacing * 1.8
+
+        def foo(val):
+            bs.screenMessage(bs.Lstr(resource=self._r+'.mustRestartText'),
+                             color=(1,1,0))
+            
+        cb = self._enablePackageModsCheckBox = bsUI.configCheckBox(parent=self._subContainer,position=(80,v),size=(self._subWidth-100,30),
+                                                              name="Enable Package Mods",autoSelect=True,valueChangeCall=foo,
+                                                              # displayName=R.enablePackageModsText,
+                                                              displayName=bs.Lstr(resource=self._r+'.enablePackageModsText'),
+                                                              scale=1.0,maxWidth=400)
+        bs.widget(edit=b,downWidget=cb)
+        bs.widget(edit=cb,upWidget=b)
+        t = bs.textWidget(parent=self._subContainer,position=(90,v-10),size=(0,0),
+                          # text=R.enablePackageModsDescriptionText,
+                          text=bs.Lstr(resource=self._r+'.enablePackageModsDescriptionText'),
+                          maxWidth=400,flatness=1.0,scale=0.65,color=(0.4,0.9,0.4,0.8),
+                          hAlign='left',vAlign='center')
+        
+        v -= self._spacing * 0.6
+
+        if self._doVRTestButton:
+            v -= self._extraButtonSpacing
+            self._vrTestButton = bs.buttonWidget(parent=self._subContainer,
+                                                 position=(self._subWidth/2-thisButtonWidth/2,v-14),
+                                                 size=(thisButtonWidth,60),
+                                                 autoSelect=True,
+                                                 #label=R.vrTestingText,
+                                                 label=bs.Lstr(resource=self._r+'.vrTestingText'),
+                                                 textScale=1.0,
+                                                 onActivateCall=self._onVRTestPress)
+        else:
+            self._vrTestButton = None
+            
+        if self._doNetTestButton:
+            v -= self._extraButtonSpacing
+            self._netTestButton = bs.buttonWidget(parent=self._subContainer,
+                                                  position=(self._subWidth/2-thisButtonWidth/2,v-14),
+                                                  size=(thisButtonWidth,60),
+                                                  autoSelect=True,
+                                                  # label=R.netTestingText,
+                                                  label=bs.Lstr(resource=self._r+'.netTestingText'),
+                                                  textScale=1.0,
+                                                  onActivateCall=self._onNetTestPress)
+        else: self._netTestButton = None
+
+        v -= 70
+        self._benchmarksButton = bs.buttonWidget(parent=self._subContainer,
+                                                 position=(self._subWidth/2-thisButtonWidth/2,v-14),
+                                                 size=(thisButtonWidth,60),
+                                                 autoSelect=True,
+                                                 # label=R.benchmarksText,
+                                                 label=bs.Lstr(resource=self._r+'.benchmarksText'),
+                                                 textScale=1.0,
+                                                 onActivateCall=self._onBenchmarkPress)
+
+        
+        bs.widget(edit=self._vrTestButton if self._vrTestButton is not None else self._netTestButton if self._netTestButton is not None else self._benchmarksButton,
+                  upWidget=cb)
+        
+        #bs.widget(edit=showUserModsButton,downWidget=promoCodeButton)
+        #bs.widget(edit=moddingGuideButton,upWidget=translationEditorButton)
+        # for b in [showUserModsButton,moddingGuideButton,promoCodeButton]:
+        #     bs.widget(edit=b,showBufferBottom=30)
+
+        for w in self._subContainer.getChildren():
+            bs.widget(edit=w,showBufferBottom=30,showBufferTop=20)
+            
+        self._modpackWebpageButton = bs.buttonWidget(parent=self._subContainer,
+                                                position=(self._subWidth/2-thisButtonWidth/2,v-86),
+                                                size=(thisButtonWidth,60),
+                                                autoSelect=True,
+                                                label=bs.Lstr(resource=self._r+'.modpackWebpageText'),
+                                                textScale=1.0,
+                                                onActivateCall=bs.Call(bs.openURL,'https://bombsquadjoyride.blogspot.com/'))
+
+        if bsUI.gToolbars:
+            # print 'SETTING'
+            pb = bsInternal._getSpecialWidget('partyButton')
+            bs.widget(edit=self._scrollWidget,rightWidget=pb)
+            if self._backButton is None:
+                bs.widget(edit=self._scrollWidget,leftWidget=bsInternal._getSpecialWidget('backButton'))
+            # for w in self._subContainer.getChildren():
+            #     bs.widget(edit=w,rightWidget=pb)
+            
+        self._restoreState()
+        
+    def _onVRTestPress(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.VRTestingWindow(transition='inRight').getRootWidget()
+
+    def _onNetTestPress(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.NetTestingWindow(transition='inRight').getRootWidget()
+
+    def _onFriendPromoCodePress(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+            return
+        bsUI.doAppInvitesPress()
+        
+    def _onPromoCodePress(self):
+
+        # we have to be logged in for promo-codes to work..
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+            return
+        
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.PromoCodeWindow(originWidget=self._promoCodeButton).getRootWidget()
+
+    def _onBenchmarkPress(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = DebugWindow(transition='inRight').getRootWidget()
+        
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._scrollWidget:
+                sel = self._subContainer.getSelectedChild()
+                if sel == self._vrTestButton: selName = 'VRTest'
+                elif sel == self._netTestButton: selName = 'NetTest'
+                elif sel == self._promoCodeButton: selName = 'PromoCode'
+                # elif sel == self._friendPromoCodeButton: selName = 'FriendPromoCode'
+                elif sel == self._benchmarksButton: selName = 'Benchmarks'
+                elif sel == self._kickIdlePlayersCheckBox: selName = 'KickIdlePlayers'
+                elif sel == self._alwaysUseInternalKeyboardCheckBox: selName = 'AlwaysUseInternalKeyboard'
+                elif sel == self._kidFriendlyCheckBox: selName = 'KidFriendly'
+                elif sel == self._languagePopup.getButtonWidget(): selName = 'Languages'
+                elif sel == self._translationEditorButton: selName = 'TranslationEditor'
+                elif sel == self._showUserModsButton: selName = 'ShowUserMods'
+                elif sel == self._moddingGuideButton: selName = 'ModdingGuide'
+                elif sel == self._enablePackageModsCheckBox: selName = 'PackageMods'
+                elif sel == self._modpackWebpageButton: selName = 'ModpackWebpage'
+                else: raise Exception("unrecognized selection")
+            elif sel == self._backButton: selName = 'Back'
+            else: raise Exception("unrecognized selection")
+            bsUI.gWindowStates[self.__class__.__name__] = {'selName':selName}
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]['selName']
+            except Exception: selName = None
+            if selName == 'Back':
+                sel = self._backButton
+                subSel = None
+            else:
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
+                if selName == 'VRTest': sel = self._vrTestButton
+                elif selName == 'NetTest': sel = self._netTestButton
+                elif selName == 'PromoCode': sel = self._promoCodeButton
+                #elif selName == 'FriendPromoCode': sel = self._friendPromoCodeButton
+                elif selName == 'Benchmarks': sel = self._benchmarksButton
+                elif selName == 'KickIdlePlayers': sel = self._kickIdlePlayersCheckBox
+                elif selName == 'KidFriendly': sel = self._kidFriendlyCheckBox
+                elif selName == 'AlwaysUseInternalKeyboard': sel = self._alwaysUseInternalKeyboardCheckBox
+                elif selName == 'Languages': sel = self._languagePopup.getButtonWidget()
+                elif selName == 'TranslationEditor': sel = self._translationEditorButton
+                elif selName == 'ShowUserMods': sel = self._showUserModsButton
+                elif selName == 'ModdingGuide': sel = self._moddingGuideButton
+                elif selName == 'PackageMods': sel = self._enablePackageModsCheckBox
+                elif selName == 'ModpackWebpage': sel = self._modpackWebpageButton
+                else: sel = None
+                if sel != None: bs.containerWidget(edit=self._subContainer,selectedChild=sel,visibleChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+    
+    def _onMenuOpen(self):
+        self._menuOpen = True
+
+    def _onMenuClose(self):
+        self._menuOpen = False
+
+    def _onMenuChoice(self,choice):
+        if choice == 'Auto': bsUtils._setLanguage(None)
+        else:
+            try:
+                # attempt to reload the language module first.. (this makes iterating on a language easier)
+                langModule = __import__('bsLanguage'+choice)
+                reload(langModule)
+            except Exception:
+                bs.printException('error on language switch reload for lang \''+choice+'\':')
+            bsUtils._setLanguage(choice)
+        self._saveState()
+        bs.realTimer(100,bs.WeakCall(self._rebuild))
+
+    def _completedLangsCB(self,results):
+        if results is not None:
+            self._completeLangsList = results['langs']
+            self._completeLangsError = False
+        else:
+            self._completeLangsList = None
+            self._completeLangsError = True
+        bs.realTimer(1,bs.WeakCall(self._updateLangStatus))
+            
+
+    def _doBack(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.SettingsWindow(transition='inLeft').getRootWidget()
+
+
+class DebugWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight'):
+        
+        self._width = width = 580
+        self._height = height = 350 if bsUI.gSmallUI else 420 if bsUI.gMedUI else 520
+
+        self._scrollWidth = self._width - 100
+        self._scrollHeight = self._height - 120
+
+        self._subWidth = self._scrollWidth*0.95;
+        self._subHeight = 520
+        
+        self._stressTestGameType = 'Random'
+        self._stressTestPlaylist = '__default__'
+        self._stressTestPlayerCount = 8
+        self._stressTestRoundDuration = 30
+
+        # bs.playSound(bs.getSound('gong'))
+
+        self._r = 'debugWindow'
+        self._rootWidget = bs.containerWidget(size=(width,height),transition=transition,
+                                              scale=2.35 if bsUI.gSmallUI else 1.55 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-30) if bsUI.gSmallUI else (0,0))
+        
+        self._doneButton = b = bs.buttonWidget(parent=self._rootWidget,position=(40,height-67),size=(120,60),scale=0.8,
+                                               autoSelect=True,label=bs.Lstr(resource='doneText'), onActivateCall=self._done)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+        t = bs.textWidget(parent=self._rootWidget,position=(0,height-60),size=(width,30),
+                          # text=R.titleText,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          hAlign="center",color=bsUI.gTitleColor,
+                          vAlign="center",maxWidth=260)
+
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,size=(self._scrollWidth,self._scrollHeight),
+                                             highlight=False, position=((self._width-self._scrollWidth)*0.5,50))
+        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True)
+        
+        self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._subWidth,self._subHeight),
+                                                background=False)
+        
+        v = self._subHeight - 70
+        buttonWidth = 300
+        # b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
+        #                     label=R.unlockCoopText,onActivateCall=self._unlockPressed)
+        # v -= 80
+        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
+                            autoSelect=True,
+                            # label=R.runCPUBenchmarkText,
+                            label=bs.Lstr(resource=self._r+'.runCPUBenchmarkText'),
+                            onActivateCall=self._runCPUBenchmarkPressed)
+        bs.widget(edit=b,upWidget=self._doneButton,leftWidget=self._doneButton)
+        v -= 60
+
+        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
+                            autoSelect=True,
+                            # label=R.runGPUBenchmarkText,
+                            label=bs.Lstr(resource=self._r+'.runGPUBenchmarkText'),
+                            onActivateCall=self._runGPUBenchmarkPressed)
+        v -= 60
+
+        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
+                            autoSelect=True,
+                            # label=R.runMediaReloadBenchmarkText,
+                            label=bs.Lstr(resource=self._r+'.runMediaReloadBenchmarkText'),
+                            onActivateCall=self._runMediaReloadBenchmarkPressed)
+        v -= 60
+        
+        t = bs.textWidget(parent=self._subContainer,position=(self._subWidth*0.5,v+22),size=(0,0),
+                          # text=R.stressTestTitleText,
+                          text=bs.Lstr(resource=self._r+'.stressTestTitleText'),
+                          maxWidth=200,color=bsUI.gHeadingColor,
+                          scale=0.85,hAlign="center",vAlign="center")
+        v -= 45
+
+        xOffs = 165
+        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v+22),size=(0,0),
+                          # text=R.stressTestPlaylistTypeText,
+                          text=bs.Lstr(resource=self._r+'.stressTestPlaylistTypeText'),
+                          maxWidth=130,color=bsUI.gHeadingColor,
+                          scale=0.65,hAlign="right",vAlign="center")
+
+        bsUI.PopupMenu(parent=self._subContainer,position=(xOffs,v),width=150,
+                  choices=['Random','Teams','Free-For-All'],
+                  choicesDisplay=[bs.Lstr(resource=a) for a in ['randomText','playModes.teamsText','playModes.freeForAllText']],
+                  currentChoice='Auto',onValueChangeCall=self._stressTestGameTypeSelected)
+        v -= 46
+        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v+22),size=(0,0),
+                          # text=R.stressTestPlaylistNameText,
+                          text=bs.Lstr(resource=self._r+'.stressTestPlaylistNameText'),
+                          maxWidth=130,color=bsUI.gHeadingColor,
+                          scale=0.65,hAlign="right",vAlign="center")
+        self._stressTestPlaylistNameField = bs.textWidget(parent=self._subContainer,position=(xOffs+5,v-5),size=(250,46),
+                                                          text=self._stressTestPlaylist,hAlign="left",
+                                                          vAlign="center",
+                                                          autoSelect=True,
+                                                          color=(0.9,0.9,0.9,1.0),
+                                                          # description=R.stressTestPlaylistDescriptionText,
+                                                          description=bs.Lstr(resource=self._r+'.stressTestPlaylistDescriptionText'),
+                                                          editable=True,padding=4)
+        v -= 29
+        xSub = 60
+        
+        # player count
+        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v),size=(0,0),
+                          # text=R.stressTestPlayerCountText,
+                          text=bs.Lstr(resource=self._r+'.stressTestPlayerCountText'),
+                          color=(0.8,0.8,0.8,1.0),hAlign="right",vAlign="center",scale=0.65,
+                          maxWidth=130)
+        self._stressTestPlayerCountText = bs.textWidget(parent=self._subContainer,position=(246-xSub,v-14),
+                                                      size=(60,28),editable=False,
+                                                      color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
+                                                      text=str(self._stressTestPlayerCount),
+                          padding=2)
+        b = bs.buttonWidget(parent=self._subContainer,position=(330-xSub,v-11),size=(28,28),label="-",
+                            autoSelect=True,onActivateCall=bs.Call(self._stressTestPlayerCountDecrement),
+                            repeat=True,enableSound=True)
+        b = bs.buttonWidget(parent=self._subContainer,position=(380-xSub,v-11),size=(28,28),label="+",
+                            autoSelect=True,onActivateCall=bs.Call(self._stressTestPlayerCountIncrement),
+                            repeat=True,enableSound=True)
+
+
+        v -= 42
+
+        # round duration
+        t = bs.textWidget(parent=self._subContainer,position=(xOffs-10,v),size=(0,0),
+                          # text=R.stressTestRoundDurationText,
+                          text=bs.Lstr(resource=self._r+'.stressTestRoundDurationText'),
+                          color=(0.8,0.8,0.8,1.0),hAlign="right",vAlign="center",scale=0.65,
+                          maxWidth=130)
+        self._stressTestRoundDurationText = bs.textWidget(parent=self._subContainer,position=(246-xSub,v-14),
+                                                      size=(60,28),editable=False,
+                                                          color=(0.3,1.0,0.3,1.0),hAlign="right",vAlign="center",
+                                                          text=str(self._stressTestRoundDuration),
+                          padding=2)
+        b = bs.buttonWidget(parent=self._subContainer,position=(330-xSub,v-11),size=(28,28),label="-",
+                            autoSelect=True,onActivateCall=bs.Call(self._stressTestRoundDurationDecrement),
+                            repeat=True,enableSound=True)
+        b = bs.buttonWidget(parent=self._subContainer,position=(380-xSub,v-11),size=(28,28),label="+",
+                            autoSelect=True,onActivateCall=bs.Call(self._stressTestRoundDurationIncrement),
+                            repeat=True,enableSound=True)
+
+
+        v -= 82
+
+        b = bs.buttonWidget(parent=self._subContainer,position=((self._subWidth-buttonWidth)*0.5,v),size=(buttonWidth,60),
+                            autoSelect=True,
+                            # label=R.runStressTestText,
+                            label=bs.Lstr(resource=self._r+'.runStressTestText'),
+                            onActivateCall=self._stressTestPressed)
+        bs.widget(b,showBufferBottom=50)
+
+    def _stressTestPlayerCountDecrement(self):
+        self._stressTestPlayerCount = max(1,self._stressTestPlayerCount - 1)
+        bs.textWidget(edit=self._stressTestPlayerCountText,text=str(self._stressTestPlayerCount))
+
+    def _stressTestPlayerCountIncrement(self):
+        self._stressTestPlayerCount = self._stressTestPlayerCount + 1
+        bs.textWidget(edit=self._stressTestPlayerCountText,text=str(self._stressTestPlayerCount))
+
+    def _stressTestRoundDurationDecrement(self):
+        self._stressTestRoundDuration = max(10,self._stressTestRoundDuration - 10)
+        bs.textWidget(edit=self._stressTestRoundDurationText,text=str(self._stressTestRoundDuration))
+
+    def _stressTestRoundDurationIncrement(self):
+        self._stressTestRoundDuration = self._stressTestRoundDuration + 10
+        bs.textWidget(edit=self._stressTestRoundDurationText,text=str(self._stressTestRoundDuration))
+
+
+    def _stressTestGameTypeSelected(self,gameType):
+        self._stressTestGameType = gameType
+
+    def _runCPUBenchmarkPressed(self):
+        bsUtils.runCPUBenchmark()
+
+    def _runGPUBenchmarkPressed(self):
+        bsUtils.runGPUBenchmark()
+
+    def _runMediaReloadBenchmarkPressed(self):
+        bsUtils.runMediaReloadBenchmark()
+        
+    # def _unlockPressed(self):
+    #     try:
+    #         import bsCoopGame
+    #         campaign = bsCoopGame.getCampaign('Default')
+    #         levels = campaign.getLevels()
+    #         for level in levels: campaign.completeLevel(level['name'])
+    #         bs.screenMessage("CO-OP LEVELS UNLOCKED!",color=(0,1,0))
+    #         bs.playSound(bs.getSound('gunCocking'))
+    #     except Exception:
+    #         bs.screenMessage("ERROR UNLOCKING CO-OP LEVELS",color=(1,0,0))
+
+    def _stressTestPressed(self):
+        bsUtils.runStressTest(playlistType=self._stressTestGameType,
+                              playlistName=bs.textWidget(query=self._stressTestPlaylistNameField),
+                              playerCount=self._stressTestPlayerCount,
+                              roundDuration=self._stressTestRoundDuration)
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+
+    def _done(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = AdvancedSettingsWindow(transition='inLeft').getRootWidget()
@@ -0,0 +1,994 @@
+import bs
+import bsInternal
+import bsUtils
+import copy
+import os
+import threading
+import time
+import bsUI
+
+
+class SoundtracksWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight',originWidget=None):
+
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+
+        self._r = 'editSoundtrackWindow'
+        self._width = 600
+        self._height = 340 if bsUI.gSmallUI else 370 if bsUI.gMedUI else 440
+        spacing = 40
+        v = self._height - 40
+        v -= spacing*1.0
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=2.3 if bsUI.gSmallUI else 1.6 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-18) if bsUI.gSmallUI else (0,0))
+
+        if bsUI.gToolbars and bsUI.gSmallUI:
+            self._backButton = None
+        else:
+            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(45,self._height-60),size=(120,60),
+                                                                scale=0.8,label=bs.Lstr(resource='backText'),buttonType='back',autoSelect=True)
+            if bsUI.gDoAndroidNav:
+                bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(116,self._height-38))
+                
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-35),size=(0,0),maxWidth=300,
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="center")
+
+        
+        h = 43
+        v = self._height - 60
+        hspacing = 15
+        bColor = (0.6,0.53,0.63)
+        bTextColor = (0.75,0.7,0.8)
+
+        s = 1.0 if bsUI.gSmallUI else 1.13 if bsUI.gMedUI else 1.4
+        v -= 60.0*s
+        self._newButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
+                                              onActivateCall=self._newSoundtrack,
+                                              color=bColor,
+                                              buttonType='square',
+                                              autoSelect=True,
+                                              textColor=bTextColor,
+                                              textScale=0.7,
+                                              label=bs.Lstr(resource=self._r+'.newText'))
+        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
+        v -= 60.0*s
+
+
+        self._editButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
+                                               onActivateCall=self._editSoundtrack,
+                                               color=bColor,
+                                               buttonType='square',
+                                               autoSelect=True,
+                                               textColor=bTextColor,
+                                               textScale=0.7,
+                                               label=bs.Lstr(resource=self._r+'.editText'))
+        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
+        v -= 60.0*s
+
+        self._duplicateButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
+                                                    onActivateCall=self._duplicateSoundtrack,
+                                                    buttonType='square',
+                                                    autoSelect=True,
+                                                    color=bColor,
+                                                    textColor=bTextColor,
+                                                    textScale=0.7,
+                                                    label=bs.Lstr(resource=self._r+'.duplicateText'))
+        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
+        v -= 60.0*s
+
+        self._deleteButton = b = bs.buttonWidget(parent=self._rootWidget,position=(h,v),size=(100,55.0*s),
+                                                 onActivateCall=self._deleteSoundtrack,
+                                                 color=bColor,
+                                                 buttonType='square',
+                                                 autoSelect=True,
+                                                 textColor=bTextColor,
+                                                 textScale=0.7,
+                                                 label=bs.Lstr(resource=self._r+'.deleteText'))
+        if self._backButton is None: bs.widget(edit=b,leftWidget=bsInternal._getSpecialWidget('backButton'))
+
+        v = self._height - 65
+        scrollHeight = self._height - 105
+        v -= scrollHeight
+        hspacing = 15
+        self._scrollWidget = scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=(152,v),highlight=False,size=(self._width-205,scrollHeight))
+        bs.widget(edit=self._scrollWidget,leftWidget=self._newButton,rightWidget=bsInternal._getSpecialWidget('partyButton') if bsUI.gToolbars else self._scrollWidget)
+        self._c = bs.columnWidget(parent=scrollWidget)
+
+        
+        self._soundtracks = None
+        self._selectedSoundtrack = None
+        self._selectedSoundtrackIndex = None
+        self._soundtrackWidgets = []
+        self._allowChangingSoundtracks = False
+        self._refresh()
+        if self._backButton is not None:
+            bs.buttonWidget(edit=backButton,onActivateCall=self._back)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=backButton)
+        else:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
+
+        # try:
+        #     for b in [self._newButton,self._editButton,self._duplicateButton,self._deleteButton]:
+        #         bs.widget(edit=b,upWidget=scrollWidget)
+        #     self._restoreState()
+        # except Exception:
+        #     bs.printException('exception wiring up SoundtracksWindow')
+        
+    def _doDeleteSoundtrack(self):
+        try: del bs.getConfig()['Soundtracks'][self._selectedSoundtrack]
+        except Exception: pass
+        bs.writeConfig()
+        bs.playSound(bs.getSound('shieldDown'))
+        if self._selectedSoundtrackIndex >= len(self._soundtracks):
+            self._selectedSoundtrackIndex = len(self._soundtracks)
+        self._refresh()
+
+    def _deleteSoundtrack(self):
+        if self._selectedSoundtrack is None: return
+        if self._selectedSoundtrack == '__default__':
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource=self._r+'.cantDeleteDefaultText'))
+        else:
+            bsUI.ConfirmWindow(bs.Lstr(resource=self._r+'.deleteConfirmText',subs=[("${NAME}",self._selectedSoundtrack)]),self._doDeleteSoundtrack,450,150)
+
+    def _duplicateSoundtrack(self):
+        try: soundtracks = [bs.getConfig()['Soundtracks']]
+        except Exception: bs.getConfig()['Soundtracks'] = {}
+
+        if self._selectedSoundtrack is None: return
+        if self._selectedSoundtrack == '__default__':
+            pl = {}
+        else:
+            pl = bs.getConfig()['Soundtracks'][self._selectedSoundtrack]
+
+        # find a valid dup name that doesn't exist
+        testIndex = 1
+        copyText = bs.Lstr(resource='copyOfText').evaluate()
+        copyWord = copyText.replace('${NAME}','').strip() # get just 'Copy' or whatnot
+        baseName = self._getSoundtrackDisplayName(self._selectedSoundtrack).evaluate()
+        if type(baseName) is not unicode:
+            print 'expected uni baseName 3fj0'
+            baseName = baseName.decode('utf-8')
+        
+        # if it looks like a copy, strip digits and spaces off the end
+        if copyWord in baseName:
+            while baseName[-1].isdigit() or baseName[-1] == ' ': baseName = baseName[:-1]
+        while True:
+            if copyWord in baseName: testName = baseName
+            else: testName = copyText.replace('${NAME}',baseName)
+            if testIndex > 1: testName += ' '+str(testIndex)
+            if not testName in bs.getConfig()['Soundtracks']: break
+            testIndex += 1
+
+            # testName = baseName + (copyStr if testIndex < 2 else copyStr+' '+str(testIndex))
+            # if not testName in bs.getConfig()['Soundtracks']:
+            #     break
+            # testIndex += 1
+
+        bs.getConfig()['Soundtracks'][testName] = copy.deepcopy(pl)
+        bs.writeConfig()
+        #bs.playSound(bs.getSound('gunCocking'))
+        self._refresh(selectSoundtrack=testName)
+
+
+    def _select(self,name,index):
+        self._selectedSoundtrackIndex = index
+        self._selectedSoundtrack = name
+
+        try: currentSoundtrack = bs.getConfig()['Soundtrack']
+        except Exception: currentSoundtrack = '__default__'
+
+        # if it varies from current, write to prefs and apply
+        if currentSoundtrack != name and self._allowChangingSoundtracks:
+            bs.playSound(bs.getSound('gunCocking'))
+            bs.getConfig()['Soundtrack'] = self._selectedSoundtrack
+            bs.writeConfig()
+            # just play whats already playing.. this'll grab it from the new soundtrack
+            bsUtils._playMusic(bsUtils.gMusicTypes['regular'])
+
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.ConfigAudioWindow(transition='inLeft').getRootWidget()
+
+    def _editSoundtrackWithSound(self):
+        bs.playSound(bs.getSound('swish'))
+        self._editSoundtrack()
+
+    def _editSoundtrack(self):
+        if self._selectedSoundtrack is None: return
+        if self._selectedSoundtrack == u'__default__':
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource=self._r+'.cantEditDefaultText'))
+            return
+
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = EditSoundtrackWindow(existingSoundtrack=self._selectedSoundtrack).getRootWidget()
+
+    def _getSoundtrackDisplayName(self,soundtrack):
+        if soundtrack == '__default__':
+            return bs.Lstr(resource=self._r+'.defaultSoundtrackNameText')
+        else:
+            return bs.Lstr(value=soundtrack)
+        
+    def _refresh(self,selectSoundtrack=None):
+        self._allowChangingSoundtracks = False
+        oldSelection = self._selectedSoundtrack
+        # if there was no prev selection, look in prefs
+        if oldSelection is None:
+            try: oldSelection = bs.getConfig()['Soundtrack']
+            except Exception: pass
+        oldSelectionIndex = self._selectedSoundtrackIndex
+
+        # delete old
+        while len(self._soundtrackWidgets) > 0: self._soundtrackWidgets.pop().delete()
+        try: self._soundtracks = bs.getConfig()['Soundtracks']
+        except Exception: self._soundtracks = {}
+        items = self._soundtracks.items()
+        items.sort(key=lambda x:x[0].lower())
+        items = [['__default__',None]] + items # default is always first
+        index = 0
+        for pName,p in items:
+            w = bs.textWidget(parent=self._c,size=(self._width-40,24),
+                              text=self._getSoundtrackDisplayName(pName),hAlign='left',vAlign='center',
+                              maxWidth=self._width-110,
+                              alwaysHighlight=True,
+                              onSelectCall=bs.WeakCall(self._select,pName,index),
+                              onActivateCall=self._editSoundtrackWithSound,
+                              selectable=True)
+            if index == 0: bs.widget(edit=w,upWidget=self._backButton)
+            self._soundtrackWidgets.append(w)
+            # select this one if the user requested it
+            if selectSoundtrack is not None:
+                if pName == selectSoundtrack:
+                    bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
+            else:
+                # select this one if it was previously selected
+                if oldSelectionIndex is not None: # go by index if there's one
+                    if index == oldSelectionIndex:
+                        bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
+                else: # otherwise look by name
+                    if pName == oldSelection:
+                        bs.columnWidget(edit=self._c,selectedChild=w,visibleChild=w)
+            index += 1
+
+        # explicitly run select callback on current one and re-enable callbacks
+        
+        # eww need to run this in a timer so it happens after our select calbacks..
+        # with a small-enough time sometimes it happens before anyway.. ew.
+        # need a way to just schedule a callable i guess..
+        bs.realTimer(100,bs.WeakCall(self._setAllowChanging))
+
+    def _setAllowChanging(self):
+        self._allowChangingSoundtracks = True
+        self._select(self._selectedSoundtrack,self._selectedSoundtrackIndex)
+        
+    def _newSoundtrack(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        #EditSoundtrackWindow(existingSoundtrack=None,completionCall=self._createDone)
+        EditSoundtrackWindow(existingSoundtrack=None)
+
+    def _createDone(self,newSoundtrack):
+        if newSoundtrack is not None:
+            bs.playSound(bs.getSound('gunCocking'))
+            self._refresh(selectSoundtrack=newSoundtrack)
+
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._scrollWidget: selName = 'Scroll'
+            elif sel == self._newButton: selName = 'New'
+            elif sel == self._editButton: selName = 'Edit'
+            elif sel == self._duplicateButton: selName = 'Duplicate'
+            elif sel == self._deleteButton: selName = 'Delete'
+            elif sel == self._backButton: selName = 'Back'
+            else: raise Exception("unrecognized selection")
+            bsUI.gWindowStates[self.__class__.__name__] = selName
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]
+            except Exception: selName = None
+            if selName == 'Scroll': sel = self._scrollWidget
+            elif selName == 'New': sel = self._newButton
+            elif selName == 'Edit': sel = self._editButton
+            elif selName == 'Duplicate': sel = self._duplicateButton
+            elif selName == 'Delete': sel = self._deleteButton
+            else: sel = self._scrollWidget
+            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+
+
+class EditSoundtrackWindow(bsUI.Window):
+
+    def __init__(self,existingSoundtrack,transition='inRight'):
+
+        bsConfig = bs.getConfig()
+
+        self._r = 'editSoundtrackWindow'
+
+        self._folderTex = bs.getTexture('folder')
+        self._fileTex = bs.getTexture('file')
+
+        self._width = 648
+        self._height = 395 if bsUI.gSmallUI else 450 if bsUI.gMedUI else 560
+        spacing = 40
+        buttonWidth = 350
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
+                                              scale=2.08 if bsUI.gSmallUI else 1.5 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-48) if bsUI.gSmallUI else (0,15) if bsUI.gMedUI else (0,0))
+
+        cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(38,self._height-60),size=(160,60),
+                                           autoSelect=True,label=bs.Lstr(resource='cancelText'),scale=0.8)
+        saveButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-168,self._height-60),
+                                         autoSelect=True,size=(160,60),label=bs.Lstr(resource='saveText'),scale=0.8)
+        bs.widget(edit=saveButton,leftWidget=cancelButton)
+        bs.widget(edit=cancelButton,rightWidget=saveButton)
+        t = bs.textWidget(parent=self._rootWidget,position=(0,self._height-50),
+                          size=(self._width,25),
+                          text=bs.Lstr(resource=self._r+('.editSoundtrackText' if existingSoundtrack is not None else '.newSoundtrackText')),
+                          color=bsUI.gTitleColor,
+                          hAlign="center",vAlign="center",maxWidth=280)
+        v = self._height - 110
+
+        # make sure config exists
+        try: bsConfig['Soundtracks']
+        except Exception: bsConfig['Soundtracks'] = {}
+
+        if existingSoundtrack is not None:
+            # if they passed just a name, pull info from that soundtrack
+            if type(existingSoundtrack) is unicode:
+                self._soundtrack = copy.deepcopy(bsConfig['Soundtracks'][existingSoundtrack])
+                self._soundtrackName = existingSoundtrack
+                self._existingSoundtrackName = existingSoundtrack
+                self._lastEditedSongType = None
+            elif type(existingSoundtrack) is str:
+                print 'ERROR; got str existingSoundtrack'
+            else:
+                # otherwise they can pass info on an in-progress edit
+                self._soundtrack = existingSoundtrack['soundtrack']
+                self._soundtrackName = existingSoundtrack['name']
+                self._existingSoundtrackName = existingSoundtrack['existingName']
+                self._lastEditedSongType = existingSoundtrack['lastEditedSongType']
+        else:
+            self._soundtrackName = None
+            self._existingSoundtrackName = None
+            self._soundtrack = {}
+            self._lastEditedSongType = None
+
+        bs.textWidget(parent=self._rootWidget,
+                      # text=R.nameText,
+                      text=bs.Lstr(resource=self._r+'.nameText'),
+                      maxWidth=80,scale=0.8,
+                      position=(105,v+19),color=(0.8,0.8,0.8,0.5),size=(0,0),hAlign='right',vAlign='center')
+
+        # if there's no initial value, find a good initial unused name
+        if existingSoundtrack is None:
+            i = 1
+            stNameText = bs.Lstr(resource=self._r+'.newSoundtrackNameText').evaluate()
+            if '${COUNT}' not in stNameText: stNameText = stNameText+' ${COUNT}' # make sure we insert number *somewhere*
+            while True:
+                self._soundtrackName = stNameText.replace('${COUNT}',str(i))
+                if self._soundtrackName not in bsConfig['Soundtracks']: break
+                i += 1
+
+        self._textField = bs.textWidget(parent=self._rootWidget,position=(120,v-5),size=(self._width - 160,43),
+                                        text=self._soundtrackName,hAlign="left",
+                                        vAlign="center",
+                                        maxChars=32,
+                                        autoSelect=True,
+                                        editable=True,padding=4,
+                                        onReturnPressCall=self._doItWithSound)
+        
+        scrollHeight = self._height - 180
+        self._scrollWidget = scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=(40,v-(scrollHeight+10)),size=(self._width-80,scrollHeight),simpleCullingV=10)
+        bs.widget(edit=self._textField,downWidget=self._scrollWidget)
+        self._col = bs.columnWidget(parent=scrollWidget)
+
+        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+        bs.containerWidget(edit=self._col,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+
+        self._songTypeButtons = {}
+        self._refresh()
+        bs.buttonWidget(edit=cancelButton,onActivateCall=self._cancel)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=cancelButton)
+        bs.buttonWidget(edit=saveButton,onActivateCall=self._doIt)
+        bs.containerWidget(edit=self._rootWidget,startButton=saveButton)
+
+        bs.widget(edit=self._textField,upWidget=cancelButton)
+        bs.widget(edit=cancelButton,downWidget=self._textField)
+        
+    def _refresh(self):
+        for w in self._col.getChildren():
+            w.delete()
+            
+        types = ['Menu',
+                 'CharSelectCOOP',
+                 'CharSelectFFA',
+                 'CharSelectTEAMS',
+                 'Last Stand',
+                 'ToTheDeath',
+                 'Onslaught',
+                 'Keep Away',
+                 'Race',
+                 'Epic Race',
+                 'Nightmare',
+                 'Marathon',
+                 'ForwardMarch',
+                 'FlagCatcher',
+                 'FlagSlip',
+                 'FlagDropper',
+                 'FlagBomber',
+                 'FlagRunner',
+                 'Survival',
+                 'Epic',
+                 'Hockey',
+                 'Football',
+                 'Flying',
+                 'Scary',
+                 'Marching',
+                 'GrandRomp',
+                 'Where Eagles Dare',
+                 'Toilet',
+                 'Chosen One',
+                 'Scores',
+                 'Victory',
+                 ]
+        # FIXME - we should probably convert this to use translations...
+        typeNamesTranslated = bsUtils._getResource('soundtrackTypeNames')
+        prevTypeButton = None
+        prevTestButton = None
+
+        bColor = (0.6,0.53,0.63)
+        bTextColor = (0.75,0.7,0.8)
+        
+        for index,songType in enumerate(types):
+            r = bs.rowWidget(parent=self._col,size=(self._width-40,40))
+            bs.containerWidget(edit=r,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+            try: typeName = typeNamesTranslated[songType]
+            except Exception: typeName = songType
+            t = bs.textWidget(parent=r,size=(230,25),alwaysHighlight=True,
+                              text=typeName,scale=0.7,hAlign='left',vAlign='center',maxWidth=190)
+
+            if songType in self._soundtrack: entry = self._soundtrack[songType]
+            else: entry = None
+
+            if entry is not None: entry = copy.deepcopy(entry) # make sure they dont muck with this after it gets to us
+
+            iconType = self._getEntryButtonDisplayIconType(entry)
+            self._songTypeButtons[songType] = b = bs.buttonWidget(parent=r,size=(230,32),label=self._getEntryButtonDisplayName(entry),
+                                                                  textScale=0.6,onActivateCall=bs.Call(self._getEntry,songType,entry,typeName),
+                                                                  icon=self._fileTex if iconType == 'file' else self._folderTex if iconType == 'folder' else None,
+                                                                  #color=bColor,textColor=(1,1,1),
+                                                                  iconColor=(1.1,0.8,0.2) if iconType == 'folder' else (1,1,1),
+                                                                  leftWidget=self._textField,
+                                                                  iconScale=0.7,autoSelect=True,upWidget=prevTypeButton)
+                                                                  #iconScale=0.7,upWidget=prevTypeButton)
+            if index == 0: bs.widget(edit=b,upWidget=self._textField)
+            bs.widget(edit=b,downWidget=b)
+
+            if self._lastEditedSongType is not None and songType == self._lastEditedSongType:
+                bs.containerWidget(edit=r,selectedChild=b,visibleChild=b)
+                bs.containerWidget(edit=self._col,selectedChild=r,visibleChild=r)
+                bs.containerWidget(edit=self._scrollWidget,selectedChild=self._col,visibleChild=self._col)
+                bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget,visibleChild=self._scrollWidget)
+                
+            if prevTypeButton is not None: bs.widget(edit=prevTypeButton,downWidget=b)
+            prevTypeButton = b
+            t = bs.textWidget(parent=r,size=(10,32),text='') # spacing..
+            b = bs.buttonWidget(parent=r,size=(50,32),
+                                label=bs.Lstr(resource=self._r+'.testText'),
+                                textScale=0.6,onActivateCall=bs.Call(self._test,songType),
+                                upWidget=prevTestButton if prevTestButton is not None else self._textField)
+            if prevTestButton is not None: bs.widget(edit=prevTestButton,downWidget=b)
+            bs.widget(edit=b,downWidget=b,rightWidget=b)
+            prevTestButton = b
+
+    @classmethod
+    def _restoreEditor(cls,state,musicType,entry):
+        #print 'GOT CB',state,musicType,entry
+        # apply the change and recreate the window
+        soundtrack = state['soundtrack']
+        existingEntry = None if musicType not in soundtrack else soundtrack[musicType]
+        if existingEntry != entry:
+            bs.playSound(bs.getSound('gunCocking'))
+
+        # make sure this doesn't get mucked with after we get it
+        if entry is not None: entry = copy.deepcopy(entry)
+
+        entryType = bsUtils._getSoundtrackEntryType(entry)
+        if entryType == 'default':
+            # for 'default' entries simply exclude them from the list
+            if musicType in soundtrack: del soundtrack[musicType]
+        else:
+            soundtrack[musicType] = entry
+
+        bsUI.uiGlobals['mainMenuWindow'] = cls(state,transition='inLeft').getRootWidget()
+        
+    def _getEntry(self,songType,entry,selectionTargetName):
+        if selectionTargetName != '':
+            selectionTargetName = "'"+selectionTargetName+"'"
+        state = {'name':self._soundtrackName,'existingName':self._existingSoundtrackName,'soundtrack':self._soundtrack,'lastEditedSongType':songType}
+        #bsUtils.getMusicPlayer().selectEntry(bs.Call(self._completionCB,songType),name)
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        bsUI.uiGlobals['mainMenuWindow'] = bsUtils.getMusicPlayer().selectEntry(bs.Call(self._restoreEditor,state,songType),entry,selectionTargetName).getRootWidget()
+
+    def _test(self,songType):
+        # warn if volume is zero
+        if bsInternal._getSetting("Music Volume") < 0.01:
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource=self._r+'.musicVolumeZeroWarning'),color=(1,0.5,0))
+        bsUtils.setMusicPlayMode('test')
+        bsUtils._playMusic(songType,mode='test',testSoundtrack=self._soundtrack)
+
+    def _getEntryButtonDisplayName(self,entry):
+        entryType = bsUtils._getSoundtrackEntryType(entry)
+        if entryType == 'default':
+            entryName = bs.Lstr(resource=self._r+'.defaultGameMusicText')
+        elif entryType in ('musicFile','musicFolder'):
+            entryName = os.path.basename(bsUtils._getSoundtrackEntryName(entry))
+        else:
+            entryName = bsUtils._getSoundtrackEntryName(entry)
+        return entryName
+
+    def _getEntryButtonDisplayIconType(self,entry):
+        entryType = bsUtils._getSoundtrackEntryType(entry)
+        if entryType == 'musicFile':
+            return 'file'
+        elif entryType == 'musicFolder':
+            return 'folder'
+        else: return None
+
+    # def _completionCB(self,musicType,entry):
+    #     existingEntry = None if musicType not in self._soundtrack else self._soundtrack[musicType]
+    #     if existingEntry != entry:
+    #         bs.playSound(bs.getSound('gunCocking'))
+
+    #     # make sure this doesn't get mucked with after we get it
+    #     if entry is not None: entry = copy.deepcopy(entry)
+
+    #     entryType = bsUtils._getSoundtrackEntryType(entry)
+    #     if entryType == 'default':
+    #         # for 'default' entries simply exclude them from the list
+    #         if musicType in self._soundtrack: del self._soundtrack[musicType]
+    #     else:
+    #         self._soundtrack[musicType] = entry
+
+    #     bs.buttonWidget(edit=self._songTypeButtons[musicType],label=self._getEntryButtonDisplayName(entry),
+    #                     onActivateCall=bs.Call(self._getEntry,musicType,entry))
+
+    def _cancel(self):
+        # resets music back to normal..
+        bsUtils.setMusicPlayMode('regular')
+
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        bsUI.uiGlobals['mainMenuWindow'] = SoundtracksWindow(transition='inLeft').getRootWidget()
+        #self._completionCall(None)
+
+    def _doIt(self):
+
+        bsConfig = bs.getConfig()
+        newName = bs.uni(bs.textWidget(query=self._textField))
+        if newName != self._soundtrackName and newName in bsConfig['Soundtracks']:
+            bs.screenMessage(bs.Lstr(resource=self._r+'.cantSaveAlreadyExistsText'))
+            bs.playSound(bs.getSound('error'))
+            return
+        if len(newName) == 0:
+            bs.playSound(bs.getSound('error'))
+            return
+        if newName == bs.Lstr(resource=self._r+'.defaultSoundtrackNameText').evaluate():
+            bs.screenMessage(bs.Lstr(resource=self._r+'.cantOverwriteDefaultText'))
+            bs.playSound(bs.getSound('error'))
+            return
+
+        # make sure config exists
+        try: bsConfig['Soundtracks']
+        except Exception: bsConfig['Soundtracks'] = {}
+
+        # if we had an old one, delete it
+        if self._existingSoundtrackName is not None and self._existingSoundtrackName in bsConfig['Soundtracks']:
+            del bsConfig['Soundtracks'][self._existingSoundtrackName]
+        bsConfig['Soundtracks'][newName] = self._soundtrack
+        bsConfig['Soundtrack'] = newName
+        
+        bs.writeConfig()
+        bs.playSound(bs.getSound('gunCocking'))
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        
+        # resets music back to normal
+        bsUtils.setMusicPlayMode('regular',forceRestart=True)
+
+        bsUI.uiGlobals['mainMenuWindow'] = SoundtracksWindow(transition='inLeft').getRootWidget()
+        #self._completionCall(newName)
+
+    def _doItWithSound(self):
+        bs.playSound(bs.getSound('swish'))
+        self._doIt()
+
+
+class GetSoundtrackEntryTypeWindow(bsUI.Window):
+
+    def __init__(self,callback,currentEntry,selectionTargetName,transition='inRight'):
+
+        self._r = 'editSoundtrackWindow'
+
+        self._callback = callback
+        self._currentEntry = copy.deepcopy(currentEntry)
+
+        self._width = 580
+        self._height = 220
+        spacing = 80
+        
+        doDefault = True
+        doITunesPlaylist = bsUtils._isSoundtrackEntryTypeSupported('iTunesPlaylist')
+        doMusicFile = bsUtils._isSoundtrackEntryTypeSupported('musicFile')
+        doMusicFolder = bsUtils._isSoundtrackEntryTypeSupported('musicFolder')
+
+        if doITunesPlaylist: self._height += spacing
+        if doMusicFile: self._height += spacing
+        if doMusicFolder: self._height += spacing
+
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition=transition,
+                                              scale=1.7 if bsUI.gSmallUI else 1.4 if bsUI.gMedUI else 1.0)
+        b = bs.buttonWidget(parent=self._rootWidget,position=(35,self._height-65),size=(160,60),scale=0.8,textScale=1.2,
+                            label=bs.Lstr(resource='cancelText'),onActivateCall=self._onCancelPress)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-32),size=(0,0),
+                          text=bs.Lstr(resource=self._r+'.selectASourceText'),
+                          color=bsUI.gTitleColor,
+                          maxWidth=230,hAlign="center",vAlign="center")
+
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-56),size=(0,0),
+                          text=selectionTargetName,color=bsUI.gInfoTextColor,
+                          scale=0.7,maxWidth=230,hAlign="center",vAlign="center")
+
+        v = self._height - 155
+
+        currentEntryType = bsUtils._getSoundtrackEntryType(currentEntry)
+
+        if doDefault:
+            b = defaultGameMusicButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
+                                                         label=bs.Lstr(resource=self._r+'.useDefaultGameMusicText'),
+                                                         onActivateCall=self._onDefaultPress)
+            if currentEntryType == 'default':
+                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
+            v -= spacing
+
+        if doITunesPlaylist:
+            b = iTunesPlaylistButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
+                                                       label=bs.Lstr(resource=self._r+'.useITunesPlaylistText'),
+                                                       onActivateCall=self._onITunesPlaylistPress,
+                                                       icon=None)
+            if currentEntryType == 'iTunesPlaylist':
+                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
+            v -= spacing
+
+        if doMusicFile:
+            b = musicFileButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
+                                                  label=bs.Lstr(resource=self._r+'.useMusicFileText'),
+                                                  onActivateCall=self._onMusicFilePress,
+                                                  icon=bs.getTexture('file'))
+            if currentEntryType == 'musicFile':
+                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
+            v -= spacing
+
+        if doMusicFolder:
+            b = musicFolderButton = bs.buttonWidget(parent=self._rootWidget,size=(self._width-100,60),position=(50,v),
+                                                    label=bs.Lstr(resource=self._r+'.useMusicFolderText'),
+                                                    onActivateCall=self._onMusicFolderPress,
+                                                    icon=bs.getTexture('folder'),iconColor=(1.1,0.8,0.2))
+            if currentEntryType == 'musicFolder':
+                bs.containerWidget(edit=self._rootWidget,selectedChild=b)
+            v -= spacing
+
+    def _onITunesPlaylistPress(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+
+        if bsUtils._getSoundtrackEntryType(self._currentEntry) == 'iTunesPlaylist':
+            currentPlaylistEntry = bsUtils._getSoundtrackEntryName(self._currentEntry)
+        else:
+            currentPlaylistEntry = None
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.GetMacITunesPlaylistWindow(self._callback,currentPlaylistEntry,self._currentEntry).getRootWidget()
+
+    def _onMusicFilePress(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        basePath = bsInternal._androidGetExternalStoragePath()
+        bsUI.uiGlobals['mainMenuWindow'] = FileSelectorWindow(basePath,callback=self._musicFileSelectorCB,
+                                                         showBasePath=False,
+                                                         validFileExtensions=bsUtils._getValidMusicFileExtensions(),
+                                                         allowFolders=False).getRootWidget()
+
+    def _onMusicFolderPress(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        basePath = bsInternal._androidGetExternalStoragePath()
+        bsUI.uiGlobals['mainMenuWindow'] = FileSelectorWindow(basePath,callback=self._musicFolderSelectorCB,
+                                                         showBasePath=False,
+                                                         validFileExtensions=[],
+                                                         allowFolders=True).getRootWidget()
+
+    def _musicFileSelectorCB(self,result):
+        if result is None:
+            self._callback(self._currentEntry)
+        else:
+            self._callback({'type':'musicFile','name':bs.uni(result)})
+
+    def _musicFolderSelectorCB(self,result):
+        if result is None:
+            self._callback(self._currentEntry)
+        else:
+            self._callback({'type':'musicFolder','name':bs.uni(result)})
+
+    def _onDefaultPress(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        self._callback(None)
+        
+    def _onCancelPress(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        self._callback(self._currentEntry)
+
+
+class FileSelectorWindow(bsUI.Window):
+
+    def __init__(self,path,callback=None,showBasePath=True,validFileExtensions=[],allowFolders=False):
+        self._width = 600
+        self._height = 365 if bsUI.gSmallUI else 418
+        self._callback = callback
+        self._basePath = path
+        self._path = None
+        self._recentPaths = []
+        self._showBasePath = showBasePath
+        self._validFileExtensions = ['.'+ext for ext in validFileExtensions]
+        self._allowFolders = allowFolders
+        
+        self._scrollWidth = self._width-80
+        self._scrollHeight = self._height-170
+        self._r = 'fileSelectorWindow'
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height),transition='inRight',
+                                              scale=2.23 if bsUI.gSmallUI else 1.4 if bsUI.gMedUI else 1.0,
+                                              stackOffset=(0,-35) if bsUI.gSmallUI else (0,0))
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-42),size=(0,0),
+                          color=bsUI.gTitleColor,hAlign="center",vAlign="center",
+                          text=bs.Lstr(resource=self._r+'.titleFolderText') if (allowFolders and not validFileExtensions) else bs.Lstr(resource=self._r+'.titleFileText') if not allowFolders else bs.Lstr(resource=self._r+'.titleFileFolderText'),
+                          maxWidth=210)
+
+        
+        self._buttonWidth = 146
+        self._cancelButton = b = bs.buttonWidget(parent=self._rootWidget,position=(35,self._height-67),
+                                                 autoSelect=True,size=(self._buttonWidth,50),label=bs.Lstr(resource='cancelText'),onActivateCall=self._cancel)
+        bs.widget(edit=self._cancelButton,leftWidget=self._cancelButton)
+
+        bColor = (0.6,0.53,0.63)
+
+        self._backButton = bs.buttonWidget(parent=self._rootWidget,buttonType='square',position=(43,self._height-113),
+                                           color=bColor,textColor=(0.75,0.7,0.8),enableSound=False,
+                                           size=(55,35),label='Back' if False else bs.getSpecialChar('leftArrow'),onActivateCall=self._onBackPress)
+                                         #size=(55,35),label='Back' if False else bs.getSpecialChar('leftArrow')"\xee\x80\x81",call=self._onBackPress)
+                                         #size=(55,35),label='Up' if False else "\xc2\x81",call=self._onBackPress)
+
+        # self._upButton = bs.buttonWidget(parent=self._rootWidget,buttonType='square',position=(39,self._height-113),
+        #                                  color=bColor,textColor=(0.75,0.7,0.8),enableSound=False,
+        #                                  size=(65,35),label='Up' if False else "\xc2\x82",onActivateCall=self._onUpPress)
+
+
+        self._folderTex = bs.getTexture('folder')
+        self._folderColor = (1.1,0.8,0.2)
+        self._fileTex = bs.getTexture('file')
+        self._fileColor = (1,1,1)
+        self._useFolderButton = None
+
+        self._folderCenter = self._width*0.5+15
+
+        self._folderIcon = bs.imageWidget(parent=self._rootWidget,size=(40,40),position=(40,self._height-117),texture=self._folderTex,color=self._folderColor)
+        self._pathText = bs.textWidget(parent=self._rootWidget,position=(self._folderCenter,self._height-98),size=(0,0),
+                                       color=bsUI.gTitleColor,hAlign="center",vAlign="center",text=self._path,maxWidth=self._width*0.9)
+
+        # self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-119),
+        #                                      size=(self._scrollWidth,self._scrollHeight))
+
+
+        self._scrollWidget = None
+
+        bs.containerWidget(edit=self._rootWidget,
+                   #selectedChild=self._scrollWidget,
+                   #startButton=self._selectButton,
+                   cancelButton=self._cancelButton)
+
+        self._setPath(path)
+
+    def _onUpPress(self):
+        self._onEntryActivated('..')
+
+    def _onBackPress(self):
+        if len(self._recentPaths) > 1:
+            bs.playSound(bs.getSound('swish'))
+            self._recentPaths.pop()
+            self._setPath(self._recentPaths.pop())
+        else:
+            pass
+            bs.playSound(bs.getSound('error'))
+            #bs.screenMessage('can\'t go back further',color=(1,0,0))
+
+    def _onFolderEntryActivated(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        if self._callback is not None:
+            self._callback(self._path)
+        
+    def _onEntryActivated(self,entry):
+        try:
+            newPath = None
+            if entry == '..':
+                chunks = self._path.split('/')
+                if len(chunks) > 1:
+                    newPath = '/'.join(chunks[:-1])
+                    if newPath == '': newPath = '/'
+                else:
+                    bs.playSound(bs.getSound('error'))
+            else:
+                if self._path == '/': testPath = self._path+entry
+                else: testPath = self._path+'/'+entry
+                if os.path.isdir(bs.utf8(testPath)):
+                    bs.playSound(bs.getSound('swish'))
+                    newPath = testPath
+                elif os.path.isfile(bs.utf8(testPath)):
+                    if self._isValidFilePath(testPath):
+                        bs.playSound(bs.getSound('swish'))
+                        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+                        if self._callback is not None:
+                            self._callback(testPath)
+                    else:
+                        bs.playSound(bs.getSound('error'))
+                else: print 'Error: FileSelectorWindow found non-file/dir:',testPath
+        except Exception:
+            bs.printException('error on FileSelectorWindow._onEntryActivated')
+
+        if newPath is not None:
+            self._setPath(newPath)
+
+    class _RefreshThread(threading.Thread):
+            
+        def __init__(self,path,callback):
+            threading.Thread.__init__(self)
+            self._callback = callback
+            self._path = path
+        def run(self):
+            try:
+                startTime = time.time()
+                files = [bs.uni(f) for f in os.listdir(bs.utf8(self._path))]
+                duration = time.time()-startTime
+                minTime = 0.1
+                # make sure this takes at least 1/10 second so the user has time to see the selection highlight
+                if duration < minTime: time.sleep(minTime-duration)
+                bs.callInGameThread(bs.Call(self._callback,fileNames=files))
+            except Exception,e:
+                bs.printException()
+                bs.callInGameThread(bs.Call(self._callback,error=str(e)))
+
+    def _setPath(self,path,addToRecent=True):
+        self._path = path
+        if addToRecent: self._recentPaths.append(path)
+        self._RefreshThread(path,self._refresh).start()
+        
+    def _refresh(self,fileNames=None,error=None):
+
+        scrollWidgetSelected = (self._scrollWidget is None or self._rootWidget.getSelectedChild() == self._scrollWidget)
+
+        inTopFolder = (self._path == self._basePath)
+        hideTopFolder = inTopFolder and self._showBasePath is False
+
+        if hideTopFolder: folderName = ''
+        elif self._path == '/': folderName = '/'
+        else: folderName = os.path.basename(self._path)
+
+        bColor = (0.6,0.53,0.63)
+        bColorDisabled = (0.65,0.65,0.65)
+
+        if len(self._recentPaths) < 2:
+            bs.buttonWidget(edit=self._backButton,color=bColorDisabled,textColor=(0.5,0.5,0.5))
+        else:
+            bs.buttonWidget(edit=self._backButton,color=bColor,textColor=(0.75,0.7,0.8))
+
+        maxStrWidth = 300
+        strWidth = min(maxStrWidth,bsInternal._getStringWidth(folderName,suppressWarning=True))
+        bs.textWidget(edit=self._pathText,text=folderName,maxWidth=maxStrWidth)
+        bs.imageWidget(edit=self._folderIcon,position=(self._folderCenter-strWidth*0.5-40,self._height-117),opacity=0.0 if hideTopFolder else 1.0)
+
+        if self._scrollWidget is not None:
+            self._scrollWidget.delete()
+
+        if self._useFolderButton is not None:
+            self._useFolderButton.delete()
+            bs.widget(edit=self._cancelButton,rightWidget=self._backButton)
+
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-119),
+                                             size=(self._scrollWidth,self._scrollHeight))
+
+        if scrollWidgetSelected:
+            bs.containerWidget(edit=self._rootWidget,selectedChild=self._scrollWidget)
+
+        # show error case..
+        if error is not None:
+            self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._scrollWidth,self._scrollHeight),background=False)
+            bs.textWidget(parent=self._subContainer,color=(1,1,0,1),text=error,maxWidth=self._scrollWidth*0.9,
+                          position=(self._scrollWidth*0.48,self._scrollHeight*0.57),size=(0,0),
+                          hAlign='center',vAlign='center')
+
+        else:
+            fileNames = [f for f in fileNames if not f.startswith('.')]
+            fileNames.sort(key=lambda x:x[0].lower())
+
+            entries = fileNames
+            entryHeight = 35
+
+            folderEntryHeight = 100
+            showFolderEntry = False
+
+            showUseFolderButton = (self._allowFolders and not inTopFolder)
+
+            self._subContainerHeight = entryHeight*len(entries) + (folderEntryHeight if showFolderEntry else 0)
+            v = self._subContainerHeight - (folderEntryHeight if showFolderEntry else 0)
+
+            self._subContainer = bs.containerWidget(parent=self._scrollWidget,size=(self._scrollWidth,self._subContainerHeight),background=False)
+
+            bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=False,claimsTab=False)
+            bs.containerWidget(edit=self._subContainer,claimsLeftRight=False,claimsTab=False,
+                               selectionLoops=False,printListExitInstructions=False)
+            bs.widget(edit=self._subContainer,upWidget=self._backButton)
+
+            if showUseFolderButton:
+                self._useFolderButton = b = bs.buttonWidget(parent=self._rootWidget,position=(self._width - self._buttonWidth-35,self._height-67),
+                                                            size=(self._buttonWidth,50),
+                                                            label=bs.Lstr(resource=self._r+'.useThisFolderButtonText'),
+                                                            onActivateCall=self._onFolderEntryActivated)
+                bs.widget(edit=b,leftWidget=self._cancelButton,downWidget=self._scrollWidget)
+                bs.widget(edit=self._cancelButton,rightWidget=b)
+                bs.containerWidget(edit=self._rootWidget,startButton=b)
+                
+
+            folderIconSize = 35
+            for num,entry in enumerate(entries):
+                c = bs.containerWidget(parent=self._subContainer,position=(0,v-entryHeight),
+                                       size=(self._scrollWidth,entryHeight),rootSelectable=True,
+                                       background=False,clickActivate=True,
+                                       onActivateCall=bs.Call(self._onEntryActivated,entry))
+                if num == 0:
+                    bs.widget(edit=c,upWidget=self._backButton)
+                isValidFilePath = self._isValidFilePath(entry)
+                isDir = os.path.isdir(bs.utf8(self._path+'/'+entry))
+                if isDir:
+                    i = bs.imageWidget(parent=c,size=(folderIconSize,folderIconSize),position=(10,0.5*entryHeight-folderIconSize*0.5),
+                                       drawController=c,texture=self._folderTex,color=self._folderColor)
+                else:
+                    i = bs.imageWidget(parent=c,size=(folderIconSize,folderIconSize),position=(10,0.5*entryHeight-folderIconSize*0.5),
+                                       opacity=1.0 if isValidFilePath else 0.5,
+                                       drawController=c,texture=self._fileTex,color=self._fileColor)
+                t = bs.textWidget(parent=c,drawController=c,text=entry,hAlign='left',vAlign='center',
+                                  position=(10+folderIconSize*1.05,entryHeight*0.5),
+                                  size=(0,0),maxWidth=self._scrollWidth*0.93-50,color=(1,1,1,1) if (isValidFilePath or isDir) else (0.5,0.5,0.5,1))
+                v -= entryHeight
+                
+    def _isValidFilePath(self,path):
+        return any(path.lower().endswith(ext) for ext in self._validFileExtensions)
+        
+    def _cancel(self):
+        bs.containerWidget(edit=self._rootWidget,transition='outRight')
+        if self._callback is not None:
+            self._callback(None)
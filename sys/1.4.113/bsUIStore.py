@@ -0,0 +1,655 @@
+import bs
+import bsInternal
+import bsUtils
+import copy
+import math
+import weakref
+import bsUI
+
+
+class StoreWindow(bsUI.Window):
+
+    def _updateGetTicketsButtonPos(self):
+        if self._getTicketsButton.exists():
+            p = (self._width-252-(47 if bsUI.gSmallUI and bsInternal._isPartyIconVisible() else 0),self._height-70)
+            bs.buttonWidget(edit=self._getTicketsButton,position=p)
+        
+    def __init__(self,transition='inRight',modal=False,showTab=None,
+                 onCloseCall=None,backLocation=None,originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Store Window')
+        
+        # if they provided an origin-widget, scale up from that
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+        
+        self._backLocation = backLocation
+        self._onCloseCall = onCloseCall
+        self._showTab = showTab
+        self._modal = modal
+        self._width = 1040
+        self._height = 578 if bsUI.gSmallUI else 645 if bsUI.gMedUI else 800
+        self._currentTab = None
+        extraTop = 30 if bsUI.gSmallUI else 0
+        
+        self._request = None
+        self._r = 'store'
+        self._lastBuyTime = 0
+
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
+                                              toolbarVisibility='MENU_FULL',
+                                              scale=1.3 if bsUI.gSmallUI else 0.9 if bsUI.gMedUI else 0.8,
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              stackOffset=(0,-5) if bsUI.gSmallUI else (0,0) if bsUI.gMedUI else (0,0))
+
+        self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,position=(70,self._height-74),size=(140,60),scale=1.1,
+                                                            autoSelect=True,
+                                                            label=bs.Lstr(resource='doneText' if self._modal else 'backText'),
+                                                            buttonType=None if self._modal else 'back',
+                                                            onActivateCall=self._back)
+        bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+
+        self._getTicketsButton = b = bs.buttonWidget(parent=self._rootWidget,
+                                                     size=(210,65),
+                                                     onActivateCall=self._onGetMoreTicketsPress,
+                                                     autoSelect=True,
+                                                     scale=0.9,
+                                                     textScale=1.4,
+                                                     leftWidget=self._backButton,
+                                                     color=(0.7,0.5,0.85),
+                                                     # textColor=(1,0.5,0),
+                                                     textColor=(0.2, 1.0, 0.2),
+                                                     label=bs.Lstr(resource='getTicketsWindow.titleText'))
+        
+        # move this dynamically to keep it out of the way of the party icon :-(
+        self._updateGetTicketsButtonPos()
+        self._getTicketPosUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateGetTicketsButtonPos),repeat=True,timeType='real')
+        bs.widget(edit=self._backButton,rightWidget=self._getTicketsButton)
+        self._ticketTextUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateTicketsText),timeType='real',repeat=True)
+        self._updateTicketsText()
+
+        env = bs.getEnvironment()
+        if env['platform'] in ['mac','ios'] and env['subplatform'] == 'appstore':
+            # b = bs.buttonWidget(parent=self._rootWidget,position=(self._width-240,60),size=(230,60),scale=0.7,
+            b = bs.buttonWidget(parent=self._rootWidget,position=(self._width*0.5-70,16),size=(230,50),scale=0.65,
+                                onActivateCall=bs.WeakCall(self._restorePurchases),
+                                #color=(0.45,0.4,0.5),
+                                color=(0.35,0.3,0.4),
+                                selectable=False,
+                                textColor=(0.55,0.5,0.6),
+                                label=bs.Lstr(resource='getTicketsWindow.restorePurchasesText'))
+
+
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-44),size=(0,0),
+                          color=bsUI.gTitleColor,scale=1.5,hAlign="center",vAlign="center",
+                          text=bs.Lstr(resource='storeText'),
+                          maxWidth=420)
+
+        if not self._modal and bsUI.gDoAndroidNav:
+            bs.buttonWidget(edit=self._backButton,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+            # bs.textWidget(edit=t,hAlign='left',position=(153,self._height-44))
+
+        scrollBufferH = 130
+        tabBufferH = 250
+        
+        tabsDef = [['extras',bs.Lstr(resource=self._r+'.extrasText')],
+                   ['maps',bs.Lstr(resource=self._r+'.mapsText')],
+                   ['minigames',bs.Lstr(resource=self._r+'.miniGamesText')],
+                   ['characters',bs.Lstr(resource=self._r+'.charactersText')],
+                   ['icons',bs.Lstr(resource=self._r+'.iconsText')]]
+
+        tabResults = bsUI._createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
+                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab,returnExtraInfo=True)
+
+        self._purchasableCountWidgets = {}
+        
+        # create our purchasable-items tags and have them update over time..
+        for i,tab in enumerate(tabsDef):
+            pos = tabResults['positions'][i]
+            size = tabResults['sizes'][i]
+            button = tabResults['buttonsIndexed'][i]
+            rad = 10
+            center = (pos[0]+0.1*size[0],pos[1]+0.9*size[1])
+            img = bs.imageWidget(parent=self._rootWidget,position=(center[0]-rad*1.04,center[1]-rad*1.15),size=(rad*2.2,rad*2.2),
+                           texture=bs.getTexture('circleShadow'),color=(1,0,0))
+            txt = bs.textWidget(parent=self._rootWidget,position=center,size=(0,0),hAlign='center',vAlign='center',
+                                maxWidth=1.4*rad,scale=0.6,shadow=1.0,flatness=1.0)
+            rad = 20
+            saleImg = bs.imageWidget(parent=self._rootWidget,position=(center[0]-rad,center[1]-rad),size=(rad*2,rad*2),
+                                     drawController=button,
+                                     texture=bs.getTexture('circleZigZag'),color=(0.5,0,1.0))
+            saleTitleText = bs.textWidget(parent=self._rootWidget,position=(center[0],center[1]+0.24*rad),size=(0,0),hAlign='center',vAlign='center',
+                                          drawController=button,
+                                          maxWidth=1.4*rad,scale=0.6,shadow=0.0,flatness=1.0,color=(0,1,0))
+            saleTimeText = bs.textWidget(parent=self._rootWidget,position=(center[0],center[1]-0.29*rad),size=(0,0),hAlign='center',vAlign='center',
+                                     drawController=button,
+                                     maxWidth=1.4*rad,scale=0.4,shadow=0.0,flatness=1.0,color=(0,1,0))
+            self._purchasableCountWidgets[tab[0]] = {'img':img,
+                                                     'text':txt,
+                                                     'saleImg':saleImg,
+                                                     'saleTitleText':saleTitleText,
+                                                     'saleTimeText':saleTimeText}
+        self._tabUpdateTimer = bs.Timer(1000,bs.WeakCall(self._updateTabs),timeType='real',repeat=True)
+        self._updateTabs()
+
+        self._tabButtons = tabResults['buttons']
+        
+        if self._getTicketsButton is not None:
+            lastTabButton = self._tabButtons[tabsDef[-1][0]]
+            bs.widget(edit=self._getTicketsButton,downWidget=lastTabButton)
+            bs.widget(edit=lastTabButton,upWidget=self._getTicketsButton,rightWidget=self._getTicketsButton)
+            
+        self._scrollWidth = self._width-scrollBufferH
+        self._scrollHeight = self._height-180
+
+        self._scrollWidget = None
+        self._statusTextWidget = None
+        self._restoreState()
+
+    def _restorePurchases(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+        else:
+            bsInternal._restorePurchases()
+        
+    def _updateTabs(self):
+        for tabName,tabData in self._purchasableCountWidgets.items():
+            saleTime = bsUI._getAvailableSaleTime(tabName)
+
+            if saleTime is not None:
+                bs.textWidget(edit=tabData['saleTitleText'],
+                              text=bs.Lstr(resource='store.saleText')
+                )
+                bs.textWidget(edit=tabData['saleTimeText'],text=bsUtils.getTimeString(saleTime,centi=False))
+                bs.imageWidget(edit=tabData['saleImg'],opacity=1.0)
+                count = 0
+            else:
+                bs.textWidget(edit=tabData['saleTitleText'],text='')
+                bs.textWidget(edit=tabData['saleTimeText'],text='')
+                bs.imageWidget(edit=tabData['saleImg'],opacity=0.0)
+                count = bsUI._getAvailablePurchaseCount(tabName)
+
+            if count > 0:
+                bs.textWidget(edit=tabData['text'],text=str(count))
+                bs.imageWidget(edit=tabData['img'],opacity=1.0)
+            else:
+                bs.textWidget(edit=tabData['text'],text='')
+                bs.imageWidget(edit=tabData['img'],opacity=0.0)
+        
+    def _updateTicketsText(self):
+        if bsInternal._getAccountState() == 'SIGNED_IN':
+            s = bs.getSpecialChar('ticket')+str(bsInternal._getAccountTicketCount())
+        else:
+            #s = bs.getSpecialChar('ticket')+'?'
+            s = bs.Lstr(resource='getTicketsWindow.titleText')
+        bs.buttonWidget(edit=self._getTicketsButton,label=s)
+        
+    def _setTab(self,tab):
+
+        if self._currentTab == tab: return
+        self._currentTab = tab
+
+        # we wanna preserve our current tab between runs
+        bs.getConfig()['Store Tab'] = tab
+        bs.writeConfig()
+        
+        # update tab colors based on which is selected
+        bsUI._updateTabButtonColors(self._tabButtons,tab)
+
+        # (re)create scroll widget
+        if self._scrollWidget is not None and self._scrollWidget.exists():
+            self._scrollWidget.delete()
+
+        self._scrollWidget = bs.scrollWidget(parent=self._rootWidget,highlight=False,position=((self._width-self._scrollWidth)*0.5,self._height-self._scrollHeight-79-48),size=(self._scrollWidth,self._scrollHeight))
+
+        # stop updating anything that was there
+        self._buttonInfos = {}
+        self._updateButtonsTimer = None
+
+        # so we can still select root level widgets with controllers
+        bs.containerWidget(edit=self._scrollWidget,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+
+        # show status over top..
+        if self._statusTextWidget is not None and self._statusTextWidget.exists():
+            self._statusTextWidget.delete()
+        self._statusTextWidget = bs.textWidget(parent=self._rootWidget,
+                                               position=(self._width*0.5,self._height*0.5),
+                                               size=(0,0),
+                                               color=(1,0.7,1,0.5),hAlign="center",vAlign="center",
+                                               text=bs.Lstr(resource=self._r+'.loadingText'),
+                                               maxWidth=self._scrollWidth*0.9)
+        # self._statusTextWidgetUpdateTimer = bs.Timer(500,bs.WeakCall(self._updateStatusText),repeat=True,timeType='real')
+        # self._statusTextDots = 1
+
+
+        class _Request(object):
+            def __init__(self,window):
+                self._window = weakref.ref(window)
+                data = {'tab':tab}
+                bs.realTimer(100,bs.WeakCall(self._onResponse,data))
+            def _onResponse(self,data):
+                window = self._window()
+                if window is not None and (window._request is self):
+                    window._request = None
+                    window._onResponse(data)
+
+        # kick off a server request
+        self._request = _Request(self)
+        
+    # actually start the purchase locally..
+    def _purchaseCheckResult(self,item,isTicketPurchase,result):
+        if result is None:
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource='internal.unavailableNoConnectionText'),
+                             color=(1,0,0))
+        else:
+            if isTicketPurchase:
+                price = bsInternal._getAccountMiscReadVal('price.'+item, None)
+                if price is None or type(price) not in (int,long) or price <= 0:
+                    print 'Error; got invalid local price of',price,'for item',item
+                    bs.playSound(bs.getSound('error'))
+                else:
+                    bs.playSound(bs.getSound('click01'))
+                    bsInternal._inGamePurchase(item, price)
+            # real in-app purchase
+            else:
+                if result['allow']:
+                    bsInternal._purchase(item)
+                else:
+                    if result['reason'] == 'versionTooOld':
+                        bs.playSound(bs.getSound('error'))
+                        bs.screenMessage(bs.Lstr(resource='getTicketsWindow.versionTooOldText'),
+                                         color=(1,0,0))
+                    else:
+                        bs.playSound(bs.getSound('error'))
+                        bs.screenMessage(bs.Lstr(resource='getTicketsWindow.unavailableText'),
+                                         color=(1,0,0))
+
+    def _doPurchaseCheck(self,item,isTicketPurchase=False):
+        # here we ping the server to ask if it's valid for us to purchase this..
+        # (better to fail now than after we've paid locally)
+        env = bs.getEnvironment()
+        bsUtils.serverGet('bsAccountPurchaseCheck',{'item':item,
+                                                    'platform':env['platform'],
+                                                    'subplatform':env['subplatform'],
+                                                    'version':env['version'],
+                                                    'buildNumber':env['buildNumber'],
+                                                    'purchaseType':'ticket' if isTicketPurchase else 'real'},
+                          callback=bs.WeakCall(self._purchaseCheckResult,item,isTicketPurchase))
+        
+    def _buy(self,item):
+        # prevent pressing buy within a few seconds of the last press
+        # (gives the buttons time to disable themselves and whatnot)
+        t = bs.getRealTime()
+        if t - self._lastBuyTime < 2000:
+            bs.playSound(bs.getSound('error'))
+        else:
+            if bsInternal._getAccountState() != 'SIGNED_IN':
+                bsUI.showSignInPrompt()
+            else:
+                # pros is an actual IAP; the rest are ticket purchases.
+                if item == 'pro':
+                    bs.playSound(bs.getSound('click01'))
+                    self._lastBuyTime = t
+                    # purchase either pro or pro_sale depending on whether there is a sale going on..
+                    #bsInternal._purchase('pro' if _getAvailableSaleTime('extras') is None else 'pro_sale')
+                    self._doPurchaseCheck('pro' if bsUI._getAvailableSaleTime('extras') is None else 'pro_sale')
+                else:
+                    # def doIt():
+                    self._lastBuyTime = t
+                    price = bsInternal._getAccountMiscReadVal('price.'+item,None)
+                    ourTickets = bsInternal._getAccountTicketCount()
+                    if price is not None and ourTickets < price:
+                        bs.playSound(bs.getSound('error'))
+                        bsUI.showGetTicketsPrompt()
+                    else:
+                        def doIt():
+                            self._doPurchaseCheck(item,isTicketPurchase=True)
+                        bs.playSound(bs.getSound('swish'))
+                        bsUI.ConfirmWindow(bs.Lstr(resource='store.purchaseConfirmText',subs=[('${ITEM}',bsUI._getStoreItemNameTranslated(item))]),
+                                      width=400,height=120,
+                                      action=doIt,
+                                      okText=bs.Lstr(resource='store.purchaseText',fallback='okText'))
+
+    def _printAlreadyOwn(self,charName):
+        bs.screenMessage(bs.Lstr(resource=self._r+'.alreadyOwnText',subs=[('${NAME}',charName)]),color=(1,0,0))
+        bs.playSound(bs.getSound('error'))
+
+    def _updateButtons(self):
+        import datetime
+        salesRaw = bsInternal._getAccountMiscReadVal('sales',{})
+        sales = {}
+        try:
+            # look at the current set of sales; filter any with time remaining..
+            for saleItem, saleInfo in salesRaw.items():
+                toEnd = (datetime.datetime.utcfromtimestamp(saleInfo['e']) - datetime.datetime.utcnow()).total_seconds()
+                if toEnd > 0:
+                    sales[saleItem] = {'toEnd':toEnd,'originalPrice':saleInfo['op']}
+        except Exception:
+            bs.printException("Error parsing sales")
+        
+        for bType,bInfo in self._buttonInfos.items():
+
+            if bType in ['upgrades.pro','pro']: purchased = bsUtils._havePro()
+            else: purchased = bsInternal._getPurchased(bType)
+
+            saleOpacity = 0.0
+            saleTitleText = ''
+            saleTimeText = ''
+            
+            if purchased:
+                titleColor=(0.8,0.7,0.9,1.0)
+                color = (0.63,0.55,0.78)
+                extraImageOpacity = 0.5
+                call = bs.WeakCall(self._printAlreadyOwn,bInfo['name'])
+                priceText = ''
+                priceTextLeft = ''
+                priceTextRight = ''
+                showPurchaseCheck = True
+                descriptionColor = (0.4,1.0,0.4,0.4)
+                priceColor = (0.5,1,0.5,0.3)
+            else:
+                titleColor=(0.7,0.9,0.7,1.0)
+                color = (0.4,0.8,0.1)
+                extraImageOpacity = 1.0
+                call = bInfo['call'] if 'call' in bInfo else None
+                if bType in ['upgrades.pro','pro']:
+                    saleTime = bsUI._getAvailableSaleTime('extras')
+                    if saleTime is not None:
+                        price = bsInternal._getPrice('pro')
+                        priceTextLeft = price if price is not None else '?'
+                        price = bsInternal._getPrice('pro_sale')
+                        priceTextRight = price if price is not None else '?'
+                        saleOpacity = 1.0
+                        priceText = ''
+                        saleTitleText = bs.Lstr(resource='store.saleText')
+                        saleTimeText = bs.getTimeString(saleTime,centi=False)
+                    else:
+                        price = bsInternal._getPrice('pro')
+                        priceText = price if price is not None else '?'
+                        priceTextLeft = ''
+                        priceTextRight = ''
+                    # if price is None: priceText = '??'
+                    # else: priceText = price
+                else:
+                    price = bsInternal._getAccountMiscReadVal('price.'+bType,0)
+                    # color button differently if we cant afford this
+                    if bsInternal._getAccountState() == 'SIGNED_IN':
+                        if bsInternal._getAccountTicketCount() < price:
+                            color = (0.6, 0.61, 0.6)
+                    priceText = bs.getSpecialChar('ticket')+str(bsInternal._getAccountMiscReadVal('price.'+bType,'?'))
+                    priceTextLeft = ''
+                    priceTextRight = ''
+
+                    # TESTING:
+                    if bType in sales:
+                        saleOpacity = 1.0
+                        priceTextLeft = bs.getSpecialChar('ticket')+str(sales[bType]['originalPrice'])
+                        priceTextRight = priceText
+                        priceText = ''
+                        saleTitleText = bs.Lstr(resource='store.saleText')
+                        saleTimeText = bs.getTimeString(int(sales[bType]['toEnd']*1000),centi=False)
+                    
+                descriptionColor = (0.5,1,0.5)
+                # priceColor = (1,0.5,0.0,1.0)
+                priceColor = (0.2,1,0.2,1.0)
+                showPurchaseCheck = False
+
+            if 'titleText' in bInfo: bs.textWidget(edit=bInfo['titleText'], color=titleColor)
+            if 'purchaseCheck' in bInfo: bs.imageWidget(edit=bInfo['purchaseCheck'],opacity=1.0 if showPurchaseCheck else 0.0)
+            if 'priceWidget' in bInfo: bs.textWidget(edit=bInfo['priceWidget'],text=priceText,color=priceColor)
+            if 'priceWidgetLeft' in bInfo: bs.textWidget(edit=bInfo['priceWidgetLeft'],text=priceTextLeft)
+            if 'priceWidgetRight' in bInfo: bs.textWidget(edit=bInfo['priceWidgetRight'],text=priceTextRight)
+            if 'priceSlashWidget' in bInfo: bs.imageWidget(edit=bInfo['priceSlashWidget'],opacity=saleOpacity)
+            if 'saleBGWidget' in bInfo: bs.imageWidget(edit=bInfo['saleBGWidget'],opacity=saleOpacity)
+            if 'saleTitleWidget' in bInfo: bs.textWidget(edit=bInfo['saleTitleWidget'],text=saleTitleText)
+            if 'saleTimeWidget' in bInfo: bs.textWidget(edit=bInfo['saleTimeWidget'],text=saleTimeText)
+            if 'button' in bInfo: bs.buttonWidget(edit=bInfo['button'],color=color,onActivateCall=call)
+            if 'extraBackings' in bInfo:
+                for b in bInfo['extraBackings']:
+                    bs.imageWidget(edit=b,color=color,opacity=extraImageOpacity)
+            if 'extraImages' in bInfo:
+                for b in bInfo['extraImages']:
+                    bs.imageWidget(edit=b,opacity=extraImageOpacity)
+            if 'extraTexts' in bInfo:
+                for b in bInfo['extraTexts']:
+                    bs.textWidget(edit=b,color=descriptionColor)
+            if 'descriptionText' in bInfo: bs.textWidget(edit=bInfo['descriptionText'],color=descriptionColor)
+
+    def _onResponse(self,data):
+
+        # clear status text..
+        if self._statusTextWidget is not None and self._statusTextWidget.exists():
+            self._statusTextWidget.delete()
+            self._statusTextWidgetUpdateTimer = None
+        
+        if data is None:
+            self._statusTextWidget = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height*0.5),size=(0,0),
+                                                   scale=1.3,
+                                                   transitionDelay=100,
+                                                   color=(1,0.3,0.3,1.0),hAlign="center",vAlign="center",
+                                                   text=bs.Lstr(resource=self._r+'.loadErrorText'),
+                                                   maxWidth=self._scrollWidth*0.9)
+        else:
+            class _Store(object):
+
+                def __init__(self,storeWindow,data,width):
+
+                    self._storeWindow = storeWindow
+                    self._width = width
+                    self._rows = []
+                    storeData = bsUI._getStoreLayout()
+                    
+                    self._tab = data['tab']
+                    self._sections = copy.deepcopy(storeData[data['tab']])
+
+                    # pre-calc a few things and add them to store-data
+                    for section in self._sections:
+                        # if self._tab == 'characters': section['buttonSize'] = (340*0.6,430*0.6)
+                        # elif self._tab == 'extras': section['buttonSize'] = (650*0.75,500*0.75)
+                        # elif self._tab == 'maps': section['buttonSize'] = (510*0.6,450*0.6)
+                        # else: section['buttonSize'] = (450*0.6,450*0.6)
+                        if self._tab == 'characters': dummyName = 'characters.foo'
+                        elif self._tab == 'extras': dummyName = 'pro'
+                        elif self._tab == 'maps': dummyName = 'maps.foo'
+                        elif self._tab == 'icons': dummyName = 'icons.foo'
+                        else: dummyName = ''
+                        section['buttonSize'] = bsUI._getStoreItemDisplaySize(dummyName)
+                        section['vSpacing'] = -17 if self._tab == 'characters' else 0
+                        if 'title' not in section: section['title'] = ''
+                        #section['xOffs'] = 200 if self._tab == 'characters' else 170 if self._tab == 'extras' else 0
+                        # section['xOffs'] = 100 if (self._tab == 'characters' and not bsInternal._getAccountMiscReadVal('xmas',False)) else 130 if self._tab == 'extras' else 270 if self._tab == 'maps' else 0
+                        section['xOffs'] = 130 if self._tab == 'extras' else 270 if self._tab == 'maps' else 0
+                        section['yOffs'] = 55 if (self._tab == 'extras' and bsUI.gSmallUI) else -20 if self._tab == 'icons' else 0
+                        
+                def instantiate(self,scrollWidget,tabButton):
+
+                    titleSpacing = 40
+                    buttonBorder = 20
+                    buttonSpacing = 4
+                    # buttonVSpacing = -10
+                    buttonOffsetH = 40
+                    
+                    self._height = 80
+
+                    # calc total height
+                    for i,section in enumerate(self._sections):
+                        if section['title'] != '': self._height += titleSpacing
+                        bWidth,bHeight = section['buttonSize']
+                        bColumnCount = int(math.floor((self._width-buttonOffsetH-20)/(bWidth+buttonSpacing)))
+                        bRowCount = int(math.ceil(float(len(section['items']))/bColumnCount))
+                        bHeightTotal = 2*buttonBorder+bRowCount*bHeight+(bRowCount-1)*section['vSpacing']
+                        self._height += bHeightTotal
+
+                    c = bs.containerWidget(parent=scrollWidget,scale=1.0,size=(self._width,self._height),background=False)
+                    bs.containerWidget(edit=c,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+                    v = self._height - 20
+
+                    if self._tab == 'characters':
+                        t = bs.Lstr(resource='store.howToSwitchCharactersText',
+                                    subs=[('${SETTINGS}',bs.Lstr(resource='accountSettingsWindow.titleText')),
+                                          ('${PLAYER_PROFILES}',bs.Lstr(resource='playerProfilesWindow.titleText'))])
+                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
+                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
+                                      maxWidth=700,transitionDelay=400)
+                    elif self._tab == 'icons':
+                        t = bs.Lstr(resource='store.howToUseIconsText',
+                                    subs=[('${SETTINGS}',bs.Lstr(resource='mainMenu.settingsText')),
+                                          ('${PLAYER_PROFILES}',bs.Lstr(resource='playerProfilesWindow.titleText'))])
+                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
+                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
+                                      maxWidth=700,transitionDelay=400)
+                    elif self._tab == 'maps':
+                        t = bs.Lstr(resource='store.howToUseMapsText')
+                        bs.textWidget(parent=c,text=t,size=(0,0),position=(self._width*0.5,self._height - 28),
+                                      hAlign='center',vAlign='center',color=(0.7,1,0.7,0.4),scale=0.7,shadow=0,flatness=1.0,
+                                      maxWidth=700,transitionDelay=400)
+                        
+                    prevRowButtons = None
+                    thisRowButtons = []
+
+                    
+                    delay = 300
+                    for section in self._sections:
+                        if section['title'] != '':
+                            bs.textWidget(parent=c,position=(60,v-titleSpacing*0.8),size=(0,0),
+                                          scale=1.0,
+                                          transitionDelay=delay,
+                                          color=(0.7,0.9,0.7,1),hAlign="left",vAlign="center",
+                                          text=bs.Lstr(resource=section['title']),
+                                          maxWidth=self._width*0.7)
+                            v -= titleSpacing
+                        delay = max(100,delay-100)
+                        v -= buttonBorder
+                        bWidth,bHeight = section['buttonSize']
+                        bCount = len(section['items'])
+                        bColumnCount = int(math.floor((self._width-buttonOffsetH-20)/(bWidth+buttonSpacing)))
+                        col = 0
+                        for i,itemName in enumerate(section['items']):
+
+                            item = self._storeWindow._buttonInfos[itemName] = {}
+                            item['call'] = bs.WeakCall(self._storeWindow._buy,itemName)
+
+                            if 'xOffs' in section: bOffsH2 = section['xOffs']
+                            else: bOffsH2 = 0
+
+                            if 'yOffs' in section: bOffsV2 = section['yOffs']
+                            else: bOffsV2 = 0
+
+                            bPos = (buttonOffsetH+bOffsH2+(bWidth+buttonSpacing)*col,v-bHeight+bOffsV2)
+                            
+                            bsUI._instantiateStoreItemDisplay(itemName,item,
+                                                         parentWidget=c,
+                                                         bPos=bPos,
+                                                         buttonOffsetH=buttonOffsetH,
+                                                         bWidth=bWidth,bHeight=bHeight,
+                                                         bOffsH2=bOffsH2,bOffsV2=bOffsV2,
+                                                         delay=delay)
+                            b = item['button']
+                            
+                            delay = max(100,delay-100)
+                            thisRowButtons.append(b)
+
+                            # wire this button to the equivalent in the previous row
+                            if prevRowButtons is not None:
+                                if len(prevRowButtons) > col:
+                                    bs.widget(edit=b,upWidget=prevRowButtons[col])
+                                    bs.widget(edit=prevRowButtons[col],downWidget=b)
+                                    # if we're the last button in our row, wire any in the previous row past
+                                    # our position to go to us if down is pressed
+                                    if col+1 == bColumnCount or i == bCount-1:
+                                        for bPrev in prevRowButtons[col+1:]:
+                                            bs.widget(edit=bPrev,downWidget=b)
+                                else:
+                                    bs.widget(edit=b,upWidget=prevRowButtons[-1])
+                            else:
+                                bs.widget(edit=b,upWidget=tabButton)
+                                
+                            col += 1
+                            if col == bColumnCount or i == bCount-1:
+                                prevRowButtons = thisRowButtons
+                                thisRowButtons = []
+                                col = 0
+                                v -= bHeight
+                                if i < bCount-1: v -= section['vSpacing']
+
+                        v -= buttonBorder
+
+                    # set a timer to update these buttons periodically as long as we're alive
+                    # (so if we buy one it will grey out, etc)
+                    self._storeWindow._updateButtonsTimer = bs.Timer(500,bs.WeakCall(self._storeWindow._updateButtons),repeat=True,timeType='real')
+                    # also update them immediately
+                    self._storeWindow._updateButtons()
+                    
+            if self._currentTab in ('extras','minigames','characters','maps','icons'):
+                store = _Store(self,data,self._scrollWidth)
+                store.instantiate(scrollWidget=self._scrollWidget,tabButton=self._tabButtons[self._currentTab])
+            else:
+                c = bs.containerWidget(parent=self._scrollWidget,scale=1.0,size=(self._scrollWidth,self._scrollHeight*0.95),
+                                       background=False)
+                bs.containerWidget(edit=c,claimsLeftRight=True,claimsTab=True,selectionLoopToParent=True)
+                self._statusTextWidget = bs.textWidget(parent=c,position=(self._scrollWidth*0.5,self._scrollHeight*0.5),size=(0,0),
+                                                       scale=1.3,transitionDelay=100,
+                                                       color=(1,1,0.3,1.0),hAlign="center",vAlign="center",
+                                                       text=bs.Lstr(resource=self._r+'.comingSoonText'),
+                                                       maxWidth=self._scrollWidth*0.9)
+
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._getTicketsButton: selName = 'GetTickets'
+            elif sel == self._scrollWidget: selName = 'Scroll'
+            elif sel == self._backButton: selName = 'Back'
+            elif sel in self._tabButtons.values():
+                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
+            else: raise Exception("unrecognized selection")
+            bsUI.gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab}
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]['selName']
+            except Exception: selName = None
+            try: currentTab = bs.getConfig()['Store Tab']
+            except Exception: currentTab = None
+            if self._showTab is not None: currentTab = self._showTab
+            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'characters'
+            if selName == 'GetTickets': sel = self._getTicketsButton
+            elif selName == 'Back': sel = self._backButton
+            elif selName == 'Scroll': sel = self._scrollWidget
+            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
+            else: sel = self._tabButtons[currentTab]
+            # if we were requested to show a tab, select it too..
+            if self._showTab is not None and self._showTab in self._tabButtons:
+                sel = self._tabButtons[self._showTab]
+            self._setTab(currentTab)
+            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+
+                
+    def _onGetMoreTicketsPress(self):
+        if bsInternal._getAccountState() != 'SIGNED_IN':
+            bsUI.showSignInPrompt()
+            return
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+        window = bsUI.GetTicketsWindow(fromModalStore=self._modal,storeBackLocation=self._backLocation).getRootWidget()
+        if not self._modal:
+            bsUI.uiGlobals['mainMenuWindow'] = window
+
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        if not self._modal:
+            if self._backLocation == 'CoopWindow':
+                bsUI.uiGlobals['mainMenuWindow'] = bsUI.CoopWindow(transition='inLeft').getRootWidget()
+            else:
+                bsUI.uiGlobals['mainMenuWindow'] = bsUI.MainMenuWindow(transition='inLeft').getRootWidget()
+        if self._onCloseCall is not None: self._onCloseCall()
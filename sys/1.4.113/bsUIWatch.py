@@ -0,0 +1,347 @@
+import bs
+import bsInternal
+import os
+import bsUI
+
+
+class WatchWindow(bsUI.Window):
+
+    def __init__(self,transition='inRight',originWidget=None):
+
+        bsInternal._setAnalyticsScreen('Watch Window')
+        
+        if originWidget is not None:
+            self._transitionOut = 'outScale'
+            scaleOrigin = originWidget.getScreenSpaceCenter()
+            transition = 'inScale'
+        else:
+            self._transitionOut = 'outRight'
+            scaleOrigin = None
+        
+        bsUI.gMainWindow = "Watch"
+        
+        self._r = 'watchWindow'
+        
+        self._width = 1040
+        self._height = 578 if bsUI.gSmallUI else 670 if bsUI.gMedUI else 800
+        self._currentTab = None
+        extraTop = 20 if bsUI.gSmallUI else 0
+
+        self._rootWidget = bs.containerWidget(size=(self._width,self._height+extraTop),transition=transition,
+                                              toolbarVisibility='MENU_MINIMAL',
+                                              scaleOriginStackOffset=scaleOrigin,
+                                              scale=1.3 if bsUI.gSmallUI else 0.97 if bsUI.gMedUI else 0.8,
+                                              stackOffset=(0,-10) if bsUI.gSmallUI else (0,15) if bsUI.gMedUI else (0,0))
+
+        if bsUI.gSmallUI and bsUI.gToolbars:
+            bs.containerWidget(edit=self._rootWidget,onCancelCall=self._back)
+            self._backButton = None
+        else:
+            self._backButton = backButton = b = bs.buttonWidget(parent=self._rootWidget,autoSelect=True,position=(70,self._height-74),
+                                                                size=(140,60),scale=1.1,label=bs.Lstr(resource='backText'),
+                                                                buttonType='back', onActivateCall=self._back)
+            bs.containerWidget(edit=self._rootWidget,cancelButton=b)
+            if bsUI.gDoAndroidNav:
+                bs.buttonWidget(edit=b,buttonType='backSmall',size=(60,60),label=bs.getSpecialChar('back'))
+                # bs.textWidget(edit=t,hAlign='left',position=(155,self._height - 40))
+        
+        t = bs.textWidget(parent=self._rootWidget,position=(self._width*0.5,self._height-38),size=(0,0),
+                          color=bsUI.gTitleColor,scale=1.5,hAlign="center",vAlign="center",
+                          text=bs.Lstr(resource=self._r+'.titleText'),
+                          maxWidth=400)
+
+        
+        tabsDef = [['myReplays',bs.Lstr(resource=self._r+'.myReplaysText')]]
+
+        scrollBufferH = 130
+        tabBufferH = 750
+        
+        self._tabButtons = bsUI._createTabButtons(self._rootWidget,tabsDef,pos=(tabBufferH*0.5,self._height - 130),
+                                             size=(self._width-tabBufferH,50),onSelectCall=self._setTab)
+
+        if bsUI.gToolbars:
+            bs.widget(edit=self._tabButtons[tabsDef[-1][0]],rightWidget=bsInternal._getSpecialWidget('partyButton'))
+            if bsUI.gSmallUI:
+                bb = bsInternal._getSpecialWidget('backButton')
+                bs.widget(edit=self._tabButtons[tabsDef[0][0]],upWidget=bb,leftWidget=bb)
+            
+        self._scrollWidth = self._width-scrollBufferH
+        self._scrollHeight = self._height-180
+
+        # not actually using a scroll widget anymore; just an image
+        scrollLeft = (self._width-self._scrollWidth)*0.5
+        scrollBottom = self._height-self._scrollHeight-79-48
+        bufferH = 10
+        bufferV = 4
+        bs.imageWidget(parent=self._rootWidget,position=(scrollLeft-bufferH,scrollBottom-bufferV),size=(self._scrollWidth+2*bufferH,self._scrollHeight+2*bufferV),
+                       texture=bs.getTexture('scrollWidget'),modelTransparent=bs.getModel('softEdgeOutside'))
+        self._tabContainer = None
+
+        self._restoreState()
+        
+    def _setTab(self,tab):
+
+        if self._currentTab == tab: return
+        self._currentTab = tab
+
+        # we wanna preserve our current tab between runs
+        bs.getConfig()['Watch Tab'] = tab
+        bs.writeConfig()
+        
+        # update tab colors based on which is selected
+        bsUI._updateTabButtonColors(self._tabButtons,tab)
+        
+        if self._tabContainer is not None and self._tabContainer.exists():
+            self._tabContainer.delete()
+        scrollLeft = (self._width-self._scrollWidth)*0.5
+        scrollBottom = self._height-self._scrollHeight-79-48
+
+        # a place where tabs can store data to get cleared when switching to a different tab
+        self._tabData = {}
+        
+        def _simpleMessage(message,stringHeight):
+            msgScale = 1.1
+            cWidth = self._scrollWidth
+            cHeight = min(self._scrollHeight,stringHeight*msgScale+100)
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectable=False)
+            bs.widget(edit=c,upWidget=self._tabButtons[tab])
+            
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,cHeight*0.5),color=(0.6,1.0,0.6),scale=msgScale,
+                              size=(0,0),maxWidth=cWidth*0.9,maxHeight=cHeight*0.9,
+                              hAlign='center',vAlign='center',
+                              text=message)
+        
+        if tab == 'myReplays':
+            cWidth = self._scrollWidth
+            cHeight = self._scrollHeight-20
+            subScrollHeight = cHeight - 63
+            self._myReplaysScrollWidth = subScrollWidth = (680 if bsUI.gSmallUI else 640)
+
+            self._tabContainer = c = bs.containerWidget(parent=self._rootWidget,
+                                                        position=(scrollLeft,scrollBottom+(self._scrollHeight-cHeight)*0.5),
+                                                        size=(cWidth,cHeight),background=False,selectionLoopToParent=True)
+
+            v = cHeight - 30
+            t = bs.textWidget(parent=c,position=(cWidth*0.5,v),color=(0.6,1.0,0.6),scale=0.7,
+                              size=(0,0),
+                              maxWidth=cWidth*0.9,
+                              hAlign='center',vAlign='center',
+                              text=bs.Lstr(resource='replayRenameWarningText',subs=[('${REPLAY}',bs.Lstr(resource='replayNameDefaultText'))]))
+
+            bWidth = 140 if bsUI.gSmallUI else 178
+            bHeight = 107 if bsUI.gSmallUI else 142 if bsUI.gMedUI else 190
+            bSpaceExtra = 0 if bsUI.gSmallUI else -2 if bsUI.gMedUI else -5
+            
+            bColor = (0.6,0.53,0.63)
+            bTextColor = (0.75,0.7,0.8)
+            bv = cHeight-(48 if bsUI.gSmallUI else 45 if bsUI.gMedUI else 40)-bHeight
+            bh = 40 if bsUI.gSmallUI else 40
+            sh = 190 if bsUI.gSmallUI else 225
+            ts = 1.0 if bsUI.gSmallUI else 1.2
+            self._myReplaysWatchReplayButton = b1 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
+                                                                    buttonType='square',color=bColor,textColor=bTextColor,
+                                                                    onActivateCall=self._onMyReplayPlayPress,textScale=ts,
+                                                                    label=bs.Lstr(resource=self._r+'.watchReplayButtonText'),
+                                                                    autoSelect=True)
+            bs.widget(edit=b1,upWidget=self._tabButtons[tab])
+            if bsUI.gSmallUI and bsUI.gToolbars:
+                bs.widget(edit=b1,leftWidget=bsInternal._getSpecialWidget('backButton'))
+            bv -= bHeight+bSpaceExtra
+            b2 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
+                                 buttonType='square',color=bColor,textColor=bTextColor,
+                                 onActivateCall=self._onMyReplayRenamePress,textScale=ts,
+                                 label=bs.Lstr(resource=self._r+'.renameReplayButtonText'),
+                                 autoSelect=True)
+            bv -= bHeight+bSpaceExtra
+            b3 = bs.buttonWidget(parent=c,size=(bWidth,bHeight),position=(bh,bv),
+                                 buttonType='square',color=bColor,textColor=bTextColor,
+                                 onActivateCall=self._onMyReplayDeletePress,textScale=ts,
+                                 label=bs.Lstr(resource=self._r+'.deleteReplayButtonText'),
+                                 autoSelect=True)
+            
+            v -= subScrollHeight+23
+            self._scrollWidget = sw = bs.scrollWidget(parent=c,position=(sh,v),size=(subScrollWidth,subScrollHeight))
+            bs.containerWidget(edit=c,selectedChild=sw)
+            self._columnWidget = bs.columnWidget(parent=sw,leftBorder=10)
+            
+            bs.widget(edit=sw,autoSelect=True,leftWidget=b1,upWidget=self._tabButtons[tab])
+            bs.widget(edit=self._tabButtons[tab],downWidget=sw)
+
+            self._myReplaySelected = None
+            self._refreshMyReplays()
+        elif tab == 'sharedReplays':
+            _simpleMessage(('(COMING SOON)\n'
+                            'This section will include replays that your friends\n'
+                            'have shared with you or possibly public replays\n'
+                            'from recent online tournaments, etc.'))
+        elif tab == 'bestMoments':
+            _simpleMessage(('(COMING SOON)\n'
+                            'This section will highlight short snippets of replays\n'
+                            'that people have shared, each only a few seconds long;\n'
+                            'awesome moves, random moments of hilarity, etc.'))
+
+    def _noReplaySelectedError(self):
+        bs.screenMessage(bs.Lstr(resource=self._r+'.noReplaySelectedErrorText'),color=(1,0,0))
+        bs.playSound(bs.getSound('error'))
+
+    def _onMyReplayPlayPress(self):
+        if self._myReplaySelected is None:
+            self._noReplaySelectedError()
+            return
+
+        bsInternal._incrementAnalyticsCount('Replay watch')
+        def doIt():
+            try:
+                bsInternal._fadeScreen(True)
+                bsInternal._newReplaySession(bsInternal._getReplaysDir()+'/'+self._myReplaySelected)
+            except Exception:
+                import bsMainMenu
+                bs.printException("exception running replay session")
+                # drop back into a fresh main menu session in case we half-launched or something..
+                bsInternal._newHostSession(bsMainMenu.MainMenuSession)
+        bsInternal._fadeScreen(False,time=250,endCall=bs.Call(bs.pushCall,doIt))
+        bs.containerWidget(edit=self._rootWidget,transition='outLeft')
+
+    def _onMyReplayRenamePress(self):
+        if self._myReplaySelected is None:
+            self._noReplaySelectedError()
+            return
+        cWidth = 600
+        cHeight = 250
+        self._myReplaysRenameWindow = c = bs.containerWidget(scale=1.8 if bsUI.gSmallUI else 1.55 if bsUI.gMedUI else 1.0,
+                                                             size=(cWidth,cHeight),transition='inScale')
+        dName = self._getReplayDisplayName(self._myReplaySelected)
+        bs.textWidget(parent=c,size=(0,0),hAlign='center',vAlign='center',
+                      text=bs.Lstr(resource=self._r+'.renameReplayText',subs=[('${REPLAY}',dName)]),
+                      maxWidth=cWidth*0.8,
+                      position=(cWidth*0.5,cHeight-60))
+        self._myReplayRenameText = t = bs.textWidget(parent=c,size=(cWidth*0.8,40),hAlign='left',vAlign='center',text=dName,
+                                                     editable=True,
+                                                     description=bs.Lstr(resource=self._r+'.replayNameText'),
+                                                     position=(cWidth*0.1,cHeight-140),autoSelect=True,maxWidth=cWidth*0.7,maxChars=200)
+        cb = bs.buttonWidget(parent=c,
+                             label=bs.Lstr(resource='cancelText'),
+                             onActivateCall=bs.Call(bs.containerWidget,edit=c,transition='outScale'),size=(180,60),position=(30,30),autoSelect=True)
+        okb = bs.buttonWidget(parent=c,
+                              label=bs.Lstr(resource=self._r+'.renameText'),
+                              size=(180,60),position=(cWidth-230,30),
+                              onActivateCall=bs.Call(self._renameMyReplay,self._myReplaySelected),autoSelect=True)
+        bs.widget(edit=cb,rightWidget=okb)
+        bs.widget(edit=okb,leftWidget=cb)
+        bs.textWidget(edit=t,onReturnPressCall=okb.activate)
+        bs.containerWidget(edit=c,cancelButton=cb,startButton=okb)
+
+    def _renameMyReplay(self,replay):
+        try:
+            if not self._myReplayRenameText.exists():
+                return
+            newNameRaw = bs.textWidget(query=self._myReplayRenameText)
+            newName = newNameRaw+'.brp'
+            # ignore attempts to change it to what it already is (or what it looks like to the user)
+            if replay != newName and self._getReplayDisplayName(replay) != newNameRaw:
+                oldNameFull = (bsInternal._getReplaysDir()+'/'+replay).encode('utf-8')
+                newNameFull = (bsInternal._getReplaysDir()+'/'+newName).encode('utf-8')
+                if os.path.exists(newNameFull):
+                    bs.playSound(bs.getSound('error'))
+                    bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorAlreadyExistsText'),color=(1,0,0))
+                elif any(char in newNameRaw for char in ['/','\\',':']):
+                    bs.playSound(bs.getSound('error'))
+                    bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorInvalidName'),color=(1,0,0))
+                else:
+                    bsInternal._incrementAnalyticsCount('Replay rename')
+                    os.rename(oldNameFull,newNameFull)
+                    self._refreshMyReplays()
+                    bs.playSound(bs.getSound('gunCocking'))
+        except Exception:
+            bs.printException("error renaming replay '"+replay+"' to '"+newName+"'")
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource=self._r+'.replayRenameErrorText'),color=(1,0,0))
+            
+        bs.containerWidget(edit=self._myReplaysRenameWindow,transition='outScale')
+            
+        
+    def _onMyReplayDeletePress(self):
+        if self._myReplaySelected is None:
+            self._noReplaySelectedError()
+            return
+        bsUI.ConfirmWindow(bs.Lstr(resource=self._r+'.deleteConfirmText',subs=[('${REPLAY}',self._getReplayDisplayName(self._myReplaySelected))]),
+                      bs.Call(self._deleteReplay,self._myReplaySelected),450,150)
+
+    def _getReplayDisplayName(self,replay):
+        if replay.endswith('.brp'):
+            replay = replay[:-4]
+        if replay == '__lastReplay': return bs.Lstr(resource='replayNameDefaultText').evaluate()
+        return replay
+    
+    def _deleteReplay(self,replay):
+        try:
+            bsInternal._incrementAnalyticsCount('Replay delete')
+            os.remove((bsInternal._getReplaysDir()+'/'+replay).encode('utf-8'))
+            self._refreshMyReplays()
+            bs.playSound(bs.getSound('shieldDown'))
+            if replay == self._myReplaySelected: self._myReplaySelected = None
+        except Exception:
+            bs.printException("exception deleting replay '"+replay+"'")
+            bs.playSound(bs.getSound('error'))
+            bs.screenMessage(bs.Lstr(resource=self._r+'.replayDeleteErrorText'),color=(1,0,0))
+        
+    def _onMyReplaySelect(self,replay):
+        self._myReplaySelected = bs.uni(replay)
+
+    def _refreshMyReplays(self):
+        for c in self._columnWidget.getChildren(): c.delete()
+        tScale = 1.6
+        try:
+            names = os.listdir(bsInternal._getReplaysDir())
+            names = [bs.uni(n) for n in names if n.endswith('.brp')] # ignore random other files in there..
+            names.sort(key=lambda x:x.lower())
+        except Exception:
+            bs.printException("error listing replays dir")
+            names = []
+        
+        for i,name in enumerate(names):
+            t = bs.textWidget(parent=self._columnWidget,size=(self._myReplaysScrollWidth/tScale,30),selectable=True,
+                              color=(1.0,1,0.4) if name == '__lastReplay.brp' else (1,1,1),alwaysHighlight=True,
+                              onSelectCall=bs.Call(self._onMyReplaySelect,name),
+                              onActivateCall=self._myReplaysWatchReplayButton.activate,
+                              text=self._getReplayDisplayName(name),hAlign='left',vAlign='center',cornerScale=tScale,
+                              maxWidth=(self._myReplaysScrollWidth/tScale)*0.93)
+            if i == 0:
+                bs.widget(edit=t,upWidget=self._tabButtons['myReplays'])
+    
+    def _saveState(self):
+        try:
+            sel = self._rootWidget.getSelectedChild()
+            if sel == self._backButton: selName = 'Back'
+            elif sel in self._tabButtons.values():
+                selName = 'Tab:'+self._tabButtons.keys()[self._tabButtons.values().index(sel)]
+            elif sel == self._tabContainer: selName = 'TabContainer'
+            else: raise Exception("unrecognized selection")
+            bsUI.gWindowStates[self.__class__.__name__] = {'selName':selName,'tab':self._currentTab}
+        except Exception:
+            bs.printException('error saving state for',self.__class__)
+
+    def _restoreState(self):
+        try:
+            try: selName = bsUI.gWindowStates[self.__class__.__name__]['selName']
+            except Exception: selName = None
+            try: currentTab = bs.getConfig()['Watch Tab']
+            except Exception: currentTab = None
+            if currentTab is None or currentTab not in self._tabButtons: currentTab = 'myReplays'
+            self._setTab(currentTab)
+            if selName == 'Back': sel = self._backButton
+            elif selName == 'TabContainer': sel = self._tabContainer
+            elif type(selName) is str and selName.startswith('Tab:'): sel = self._tabButtons[selName.split(':')[-1]]
+            else:
+                if self._tabContainer is not None: sel = self._tabContainer
+                else: sel = self._tabButtons[currentTab]
+            bs.containerWidget(edit=self._rootWidget,selectedChild=sel)
+        except Exception:
+            bs.printException('error restoring state for',self.__class__)
+            
+    def _back(self):
+        self._saveState()
+        bs.containerWidget(edit=self._rootWidget,transition=self._transitionOut)
+        bsUI.uiGlobals['mainMenuWindow'] = bsUI.MainMenuWindow(transition='inLeft').getRootWidget()
@@ -14,6 +14,7 @@ import copy
 import bsInternal
 import bsGame
 import json
+import collections
 
 # even when kiosk mode is set, we want behavior to differ depending on
 # whether we launch games from the kiosk menu or the real one
@@ -22,6 +23,9 @@ gRunningKioskModeGame = bs.getEnvironment()['kioskMode']
 
 gConfigFileIsHealthy = False
 
+# set once the app has finished launching (see _onLaunchComplete())
+_gRanPostLaunchStuff = False
+
 # this is incremented any time the app is backgrounded/foregrounded;
 # can be a simple way to determine if network data should be refreshed/etc.
 gAppFGState = 0
@@ -41,6 +45,13 @@ gNodeOwnerWeakRefsCleanCounter = 0
 
 gPrintOnceErrors = set()
 
+# memoized Lstr.evaluate() results keyed by Lstr json (LRU ordered);
+# cleared whenever the language changes, so entries are implicitly per-language
+_gLstrEvalCache = collections.OrderedDict()
+_gLstrEvalCacheMaxSize = 2000
+_gLstrEvalCacheHits = 0
+_gLstrEvalCacheMisses = 0
+
 class Lstr(object):
     """
     category: General Utility Classes
@@ -82,6 +93,7 @@ class Lstr(object):
         # Basically just store the exact args they passed.
         # ...however if they passed any Lstr values for subs, replace them with that Lstr's dict
         self._args = keywds
+        self._json = None
         ourType = type(self)
 
         if type(self._args.get('value')) is ourType:
@@ -119,7 +131,19 @@ class Lstr(object):
         You should avoid doing this as much as possible and instead pass
         and store Lstr values.
         """
-        return bsInternal._evaluateLstr(self._getJson())
+        global _gLstrEvalCacheHits
+        global _gLstrEvalCacheMisses
+        j = self._getJson()
+        try:
+            val = _gLstrEvalCache.pop(j)
+            _gLstrEvalCacheHits += 1
+        except KeyError:
+            val = bsInternal._evaluateLstr(j)
+            _gLstrEvalCacheMisses += 1
+            if len(_gLstrEvalCache) >= _gLstrEvalCacheMaxSize: _gLstrEvalCache.popitem(last=False)
+        # (re)insert as most-recently-used
+        _gLstrEvalCache[j] = val
+        return val
 
     def isFlatValue(self):
         """
@@ -130,8 +154,11 @@ class Lstr(object):
         return True if ('value' in self._args and not self._args.get('subs',[])) else False
     
     def _getJson(self):
+        # args don't change after construction, so we only need to dump once
+        if self._json is not None: return self._json
         try:
-            return uni(json.dumps(self._args,separators=(',',':')))
+            self._json = uni(json.dumps(self._args,separators=(',',':')))
+            return self._json
         except Exception:
             bs.printException('_getJson failed for',self._args)
             return u'JSON_ERR'
@@ -141,8 +168,23 @@ class Lstr(object):
 
     def __repr__(self):
         return '<bs.Lstr: '+self._getJson()+'>'
-    
-    
+
+def _clearLstrCache():
+    """ drops all memoized Lstr evaluations (called when the language changes) """
+    _gLstrEvalCache.clear()
+
+def getLstrCacheStats():
+    """
+    Returns a dict of Lstr evaluation cache stats: 'size', 'maxSize',
+    'hits', 'misses' and 'hitRate' (0-1).
+    """
+    total = _gLstrEvalCacheHits+_gLstrEvalCacheMisses
+    return {'size':len(_gLstrEvalCache),
+            'maxSize':_gLstrEvalCacheMaxSize,
+            'hits':_gLstrEvalCacheHits,
+            'misses':_gLstrEvalCacheMisses,
+            'hitRate':float(_gLstrEvalCacheHits)/total if total > 0 else 0.0}
+
 def printException(*args,**keywds):
     """
     category: General Utility Functions
@@ -210,6 +252,118 @@ def getConfig():
     """
     return _gConfig
 
+class ConfigSnapshot(object):
+    """
+    category: General Utility Classes
+
+    A read-only snapshot of config values that gameplay code reads often.
+    Snapshots are rebuilt only when bs.writeConfig() or bs.applySettings() runs
+    (or the lobby reloads player profiles), so hot paths can read these attributes instead of hitting bs.getConfig() each time.
+    Treat all values (especially playerProfiles) as immutable.
+
+    Attributes:
+
+       version
+          Incremented each time a snapshot with changed values is created.
+
+       easyMode, powerupDistribution, powerupPopups, cameraShake,
+       offensiveCurseSound, autoBalanceTeams, particleBudgetPerFrame,
+       particleBudgetPerSecond, blastMergeRadius
+          The corresponding config values (with their usual defaults applied).
+
+       playerProfiles
+          The 'Player Profiles' dict, already run through bsUtils.jsonPrep().
+          Only rebuilt when profiles have been flagged as changed
+          (see bsUtils._markPlayerProfilesDirty()).
+    """
+    def __init__(self,config,version,playerProfiles=None):
+        self.version = version
+        self.easyMode = config.get('Easy Mode',True)
+        self.powerupDistribution = config.get('Powerup Distribution','JRMP')
+        self.powerupPopups = config.get('Powerup Popups',True)
+        self.cameraShake = config.get('Camera Shake',True)
+        self.offensiveCurseSound = config.get('Offensive Curse Sound',True)
+        self.autoBalanceTeams = config.get('Auto Balance Teams',False)
+        self.particleBudgetPerFrame = config.get('Particle Budget Per Frame',600)
+        self.particleBudgetPerSecond = config.get('Particle Budget Per Second',6000)
+        self.blastMergeRadius = config.get('Blast Merge Radius',1.0)
+        if playerProfiles is not None: self.playerProfiles = playerProfiles
+        else:
+            try: self.playerProfiles = jsonPrep(dict(config['Player Profiles']))
+            except Exception: self.playerProfiles = {}
+
+    def _getValues(self):
+        return dict((k,v) for k,v in self.__dict__.items() if k != 'version')
+
+_gConfigSnapshot = None
+_gConfigSnapshotCallbacks = []
+
+# profiles are big and rarely change, so snapshots only re-prep them when told to
+_gPlayerProfilesDirty = True
+
+def getConfigSnapshot():
+    """
+    category: General Utility Functions
+
+    Returns the current bsUtils.ConfigSnapshot.
+    """
+    if _gConfigSnapshot is None: _refreshConfigSnapshot()
+    return _gConfigSnapshot
+
+def addConfigChangeCallback(call):
+    """
+    category: General Utility Functions
+
+    Registers a callable to be run with the new bsUtils.ConfigSnapshot
+    whenever hot config values change. Bound methods are held weakly,
+    so subscribers can simply die without unregistering.
+    """
+    _gConfigSnapshotCallbacks.append(WeakMethod(call) if hasattr(call,'im_func') else call)
+
+def removeConfigChangeCallback(call):
+    for c in list(_gConfigSnapshotCallbacks):
+        if c == call or (isinstance(c,WeakMethod) and c.f is getattr(call,'im_func',None)
+                         and c.c() is getattr(call,'im_self',None)):
+            _gConfigSnapshotCallbacks.remove(c)
+
+def _markPlayerProfilesDirty():
+    """ call after changing 'Player Profiles' so the next config snapshot picks it up """
+    global _gPlayerProfilesDirty
+    _gPlayerProfilesDirty = True
+
+def _refreshConfigSnapshot(profilesChanged=False):
+    global _gConfigSnapshot
+    global _gConfigSnapshotCallbacks
+    global _gPlayerProfilesDirty
+    oldSnapshot = _gConfigSnapshot
+    if _gConfig is None: config = {}
+    else: config = _gConfig
+    # carry the old prepped profiles over as-is (which also makes comparing them free)
+    if profilesChanged or _gPlayerProfilesDirty or oldSnapshot is None: profiles = None
+    else: profiles = oldSnapshot.playerProfiles
+    _gPlayerProfilesDirty = False
+    snapshot = ConfigSnapshot(config,0 if oldSnapshot is None else oldSnapshot.version,profiles)
+    if oldSnapshot is not None and snapshot._getValues() == oldSnapshot._getValues(): return
+    if oldSnapshot is not None: snapshot.version += 1
+    _gConfigSnapshot = snapshot
+    if oldSnapshot is None: return
+
+    # prune dead subscribers and let everyone else know
+    _gConfigSnapshotCallbacks = [c for c in _gConfigSnapshotCallbacks if not (isinstance(c,WeakMethod) and c.c() is None)]
+    for call in list(_gConfigSnapshotCallbacks):
+        try: call(snapshot)
+        except Exception: bs.printException('error in config change callback',call)
+
+def applySettings():
+    """
+    category: General Utility Functions
+
+    Applies the current config's settings to the game and refreshes
+    the bsUtils.ConfigSnapshot.
+    """
+    bsInternal.applySettings()
+    _refreshConfigSnapshot()
+
 def getSharedObject(name):
     """
     category: Game Flow Functions
@@ -512,9 +666,14 @@ class WeakMethod :
         return '<bs.WeakMethod object; call='+str(self.f)+'>'
 
     
+# _LanguageTable instances for just the current language ('Target')
+# and for the current language with english fallback merged in ('Merged')
 _gLanguageTarget = None
 _gLanguageMerged = None
 
+# bump this if the compiled language cache format changes
+_gLanguageCacheVersion = 2
+
 def _getLanguages():
     langs = set()
     env = bs.getEnvironment()
@@ -550,6 +709,7 @@ def _ensureHaveAccountPlayerProfile():
                                                'color':(0.5,0.25,1.0),
                                                'highlight':(0.5,0.25,1.0)}})
         bsInternal._runTransactions()
+        _markPlayerProfilesDirty()
     
 # used internally
 def _handleRemoteAchievementList(completedAchievements):
@@ -568,8 +728,18 @@ def _shouldSubmitDebugInfo():
     try: return bs.getConfig()['Submit Debug Info']
     except Exception: return True
 
+def _onLaunchComplete():
+    # boot's done; stop profiling imports (and report on them if asked to)
+    global _gRanPostLaunchStuff
+    _gRanPostLaunchStuff = True
+    import bsImport
+    bsImport._finishImportProfiling()
+
 def _handleAppPause():
-    pass
+    # we may get killed while backgrounded; get pending config changes on disk
+    _flushConfig()
+    import bsTransactions
+    bsTransactions._persistTransactions()
 
 def _handleAppResume():
     # if there's music playing externally, make sure we aren't playing ours
@@ -898,8 +1068,8 @@ def _readConfig():
         except Exception,e: print 'EXC logging broken config contents:',e
         _gConfig = {}
 
-        # now attempt to read one of our 'prev' backup copies
-        prevPath = configFilePath + '.prev'
+        # now attempt to read the backup copy our config writer keeps
+        prevPath = configFilePath + _gConfigBackupSuffix
         try:
             if os.path.exists(prevPath):
                 f = open(prevPath,'rb')
@@ -911,6 +1081,8 @@ def _readConfig():
             print 'successfully read backup config.'
         except Exception,e:
             print 'EXC reading prev backup config:',e
+
+    _refreshConfigSnapshot()
             
 
 def _prettifyList(l,indent=0,multiLine=True):
@@ -973,8 +1145,20 @@ def _prettifyDict(d,indent=0,multiLine=True,returnBits=False):
 gAllowingPackageMods = None
 gPackageModsAdded = set()
 
-def _getModulesWithCall(callName,whiteList=None,blackList=None):
-    
+# bump this if the format of script index entries changes
+_gScriptIndexVersion = 2
+_gScriptIndex = None
+_gScriptIndexDirty = False
+
+# the 'bsGet' calls we index
+_gScriptIndexCalls = ('bsGetAPIVersion','bsGetGames','bsGetLevels')
+
+def _getScriptFiles():
+    """
+    Lists candidate script files; returns a list of (moduleName,path,isMod) tuples
+    in import-precedence order plus whether there's any modding going on.
+    (this also registers any package-mod dirs with the python path/etc)
+    """
     # first off, see if we're allowing low-level mods if we havn't
     global gAllowingPackageMods
     if gAllowingPackageMods is None:
@@ -986,7 +1170,6 @@ def _getModulesWithCall(callName,whiteList=None,blackList=None):
 
     # if package mods are enabled, tally up all dirs under user-mods that we
     # consider to be 'packages' - we'll import anything we find in them too..
-    extraPackageModFiles = []
     if gAllowingPackageMods:
         import sys
         d = env['userScriptsDirectory']
@@ -994,7 +1177,7 @@ def _getModulesWithCall(callName,whiteList=None,blackList=None):
         if os.path.isdir(d):
             try: dirlist = os.listdir(d)
             except Exception:
-                bs.printException('error listing dir during _getModulesWithCall(): \''+d+'\'')
+                bs.printException('error listing dir during _getScriptFiles(): \''+d+'\'')
                 dirlist = []
         else: dirlist = []
         
@@ -1008,10 +1191,7 @@ def _getModulesWithCall(callName,whiteList=None,blackList=None):
                     bsInternal._addPackage(name,packageDir)
                 scriptDirs.append(packageDir+'/scripts')
 
-    # lets warn if have duplicate scripts..
-    namesImported = set()
-
-    modules = []
+    files = []
     for i,d in enumerate(scriptDirs):
 
         if os.path.isdir(d):
@@ -1021,69 +1201,310 @@ def _getModulesWithCall(callName,whiteList=None,blackList=None):
                 if type(e) == OSError and e.errno in (errno.EACCES, errno.ENOENT):
                     pass # we expect these sometimes..
                 else:
-                    bs.printException('error listing dir during _getModulesWithCall(): \''+d+'\'')
+                    bs.printException('error listing dir during _getScriptFiles(): \''+d+'\'')
                 dirlist = []
         else: dirlist = []
 
         for name in dirlist:
-            try:
-                if name == 'sys' or name.endswith('.py'):
-                    # if there's anything in user-mods or package dirs, let the game know
-                    # that we've got moding going on..
-                    # (we do less error reporting in this case for my sanity's sake)
-                    if i >= 1: haveMods = True
+            if name == 'sys' or name.endswith('.py'):
+                # if there's anything in user-mods or package dirs, let the game know
+                # that we've got moding going on..
+                # (we do less error reporting in this case for my sanity's sake)
+                if i >= 1: haveMods = True
+            # language modules never contain games; skip them to save a bit of time/memory..
+            if name.endswith('.py') and not name.startswith('bsLanguage'):
+                files.append((name[:-3],d+'/'+name,i >= 1))
+    return files,haveMods
+
+def _scanScriptSource(path):
+    """
+    Statically inspects a script (without importing it) for our 'bsGet' calls.
+    Returns a dict with 'calls' (those defined at the top level), 'apiVersion'
+    and 'games' (class names bsGetGames() returns) when they're simple literals
+    (otherwise None), 'gameInfo' (see _scanGameClass()) for each of those games,
+    and 'dynamic' which is True if the script may define one of our calls in a
+    way we can't see statically and so needs importing to be sure.
+    """
+    import ast
+    with open(path,'rb') as f: source = f.read()
+    entry = {'calls':[],'apiVersion':None,'games':None,'gameInfo':{},'dynamic':False}
+    if 'bsGet' not in source and 'import *' not in source: return entry
+    try: tree = ast.parse(source,path)
+    except Exception:
+        # let the import report the actual error
+        entry['dynamic'] = True
+        return entry
+    funcs = dict((node.name,node) for node in tree.body
+                 if isinstance(node,ast.FunctionDef) and node.name in _gScriptIndexCalls)
+    entry['calls'] = sorted(funcs.keys())
+    # anything else that could define one of our calls (nested defs, assignments,
+    # imports) means we can't trust the above
+    for node in ast.walk(tree):
+        if isinstance(node,ast.FunctionDef): names = [node.name] if node is not funcs.get(node.name) else []
+        elif isinstance(node,ast.Name) and isinstance(node.ctx,ast.Store): names = [node.id]
+        elif isinstance(node,(ast.Import,ast.ImportFrom)): names = [a.asname or a.name for a in node.names]
+        else: continue
+        if any(n in _gScriptIndexCalls or n == '*' for n in names):
+            entry['dynamic'] = True
+            break
+    def _getReturnValue(func):
+        returns = [n for n in ast.walk(func) if isinstance(n,ast.Return)]
+        return returns[0].value if len(returns) == 1 else None
+    if 'bsGetAPIVersion' in funcs:
+        value = _getReturnValue(funcs['bsGetAPIVersion'])
+        if isinstance(value,ast.Num): entry['apiVersion'] = value.n
+    if 'bsGetGames' in funcs:
+        value = _getReturnValue(funcs['bsGetGames'])
+        if isinstance(value,(ast.List,ast.Tuple)) and all(isinstance(e,ast.Name) for e in value.elts):
+            entry['games'] = [e.id for e in value.elts]
+            classes = dict((node.name,node) for node in tree.body if isinstance(node,ast.ClassDef))
+            for className in entry['games']:
+                if className in classes: entry['gameInfo'][className] = _scanGameClass(classes[className])
+    return entry
+
+def _scanGameClass(node):
+    """
+    Pulls what game lists need from a game's class definition: 'name' (what
+    getName() returns) and 'sessionTypes' (names of the bs session types
+    supportsSessionType() checks for); either is None if it isn't a simple
+    literal/issubclass() test defined right on a class deriving from bs.
+    """
+    import ast
+    info = {'name':None,'sessionTypes':None}
+    if not all(isinstance(b,ast.Attribute) and isinstance(b.value,ast.Name) and b.value.id == 'bs' for b in node.bases):
+        return info
+    funcs = dict((n.name,n) for n in node.body if isinstance(n,ast.FunctionDef))
+    # getDisplayString() normally just translates getName(); if it's overridden we can't use it
+    if 'getDisplayString' in funcs: return info
+    def _getReturnValue(func):
+        if func is None: return None
+        returns = [n for n in ast.walk(func) if isinstance(n,ast.Return)]
+        return returns[0].value if len(returns) == 1 else None
+    value = _getReturnValue(funcs.get('getName'))
+    if isinstance(value,ast.Str): info['name'] = value.s
+    value = _getReturnValue(funcs.get('supportsSessionType'))
+    # 'True if (a or b) else False' is the same as 'a or b' here
+    if (isinstance(value,ast.IfExp) and isinstance(value.body,ast.Name) and value.body.id == 'True'
+        and isinstance(value.orelse,ast.Name) and value.orelse.id == 'False'): value = value.test
+    tests = value.values if isinstance(value,ast.BoolOp) and isinstance(value.op,ast.Or) else [value]
+    sessionTypes = []
+    for t in tests:
+        if not (isinstance(t,ast.Call) and isinstance(t.func,ast.Name) and t.func.id == 'issubclass'
+                and len(t.args) == 2 and isinstance(t.args[1],ast.Attribute)
+                and isinstance(t.args[1].value,ast.Name) and t.args[1].value.id == 'bs'): return info
+        sessionTypes.append(t.args[1].attr)
+    info['sessionTypes'] = sessionTypes
+    return info
+
+def _getScriptIndexPath():
+    return os.path.join(os.path.dirname(bs.getEnvironment()['configFilePath']),'.bsScriptIndex')
+
+def _getScriptIndexEntry(path):
+    """ returns the index entry for a script, rescanning it if it has changed on disk """
+    global _gScriptIndex
+    global _gScriptIndexDirty
+    if _gScriptIndex is None:
+        _gScriptIndex = {}
+        try:
+            with open(_getScriptIndexPath(),'rb') as f: cached = json.loads(f.read())
+            if cached.get('version') == _gScriptIndexVersion: _gScriptIndex = cached['entries']
+        except Exception: pass
+    stat = os.stat(path)
+    key = [stat.st_mtime,stat.st_size]
+    entry = _gScriptIndex.get(path)
+    if entry is None or entry['key'] != key:
+        entry = _scanScriptSource(path)
+        entry['key'] = key
+        _gScriptIndex[path] = entry
+        _gScriptIndexDirty = True
+    return entry
+
+def _saveScriptIndex():
+    global _gScriptIndexDirty
+    if not _gScriptIndexDirty: return
+    path = _getScriptIndexPath()
+    # its fine if this fails; we'll just rescan next time
+    try:
+        tmpPath = path+'.tmp'
+        with open(tmpPath,'wb') as f: f.write(json.dumps({'version':_gScriptIndexVersion,'entries':_gScriptIndex}))
+        if os.path.exists(path): os.remove(path) # (windows can't rename over files)
+        os.rename(tmpPath,path)
+        _gScriptIndexDirty = False
+    except Exception: pass
+
+def _getScriptIndex(whiteList=None,blackList=None):
+    """
+    Returns a list of (moduleName,entry) pairs for all scripts visible to the game
+    (see _scanScriptSource() for entry contents), honoring optional white/black lists
+    of module names. Nothing gets imported; entries are cached on disk and only
+    rescanned when their script changes.
+    """
+    files,haveMods = _getScriptFiles()
+    bsInternal._setHaveMods(haveMods)
+
+    # lets warn if have duplicate scripts..
+    namesSeen = set()
+    results = []
+    for moduleName,path,isMod in files:
+        try:
+            # if there's a black-list, make sure this isn't on it
+            if blackList is not None and moduleName in blackList: continue
+            # if there's a white-list, make sure this *is* on it
+            if whiteList is not None and moduleName not in whiteList: continue
+            if moduleName in namesSeen:
+                errMsg = "Warning: duplicate mod script found: '"+moduleName+".py'; ignoring."
+                print errMsg
+                bs.screenMessage(errMsg,color=(1,0,0))
+                continue
+            namesSeen.add(moduleName)
+            results.append((moduleName,_getScriptIndexEntry(path)))
+        except Exception:
+            bs.printException('Error indexing game module \''+moduleName+'\'')
+    _saveScriptIndex()
+    return results
 
-                moduleName = name.replace('.py','')
+def _showAPIVersionError(name,moduleAPIVersion,ourAPIVersion):
+    txt = bs.Lstr(resource='apiVersionErrorText',
+                  subs=[('${NAME}',name),
+                        ('${VERSION_USED}',str(moduleAPIVersion)),
+                        ('${VERSION_REQUIRED}',str(ourAPIVersion))])
+    bs.screenMessage(txt,color=(1,0.5,0))
 
-                # if there's a black-list, make sure this isn't on it
-                if (blackList is None or moduleName not in blackList):
+def _getModulesWithCall(callName,whiteList=None,blackList=None):
+    """
+    Returns the modules defining the given call with an api version matching ours.
+    Only those modules get imported; everything else is ruled out from the script index.
+    """
+    ourAPIVersion = 4
+    modules = []
+    for moduleName,entry in _getScriptIndex(whiteList,blackList):
+        if callName not in entry['calls'] and not entry['dynamic']: continue
+        # if we know statically that this module's API-version doesn't match ours,
+        # ignore it (and complain about it) without bothering to import it
+        if not entry['dynamic'] and entry['apiVersion'] is not None and entry['apiVersion'] != ourAPIVersion:
+            _showAPIVersionError(moduleName,entry['apiVersion'],ourAPIVersion)
+            continue
+        try:
+            module = __import__(moduleName)
 
-                    # if there's a white-list, make sure this *is* on it
-                    if (whiteList is None or moduleName in whiteList):
-                        
-                        # avoid importing language modules here to save a bit of time/memory..
-                        if (name.endswith('.py') and not name.startswith('bsLanguage')):
-                            if name in namesImported:
-                                errMsg = "Warning: duplicate mod script found: '"+name+"'; ignoring."
-                                print errMsg
-                                bs.screenMessage(errMsg,color=(1,0,0))
-                            else:
-                                namesImported.add(name)
-                                module = __import__(moduleName)
-
-                                # only look at the module if it contains the callable we're after
-                                call = getattr(module,callName,None)
-                                if call is not None and callable(call):
-
-                                    # if this module's API-version doesn't match ours, ignore it (and complain about it)
-                                    ourAPIVersion = 4
-                                    try: moduleAPIVersion = module.bsGetAPIVersion()
-                                    except Exception: moduleAPIVersion = None
-                                    if moduleAPIVersion == ourAPIVersion:
-                                        modules.append(module)
-                                    else:
-                                        try: name = module.__name__
-                                        except Exception: name = str(module)
-                                        txt = bs.Lstr(resource='apiVersionErrorText',
-                                                      subs=[('${NAME}',name),
-                                                            ('${VERSION_USED}',str(moduleAPIVersion)),
-                                                            ('${VERSION_REQUIRED}',str(ourAPIVersion))])
-                                        bs.screenMessage(txt,color=(1,0.5,0))
-            except Exception:
-                bs.printException('Error importing game module \''+name+'\'')
-                
-    bsInternal._setHaveMods(haveMods)
+            # only look at the module if it contains the callable we're after
+            call = getattr(module,callName,None)
+            if call is not None and callable(call):
+
+                # if this module's API-version doesn't match ours, ignore it (and complain about it)
+                try: moduleAPIVersion = module.bsGetAPIVersion()
+                except Exception: moduleAPIVersion = None
+                if moduleAPIVersion == ourAPIVersion:
+                    modules.append(module)
+                else:
+                    try: name = module.__name__
+                    except Exception: name = str(module)
+                    _showAPIVersionError(name,moduleAPIVersion,ourAPIVersion)
+        except Exception:
+            bs.printException('Error importing game module \''+moduleName+'\'')
     return modules
 
+# games that only show up once purchased
+_gPurchasableGameModules = {'bsMeteorShower':'games.meteor_shower',
+                            'bsTargetPractice':'games.target_practice',
+                            'bsNinjaFight':'games.ninja_fight',
+                            'bsEasterEggHunt':'games.easter_egg_hunt'}
+
+def _isGameModuleAvailable(moduleName):
+    purchase = _gPurchasableGameModules.get(moduleName)
+    return purchase is None or bsInternal._getPurchased(purchase)
+
+def _getUnOwnedGameModules():
+    """ returns the names of purchasable game modules that haven't been purchased """
+    if bs.getEnvironment()['subplatform'] == 'headless': return set()
+    return set(m for m in _gPurchasableGameModules if not _isGameModuleAvailable(m))
+
+class _LazyGameType(object):
+    """
+    Stands in for a game class listed in the script index so game lists can be
+    built, sorted and filtered without importing every game module. getName(),
+    getDisplayString() and supportsSessionType() are answered from the index
+    when possible; anything else imports the module and goes to the real class.
+    Use _resolveGameType() to get the real class.
+    """
+    def __init__(self,moduleName,className,info):
+        self.__module__ = moduleName
+        self.__name__ = className
+        self._info = info
+        self._gameType = None
+
+    def __repr__(self):
+        return '<lazy game type '+getTypeName(self)+'>'
+
+    def resolve(self):
+        if self._gameType is None: self._gameType = getattr(__import__(self.__module__),self.__name__)
+        return self._gameType
+
+    def getName(self):
+        if self._info['name'] is None: return self.resolve().getName()
+        return self._info['name']
+
+    def getDisplayString(self,settings=None):
+        if self._info['name'] is None: return self.resolve().getDisplayString(settings)
+        # the stock implementation only needs getName()
+        return bs.GameActivity.getDisplayString.im_func(self,settings)
+
+    def supportsSessionType(self,sessionType):
+        if self._info['sessionTypes'] is None: return self.resolve().supportsSessionType(sessionType)
+        return any(issubclass(sessionType,getattr(bs,t)) for t in self._info['sessionTypes'])
+
+    def __getattr__(self,attr):
+        if attr.startswith('__'): raise AttributeError(attr)
+        return getattr(self.resolve(),attr)
+
+_gLazyGameTypes = {}
+
+def _getLazyGameType(moduleName,className,info):
+    # keep one per type so they can be compared like classes
+    typeName = moduleName+'.'+className
+    if info is None: info = {'name':None,'sessionTypes':None}
+    t = _gLazyGameTypes.get(typeName)
+    if t is None: t = _gLazyGameTypes[typeName] = _LazyGameType(moduleName,className,info)
+    else: t._info = info
+    return t
+
+def _resolveGameType(gameType):
+    """ returns the actual class for a game type from getGameTypes()/_filterPlaylist() """
+    return gameType.resolve() if isinstance(gameType,_LazyGameType) else gameType
+
+def _prepareGameSpec(gamespec,sessionType):
+    """
+    Resolves the 'resolvedType' of an entry from _filterPlaylist() to its actual
+    class (importing its module) and fills in any settings it lacks; call this
+    right before instantiating the game. Returns the class.
+    """
+    gameType = gamespec['resolvedType'] = _resolveGameType(gamespec['resolvedType'])
+    for settingName,setting in gameType.getSettings(sessionType):
+        if settingName not in gamespec['settings']:
+            gamespec['settings'][settingName] = setting['default']
+    return gameType
+
+def _isStaticGameEntry(entry):
+    return entry['games'] is not None and not entry['dynamic'] and entry['apiVersion'] == 4
 
 def getGameTypes():
+    """
+    Returns all available game types. Games the script index knows about come
+    back as lazy stand-ins that only import their module when something beyond
+    their name/display-string/session support is needed (see _resolveGameType());
+    scripts whose games can't be determined statically are imported.
+    """
     allGames = []
-    modules = _getModulesWithCall('bsGetGames')
-    for module in modules:
-        if ((module.__name__ != 'bsMeteorShower' or bsInternal._getPurchased('games.meteor_shower'))
-            and (module.__name__ != 'bsTargetPractice' or bsInternal._getPurchased('games.target_practice'))
-            and (module.__name__ != 'bsNinjaFight' or bsInternal._getPurchased('games.ninja_fight'))
-            and (module.__name__ != 'bsEasterEggHunt' or bsInternal._getPurchased('games.easter_egg_hunt'))):
+    needImport = []
+    for moduleName,entry in _getScriptIndex():
+        if not _isGameModuleAvailable(moduleName): continue
+        if _isStaticGameEntry(entry):
+            allGames += [_getLazyGameType(moduleName,className,entry['gameInfo'].get(className))
+                         for className in entry['games']]
+        elif 'bsGetGames' in entry['calls'] or entry['dynamic']:
+            needImport.append(moduleName)
+    if needImport:
+        for module in _getModulesWithCall('bsGetGames',whiteList=needImport):
             allGames += module.bsGetGames()
     return allGames
 
@@ -1198,34 +1619,22 @@ def _getAllTips(): #JRMP
 
     return tips
 
-def _getUnOwnedGameTypes():
-    try:
-        import bsUI
-        import bsInternal
-        unOwnedGames = set()
-        if bs.getEnvironment()['subplatform'] != 'headless':
-            for section in bsUI._getStoreLayout()['minigames']:
-                for m in section['items']:
-                    if not bsInternal._getPurchased(m):
-                        mInfo = bsUI._getStoreItem(m)
-                        unOwnedGames.add(mInfo['gameType'])
-        return unOwnedGames
-    except Exception:
-        bs.printException("error calcing un-owned games")
-        return set()
-
 def _filterPlaylist(playlist,sessionType,addResolvedType=False,removeUnOwned=True,markUnOwned=False):
     """ returns a filtered version of a playlist - strips out or replaces invalid or unowned game types,
-    makes sure all settings are present, and adds in a 'resolvedType' which is the actual type """
+    and adds in a 'resolvedType' for the game type. Game types are checked against the script index
+    so no game modules get imported here; 'resolvedType' may be a lazy stand-in which should go through
+    _prepareGameSpec() (which also fills in missing settings) before the game is instantiated """
     import bsMap
     goodList = []
 
     if removeUnOwned or markUnOwned:
         unOwnedMaps = bsMap._getUnOwnedMaps()
-        unOwnedGameTypes = _getUnOwnedGameTypes()
+        unOwnedGameModules = _getUnOwnedGameModules()
     else:
         unOwnedMaps = []
-        unOwnedGameTypes = []
+        unOwnedGameModules = set()
+
+    scriptIndex = dict(_getScriptIndex())
         
     #print 'got',unOwnedGameTypes
     
@@ -1268,22 +1677,19 @@ def _filterPlaylist(playlist,sessionType,addResolvedType=False,removeUnOwned=Tru
 
                 gameModuleName,gameClassName = gamespec['type'].split('.')
 
-                gameModule = __import__(gameModuleName)
-                gameClass = getattr(gameModule,gameClassName)
+                entry = scriptIndex.get(gameModuleName)
+                if entry is not None and _isStaticGameEntry(entry) and gameClassName in entry['games']:
+                    gameClass = _getLazyGameType(gameModuleName,gameClassName,entry['gameInfo'].get(gameClassName))
+                else:
+                    gameClass = getattr(__import__(gameModuleName),gameClassName)
 
                 # skip this one completely if they want to strip un-owned stuff..
-                if removeUnOwned and gameClass in unOwnedGameTypes: continue
+                if removeUnOwned and gameModuleName in unOwnedGameModules: continue
                 
                 if addResolvedType: gamespec['resolvedType'] = gameClass
 
                 if markUnOwned and gamespec['settings']['map'] in unOwnedMaps: gamespec['isUnOwnedMap'] = True
-                if markUnOwned and gameClass in unOwnedGameTypes: gamespec['isUnOwnedGame'] = True
-                    
-                # make sure all settings the game defines are present
-                neededSettings = gameClass.getSettings(sessionType)
-                for settingName,setting in neededSettings:
-                    if settingName not in gamespec['settings']:
-                        gamespec['settings'][settingName] = setting['default']
+                if markUnOwned and gameModuleName in unOwnedGameModules: gamespec['isUnOwnedGame'] = True
 
                 goodList.append(gamespec)
 
@@ -1375,7 +1781,130 @@ def writeConfig(force=False,storeRemote=True):
     #     else:
     #         print 'CONFIG IS SAME; ALL GOOD'
             
-    bsInternal._markConfigDirty()
+    _refreshConfigSnapshot()
+    # _ConfigWriter is the only thing that writes the config file now; marking the
+    # engine's config dirty would have it write (and rotate backups of) the same file
+    _gConfigWriter.requestWrite()
+
+def getConfigWriteStats():
+    """
+    Returns a dict of config persistence stats: 'requests' (writeConfig calls),
+    'writes' (actual disk writes after coalescing), 'errors', 'pending', and
+    'lastLatency'/'avgLatency'/'maxLatency' in seconds.
+    """
+    return _gConfigWriter.getStats()
+
+def _flushConfig():
+    """ synchronously writes any pending config changes """
+    _gConfigWriter.flush()
+
+_gConfigBackupSuffix = '.bak'
+
+class _ConfigWriter(object):
+    """
+    Commits the config to disk on a background thread.
+    Write requests landing within 'debounce' seconds of the first pending one are
+    coalesced into a single write. Each write goes to a temp file that is then
+    renamed over the real config, so a crash mid-write never leaves a truncated
+    file; the previous copy is kept as a backup for _readConfig() to fall back on.
+    The backup uses its own suffix rather than the engine's '.prev' so that the
+    fallback only ever sees files this writer produced.
+    """
+    def __init__(self,debounce=2.0):
+        self._debounce = debounce
+        self._cond = threading.Condition()
+        self._writeLock = threading.Lock()
+        self._thread = None
+        self._path = None
+        self._pendingSince = None
+        self._writing = False
+        self._requests = 0
+        self._writes = 0
+        self._errors = 0
+        self._lastLatency = 0.0
+        self._totalLatency = 0.0
+        self._maxLatency = 0.0
+
+    def requestWrite(self):
+        with self._cond:
+            if self._path is None: self._path = bs.getEnvironment()['configFilePath']
+            self._requests += 1
+            if self._pendingSince is None: self._pendingSince = time.time()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self):
+        with self._cond:
+            # if our thread has already picked up a write, let it land first
+            while self._writing: self._cond.wait()
+            if self._pendingSince is None: return
+            self._pendingSince = None
+            self._writing = True
+        self._write()
+
+    def getStats(self):
+        with self._cond:
+            return {'requests':self._requests,
+                    'writes':self._writes,
+                    'errors':self._errors,
+                    'pending':self._pendingSince is not None or self._writing,
+                    'lastLatency':self._lastLatency,
+                    'avgLatency':self._totalLatency/self._writes if self._writes > 0 else 0.0,
+                    'maxLatency':self._maxLatency}
+
+    def _run(self):
+        bsInternal._setThreadName("BS_ConfigWriterThread")
+        while True:
+            with self._cond:
+                while self._pendingSince is None: self._cond.wait()
+                delay = self._pendingSince+self._debounce-time.time()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                self._pendingSince = None
+                self._writing = True
+            self._write()
+
+    def _write(self):
+        with self._writeLock:
+            startTime = time.time()
+            path = self._path
+            try:
+                # json's C encoder holds the GIL for the whole dump, so this gives us a
+                # consistent snapshot even though the game thread owns the config dict
+                contents = json.dumps(_gConfig,separators=(',',':'))
+                tmpPath = path+'.tmp'
+                with open(tmpPath,'wb') as f:
+                    f.write(contents)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if os.path.exists(path):
+                    import shutil
+                    shutil.copyfile(path,path+_gConfigBackupSuffix)
+                try: os.rename(tmpPath,path)
+                except OSError:
+                    # (windows can't rename over existing files)
+                    os.remove(path)
+                    os.rename(tmpPath,path)
+                success = True
+            except Exception,e:
+                print 'EXC writing config file \''+str(path)+'\':',e
+                success = False
+            latency = time.time()-startTime
+            with self._cond:
+                self._writing = False
+                self._cond.notifyAll()
+                if success:
+                    self._writes += 1
+                    self._lastLatency = latency
+                    self._totalLatency += latency
+                    self._maxLatency = max(self._maxLatency,latency)
+                else: self._errors += 1
+
+_gConfigWriter = _ConfigWriter()
 
     
 def _setLanguage(language,printChange=True,storeToConfig=True):
@@ -1402,44 +1931,32 @@ def _setLanguage(language,printChange=True,storeToConfig=True):
     if language is None: language = _getDefaultLanguage()
 
     try:
-        lEnglish = __import__('bsLanguageEnglish')
-        l = __import__('bsLanguage'+language)
-        if language != 'English': reload(l) # helpful for iterating
+        compiled = _getCompiledLanguage(language)
     except Exception:
         #print 'Exception importing language module \'bsLanguage'+language+'\':',e
         bs.printException('Exception importing language:',language)
         bs.screenMessage("Error setting language to '"+language+"'; see log for details",color=(1,0,0))
         switched = False
-        l = None
-
-    # create an attrdict of *just* our target language
-    _gLanguageTarget = AttrDict()
-    _addToAttrDict(_gLanguageTarget,l.values if l is not None else lEnglish.values)
-
-    # create an attrdict of our target languaged overlaid on our base (english)
-    languages = []
-    if l is not None: languages.append(l)
-    if language != 'English': languages.append(__import__('bsLanguageEnglish'))
-    languages.reverse()
-    lFull = AttrDict()
-    for l in languages:
-        _addToAttrDict(lFull,l.values)
-    _gLanguageMerged = lFull
+        compiled = _getCompiledLanguage('English')
+
+    _gLanguageTarget = _LanguageTable(compiled['target'])
+    _gLanguageMerged = _LanguageTable(compiled['merged'])
+    _clearLstrCache()
 
     # pass some keys/values in for low level code to use;
     # start with everything in ther 'internal' section...
-    internalVals = [v for v in lFull['internal'].items() if type(v[1]) in (str,unicode)]
+    internalVals = [v for v in _gLanguageMerged.getRawSection('internal').items() if type(v[1]) in (str,unicode)]
     # cherry-pick various other values to include.. (should probably get rid of the 'internal' section and do everything this way)
     for value in ['replayNameDefaultText','replayWriteErrorText','replayVersionErrorText','replayReadErrorText']:
-        internalVals.append((value,lFull[value]))
-    internalVals.append(('axisText',lFull['configGamepadWindow']['axisText']))
+        internalVals.append((value,_gLanguageMerged.getRaw(value)))
+    internalVals.append(('axisText',_gLanguageMerged.getRaw('configGamepadWindow.axisText')))
     
     #internalVals.append(('bombSquadProNameText',lFull['store']['bombSquadProNameText']))
     # internalVals.append(('replayNameDefaultText',lFull['replayNameDefaultText']))
     # internalVals.append(('replayWriteErrorText',lFull['replayWriteErrorText']))
     # internalVals.append(('replayVersionErrorText',lFull['replayVersionErrorText']))
     # internalVals.append(('replayReadErrorText',lFull['replayReadErrorText']))
-    randomNames = [n.strip() for n in _gLanguageMerged['randomPlayerNamesText'].split(',')]
+    randomNames = [n.strip() for n in _gLanguageMerged.getRaw('randomPlayerNamesText').split(',')]
     randomNames = [n for n in randomNames if n != '']
     bsInternal._setInternalLanguageKeys(internalVals, randomNames)
 
@@ -1485,6 +2002,172 @@ def _addToAttrDict(dst,src):
             if type(value) not in (float,int,bool,str,unicode,type(None)): raise Exception("invalid value type for res '"+key+"': "+str(type(value)))
             dst[key] = value
 
+def _compileLanguageValues(values,path=(),out=None):
+    """ flattens a nested language dict into a list of (pathTuple,value) pairs """
+    if out is None: out = []
+    for key,value in values.items():
+        if type(value) is dict:
+            _compileLanguageValues(value,path+(key,),out)
+        else:
+            if type(value) not in (float,int,bool,str,unicode,type(None)): raise Exception("invalid value type for res '"+key+"': "+str(type(value)))
+            out.append((path+(key,),value))
+    return out
+
+def _getLanguageSourceInfo(language):
+    """ returns the source path and mtime for a language module (without importing it) """
+    import imp
+    f,path,desc = imp.find_module('bsLanguage'+language)
+    if f is not None: f.close()
+    return path,os.path.getmtime(path)
+
+def _getCompiledLanguage(language):
+    """
+    Returns a dict containing 'target' and 'merged' section dicts for a language;
+    each maps a top-level section name ('' for top-level values) to a marshalled
+    list of (path,value) pairs, so sections can be unpacked independently.
+    Results are cached in a marshal file next to the language script, keyed by the
+    mtimes of the target and english sources, so we only re-import/merge when they change.
+    """
+    import marshal
+    sources = [_getLanguageSourceInfo('English')]
+    if language != 'English': sources.append(_getLanguageSourceInfo(language))
+    cachePath = os.path.splitext(sources[-1][0])[0]+'.langcache'
+    key = [_gLanguageCacheVersion]+[mtime for path,mtime in sources]
+    try:
+        with open(cachePath,'rb') as f: compiled = marshal.load(f)
+        if compiled['key'] == key: return compiled
+    except Exception: pass
+
+    lEnglish = __import__('bsLanguageEnglish')
+    target = merged = _compileLanguageValues(lEnglish.values)
+    if language != 'English':
+        l = __import__('bsLanguage'+language)
+        reload(l) # helpful for iterating
+        target = _compileLanguageValues(l.values)
+        # overlay our target language on our base (english)
+        targetPaths = set(path for path,value in target)
+        merged = [p for p in merged if p[0] not in targetPaths]+target
+    compiled = {'key':key,'target':_splitLanguageSections(target),'merged':_splitLanguageSections(merged)}
+
+    # write atomically; its fine if this fails (read-only script dirs, etc)
+    try:
+        tmpPath = cachePath+'.tmp'
+        with open(tmpPath,'wb') as f: marshal.dump(compiled,f)
+        if os.path.exists(cachePath): os.remove(cachePath) # (windows can't rename over files)
+        os.rename(tmpPath,cachePath)
+    except Exception: pass
+    return compiled
+
+def _splitLanguageSections(pairs):
+    import marshal
+    sections = {}
+    for pair in pairs:
+        path = pair[0]
+        sections.setdefault(path[0] if len(path) > 1 else '',[]).append(pair)
+    return dict((name,marshal.dumps(sectionPairs)) for name,sectionPairs in sections.items())
+
+class _LanguageTable(object):
+    """
+    Flat {dotted.key: value} lookup table for a language. Values are stored as
+    they appear in the language module and decoded to unicode on access. Each
+    top-level section stays a compact marshalled blob until something first
+    asks for a value in it.
+    """
+    def __init__(self,sectionBlobs):
+        self._blobs = dict(sectionBlobs)
+        self._values = {}
+        self._sectionKeys = {}
+        # top-level values are always needed
+        self.materialize('')
+
+    def materialize(self,section):
+        import marshal
+        try: blob = self._blobs.pop(section)
+        except KeyError: return
+        values = self._values
+        keys = self._sectionKeys[section] = []
+        for path,value in marshal.loads(blob):
+            key = '.'.join(path)
+            values[key] = value
+            # (a few keys have dots of their own; keep their paths so sections can be rebuilt)
+            keys.append(key if len(path) == key.count('.')+1 else path)
+
+    def get(self,resource):
+        # leaf values are a single dict get once their section is loaded
+        try: value = self._values[resource]
+        except KeyError:
+            section = resource.split('.',1)[0]
+            if section not in self._blobs: return self.getRawSection(resource)
+            self.materialize(section)
+            try: value = self._values[resource]
+            except KeyError: return self.getRawSection(resource)
+        if type(value) is str: value = value.decode('utf-8',errors='ignore')
+        return value
+
+    def getRawSection(self,resource):
+        """ reconstructs a sub-dict of resources as an AttrDict (no unicode conversion) """
+        section = resource.split('.',1)[0]
+        self.materialize(section)
+        prefix = resource+'.'
+        prefixLen = resource.count('.')+1
+        values = self._values
+        result = AttrDict()
+        found = False
+        for entry in self._sectionKeys.get(section,()):
+            if type(entry) is tuple:
+                path = entry
+                key = '.'.join(path)
+                if not key.startswith(prefix) or '.'.join(path[:prefixLen]) != resource: continue
+            else:
+                key = entry
+                if not key.startswith(prefix): continue
+                path = key.split('.')
+            found = True
+            d = result
+            for name in path[prefixLen:-1]:
+                if name not in d: d[name] = AttrDict()
+                d = d[name]
+            d[path[-1]] = values[key]
+        if not found: raise KeyError(resource)
+        return result
+
+    def getRaw(self,resource):
+        """ returns a leaf value as stored in the language module (no unicode conversion) """
+        try: return self._values[resource]
+        except KeyError: pass
+        self.materialize(resource.split('.',1)[0] if '.' in resource else '')
+        return self._values[resource]
+
+    def getSectionSizes(self):
+        """ returns a dict of section names to (isLoaded,approxResidentBytes) """
+        import sys
+        sizes = {}
+        for section,blob in self._blobs.items(): sizes[section] = (False,sys.getsizeof(blob))
+        for section,keys in self._sectionKeys.items():
+            size = sys.getsizeof(keys)
+            for entry in keys:
+                key = '.'.join(entry) if type(entry) is tuple else entry
+                size += sys.getsizeof(key)+sys.getsizeof(self._values[key])
+                if type(entry) is tuple: size += sys.getsizeof(entry)+sum(sys.getsizeof(name) for name in entry)
+            sizes[section] = (True,size)
+        return sizes
+
+def printLanguageSectionReport():
+    """
+    Prints the approximate resident size of each section of the current
+    (merged) language, and whether it has been loaded yet.
+    """
+    if _gLanguageMerged is None:
+        print 'no language loaded'
+        return
+    sizes = _gLanguageMerged.getSectionSizes()
+    total = 0
+    print 'LANGUAGE SECTIONS ('+str(len(sizes))+'):'
+    for section,(loaded,size) in sorted(sizes.items(),key=lambda s:-s[1][1]):
+        total += size
+        print '  '+(section if section else '<top-level>')+':',size,'bytes',('(loaded)' if loaded else '(packed)')
+    print '  total:',total,'bytes'
+
 def _canDisplayLanguage(lang):
     # we don't yet support full unicode display on windows or linux..
     if lang in ('Chinese','Persian','Korean') and bs.getEnvironment()['platform'] in ('windows','linux'):
@@ -1548,43 +2231,19 @@ def _getResource(resource, fallback=None):
                     try: _setLanguage('English',printChange=False,storeToConfig=False)
                     except Exception,e: print 'Error setting language to English fallback: ',e
 
-        # if they provided a fallback value, try the target-language-only dict first and
-        # then fall back to trying the fallback value in the merged dict.
+        # if they provided a fallback value, try the target-language-only table first and
+        # then fall back to trying the fallback value in the merged table.
         if fallback is not None:
-            try:
-                values = _gLanguageTarget
-                splits = resource.split('.')
-                dicts = splits[:-1]
-                key = splits[-1]
-                for d in dicts: values = values[d]
-                val = values[key]
-                if uni and type(val) is str: val = val.decode('utf-8',errors='ignore')
-                return val
-            except Exception:
-                try:
-                    values = _gLanguageMerged
-                    splits = fallback.split('.')
-                    dicts = splits[:-1]
-                    key = splits[-1]
-                    for d in dicts: values = values[d]
-                    val = values[key]
-                    if uni and type(val) is str: val = val.decode('utf-8',errors='ignore')
-                    return val
-                
-                except Exception:
+            try: return _gLanguageTarget.get(resource)
+            except KeyError:
+                try: return _gLanguageMerged.get(fallback)
+                except KeyError:
                     # if we got nothing for fallback, default to the normal code which checks
-                    # or primary value in the merge dict; there's a chance we can get an english
+                    # or primary value in the merge table; there's a chance we can get an english
                     # value for it (which we weren't looking for the first time through)
                     pass
-                    
-        values = _gLanguageMerged
-        splits = resource.split('.')
-        dicts = splits[:-1]
-        key = splits[-1]
-        for d in dicts: values = values[d]
-        val = values[key]
-        if uni and type(val) is str: val = val.decode('utf-8',errors='ignore')
-        return val
+
+        return _gLanguageMerged.get(resource)
 
     except Exception:
         #if default is not None: return default
@@ -1699,6 +2358,11 @@ def animateArray(node,attr,size,keys,loop=False,offset=0,driver='gameTime'):
 def _shutdown():
     if _gMusicPlayer is not None:
         _gMusicPlayer.shutdown()
+    _flushConfig()
+    import bsTransactions
+    bsTransactions._persistTransactions()
+    import bsStats
+    bsStats._shutdownStats()
 
 
 class MusicPlayer(object):
@@ -2611,83 +3275,108 @@ def printRefs(obj):
         #if type(ref) is types.FrameType: continue
         print '     ref',i,':',ref
         i += 1
-    
-    
-def printLiveObjectWarnings(when,ignoreSession=None,ignoreActivity=None):
-    sessions = []
-    activities = []
-    actors = []
+
+def printRefChain(obj,depth=2,maxRefs=10):
+    """
+    Prints referrers of an object, and referrers of those referrers, down to
+    'depth' levels. This walks the gc graph so it is slow; only call it when
+    actually hunting a leak (see bsUtils.printLiveObjectWarnings()).
+    """
+    seen = set([id(obj)])
+    def _printLevel(o,level):
+        refs = [r for r in gc.get_referrers(o) if type(r) is not types.FrameType and id(r) not in seen]
+        seen.add(id(refs))
+        for i,ref in enumerate(refs[:maxRefs]):
+            seen.add(id(ref))
+            try: refStr = repr(ref)
+            except Exception: refStr = '<unprintable '+type(ref).__name__+'>'
+            if len(refStr) > 200: refStr = refStr[:200]+'...'
+            print '   '+'   '*level+'ref',str(i+1)+':',refStr
+            if level+1 < depth: _printLevel(ref,level+1)
+        if len(refs) > maxRefs: print '   '+'   '*level+'('+str(len(refs)-maxRefs)+' more)'
+        del refs
+    print 'REFERENCE CHAIN FOR',obj,':'
+    _printLevel(obj,0)
+
+# weak registry of every live Session, Activity and Actor, populated from their
+# constructors; lets us answer 'what is still alive' without walking gc.get_objects().
+# maps id(obj) to (weakref, category, className, creatingActivityName)
+_gLiveObjects = {}
+
+def _registerLiveObject(obj,category,activity=None):
+    key = id(obj)
+    def _onDeath(ref):
+        try:
+            entry = _gLiveObjects.get(key)
+            # (ids get reused, so make sure we're removing our own entry)
+            if entry is not None and entry[0] is ref: del _gLiveObjects[key]
+        except Exception: pass
+    if activity is None: activityName = None
+    else: activityName = type(activity).__name__+'@'+hex(id(activity))
+    _gLiveObjects[key] = (weakref.ref(obj,_onDeath),category,type(obj).__name__,activityName)
+
+def getLiveObjects(category=None):
+    """
+    Returns a list of live objects registered via their constructors.
+    'category' can be 'Session', 'Activity', or 'Actor' to filter results.
+    Cost is proportional to the number of live objects; not the heap size.
+    """
+    objs = []
+    for ref,cat,className,activityName in _gLiveObjects.values():
+        if category is not None and cat != category: continue
+        obj = ref()
+        if obj is not None: objs.append(obj)
+    return objs
+
+def getLiveObjectCounts():
+    """
+    Returns live object counts grouped two ways, as a dict:
+    {'byClass':{className:count}, 'byActivity':{activityName:count}}.
+    Sessions and activities themselves are listed under activity None.
+    """
+    byClass = {}
+    byActivity = {}
+    for ref,cat,className,activityName in _gLiveObjects.values():
+        if ref() is None: continue
+        byClass[className] = byClass.get(className,0)+1
+        byActivity[activityName] = byActivity.get(activityName,0)+1
+    return {'byClass':byClass,'byActivity':byActivity}
+
+def printLiveObjectWarnings(when,ignoreSession=None,ignoreActivity=None,showRefs=False):
+    """
+    Complains about any Sessions, Activities or Actors still alive.
+    Pass showRefs=True to also print referrer chains for each (slow).
+    """
     global _gPrintedLiveObjectWarning
     
-    if _gPrintedLiveObjectWarning:
+    if _gPrintedLiveObjectWarning and not showRefs:
         # print 'skipping live object check due to previous found live object(s)'
         return
 
-    for obj in gc.get_objects():
-        if isinstance(obj,bs.Actor): actors.append(obj)
-        elif isinstance(obj,bs.Session): sessions.append(obj)
-        elif isinstance(obj,bs.Activity): activities.append(obj)
-
-    # complain about any remaining sessions
-    for session in sessions:
-        if session is ignoreSession: continue
-        _gPrintedLiveObjectWarning = True
-        print 'ERROR: Session found',when,':',session
-        # refs = list(gc.get_referrers(session))
-        # i = 1
-        # for ref in refs:
-        #     if type(ref) is types.FrameType: continue
-        #     print '     ref',i,':',ref
-        #     i += 1
-            # if type(ref) is list or type(ref) is tuple or type(ref) is dict:
-            #     refs2 = list(gc.get_referrers(ref))
-            #     j = 1
-            #     for ref2 in refs2:
-            #         if type(ref2) is types.FrameType: continue
-            #         print '        ref\'s ref',j,':',ref2
-            #         j += 1
-
-    # complain about any remaining activities
-    for activity in activities:
-        if activity is ignoreActivity: continue
-        _gPrintedLiveObjectWarning = True
-        print 'ERROR: Activity found',when,':',activity
-        # refs = list(gc.get_referrers(activity))
-        # i = 1
-        # for ref in refs:
-        #     if type(ref) is types.FrameType: continue
-        #     print '     ref',i,':',ref
-        #     i += 1
-            # if type(ref) is list or type(ref) is tuple or type(ref) is dict:
-            #     refs2 = list(gc.get_referrers(ref))
-            #     j = 1
-            #     for ref2 in refs2:
-            #         if type(ref2) is types.FrameType: continue
-            #         print '        ref\'s ref',j,':',ref2
-            #         j += 1
-
-    # complain about any remaining actors
-    for actor in actors:
-        _gPrintedLiveObjectWarning = True
-        print 'ERROR: Actor found',when,':',actor
-        if type(actor) is bs.Actor:
-            try:
-                if actor.node.exists(): print '   - contains node:',actor.node.getNodeType(),';',actor.node.getName()
-            except Exception,e:
-                print '   - exception checking actor node:',e
-        # refs = list(gc.get_referrers(actor))
-        # i = 1
-        # for ref in refs:
-        #     if type(ref) is types.FrameType: continue
-        #     print '     ref',i,':',ref
-        #     i += 1
-            # if type(ref) is list or type(ref) is tuple or type(ref) is dict:
-            #     refs2 = list(gc.get_referrers(ref))
-            #     j = 1
-            #     for ref2 in refs2:
-            #         if type(ref2) is types.FrameType: continue
-            #         print '        ref\'s ref',j,':',ref2
-            #         j += 1
+    # run the order the old gc scan did: sessions, activities, then actors
+    found = {'Session':[],'Activity':[],'Actor':[]}
+    for ref,cat,className,activityName in _gLiveObjects.values():
+        obj = ref()
+        if obj is None or obj is ignoreSession or obj is ignoreActivity: continue
+        found[cat].append((obj,activityName))
+
+    for cat in ('Session','Activity','Actor'):
+        for obj,activityName in found[cat]:
+            _gPrintedLiveObjectWarning = True
+            if cat == 'Actor':
+                print 'ERROR: Actor found',when,':',obj,'(created in '+str(activityName)+')'
+                if type(obj) is bs.Actor:
+                    try:
+                        if obj.node.exists(): print '   - contains node:',obj.node.getNodeType(),';',obj.node.getName()
+                    except Exception,e:
+                        print '   - exception checking actor node:',e
+            else: print 'ERROR: '+cat+' found',when,':',obj
+            if showRefs: printRefChain(obj)
+
+    if _gPrintedLiveObjectWarning:
+        counts = getLiveObjectCounts()
+        print 'Live objects by class:',counts['byClass']
+        print 'Live objects by creating activity:',counts['byActivity']
 
     # complain about any remaining nodes (no longer needed now that we have multiple scene-graphs)
     # j = 1
@@ -2730,56 +3419,13 @@ def _setNodeOwner(node,owner):
             gNodeOwnerWeakRefs = [r for r in gNodeOwnerWeakRefs if r() is not None]
             gNodeOwnerWeakRefsCleanCounter = 0
 
-class ServerCallThread(threading.Thread):
-        
-    def __init__(self,request,requestType,data,callback):
-        
-        threading.Thread.__init__(self)
-        self._request = request
-        self._requestType = requestType
-        self._data = {} if data is None else copy.deepcopy(data)
-        self._callback = callback
-
-        self._context = bs.Context('current')
-
-        # save and restore the context we were created from
-        activity = bs.getActivity(exceptionOnNone=False)
-        self._activity = weakref.ref(activity) if activity is not None else None
-        
-    def _runCallback(self,arg):
-        
-        # if we were created in an activity context and that activity has since died, do nothing
-        # (hmm should we be using a context-call instead of doing this manually?)
-        if self._activity is not None and (self._activity() is None or self._activity().isFinalized()): return
-        
-        # (technically we could do the same check for session contexts, but not gonna worry about it for now)
-        with self._context: self._callback(arg)
-        
-    def run(self):
-        try:
-            self._data = toUTF8(self._data)
-            bsInternal._setThreadName("BS_ServerCallThread")
-
-            if self._requestType == 'get':
-                response = urllib2.urlopen(urllib2.Request(str(bsInternal._getServerAddress()+'/'+self._request+'?'+urllib.urlencode(self._data)), # fails with unicode for some reason
-                                                           None,
-                                                           { 'User-Agent' : bs.getEnvironment()['userAgentString'] }))
-            elif self._requestType == 'post':
-                response = urllib2.urlopen(urllib2.Request(str(bsInternal._getServerAddress()+'/'+self._request), # this fails with unicode for some reason
-                                                           urllib.urlencode(self._data),
-                                                           { 'User-Agent' : bs.getEnvironment()['userAgentString'] }))
-            else: raise Exception("Invalid requestType: "+self._requestType)
-            responseData = ast.literal_eval(response.read())
-            if self._callback is not None: bs.callInGameThread(bs.Call(self._runCallback,responseData))
-        except Exception,e:
-            if self._callback is not None: bs.callInGameThread(bs.Call(self._runCallback,None))
+def serverGet(request,data,callback=None,timeout=None):
+    import bsHttp
+    bsHttp.getServerRequestExecutor().get(request,data,callback,timeout)
 
-
-def serverGet(request,data,callback=None):
-    ServerCallThread(request,'get',data,callback).start()
-
-def serverPut(request,data,callback=None):
-    ServerCallThread(request,'post',data,callback).start()
+def serverPut(request,data,callback=None,timeout=None):
+    import bsHttp
+    bsHttp.getServerRequestExecutor().post(request,data,callback,timeout)
 
 def runGPUBenchmark():
     bs.screenMessage("FIXME: not wired up yet",color=(1,0,0))
@@ -4064,6 +4710,10 @@ def _onAccountStateChanged():
         bsInternal._runTransactions()
         _pendingPromoCodes = []
 
+    # send anything that queued up while we were signed out (or persisted from a previous run)
+    import bsTransactions
+    bsTransactions._onAccountStateChanged()
+
 def _checkPendingCodes():
     # if we're still not signed in and have pending codes,
     # inform the user that they need to sign in to use them
@@ -4191,6 +4841,7 @@ def _configServer():
     bsInternal._setTelnetAccessEnabled(config.get('enableTelnet', False))
         
     bs.getConfig()['Auto Balance Teams'] = config.get('autoBalanceTeams', True)
+    _refreshConfigSnapshot()
 
     bsInternal._setPublicPartyMaxSize(config.get('maxPartySize', 9))
     bsInternal._setPublicPartyName(config.get('partyName', 'party'))
@@ -4280,7 +4931,7 @@ def configServer(configFile=None):
 
     global _gServerConfig
     global _gLaunchedServer
-    
+
     # read and store the new server config and then delete the file it came from
     if configFile is not None:
         f = open(configFile)
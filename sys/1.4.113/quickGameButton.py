@@ -91,6 +91,9 @@ class CustomSession(bsTeamGame.FreeForAllSession):
         # start in our custom join screen
         self.setActivity(bs.newActivity(bsTeamGame.TeamJoiningActivity))
 
+        # the game warms up while folks are joining
+        self._startNextGameWarmup()
+
 
 class SelectGameWindow(AddGameWindow):
     def __init__(self, transition='inRight'):